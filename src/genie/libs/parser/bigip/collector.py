@@ -0,0 +1,351 @@
+'''Shared REST collector of the bigip resources
+
+Every bigip parser is an entry of this collector: the iControl REST path of
+its resource as cli_command, fetched by BigipResource.rest(). The collector
+follows the paging of the collections and fetches many resources
+concurrently.
+
+With the bigip REST connector, the resources are requested through a
+requests session of the collector, authenticated as the iControl REST
+session of the connector (icr_session), over as many keep-alive connections
+as concurrent requests, and the JSON of the responses is decoded as it is
+read. Responses which are not ok, such as once the token expired, are
+requested again with device.get(), for the connector to reconnect or raise
+its error. Other connections are requested with device.get().
+
+The items of all the pages of a collection are returned as one collection,
+without the keys describing the page (nextLink, pageIndex, ...).
+
+    >>> from genie.libs.parser.bigip.collector import collect_resources
+    >>> from genie.libs.parser.bigip.get_cli_version import CliVersion
+    >>> collect_resources(device, [CliVersion, '/mgmt/tm/ltm/pool'])
+    {<class 'CliVersion'>: {...}, '/mgmt/tm/ltm/pool': {...}}
+'''
+
+# python
+import re
+import json
+import codecs
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    Session = HTTPAdapter = None
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+log = logging.getLogger(__name__)
+
+# Attribute of the device holding its BigipCollector
+COLLECTOR_ATTR = 'bigip_collector'
+
+# Keys of a collection describing the page returned, dropped once its pages
+# are merged
+_PAGE_KEYS = ('nextLink', 'previousLink', 'pageIndex', 'startIndex',
+              'totalPages', 'itemsPerPage')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _JsonStream(object):
+    '''Decoder of a JSON document read in chunks of bytes. The items of a
+    collection are decoded one at a time, as soon as they are read, so the
+    text of the whole document is never held in memory.
+
+    Args:
+        chunks (`iter`): bytes of the document
+    '''
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._text = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read(self):
+        '''Read at least as much text as what is left to decode, False when
+        there is nothing more to read'''
+        if self._eof:
+            return False
+        self._text = self._text[self._pos:]
+        self._pos = 0
+        # Doubling the text left to decode keeps the decoding of a value
+        # spanning many chunks linear
+        size = max(len(self._text) * 2, 1)
+        while len(self._text) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._text += self._utf8.decode(b'', final=True)
+                self._eof = True
+                break
+            if isinstance(chunk, str):
+                self._text += chunk
+            else:
+                self._text += self._utf8.decode(chunk)
+        return True
+
+    def _error(self, message):
+        return json.JSONDecodeError(message, self._text, self._pos)
+
+    def _peek(self):
+        '''Next character after the whitespace, '' at the end'''
+        while True:
+            self._pos = _WHITESPACE.match(self._text, self._pos).end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._read():
+                return ''
+
+    def _expect(self, characters):
+        character = self._peek()
+        if not character or character not in characters:
+            raise self._error('Expecting {!r}'.format(characters))
+        self._pos += 1
+        return character
+
+    def value(self):
+        '''Decode the next value'''
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._text, self._pos)
+            except ValueError:
+                if self._read():
+                    continue
+                raise
+            # A number may go on in the next chunk
+            if end < len(self._text) or not self._read():
+                self._pos = end
+                return value
+
+    def _items(self):
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self._expect(',]') == ']':
+                return
+
+    def decode(self, streamed='items'):
+        '''Decode the document, the items of its streamed member one at a
+        time'''
+        if self._peek() != '{':
+            decoded = self.value()
+        else:
+            self._pos += 1
+            decoded = {}
+            if self._peek() == '}':
+                self._pos += 1
+            else:
+                while True:
+                    name = self.value()
+                    if not isinstance(name, str):
+                        raise self._error('Expecting property name')
+                    self._expect(':')
+                    if name == streamed and self._peek() == '[':
+                        self._pos += 1
+                        decoded[name] = list(self._items())
+                    else:
+                        decoded[name] = self.value()
+                    if self._expect(',}') == '}':
+                        break
+        if self._peek():
+            raise self._error('Extra data')
+        return decoded
+
+
+def _with_query(path, **query):
+    '''path with the iControl query options, as $<option>=<value>'''
+    return '{}{}{}'.format(path, '&' if '?' in path else '?', '&'.join(
+        '${}={}'.format(option, value)
+                                    for option, value in sorted(query.items())))
+
+
+def _link_path(link):
+    '''Path and query of a link returned by the device, whose host is
+    localhost'''
+    match = re.match(r'^\w+://[^/]*(?P<path>/.*)$', link)
+    return match.group('path') if match else link
+
+
+def _rest_session(device):
+    '''requests Session of the iControl REST session of the bigip REST
+    connection of device, None without one'''
+    session = getattr(getattr(device, 'icr_session', None), 'session', None)
+    if Session is None or not isinstance(session, Session) or \
+            not isinstance(getattr(device, 'base_url', None), str):
+        return None
+    return session
+
+
+def _pooled_session(session, maxsize):
+    '''New requests Session authenticated as session, keeping up to maxsize
+    connections alive for the concurrent requests not to open and close
+    their own. session itself is left as it is.'''
+    pooled = Session()
+    pooled.auth = session.auth
+    pooled.verify = session.verify
+    pooled.cert = session.cert
+    pooled.proxies = dict(session.proxies)
+    pooled.headers.update(session.headers)
+    adapter = HTTPAdapter(pool_maxsize=maxsize)
+    pooled.mount('https://', adapter)
+    pooled.mount('http://', adapter)
+    return pooled
+
+
+class BigipCollector(object):
+    '''Fetches iControl REST resources of a device, over its REST connection
+
+    The items of all the pages of a collection are returned as one
+    collection: the nextLink of each page is followed, or $skip when the
+    device only returns totalItems.
+
+    Args:
+        device (`Device`): device connected with the bigip REST connector
+        max_workers (`int`): resources fetched concurrently
+        page_size (`int`): items requested per page with $top, None returns
+                           the pages of the device
+        chunk_size (`int`): bytes of the responses decoded at a time
+        timeout (`int`): seconds to wait for the device, as the connector
+
+    example:
+
+        >>> device.bigip_collector = BigipCollector(device, page_size=500)
+        >>> CliVersion(device=device).parse()
+        >>> device.bigip_collector.collect(['/mgmt/tm/ltm/pool',
+        ...                                 '/mgmt/tm/ltm/virtual'])
+        OrderedDict([('/mgmt/tm/ltm/pool', {...}),
+                     ('/mgmt/tm/ltm/virtual', {...})])
+    '''
+
+    def __init__(self, device, max_workers=8, page_size=None,
+                 chunk_size=65536, timeout=30):
+        self.device = device
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        # (session of the connector, pooled session of the collector)
+        self._sessions = (None, None)
+        self._lock = threading.Lock()
+
+    def _session(self):
+        '''Pooled session of the collector, made again when the connector
+        replaced its session, as when reconnecting. None without the bigip
+        REST connector.'''
+        session = _rest_session(self.device)
+        if session is None or not getattr(self.device, 'connected', True):
+            return None
+        with self._lock:
+            if self._sessions[0] is not session:
+                self._sessions = (session,
+                                  _pooled_session(session, self.max_workers))
+            return self._sessions[1]
+
+    def _get(self, url):
+        '''Return the decoded JSON of the resource at url'''
+        session = self._session()
+        if session is None:
+            return self.device.get(url).json()
+
+        full_url = self.device.base_url + url
+        log.debug('Sending GET to {}'.format(full_url))
+        # The connector reads the whole response, streamed here instead
+        with session.get(full_url, stream=True,
+                         timeout=self.timeout) as response:
+            if response.ok:
+                return _JsonStream(response.iter_content(self.chunk_size)) \
+                                                                    .decode()
+            log.debug('GET {} returned {}, requested again through the '
+                      'connector'.format(full_url, response.status_code))
+        return self.device.get(url, timeout=self.timeout).json()
+
+    def _pages(self, path):
+        '''Yield the pages of the resource at path'''
+        url = _with_query(path, top=self.page_size) if self.page_size \
+                                                                    else path
+        requested = set()
+        count = 0
+        while url and url not in requested:
+            requested.add(url)
+            page = self._get(url)
+            yield page
+            if not isinstance(page, dict) or not page.get('items'):
+                return
+            count += len(page['items'])
+            if page.get('nextLink'):
+                url = _link_path(page['nextLink'])
+            elif self.page_size and page.get('totalItems', 0) > count:
+                url = _with_query(path, top=self.page_size, skip=count)
+            else:
+                url = None
+
+    def get(self, path):
+        '''Return the resource at path, with the items of all its pages'''
+        pages = self._pages(path)
+        resource = next(pages)
+        paged = False
+        for page in pages:
+            paged = True
+            resource['items'].extend(page['items'])
+        if paged:
+            for key in _PAGE_KEYS:
+                resource.pop(key, None)
+            resource['currentItemCount'] = len(resource['items'])
+        return resource
+
+    def collect(self, resources):
+        '''Return {resource: fetched resource} of the resources, given as
+        paths or as bigip parsers, fetched concurrently'''
+        resources = list(OrderedDict.fromkeys(resources))
+        paths = [getattr(resource, 'cli_command', resource)
+                                                    for resource in resources]
+        if len(paths) < 2 or self.max_workers < 2:
+            return OrderedDict(zip(resources, map(self.get, paths)))
+        with ThreadPoolExecutor(max_workers=min(self.max_workers,
+                                                len(paths))) as pool:
+            return OrderedDict(zip(resources, pool.map(self.get, paths)))
+
+
+def device_collector(device):
+    '''Return the BigipCollector of device, a default one if it has none'''
+    collector = getattr(device, COLLECTOR_ATTR, None)
+    if isinstance(collector, BigipCollector):
+        return collector
+    return BigipCollector(device)
+
+
+def collect_resources(device, resources):
+    '''Return {resource: fetched resource} of the resources of device, given
+    as paths or as bigip parsers, fetched concurrently
+
+    example:
+
+        >>> collect_resources(device, [CliVersion, SysProvision])
+    '''
+    return device_collector(device).collect(resources)
+
+
+class BigipResource(MetaParser):
+    '''Parser of the iControl REST resource at cli_command, returned as the
+    device gives it with the items of all its pages'''
+
+    schema = {}
+
+    def rest(self):
+        response_json = device_collector(self.device).get(self.cli_command)
+
+        if not response_json:
+            return {}
+
+        return response_json
@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/analytics/application-security-anomalies/generate-report' resources
 # =============================================
 
 
-class AnalyticsApplicationsecurityanomaliesGeneratereportSchema(MetaParser):
+class AnalyticsApplicationsecurityanomaliesGeneratereportSchema(BigipResource):
 
     schema = {}
 
@@ -24,14 +20,3 @@ class AnalyticsApplicationsecurityanomaliesGeneratereport(
     cli_command = (
         "/mgmt/tm/analytics/application-security-anomalies/generate-report"
     )
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
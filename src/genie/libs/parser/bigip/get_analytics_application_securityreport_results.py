@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/analytics/application-security/report-results' resources
 # =============================================
 
 
-class AnalyticsApplicationsecurityReportresultsSchema(MetaParser):
+class AnalyticsApplicationsecurityReportresultsSchema(BigipResource):
 
     schema = {}
 
@@ -22,14 +18,3 @@ class AnalyticsApplicationsecurityReportresults(
     """
 
     cli_command = "/mgmt/tm/analytics/application-security/report-results"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
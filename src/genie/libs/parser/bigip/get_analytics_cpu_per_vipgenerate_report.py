@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/analytics/cpu-per-vip/generate-report' resources
 # =============================================
 
 
-class AnalyticsCpupervipGeneratereportSchema(MetaParser):
+class AnalyticsCpupervipGeneratereportSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class AnalyticsCpupervipGeneratereport(AnalyticsCpupervipGeneratereportSchema):
     """
 
     cli_command = "/mgmt/tm/analytics/cpu-per-vip/generate-report"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/analytics/dos-vis-vips/generate-report' resources
 # =============================================
 
 
-class AnalyticsDosvisvipsGeneratereportSchema(MetaParser):
+class AnalyticsDosvisvipsGeneratereportSchema(BigipResource):
 
     schema = {}
 
@@ -22,14 +18,3 @@ class AnalyticsDosvisvipsGeneratereport(
     """
 
     cli_command = "/mgmt/tm/analytics/dos-vis-vips/generate-report"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
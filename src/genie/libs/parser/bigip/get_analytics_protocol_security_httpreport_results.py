@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/analytics/protocol-security-http/report-results' resources
 # =============================================
 
 
-class AnalyticsProtocolsecurityhttpReportresultsSchema(MetaParser):
+class AnalyticsProtocolsecurityhttpReportresultsSchema(BigipResource):
 
     schema = {}
 
@@ -22,14 +18,3 @@ class AnalyticsProtocolsecurityhttpReportresults(
     """
 
     cli_command = "/mgmt/tm/analytics/protocol-security-http/report-results"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
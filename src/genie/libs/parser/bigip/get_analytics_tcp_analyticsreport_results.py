@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/analytics/tcp-analytics/report-results' resources
 # =============================================
 
 
-class AnalyticsTcpanalyticsReportresultsSchema(MetaParser):
+class AnalyticsTcpanalyticsReportresultsSchema(BigipResource):
 
     schema = {}
 
@@ -22,14 +18,3 @@ class AnalyticsTcpanalyticsReportresults(
     """
 
     cli_command = "/mgmt/tm/analytics/tcp-analytics/report-results"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/cm/sha1-fingerprint' resources
 # =============================================
 
 
-class CmSha1fingerprintSchema(MetaParser):
+class CmSha1fingerprintSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class CmSha1fingerprint(CmSha1fingerprintSchema):
     """
 
     cli_command = "/mgmt/tm/cm/sha1-fingerprint"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
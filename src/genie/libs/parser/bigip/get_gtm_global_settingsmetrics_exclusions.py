@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/gtm/global-settings/metrics-exclusions' resources
 # =============================================
 
 
-class GtmGlobalsettingsMetricsexclusionsSchema(MetaParser):
+class GtmGlobalsettingsMetricsexclusionsSchema(BigipResource):
 
     schema = {}
 
@@ -22,14 +18,3 @@ class GtmGlobalsettingsMetricsexclusions(
     """
 
     cli_command = "/mgmt/tm/gtm/global-settings/metrics-exclusions"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/gtm/server' resources
 # =============================================
 
 
-class GtmServerSchema(MetaParser):
+class GtmServerSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class GtmServer(GtmServerSchema):
     """
 
     cli_command = "/mgmt/tm/gtm/server"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/ltm/auth/ldap' resources
 # =============================================
 
 
-class LtmAuthLdapSchema(MetaParser):
+class LtmAuthLdapSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class LtmAuthLdap(LtmAuthLdapSchema):
     """
 
     cli_command = "/mgmt/tm/ltm/auth/ldap"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
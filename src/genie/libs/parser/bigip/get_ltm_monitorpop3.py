@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/ltm/monitor/pop3' resources
 # =============================================
 
 
-class LtmMonitorPop3Schema(MetaParser):
+class LtmMonitorPop3Schema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class LtmMonitorPop3(LtmMonitorPop3Schema):
     """
 
     cli_command = "/mgmt/tm/ltm/monitor/pop3"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
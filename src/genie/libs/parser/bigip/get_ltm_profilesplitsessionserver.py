@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/ltm/profile/splitsessionserver' resources
 # =============================================
 
 
-class LtmProfileSplitsessionserverSchema(MetaParser):
+class LtmProfileSplitsessionserverSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class LtmProfileSplitsessionserver(LtmProfileSplitsessionserverSchema):
     """
 
     cli_command = "/mgmt/tm/ltm/profile/splitsessionserver"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
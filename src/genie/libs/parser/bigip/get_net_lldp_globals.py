@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/net/lldp-globals' resources
 # =============================================
 
 
-class NetLldpglobalsSchema(MetaParser):
+class NetLldpglobalsSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class NetLldpglobals(NetLldpglobalsSchema):
     """
 
     cli_command = "/mgmt/tm/net/lldp-globals"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
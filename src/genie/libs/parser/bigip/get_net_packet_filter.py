@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/net/packet-filter' resources
 # =============================================
 
 
-class NetPacketfilterSchema(MetaParser):
+class NetPacketfilterSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class NetPacketfilter(NetPacketfilterSchema):
     """
 
     cli_command = "/mgmt/tm/net/packet-filter"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
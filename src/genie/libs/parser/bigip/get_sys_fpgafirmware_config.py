@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/sys/fpga/firmware-config' resources
 # =============================================
 
 
-class SysFpgaFirmwareconfigSchema(MetaParser):
+class SysFpgaFirmwareconfigSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class SysFpgaFirmwareconfig(SysFpgaFirmwareconfigSchema):
     """
 
     cli_command = "/mgmt/tm/sys/fpga/firmware-config"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
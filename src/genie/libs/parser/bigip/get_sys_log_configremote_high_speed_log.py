@@ -1,16 +1,12 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
+# Bigip REST collector
+from genie.libs.parser.bigip.collector import BigipResource
 
 # =============================================
 # Collection for '/mgmt/tm/sys/log-config/destination/remote-high-speed-log' resources
 # =============================================
 
 
-class SysLogconfigRemotehighspeedlogSchema(MetaParser):
+class SysLogconfigRemotehighspeedlogSchema(BigipResource):
 
     schema = {}
 
@@ -20,14 +16,3 @@ class SysLogconfigRemotehighspeedlog(SysLogconfigRemotehighspeedlogSchema):
     """
 
     cli_command = "/mgmt/tm/sys/log-config/destination/remote-high-speed-log"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
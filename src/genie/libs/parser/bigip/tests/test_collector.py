@@ -0,0 +1,273 @@
+# Python
+import json
+import time
+import threading
+import unittest
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit, parse_qs
+from socketserver import ThreadingMixIn
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+# Parser
+from genie.libs.parser.bigip.collector import (BigipCollector, _JsonStream,
+                                               collect_resources)
+from genie.libs.parser.bigip.get_cli_version import CliVersion
+from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+
+
+class BigipServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class BigipHandler(BaseHTTPRequestHandler):
+    '''BIG-IP answering with the collections of `server.resources`, paged
+    with $top/$skip and nextLink, recording the requested paths, the
+    connections and the most requests served at once'''
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.paths.append(self.path)
+            server.authorizations.add(self.headers.get('Authorization'))
+            server.clients.add(self.client_address)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight,
+                                       server.in_flight)
+        try:
+            # Long enough for concurrent requests to overlap
+            time.sleep(0.01)
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            items = server.resources.get(url.path)
+            if items is None:
+                self.send_error(404)
+                return
+            body = {'kind': 'tm:collectionstate',
+                    'selfLink': 'https://localhost' + self.path}
+            if '$top' in query:
+                top = int(query['$top'][0])
+                skip = int(query.get('$skip', ['0'])[0])
+                body.update(currentItemCount=len(items[skip:skip + top]),
+                            itemsPerPage=top, pageIndex=skip // top + 1,
+                            startIndex=skip + 1, totalItems=len(items),
+                            totalPages=-(-len(items) // top))
+                if skip + top < len(items) and server.next_link:
+                    body['nextLink'] = 'https://localhost{}?$top={}&' \
+                        '$skip={}&ver=15.1.0'.format(url.path, top,
+                                                     skip + top)
+                items = items[skip:skip + top]
+            body['items'] = items
+            body = json.dumps(body).encode()
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class IcrSession(object):
+    '''iControl REST session, reading the whole text of its responses'''
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.auth = ('admin', 'admin')
+        self.session.verify = False
+        self.session.headers.update({'Content-Type': 'application/json'})
+
+    def get(self, url, **kwargs):
+        response = self.session.get(url, **kwargs)
+        response.text
+        return response
+
+
+class RestDevice(object):
+    '''Device connected with the bigip REST connector, raising as it does
+    when the response is not ok'''
+
+    def __init__(self, host, port):
+        self.base_url = 'http://{}:{}'.format(host, port)
+        self.icr_session = IcrSession()
+        self.get = Mock(side_effect=self._get)
+
+    def _get(self, api_url, timeout=30):
+        response = self.icr_session.get(self.base_url + api_url,
+                                        timeout=timeout)
+        if not response.ok:
+            raise requests.HTTPError('returned {}'.format(
+                                                    response.status_code))
+        return response
+
+
+class TestJsonStream(unittest.TestCase):
+
+    documents = [
+        {'kind': 'tm:ltm:pool:poolcollectionstate', 'items': [
+            {'name': 'pool{}'.format(index), 'slowRampTime': 10 ** index,
+             'description': 'café ☃ "quoted"', 'monitor': None,
+             'members': [{'ratio': 1.5, 'enabled': True}]}
+                                                    for index in range(20)],
+         'totalItems': 12345},
+        {'items': []},
+        {},
+        [1, {'a': 'b'}],
+        1234567,
+        '☃',
+    ]
+
+    def chunks(self, document, size):
+        encoded = json.dumps(document, ensure_ascii=False).encode()
+        return [encoded[index:index + size]
+                                for index in range(0, len(encoded), size)]
+
+    def test_same_as_json(self):
+        for document in self.documents:
+            for size in (1, 2, 7, 64, 100000):
+                with self.subTest(document=document, size=size):
+                    self.assertEqual(_JsonStream(self.chunks(document,
+                                                             size)).decode(),
+                                     document)
+
+    def test_invalid(self):
+        for text in (b'', b'{"items": [1, 2}', b'{"a": 1} 2', b'{1: 2}',
+                     b'{"items": [1, 2'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    _JsonStream([text[:3], text[3:]]).decode()
+
+
+class TestBigipCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.server = BigipServer(('127.0.0.1', 0), BigipHandler)
+        self.server.lock = threading.Lock()
+        self.server.paths = []
+        self.server.authorizations = set()
+        self.server.clients = set()
+        self.server.in_flight = self.server.max_in_flight = 0
+        self.server.next_link = True
+        self.server.resources = {
+            '/mgmt/tm/ltm/pool': [{'name': 'pool{}'.format(index)}
+                                                    for index in range(5)],
+            '/mgmt/tm/cli/version': [{'version': '15.1.0'}],
+        }
+        for index in range(40):
+            self.server.resources['/mgmt/tm/sys/resource{}'.format(index)] \
+                                                    = [{'index': index}]
+
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.device = RestDevice(*self.server.server_address)
+
+    def test_parser(self):
+        parsed = CliVersion(device=self.device, context='rest').parse()
+        self.assertEqual(parsed['items'], [{'version': '15.1.0'}])
+        self.assertEqual(self.server.paths, ['/mgmt/tm/cli/version'])
+
+    def test_streamed(self):
+        collector = BigipCollector(self.device, max_workers=16,
+                                   chunk_size=16)
+        with patch('genie.libs.parser.bigip.collector._JsonStream',
+                   wraps=_JsonStream) as stream:
+            self.assertEqual(len(collector.get('/mgmt/tm/ltm/pool')['items']),
+                             5)
+        # Through a session of the collector, not the whole text read by
+        # the connector
+        self.device.get.assert_not_called()
+        stream.assert_called_once()
+        self.assertEqual(self.server.authorizations,
+                         {requests.auth._basic_auth_str('admin', 'admin')})
+        session = collector._session()
+        self.assertIsNot(session, self.device.icr_session.session)
+        self.assertFalse(session.verify)
+        self.assertEqual(session.adapters['http://']._pool_maxsize, 16)
+        # The session of the connector is left as it is
+        self.assertEqual(self.device.icr_session.session.adapters['http://']
+                                                            ._pool_maxsize,
+                         requests.adapters.DEFAULT_POOLSIZE)
+
+    def test_reconnected(self):
+        collector = BigipCollector(self.device)
+        session = collector._session()
+        self.assertIs(collector._session(), session)
+        self.device.icr_session = IcrSession()
+        self.assertIsNot(collector._session(), session)
+
+    def test_error(self):
+        collector = BigipCollector(self.device)
+        # Requested again through the connector, raising its error
+        with self.assertRaises(requests.HTTPError):
+            collector.get('/mgmt/tm/ltm/unknown')
+        self.device.get.assert_called_once_with('/mgmt/tm/ltm/unknown',
+                                                timeout=30)
+
+    def test_next_link(self):
+        self.device.bigip_collector = BigipCollector(self.device, page_size=2)
+        parsed = LtmPool(device=self.device, context='rest').parse()
+
+        self.assertEqual([item['name'] for item in parsed['items']],
+                         ['pool0', 'pool1', 'pool2', 'pool3', 'pool4'])
+        self.assertEqual(parsed['totalItems'], 5)
+        self.assertEqual(parsed['currentItemCount'], 5)
+        self.assertNotIn('nextLink', parsed)
+        self.assertNotIn('pageIndex', parsed)
+        self.assertEqual(self.server.paths, [
+            '/mgmt/tm/ltm/pool?$top=2',
+            '/mgmt/tm/ltm/pool?$top=2&$skip=2&ver=15.1.0',
+            '/mgmt/tm/ltm/pool?$top=2&$skip=4&ver=15.1.0'])
+
+    def test_skip(self):
+        # Pages given with totalItems only
+        self.server.next_link = False
+        collector = BigipCollector(self.device, page_size=2)
+        pool = collector.get('/mgmt/tm/ltm/pool')
+
+        self.assertEqual(len(pool['items']), 5)
+        self.assertEqual(self.server.paths, [
+            '/mgmt/tm/ltm/pool?$top=2',
+            '/mgmt/tm/ltm/pool?$skip=2&$top=2',
+            '/mgmt/tm/ltm/pool?$skip=4&$top=2'])
+
+    def test_collect(self):
+        paths = ['/mgmt/tm/sys/resource{}'.format(index)
+                                                    for index in range(40)]
+        collector = BigipCollector(self.device, max_workers=16)
+        resources = collector.collect(paths + [CliVersion, paths[0]])
+
+        self.assertEqual(list(resources), paths + [CliVersion])
+        self.assertEqual(resources[paths[7]]['items'], [{'index': 7}])
+        self.assertEqual(resources[CliVersion]['items'],
+                         [{'version': '15.1.0'}])
+        self.assertEqual(len(self.server.paths), 41)
+
+        # Concurrent requests over at most 16 kept-alive connections
+        for _ in range(3):
+            collector.collect(paths)
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 16)
+        self.assertLessEqual(len(self.server.clients), 16)
+
+    def test_mock_device(self):
+        device = Mock()
+        device.get.return_value.json.return_value = {'items': []}
+        self.assertEqual(collect_resources(device, [CliVersion]),
+                         {CliVersion: {'items': []}})
+        device.get.assert_called_once_with('/mgmt/tm/cli/version')
+
+
+if __name__ == '__main__':
+    unittest.main()
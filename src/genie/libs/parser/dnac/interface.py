@@ -10,8 +10,16 @@ import logging
 import pprint
 import re
 import unittest
+import functools
 from genie import parsergen
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    Session = HTTPAdapter = None
 
 from pyats.log.utils import banner
 
@@ -85,12 +93,88 @@ class Interface(InterfaceSchema):
     parser for 
     /dna/intent/api/v1/interface, 
     /dna/intent/api/v1/interface/{interface}
+
+    The get() of the dnac REST connector sends one request at a time, each
+    on a new connection. With this connector, the hostname of each device is
+    looked up through a session of the parser instead, authenticated with
+    the token of the connection, with at most lookup_workers concurrent
+    requests over as many keep-alive connections. Otherwise the devices are
+    looked up one at a time through get().
+    With bulk=True, the hostnames are read from the network-device listing
+    instead, a page of device_page_size devices per request.
     """
 
     cli_command = ['/dna/intent/api/v1/interface', 
                    '/dna/intent/api/v1/interface/{interface}']
 
-    def cli(self,interface="", output=None):
+    device_command = '/dna/intent/api/v1/network-device/{device_id}'
+    device_list_command = '/dna/intent/api/v1/network-device?offset={offset}&limit={limit}'
+
+    lookup_workers = 8
+    device_page_size = 500
+
+    def _lookup_session(self, max_workers):
+        '''requests Session authenticated as the dnac REST connection of the
+        device, keeping up to max_workers connections alive. None without
+        this connection.'''
+        base_url = getattr(self.device, 'base_url', None)
+        token = getattr(self.device, 'token', None)
+        if Session is None or not isinstance(base_url, str) or \
+                not isinstance(token, str) or \
+                getattr(self.device, 'connected', True) is not True:
+            return None
+        session = Session()
+        session.headers.update({'x-auth-token': token,
+                                'content-type': 'application/json'})
+        session.verify = getattr(self.device, 'verify', True)
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _hostname(self, device_id, session=None):
+        cmd = self.device_command.format(device_id=device_id)
+        if session is None:
+            response = self.device.get(cmd)
+        else:
+            response = session.get(self.device.base_url + cmd, timeout=30)
+        return response.json()['response']['hostname']
+
+    def _lookup_hostnames(self, device_ids, max_workers):
+        session = None
+        if len(device_ids) > 1 and max_workers > 1:
+            session = self._lookup_session(max_workers)
+        if session is None:
+            return {device_id: self._hostname(device_id)
+                    for device_id in device_ids}
+        with session, ThreadPoolExecutor(max_workers=min(
+                                    max_workers, len(device_ids))) as pool:
+            return dict(zip(device_ids, pool.map(
+                functools.partial(self._hostname, session=session),
+                device_ids)))
+
+    def _list_hostnames(self, device_ids):
+        id_to_hostname = {}
+        missing = set(device_ids)
+        offset = 1
+        while missing:
+            cmd = self.device_list_command.format(offset=offset,
+                                                  limit=self.device_page_size)
+            devices = self.device.get(cmd).json()['response']
+            for device_info in devices:
+                id_to_hostname[device_info['id']] = device_info['hostname']
+                missing.discard(device_info['id'])
+            if len(devices) < self.device_page_size:
+                break
+            offset += len(devices)
+
+        # Devices added since the listing
+        id_to_hostname.update(self._lookup_hostnames(
+            [device_id for device_id in device_ids if device_id in missing],
+            self.lookup_workers))
+        return id_to_hostname
+
+    def cli(self,interface="", output=None, bulk=False, max_workers=None):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
@@ -101,20 +185,18 @@ class Interface(InterfaceSchema):
         else:
             out = output
 
-        # get device by id
-        cmd = '/dna/intent/api/v1/network-device/{device_id}'
+        # get devices by id, each of them once
+        device_ids = list(OrderedDict.fromkeys(intf_dict['deviceId']
+                                               for intf_dict in out))
+        if bulk:
+            id_to_hostname = self._list_hostnames(device_ids)
+        else:
+            id_to_hostname = self._lookup_hostnames(
+                device_ids, max_workers or self.lookup_workers)
 
         result_dict={}
-        id_to_hostname = {}
         for intf_dict in out:
-            device_id = intf_dict['deviceId']
-            if device_id not in id_to_hostname:
-                device_id_cmd = cmd.format(device_id=device_id)
-                device_info = self.device.get(device_id_cmd).json()['response']
-                hostname = device_info['hostname']
-                id_to_hostname[device_id] = hostname
-            else:
-                hostname = id_to_hostname[device_id]
+            hostname = id_to_hostname[intf_dict['deviceId']]
 
             host_info = result_dict.setdefault('hostname', {}).setdefault(hostname, {}).setdefault('interfaces', {})
             # remove None values
@@ -1,6 +1,13 @@
 # Python
+import json
+import time
+import threading
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit, parse_qs
+from socketserver import ThreadingMixIn
+from http.server import HTTPServer, BaseHTTPRequestHandler
+import requests
 from requests.models import Response
 # ATS
 from pyats.topology import Device
@@ -215,5 +222,178 @@ class TestInterfaceRest(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
 
+class DnacServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class DnacHandler(BaseHTTPRequestHandler):
+    '''DNA Center answering with `server.interfaces` and `server.devices`
+    (`server.listed` in the network-device listing if set), recording the
+    requested paths, the tokens and connections of the device lookups and
+    the most requests served at once'''
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.paths.append(self.path)
+            if self.path.startswith('/dna/intent/api/v1/network-device/'):
+                server.tokens.add(self.headers.get('x-auth-token'))
+                server.clients.add(self.client_address)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight,
+                                       server.in_flight)
+        try:
+            # Long enough for concurrent lookups to overlap
+            time.sleep(0.01)
+            url = urlsplit(self.path)
+            if url.path == '/dna/intent/api/v1/interface':
+                response = server.interfaces
+            elif url.path == '/dna/intent/api/v1/network-device':
+                query = parse_qs(url.query)
+                offset = int(query['offset'][0]) - 1
+                limit = int(query['limit'][0])
+                listed = getattr(server, 'listed', server.devices)
+                response = listed[offset:offset + limit]
+            else:
+                device_id = url.path.rsplit('/', 1)[1]
+                response = [device for device in server.devices
+                                            if device['id'] == device_id][0]
+            body = json.dumps({'response': response}).encode()
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class RestDevice(object):
+    '''Device connected with the dnac REST connector, whose get() holds the
+    lock of the connection and sends each request on its own connection'''
+
+    def __init__(self, host, port):
+        self.url = self.base_url = 'http://{}:{}'.format(host, port)
+        self.token = 'token-1'
+        self.verify = False
+        self.connected = True
+        self.lock = threading.Lock()
+        self.gets = []
+
+    def get(self, api_url, timeout=30, **kwargs):
+        with self.lock:
+            self.gets.append(api_url)
+            hdr = {'x-auth-token': self.token,
+                   'content-type': 'application/json'}
+            return requests.get(self.url + api_url, headers=hdr,
+                                verify=self.verify, timeout=timeout, **kwargs)
+
+
+class LockedDevice(RestDevice):
+    '''Connected device without the attributes of the dnac REST connector'''
+
+    def __init__(self, host, port):
+        super().__init__(host, port)
+        del self.base_url
+
+
+class TestInterfaceDeviceLookups(unittest.TestCase):
+
+    interface = {
+        'adminStatus': 'UP', 'ifIndex': '1', 'interfaceType': 'Physical',
+        'isisSupport': 'false', 'lastUpdated': '2019-05-31 16:17:51.735',
+        'ospfSupport': 'false', 'pid': 'ISR4451-X/K9', 'portMode': 'routed',
+        'serialNo': 'FOC1234', 'series': 'Cisco 4400 Series',
+        'status': 'up', 'description': None}
+
+    def setUp(self):
+        self.server = DnacServer(('127.0.0.1', 0), DnacHandler)
+        self.server.lock = threading.Lock()
+        self.server.paths = []
+        self.server.tokens = set()
+        self.server.clients = set()
+        self.server.in_flight = self.server.max_in_flight = 0
+        self.server.devices = [{'id': 'id-{}'.format(index),
+                                'hostname': 'router{}'.format(index)}
+                               for index in range(40)]
+        self.server.interfaces = [
+            dict(self.interface, deviceId='id-{}'.format(index % 30),
+                 portName='GigabitEthernet0/0/{}'.format(index))
+            for index in range(90)]
+
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.device = RestDevice(*self.server.server_address)
+
+    def device_lookups(self):
+        return [path for path in self.server.paths
+                            if path.startswith('/dna/intent/api/v1/network-device/')]
+
+    def test_concurrent_lookups(self):
+        parsed = Interface(device=self.device).parse(max_workers=4)
+
+        self.assertEqual(len(parsed['hostname']), 30)
+        self.assertEqual(
+            sorted(parsed['hostname']['router7']['interfaces']),
+            ['GigabitEthernet0/0/37', 'GigabitEthernet0/0/67',
+             'GigabitEthernet0/0/7'])
+        self.assertNotIn('description', parsed['hostname']['router7']
+                            ['interfaces']['GigabitEthernet0/0/7'])
+
+        # Each device looked up once, at most 4 at a time over 4 connections
+        # of the session of the parser, not through the locked get()
+        self.assertEqual(self.server.paths[0], '/dna/intent/api/v1/interface')
+        self.assertEqual(sorted(self.device_lookups()), sorted(
+            '/dna/intent/api/v1/network-device/id-{}'.format(index)
+                                                    for index in range(30)))
+        self.assertEqual(self.device.gets, ['/dna/intent/api/v1/interface'])
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        self.assertLessEqual(len(self.server.clients), 4)
+        self.assertEqual(self.server.tokens, {'token-1'})
+
+    def test_without_connector(self):
+        # Looked up one at a time through get()
+        device = LockedDevice(*self.server.server_address)
+        parsed = Interface(device=device).parse(max_workers=4)
+
+        self.assertEqual(len(parsed['hostname']), 30)
+        self.assertEqual(len(device.gets), 31)
+        self.assertEqual(self.server.max_in_flight, 1)
+
+    def test_bulk(self):
+        with patch.object(Interface, 'device_page_size', 16):
+            parsed = Interface(device=self.device).parse(bulk=True)
+
+        self.assertEqual(len(parsed['hostname']), 30)
+        self.assertEqual(self.server.paths, [
+            '/dna/intent/api/v1/interface',
+            '/dna/intent/api/v1/network-device?offset=1&limit=16',
+            '/dna/intent/api/v1/network-device?offset=17&limit=16'])
+
+    def test_bulk_unlisted_device(self):
+        # Device added after the listing, looked up on its own
+        self.server.interfaces.append(dict(self.interface, deviceId='id-new',
+                                           portName='Loopback0'))
+        self.server.devices.append({'id': 'id-new', 'hostname': 'new'})
+        self.server.listed = self.server.devices[:-1]
+
+        parsed = Interface(device=self.device).parse(bulk=True)
+
+        self.assertIn('Loopback0', parsed['hostname']['new']['interfaces'])
+        self.assertEqual(self.device_lookups(),
+                         ['/dna/intent/api/v1/network-device/id-new'])
+
 if __name__ == '__main__':
     unittest.main()
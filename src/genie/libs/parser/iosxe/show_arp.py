@@ -22,6 +22,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.interning import string_pool
 
 
 # =============================================
@@ -104,7 +106,7 @@ class ShowArp(ShowArpSchema):
             if m:
                 group = m.groupdict()
                 address = group['address']
-                interface = group['interface']
+                interface = string_pool(group['interface'])
                 if interface:
                     final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
                         interface, {}).setdefault('ipv4', {}).setdefault(
@@ -112,7 +114,7 @@ class ShowArp(ShowArpSchema):
                     
                     final_dict['ip'] = address
                     final_dict['link_layer_address'] = group['mac']
-                    final_dict['type'] = group['type']
+                    final_dict['type'] = string_pool(group['type'])
                     if group['age'] == '-':
                         final_dict['origin'] = 'static'
                     else:
@@ -122,10 +124,10 @@ class ShowArp(ShowArpSchema):
                         'global_static_table', {}).setdefault(address, {})
                     final_dict['ip_address'] = address
                     final_dict['mac_address'] = group['mac']
-                    final_dict['encap_type'] = group['type']
+                    final_dict['encap_type'] = string_pool(group['type'])
 
-                final_dict['age'] = group['age']
-                final_dict['protocol'] = group['protocol']
+                final_dict['age'] = string_pool(group['age'])
+                final_dict['protocol'] = string_pool(group['protocol'])
                 continue
 
         return ret_dict
@@ -133,10 +135,14 @@ class ShowArp(ShowArpSchema):
 # =====================================
 # Parser for 'show ip arp, show ip arp vrf <vrf>'
 # =====================================
-class ShowIpArp(ShowArp):
+class ShowIpArp(ShowArp, CompactParser):
     """Parser for 'show ip arp,  show ip arp vrf <vrf>"""
     cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 
+    # Neighbors of each interface, and entries without interface
+    compact_tables = [('interfaces', None, 'ipv4', 'neighbors'),
+                      ('global_static_table',)]
+
     def cli(self, vrf='', output=None):
         if output is None:
             if vrf:
@@ -115,6 +115,13 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.stream import RecordStream, StreamParser
+from genie.libs.parser.utils.cache import parse_cached, execute_cached
+from genie.libs.parser.utils.interning import string_pool
+
+# Patterns of the parsers in this module, compiled once
+_patterns = PatternTable()
 
 
 # ============================================
@@ -193,7 +200,7 @@ class ShowBgpSchema(MetaParser):
 #   * 'show ip bgp {address_family} rd {rd}'
 #   * 'show ip bgp {address_family} vrf {vrf}'
 # ============================================
-class ShowBgpSuperParser(ShowBgpSchema):
+class ShowBgpSuperParser(ShowBgpSchema, StreamParser):
 
     ''' Super Parser for:
         * 'show bgp all'
@@ -208,6 +215,17 @@ class ShowBgpSuperParser(ShowBgpSchema):
         * 'show ip bgp {address_family} vrf {vrf}'
     '''
 
+    # A prefix starts on its status codes and network, its next paths being
+    # the lines after it, under its address family, table version and route
+    # distinguisher
+    record_stream = RecordStream(
+        record=r'^\s*[sxSdhmr\*\>]*( ?[iecarlI])? {0,4}[\w\[]'
+               r'[\w\.\:\-\[\]\,]*\/\d+( |$)',
+        context=[r'^\s*For +address +family:',
+                 r'^\s*BGP +table +version +is',
+                 r'^\s*Route +Distinguisher *:',
+                 r'^\s*AF-Private +Import +to +Address-Family:'])
+
     def cli(self, address_family='', vrf='', output=None):
 
         # Init dictionary
@@ -225,21 +243,21 @@ class ShowBgpSuperParser(ShowBgpSchema):
         origin_codes_info = origin_codes_data = ""
 
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                        r' +(?P<address_family>[\S\s]+)$')
+        p1 = _patterns.compile(r'^\s*For +address +family:'
+                               r' +(?P<address_family>[\S\s]+)$')
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                               r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                               r' +ID +is +(?P<local_router_id>(\S+))$')
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # *>   [5][65535:1][0][24][10.1.1.0]/17
         # *>  100:2051:VEID-2:Blk-1/136
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
-                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
-                          r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_1 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                 r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
+                                 r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
+                                 r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -248,11 +266,11 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # r>                    0.0.0.0                 0         32768 ?
         # *m                    0.0.0.0                 0         32768 ?
         # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
-                          r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                          r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
-                          r'(?P<termination>[\s\S]+)$')
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
+                                 r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
+                                 r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                 r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
+                                 r'(?P<termination>[\s\S]+)$')
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
@@ -262,26 +280,26 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
         # *>  100:2051:VEID-2:Blk-1/136
         # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
-        p4 = re.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
-                        r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
-                        r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
-                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
-                        r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
-                        r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
-                        r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
+        p4 = _patterns.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
+                               r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
+                               r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
+                               r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
+                               r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
+                               r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
+                               r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
 
         # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-        p5 = re.compile(r'^\s*AF-Private +Import +to +Address-Family:'
-                        r' +(?P<af_private_import_to_address_family>[\s\S]+),'
-                        r' +Pfx +Count/Limit:'
-                        r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
+        p5 = _patterns.compile(r'^\s*AF-Private +Import +to +Address-Family:'
+                               r' +(?P<af_private_import_to_address_family>[\s\S]+),'
+                               r' +Pfx +Count/Limit:'
+                               r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p6 = re.compile(r'^\s*Route +Distinguisher *: '
-                        r'+(?P<route_distinguisher>(\S+))'
-                        r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                        r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p6 = _patterns.compile(r'^\s*Route +Distinguisher *: '
+                               r'+(?P<route_distinguisher>(\S+))'
+                               r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                               r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -346,8 +364,8 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['termination']:
                     termination = m.groupdict()['termination']
-                    m3 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
-                                    ' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
+                    m3 = _patterns.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
+                                           ' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
                     if m3 and m3.groupdict()['path']:
                         path_info = m3.groupdict()['path']
                     if m3 and m3.groupdict()['origin_codes']:
@@ -388,10 +406,10 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 # Set keys
                 if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
+                    af_dict['routes'][prefix]['index'][index]['status_codes'] = string_pool(status_codes)
 
                 if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+                    af_dict['routes'][prefix]['index'][index]['next_hop'] = string_pool(next_hop)
                 if m.groupdict()['local_prf']:
                     af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
                 if m.groupdict()['weight']:
@@ -400,9 +418,9 @@ class ShowBgpSuperParser(ShowBgpSchema):
                     af_dict['routes'][prefix]['index'][index]['metric'] = metric
 
                 if path_info:
-                     af_dict['routes'][prefix]['index'][index]['path'] = path_info
+                     af_dict['routes'][prefix]['index'][index]['path'] = string_pool(path_info)
                 if origin_codes_info:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_info
+                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = string_pool(origin_codes_info)
 
                 continue
 
@@ -433,8 +451,8 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['path']:
                     path_1 = m.groupdict()['path']
-                    m3 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
-                                    ' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
+                    m3 = _patterns.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
+                                           ' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
                     if m3:
                         path_data = m3.groupdict()['path_inner']
                         origin_codes_data = m3.groupdict()['origin_codes_inner']
@@ -474,11 +492,11 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 # Set keys
                 if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
+                    af_dict['routes'][prefix]['index'][index]['status_codes'] = string_pool(status_codes)
                 if path_data:
-                    af_dict['routes'][prefix]['index'][index]['path'] = path_data
+                    af_dict['routes'][prefix]['index'][index]['path'] = string_pool(path_data)
                 if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+                    af_dict['routes'][prefix]['index'][index]['next_hop'] = string_pool(next_hop)
                 if m.groupdict()['local_prf']:
                     af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
                 if m.groupdict()['weight']:
@@ -486,7 +504,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 if m.groupdict()['metric']:
                     af_dict['routes'][prefix]['index'][index]['metric'] = metric
                 if origin_codes_data:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_data
+                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = string_pool(origin_codes_data)
                 continue
 
             # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
@@ -922,24 +940,24 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family:'
-                        r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
+        p1 = _patterns.compile(r'^For +address +family:'
+                               r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
 
         # Paths: (1 available, best #1, table default)
         # Paths: (1 available, best #1, table VRF1)
         # Paths: (1 available, best #1, no table)
         # Paths: (1 available, best #1, table default, RIB-failure(17))
-        p2 = re.compile(r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
-                        r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
-                        r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
+        p2 = _patterns.compile(r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
+                               r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
+                               r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
 
         # Route Distinguisher: 100:100 (default for vrf VRF1)
         # Route Distinguisher: 65535:1 (default for vrf evpn1)
         # Route Distinguisher: 65109:3051
         # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-        p2_1 = re.compile(r'^Route +Distinguisher:'
-                          r' +(?P<route_distinguisher>[0-9.\:]+)'
-                          r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
+        p2_1 = _patterns.compile(r'^Route +Distinguisher:'
+                                 r' +(?P<route_distinguisher>[0-9.\:]+)'
+                                 r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
 
         # BGP routing table entry for 10.4.1.1/32, version 4
         # BGP routing table entry for [100:100]2001:11:11::11/128, version 2
@@ -948,7 +966,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # BGP routing table entry for 2001:2:2:2::2/128, version 2
         # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
         # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-        p3_1 = re.compile(r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
+        p3_1 = _patterns.compile(r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
                         r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
                         r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
                         r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
@@ -962,106 +980,106 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         r'+(?P<prefix_table_version>[0-9]+)$')
 
         # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-        p3_2 = re.compile(r'^BGP +routing +table +entry +for'
-                          r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
-                          r' +version +(?P<version>(\d+))$')
+        p3_2 = _patterns.compile(r'^BGP +routing +table +entry +for'
+                                 r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
+                                 r' +version +(?P<version>(\d+))$')
 
         # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
         # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
         # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
         # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
         # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-        p4 = re.compile(r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                        r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
-                        r'( +\((?P<inaccessible>inaccessible)\)))?'
-                        r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
-                        r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
-                        r' +\((?P<originator>[0-9\.]+)\))$')
+        p4 = _patterns.compile(r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                               r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
+                               r'( +\((?P<inaccessible>inaccessible)\)))?'
+                               r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
+                               r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
+                               r' +\((?P<originator>[0-9\.]+)\))$')
 
         # Origin incomplete, metric 0, localpref 100, valid, internal
         # Origin incomplete, metric 0, localpref 100, valid, internal, best
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
         # Origin IGP, localpref 100, valid, external, atomic-aggregate
         # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
-        p5 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
-                        r'+(?P<metric>[0-9]+),?)?(?: +localpref '
-                        r'+(?P<locprf>[0-9]+),?)?(?: +weight '
-                        r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
-                        r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
-                        r'external|local)\,?))?(?: '
-                        r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
-                        r'+(?P<best>best))?$')
+        p5 = _patterns.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
+                               r'+(?P<metric>[0-9]+),?)?(?: +localpref '
+                               r'+(?P<locprf>[0-9]+),?)?(?: +weight '
+                               r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
+                               r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
+                               r'external|local)\,?))?(?: '
+                               r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
+                               r'+(?P<best>best))?$')
 
         # Advertised to update-groups:
-        p6_1 = re.compile(r'^Advertised +to +update-groups *:$')
+        p6_1 = _patterns.compile(r'^Advertised +to +update-groups *:$')
 
         # Not advertised to any peer
-        p6_2 = re.compile(r'^Not +advertised +to +any +peer$')
+        p6_2 = _patterns.compile(r'^Not +advertised +to +any +peer$')
 
         # 3
         # 38         44         45
-        p6_3 = re.compile(r'^(?P<group1>(\d+))'
-                          r'(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$')
+        p6_3 = _patterns.compile(r'^(?P<group1>(\d+))'
+                                 r'(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$')
 
         # Refresh Epoch 1
-        p7 = re.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
+        p7 = _patterns.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
 
         # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-        p8 = re.compile(r'^Extended +Community\:'
-                        r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
-                        r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
+        p8 = _patterns.compile(r'^Extended +Community\:'
+                               r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
+                               r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
 
         # Extended Community: SoO:65109:999 RT:65109:50
         # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
         # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-        p8_2 = re.compile(r'^Extended +Community *:'
-                          r' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
-                          r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
+        p8_2 = _patterns.compile(r'^Extended +Community *:'
+                                 r' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
+                                 r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
 
         # Community: 62000:1
         # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-        p8_3 = re.compile(r'^Community: +(?P<community>[\S+\s]+)$')
+        p8_3 = _patterns.compile(r'^Community: +(?P<community>[\S+\s]+)$')
 
         # AGI version(0), VE Block Size(10) Label Base(16)
-        p8_4 = re.compile(r'^AGI +version\((?P<agi_version>(\d+))\),'
-                          r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
-                          r' +Label +Base\((?P<label_base>(\d+))\)$')
+        p8_4 = _patterns.compile(r'^AGI +version\((?P<agi_version>(\d+))\),'
+                                 r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
+                                 r' +Label +Base\((?P<label_base>(\d+))\)$')
 
         # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-        p8_5 = re.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
-                          r' +Cluster +list: +(?P<cluster_list>(\S+))$')
+        p8_5 = _patterns.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
+                                 r' +Cluster +list: +(?P<cluster_list>(\S+))$')
 
         # rx pathid: 0, tx pathid: 0
-        p9 = re.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
-                        r' +tx +pathid\:'
-                        r' +(?P<transfer_pathid>[0-9x]+)$')
+        p9 = _patterns.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
+                               r' +tx +pathid\:'
+                               r' +(?P<transfer_pathid>[0-9x]+)$')
 
         # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-        p10 = re.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
-                         r' +Gateway +Address\: +'
-                         r'(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
-                         r' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
-                         r'\, +[L|l]abel +(?P<label>[0-9]+)$')
+        p10 = _patterns.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
+                                r' +Gateway +Address\: +'
+                                r'(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
+                                r' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
+                                r'\, +[L|l]abel +(?P<label>[0-9]+)$')
 
         # Local vxlan vtep:
-        p11 = re.compile(r'^Local +vxlan +vtep\:$')
+        p11 = _patterns.compile(r'^Local +vxlan +vtep\:$')
 
         # bdi:BDI200
-        p12 = re.compile(r'^bdi\:(?P<bdi>[A-Z0-9]+)$')
+        p12 = _patterns.compile(r'^bdi\:(?P<bdi>[A-Z0-9]+)$')
 
         # vrf:evpn1, vni:30000
-        p13 = re.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
-                         r' +vni\:(?P<vni>[0-9]+)$')
+        p13 = _patterns.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
+                                r' +vni\:(?P<vni>[0-9]+)$')
 
         # local router mac:001E.7AFF.FCD2
-        p14 = re.compile(r'^local +router +mac\:'
-                         r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
+        p14 = _patterns.compile(r'^local +router +mac\:'
+                                r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
 
         # encap:8
-        p15 = re.compile(r'^encap\:(?P<encap>[0-9]+)$')
+        p15 = _patterns.compile(r'^encap\:(?P<encap>[0-9]+)$')
 
         # vtep-ip:10.21.33.33
-        p16 = re.compile(r'^vtep-ip\:(?P<vtep_ip>[0-9\.]+)$')
+        p16 = _patterns.compile(r'^vtep-ip\:(?P<vtep_ip>[0-9\.]+)$')
 
         # Local
         # 65530
@@ -1074,13 +1092,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-        p17 = re.compile(r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
+        p17 = _patterns.compile(r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
                        r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
                        r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
                        r'\[\]\-\&]+))?$')
         
         # mpls labels in/out nolabel/64402
-        p18 = re.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
+        p18 = _patterns.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1858,8 +1876,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         show_vrf_output = None
         if ('rd' in cmd and 'summary' in cmd and
             output != '% RD does not match the default RD of any VRF'):
-            obj = ShowVrf(device=self.device)
-            show_vrf_output = obj.parse()
+            show_vrf_output = parse_cached(ShowVrf, self.device)
             # try:
             #     show_vrf_output = obj.parse()
             # except Exception:
@@ -1879,12 +1896,12 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                                      'show run | sec address-family ipv6 vrf']
                 
                 for command in commands_list:
-                    out_vrf = self.device.execute(command)
+                    out_vrf = execute_cached(self.device, command)
 
-                    rc1 = re.compile(r'address\-family\s+(?P<address_family>'
-                                      'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
+                    rc1 = _patterns.compile(r'address\-family\s+(?P<address_family>'
+                                             'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
 
-                    rc2 = re.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
+                    rc2 = _patterns.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
                                 'remote\-as\s+(?P<remote_as>\S+)')
 
                     flag_address_family = False            
@@ -1910,80 +1927,80 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                             continue
 
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p1 = _patterns.compile(r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
 
         # BGP router identifier 192.168.111.1, local AS number 100
-        p2 = re.compile(r'^BGP +router +identifier'
-                         ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                         ' +number +(?P<local_as>[0-9]+)$')
+        p2 = _patterns.compile(r'^BGP +router +identifier'
+                                ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
+                                ' +number +(?P<local_as>[0-9]+)$')
 
         # BGP table version is 28, main routing table version 28
-        p3 = re.compile(r'^BGP +table +version +is'
-                         ' +(?P<bgp_table_version>[0-9]+),'
-                         ' +main +routing +table +version'
-                         ' +(?P<routing_table_version>[0-9]+)$')
+        p3 = _patterns.compile(r'^BGP +table +version +is'
+                                ' +(?P<bgp_table_version>[0-9]+),'
+                                ' +main +routing +table +version'
+                                ' +(?P<routing_table_version>[0-9]+)$')
 
         # 27 network entries using 6696 bytes of memory
-        p4 = re.compile(r'^(?P<networks>[0-9]+) +network +entries +using'
-                         ' +(?P<bytes>[0-9]+) +bytes +of +memory$')
+        p4 = _patterns.compile(r'^(?P<networks>[0-9]+) +network +entries +using'
+                                ' +(?P<bytes>[0-9]+) +bytes +of +memory$')
 
         # 27 path entries using 3672 bytes of memory
-        p5 = re.compile(r'^(?P<path>[0-9]+) +path +entries +using'
-                         ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
+        p5 = _patterns.compile(r'^(?P<path>[0-9]+) +path +entries +using'
+                                ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
 
         # 2 BGP rrinfo entries using 48 bytes of memory
         # 201 BGP AS-PATH entries using 4824 bytes of memory
-        p5_1 = re.compile(r'^(?P<num_entries>([0-9]+)) +BGP'
-                           ' +(?P<entries_type>(\S+)) +entries +using'
-                           ' +(?P<entries_byte>[0-9]+) +bytes +of +memory$')
+        p5_1 = _patterns.compile(r'^(?P<num_entries>([0-9]+)) +BGP'
+                                  ' +(?P<entries_type>(\S+)) +entries +using'
+                                  ' +(?P<entries_byte>[0-9]+) +bytes +of +memory$')
 
         # 4 BGP extended community entries using 96 bytes of memory
-        p5_2 = re.compile(r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
-                           ' +community +entries +using'
-                           ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
+        p5_2 = _patterns.compile(r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
+                                  ' +community +entries +using'
+                                  ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
 
         # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
-        p6 = re.compile(r'^(?P<attribute_entries>(\S+)) +BGP'
-                         ' +(?P<attribute_type>(\S+)) +attribute +entries'
-                         ' +using +(?P<bytes>[0-9]+) +bytes +of +memory$')
+        p6 = _patterns.compile(r'^(?P<attribute_entries>(\S+)) +BGP'
+                                ' +(?P<attribute_type>(\S+)) +attribute +entries'
+                                ' +using +(?P<bytes>[0-9]+) +bytes +of +memory$')
 
         # 0 BGP route-map cache entries using 0 bytes of memory
         # 0 BGP filter-list cache entries using 0 bytes of memory
-        p6_1 = re.compile(r'^(?P<num_cache_entries>([0-9]+)) +BGP'
-                           ' +(?P<cache_type>(\S+)) +cache +entries +using'
-                           ' +(?P<cache_byte>[0-9]+) +bytes +of +memory$')
+        p6_1 = _patterns.compile(r'^(?P<num_cache_entries>([0-9]+)) +BGP'
+                                  ' +(?P<cache_type>(\S+)) +cache +entries +using'
+                                  ' +(?P<cache_byte>[0-9]+) +bytes +of +memory$')
 
         # BGP using 10648 total bytes of memory
-        p7 = re.compile(r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
-                         ' +of +memory$')
+        p7 = _patterns.compile(r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
+                                ' +of +memory$')
 
         # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
-        p8 = re.compile(r'^BGP +activity +(?P<activity_prefixes>(\S+))'
-                         ' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
-                         ' +interval +(?P<scan_interval>[0-9]+) +secs$')
+        p8 = _patterns.compile(r'^BGP +activity +(?P<activity_prefixes>(\S+))'
+                                ' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
+                                ' +interval +(?P<scan_interval>[0-9]+) +secs$')
 
         # Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
         # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
         # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
-        p9 = re.compile(r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
-                         ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
-                         ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                         ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                         ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
+        p9 = _patterns.compile(r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
+                                ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+                                ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+                                ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+                                ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
 
         #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         #  2001:DB8:20:4:6::6
         #           4          400      67      73       66    0    0 01:03:11        5
-        p10 = re.compile(r'^(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p10 = _patterns.compile(r'^(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
 
-        p11 = re.compile(r'^(?P<version>[0-9]+)'
-                          ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
-                          ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                          ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                          ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
+        p11 = _patterns.compile(r'^(?P<version>[0-9]+)'
+                                 ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+                                 ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+                                 ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+                                 ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
 
         for line in output.splitlines():
 
@@ -2805,127 +2822,127 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+        p1 = _patterns.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
 
         # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+        p2_1 = _patterns.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
                          ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
 
         # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
         # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +(?P<link>[a-zA-Z]+) +link$')
+        p2_2 = _patterns.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+                                  ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
+                                  ' +(?P<link>[a-zA-Z]+) +link$')
 
         # IOS output
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           '(?: +vrf +(?P<vrf>(\S+)),)?'
-                           ' +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
-                           '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+        p2_3 = _patterns.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+                                  '(?: +vrf +(?P<vrf>(\S+)),)?'
+                                  ' +remote +AS +(?P<remote_as>(\d+)),'
+                                  ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
+                                  '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
 
         # Description: router22222222
-        p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
+        p3 = _patterns.compile(r'^Description: +(?P<description>(\S+))$')
 
         # Administratively shut down
-        p4 = re.compile(r'^Administratively shut down$')
+        p4 = _patterns.compile(r'^Administratively shut down$')
 
         # BGP version 4, remote router ID 10.16.2.2
-        p5 = re.compile(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
-                         ' +router +ID +(?P<router_id>(\S+))$')
+        p5 = _patterns.compile(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
+                                ' +router +ID +(?P<router_id>(\S+))$')
 
         # BGP state = Established, up for 01:10:35
         # BGP state = Idle, down for 01:10:35
         # BGP state = Idle
         # BGP state = Established, up for 1w2d
         # Session state = Closing
-        p6 = re.compile(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
-                         '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
+        p6 = _patterns.compile(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
+                                '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
 
         # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-        p7_1 = re.compile(r'^Last +read +(?P<last_read>(\S+)), +last +write'
-                           ' +(?P<last_write>(\S+)), +hold +time +is'
-                           ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
-                           ' +(?P<keepalive>(\d+)) +seconds$')
+        p7_1 = _patterns.compile(r'^Last +read +(?P<last_read>(\S+)), +last +write'
+                                  ' +(?P<last_write>(\S+)), +hold +time +is'
+                                  ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
+                                  ' +(?P<keepalive>(\d+)) +seconds$')
 
         # Configured hold time is 90, keepalive interval is 30 seconds
-        p7_2 = re.compile(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
-                           ' +keepalive +interval +is +(?P<keepalive>(\d+))'
-                           ' +seconds$')
+        p7_2 = _patterns.compile(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
+                                  ' +keepalive +interval +is +(?P<keepalive>(\d+))'
+                                  ' +seconds$')
 
         # Minimum holdtime from neighbor is 0 seconds
-        p7_3 = re.compile(r'^Minimum +holdtime +from +neighbor +is'
-                           ' +(?P<min_holdtime>(\d+)) +seconds$')
+        p7_3 = _patterns.compile(r'^Minimum +holdtime +from +neighbor +is'
+                                  ' +(?P<min_holdtime>(\d+)) +seconds$')
 
         # Neighbor sessions:
-        p7_4 = re.compile(r'^Neighbor +sessions:+$')
+        p7_4 = _patterns.compile(r'^Neighbor +sessions:+$')
 
         # Neighbor sessions:
         #  1 active, is not multisession capable (disabled)
-        p8 = re.compile(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
-                         ' +capable( +\(disabled\))?)?$')
+        p8 = _patterns.compile(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
+                                ' +capable( +\(disabled\))?)?$')
 
         # Neighbor capabilities:
-        p9 = re.compile(r'^Neighbor +capabilities:$')
+        p9 = _patterns.compile(r'^Neighbor +capabilities:$')
 
         #  Route refresh: advertised and received(new)
-        p10 = re.compile(r'^Route +refresh: +(?P<route_refresh>(.*))$')
+        p10 = _patterns.compile(r'^Route +refresh: +(?P<route_refresh>(.*))$')
 
         #  Four-octets ASN Capability: advertised and received
-        p11 = re.compile(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
+        p11 = _patterns.compile(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
 
         # Address family VPNv4 Unicast: advertised and received
         # Address family VPNv6 Unicast: advertised and received
         # Address family link-state link-state: advertised
-        p12 = re.compile(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
-                          ' +(?P<val>(.*))$')
+        p12 = _patterns.compile(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
+                                 ' +(?P<val>(.*))$')
 
         #  Graceful Restart Capability: received
-        p13 = re.compile(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
+        p13 = _patterns.compile(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
 
         #   Remote Restart timer is 120 seconds
-        p14 = re.compile(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
-                          ' +seconds$')
+        p14 = _patterns.compile(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
+                                 ' +seconds$')
 
         #   Address families advertised by peer:
         #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-        p15 = re.compile(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
-                          ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
-                          ' +\(was +not +preserved$')
+        p15 = _patterns.compile(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
+                                 ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
+                                 ' +\(was +not +preserved$')
 
         # Address families advertised by peer before restart:
         #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
 
         #  Enhanced Refresh Capability: advertised
-        p16 = re.compile(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
+        p16 = _patterns.compile(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
 
 
         #  Multisession Capability:
         #  Multisession Capability: advertised
-        p17 = re.compile(r'^Multisession +Capability: +(?P<multisession>(.*))$')
+        p17 = _patterns.compile(r'^Multisession +Capability: +(?P<multisession>(.*))$')
 
         #  Stateful switchover support enabled: NO for session 1
-        p18 = re.compile(r'^Stateful +switchover +support +(?P<state>(\S+)):'
-                         ' +(?P<value>(.*))$')
+        p18 = _patterns.compile(r'^Stateful +switchover +support +(?P<state>(\S+)):'
+                                ' +(?P<value>(.*))$')
 
         # Message statistics:
         # Message statistics for 192.168.10.253 active:
         # Message statistics, state Established:
-        p19 = re.compile(r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
-                         r'(, +state +Established))?:$')
+        p19 = _patterns.compile(r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
+                                r'(, +state +Established))?:$')
 
         #  InQ depth is 0
         #  OutQ depth is 0
-        p20 = re.compile(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
+        p20 = _patterns.compile(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
 
         # Prefix activity:               ----       ----
         # Local Policy Denied Prefixes:    --------    -------
         # Refresh activity:          ----   ----
-        p21 = re.compile(r'^(?P<table_type>(Prefix activity|'
-                          'Local Policy Denied Prefixes|Refresh activity)) *:'
-                          ' +(.*)$')
+        p21 = _patterns.compile(r'^(?P<table_type>(Prefix activity|'
+                                 'Local Policy Denied Prefixes|Refresh activity)) *:'
+                                 ' +(.*)$')
 
         #  Opens:                  1          1
         #  Notifications:          0          0
@@ -2936,74 +2953,74 @@ class ShowBgpNeighborSuperParser(MetaParser):
         #  Prefixes Current:     403        201 (Consumes 27336 bytes)
         #  Used as bestpath:     n/a          0
         #  Used as multipath:    n/a          0
-        p22 = re.compile('^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
-                         ' +(?P<recv>(n/a|\d+))(?:\(Consumes +(?P<bytes>(\d+))'
-                         ' +bytes\))?$')
+        p22 = _patterns.compile('^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
+                                ' +(?P<recv>(n/a|\d+))(?:\(Consumes +(?P<bytes>(\d+))'
+                                ' +bytes\))?$')
 
         # Do log neighbor state changes (via global configuration)
 
         # Default minimum time between advertisement runs is 0 seconds
-        p23 = re.compile(r'^Default +minimum +time +between +advertisement'
-                          ' +runs +is +(?P<time>(\d+)) +seconds$')
+        p23 = _patterns.compile(r'^Default +minimum +time +between +advertisement'
+                                 ' +runs +is +(?P<time>(\d+)) +seconds$')
 
         # Address tracking is enabled, the RIB does have a route to 10.16.2.2
         # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-        p24 = re.compile(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
-                          ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
+        p24 = _patterns.compile(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
+                                 ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
 
         # Connections established 1; dropped 0
-        p25 = re.compile(r'^Connections +established +(?P<established>(\d+));'
-                          ' +dropped +(?P<dropped>(\d+))$')
+        p25 = _patterns.compile(r'^Connections +established +(?P<established>(\d+));'
+                                 ' +dropped +(?P<dropped>(\d+))$')
 
         # Last reset never
         # Last reset 01:05:09, due to Active open failed
-        p26 = re.compile(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
-                          ' +(?P<reason>(.*)))?$')
+        p26 = _patterns.compile(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
+                                 ' +(?P<reason>(.*)))?$')
 
         # Transport(tcp) path-mtu-discovery is enabled
-        p27 = re.compile(r'^Transport\(tcp\) +path-mtu-discovery +is'
-                          ' +(?P<status>(\S+))$')
+        p27 = _patterns.compile(r'^Transport\(tcp\) +path-mtu-discovery +is'
+                                 ' +(?P<status>(\S+))$')
 
         # Graceful-Restart is disabled
         # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-        p28 = re.compile(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
-                          '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
-                          ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
+        p28 = _patterns.compile(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
+                                 '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
+                                 ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
 
         # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-        p29 = re.compile(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
-                          ' +status: (?P<io>(\d+)), +unread +input +bytes:'
-                          ' +(?P<bytes>(\d+))$')
+        p29 = _patterns.compile(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
+                                 ' +status: (?P<io>(\d+)), +unread +input +bytes:'
+                                 ' +(?P<bytes>(\d+))$')
 
         # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-        p30 = re.compile(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
-                          ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
-                          ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
+        p30 = _patterns.compile(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
+                                 ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
+                                 ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
 
         # Local host: 10.64.4.4, Local port: 35281
-        p31 = re.compile(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
-                          ' +(?P<local_port>(\d+))$')
+        p31 = _patterns.compile(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
+                                 ' +(?P<local_port>(\d+))$')
 
         # Foreign host: 10.16.2.2, Foreign port: 179
-        p32 = re.compile(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
-                          ' +port: +(?P<foreign_port>(\d+))$')
+        p32 = _patterns.compile(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
+                                 ' +port: +(?P<foreign_port>(\d+))$')
 
         # Connection tableid (VRF): 0
-        p33 = re.compile(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
+        p33 = _patterns.compile(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
 
         # Maximum output segment queue size: 50
-        p34 = re.compile(r'^Maximum +output +segment +queue +size:'
-                          ' +(?P<size>(\d+))$')
+        p34 = _patterns.compile(r'^Maximum +output +segment +queue +size:'
+                                 ' +(?P<size>(\d+))$')
 
         # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-        p35 = re.compile(r'^Enqueued +packets +for +retransmit:'
-                          ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
-                          ' +mis-ordered: +(?P<misordered>(\d+))'
-                          ' +\((?P<bytes>(\d+)) +bytes+\)$')
+        p35 = _patterns.compile(r'^Enqueued +packets +for +retransmit:'
+                                 ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
+                                 ' +mis-ordered: +(?P<misordered>(\d+))'
+                                 ' +\((?P<bytes>(\d+)) +bytes+\)$')
 
         # Event Timers (current time is 0x530449):
-        p36 = re.compile(r'^Event +Timers +\(+current +time +is'
-                          ' +(?P<time>(\S+))+\):$')
+        p36 = _patterns.compile(r'^Event +Timers +\(+current +time +is'
+                                 ' +(?P<time>(\S+))+\):$')
 
         # Timer          Starts    Wakeups            Next
         # Retrans            86          0             0x0
@@ -3016,153 +3033,153 @@ class ShowBgpNeighborSuperParser(MetaParser):
         # DeadWait            0          0             0x0
         # Linger              0          0             0x0
         # ProcessQ            0          0             0x0
-        p37 = re.compile(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
-                          ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
+        p37 = _patterns.compile(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
+                                 ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
 
         # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-        p38 = re.compile(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
-                          ' +sndnxt: +(?P<sndnxt>(\d+))$')
+        p38 = _patterns.compile(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
+                                 ' +sndnxt: +(?P<sndnxt>(\d+))$')
 
         # irs:  109992783  rcvnxt:  109995158
-        p39 = re.compile(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
+        p39 = _patterns.compile(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
 
 
         # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-        p40 = re.compile(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
+        p40 = _patterns.compile(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+                                 ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
 
         # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-        p41 = re.compile(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
+        p41 = _patterns.compile(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+                                 ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
 
         # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-        p42 = re.compile(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
-                          ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
-                          ' +(?P<krtt>(\d+)) +ms$')
+        p42 = _patterns.compile(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
+                                 ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
+                                 ' +(?P<krtt>(\d+)) +ms$')
 
         # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-        p43 = re.compile(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
-                          ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
-                          ' +(?P<ack_hold>(\d+)) +ms$')
+        p43 = _patterns.compile(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
+                                 ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
+                                 ' +(?P<ack_hold>(\d+)) +ms$')
 
 
         # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-        p44 = re.compile(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
-                          ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
-                          ' +(?P<receive>(\d+)) +ms$')
+        p44 = _patterns.compile(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
+                                 ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
+                                 ' +(?P<receive>(\d+)) +ms$')
 
         # Status Flags: active open
-        p45 = re.compile(r'^Status +Flags: +(?P<flags>(.*))$')
+        p45 = _patterns.compile(r'^Status +Flags: +(?P<flags>(.*))$')
 
         # Option Flags: nagle, path mtu capable
-        p46 = re.compile(r'^Option +Flags: +(?P<flags>(.*))$')
+        p46 = _patterns.compile(r'^Option +Flags: +(?P<flags>(.*))$')
 
         # IP Precedence value : 6
-        p47 = re.compile(r'^IP +Precedence +value : +(?P<value>(\d+))$')
+        p47 = _patterns.compile(r'^IP +Precedence +value : +(?P<value>(\d+))$')
 
         # Datagrams (max data segment is 536 bytes):
-        p48 = re.compile(r'^Datagrams +\(max +data +segment +is'
-                          ' +(?P<bytes>(\d+)) +bytes\):$')
+        p48 = _patterns.compile(r'^Datagrams +\(max +data +segment +is'
+                                 ' +(?P<bytes>(\d+)) +bytes\):$')
 
         # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-        p49 = re.compile(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
-                          ' +(?P<out_of_order>(\d+))\), +with +data:'
-                          ' (?P<with_data>(\d+)), +total +data +bytes:'
-                          ' (?P<total_data>(\d+))$')
+        p49 = _patterns.compile(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
+                                 ' +(?P<out_of_order>(\d+))\), +with +data:'
+                                 ' (?P<with_data>(\d+)), +total +data +bytes:'
+                                 ' (?P<total_data>(\d+))$')
 
         # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0), with data: 87, total data bytes: 3303
-        p50 = re.compile(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
-                          ' +(?P<retransmit>(\d+)), +fastretransmit:'
-                          ' +(?P<fastretransmit>(\d+)), +partialack:'
-                          ' +(?P<partialack>(\d+)), +Second +Congestion:'
-                          ' +(?P<second_congestion>(\d+))\), +with +data:'
-                          ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
-                          ' +(?P<sent_total_data>(\d+))$')
+        p50 = _patterns.compile(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
+                                 ' +(?P<retransmit>(\d+)), +fastretransmit:'
+                                 ' +(?P<fastretransmit>(\d+)), +partialack:'
+                                 ' +(?P<partialack>(\d+)), +Second +Congestion:'
+                                 ' +(?P<second_congestion>(\d+))\), +with +data:'
+                                 ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
+                                 ' +(?P<sent_total_data>(\d+))$')
 
 
         # Packets received in fast path: 0, fast processed: 0, slow path: 0
-        p51 = re.compile(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
-                          ' +fast +processed: +(?P<processed>(\d+)),'
-                          ' +slow +path: +(?P<path>(\d+))$')
+        p51 = _patterns.compile(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
+                                 ' +fast +processed: +(?P<processed>(\d+)),'
+                                 ' +slow +path: +(?P<path>(\d+))$')
 
         # fast lock acquisition failures: 0, slow path: 0
-        p52 = re.compile(r'^fast +lock +acquisition +failures:'
-                          ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
+        p52 = _patterns.compile(r'^fast +lock +acquisition +failures:'
+                                 ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
 
 
         # TCP Semaphore      0x1286E7EC  FREE
-        p53 = re.compile(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
-                          ' +(?P<status>(\S+))$')
+        p53 = _patterns.compile(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
+                                 ' +(?P<status>(\S+))$')
 
         # BGP table version 9431, neighbor version 9431/0
-        p54 = re.compile(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
-                          ' +neighbor +version +(?P<nbr_version>(\S+))$')
+        p54 = _patterns.compile(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
+                                 ' +neighbor +version +(?P<nbr_version>(\S+))$')
 
         # Output queue size : 0
-        p55 = re.compile(r'^Output +queue +size *: +(?P<size>(\d+))$')
+        p55 = _patterns.compile(r'^Output +queue +size *: +(?P<size>(\d+))$')
 
         # Index 38, Advertise bit 1
-        p56 = re.compile(r'^Index +(?P<index>(\d+)), +Advertise +bit'
+        p56 = _patterns.compile(r'^Index +(?P<index>(\d+)), +Advertise +bit'
                         ' +(?P<adv_bit>(\d+))$')
 
         # Route-Reflector Client
-        p57 = re.compile(r'^Route-Reflector +Client$')
+        p57 = _patterns.compile(r'^Route-Reflector +Client$')
 
         # 38 update-group member
-        p58 = re.compile(r'^(?P<num>(\d+)) +update-group +member$')
+        p58 = _patterns.compile(r'^(?P<num>(\d+)) +update-group +member$')
 
         # Community attribute sent to this neighbor
-        p59 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
+        p59 = _patterns.compile(r'^Community +attribute +sent +to +this +neighbor$')
 
         # Extended-community attribute sent to this neighbor
-        p60 = re.compile(r'^Extended-community +attribute +sent +to +this'
+        p60 = _patterns.compile(r'^Extended-community +attribute +sent +to +this'
                         ' +neighbor$')
 
         # Suppress LDP signaling protocol
-        p61 = re.compile(r'^Suppress +LDP +signaling +protocol$')
+        p61 = _patterns.compile(r'^Suppress +LDP +signaling +protocol$')
 
         # Slow-peer detection is disabled
-        p62 = re.compile(r'^Slow-peer +detection +is'
-                          ' +(?P<state>(enabled|disabled))$')
+        p62 = _patterns.compile(r'^Slow-peer +detection +is'
+                                 ' +(?P<state>(enabled|disabled))$')
 
         # Slow-peer split-update-group dynamic is disabled
-        p63 = re.compile(r'^Slow-peer +split-update-group +dynamic +is'
-                          ' +(?P<state>(enabled|disabled))$')
+        p63 = _patterns.compile(r'^Slow-peer +split-update-group +dynamic +is'
+                                 ' +(?P<state>(enabled|disabled))$')
 
         # Number of NLRIs in the update sent: max 199, min 0
-        p64 = re.compile(r'^Number +of +NLRIs +in +the +update +sent: +max'
+        p64 = _patterns.compile(r'^Number +of +NLRIs +in +the +update +sent: +max'
                         ' +(?P<max>(\d+)), +min +(?P<min>(\d+))$')
 
         # Last detected as dynamic slow peer: never
-        p65 = re.compile(r'^Last +detected +as +dynamic +slow +peer:'
-                          ' +(?P<val>(\S+))$')
+        p65 = _patterns.compile(r'^Last +detected +as +dynamic +slow +peer:'
+                                 ' +(?P<val>(\S+))$')
 
         # Dynamic slow peer recovered: never
-        p66 = re.compile(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
+        p66 = _patterns.compile(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
 
         # Refresh Epoch: 3
-        p67 = re.compile(r'^Refresh +Epoch: +(?P<num>(\d+))$')
+        p67 = _patterns.compile(r'^Refresh +Epoch: +(?P<num>(\d+))$')
 
         # Last Sent Refresh Start-of-rib: 02:41:38
         # Last Received Refresh Start-of-rib: 02:01:36
-        p68 = re.compile(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
-                          ' +(?P<val>(\S+))$')
+        p68 = _patterns.compile(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
+                                 ' +(?P<val>(\S+))$')
 
         # Last Sent Refresh End-of-rib: 02:41:38
         # Last Received Refresh End-of-rib: 02:01:32
-        p69 = re.compile(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
-                          ' +(?P<val>(\S+))$')
+        p69 = _patterns.compile(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
+                                 ' +(?P<val>(\S+))$')
 
         # Refresh-Out took 0 seconds
         # Refresh-In took 4 seconds
-        p70 = re.compile(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
-                          ' +seconds$')
+        p70 = _patterns.compile(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
+                                 ' +seconds$')
 
         # SSO is disabled
-        p71 = re.compile(r'^SSO +is +(?P<state>(enabled|disabled))$')
+        p71 = _patterns.compile(r'^SSO +is +(?P<state>(enabled|disabled))$')
 
         # No active TCP connection
-        p72 = re.compile(r'^No +active +TCP +connection$')
+        p72 = _patterns.compile(r'^No +active +TCP +connection$')
 
         for line in output.splitlines():
 
@@ -4362,46 +4379,46 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
         # BGP neighbor is 10.225.10.253,  vrf CE1test,  remote AS 60000, external link
         # BGP neighbor is 192.168.0.254,  vrf L3VPN_1001,  remote AS 60001, external link
-        p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                        '(, +vrf +(?P<vrf>\S+))?, +remote AS '
-                        '+(?P<remote_as_id>[0-9]+), '
-                        '+(?P<internal_external_link>[a-z\s]+)$')
-
-        p1 = re.compile(r'^\s*For +address +family:'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                            '[\.][0-9]+[\/]?[0-9]*)|([a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
-                            '+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            '[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
-                            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            '[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-
-        p4 = re.compile(r'^\s*Route +Distinguisher *: '
-                            '+(?P<route_distinguisher>(\S+))'
-                            '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                            '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p = _patterns.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                               '(, +vrf +(?P<vrf>\S+))?, +remote AS '
+                               '+(?P<remote_as_id>[0-9]+), '
+                               '+(?P<internal_external_link>[a-z\s]+)$')
+
+        p1 = _patterns.compile(r'^\s*For +address +family:'
+                                   ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+
+        p3_1 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+                                   '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+                                   '[\.][0-9]+[\/]?[0-9]*)|([a-zA-Z0-9]+[\:]'
+                                   '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                   '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                   '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                   '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
+                                   ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                   ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+
+        p3_3 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   ' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
+                                   '+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+                                   '[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                   '[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
+                                   '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+                                   '[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
+                                   '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                   ' +(?P<origin_codes>(i|e|\?|\|))$')
+
+        p4 = _patterns.compile(r'^\s*Route +Distinguisher *: '
+                                   '+(?P<route_distinguisher>(\S+))'
+                                   '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                                   '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
         out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
@@ -4431,9 +4448,9 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         # For address family: IPv4 Unicast
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                         ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                         ' +ID +is +(?P<local_router_id>(\S+))$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                ' +ID +is +(?P<local_router_id>(\S+))$')
 
         # Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
         # Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist, I-injected
@@ -4452,7 +4469,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
         # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
         # *>i  172.16.51.0/24    192.168.36.220          0    100      0 ?
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
             '(?P<path_type>(i|e|c|l|a|r|I))?(\s+)?(?P<prefix>\S+) +(?P<next_hop>'
             '[a-zA-Z0-9\.\:]+) +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+) +'
             '(?P<origin_codes>(i|e|\?|\&|\|))$')
@@ -4615,25 +4632,25 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
                     # Metric     LocPrf     Weight Path
                     #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                    m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                     '(?P<space1>\s{4,10})'
-                                     '(?P<localprf>[0-9]+)'
-                                     '(?P<space2>\s{5,10})'
-                                     '(?P<weight>[0-9]+)'
-                                     '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                    m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                            '(?P<space1>\s{4,10})'
+                                            '(?P<localprf>[0-9]+)'
+                                            '(?P<space2>\s{5,10})'
+                                            '(?P<weight>[0-9]+)'
+                                            '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                     #    100        ---          0 10 20 30 40 50 60 70 80 90
                     #    ---        100          0 10 20 30 40 50 60 70 80 90
                     #    100        ---      32788 ---
                     #    ---        100      32788 ---
-                    m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                     '(?P<space>\s{2,21})'
-                                     '(?P<weight>[0-9]+)'
-                                     '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                    m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                            '(?P<space>\s{2,21})'
+                                            '(?P<weight>[0-9]+)'
+                                            '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                     #    ---        ---      32788 200 33299 51178 47751 {27016}
-                    m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                     ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                    m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                            ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                     if m1:
                         af_dict['advertised'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -4703,25 +4720,25 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{4,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{4,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['advertised'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5029,37 +5046,37 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
     '''
 
     def cli(self, neighbor, address_family='', output=None):
-        p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                        '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
-                        '+(?P<remote_as_id>[0-9]+), '
-                        '+(?P<internal_external_link>[a-z\s]+)$')
-        p1 = re.compile(r'^\s*For +address +family:'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            ' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+        p = _patterns.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                               '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
+                               '+(?P<remote_as_id>[0-9]+), '
+                               '+(?P<internal_external_link>[a-z\s]+)$')
+        p1 = _patterns.compile(r'^\s*For +address +family:'
+                                   ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                   ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                   ' +ID +is +(?P<local_router_id>(\S+))$')
+        p3_1 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
                         '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                            '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_3 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *: '
-                            '+(?P<route_distinguisher>(\S+))'
-                            '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                            '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+                                   '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+                                   '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+                                   '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                   '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                   '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                   '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
+                                   ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                   ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_3 = _patterns.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                   ' +(?P<origin_codes>(i|e|\?|\|))$')
+        p4 = _patterns.compile(r'^\s*Route +Distinguisher *: '
+                                   '+(?P<route_distinguisher>(\S+))'
+                                   '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                                   '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
         out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
@@ -5232,25 +5249,25 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
 
                     # Metric     LocPrf     Weight Path
                     #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                    m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                     '(?P<space1>\s{5,10})'
-                                     '(?P<localprf>[0-9]+)'
-                                     '(?P<space2>\s{5,10})'
-                                     '(?P<weight>[0-9]+)'
-                                     '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                    m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                            '(?P<space1>\s{5,10})'
+                                            '(?P<localprf>[0-9]+)'
+                                            '(?P<space2>\s{5,10})'
+                                            '(?P<weight>[0-9]+)'
+                                            '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                     #    100        ---          0 10 20 30 40 50 60 70 80 90
                     #    ---        100          0 10 20 30 40 50 60 70 80 90
                     #    100        ---      32788 ---
                     #    ---        100      32788 ---
-                    m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                     '(?P<space>\s{2,21})'
-                                     '(?P<weight>[0-9]+)'
-                                     '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                    m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                            '(?P<space>\s{2,21})'
+                                            '(?P<weight>[0-9]+)'
+                                            '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                     #    ---        ---      32788 200 33299 51178 47751 {27016}
-                    m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                     ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                    m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                            ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                     if m1:
                         af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5314,25 +5331,25 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5632,10 +5649,10 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
             # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
             out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
             vrf='default'
-            p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                            '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
-                            '+(?P<remote_as_id>[0-9]+), '
-                            '+(?P<internal_external_link>[a-z\s]+)$')
+            p = _patterns.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                                   '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
+                                   '+(?P<remote_as_id>[0-9]+), '
+                                   '+(?P<internal_external_link>[a-z\s]+)$')
             for line in out_vrf.splitlines():
                 line = line.strip()
                 # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
@@ -5659,35 +5676,35 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
             original_address_family = address_family
 
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                         ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p1 = _patterns.compile(r'^\s*For +address +family:'
+                                ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                         ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                         ' +ID +is +(?P<local_router_id>(\S+))$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                ' +ID +is +(?P<local_router_id>(\S+))$')
 
         # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
         # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
         # *>i  2001:db8:400::/64          ::FFFF:192.168.51.1
         # r>i  2001:2:2:2::2/128
-        p3 = re.compile(r'^\s*(?P<status_codes>(b|s|x|S|d|h|r|\*|\>|\s)+)?'
-                         '(?P<path_type>(i|e|c|l|a|r|I))? *'
-                         '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                         '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3 = _patterns.compile(r'^\s*(?P<status_codes>(b|s|x|S|d|h|r|\*|\>|\s)+)?'
+                                '(?P<path_type>(i|e|c|l|a|r|I))? *'
+                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
 
         # 4444        100          0 i
-        p4 = re.compile(r'^(?P<metric>(\d+)) +(?P<locprf>(\d+))'
-                         ' +(?P<weight>(\d+)) +(?P<origin_codes>(i|e|\?|\|))$')
+        p4 = _patterns.compile(r'^(?P<metric>(\d+)) +(?P<locprf>(\d+))'
+                                ' +(?P<weight>(\d+)) +(?P<origin_codes>(i|e|\?|\|))$')
 
         #                     0.0.0.0               100     32768 i
         #                     10.106.101.1            4444    100 0 3 10 20 30 40 50 60 70 80 90 i
         # *>i                 10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-        p5 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                         '(?P<path_type>(i|e|c|l|a|r|I))?'
-                         ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                         '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))? +'
-                         '(?P<origin_codes>(i|e|\?|\|))$')
+        p5 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))? +'
+                                '(?P<origin_codes>(i|e|\?|\|))$')
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -5699,25 +5716,25 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
         # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
         # Condition placed to handle the situation of a long line that is
         # divided nto two lines while actually it is not another index.
-        p6 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|r|h|\*|\>|\s)+)'
-                         '(?P<path_type>(i|e|c|l|a|r|I))? *'
-                         '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                         '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                         '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                         '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                         '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                         '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                         '([a-zA-Z0-9\.\:]+)))'
-                         ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                         ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                         ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p6 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|r|h|\*|\>|\s)+)'
+                                '(?P<path_type>(i|e|c|l|a|r|I))? *'
+                                '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+                                '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+                                '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                '([a-zA-Z0-9\.\:]+)))'
+                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p7 = re.compile(r'^\s*Route +Distinguisher *: '
-                         '+(?P<route_distinguisher>(\S+))'
-                         '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                         '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p7 = _patterns.compile(r'^\s*Route +Distinguisher *: '
+                                '+(?P<route_distinguisher>(\S+))'
+                                '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                                '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -5855,25 +5872,25 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{4,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{4,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5951,25 +5968,25 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{4,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{4,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -6239,16 +6256,16 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
         cmd_vrfs = 'show vrf detail | inc \(VRF'
         out_vrf = self.device.execute(cmd_vrfs)
         vrf_dict = {'0':'default'}
-        p = re.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
-                        ' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
-                        ' +default +(?P<other_data>.+)$')
-        p1 = re.compile(r'^\s*Global +cluster-id: +(?P<cluster_id>[0-9\.]+)'
-                        ' +\(+configured: +(?P<configured>[0-9\.]+)+\)$')
-        p3 = re.compile(r'^\s*all +\(+inter-cluster +and +intra-cluster+\):'
-                        ' +(?P<all_configured>[a-zA-Z]+)$')
-        p4 = re.compile(r'^\s*intra-cluster:\s+(?P<intra_cluster_configured>[a-zA-Z]+)'
-                        ' +(?P<intra_cluster_used>[a-zA-Z]+)$')
-        p5 = re.compile(r'^\s*(?P<cluster_ids>[0-9\.]+)'
+        p = _patterns.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
+                               ' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
+                               ' +default +(?P<other_data>.+)$')
+        p1 = _patterns.compile(r'^\s*Global +cluster-id: +(?P<cluster_id>[0-9\.]+)'
+                               ' +\(+configured: +(?P<configured>[0-9\.]+)+\)$')
+        p3 = _patterns.compile(r'^\s*all +\(+inter-cluster +and +intra-cluster+\):'
+                               ' +(?P<all_configured>[a-zA-Z]+)$')
+        p4 = _patterns.compile(r'^\s*intra-cluster:\s+(?P<intra_cluster_configured>[a-zA-Z]+)'
+                               ' +(?P<intra_cluster_used>[a-zA-Z]+)$')
+        p5 = _patterns.compile(r'^\s*(?P<cluster_ids>[0-9\.]+)'
                     ' +(?P<num_neighbors>[0-9]+)'
                     ' +(?P<client_to_client_ref_configured>[a-zA-Z]+)'
                     ' +(?P<client_to_client_ref_used>[a-zA-Z]+)$')
@@ -6403,13 +6420,13 @@ class ShowBgpAllNeighborsPolicy(ShowBgpAllNeighborsPolicySchema):
 
         # Neighbor: 10.4.6.6, Address-Family: VPNv4 Unicast (VRF1)
         # Neighbor: 10.251.15.5, Address-Family: VPNv4 Unicast (LABDR_HoC_AZS_Transit)
-        p1 = re.compile(r'^\s*Neighbor: +(?P<neighbor>[\S]+),'
-                        r' +Address-Family: +(?P<address_family>[\w\s\-\_]+)'
-                        r'( +\((?P<vrf>[\S]+)\))?$')
+        p1 = _patterns.compile(r'^\s*Neighbor: +(?P<neighbor>[\S]+),'
+                               r' +Address-Family: +(?P<address_family>[\w\s\-\_]+)'
+                               r'( +\((?P<vrf>[\S]+)\))?$')
 
         # route-map test in
-        p2 = re.compile(r'^\s*route-map +(?P<route_map_name>\S+)'
-                            ' +(?P<route_map_direction>[a-zA-Z]+)$')
+        p2 = _patterns.compile(r'^\s*route-map +(?P<route_map_name>\S+)'
+                                   ' +(?P<route_map_direction>[a-zA-Z]+)$')
 
         # Init dictionary
         policy_dict = {}
@@ -6523,25 +6540,25 @@ class ShowIpBgpTemplatePeerSession(ShowIpBgpTemplatePeerSessionSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
-                        ' +index:(?P<index>[0-9]+)$')
-        p2 = re.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
-                        ' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
-        p3 = re.compile(r'^\s*Locally +configured +session +commands:$')
-        p4 = re.compile(r'^\s*remote-as +(?P<remote_as>[0-9]+)$')
-        p5 = re.compile(r'^\s*password +(?P<password_text>[\w\s]+)$')
-        p6 = re.compile(r'^\s*shutdown$')
-        p7 = re.compile(r'^\s*ebgp-multihop +(?P<ebgp_multihop_max_no>[0-9]+)$')
-        p8 = re.compile(r'^\s*update-source +(?P<update_source>[\d\w]+)$')
-        p9 = re.compile(r'^\s*transport +connection-mode +(?P<transport_connection_mode>[\s\w]+)$')
-        p10 = re.compile(r'^\s*description +(?P<desc>[\d\S\s\w]+)$')
-        p11 = re.compile(r'^\s*dont-capability-negotiate +four-octets-as$')
-        p12 = re.compile(r'^\s*timers +(?P<keepalive_interval>[\d]+)'
-                            ' +(?P<holdtime>[\d]+)$')
-        p13 = re.compile(r'^\s*local-as +(?P<local_as_as_no>[\d]+)$')
-        p14 = re.compile(r'^\s*disable-connected-check$')
-        p15 = re.compile(r'^\s*fall-over +bfd$')
-        p16 = re.compile(r'^\s*Inherited +session +commands:$')
+        p1 = _patterns.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
+                               ' +index:(?P<index>[0-9]+)$')
+        p2 = _patterns.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
+                               ' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
+        p3 = _patterns.compile(r'^\s*Locally +configured +session +commands:$')
+        p4 = _patterns.compile(r'^\s*remote-as +(?P<remote_as>[0-9]+)$')
+        p5 = _patterns.compile(r'^\s*password +(?P<password_text>[\w\s]+)$')
+        p6 = _patterns.compile(r'^\s*shutdown$')
+        p7 = _patterns.compile(r'^\s*ebgp-multihop +(?P<ebgp_multihop_max_no>[0-9]+)$')
+        p8 = _patterns.compile(r'^\s*update-source +(?P<update_source>[\d\w]+)$')
+        p9 = _patterns.compile(r'^\s*transport +connection-mode +(?P<transport_connection_mode>[\s\w]+)$')
+        p10 = _patterns.compile(r'^\s*description +(?P<desc>[\d\S\s\w]+)$')
+        p11 = _patterns.compile(r'^\s*dont-capability-negotiate +four-octets-as$')
+        p12 = _patterns.compile(r'^\s*timers +(?P<keepalive_interval>[\d]+)'
+                                   ' +(?P<holdtime>[\d]+)$')
+        p13 = _patterns.compile(r'^\s*local-as +(?P<local_as_as_no>[\d]+)$')
+        p14 = _patterns.compile(r'^\s*disable-connected-check$')
+        p15 = _patterns.compile(r'^\s*fall-over +bfd$')
+        p16 = _patterns.compile(r'^\s*Inherited +session +commands:$')
 
         # Init vars
         parsed_dict = {}
@@ -6813,45 +6830,45 @@ class ShowIpBgpTemplatePeerPolicy(ShowIpBgpTemplatePeerPolicySchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
-                        ' +index:(?P<index>[0-9]+).$')
+        p1 = _patterns.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
+                               ' +index:(?P<index>[0-9]+).$')
     
-        p2 = re.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
-                        ' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
+        p2 = _patterns.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
+                               ' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
     
-        p3 = re.compile(r'^\s*Local +disable +policies:+(?P<local_disable_policies>0x[0-9A-F]+),'
-                        ' +Inherited +disable +policies:+(?P<inherited_disable_polices>0x[0-9A-F]+)$')
+        p3 = _patterns.compile(r'^\s*Local +disable +policies:+(?P<local_disable_policies>0x[0-9A-F]+),'
+                               ' +Inherited +disable +policies:+(?P<inherited_disable_polices>0x[0-9A-F]+)$')
     
-        p4 = re.compile(r'^\s*Locally +configured +policies:$')
+        p4 = _patterns.compile(r'^\s*Locally +configured +policies:$')
     
-        p5 = re.compile(r'^\s*route-map +(?P<remote_map_in>[0-9a-zA-Z]+) +in$')
+        p5 = _patterns.compile(r'^\s*route-map +(?P<remote_map_in>[0-9a-zA-Z]+) +in$')
     
-        p6 = re.compile(r'^\s*route-map +(?P<route_map_out>[0-9a-zA-Z]+) +out$')
+        p6 = _patterns.compile(r'^\s*route-map +(?P<route_map_out>[0-9a-zA-Z]+) +out$')
     
-        p7 = re.compile(r'^\s*default-originate +route-map'
-                        ' +(?P<default_originate_route_map>[0-9a-zA-Z]+)$')
+        p7 = _patterns.compile(r'^\s*default-originate +route-map'
+                               ' +(?P<default_originate_route_map>[0-9a-zA-Z]+)$')
     
-        p8 = re.compile(r'^\s*soft-reconfiguration'
-                        ' +(?P<soft_reconfiguration>[a-zA-Z]+)$')
+        p8 = _patterns.compile(r'^\s*soft-reconfiguration'
+                               ' +(?P<soft_reconfiguration>[a-zA-Z]+)$')
     
-        p9 = re.compile(r'^\s*maximum-prefix'
-                        ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)'
-                        ' ?(?P<maximum_prefix_threshold>[0-9]+)?'
-                        ' +restart +(?P<maximum_prefix_restart>[0-9]+)$')
+        p9 = _patterns.compile(r'^\s*maximum-prefix'
+                               ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)'
+                               ' ?(?P<maximum_prefix_threshold>[0-9]+)?'
+                               ' +restart +(?P<maximum_prefix_restart>[0-9]+)$')
     
-        p10 = re.compile(r'^\s*as-override$')
+        p10 = _patterns.compile(r'^\s*as-override$')
     
-        p11 = re.compile(r'^\s*allowas-in +(?P<allowas_in_as_number>[0-9]+)$')
+        p11 = _patterns.compile(r'^\s*allowas-in +(?P<allowas_in_as_number>[0-9]+)$')
     
-        p12 = re.compile(r'^\s*route-reflector-client$')
+        p12 = _patterns.compile(r'^\s*route-reflector-client$')
     
-        p13 = re.compile(r'^\s*next-hop-self$')
+        p13 = _patterns.compile(r'^\s*next-hop-self$')
     
-        p14 = re.compile(r'^\s*send-community +(?P<send_community>[\w]+)$')
+        p14 = _patterns.compile(r'^\s*send-community +(?P<send_community>[\w]+)$')
     
-        p15 = re.compile(r'^\s*soo +(?P<soo>[\w\:\d]+)$')
+        p15 = _patterns.compile(r'^\s*soo +(?P<soo>[\w\:\d]+)$')
     
-        p16 = re.compile(r'^\s*Inherited policies:$')
+        p16 = _patterns.compile(r'^\s*Inherited policies:$')
 
         # Init vars
         parsed_dict = {}
@@ -7102,29 +7119,29 @@ class ShowIpBgpAllDampeningParameters(ShowIpBgpAllDampeningParametersSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*For +address +family:'
-                        ' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
+        p1 = _patterns.compile(r'^\s*For +address +family:'
+                               ' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
 
-        p2 = re.compile(r'^\s*dampening'
-                        ' +(?P<dampening_val>[\d\s\S]+)$')
+        p2 = _patterns.compile(r'^\s*dampening'
+                               ' +(?P<dampening_val>[\d\s\S]+)$')
 
-        p3 = re.compile(r'^\s*Half-life +time\s*:'
-                        ' +(?P<half_life_time>[\d]+)'
-                        ' mins +Decay +Time +: +(?P<decay_time>[\d]+) +secs$')
+        p3 = _patterns.compile(r'^\s*Half-life +time\s*:'
+                               ' +(?P<half_life_time>[\d]+)'
+                               ' mins +Decay +Time +: +(?P<decay_time>[\d]+) +secs$')
 
-        p4 = re.compile(r'^\s*Max +suppress +penalty:'
-                        '\s+(?P<max_suppress_penalty>[0-9]+)'
-                        '\s+Max +suppress +time:\s+(?P<max_suppress_time>[\d]+) +mins$')
+        p4 = _patterns.compile(r'^\s*Max +suppress +penalty:'
+                               '\s+(?P<max_suppress_penalty>[0-9]+)'
+                               '\s+Max +suppress +time:\s+(?P<max_suppress_time>[\d]+) +mins$')
 
-        p5 = re.compile(r'^\s*Suppress +penalty +:'
-                        ' +(?P<suppress_penalty>[\d]+)'
-                        ' +Reuse +penalty +: +(?P<reuse_penalty>[\d]+)$')
+        p5 = _patterns.compile(r'^\s*Suppress +penalty +:'
+                               ' +(?P<suppress_penalty>[\d]+)'
+                               ' +Reuse +penalty +: +(?P<reuse_penalty>[\d]+)$')
 
-        p6 = re.compile(r'^\s*% +dampening +not +enabled +for +base$')
+        p6 = _patterns.compile(r'^\s*% +dampening +not +enabled +for +base$')
 
-        p7 = re.compile(r'^\s*For +vrf: +(?P<vrf_name>[\w\d]+)$')
+        p7 = _patterns.compile(r'^\s*For +vrf: +(?P<vrf_name>[\w\d]+)$')
 
-        p8 = re.compile(r'^\s*% +dampening +not +enabled +for +vrf +(?P<vrf_name>[\d\w]+)$')
+        p8 = _patterns.compile(r'^\s*% +dampening +not +enabled +for +vrf +(?P<vrf_name>[\d\w]+)$')
             
         # Init vars
         parsed_dict = {}
@@ -20,6 +20,8 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.interning import string_pool
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -54,9 +56,12 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(ShowMacAddressTableSchema, CompactParser):
     """Parser for show mac address-table"""
 
+    # MAC addresses of each vlan
+    compact_tables = [('mac_table', 'vlans', None, 'mac_addresses')]
+
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
@@ -130,7 +135,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
                     drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    drop_dict.update({'entry_type': string_pool(group['entry_type'].lower())})
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
@@ -138,10 +143,10 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                     intf_dict = mac_dict.setdefault('interfaces', {}) \
                                         .setdefault(intf, {})
                     intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
+                    entry_type = string_pool(group['entry_type'].lower())
                     intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
-                        entry = group['entry'].strip()
+                        entry = string_pool(group['entry'].strip())
                         intf_dict.update({'entry': entry})
                 continue
 
@@ -193,7 +198,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
                     drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    drop_dict.update({'entry_type': string_pool(group['entry_type'].lower())})
                     continue
 
                 for intf in intfs.split(','):
@@ -201,13 +206,13 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                     intf_dict = mac_dict.setdefault('interfaces', {}) \
                                         .setdefault(intf, {})
                     intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
+                    entry_type = string_pool(group['entry_type'].lower())
                     intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
-                        entry = group['entry'].strip()
+                        entry = string_pool(group['entry'].strip())
                         intf_dict.update({'entry': entry})
                     if group['learn']:
-                        learn = group['learn']
+                        learn = string_pool(group['learn'])
                         intf_dict.update({'learn': learn})
                     if group['age']:
                         if group['age'].isdigit():
@@ -235,7 +240,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
                     drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    drop_dict.update({'entry_type': string_pool(group['entry_type'].lower())})
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
@@ -243,14 +248,15 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                     intf_dict = mac_dict.setdefault('interfaces', {}) \
                                         .setdefault(intf, {})
                     intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
+                    entry_type = string_pool(group['entry_type'].lower())
                     intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
-                        entry = group['entry'].strip()
+                        entry = string_pool(group['entry'].strip())
                         intf_dict.update({'entry': entry})
 
                     if group['protocols']:
-                        intf_dict.update({'protocols': group['protocols'].split(',')})
+                        intf_dict.update({'protocols': [string_pool(protocol) for protocol in
+                                                       group['protocols'].split(',')]})
                 continue
 
         return ret_dict
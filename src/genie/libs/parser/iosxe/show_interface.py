@@ -47,6 +47,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import LineDispatcher
+from genie.libs.parser.utils.counters import CounterLines, CounterParser, \
+                                             load_interval
 
 logger = logging.getLogger(__name__)
 
@@ -193,11 +196,351 @@ class ShowInterfacesSchema(MetaParser):
     }
 
 
-class ShowInterfaces(ShowInterfacesSchema):
+# Lines of show interfaces, routed on the text they start with
+_show_interfaces_lines = LineDispatcher()
+
+# GigabitEthernet1 is up, line protocol is up 
+# Port-channel12 is up, line protocol is up (connected)
+# Vlan1 is administratively down, line protocol is down , Autostate Enabled
+# Dialer1 is up (spoofing), line protocol is up (spoofing)
+_show_interfaces_lines.add('p1', r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+                                 r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+                                 r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$',
+                           contains='protocol')
+_show_interfaces_lines.add('p1', r'^(?P<interface>[\w\/\.\-]+) +is'
+                                 r' +(?P<enabled>[\w\s]+),'
+                                 r' +line +protocol +is +(?P<line_protocol>\w+)'
+                                 r'( *, *(?P<attribute>[\w\s]+))?$', contains='protocol')
+
+# Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
+# Hardware is Loopback
+_show_interfaces_lines.add('p2', r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+                                 r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+                                 r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$',
+                           anchor='Hardware is')
+
+# Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
+_show_interfaces_lines.add('p2', r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+                                 r'(?P<mac_address>.*)(?P<phys_address>.*)',
+                           anchor='Hardware is')
+
+# Description: desc
+# Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
+_show_interfaces_lines.add('p3', r'^Description: *(?P<description>.*)$',
+                           anchor='Description:')
+
+# Secondary address 10.2.2.2/24
+_show_interfaces_lines.add('p4', r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                                 r'\/(?P<prefix_length>[0-9]+))$',
+                           anchor='Secondary Address is')
+
+# Internet address is 10.4.4.4/24
+_show_interfaces_lines.add('p5', r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
+                                 r'\/(?P<prefix_length>[0-9]+))$', anchor='Internet')
+
+# MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
+# MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+# MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
+# MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec, 
+_show_interfaces_lines.add('p6', r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
+                                 r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
+                                 r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
+                                 r'DLY +(?P<delay>[0-9]+) +usec,$', anchor='MTU')
+
+# reliability 255/255, txload 1/255, rxload 1/255
+_show_interfaces_lines.add('p7', r'^reliability +(?P<reliability>[\d\/]+),'
+                                 r' +txload +(?P<txload>[\d\/]+), +rxload'
+                                 r' +(?P<rxload>[\d\/]+)$', anchor='reliability')
+
+# Encapsulation LOOPBACK, loopback not set
+# Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+# Encapsulation ARPA, medium is broadcast
+# Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
+# Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
+# Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
+# Encapsulation(s): AAL5
+_show_interfaces_lines.add('p8', r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
+                                 r'(, +(?P<rest>.*))?$', anchor='Encapsulation')
+
+# Keepalive set (10 sec)
+_show_interfaces_lines.add('p10', r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+                                  r' +sec\)$', anchor='Keepalive set')
+
+# Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
+# Full-duplex, 1000Mb/s, link type is auto, media type is
+# Full Duplex, 1000Mbps, link type is auto, media type is RJ45
+# Full Duplex, Auto Speed, link type is auto, media type is RJ45
+# Full Duplex, 10000Mbps, link type is force-up, media type is unknown media type
+# full-duplex, 1000 Mb/s
+# auto-duplex, auto-speed
+# auto-duplex, 10 Gb/s, media type is 10G
+# Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
+# Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
+_show_interfaces_lines.add('p11', r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+                                  r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+                                  r'(S|s)peed)(?:(?:\, +link +type +is '
+                                  r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
+                                  r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$',
+                           contains='uplex')
+
+# input flow-control is off, output flow-control is unsupported
+_show_interfaces_lines.add('p12', r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
+                                  '(output|input) +flow-control +is +(?P<send>\w+)$',
+                           anchor=('input', 'output'))
+
+# Carrier delay is 10 sec
+_show_interfaces_lines.add('p_cd', r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$',
+                           anchor='Carrier delay is')
+
+# Asymmetric Carrier-Delay Up Timer is 2 sec
+# Asymmetric Carrier-Delay Down Timer is 10 sec
+_show_interfaces_lines.add('p_cd_2', r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+                                     ' +Timer +is +(?P<carrier_delay>\d+).*$',
+                           anchor='Asymmetric Carrier-Delay')
+
+# ARP type: ARPA, ARP Timeout 04:00:00
+_show_interfaces_lines.add('p13', r'^ARP +type: +(?P<arp_type>\w+), +'
+                                  'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$',
+                           anchor='ARP type:')
+
+# Last input never, output 00:01:05, output hang never
+_show_interfaces_lines.add('p14', r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+                                  'output +(?P<last_output>[\w\.\:]+), '
+                                  'output +hang +(?P<output_hang>[\w\.\:]+)$',
+                           anchor='Last input')
+
+# Members in this channel: Gi1/0/2
+# Members in this channel: Fo1/0/2 Fo1/0/4
+_show_interfaces_lines.add('p15', r'^Members +in +this +channel: +'
+                                  '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$',
+                           anchor='Members in this channel:')
+
+# No. of active members in this channel: 12 
+_show_interfaces_lines.add('p15_1', r'^No\. +of +active +members +in +this +'
+                                    'channel: +(?P<active_members>\d+)$',
+                           anchor='No. of active members')
+
+# Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
+_show_interfaces_lines.add('p15_2', r'^Member +\d+ +: +(?P<interface>\S+) +,'
+                                    ' +\S+, +\S+$', anchor='Member')
+
+# No. of PF_JUMBO supported members in this channel : 0
+_show_interfaces_lines.add('p15_3', r'^No\. +of +PF_JUMBO +supported +members +'
+                                    'in +this +channel +: +(?P<number>\d+)$',
+                           anchor='No. of PF_JUMBO')
+
+# Last clearing of "show interface" counters 1d02h
+_show_interfaces_lines.add('p16', r'^Last +clearing +of +\"show +interface\" +counters +'
+                                  '(?P<last_clear>[\w\:\.]+)$', anchor='Last clearing of')
+
+# Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+_show_interfaces_lines.add('p17', r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+                                  '(?P<drops>\d+)\/(?P<flushes>\d+) +'
+                                  '\(size\/max\/drops\/flushes\); +'
+                                  'Total +output +drops: +(?P<output_drop>\d+)$',
+                           anchor='Input queue:')
+
+# Queueing strategy: fifo
+# Queueing strategy: Class-based queueing
+_show_interfaces_lines.add('p18', r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$',
+                           anchor='Queueing strategy:')
+
+# Output queue: 0/0 (size/max)
+# Output queue: 0/1000/64/0 (size/max total/threshold/drops)
+_show_interfaces_lines.add('p19', r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+                                  '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+                                  '+\(size\/max(?: +total\/threshold\/drops\))?.*$',
+                           anchor='Output queue:')
+
+# 5 minute input rate 0 bits/sec, 0 packets/sec
+_show_interfaces_lines.add('p20', r'^(?P<load_interval>[0-9\#]+)'
+                                  ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+                                  ' *(?P<in_rate>[0-9]+) *bits/sec,'
+                                  ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
+                           contains='input')
+
+# 5 minute output rate 0 bits/sec, 0 packets/sec
+_show_interfaces_lines.add('p21', r'^(?P<load_interval>[0-9\#]+)'
+                                  ' *(minute|second|minutes|seconds) *output *rate'
+                                  ' *(?P<out_rate>[0-9]+) *bits/sec,'
+                                  ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$',
+                           contains='output')
+
+# 0 packets input, 0 bytes, 0 no buffer
+# 13350 packets input, 2513375 bytes
+_show_interfaces_lines.add('p22', r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+                                  '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$',
+                           anchor='0 packets input')
+
+# Received 4173 broadcasts (0 IP multicasts)
+# Received 535996 broadcasts (535961 multicasts)
+_show_interfaces_lines.add('p23', r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+                                  '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$',
+                           anchor='Received')
+
+# 0 runts, 0 giants, 0 throttles
+_show_interfaces_lines.add('p24', r'^(?P<in_runts>[0-9]+) *runts,'
+                                  ' *(?P<in_giants>[0-9]+) *giants,'
+                                  ' *(?P<in_throttles>[0-9]+) *throttles$',
+                           anchor='0 runts')
+
+# 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+# 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+_show_interfaces_lines.add('p25', r'^(?P<in_errors>[0-9]+) +input +errors, +'
+                                  '(?P<in_crc_errors>[0-9]+) +CRC, +'
+                                  '(?P<in_frame>[0-9]+) +frame, +'
+                                  '(?P<in_overrun>[0-9]+) +overrun, +'
+                                  '(?P<in_ignored>[0-9]+) +ignored'
+                                  '(, *(?P<in_abort>[0-9]+) +abort)?$',
+                           anchor='0 input errors')
+
+# 0 watchdog, 535961 multicast, 0 pause input
+_show_interfaces_lines.add('p26', r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+                                  '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+                                  '(?P<in_pause_input>[0-9]+) +pause +input$',
+                           anchor='0 watchdog')
+
+# 0 input packets with dribble condition detected
+_show_interfaces_lines.add('p27', r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+                                  'dribble +condition +detected$',
+                           anchor='0 input packets with')
+
+# 23376 packets output, 3642296 bytes, 0 underruns
+# 13781 packets output, 2169851 bytes
+_show_interfaces_lines.add('p28', r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+                                  '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$',
+                           anchor='0 packets output')
+
+# Received 4173 broadcasts (0 IP multicasts)
+# Received 535996 broadcasts (535961 multicasts)
+_show_interfaces_lines.add('p29', r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+                                  '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$',
+                           anchor='Received')
+
+# 0 output errors, 0 collisions, 2 interface resets
+# 0 output errors, 0 interface resets
+_show_interfaces_lines.add('p30', r'^(?P<out_errors>[0-9]+) +output +errors,'
+                                  '( *(?P<out_collision>[0-9]+) +collisions,)? +'
+                                  '(?P<out_interface_resets>[0-9]+) +interface +resets$',
+                           anchor='0 output errors')
+
+# 0 unknown protocol drops
+_show_interfaces_lines.add('p31', r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+                                  'unknown +protocol +drops$',
+                           anchor='0 unknown protocol')
+
+# 0 babbles, 0 late collision, 0 deferred
+_show_interfaces_lines.add('p32', r'^(?P<out_babble>[0-9]+) +babbles, +'
+                                  '(?P<out_late_collision>[0-9]+) +late +collision, +'
+                                  '(?P<out_deferred>[0-9]+) +deferred$',
+                           anchor='0 babbles')
+
+# 0 lost carrier, 0 no carrier, 0 pause output
+# 0 lost carrier, 0 no carrier
+_show_interfaces_lines.add('p33', r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
+                                  r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
+                                  r'pause +output)?$', anchor='0 lost carrier')
+
+# 0 output buffer failures, 0 output buffers swapped out
+_show_interfaces_lines.add('p34', r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+                                  '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$',
+                           anchor='0 output buffer')
+
+# Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+# Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
+_show_interfaces_lines.add('p35', r'^Interface +is +unnumbered. +Using +address +of +'
+                                  '(?P<unnumbered_intf>[\w\/\.]+) +'
+                                  '\((?P<unnumbered_ip>[\w\.\:]+)\)$',
+                           anchor='Interface is unnumbered.')
+
+# 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
+_show_interfaces_lines.add('p36', r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
+                                  r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$',
+                           anchor='0 maximum active VCs')
+
+# VC Auto Creation Disabled.
+_show_interfaces_lines.add('p37', r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$',
+                           anchor='VC Auto Creation')
+
+# VC idle disconnect time: 300 seconds
+_show_interfaces_lines.add('p38', r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
+                                  r'seconds$', anchor='VC idle disconnect time:')
+
+# AAL5 CRC errors : 0
+_show_interfaces_lines.add('p39', r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$',
+                           contains='CRC')
+
+# AAL5 SAR Timeouts : 0
+_show_interfaces_lines.add('p40', r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$',
+                           contains='SAR')
+
+# AAL5 Oversized SDUs : 0
+_show_interfaces_lines.add('p41', r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$',
+                           contains='Oversized')
+
+# LCP Closed
+# LCP Closed, loopback not set
+_show_interfaces_lines.add('p42', r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$',
+                           anchor='LCP')
+
+# Base PPPoATM vaccess
+_show_interfaces_lines.add('p43', r'^Base PPPoATM +(?P<base_pppoatm>\S+)$',
+                           anchor='Base PPPoATM')
+
+# Vaccess status 0x44, loopback not set
+_show_interfaces_lines.add('p44', r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
+                                  r'loopback\s+(?P<loopback>[\S\s]+)$',
+                           anchor='Vaccess status')
+
+# DTR is pulsed for 5 seconds on reset
+_show_interfaces_lines.add('p45', r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
+                                  r'seconds +on +reset$', anchor='DTR is pulsed')
+
+
+# Counters of show interfaces, as stored by ShowInterfaces.cli()
+_show_interfaces_counters = CounterLines(
+    lines=_show_interfaces_lines, interface='p1',
+    counters={
+        'p20': {'load_interval': load_interval, 'in_rate': 'in_rate',
+                'in_rate_pkts': 'in_rate_pkts'},
+        'p21': {'out_rate': 'out_rate', 'out_rate_pkts': 'out_rate_pkts'},
+        'p22': {'in_pkts': 'in_pkts', 'in_octets': 'in_octets',
+                'in_no_buffer': 'in_no_buffer'},
+        # Broadcasts and multicasts the other way round, as cli() does
+        'p23': {'in_multicast_pkts': 'in_broadcast_pkts',
+                'in_broadcast_pkts': 'in_multicast_pkts'},
+        'p24': {'in_runts': 'in_runts', 'in_giants': 'in_giants',
+                'in_throttles': 'in_throttles'},
+        'p25': {'in_errors': 'in_errors', 'in_crc_errors': 'in_crc_errors',
+                'in_frame': 'in_frame', 'in_overrun': 'in_overrun',
+                'in_ignored': 'in_ignored', 'in_abort': 'in_abort'},
+        'p26': {'in_watchdog': 'in_watchdog',
+                'in_multicast_pkts': 'in_multicast_pkts',
+                'in_mac_pause_frames': 'in_pause_input'},
+        'p27': {'in_with_dribble': 'in_with_dribble'},
+        'p28': {'out_pkts': 'out_pkts', 'out_octets': 'out_octets',
+                'out_underruns': 'out_underruns'},
+        'p30': {'out_errors': 'out_errors',
+                'out_interface_resets': 'out_interface_resets',
+                'out_collision': 'out_collision'},
+        'p31': {'out_unknown_protocl_drops': 'out_unknown_protocl_drops'},
+        'p32': {'out_babble': 'out_babble',
+                'out_late_collision': 'out_late_collision',
+                'out_deferred': 'out_deferred'},
+        'p33': {'out_lost_carrier': 'out_lost_carrier',
+                'out_no_carrier': 'out_no_carrier',
+                'out_mac_pause_frames': 'out_pause_output'},
+        'p34': {'out_buffer_failure': 'out_buffer_failure',
+                'out_buffers_swapped': 'out_buffers_swapped'},
+    })
+
+
+class ShowInterfaces(ShowInterfacesSchema, CounterParser):
     """parser for show interfaces
                   show interfaces <interface>"""
 
     cli_command = ['show interfaces','show interfaces {interface}']
+    counter_lines = _show_interfaces_counters
     exclude = ['in_octets', 'in_pkts', 'out_octets', 'out_pkts', 
         'in_rate', 'in_rate_pkts', 'out_rate', 'out_rate_pkts', 
         'input_queue_size', 'in_broadcast_pkts', 'in_multicast_pkts',
@@ -218,269 +561,20 @@ class ShowInterfaces(ShowInterfacesSchema):
         else:
             out = output
 
-        # GigabitEthernet1 is up, line protocol is up 
-        # Port-channel12 is up, line protocol is up (connected)
-        # Vlan1 is administratively down, line protocol is down , Autostate Enabled
-        # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
-
-        # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-        # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
-
-        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
-                          r'(?P<mac_address>.*)(?P<phys_address>.*)')
-
-        # Description: desc
-        # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
-
-        # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
-
-        # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
-
-        # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-        # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
-        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec, 
-        p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
-                        r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
-                        r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
-                        r'DLY +(?P<delay>[0-9]+) +usec,$')
-
-        # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
-
-        # Encapsulation LOOPBACK, loopback not set
-        # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
-        # Encapsulation ARPA, medium is broadcast
-        # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
-        # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
-        # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-        # Encapsulation(s): AAL5
-        p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
-                r'(, +(?P<rest>.*))?$')
-            
-        # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                        r' +sec\)$')
-
-
-        # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
-        # Full-duplex, 1000Mb/s, link type is auto, media type is
-        # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
-        # Full Duplex, Auto Speed, link type is auto, media type is RJ45
-        # Full Duplex, 10000Mbps, link type is force-up, media type is unknown media type
-        # full-duplex, 1000 Mb/s
-        # auto-duplex, auto-speed
-        # auto-duplex, 10 Gb/s, media type is 10G
-        # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
-        # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$')
-
-        # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
-                          '(output|input) +flow-control +is +(?P<send>\w+)$')
-
-        # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                          'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
-
-        # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+), '
-                          'output +hang +(?P<output_hang>[\w\.\:]+)$')
-
-        # Members in this channel: Gi1/0/2
-        # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
-
-        # No. of active members in this channel: 12 
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                            'channel: +(?P<active_members>\d+)$')
-
-        # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                            ' +\S+, +\S+$')
-
-        # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                            'in +this +channel +: +(?P<number>\d+)$')
-
-        # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
-
-        # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                          '(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                          '\(size\/max\/drops\/flushes\); +'
-                          'Total +output +drops: +(?P<output_drop>\d+)$')
-
-        # Queueing strategy: fifo
-        # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
-
-        # Output queue: 0/0 (size/max)
-        # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                          '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                          '+\(size\/max(?: +total\/threshold\/drops\))?.*$')
-
-        # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                          ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-
-        # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(minute|second|minutes|seconds) *output *rate'
-                          ' *(?P<out_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
-
-        # 0 packets input, 0 bytes, 0 no buffer
-        # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                          '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
-
-        # Received 4173 broadcasts (0 IP multicasts)
-        # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-
-        # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                          ' *(?P<in_giants>[0-9]+) *giants,'
-                          ' *(?P<in_throttles>[0-9]+) *throttles$')
-
-        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
-        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                          '(?P<in_crc_errors>[0-9]+) +CRC, +'
-                          '(?P<in_frame>[0-9]+) +frame, +'
-                          '(?P<in_overrun>[0-9]+) +overrun, +'
-                          '(?P<in_ignored>[0-9]+) +ignored'
-                          '(, *(?P<in_abort>[0-9]+) +abort)?$')
-
-        # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                          '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                          '(?P<in_pause_input>[0-9]+) +pause +input$')
-
-        # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                          'dribble +condition +detected$')
-
-        # 23376 packets output, 3642296 bytes, 0 underruns
-        # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                          '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
-
-        # Received 4173 broadcasts (0 IP multicasts)
-        # Received 535996 broadcasts (535961 multicasts)
-        p29 = re.compile(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-
-        # 0 output errors, 0 collisions, 2 interface resets
-        # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                          '( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                          '(?P<out_interface_resets>[0-9]+) +interface +resets$')
-
-        # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                          'unknown +protocol +drops$')
-
-        # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                          '(?P<out_late_collision>[0-9]+) +late +collision, +'
-                          '(?P<out_deferred>[0-9]+) +deferred$')
-
-        # 0 lost carrier, 0 no carrier, 0 pause output
-        # 0 lost carrier, 0 no carrier
-        p33 = re.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
-                r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
-                r'pause +output)?$')
-
-        # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                          '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
-
-        # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
-        # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                          '(?P<unnumbered_intf>[\w\/\.]+) +'
-                          '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-        
-        # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-        p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
-                r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
-        
-        # VC Auto Creation Disabled.
-        p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
-
-        # VC idle disconnect time: 300 seconds
-        p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
-                r'seconds$')
-        
-        # AAL5 CRC errors : 0
-        p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
-        
-        # AAL5 SAR Timeouts : 0
-        p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
-        
-        # AAL5 Oversized SDUs : 0
-        p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
-
-        # LCP Closed
-        # LCP Closed, loopback not set
-        p42 = re.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
-
-        # Base PPPoATM vaccess
-        p43 = re.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
-
-        # Vaccess status 0x44, loopback not set
-        p44 = re.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
-                r'loopback\s+(?P<loopback>[\S\s]+)$')
-
-        # DTR is pulsed for 5 seconds on reset
-        p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
-                r'seconds +on +reset$')
-
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            rule, m = _show_interfaces_lines.match(line)
+            if not m:
+                continue
+
             # GigabitEthernet1 is up, line protocol is up 
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
             # Dialer1 is up (spoofing), line protocol is up (spoofing)
 
-            m = p1.match(line)
-            m1 = p1_1.match(line)
-            m = m if m else m1
-            if m:
+            if rule == 'p1':
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
                 line_protocol = m.groupdict()['line_protocol']
@@ -518,12 +612,8 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
             # Hardware is Loopback
-            m = p2.match(line)
-
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-            m1 = p2_2.match(line)
-            m = m if m else m1
-            if m:
+            if rule == 'p2':
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -535,16 +625,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
-            if m:
+            if rule == 'p3':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             # Secondary address 10.2.2.2/24
-            m = p4.match(line)
-            if m:
+            if rule == 'p4':
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
                 address_sec = m.groupdict()['ipv4']
@@ -563,8 +651,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
-            if m:
+            if rule == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
                 address = m.groupdict()['ipv4']
@@ -582,8 +669,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-            m = p6.match(line)
-            if m:
+            if rule == 'p6':
                 mtu = m.groupdict()['mtu']
                 sub_mtu = m.groupdict().get('sub_mtu', None)
                 bandwidth = m.groupdict()['bandwidth']
@@ -598,8 +684,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
+            if rule == 'p7':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -614,8 +699,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
-            if m:
+            if rule == 'p8':
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -665,8 +749,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Keepalive set (10 sec)
-            m = p10.match(line)
-            if m:
+            if rule == 'p10':
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
                     interface_dict[interface]['keepalive'] = int(keepalive)
@@ -682,8 +765,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # auto-duplex, 10 Gb/s, media type is 10G
             # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
             # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-            m = p11.match(line)
-            if m:
+            if rule == 'p11':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
                 link_type = m.groupdict()['link_type']
@@ -706,8 +788,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
-            if m:
+            if rule == 'p12':
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
                 if 'flow_control' not in interface_dict[interface]:
@@ -724,19 +805,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
-            if m:
+            if rule == 'p_cd':
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
                 sub_dict['carrier_delay'] = int(group['carrier_delay'])
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
-            if m:
+            if rule == 'p_cd_2':
                 group = m.groupdict()
                 tp = group['type'].lower()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -746,8 +822,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
-            if m:
+            if rule == 'p13':
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
                 interface_dict[interface]['arp_type'] = arp_type
@@ -755,8 +830,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
-            if m:
+            if rule == 'p14':
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
                 output_hang = m.groupdict()['output_hang']
@@ -767,8 +841,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
-            if m:
+            if rule == 'p15':
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
                 intfs = m.groupdict()['port_channel_member_intfs'].split(' ')
@@ -787,8 +860,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of active members in this channel: 12 
-            m = p15_1.match(line)
-            if m:
+            if rule == 'p15_1':
                 group = m.groupdict()
                 active_members = int(group['active_members'])
                 interface_dict[interface]['port_channel']\
@@ -798,8 +870,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
-            if m:
+            if rule == 'p15_2':
                 group = m.groupdict()
                 intf = group['interface']
                 if 'port_channel_member_intfs' not in interface_dict[interface]['port_channel']:
@@ -812,8 +883,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
-            if m:
+            if rule == 'p15_3':
                 group = m.groupdict()
                 number = int(group['number'])
                 interface_dict[interface]['port_channel']\
@@ -821,14 +891,12 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
-            if m:                
+            if rule == 'p16':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
-            if m:
+            if rule == 'p17':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
 
@@ -846,8 +914,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Queueing strategy: fifo
             # Queueing strategy: Class-based queueing
-            m = p18.match(line)
-            if m:
+            if rule == 'p18':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['queue_strategy'] = \
@@ -856,8 +923,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Output queue: 0/0 (size/max)
             # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
-            if m:
+            if rule == 'p19':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['output_queue_size'] = \
@@ -872,8 +938,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
-            if m:
+            if rule == 'p20':
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
                 in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
@@ -906,8 +971,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
-            if m:
+            if rule == 'p21':
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
 
@@ -918,8 +982,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
-            if m:
+            if rule == 'p22':
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
 
@@ -934,8 +997,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
-            if m:
+            if rule == 'p23':
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_broadcast_pkts'])
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = \
@@ -943,8 +1005,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
-            if m:
+            if rule == 'p24':
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_giants'] = \
@@ -955,8 +1016,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
-            if m:
+            if rule == 'p25':
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_crc_errors'] = \
@@ -973,8 +1033,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
-            if m:
+            if rule == 'p26':
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
@@ -984,15 +1043,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            m = p27.match(line)
-            if m:
+            if rule == 'p27':
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
-            if m:
+            if rule == 'p28':
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
                 interface_dict[interface]['counters']['out_octets'] = \
@@ -1004,8 +1061,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p29.match(line)
-            if m:
+            if rule == 'p29':
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
                 interface_dict[interface]['counters']['out_multicast_pkts'] = \
@@ -1014,8 +1070,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            m = p30.match(line)
-            if m:
+            if rule == 'p30':
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_interface_resets'] = \
@@ -1026,15 +1081,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            m = p31.match(line)
-            if m:
+            if rule == 'p31':
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
-            if m:
+            if rule == 'p32':
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
                 interface_dict[interface]['counters']['out_late_collision'] = \
@@ -1044,8 +1097,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
-            if m:
+            if rule == 'p33':
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = \
@@ -1057,8 +1109,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
-            if m:
+            if rule == 'p34':
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
                 interface_dict[interface]['counters']['out_buffers_swapped'] = \
@@ -1067,16 +1118,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
-            if m:
+            if rule == 'p35':
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
                 unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
                 continue
 
             # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-            m = p36.match(line)
-            if m:
+            if rule == 'p36':
                 group = m.groupdict()
                 maximum_active_vcs = group['maximum_active_vcs']
                 vcs_per_vp = group['vcs_per_vp']
@@ -1087,45 +1136,39 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # VC Auto Creation Disabled.
-            m = p37.match(line)
-            if m:
+            if rule == 'p37':
                 group = m.groupdict()
                 vc_auto_creation = group['vc_auto_creation']
                 interface_dict[interface].update({'vc_auto_creation': vc_auto_creation})
                 continue
 
             # VC idle disconnect time: 300 seconds
-            m = p38.match(line)
-            if m:
+            if rule == 'p38':
                 group = m.groupdict()
                 vc_idle_disconnect_time = group['vc_idle_disconnect_time']
                 interface_dict[interface].update({'vc_idle_disconnect_time': vc_idle_disconnect_time})
                 continue
 
             # AAL5 CRC errors : 0
-            m = p39.match(line)
-            if m:
+            if rule == 'p39':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
                 continue
             
             # AAL5 SAR Timeouts : 0
-            m = p40.match(line)
-            if m:
+            if rule == 'p40':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
                 continue
 
             # AAL5 Oversized SDUs : 0
-            m = p41.match(line)
-            if m:
+            if rule == 'p41':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
                 continue
 
             # LCP Closed
-            m = p42.match(line)
-            if m:
+            if rule == 'p42':
                 group = m.groupdict()
                 interface_dict[interface].update({'lcp_state': group['state']})
                 loopback = group.get('loopback', None)
@@ -1134,23 +1177,20 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Base PPPoATM vaccess
-            m = p43.match(line)
-            if m:
+            if rule == 'p43':
                 group = m.groupdict()
                 interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
                 continue
 
             # Vaccess status 0x44, loopback not set
-            m = p44.match(line)
-            if m:
+            if rule == 'p44':
                 group = m.groupdict()
                 interface_dict[interface].update({'vaccess_status': group['status']})
                 interface_dict[interface].update({'vaccess_loopback': group['loopback']})
                 continue
 
             # DTR is pulsed for 5 seconds on reset
-            m = p45.match(line)
-            if m:
+            if rule == 'p45':
                 group = m.groupdict()
                 interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
                 continue
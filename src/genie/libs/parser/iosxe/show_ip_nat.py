@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import (Schema,
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.compact import CompactParser
 
 
 class ShowIpNatTranslationsSchema(MetaParser):
@@ -61,7 +62,7 @@ class ShowIpNatTranslationsSchema(MetaParser):
     }
 
 
-class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
+class ShowIpNatTranslations(ShowIpNatTranslationsSchema, CompactParser):
     """
         * show ip nat translations
         * show ip nat translations verbose
@@ -74,6 +75,9 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                    'show ip nat translations vrf {vrf}',
                    'show ip nat translations vrf {vrf} verbose']
 
+    # Translations of each vrf
+    compact_tables = [('vrf', None, 'index')]
+
     def cli(self, vrf=None, option=None, output=None):
         if output is None:
             if option and vrf is None:
@@ -40,6 +40,11 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.execute import memoize_commands
+
+# Patterns of the parsers in this module, compiled once
+_patterns = PatternTable()
 
 # ===========================================================
 # Schema for:
@@ -99,20 +104,20 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
         ret_dict = {}
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<pid>(\S+))\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                ' +\(Process +ID +(?P<pid>(\S+))\)$')
 
         # OSPF Segment Routing Local Blocks in Area 8
-        p2 = re.compile(r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
-                         ' +(?P<area>(\d+))$')
+        p2 = _patterns.compile(r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
+                                ' +(?P<area>(\d+))$')
 
         # Router ID        SR Capable   SRLB Base   SRLB Range
         # --------------------------------------------------------
         # *10.4.1.1          Yes          15000       1000
         # 10.16.2.2          Yes          15000       1000
         # 10.169.197.252    No 
-        p3 = re.compile(r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
-                         '( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$')
+        p3 = _patterns.compile(r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
+                                '( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -349,215 +354,215 @@ class ShowIpOspf(ShowIpOspfSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
-                            ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
-                            ' +with +ID +(?P<router_id>(\S+))$')
+        p1 = _patterns.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
+                                   ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
+                                   ' +with +ID +(?P<router_id>(\S+))$')
 
-        p1_1 = re.compile(r'^Routing +Process +is +shutdown$')
+        p1_1 = _patterns.compile(r'^Routing +Process +is +shutdown$')
 
-        p2 = re.compile(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
-                            ' +(?P<value>(\S+))$')
+        p2 = _patterns.compile(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
+                                   ' +(?P<value>(\S+))$')
 
-        p3 = re.compile(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
-                            ' +elapsed: +(?P<elapsed>(\S+))$')
+        p3 = _patterns.compile(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
+                                   ' +elapsed: +(?P<elapsed>(\S+))$')
 
-        p4 = re.compile(r'^Supports +only +single +TOS(TOS0) routes$')
+        p4 = _patterns.compile(r'^Supports +only +single +TOS(TOS0) routes$')
 
-        p5 = re.compile(r'^Supports +opaque +LSA$')
+        p5 = _patterns.compile(r'^Supports +opaque +LSA$')
 
-        p6 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+        p6 = _patterns.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
 
-        p7 = re.compile(r'^Supports +area +transit +capability$')
+        p7 = _patterns.compile(r'^Supports +area +transit +capability$')
 
-        p8 = re.compile(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
+        p8 = _patterns.compile(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
 
-        p9 = re.compile(r'^Supports +Database +Exchange +Summary +List'
-                            ' +Optimization +\(RFC +5243\)$')
+        p9 = _patterns.compile(r'^Supports +Database +Exchange +Summary +List'
+                                   ' +Optimization +\(RFC +5243\)$')
 
-        p10 = re.compile(r'^Event-log +(?P<event_log>(enabled|disabled)),'
-                            '(?: +Maximum +number +of +events:'
-                            ' +(?P<max_events>(\d+)),'
-                            ' +Mode: +(?P<mode>(\S+)))?$')
+        p10 = _patterns.compile(r'^Event-log +(?P<event_log>(enabled|disabled)),'
+                                   '(?: +Maximum +number +of +events:'
+                                   ' +(?P<max_events>(\d+)),'
+                                   ' +Mode: +(?P<mode>(\S+)))?$')
 
-        p11 = re.compile(r'^It +is +an'
-                            '(?: +(?P<abr>(area border)))?'
-                            '(?: +and)?'
-                            '(?: +(?P<asbr>(autonomous system boundary)))?'
-                            ' +router$')
+        p11 = _patterns.compile(r'^It +is +an'
+                                   '(?: +(?P<abr>(area border)))?'
+                                   '(?: +and)?'
+                                   '(?: +(?P<asbr>(autonomous system boundary)))?'
+                                   ' +router$')
 
-        p12_1 = re.compile(r'^Redistributing +External +Routes +from,$')
+        p12_1 = _patterns.compile(r'^Redistributing +External +Routes +from,$')
 
-        p12_2 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                            ' +mapped +to +(?P<metric>(\d+)))?$')
+        p12_2 = _patterns.compile(r'^(?P<type>(connected|static))(?: +with +metric'
+                                   ' +mapped +to +(?P<metric>(\d+)))?$')
 
-        p12_2_1 = re.compile(r'^(?P<type>(connected|static|isis))'
-                                ', +includes +(?P<redist>(subnets)) +in +redistribution')
+        p12_2_1 = _patterns.compile(r'^(?P<type>(connected|static|isis))'
+                                       ', +includes +(?P<redist>(subnets)) +in +redistribution')
 
-        p12_3 = re.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
-                            '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
-                            '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
-                            '(?:, +(?P<nssa>(nssa areas only)))?$')
+        p12_3 = _patterns.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
+                                   '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
+                                   '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
+                                   '(?:, +(?P<nssa>(nssa areas only)))?$')
 
-        p12_4 = re.compile(r'^Maximum +number +of +redistributed +prefixes'
-                            ' +(?P<num_prefix>(\d+))'
-                            '(?: +\((?P<warn>(warning-only))\))?')
+        p12_4 = _patterns.compile(r'^Maximum +number +of +redistributed +prefixes'
+                                   ' +(?P<num_prefix>(\d+))'
+                                   '(?: +\((?P<warn>(warning-only))\))?')
 
-        p12_5 = re.compile(r'^Threshold +for +warning +message'
-                            ' +(?P<thld>(\d+))\%$')
+        p12_5 = _patterns.compile(r'^Threshold +for +warning +message'
+                                   ' +(?P<thld>(\d+))\%$')
 
-        p13 = re.compile(r'^Router +is +not +originating +router-LSAs'
-                            ' +with +maximum +metric$')
+        p13 = _patterns.compile(r'^Router +is +not +originating +router-LSAs'
+                                   ' +with +maximum +metric$')
 
-        p14_1 = re.compile(r'^Originating +router-LSAs +with +maximum'
-                            ' +metric$')
+        p14_1 = _patterns.compile(r'^Originating +router-LSAs +with +maximum'
+                                   ' +metric$')
 
-        p14_2 = re.compile(r'^Condition:'
-                            ' +(?P<condition>(always|on \S+))'
-                            '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
-                            ' +State: +(?P<state>(\S+))$')
+        p14_2 = _patterns.compile(r'^Condition:'
+                                   ' +(?P<condition>(always|on \S+))'
+                                   '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
+                                   ' +State: +(?P<state>(\S+))$')
 
-        p14_3 = re.compile(r'^Advertise +stub +links +with +maximum +metric'
-                            ' +in +router\-LSAs$')
+        p14_3 = _patterns.compile(r'^Advertise +stub +links +with +maximum +metric'
+                                   ' +in +router\-LSAs$')
 
-        p14_4 = re.compile(r'^Advertise +summary\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
+        p14_4 = _patterns.compile(r'^Advertise +summary\-LSAs +with +metric'
+                                   ' +(?P<metric>(\d+))$')
 
-        p14_5 = re.compile(r'^^Advertise +external\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
+        p14_5 = _patterns.compile(r'^^Advertise +external\-LSAs +with +metric'
+                                   ' +(?P<metric>(\d+))$')
 
-        p15 = re.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
-                            ' +msecs$')
+        p15 = _patterns.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
+                                   ' +msecs$')
 
-        p16 = re.compile(r'^Minimum +hold +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
+        p16 = _patterns.compile(r'^Minimum +hold +time +between +two +consecutive'
+                                   ' +SPFs +(?P<time>(\S+)) +msecs$')
 
-        p17 = re.compile(r'^Maximum +wait +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
+        p17 = _patterns.compile(r'^Maximum +wait +time +between +two +consecutive'
+                                   ' +SPFs +(?P<time>(\S+)) +msecs$')
 
-        p18 = re.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
-                            ' +msecs$')
+        p18 = _patterns.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
+                                   ' +msecs$')
 
-        p19 = re.compile(r'^Minimum +hold +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
+        p19 = _patterns.compile(r'^Minimum +hold +time +for +LSA +throttle'
+                                   ' +(?P<time>(\S+)) +msecs$')
 
-        p20 = re.compile(r'^Maximum +wait +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
+        p20 = _patterns.compile(r'^Maximum +wait +time +for +LSA +throttle'
+                                   ' +(?P<time>(\S+)) +msecs$')
 
-        p21 = re.compile(r'^Minimum +LSA +arrival'
-                            ' +(?P<arrival>(\S+)) +msecs$')
+        p21 = _patterns.compile(r'^Minimum +LSA +arrival'
+                                   ' +(?P<arrival>(\S+)) +msecs$')
 
-        p22 = re.compile(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
+        p22 = _patterns.compile(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
 
-        p23 = re.compile(r'LSA +group +pacing +timer'
-                            ' +(?P<pacing>(\d+)) +secs$')
+        p23 = _patterns.compile(r'LSA +group +pacing +timer'
+                                   ' +(?P<pacing>(\d+)) +secs$')
 
-        p24 = re.compile(r'Interface +flood +pacing +timer'
-                            ' +(?P<interface>(\d+)) +msecs$')
+        p24 = _patterns.compile(r'Interface +flood +pacing +timer'
+                                   ' +(?P<interface>(\d+)) +msecs$')
 
-        p25 = re.compile(r'Retransmission +pacing +timer'
-                            ' +(?P<retransmission>(\d+)) +msecs$')
+        p25 = _patterns.compile(r'Retransmission +pacing +timer'
+                                   ' +(?P<retransmission>(\d+)) +msecs$')
 
-        p26 = re.compile(r'EXCHANGE/LOADING +adjacency +limit: +initial'
-                            ' +(?P<initial>(\S+)), +process +maximum'
-                            ' +(?P<maximum>(\d+))$')
+        p26 = _patterns.compile(r'EXCHANGE/LOADING +adjacency +limit: +initial'
+                                   ' +(?P<initial>(\S+)), +process +maximum'
+                                   ' +(?P<maximum>(\d+))$')
 
-        p27 = re.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
+        p27 = _patterns.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
+                                   ' +Checksum +Sum +(?P<checksum>(\S+))$')
 
-        p28 = re.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
+        p28 = _patterns.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
+                                   ' +Checksum +Sum +(?P<checksum>(\S+))$')
 
-        p29 = re.compile(r'^Number +of +DCbitless +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
+        p29 = _patterns.compile(r'^Number +of +DCbitless +external +and +opaque'
+                                   ' +AS +LSA +(?P<num>(\d+))$')
 
-        p30 = re.compile(r'^Number +of +DoNotAge +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
+        p30 = _patterns.compile(r'^Number +of +DoNotAge +external +and +opaque'
+                                   ' +AS +LSA +(?P<num>(\d+))$')
 
-        p31 = re.compile(r'^Number +of +areas +in +this +router +is'
-                            ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
-                            ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
-                            ' +nssa$')
+        p31 = _patterns.compile(r'^Number +of +areas +in +this +router +is'
+                                   ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
+                                   ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
+                                   ' +nssa$')
 
-        p32 = re.compile(r'Number +of +areas +transit +capable +is'
-                            ' +(?P<num>(\d+))$')
+        p32 = _patterns.compile(r'Number +of +areas +transit +capable +is'
+                                   ' +(?P<num>(\d+))$')
 
-        p33 = re.compile(r'^Maximum +number +of +non +self-generated +LSA'
-                            ' +allowed +(?P<max_lsa>(\d+))$')
+        p33 = _patterns.compile(r'^Maximum +number +of +non +self-generated +LSA'
+                                   ' +allowed +(?P<max_lsa>(\d+))$')
 
-        p33_1 = re.compile(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
+        p33_1 = _patterns.compile(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
 
-        p33_2 = re.compile(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
+        p33_2 = _patterns.compile(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
 
-        p33_3 = re.compile(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
-                            ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
+        p33_3 = _patterns.compile(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
+                                   ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
 
-        p33_4 = re.compile(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
-                            ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
+        p33_4 = _patterns.compile(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
+                                   ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
 
-        p33_5 = re.compile(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
+        p33_5 = _patterns.compile(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
 
-        p34 = re.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
+        p34 = _patterns.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
 
-        p35 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
-                            ' +(?P<enable>(enabled|disabled))$')
+        p35 = _patterns.compile(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
+                                   ' +(?P<enable>(enabled|disabled))$')
 
-        p36 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
-                            ' +(?P<gr_helper>(enabled|disabled))$')
+        p36 = _patterns.compile(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
+                                   ' +(?P<gr_helper>(enabled|disabled))$')
 
-        p36_1 = re.compile(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
+        p36_1 = _patterns.compile(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
 
-        p37 = re.compile(r'^Reference +bandwidth +unit +is'
-                            ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
+        p37 = _patterns.compile(r'^Reference +bandwidth +unit +is'
+                                   ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
 
-        p38 = re.compile(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
+        p38 = _patterns.compile(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
 
-        p39_1 = re.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
-                            '(?:, +(?P<summary>(no +summary +LSA +in +this'
-                            ' +area)))?$')
+        p39_1 = _patterns.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
+                                   '(?:, +(?P<summary>(no +summary +LSA +in +this'
+                                   ' +area)))?$')
 
-        p39_2 = re.compile(r'^generates +stub +default +route +with +cost'
-                            ' +(?P<default_cost>(\d+))$')
+        p39_2 = _patterns.compile(r'^generates +stub +default +route +with +cost'
+                                   ' +(?P<default_cost>(\d+))$')
 
-        p40_1 = re.compile(r'^Area ranges are$')
+        p40_1 = _patterns.compile(r'^Area ranges are$')
 
-        p40_2 = re.compile(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
-                            '(?:\((?P<cost>(\d+)) +\- +configured\))?'
-                            ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
+        p40_2 = _patterns.compile(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
+                                   '(?:\((?P<cost>(\d+)) +\- +configured\))?'
+                                   ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
 
-        p41 = re.compile(r'^Number +of +interfaces +in +this +area +is'
-                            ' +(?P<num_intf>(\d+))(?:'
-                            ' *\((?P<loopback>(\d+)) +loopback\))?$')
+        p41 = _patterns.compile(r'^Number +of +interfaces +in +this +area +is'
+                                   ' +(?P<num_intf>(\d+))(?:'
+                                   ' *\((?P<loopback>(\d+)) +loopback\))?$')
 
-        p42 = re.compile(r'^Area +has +RRR +enabled$')
+        p42 = _patterns.compile(r'^Area +has +RRR +enabled$')
 
-        p43 = re.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
-                            ' +times$')
+        p43 = _patterns.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
+                                   ' +times$')
 
-        p44 = re.compile(r'^SPF +algorithm +last +executed'
-                            ' +(?P<last_exec>(\S+)) +ago$')
+        p44 = _patterns.compile(r'^SPF +algorithm +last +executed'
+                                   ' +(?P<last_exec>(\S+)) +ago$')
 
-        p45 = re.compile(r'^Area +has +no +authentication$')
+        p45 = _patterns.compile(r'^Area +has +no +authentication$')
 
-        p46 = re.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
+        p46 = _patterns.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
+                                   ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
 
-        p47 = re.compile(r'^Number +of opaque +link +LSA'
-                            ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
-                            ' +(?P<checksum_sum>(\S+))$')
+        p47 = _patterns.compile(r'^Number +of opaque +link +LSA'
+                                   ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
+                                   ' +(?P<checksum_sum>(\S+))$')
 
-        p48 = re.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
+        p48 = _patterns.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
 
-        p49 = re.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
+        p49 = _patterns.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
 
-        p50 = re.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
+        p50 = _patterns.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
 
-        p51 = re.compile(r'^Flood +list +length +(?P<len>(\d+))$')
+        p51 = _patterns.compile(r'^Flood +list +length +(?P<len>(\d+))$')
 
-        p52 = re.compile(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
+        p52 = _patterns.compile(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
 
-        p53_1 = re.compile(r'^BFD +is +enabled +in +strict +mode$')
+        p53_1 = _patterns.compile(r'^BFD +is +enabled +in +strict +mode$')
 
-        p53_2 = re.compile(r'^BFD +is +enabled$')
+        p53_2 = _patterns.compile(r'^BFD +is +enabled$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -798,10 +803,10 @@ class ShowIpOspf(ShowIpOspfSchema):
             # Condition: always, State: active
             # Condition: on start-up for 5 seconds, State: inactive
             # Condition: on startup for 300 seconds, State: inactive
-            p14_2 = re.compile(r'^Condition:'
-                               ' +(?P<condition>(always|on \S+))'
-                               '(?: +for +(?P<seconds>(\d+)) +seconds)?,?'
-                               ' +State: +(?P<state>(\S+))$')
+            p14_2 = _patterns.compile(r'^Condition:'
+                                      ' +(?P<condition>(always|on \S+))'
+                                      '(?: +for +(?P<seconds>(\d+)) +seconds)?,?'
+                                      ' +State: +(?P<state>(\S+))$')
             m = p14_2.match(line)
             if m:
                 condition = str(m.groupdict()['condition']).lower().replace("-", "")
@@ -1399,7 +1404,7 @@ class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
         # Init vars
         ret_dict = {}
         
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\d+) +'
+        p1 = _patterns.compile(r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\d+) +'
             '(?P<address>\S+) +(?P<cost>\d+) +(?P<state>\S+) +(?P<nbrs_full>\d+)'
             '\/(?P<nbrs_count>\d+)$$')
 
@@ -1764,6 +1769,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         'max_flood_scan_length', 'max_flood_scan_time_msec', 'state']
 
 
+    @memoize_commands
     def cli(self, interface=None, output=None):
         if output is None:
             if interface:
@@ -1784,140 +1790,140 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         bool_dict = {'up': True, 'down': False, 'unknown': False}
 
         
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            ' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            ' +is +(?P<line_protocol>(up|down))'
-                            '(?: +\(\S+\))?$')
+        p1 = _patterns.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
+                                   ' +(?P<enable>(unknown|up|down)), +line +protocol'
+                                   ' +is +(?P<line_protocol>(up|down))'
+                                   '(?: +\(\S+\))?$')
  
-        p2 = re.compile(r'^Internet +Address +(?P<address>(\S+)),'
-                            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            ' +(?P<attach>(.*)))?$')
+        p2 = _patterns.compile(r'^Internet +Address +(?P<address>(\S+)),'
+                                   '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+                                   ' +Area +(?P<area>(\S+))(?:, +Attached +via'
+                                   ' +(?P<attach>(.*)))?$')
  
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
+        p2_1 = _patterns.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
  
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)))?'
-                            ' +Router +ID +(?P<router_id>(\S+)),'
-                            ' +Network +Type +(?P<interface_type>(\S+)),'
-                            ' +Cost: +(?P<cost>(\d+))$')
+        p3 = _patterns.compile(r'^Process +ID +(?P<pid>(\S+)),'
+                                   '(?: +VRF +(?P<vrf>(\S+)))?'
+                                   ' +Router +ID +(?P<router_id>(\S+)),'
+                                   ' +Network +Type +(?P<interface_type>(\S+)),'
+                                   ' +Cost: +(?P<cost>(\d+))$')
 
-        p5 = re.compile(r'^Configured as demand circuit$')
+        p5 = _patterns.compile(r'^Configured as demand circuit$')
  
-        p6 = re.compile(r'^Run as demand circuit$')
+        p6 = _patterns.compile(r'^Run as demand circuit$')
  
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
+        p7 = _patterns.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
+                                   ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
  
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            ' +secondary +ip +addresses$')
+        p8 = _patterns.compile(r'^Enabled +by +interface +config, +including'
+                                   ' +secondary +ip +addresses$')
  
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            ' +State +(?P<state>(\S+))'
-                            '(?:, +Priority +(?P<priority>(\d+)))?'
-                            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
+        p9 = _patterns.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+                                   ' +State +(?P<state>(\S+))'
+                                   '(?:, +Priority +(?P<priority>(\d+)))?'
+                                   '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
  
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
+        p10 = _patterns.compile(r'^Designated +(R|r)outer +\(ID\)'
+                                   ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+                                   ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
  
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
+        p11 = _patterns.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+                                   ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+                                   ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
  
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            ' +Retransmit +(?P<retransmit>(\d+))$')
+        p12 = _patterns.compile(r'^Timer +intervals +configured,'
+                                   ' +Hello +(?P<hello>(\d+)),'
+                                   ' +Dead +(?P<dead>(\d+)),'
+                                   ' +Wait +(?P<wait>(\d+)),'
+                                   ' +Retransmit +(?P<retransmit>(\d+))$')
  
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
+        p12_1 = _patterns.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
  
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p12_2 = _patterns.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
  
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+        p13 = _patterns.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
  
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            ' +(?P<helper>(enabled|disabled))$')
+        p14 = _patterns.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+                                   ' +(?P<helper>(enabled|disabled))$')
  
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            ' +flood +queue +length +(?P<length>(\d+))$')
+        p15 = _patterns.compile(r'^Index +(?P<index>(\S+)),'
+                                   ' +flood +queue +length +(?P<length>(\d+))$')
  
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
+        p16 = _patterns.compile(r'^Next +(?P<next>(\S+))$')
  
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            ' +maximum +is +(?P<max>(\d+))$')
+        p17 = _patterns.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+                                   ' +maximum +is +(?P<max>(\d+))$')
  
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
+        p18 = _patterns.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+                                   ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
  
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            ' +Adjacent +neighbor +count +is'
-                            ' +(?P<adj_nbr_count>(\d+))$')
+        p19 = _patterns.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+                                   ' +Adjacent +neighbor +count +is'
+                                   ' +(?P<adj_nbr_count>(\d+))$')
  
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
+        p20_1 = _patterns.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                   ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
  
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((D|d)esignated +(R|r)outer\)$')
+        p20_2 = _patterns.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                   ' +\((D|d)esignated +(R|r)outer\)$')
  
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\(Hello suppressed\)$')
+        p20_3 = _patterns.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                   ' +\(Hello suppressed\)$')
  
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            ' +neighbor\(s\)$')
+        p21 = _patterns.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
+                                   ' +neighbor\(s\)$')
  
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            ' +Host$')
+        p22 = _patterns.compile(r'^Loopback +interface +is +treated +as +a +stub'
+                                   ' +Host$')
  
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            ' +FastReroute$')
+        p23 = _patterns.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
+                                   ' +FastReroute$')
  
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            ' +FastReroute +repair +paths$')
+        p24 = _patterns.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
+                                   ' +FastReroute +repair +paths$')
  
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
+        p25 = _patterns.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
  
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
+        p26 = _patterns.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
  
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p27 = _patterns.compile(r'^Strict +TTL +checking'
+                                   ' +(?P<strict_ttl>(enabled|disabled))'
+                                   '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
  
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
+        p28_1 = _patterns.compile(r'^Simple +password +authentication +enabled$')
  
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
+        p28_2 = _patterns.compile(r'^Cryptographic +authentication +enabled$')
  
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
+        p28_3 = _patterns.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
  
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            ' +neighbor(s) +using +the +old +key(s):$')
+        p28_4 = _patterns.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
+                                   ' +neighbor(s) +using +the +old +key(s):$')
  
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
+        p28_5 = _patterns.compile(r'^key +id +1 +algorithm +MD5$')
 
         # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
+        p29 = _patterns.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
 
         # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
+        p30 = _patterns.compile(r'^TEAPP:$')
 
         # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
+        p30_1 = _patterns.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
 
         # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
+        p30_2 = _patterns.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
 
         # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_3 = _patterns.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_4 = _patterns.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
+        p31 = _patterns.compile(r'^SR +Policy +Manager:$')
 
         # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        p31_1 = _patterns.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2178,9 +2184,9 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
             # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
             #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             ' +(?P<topo_name>(\S+))$')
+            p4 = _patterns.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                    ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                    ' +(?P<topo_name>(\S+))$')
             m = p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
@@ -2869,140 +2875,140 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
         bool_dict = {'up': True, 'down': False, 'unknown': False}
 
         
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            ' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            ' +is +(?P<line_protocol>(up|down))'
-                            '(?: +\(\S+\))?$')
+        p1 = _patterns.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
+                                   ' +(?P<enable>(unknown|up|down)), +line +protocol'
+                                   ' +is +(?P<line_protocol>(up|down))'
+                                   '(?: +\(\S+\))?$')
  
-        p2 = re.compile(r'^Internet +Address +(?P<address>(\S+)),'
-                            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            ' +(?P<attach>(.*)))?$')
+        p2 = _patterns.compile(r'^Internet +Address +(?P<address>(\S+)),'
+                                   '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+                                   ' +Area +(?P<area>(\S+))(?:, +Attached +via'
+                                   ' +(?P<attach>(.*)))?$')
  
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
+        p2_1 = _patterns.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
  
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)))?'
-                            ' +Router +ID +(?P<router_id>(\S+)),'
-                            ' +Network +Type +(?P<interface_type>(\S+)),'
-                            ' +Cost: +(?P<cost>(\d+))$')
+        p3 = _patterns.compile(r'^Process +ID +(?P<pid>(\S+)),'
+                                   '(?: +VRF +(?P<vrf>(\S+)))?'
+                                   ' +Router +ID +(?P<router_id>(\S+)),'
+                                   ' +Network +Type +(?P<interface_type>(\S+)),'
+                                   ' +Cost: +(?P<cost>(\d+))$')
 
-        p5 = re.compile(r'^Configured as demand circuit$')
+        p5 = _patterns.compile(r'^Configured as demand circuit$')
  
-        p6 = re.compile(r'^Run as demand circuit$')
+        p6 = _patterns.compile(r'^Run as demand circuit$')
  
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
+        p7 = _patterns.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
+                                   ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
  
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            ' +secondary +ip +addresses$')
+        p8 = _patterns.compile(r'^Enabled +by +interface +config, +including'
+                                   ' +secondary +ip +addresses$')
  
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            ' +State +(?P<state>(\S+))'
-                            '(?:, +Priority +(?P<priority>(\d+)))?'
-                            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
+        p9 = _patterns.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+                                   ' +State +(?P<state>(\S+))'
+                                   '(?:, +Priority +(?P<priority>(\d+)))?'
+                                   '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
  
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
+        p10 = _patterns.compile(r'^Designated +(R|r)outer +\(ID\)'
+                                   ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+                                   ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
  
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
+        p11 = _patterns.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+                                   ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+                                   ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
  
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            ' +Retransmit +(?P<retransmit>(\d+))$')
+        p12 = _patterns.compile(r'^Timer +intervals +configured,'
+                                   ' +Hello +(?P<hello>(\d+)),'
+                                   ' +Dead +(?P<dead>(\d+)),'
+                                   ' +Wait +(?P<wait>(\d+)),'
+                                   ' +Retransmit +(?P<retransmit>(\d+))$')
  
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
+        p12_1 = _patterns.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
  
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p12_2 = _patterns.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
  
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+        p13 = _patterns.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
  
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            ' +(?P<helper>(enabled|disabled))$')
+        p14 = _patterns.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+                                   ' +(?P<helper>(enabled|disabled))$')
  
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            ' +flood +queue +length +(?P<length>(\d+))$')
+        p15 = _patterns.compile(r'^Index +(?P<index>(\S+)),'
+                                   ' +flood +queue +length +(?P<length>(\d+))$')
  
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
+        p16 = _patterns.compile(r'^Next +(?P<next>(\S+))$')
  
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            ' +maximum +is +(?P<max>(\d+))$')
+        p17 = _patterns.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+                                   ' +maximum +is +(?P<max>(\d+))$')
  
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
+        p18 = _patterns.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+                                   ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
  
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            ' +Adjacent +neighbor +count +is'
-                            ' +(?P<adj_nbr_count>(\d+))$')
+        p19 = _patterns.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+                                   ' +Adjacent +neighbor +count +is'
+                                   ' +(?P<adj_nbr_count>(\d+))$')
  
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
+        p20_1 = _patterns.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                   ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
  
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((D|d)esignated +(R|r)outer\)$')
+        p20_2 = _patterns.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                   ' +\((D|d)esignated +(R|r)outer\)$')
  
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\(Hello suppressed\)$')
+        p20_3 = _patterns.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                   ' +\(Hello suppressed\)$')
  
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            ' +neighbor\(s\)$')
+        p21 = _patterns.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
+                                   ' +neighbor\(s\)$')
  
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            ' +Host$')
+        p22 = _patterns.compile(r'^Loopback +interface +is +treated +as +a +stub'
+                                   ' +Host$')
  
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            ' +FastReroute$')
+        p23 = _patterns.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
+                                   ' +FastReroute$')
  
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            ' +FastReroute +repair +paths$')
+        p24 = _patterns.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
+                                   ' +FastReroute +repair +paths$')
  
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
+        p25 = _patterns.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
  
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
+        p26 = _patterns.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
  
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p27 = _patterns.compile(r'^Strict +TTL +checking'
+                                   ' +(?P<strict_ttl>(enabled|disabled))'
+                                   '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
  
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
+        p28_1 = _patterns.compile(r'^Simple +password +authentication +enabled$')
  
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
+        p28_2 = _patterns.compile(r'^Cryptographic +authentication +enabled$')
  
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
+        p28_3 = _patterns.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
  
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            ' +neighbor(s) +using +the +old +key(s):$')
+        p28_4 = _patterns.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
+                                   ' +neighbor(s) +using +the +old +key(s):$')
  
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
+        p28_5 = _patterns.compile(r'^key +id +1 +algorithm +MD5$')
 
         # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
+        p29 = _patterns.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
 
         # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
+        p30 = _patterns.compile(r'^TEAPP:$')
 
         # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
+        p30_1 = _patterns.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
 
         # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
+        p30_2 = _patterns.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
 
         # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_3 = _patterns.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_4 = _patterns.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
+        p31 = _patterns.compile(r'^SR +Policy +Manager:$')
 
         # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        p31_1 = _patterns.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3151,9 +3157,9 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
 
             # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
             #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             ' +(?P<topo_name>(\S+))$')
+            p4 = _patterns.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                    ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                    ' +(?P<topo_name>(\S+))$')
             m = p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
@@ -3524,6 +3530,7 @@ class ShowIpOspfLinksParser(MetaParser):
         * 'show ip ospf sham-links'
     '''
 
+    @memoize_commands
     def cli(self, cmd, link_type,output=None):
 
         assert link_type in ['virtual_links', 'sham_links']
@@ -3541,56 +3548,56 @@ class ShowIpOspfLinksParser(MetaParser):
         crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
 
 
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            ' +(address|router) +(?P<address>(\S+)) +is'
-                            ' +(?P<link_state>(up|down))$')
+        p1 = _patterns.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+                                   ' +(address|router) +(?P<address>(\S+)) +is'
+                                   ' +(?P<link_state>(up|down))$')
 
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            ' +(?P<source_address>(\S+))$')
+        p2 = _patterns.compile(r'^Area +(?P<area>(\S+)),? +source +address'
+                                   ' +(?P<source_address>(\S+))$')
 
-        p3 = re.compile(r'^Run +as +demand +circuit$')
+        p3 = _patterns.compile(r'^Run +as +demand +circuit$')
 
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            '(?: State +(?P<state>(\S+)))?$')
+        p4 = _patterns.compile(r'^DoNotAge +LSA +not +allowed'
+                                   ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+                                   '(?: +Cost +of +using +(?P<cost>(\d+)))?'
+                                   '(?: State +(?P<state>(\S+)))?$')
 
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            '(?: +via +interface +(?P<intf>(\S+)))?$')
+        p5 = _patterns.compile(r'^Transit +area +(?P<area>(\S+)),'
+                                   '(?: +via +interface +(?P<intf>(\S+)))?$')
 
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            ' +(?P<topo_name>(\S+))$')
+        p6 = _patterns.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                   ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                   ' +(?P<topo_name>(\S+))$')
 
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            ' +sec, +State +(?P<state>(\S+)),?$')
+        p7 = _patterns.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+                                   ' +sec, +State +(?P<state>(\S+)),?$')
 
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
+        p8 = _patterns.compile(r'^Timer +intervals +configured,'
+                                   ' +Hello +(?P<hello>(\d+)),'
+                                   ' +Dead +(?P<dead>(\d+)),'
+                                   ' +Wait +(?P<wait>(\d+)),'
+                                   '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
 
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p9 = _patterns.compile(r'^Strict +TTL +checking'
+                                   ' +(?P<strict_ttl>(enabled|disabled))'
+                                   '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
 
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p10 = _patterns.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
 
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
+        p11 = _patterns.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
 
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            ' +length +(?P<length>(\d+)), +number +of'
-                            ' +retransmission +(?P<retrans>(\d+))$')
+        p12 = _patterns.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
+                                   ' +length +(?P<length>(\d+)), +number +of'
+                                   ' +retransmission +(?P<retrans>(\d+))$')
 
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p13 = _patterns.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
 
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p14 = _patterns.compile(r'^Last +retransmission +scan +length +is'
+                                   ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
 
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<time>(\d+)) +msec, +maximum +is'
-                            ' +(?P<max>(\d+)) +msec$')
+        p15 = _patterns.compile(r'^Last +retransmission +scan +time +is'
+                                   ' +(?P<time>(\d+)) +msec, +maximum +is'
+                                   ' +(?P<max>(\d+)) +msec$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4238,6 +4245,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         'uptime', 'last_retrans_scan_length', 'last_retrans_scan_time_msec']
 
 
+    @memoize_commands
     def cli(self, neighbor='', output=None):
 
         if output is None:
@@ -4253,45 +4261,45 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                            ' +address +(?P<address>(\S+))'
-                            '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
+        p1 = _patterns.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+                                   ' +address +(?P<address>(\S+))'
+                                   '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
         
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
+        p2 = _patterns.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
+                                   ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
         
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                            ' +State +is +(?P<state>(\S+)),'
-                            ' +(?P<num>(\d+)) +state +changes$')
+        p3 = _patterns.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+                                   ' +State +is +(?P<state>(\S+)),'
+                                   ' +(?P<num>(\d+)) +state +changes$')
         
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
+        p4 = _patterns.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
+                                   ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
         
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            ' +\(E-bit\)$')
+        p5 = _patterns.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
+                                   ' +\(E-bit\)$')
         
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            ' +\(E-bit, O-bit\)$')
+        p6 = _patterns.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
+                                   ' +\(E-bit, O-bit\)$')
         
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
+        p7 = _patterns.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
         
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
+        p8 = _patterns.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
         
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            ' +length +(?P<ql>(\d+)), +number +of'
-                            ' +retransmission +(?P<num_retrans>(\d+))$')
+        p9 = _patterns.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
+                                   ' +length +(?P<ql>(\d+)), +number +of'
+                                   ' +retransmission +(?P<num_retrans>(\d+))$')
         
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p10 = _patterns.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
         
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<num1>(\d+)), +maximum +is'
-                            ' +(?P<num2>(\d+))$')
+        p11 = _patterns.compile(r'^Last +retransmission +scan +length +is'
+                                   ' +(?P<num1>(\d+)), +maximum +is'
+                                   ' +(?P<num2>(\d+))$')
         
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            ' +(?P<num2>(\d+)) +msec$')
+        p12 = _patterns.compile(r'^Last +retransmission +scan +time +is'
+                                   ' +(?P<num1>(\d+)) +msec, +maximum +is'
+                                   ' +(?P<num2>(\d+)) +msec$')
         
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
+        p13 = _patterns.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -4688,45 +4696,45 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                            ' +address +(?P<address>(\S+))'
-                            '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
+        p1 = _patterns.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+                                   ' +address +(?P<address>(\S+))'
+                                   '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
         
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
+        p2 = _patterns.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
+                                   ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
         
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                            ' +State +is +(?P<state>(\S+)),'
-                            ' +(?P<num>(\d+)) +state +changes$')
+        p3 = _patterns.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+                                   ' +State +is +(?P<state>(\S+)),'
+                                   ' +(?P<num>(\d+)) +state +changes$')
         
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
+        p4 = _patterns.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
+                                   ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
         
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            ' +\(E-bit\)$')
+        p5 = _patterns.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
+                                   ' +\(E-bit\)$')
         
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            ' +\(E-bit, O-bit\)$')
+        p6 = _patterns.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
+                                   ' +\(E-bit, O-bit\)$')
         
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
+        p7 = _patterns.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
         
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
+        p8 = _patterns.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
         
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            ' +length +(?P<ql>(\d+)), +number +of'
-                            ' +retransmission +(?P<num_retrans>(\d+))$')
+        p9 = _patterns.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
+                                   ' +length +(?P<ql>(\d+)), +number +of'
+                                   ' +retransmission +(?P<num_retrans>(\d+))$')
         
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p10 = _patterns.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
         
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<num1>(\d+)), +maximum +is'
-                            ' +(?P<num2>(\d+))$')
+        p11 = _patterns.compile(r'^Last +retransmission +scan +length +is'
+                                   ' +(?P<num1>(\d+)), +maximum +is'
+                                   ' +(?P<num2>(\d+))$')
         
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            ' +(?P<num2>(\d+)) +msec$')
+        p12 = _patterns.compile(r'^Last +retransmission +scan +time +is'
+                                   ' +(?P<num1>(\d+)) +msec, +maximum +is'
+                                   ' +(?P<num2>(\d+)) +msec$')
         
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
+        p13 = _patterns.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
         
         
         for line in out.splitlines():
@@ -4967,23 +4975,23 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
 
         # OSPF Router with ID (172.16.1.214) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                ' +\(Process +ID +(?P<instance>(\d+))'
+                                '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # Router Link States (Area 0)
         # Net Link States (Area 0)
         # Summary Net Link States (Area 8)
         # Summary ASB Link States (Area 8)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z\s]+)) +Link +States +\(Area'
-                         ' +(?P<area>(\S+))\)$')
+        p2 = _patterns.compile(r'^(?P<lsa_type>([a-zA-Z\s]+)) +Link +States +\(Area'
+                                ' +(?P<area>(\S+))\)$')
 
         # Link ID         ADV Router      Age         Seq#       Checksum Link count
         # 10.13.202.64    10.120.202.64   2794        0x80000043 0x002254 3
         # 10.1.1.2        10.169.197.253  70          0x8000003F 0x0015EF
-        p3 = re.compile(r'^(?P<link_id>(\S+)) +(?P<adv_router>(\S+))'
-                         ' +(?P<age>(\d+)) +(?P<seq>(\S+)) +(?P<checksum>(\S+))'
-                         '(?: *(?P<link_count>(\d+)))?$')
+        p3 = _patterns.compile(r'^(?P<link_id>(\S+)) +(?P<adv_router>(\S+))'
+                                ' +(?P<age>(\d+)) +(?P<seq>(\S+)) +(?P<checksum>(\S+))'
+                                '(?: *(?P<link_count>(\d+)))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5118,210 +5126,210 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             'opaque': 10,
             }
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\d+))'
-                            '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                   ' +\(Process +ID +(?P<instance>(\d+))'
+                                   '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
        
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            '(?: +\(Area +(?P<area>(\S+))\))?$')
+        p2 = _patterns.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
+                                   '(?: +\(Area +(?P<area>(\S+))\))?$')
        
-        p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
+        p3_1 = _patterns.compile(r'^Routing +Bit +Set +on +this +LSA$')
        
-        p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
+        p3_2 = _patterns.compile(r'^LS +age: +(?P<age>(\d+))$')
        
-        p3_2_1 = re.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
+        p3_2_1 = _patterns.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
        
-        p4 = re.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
-                        '(?: *\((?P<option_desc>(.*))\))?$')
+        p4 = _patterns.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
+                               '(?: *\((?P<option_desc>(.*))\))?$')
        
-        p5_1 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
+        p5_1 = _patterns.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
        
-        p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            '(?: +\(.*\))?$')
+        p5_2 = _patterns.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+                                   '(?: +\(.*\))?$')
        
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+        p6 = _patterns.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
        
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
+        p7 = _patterns.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
        
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
+        p8 = _patterns.compile(r'^Checksum: +(?P<checksum>(\S+))$')
        
-        p9 = re.compile(r'^Length *: +(?P<length>(\d+))$')
+        p9 = _patterns.compile(r'^Length *: +(?P<length>(\d+))$')
        
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
+        p10 = _patterns.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
        
-        p11_1 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
+        p11_1 = _patterns.compile(r'^Metric +Type: +2 +\(.*\)$')
        
-        p11_2 = re.compile(r'^Metric +Type: +1 +\(.*\)$')
+        p11_2 = _patterns.compile(r'^Metric +Type: +1 +\(.*\)$')
        
-        p12 = re.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
-                            ' +(?P<metric>(\d+)))?$')
+        p12 = _patterns.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
+                                   ' +(?P<metric>(\d+)))?$')
        
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
+        p13 = _patterns.compile(r'^Metric: +(?P<metric>(\d+))$')
        
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
+        p14 = _patterns.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
        
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
+        p15 = _patterns.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
        
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
+        p16 = _patterns.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
        
-        p17 = re.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
+        p17 = _patterns.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
        
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
+        p18 = _patterns.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
        
-        p18_1 = re.compile(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
+        p18_1 = _patterns.compile(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
        
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
-                            ' +(?P<link_id>(\S+))$')
+        p19_1 = _patterns.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
+                                   ' +(?P<link_id>(\S+))$')
        
-        p19_2 = re.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
-                            ' +(a|A)ddress: +(?P<link_id>(\S+))$')
+        p19_2 = _patterns.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
+                                   ' +(a|A)ddress: +(?P<link_id>(\S+))$')
        
-        p19_3 = re.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
-                            ' +(I|d)D: +(?P<link_id>(\S+))$')
+        p19_3 = _patterns.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
+                                   ' +(I|d)D: +(?P<link_id>(\S+))$')
        
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            ' +(?P<link_data>(\S+))$')
+        p20_1 = _patterns.compile(r'^\(Link +Data\) +Network +Mask:'
+                                   ' +(?P<link_data>(\S+))$')
        
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            ' +(?P<link_data>(\S+))$')
+        p20_2 = _patterns.compile(r'^\(Link +Data\) +Router +Interface +address:'
+                                   ' +(?P<link_data>(\S+))$')
        
         # MTID 32 Metrics: 1
         # MTID   : 0
-        p21 = re.compile(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
+        p21 = _patterns.compile(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
        
-        p21_1 = re.compile(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
+        p21_1 = _patterns.compile(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
        
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
+        p22 = _patterns.compile(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
        
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
+        p23 = _patterns.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
        
-        p24 = re.compile(r'^Fragment +number *: +(?P<num>(\d+))$')
+        p24 = _patterns.compile(r'^Fragment +number *: +(?P<num>(\d+))$')
        
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
+        p25 = _patterns.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
        
-        p26_1 = re.compile(r'^AS +Boundary +Router$')
+        p26_1 = _patterns.compile(r'^AS +Boundary +Router$')
        
-        p26_2 = re.compile(r'^Area +Border +Router$')
+        p26_2 = _patterns.compile(r'^Area +Border +Router$')
        
-        p27 = re.compile(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
+        p27 = _patterns.compile(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
        
-        p28 = re.compile(r'^Link +ID *: +(?P<id>(\S+))$')
+        p28 = _patterns.compile(r'^Link +ID *: +(?P<id>(\S+))$')
        
-        p29 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p29 = _patterns.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
        
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
+        p30 = _patterns.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
        
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            ' +(?P<max_band>(\d+))$')
+        p31 = _patterns.compile(r'^Maximum +(B|b)andwidth *:'
+                                   ' +(?P<max_band>(\d+))$')
        
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
-                            '(?: +global)? *: +(?P<max_res_band>(\d+))$')
+        p32 = _patterns.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
+                                   '(?: +global)? *: +(?P<max_res_band>(\d+))$')
        
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+        p33 = _patterns.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
        
-        p33_1 = re.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
+        p33_1 = _patterns.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
        
-        p33_2 = re.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
+        p33_2 = _patterns.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
        
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
+        p34 = _patterns.compile(r'^Priority +(?P<num1>(\d+)) *:'
+                                   ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                                   ' *: +(?P<band2>(\d+)))?$')
        
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            ' +Length += +(?P<length>(\d+))'
-                            ' +Value += +(?P<value>(.*))$')
+        p35 = _patterns.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+                                   ' +Length += +(?P<length>(\d+))'
+                                   ' +Value += +(?P<value>(.*))$')
        
-        p36 = re.compile(r'^Extended +Administrative +Group *: +Length *:'
-                            ' +(?P<eag_length>(\d+))$')
+        p36 = _patterns.compile(r'^Extended +Administrative +Group *: +Length *:'
+                                   ' +(?P<eag_length>(\d+))$')
        
-        p37 = re.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
+        p37 = _patterns.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
 
         # Neighbor Address : 192.168.220.2
-        p38 = re.compile(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
+        p38 = _patterns.compile(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
 
         # TLV Type: Router Information
         # TLV Type: Segment Routing Algorithm
-        p39 = re.compile(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
+        p39 = _patterns.compile(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
 
         # Router Information
-        p39_1 = re.compile(r'(R|r)outer\s+(I|i)nformation')
+        p39_1 = _patterns.compile(r'(R|r)outer\s+(I|i)nformation')
 
         # Segment Routing Algorithm
-        p39_2 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
+        p39_2 = _patterns.compile(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
 
         # Segment Routing Range
-        p39_3 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
+        p39_3 = _patterns.compile(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
 
         # Segment Routing Node MSD
-        p39_4 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
+        p39_4 = _patterns.compile(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
 
         # Segment Routing Local Block
-        p39_5 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
+        p39_5 = _patterns.compile(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
 
         # Extended Prefix
-        p39_6 = re.compile(r'(E|e)xtended\s+(P|p)refix')
+        p39_6 = _patterns.compile(r'(E|e)xtended\s+(P|p)refix')
 
         # Extended Link
-        p39_7 = re.compile(r'(E|e)xtended\s+(L|l)ink')
+        p39_7 = _patterns.compile(r'(E|e)xtended\s+(L|l)ink')
 
         # Algorithm: SPF
         # Algorithm: Strict SPF
-        p40 = re.compile(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
+        p40 = _patterns.compile(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
 
         # Range Size: 1000
-        p41 = re.compile(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
+        p41 = _patterns.compile(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
 
         # Flags  : L-Bit, V-bit
-        p42 = re.compile(r'Flags\s*\:\s*(?P<flags>.+)')        
+        p42 = _patterns.compile(r'Flags\s*\:\s*(?P<flags>.+)')        
 
         # Weight : 0
-        p44 = re.compile(r'Weight\s*:\s*(?P<weight>\d+)')
+        p44 = _patterns.compile(r'Weight\s*:\s*(?P<weight>\d+)')
 
         # Label  : 19
-        p45 = re.compile(r'Label\s*:\s*(?P<label>\d+)')       
+        p45 = _patterns.compile(r'Label\s*:\s*(?P<label>\d+)')       
         
         # (Link Data) Interface IP address: 192.168.220.1
-        p46 = re.compile(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
+        p46 = _patterns.compile(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
 
         # Prefix    : 10.4.1.1/32
-        p47 = re.compile(r'Prefix\s*:\s*(?P<prefix>\S+)')
+        p47 = _patterns.compile(r'Prefix\s*:\s*(?P<prefix>\S+)')
 
         # AF        : 0
-        p48 = re.compile(r'AF\s*:\s*(?P<af>\S+)')
+        p48 = _patterns.compile(r'AF\s*:\s*(?P<af>\S+)')
 
         # Route-type: Intra
-        p49 = re.compile(r'Route\-type\s*:\s*(?P<route_type>.+)')
+        p49 = _patterns.compile(r'Route\-type\s*:\s*(?P<route_type>.+)')
 
         # Sub-TLV Type: Remote Intf Addr
         # Sub-TLV Type: Local / Remote Intf ID
-        p50 = re.compile(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
+        p50 = _patterns.compile(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
 
         # Remote Interface Address   : 192.168.0.1
-        p51 = re.compile(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
+        p51 = _patterns.compile(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
 
         # Local Interface ID   : 20
-        p52 = re.compile(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
+        p52 = _patterns.compile(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
 
         # Remote Interface ID   : 20
-        p53 = re.compile(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
+        p53 = _patterns.compile(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
 
         # SID   : 1
-        p54 = re.compile(r'SID\s*:\s*(?P<sid>\S+)')
+        p54 = _patterns.compile(r'SID\s*:\s*(?P<sid>\S+)')
 
         # Graceful Restart Helper                
-        p55 = re.compile(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
+        p55 = _patterns.compile(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
 
         # Stub Router Support
-        p56 = re.compile(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
+        p56 = _patterns.compile(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
 
         # SPF
-        p57 = re.compile(r'SPF')
+        p57 = _patterns.compile(r'SPF')
 
         # Strict SPF
-        p58 = re.compile(r'Strict\s+SPF')
+        p58 = _patterns.compile(r'Strict\s+SPF')
 
         # Sub-type: Node Max Sid Depth, Value: 13
-        p59 = re.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
+        p59 = _patterns.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5795,7 +5803,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
                 
             # Number of TOS metrics: 0
-            p21_2 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
+            p21_2 = _patterns.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
             m = p21_2.match(line)
             if m:
                 db_dict['links'][link_id]['num_tos_metrics'] = \
@@ -6964,21 +6972,21 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
-                            'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
-                            'VirtualPortGroup.*|Vlan.*))$')
+        p1 = _patterns.compile(r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
+                                   'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
+                                   'VirtualPortGroup.*|Vlan.*))$')
 
-        p2 = re.compile(r'^Process +ID +(?P<instance>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)),)?'
-                            ' +Area +(?P<area>(\S+))$')
+        p2 = _patterns.compile(r'^Process +ID +(?P<instance>(\S+)),'
+                                   '(?: +VRF +(?P<vrf>(\S+)),)?'
+                                   ' +Area +(?P<area>(\S+))$')
 
-        p3 = re.compile(r'^LDP +is'
-                            ' +(?P<auto_config>(not configured|configured))'
-                            ' +through +LDP +autoconfig$')
+        p3 = _patterns.compile(r'^LDP +is'
+                                   ' +(?P<auto_config>(not configured|configured))'
+                                   ' +through +LDP +autoconfig$')
 
-        p5 = re.compile(r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$')
+        p5 = _patterns.compile(r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$')
         # Interface is down and pending LDP
-        p6 = re.compile(r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$')
+        p6 = _patterns.compile(r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$')
 
 
         for line in out.splitlines():
@@ -7101,8 +7109,8 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
             
             # LDP-IGP Synchronization : Not required
             # LDP-IGP Synchronization : Required
-            p4 = re.compile(r'^LDP-IGP +Synchronization *:'
-                              ' +(?P<igp_sync>(Not required|Required))$')
+            p4 = _patterns.compile(r'^LDP-IGP +Synchronization *:'
+                                     ' +(?P<igp_sync>(Not required|Required))$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['igp_sync'] == 'Required':
@@ -7209,6 +7217,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
 
     cli_command = 'show ip ospf mpls traffic-eng link'
 
+    @memoize_commands
     def cli(self, output=None):
 
         if output is None:
@@ -7221,42 +7230,42 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                   ' +\(Process +ID +(?P<instance>(\S+))\)$')
 
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            ' +MPLS +TE +links. +Area +instance +is'
-                            ' +(?P<area_instance>(\d+))\.$')
+        p2 = _patterns.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+                                   ' +MPLS +TE +links. +Area +instance +is'
+                                   ' +(?P<area_instance>(\d+))\.$')
 
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
+        p3 = _patterns.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
 
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
+        p4 = _patterns.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
 
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            ' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            ' +(?P<link_instance>(\d+))$')
+        p5 = _patterns.compile(r'^Link +is +associated +with +fragment'
+                                   ' +(?P<fragment>(\d+))\. +Link +instance +is'
+                                   ' +(?P<link_instance>(\d+))$')
 
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
+        p6 = _patterns.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
 
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
+        p7 = _patterns.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
 
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p8 = _patterns.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
 
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            ' +(?P<igp>(\d+))$')
+        p9 = _patterns.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+                                   ' +(?P<igp>(\d+))$')
 
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
+        p14 = _patterns.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
 
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            ' +(?P<res_band>(\d+))$')
+        p10 = _patterns.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+                                   ' +(?P<res_band>(\d+))$')
 
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+        p11 = _patterns.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
 
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
+        p12 = _patterns.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
 
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
+        p13 = _patterns.compile(r'^Priority +(?P<num1>(\d+)) *:'
+                                   ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                                   ' *: +(?P<band2>(\d+)))?$')
 
 
         for line in out.splitlines():
@@ -7574,42 +7583,42 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                   ' +\(Process +ID +(?P<instance>(\S+))\)$')
 
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            ' +MPLS +TE +links. +Area +instance +is'
-                            ' +(?P<area_instance>(\d+))\.$')
+        p2 = _patterns.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+                                   ' +MPLS +TE +links. +Area +instance +is'
+                                   ' +(?P<area_instance>(\d+))\.$')
 
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
+        p3 = _patterns.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
 
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
+        p4 = _patterns.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
 
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            ' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            ' +(?P<link_instance>(\d+))$')
+        p5 = _patterns.compile(r'^Link +is +associated +with +fragment'
+                                   ' +(?P<fragment>(\d+))\. +Link +instance +is'
+                                   ' +(?P<link_instance>(\d+))$')
 
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
+        p6 = _patterns.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
 
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
+        p7 = _patterns.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
 
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p8 = _patterns.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
 
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            ' +(?P<igp>(\d+))$')
+        p9 = _patterns.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+                                   ' +(?P<igp>(\d+))$')
 
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
+        p14 = _patterns.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
 
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            ' +(?P<res_band>(\d+))$')
+        p10 = _patterns.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+                                   ' +(?P<res_band>(\d+))$')
 
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+        p11 = _patterns.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
 
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
+        p12 = _patterns.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
 
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
+        p13 = _patterns.compile(r'^Priority +(?P<num1>(\d+)) *:'
+                                   ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                                   ' *: +(?P<band2>(\d+)))?$')
 
 
         for line in out.splitlines():
@@ -7830,39 +7839,39 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
 
         # OSPF Router with ID (172.16.1.214) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                ' +\(Process +ID +(?P<instance>(\d+))'
+                                '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # Base Topology (MTID 0)
-        p2 = re.compile(r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$')
+        p2 = _patterns.compile(r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$')
 
         # Start time: 00:01:58.314, Time elapsed: 00:54:43.858
-        p3 = re.compile(r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
-                         ' +(?P<time_elapsed>(\S+))$')
+        p3 = _patterns.compile(r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
+                                ' +(?P<time_elapsed>(\S+))$')
 
         # Originating router-LSAs with maximum metric
         # Originating router-LSAs with maximum metric, Time remaining: 00:03:55
-        p4_1 = re.compile(r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$')
+        p4_1 = _patterns.compile(r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$')
 
         # Router is not originating router-LSAs with maximum metric
-        p4_2 = re.compile(r'^Router +is +not +originating +router-LSAs +with'
-                           ' +maximum +metric$')
+        p4_2 = _patterns.compile(r'^Router +is +not +originating +router-LSAs +with'
+                                  ' +maximum +metric$')
 
         # Condition: on startup for 5 seconds, State: inactive
-        p5 = re.compile(r'^Condition: +(?P<condition>(.*)), +State:'
-                          ' +(?P<state>([a-zA-Z\s]+))$')
+        p5 = _patterns.compile(r'^Condition: +(?P<condition>(.*)), +State:'
+                                 ' +(?P<state>([a-zA-Z\s]+))$')
 
         # Advertise summary-LSAs with metric 16711680
-        p6 = re.compile(r'^Advertise +summary-LSAs +with +metric'
-                         ' +(?P<metric>(\d+))$')
+        p6 = _patterns.compile(r'^Advertise +summary-LSAs +with +metric'
+                                ' +(?P<metric>(\d+))$')
 
         # Unset reason: timer expired, Originated for 5 seconds
-        p7 = re.compile(r'^Unset +reason: (?P<reason>(.*))$')
+        p7 = _patterns.compile(r'^Unset +reason: (?P<reason>(.*))$')
 
         # Unset time: 00:02:03.314, Time elapsed: 00:54:38.858
-        p8 = re.compile(r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
-                         ' +(?P<elapsed>(\S+))$')
+        p8 = _patterns.compile(r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
+                                ' +(?P<elapsed>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8203,46 +8212,46 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         max_size_stats = False ; current_size_stats = False
 
         # OSPF statistics:
-        p1 = re.compile(r'^OSPF +statistics:$')
+        p1 = _patterns.compile(r'^OSPF +statistics:$')
 
         # Last clearing of OSPF traffic counters never
         # Last clearing of interface traffic counters never
-        p2 = re.compile(r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
-                         ' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$')
+        p2 = _patterns.compile(r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
+                                ' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$')
 
         # Rcvd: 2112690 total, 0 checksum errors
-        p3 = re.compile(r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
-                         ' +checksum +errors$')
+        p3 = _patterns.compile(r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
+                                ' +checksum +errors$')
 
         # 2024732 hello, 938 database desc, 323 link state req
         # 2381794 hello, 1176 database desc, 43 link state req
-        p4 = re.compile(r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
-                         ' +database +desc, +(?P<link_state_req>(\d+))'
-                         ' +link +state +req$')
+        p4 = _patterns.compile(r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
+                                ' +database +desc, +(?P<link_state_req>(\d+))'
+                                ' +link +state +req$')
 
         # 11030 link state updates, 75666 link state acks
         # 92224 link state updates, 8893 link state acks
-        p5 = re.compile(r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
-                         ' +(?P<link_state_acks>(\d+)) +link +state +acks$')
+        p5 = _patterns.compile(r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
+                                ' +(?P<link_state_acks>(\d+)) +link +state +acks$')
 
         # Sent: 2509472 total
-        p6 = re.compile(r'^Sent: +(?P<total>(\d+)) +total$')
+        p6 = _patterns.compile(r'^Sent: +(?P<total>(\d+)) +total$')
 
 
         # OSPF Router with ID (10.169.197.252) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p7 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p7 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                ' +\(Process +ID +(?P<instance>(\d+))'
+                                '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # OSPF queue statistics for process ID 65109:
-        p8 = re.compile(r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$')
+        p8 = _patterns.compile(r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$')
 
         #                   InputQ   UpdateQ      OutputQ
         # Limit             0        200          0
         # Drops             0          0          0
         # Max delay [msec] 49          2          2
-        p9_1 = re.compile(r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
+        p9_1 = _patterns.compile(r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
                         '(?P<inputq>(\d+)) +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
         
         # Invalid           0          0          0
@@ -8251,21 +8260,21 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         # LS req            0          0          0
         # LS upd            0          0          0
         # LS ack           14         14          6
-        p9_2 = re.compile(r'^(?P<item>(Invalid|Hello|DB des|LS '
+        p9_2 = _patterns.compile(r'^(?P<item>(Invalid|Hello|DB des|LS '
                         'req|LS upd|LS ack)) +(?P<inputq>(\d+)) '
                         '+(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
 
         #                   InputQ   UpdateQ      OutputQ
         # Max size         14         14          6
         # Current size      0          0          0
-        p9_3 = re.compile(r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
-                           ' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_3 = _patterns.compile(r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
+                                  ' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
 
         # Interface statistics:
-        p10 = re.compile(r'^Interface +statistics:$')
+        p10 = _patterns.compile(r'^Interface +statistics:$')
 
         # Interface GigabitEthernet0/0/6
-        p11 = re.compile(r'^Interface +(?P<intf>(\S+))$')
+        p11 = _patterns.compile(r'^Interface +(?P<intf>(\S+))$')
 
         # OSPF packets received/sent
         # Type          Packets              Bytes
@@ -8283,61 +8292,61 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         # TX LS upd     12539                12553264
         # TX LS ack     899                  63396
         # TX Total      182893               26212884
-        p12 = re.compile(r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
-                          ' +(?P<bytes>(\d+))$')
+        p12 = _patterns.compile(r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
+                                 ' +(?P<bytes>(\d+))$')
 
         # OSPF header errors
-        p13 = re.compile(r'^OSPF +header +errors$')
+        p13 = _patterns.compile(r'^OSPF +header +errors$')
 
         # Length 0, Instance ID 0, Checksum 0, Auth Type 0,
-        p14 = re.compile(r'^Length +(?P<len>(\d+)), +Instance +ID'
-                          ' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
-                          ' +Auth +Type +(?P<auth>(\d+)),?$')
+        p14 = _patterns.compile(r'^Length +(?P<len>(\d+)), +Instance +ID'
+                                 ' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
+                                 ' +Auth +Type +(?P<auth>(\d+)),?$')
 
         # Version 0, Bad Source 0, No Virtual Link 0,
-        p15 = re.compile(r'^Version +(?P<version>(\d+)), +Bad +Source'
-                          ' +(?P<bad_source>(\d+)), +No +Virtual +Link'
-                          ' +(?P<no_virtual_link>(\d+)),?$')
+        p15 = _patterns.compile(r'^Version +(?P<version>(\d+)), +Bad +Source'
+                                 ' +(?P<bad_source>(\d+)), +No +Virtual +Link'
+                                 ' +(?P<no_virtual_link>(\d+)),?$')
 
         # Area Mismatch 0, No Sham Link 0, Self Originated 0,
-        p16 = re.compile(r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
-                          ' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
-                          ' +Self +Originated +(?P<self_originated>(\d+)),?$')
+        p16 = _patterns.compile(r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
+                                 ' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
+                                 ' +Self +Originated +(?P<self_originated>(\d+)),?$')
 
         # Duplicate ID 0, Hello 0, MTU Mismatch 0,
-        p17 = re.compile(r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
-                          ' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
-                          ' +(?P<mtu_mismatch>(\d+)),$')
+        p17 = _patterns.compile(r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
+                                 ' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
+                                 ' +(?P<mtu_mismatch>(\d+)),$')
 
         # Nbr Ignored 0, LLS 0, Unknown Neighbor 0,
-        p18 = re.compile(r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
-                          ' +(?P<lls>(\d+)), +Unknown +Neighbor'
-                          ' +(?P<unknown_neighbor>(\d+)),?$')
+        p18 = _patterns.compile(r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
+                                 ' +(?P<lls>(\d+)), +Unknown +Neighbor'
+                                 ' +(?P<unknown_neighbor>(\d+)),?$')
 
         # Authentication 0, TTL Check Fail 0, Adjacency Throttle 0,
-        p19 = re.compile(r'^Authentication +(?P<authentication>(\d+)), +TTL'
-                          ' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
-                          ' +Throttle +(?P<adjacency_throttle>(\d+)),?$')
+        p19 = _patterns.compile(r'^Authentication +(?P<authentication>(\d+)), +TTL'
+                                 ' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
+                                 ' +Throttle +(?P<adjacency_throttle>(\d+)),?$')
 
         # Authentication 0, TTL Check Fail 0, Test discard 0
-        p19_1 = re.compile(r'^Authentication +(?P<authentication>\d+), +TTL'
+        p19_1 = _patterns.compile(r'^Authentication +(?P<authentication>\d+), +TTL'
                           ' +Check +Fail +(?P<ttl_check_fail>\d+), +Test discard'
                           ' +(?P<test_discard>\d+),?$')
 
         # BFD 0, Test discard 0
-        p20 = re.compile(r'^BFD +(?P<bfd>(\d+)), +Test +discard'
-                          ' +(?P<test_discard>(\d+))$')
+        p20 = _patterns.compile(r'^BFD +(?P<bfd>(\d+)), +Test +discard'
+                                 ' +(?P<test_discard>(\d+))$')
 
         # OSPF LSA errors
-        p21 = re.compile(r'^OSPF +LSA +errors$')
+        p21 = _patterns.compile(r'^OSPF +LSA +errors$')
 
         # Type 0, Length 0, Data 0, Checksum 0
-        p22 = re.compile(r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
-                          ' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$')
+        p22 = _patterns.compile(r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
+                                 ' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$')
 
         # Summary traffic statistics for process ID 65109:
-        p23 = re.compile(r'^Summary +traffic +statistics +for +process +ID'
-                          ' +(?P<pid>(\d+)):$')
+        p23 = _patterns.compile(r'^Summary +traffic +statistics +for +process +ID'
+                                 ' +(?P<pid>(\d+)):$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8733,8 +8742,8 @@ class ShowIpOspfNeighbor(ShowIpOspfNeighborSchema):
         # 172.16.197.253 128   FULL/DR         00:00:30    172.16.165.49  GigabitEthernet0/0/1
         # 10.169.197.252   0   FULL/  -        00:00:36    10.169.197.93  GigabitEthernet2
         
-        p1=re.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
-                       ' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$')
+        p1=_patterns.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
+                              ' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$')
 
         for line in out.splitlines():
 
@@ -8825,15 +8834,15 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        r1 = re.compile(r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
-                         '\(Process\s+ID\s+(?P<process_id>\d+)\)')
+        r1 = _patterns.compile(r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
+                                '\(Process\s+ID\s+(?P<process_id>\d+)\)')
 
         # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U   
         # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U   
-        r2 = re.compile(r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
-                         '(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
-                         '(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
-                         '\s*(?:(?P<backup_interface>\S+))?')
+        r2 = _patterns.compile(r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
+                                '(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
+                                '(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
+                                '\s*(?:(?P<backup_interface>\S+))?')
 
         parsed_output = {}
 
@@ -8927,17 +8936,17 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
             '\) +\(Process +ID +(?P<process_id>\d+)\)')
 
         # Process ID (65109)       no       yes      no          no
         # Area 8                  no       yes      no          no
         # Loopback0               no       no       no          no
         # GigabitEthernet0/1/2    no       yes      no          no
-        p2 = re.compile(r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
-                         '( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
-                         '+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
-                         '(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$')
+        p2 = _patterns.compile(r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
+                                '( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
+                                '+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
+                                '(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$')
 
         # initial variables
         ret_dict = {}
@@ -9032,14 +9041,14 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         'Process +ID +(?P<process_id>\d+)\)')
+        p1 = _patterns.compile(r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+                                'Process +ID +(?P<process_id>\d+)\)')
 
         # Area with ID (8)
-        p2 = re.compile(r'^Area +with +ID \((?P<area_id>\d+)\)$')
+        p2 = _patterns.compile(r'^Area +with +ID \((?P<area_id>\d+)\)$')
 
         # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
-        p3 = re.compile(
+        p3 = _patterns.compile(
             r'^(?P<neighbor_id>\S+) +(?P<interface>\S+) +(?P<address>\S+) +('
             r'?P<adj_sid>\d+)( +(?P<backup_nexthop>\S+))?( +(?P<backup_interface>\S+))?$')
 
@@ -9139,17 +9148,17 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                        '\(Process +ID +(?P<pid>\d+)\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+                               '\(Process +ID +(?P<pid>\d+)\)$')
 
         # 1       (L)     10.4.1.1/32          10.4.1.1          8        Intra     0
         # 2               10.16.2.2/32          10.16.2.2          8        Intra     0
         #                 10.16.2.3/32          10.16.2.2          8        Intra     0
         # 3       (M)     10.16.2.3/32                                    Unknown   0
         #                 10.36.3.3/32               10.16.2.10         0
-        p2 = re.compile(r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
-                        r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
-                        r'(?: +(?P<algo>\d+))?')
+        p2 = _patterns.compile(r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
+                               r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
+                               r'(?: +(?P<algo>\d+))?')
 
         ret_dict = {}
         sid_entries = 0
@@ -9255,19 +9264,19 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 1234)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                         '\(Process +ID +(?P<pid>\d+)\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+                                '\(Process +ID +(?P<pid>\d+)\)$')
 
         # OSPF Segment Routing Global Blocks in Area 3
-        p2 = re.compile(r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$')
+        p2 = _patterns.compile(r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$')
 
         # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
         # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
         # *10.4.1.1         No
         # 10.16.2.2         No
-        p3 = re.compile(r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
-                         '(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
-                         '(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$')
+        p3 = _patterns.compile(r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
+                                '(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
+                                '(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$')
 
         ret_dict = {}
 
@@ -9408,78 +9417,78 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
             out = output
         
         # OSPF Router with ID (10.16.2.2) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         'Process +ID +(?P<process_id>\d+)\)$')
+        p1 = _patterns.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+                                'Process +ID +(?P<process_id>\d+)\)$')
 
         # Global segment-routing state: Enabled
-        p2 = re.compile(r'^Global +segment\-routing +state: +'
-                         '(?P<global_segment_routing_state>\S+)$')
+        p2 = _patterns.compile(r'^Global +segment\-routing +state: +'
+                                '(?P<global_segment_routing_state>\S+)$')
         
         # Prefer non-SR (LDP) Labels
-        p3 = re.compile(r'^Prefer +non\-SR +\(LDP\) +Labels$')
+        p3 = _patterns.compile(r'^Prefer +non\-SR +\(LDP\) +Labels$')
 
         # Do not advertise Explicit Null
-        p4 = re.compile(r'^Do +not +advertise +Explicit +Null$')
+        p4 = _patterns.compile(r'^Do +not +advertise +Explicit +Null$')
 
         # Global Block (SRGB):
-        p5 = re.compile(r'^Global +Block +\(SRGB\):$')
+        p5 = _patterns.compile(r'^Global +Block +\(SRGB\):$')
 
         # Range: 16000 - 23999
-        p6 = re.compile(r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$')
+        p6 = _patterns.compile(r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$')
 
         # State: Created
-        p7 = re.compile(r'^State: +(?P<state>\S+)$')
+        p7 = _patterns.compile(r'^State: +(?P<state>\S+)$')
 
         # Local Block (SRLB):
-        p8 = re.compile(r'^Local +Block +\(SRLB\):$')
+        p8 = _patterns.compile(r'^Local +Block +\(SRLB\):$')
 
         # Registered with SR App, client handle: 2
-        p9 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +'
-                         'client +handle: +(?P<client_handle>\d+)$')
+        p9 = _patterns.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +'
+                                'client +handle: +(?P<client_handle>\d+)$')
 
         # SR algo 0 Connected map notifications active (handle 0x0), bitmask 0x1
-        p10 = re.compile(r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
-                          'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$')
+        p10 = _patterns.compile(r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
+                                 'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$')
 
         # Registered with MPLS, client-id: 100
-        p12 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
-                          '(?P<client_id>\d+)$')
+        p12 = _patterns.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
+                                 '(?P<client_id>\d+)$')
 
         # Max labels: platform 16, available 13
-        p13 = re.compile(r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$')
+        p13 = _patterns.compile(r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$')
 
         # Max labels pushed by OSPF: uloop tunnels 10, TI-LFA tunnels 10
-        p14 = re.compile(r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
-                          ', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$')
+        p14 = _patterns.compile(r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
+                                 ', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$')
 
         # mfi label reservation ack not pending
-        p15 = re.compile(r'^mfi +label +reservation +ack +not +pending$')
+        p15 = _patterns.compile(r'^mfi +label +reservation +ack +not +pending$')
 
         # Bind Retry timer not running
-        p16 = re.compile(r'^Bind +Retry +timer +not +running$')
+        p16 = _patterns.compile(r'^Bind +Retry +timer +not +running$')
         
         # Bind Retry timer running, left ???
-        p16_1 = re.compile(r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$')
+        p16_1 = _patterns.compile(r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$')
 
         # Adj Label Bind Retry timer not running
-        p17 = re.compile(r'^Adj +Label +Bind +Retry +timer +not +running$')
+        p17 = _patterns.compile(r'^Adj +Label +Bind +Retry +timer +not +running$')
 
         # Adj Label Bind Retry timer running, left ???
-        p17_1 = re.compile(r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$')
+        p17_1 = _patterns.compile(r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$')
 
         # sr-app locks requested: srgb 0, srlb 0
-        p18 = re.compile(r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$')
+        p18 = _patterns.compile(r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$')
 
         # TE Router ID 10.16.2.2
-        p19 = re.compile(r'^TE +Router +ID +(?P<te_router_id>\S+)$')
+        p19 = _patterns.compile(r'^TE +Router +ID +(?P<te_router_id>\S+)$')
 
         # Area Topology name Forwarding Strict SPF
-        p20 = re.compile(r'^Area +Topology +name +Forwarding +Strict +SPF$')
+        p20 = _patterns.compile(r'^Area +Topology +name +Forwarding +Strict +SPF$')
 
         # 8    Base             MPLS          Capable
         # AS external    Base             MPLS          Not applicable
-        p21 = re.compile(r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
-                         ' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$')
+        p21 = _patterns.compile(r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
+                                ' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$')
         
         # initial variables
         ret_dict = {}
@@ -9734,76 +9743,76 @@ class ShowIpOspfLinksParser2(MetaParser):
 
         # Sham Link OSPF_SL0 to address 10.151.22.22 is up
         # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            ' +(address|router) +(?P<address>(\S+)) +is'
-                            ' +(?P<link_state>(up|down))$')
+        p1 = _patterns.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+                                   ' +(address|router) +(?P<address>(\S+)) +is'
+                                   ' +(?P<link_state>(up|down))$')
 
         # Area 1, source address 10.21.33.33
         # Area 1 source address 10.229.11.11
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            ' +(?P<source_address>(\S+))$')
+        p2 = _patterns.compile(r'^Area +(?P<area>(\S+)),? +source +address'
+                                   ' +(?P<source_address>(\S+))$')
         
         # Run as demand circuit
-        p3 = re.compile(r'^Run +as +demand +circuit$')
+        p3 = _patterns.compile(r'^Run +as +demand +circuit$')
 
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            '(?: State +(?P<state>(\S+)))?$')
+        p4 = _patterns.compile(r'^DoNotAge +LSA +not +allowed'
+                                   ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+                                   '(?: +Cost +of +using +(?P<cost>(\d+)))?'
+                                   '(?: State +(?P<state>(\S+)))?$')
 
         # Transit area 1
         # Transit area 1, via interface GigabitEthernet0/1
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            '(?: +via +interface +(?P<intf>(\S+)))?$')
+        p5 = _patterns.compile(r'^Transit +area +(?P<area>(\S+)),'
+                                   '(?: +via +interface +(?P<intf>(\S+)))?$')
 
         # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
         #             0       1          no           no               Base
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            ' +(?P<topo_name>(\S+))$')
+        p6 = _patterns.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                   ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                   ' +(?P<topo_name>(\S+))$')
 
         # Transmit Delay is 1 sec, State POINT_TO_POINT,
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            ' +sec, +State +(?P<state>(\S+)),?$')
+        p7 = _patterns.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+                                   ' +sec, +State +(?P<state>(\S+)),?$')
 
         # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
         # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
         # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
+        p8 = _patterns.compile(r'^Timer +intervals +configured,'
+                                   ' +Hello +(?P<hello>(\d+)),'
+                                   ' +Dead +(?P<dead>(\d+)),'
+                                   ' +Wait +(?P<wait>(\d+)),'
+                                   '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
 
         # Strict TTL checking enabled, up to 3 hops allowed
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p9 = _patterns.compile(r'^Strict +TTL +checking'
+                                   ' +(?P<strict_ttl>(enabled|disabled))'
+                                   '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
 
         # Hello due in 00:00:03:179
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p10 = _patterns.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
 
         # Adjacency State FULL
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
+        p11 = _patterns.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
 
         # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            ' +length +(?P<length>(\d+)), +number +of'
-                            ' +retransmission +(?P<retrans>(\d+))$')
+        p12 = _patterns.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
+                                   ' +length +(?P<length>(\d+)), +number +of'
+                                   ' +retransmission +(?P<retrans>(\d+))$')
         
         # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p13 = _patterns.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
 
         # Last retransmission scan length is 1, maximum is 1
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p14 = _patterns.compile(r'^Last +retransmission +scan +length +is'
+                                   ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
 
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<time>(\d+)) +msec, +maximum +is'
-                            ' +(?P<max>(\d+)) +msec$')
+        p15 = _patterns.compile(r'^Last +retransmission +scan +time +is'
+                                   ' +(?P<time>(\d+)) +msec, +maximum +is'
+                                   ' +(?P<max>(\d+)) +msec$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -34,6 +34,10 @@ from xml.dom import minidom
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+
+# Patterns of the parsers in this module, compiled once
+_patterns = PatternTable()
 # genie.parsergen
 try:
     import genie.parsergen
@@ -84,27 +88,27 @@ class ShowBootvar(ShowBootvarSchema):
         # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;harddisk:/asr1000-genie-image_asr-MIB-1,12;
-        p1 = re.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
+        p1 = _patterns.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
 
         # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-        p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+        p2 = _patterns.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
 
         # Configuration register is 0x2002
         # Configuration register is 0x2 (will be 0x2102 at next reload)
         # Configuration Register is 0x102
-        p3 = re.compile(r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
-                        r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$')
+        p3 = _patterns.compile(r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
+                               r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$')
 
         # Standby Configuration register is 0x2002
         # Standby Configuration register is 0x1  (will be 0x2102 at next reload)
-        p4 = re.compile(r'^Standby +Configuration +register +is +(?P<var>\w+)'
-                        r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$')
+        p4 = _patterns.compile(r'^Standby +Configuration +register +is +(?P<var>\w+)'
+                               r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$')
 
         # CONFIG_FILE variable =
-        p5 = re.compile(r'^CONFIG_FILE +variable += +(?P<var>\S+)$')
+        p5 = _patterns.compile(r'^CONFIG_FILE +variable += +(?P<var>\S+)$')
 
         # BOOTLDR variable =
-        p6 = re.compile(r'^BOOTLDR +variable += +(?P<var>\S+)$')
+        p6 = _patterns.compile(r'^BOOTLDR +variable += +(?P<var>\S+)$')
 
         # BOOTLDR variable does not exist
         # not parsing
@@ -325,78 +329,78 @@ class ShowVersion(ShowVersionSchema):
         # version
         # Cisco IOS Software [Everest], ISR Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.5, RELEASE SOFTWARE (fc3)
         # Cisco IOS Software, IOS-XE Software, Catalyst 4500 L3 Switch Software (cat4500e-UNIVERSALK9-M), Version 03.03.02.SG RELEASE SOFTWARE (fc1)
-        p1 = re.compile(r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
-                        r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
-                        r'+(?P<version>\S+) +.*$')
+        p1 = _patterns.compile(r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
+                               r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
+                               r'+(?P<version>\S+) +.*$')
 
         # IOS (tm) Catalyst 4000 L3 Switch Software (cat4000-I9S-M), Version 12.2(18)EW5, RELEASE SOFTWARE (fc1)
         # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
-        p1_1 = re.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
-                          r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
-                          r' +(?P<version>\S+), +RELEASE SOFTWARE .*$')
+        p1_1 = _patterns.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
+                                 r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
+                                 r' +(?P<version>\S+), +RELEASE SOFTWARE .*$')
 
         # 16.6.5
-        p2 = re.compile(r'^(?P<ver_short>\d+\.\d+).*')
+        p2 = _patterns.compile(r'^(?P<ver_short>\d+\.\d+).*')
 
         # Cisco IOS Software [Fuji], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.7.1prd4, RELEASE SOFTWARE (fc1)
         # Cisco IOS Software [Fuji], Catalyst L3 Switch Software (CAT3K_CAA-UNIVERSALK9-M), Experimental Version 16.8.20170924:182909 [polaris_dev-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20170924_191550 132]
         # Cisco IOS Software, 901 Software (ASR901-UNIVERSALK9-M), Version 15.6(2)SP4, RELEASE SOFTWARE (fc3)
         # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
-        p3 = re.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware(.+)?\, '
-                        r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
-                        r'+Experimental)? +[Vv]ersion '
-                        r'+(?P<version>[a-zA-Z0-9\.\:\(\)]+) *,?.*')
+        p3 = _patterns.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware(.+)?\, '
+                               r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
+                               r'+Experimental)? +[Vv]ersion '
+                               r'+(?P<version>[a-zA-Z0-9\.\:\(\)]+) *,?.*')
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p4 = re.compile(r'^Copyright +(.*)$')
+        p4 = _patterns.compile(r'^Copyright +(.*)$')
 
         # Technical Support: http://www.cisco.com/techsupport
-        p5 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p5 = _patterns.compile(r'^Technical +Support: +http\:\/\/www'
+                               r'\.cisco\.com\/techsupport')
 
         # rom
-        p6 = re.compile(r'^ROM\: +(?P<rom>.+)$')
+        p6 = _patterns.compile(r'^ROM\: +(?P<rom>.+)$')
 
         # ROM: Bootstrap program is IOSv
-        p7 = re.compile(r'^Bootstrap +program +is +(?P<os>.+)$')
+        p7 = _patterns.compile(r'^Bootstrap +program +is +(?P<os>.+)$')
 
         # bootldr
-        p8 = re.compile(r'^BOOTLDR\: +(?P<bootldr>.+)$')
+        p8 = _patterns.compile(r'^BOOTLDR\: +(?P<bootldr>.+)$')
 
         # hostname & uptime
-        p9 = re.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
+        p9 = _patterns.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
 
         # uptime_this_cp
-        p10 = re.compile(r'^[Uu]ptime +for +this +control +processor '
-                         r'+is +(?P<uptime_this_cp>.+)$')
+        p10 = _patterns.compile(r'^[Uu]ptime +for +this +control +processor '
+                                r'+is +(?P<uptime_this_cp>.+)$')
 
         # system_restarted_at
-        p11 = re.compile(r'^[Ss]ystem +restarted +at '
-                         r'+(?P<system_restarted_at>.+)$')
+        p11 = _patterns.compile(r'^[Ss]ystem +restarted +at '
+                                r'+(?P<system_restarted_at>.+)$')
 
         # system_image
         # System image file is "tftp://10.1.6.241//auto/genie-ftp/Edison/cat3k_caa-universalk9.BLD__20170410_174845.SSA.bin"
         # System image file is "harddisk:test-image-PE1-13113029"
-        p12 = re.compile(r'^[Ss]ystem +image +file +is '
-                         r'+\"(?P<system_image>.+)\"')
+        p12 = _patterns.compile(r'^[Ss]ystem +image +file +is '
+                                r'+\"(?P<system_image>.+)\"')
 
         # last_reload_reason
-        p13 = re.compile(r'^[Ll]ast +reload +reason\: '
-                         r'+(?P<last_reload_reason>.+)$')
+        p13 = _patterns.compile(r'^[Ll]ast +reload +reason\: '
+                                r'+(?P<last_reload_reason>.+)$')
 
         # last_reload_reason
         # Last reset from power-on
-        p14 = re.compile(r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$')
+        p14 = _patterns.compile(r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$')
 
         # license_type
-        p15 = re.compile(r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$')
+        p15 = _patterns.compile(r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$')
 
         # license_level
-        p16 = re.compile(r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$')
+        p16 = _patterns.compile(r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$')
 
         # next_reload_license_level
-        p17 = re.compile(r'^[Nn]ext +(reload|reboot) +license +Level\: '
-                         r'+(?P<next_reload_license_level>.+)$')
+        p17 = _patterns.compile(r'^[Nn]ext +(reload|reboot) +license +Level\: '
+                                r'+(?P<next_reload_license_level>.+)$')
 
         # chassis, processor_type, main_mem and rtr_type
         # cisco WS-C3650-24PD (MIPS) processor (revision H0) with 829481K/6147K bytes of memory.
@@ -407,184 +411,184 @@ class ShowVersion(ShowVersionSchema):
         # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
         # cisco WS-C4507R+E (MPC8572) processor (revision 10) with 2097152K/20480K bytes of memory.
         # Cisco CISCO1941/K9 (revision 1.0) with 491520K/32768K bytes of memory.
-        p18 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18 = _patterns.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+                                r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+                                r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
 
         # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-        p18_2 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
-                           r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_2 = _patterns.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
+                                  r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
 
         # chassis_sn
-        p19 = re.compile(r'^[pP]rocessor +board +ID '
-                         r'+(?P<chassis_sn>[a-zA-Z0-9]+)')
+        p19 = _patterns.compile(r'^[pP]rocessor +board +ID '
+                                r'+(?P<chassis_sn>[a-zA-Z0-9]+)')
 
         # number_of_intfs
-        p20 = re.compile(r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
-                         r'+(interface(?:s)?|line|port(?:s)?)$')
+        p20 = _patterns.compile(r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
+                                r'+(interface(?:s)?|line|port(?:s)?)$')
 
         # mem_size
-        p21 = re.compile(r'^(?P<mem_size>\d+)K +bytes +of '
-                         r'+(?P<memories>.+) +[Mm]emory\.')
+        p21 = _patterns.compile(r'^(?P<mem_size>\d+)K +bytes +of '
+                                r'+(?P<memories>.+) +[Mm]emory\.')
 
         # disks, disk_size and type_of_disk
-        p22 = re.compile(r'^(?P<disk_size>\d+)K bytes of '
-                         r'(?P<type_of_disk>.*) at (?P<disks>.+)$')
+        p22 = _patterns.compile(r'^(?P<disk_size>\d+)K bytes of '
+                                r'(?P<type_of_disk>.*) at (?P<disks>.+)$')
 
         # os
         # Cisco IOS Software,
-        p23 = re.compile(r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
-                         r'+[Ss]oftware\,')
+        p23 = _patterns.compile(r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
+                                r'+[Ss]oftware\,')
 
         # curr_config_register
-        p24 = re.compile(r'^[Cc]onfiguration +register +is '
-                         r'+(?P<curr_config_register>[a-zA-Z0-9]+)')
+        p24 = _patterns.compile(r'^[Cc]onfiguration +register +is '
+                                r'+(?P<curr_config_register>[a-zA-Z0-9]+)')
 
         # next_config_register
-        p25 = re.compile(r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
-                         r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
-                         r'at next reload\)')
+        p25 = _patterns.compile(r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
+                                r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
+                                r'at next reload\)')
 
         # switch_number
-        p26 = re.compile(r'^[Ss]witch +0(?P<switch_number>\d+)$')
+        p26 = _patterns.compile(r'^[Ss]witch +0(?P<switch_number>\d+)$')
 
         # uptime
-        p27 = re.compile(r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$')
+        p27 = _patterns.compile(r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$')
 
         # mac_address
-        p28 = re.compile(r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
-                         r'+\: +(?P<mac_address>.+)$')
+        p28 = _patterns.compile(r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
+                                r'+\: +(?P<mac_address>.+)$')
 
         # mb_assembly_num
-        p29 = re.compile(r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
-                         r'+(?P<mb_assembly_num>.+)$')
+        p29 = _patterns.compile(r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
+                                r'+(?P<mb_assembly_num>.+)$')
 
         # mb_sn
-        p30 = re.compile(r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
-                         r'+(?P<mb_sn>.+)$')
+        p30 = _patterns.compile(r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
+                                r'+(?P<mb_sn>.+)$')
 
         # model_rev_num
-        p31 = re.compile(r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<model_rev_num>.+)$')
+        p31 = _patterns.compile(r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
+                                r'+(?P<model_rev_num>.+)$')
 
         # mb_rev_num
-        p32 = re.compile(r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<mb_rev_num>.+)$')
+        p32 = _patterns.compile(r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
+                                r'+(?P<mb_rev_num>.+)$')
 
         # model_num
-        p33 = re.compile(r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$')
+        p33 = _patterns.compile(r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$')
 
         # system_sn
-        p34 = re.compile(r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$')
+        p34 = _patterns.compile(r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$')
 
         # Compiled Mon 10-Apr-17 04:35 by mcpre
         # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-        p36 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\w+)$')
+        p36 = _patterns.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+                                r'+(?P<compiled_by>\w+)$')
 
         # System returned to ROM by reload at 15:57:52 CDT Mon Sep 24 2018
         # System returned to ROM by Reload Command at 07:15:43 UTC Fri Feb 1 2019
         # System returned to ROM by reload
         # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
         # System returned to ROM by power-on
-        p37 = re.compile(r'^System +returned +to +ROM +by '
-                         r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
-                         r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
-                         r'+(?P<sp_by>[\S\s\-]+)\))?$')
+        p37 = _patterns.compile(r'^System +returned +to +ROM +by '
+                                r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
+                                r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
+                                r'+(?P<sp_by>[\S\s\-]+)\))?$')
 
         # Last reload type: Normal Reload
-        p38 = re.compile(
+        p38 = _patterns.compile(
             r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$')
 
         # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
-        p39 = re.compile(r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
-                         r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
-                         r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
-                         r'+(?P<supervisor>\S+)))$')
+        p39 = _patterns.compile(r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
+                                r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
+                                r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
+                                r'+(?P<supervisor>\S+)))$')
 
         # 98304K bytes of processor board System flash (Read/Write)
-        p40 = re.compile(r'^(?P<processor_board_flash>\S+) +bytes .+$')
+        p40 = _patterns.compile(r'^(?P<processor_board_flash>\S+) +bytes .+$')
 
         # Running default software
-        p41 = re.compile(r'^Running +(?P<running_default_software>\S+) +software$')
+        p41 = _patterns.compile(r'^Running +(?P<running_default_software>\S+) +software$')
 
         # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-        p42 = re.compile(r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
-                         r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$')
+        p42 = _patterns.compile(r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
+                                r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$')
 
         # ipbase           ipbasek9         Smart License    ipbasek9
         # securityk9       securityk9       RightToUse       securityk9
-        p43 = re.compile(r'^(?P<technology>\w[\w\-]+)(?: {2,}'
-                         r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
-                         r'+\w+)?) {2,}(?P<next_boot>\w+))?$')
+        p43 = _patterns.compile(r'^(?P<technology>\w[\w\-]+)(?: {2,}'
+                                r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
+                                r'+\w+)?) {2,}(?P<next_boot>\w+))?$')
 
         # Suite                 Suite Current         Type           Suite Next reboot
         # Technology    Technology-package           Technology-package
-        p44 = re.compile(r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
-                         r'(Technology\-package))')
+        p44 = _patterns.compile(r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
+                                r'(Technology\-package))')
 
         # Suite License Information for Module:'esg'
-        p45 = re.compile(r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
-                         r'+[Mm]odule\:\'(?P<module>\S+)\'$')
+        p45 = _patterns.compile(r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
+                                r'+[Mm]odule\:\'(?P<module>\S+)\'$')
 
         # License UDI:
-        p46_0 = re.compile(r'^License UDI:$')
+        p46_0 = _patterns.compile(r'^License UDI:$')
 
         #     *0        C3900-SPE150/K9       FOC16050QP6
-        p46 = re.compile(r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$')
+        p46 = _patterns.compile(r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$')
 
         # Image text-base: 0x40101040, data-base: 0x42D98000
-        p47 = re.compile(r'^Image text-base: +(?P<text_base>\S+), '
-                         r'data-base: +(?P<data_base>\S+)$')
+        p47 = _patterns.compile(r'^Image text-base: +(?P<text_base>\S+), '
+                                r'data-base: +(?P<data_base>\S+)$')
 
         # 1 Virtual Ethernet/IEEE 802.3 interface(s)
         # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-        p48 = re.compile(r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
-                         r'/IEEE 802\.3 +interface\(s\)$')
+        p48 = _patterns.compile(r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
+                                r'/IEEE 802\.3 +interface\(s\)$')
 
         # Dagobah Revision 95, Swamp Revision 6
-        p50 = re.compile(r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
-                         r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$')
+        p50 = _patterns.compile(r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
+                                r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$')
 
         # power_supply_part_nr
         # Power supply part number: 444-8888-00
-        p51 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$')
+        p51 = _patterns.compile(r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$')
 
         # power_supply_sn
         # Power supply serial number: CCC4466B6LL
-        p52 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$')
+        p52 = _patterns.compile(r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$')
 
         # Daughterboard assembly number   : 73-11111-00
         # db_assembly_num
-        p53 = re.compile(r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$')
+        p53 = _patterns.compile(r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$')
 
         # Daughterboard serial number     : FOC87654CWW
         # db_sn
-        p54 = re.compile(r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$')
+        p54 = _patterns.compile(r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$')
 
         # top_assembly_part_num
         # Top Assembly Part Number        : 800-55555-11
-        p55 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$')
+        p55 = _patterns.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$')
 
         # top_assembly_rev_num
         # Top Assembly Revision Number    : C0
-        p56 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$')
+        p56 = _patterns.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$')
 
         # version_id
         # Version ID                      : V02
-        p57 = re.compile(r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$')
+        p57 = _patterns.compile(r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$')
 
         # clei_code_num
         # CLEI Code Number                : AAALJ00ERT
-        p58 = re.compile(r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$')
+        p58 = _patterns.compile(r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$')
 
         # Daughterboard revision number   : A0
         # db_rev_num
-        p59 = re.compile(r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$')
+        p59 = _patterns.compile(r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$')
 
         # Hardware Board Revision Number  : 0x12
         # hb_rev_num
-        p60 = re.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
+        p60 = _patterns.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -734,8 +738,8 @@ class ShowVersion(ShowVersionSchema):
                 group = m.groupdict()
                 if 'Type:' in group['license_level']:
                     # entservices   Type: Permanent
-                    p16_1 = re.compile(r'(?P<license_level>\S+) +Type\: '
-                                       r'+(?P<license_type>\S+)')
+                    p16_1 = _patterns.compile(r'(?P<license_level>\S+) +Type\: '
+                                              r'+(?P<license_type>\S+)')
                     lic_type = group['license_level'].strip()
                     m_1 = p16_1.match(lic_type)
                     group = m_1.groupdict()
@@ -1270,7 +1274,7 @@ class ShowVersion(ShowVersionSchema):
                 if 'switch_num' not in version_dict['version']:
                     version_dict['version']['switch_num'] = {}
                 if '*' in key:
-                    p = re.compile(r'\**\ *(?P<new_key>\d)')
+                    p = _patterns.compile(r'\**\ *(?P<new_key>\d)')
                     m = p.match(key)
                     switch_no = m.groupdict()['new_key']
                     if m:
@@ -1352,7 +1356,7 @@ class Dir(DirSchema):
             line = line.rstrip()
 
             # dir
-            p1 = re.compile(
+            p1 = _patterns.compile(
                 r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
             m = p1.match(line)
             if m:
@@ -1365,7 +1369,7 @@ class Dir(DirSchema):
                 continue
 
             # filename, index, permissions, size and last_modified_date
-            p2 = re.compile(
+            p2 = _patterns.compile(
                 r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) +(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) +(?P<filename>.+)$')
             m = p2.match(line)
             if m:
@@ -1381,7 +1385,7 @@ class Dir(DirSchema):
                 continue
 
             # bytes_total and bytes_free
-            p3 = re.compile(r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
+            p3 = _patterns.compile(r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
             m = p3.match(line)
             if m:
                 dir_dict['dir'][dir1]['bytes_total'] = m.groupdict()['bytes_total']
@@ -1451,7 +1455,7 @@ class ShowRedundancy(ShowRedundancySchema):
             line = line.rstrip()
 
             # available_system_uptime
-            p1 = re.compile(r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$')
+            p1 = _patterns.compile(r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$')
             m = p1.match(line)
             if m:
                 redundancy_dict.setdefault('red_sys_info', {})
@@ -1460,7 +1464,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # switchovers_system_experienced
-            p2 = re.compile(r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$')
+            p2 = _patterns.compile(r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$')
             m = p2.match(line)
             if m:
                 redundancy_dict['red_sys_info']['switchovers_system_experienced'] = \
@@ -1468,7 +1472,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # standby_failures
-            p3 = re.compile(r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$')
+            p3 = _patterns.compile(r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$')
             m = p3.match(line)
             if m:
                 redundancy_dict['red_sys_info']['standby_failures'] = \
@@ -1476,7 +1480,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # last_switchover_reason
-            p4 = re.compile(r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$')
+            p4 = _patterns.compile(r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$')
             m = p4.match(line)
             if m:
                 redundancy_dict['red_sys_info']['last_switchover_reason'] = \
@@ -1484,7 +1488,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # hw_mode
-            p5 = re.compile(r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$')
+            p5 = _patterns.compile(r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$')
             m = p5.match(line)
             if m:
                 redundancy_dict['red_sys_info']['hw_mode'] = \
@@ -1492,7 +1496,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # conf_red_mode
-            p6 = re.compile(r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$')
+            p6 = _patterns.compile(r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$')
             m = p6.match(line)
             if m:
                 redundancy_dict['red_sys_info']['conf_red_mode'] = \
@@ -1500,7 +1504,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # oper_red_mode
-            p7 = re.compile(r'\s*[Oo]perating +[Rr]edundancy +[Mm]ode +\= +(?P<oper_red_mode>.+)$')
+            p7 = _patterns.compile(r'\s*[Oo]perating +[Rr]edundancy +[Mm]ode +\= +(?P<oper_red_mode>.+)$')
             m = p7.match(line)
             if m:
                 redundancy_dict['red_sys_info']['oper_red_mode'] = \
@@ -1508,7 +1512,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # maint_mode
-            p7 = re.compile(r'\s*[Mm]aintenance +[Mm]ode +\= +(?P<maint_mode>\S+)$')
+            p7 = _patterns.compile(r'\s*[Mm]aintenance +[Mm]ode +\= +(?P<maint_mode>\S+)$')
             m = p7.match(line)
             if m:
                 redundancy_dict['red_sys_info']['maint_mode'] = \
@@ -1516,14 +1520,14 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # communications
-            p8 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)$')
+            p8 = _patterns.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict['red_sys_info']['communications'] = \
                     m.groupdict()['communications']
 
             # communications_reason
-            p8 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)\s+[Rr]eason\: +(?P<communications_reason>.+)$')
+            p8 = _patterns.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)\s+[Rr]eason\: +(?P<communications_reason>.+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict['red_sys_info']['communications'] = \
@@ -1533,7 +1537,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # slot number
-            p9 = re.compile(r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$')
+            p9 = _patterns.compile(r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$')
             m = p9.match(line)
             if m:
                 slot = m.groupdict()['slot']
@@ -1544,7 +1548,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # curr_sw_state
-            p10 = re.compile(r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$')
+            p10 = _patterns.compile(r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$')
             m = p10.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1553,7 +1557,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # uptime_in_curr_state
-            p11 = re.compile(r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$')
+            p11 = _patterns.compile(r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$')
             m = p11.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1562,7 +1566,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # image_ver
-            p12 = re.compile(r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$')
+            p12 = _patterns.compile(r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$')
             m = p12.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1571,7 +1575,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # boot
-            p13 = re.compile(r'^\s*BOOT +\= +(?P<boot>.+)$')
+            p13 = _patterns.compile(r'^\s*BOOT +\= +(?P<boot>.+)$')
             m = p13.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1580,7 +1584,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # config_file
-            p14 = re.compile(r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$')
+            p14 = _patterns.compile(r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$')
             m = p14.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1589,7 +1593,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # bootldr
-            p15 = re.compile(r'\s*BOOTLDR +\= +(?P<bootldr>.?)$')
+            p15 = _patterns.compile(r'\s*BOOTLDR +\= +(?P<bootldr>.?)$')
             m = p15.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1598,7 +1602,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # config_register
-            p16 = re.compile(r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$')
+            p16 = _patterns.compile(r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$')
             m = p16.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1646,53 +1650,53 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
         ret_dict = {}
 
         # my state = 13 -ACTIVE
-        p1 = re.compile(r'^my +state += +(?P<my_state>[\s\S]+)$')
+        p1 = _patterns.compile(r'^my +state += +(?P<my_state>[\s\S]+)$')
 
         # peer state = 8  -STANDBY HOT
-        p2 = re.compile(r'^peer +state += +(?P<peer_state>[\s\S]+)$')
+        p2 = _patterns.compile(r'^peer +state += +(?P<peer_state>[\s\S]+)$')
 
         # Mode = Duplex
-        p3 = re.compile(r'^Mode += +(?P<mode>[\w]+)$')
+        p3 = _patterns.compile(r'^Mode += +(?P<mode>[\w]+)$')
 
         # Unit = Primary
-        p4 = re.compile(r'^Unit += +(?P<unit>[\w]+)$')
+        p4 = _patterns.compile(r'^Unit += +(?P<unit>[\w]+)$')
 
         # Unit ID = 48
-        p5 = re.compile(r'^Unit +ID += +(?P<unit_id>[\d]+)$')
+        p5 = _patterns.compile(r'^Unit +ID += +(?P<unit_id>[\d]+)$')
 
         # Redundancy Mode (Operational) = sso
-        p6 = re.compile(r'^Redundancy +Mode +\(Operational\) += +'
-                        '(?P<redundancy_mode_operational>[\s\S]+)$')
+        p6 = _patterns.compile(r'^Redundancy +Mode +\(Operational\) += +'
+                               '(?P<redundancy_mode_operational>[\s\S]+)$')
 
         # Redundancy Mode (Configured)  = sso
-        p7 = re.compile(r'^Redundancy +Mode +\(Configured\) += +'
-                        '(?P<redundancy_mode_configured>[\s\S]+)$')
+        p7 = _patterns.compile(r'^Redundancy +Mode +\(Configured\) += +'
+                               '(?P<redundancy_mode_configured>[\s\S]+)$')
 
         # Redundancy State              = sso
-        p8 = re.compile(r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$')
+        p8 = _patterns.compile(r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$')
 
         # Maintenance Mode = Disabled
-        p9 = re.compile(r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$')
+        p9 = _patterns.compile(r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$')
 
         # Manual Swact = enabled
         # Manual Swact = disabled (system is simplex (no peer unit))
-        p10 = re.compile(r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
-                         '( +\((?P<manual_swact_reason>.*)\))?$')
+        p10 = _patterns.compile(r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
+                                '( +\((?P<manual_swact_reason>.*)\))?$')
 
         # Communications = Up
         # Communications = Down      Reason: Simplex mode
-        p11 = re.compile(r'^Communications += +(?P<communications>[\w]+)'
-                         '( +Reason: +(?P<communications_reason>[\s\S]+))?$')
+        p11 = _patterns.compile(r'^Communications += +(?P<communications>[\w]+)'
+                                '( +Reason: +(?P<communications_reason>[\s\S]+))?$')
 
         # client count = 76
-        p12 = re.compile(r'^client +count += +(?P<client_count>[\d]+)$')
+        p12 = _patterns.compile(r'^client +count += +(?P<client_count>[\d]+)$')
 
         # client_notification_TMR = 30000 milliseconds
-        p13 = re.compile(r'^client_notification_TMR += +'
-                         '(?P<client_notification_tmr_msec>[\d]+) +milliseconds$')
+        p13 = _patterns.compile(r'^client_notification_TMR += +'
+                                '(?P<client_notification_tmr_msec>[\d]+) +milliseconds$')
 
         # RF debug mask = 0x0
-        p14 = re.compile(r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$')
+        p14 = _patterns.compile(r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1926,33 +1930,33 @@ class ShowInventory(ShowInventorySchema):
         # NAME: "subslot 0/0 transceiver 2", DESCR: "GE T"
         # NAME: "NIM subslot 0/0", DESCR: "Front Panel 3 ports Gigabitethernet Module"
         # NAME: "Modem 0 on Cellular0/2/0", DESCR: "Sierra Wireless EM7455/EM7430"
-        p1 = re.compile(r'^NAME: +\"(?P<name>.*)\",'
-                        r' +DESCR: +\"(?P<descr>.*)\"$')
+        p1 = _patterns.compile(r'^NAME: +\"(?P<name>.*)\",'
+                               r' +DESCR: +\"(?P<descr>.*)\"$')
 
         # Switch 1
         # module 0
-        p1_1 = re.compile(r'^(Switch|[Mm]odule) +(?P<slot>(\S+))')
+        p1_1 = _patterns.compile(r'^(Switch|[Mm]odule) +(?P<slot>(\S+))')
 
         # Power Supply Module 0
         # Power Supply Module 1
-        p1_2 = re.compile(r'Power Supply Module')
+        p1_2 = _patterns.compile(r'Power Supply Module')
 
         # SPA subslot 0/0
         # IM subslot 0/1
         # NIM subslot 0/0
-        p1_3 = re.compile(r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))')
+        p1_3 = _patterns.compile(r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))')
 
         # subslot 0/0 transceiver 0
-        p1_4 = re.compile(r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))')
+        p1_4 = _patterns.compile(r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))')
 
         # StackPort1/1
-        p1_5 = re.compile(r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$')
+        p1_5 = _patterns.compile(r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$')
 
         # Fan Tray
-        p1_6 = re.compile(r'^Fan +Tray$')
+        p1_6 = _patterns.compile(r'^Fan +Tray$')
 
         # Modem 0 on Cellular0/2/0
-        p1_7 = re.compile(r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$')
+        p1_7 = _patterns.compile(r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$')
 
         # PID: ASR-920-24SZ-IM   , VID: V01  , SN: CAT1902V19M
         # PID: SFP-10G-LR        , VID: CSCO , SN: CD180456291
@@ -1962,8 +1966,8 @@ class ShowInventory(ShowInventorySchema):
         # PID: ISR4331/K9        , VID:      , SN: FDO21520TGH
         # PID: ISR4331/K9        , VID:      , SN:
         # PID: , VID: 1.0  , SN: 1162722191
-        p2 = re.compile(r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
-                        r' +SN:(?: +(?P<sn>(\S+)))?$')
+        p2 = _patterns.compile(r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
+                               r' +SN:(?: +(?P<sn>(\S+)))?$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -2250,49 +2254,49 @@ class ShowPlatform(ShowPlatformSchema):
         # ----------      C3850    -------------
 
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1 = _patterns.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+                               r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2 = _patterns.compile(r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$')
 
         # Switch  Ports    Model                Serial No.   MAC address     Hw Ver.       Sw Ver.
         # ------  -----   ---------             -----------  --------------  -------       --------
         #  1       32     WS-C3850-24P-E        FCW1947C0HH  0057.d2ff.e71b  V07           16.6.1
         #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           17.05.01
-        p3 = re.compile(r'^(?P<switch>\d+) +(?P<ports>\d+) +'
-                        r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
-                        r'(?P<mac_address>[\w\.\:]+) +'
-                        r'(?P<hw_ver>\w+) +(?P<sw_ver>[\w\.]+)$')
+        p3 = _patterns.compile(r'^(?P<switch>\d+) +(?P<ports>\d+) +'
+                               r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
+                               r'(?P<mac_address>[\w\.\:]+) +'
+                               r'(?P<hw_ver>\w+) +(?P<sw_ver>[\w\.]+)$')
 
         #                                     Current
         # Switch#   Role        Priority      State
         # -------------------------------------------
         # *1       Active          3          Ready
-        p4 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                        r'(?P<priority>\d+) +(?P<state>[\w\s]+)$')
+        p4 = _patterns.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+                               r'(?P<priority>\d+) +(?P<state>[\w\s]+)$')
 
         # ----------      ASR1K    -------------
         # Chassis type: ASR1006
         # Chassis type: ASR-903
-        p5 = re.compile(r'^[Cc]hassis +type: +(?P<chassis>\S+)$')
+        p5 = _patterns.compile(r'^[Cc]hassis +type: +(?P<chassis>\S+)$')
 
         # Slot      Type                State                 Insert time (ago)
         # --------- ------------------- --------------------- -----------------
         # 0         ASR1000-SIP40       ok                    00:33:53
         #  0/0      SPA-1XCHSTM1/OC3    ok                    2d00h
-        p6 = re.compile(r'^(?P<slot>\w+)(\/(?P<subslot>\d+))? +(?P<name>\S+) +'
-                        r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$')
+        p6 = _patterns.compile(r'^(?P<slot>\w+)(\/(?P<subslot>\d+))? +(?P<name>\S+) +'
+                               r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$')
 
         # 4                             unknown               2d00h
-        p6_1 = re.compile(r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?)'
-                          r' +(?P<insert_time>[\w\.\:]+)$')
+        p6_1 = _patterns.compile(r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?)'
+                                 r' +(?P<insert_time>[\w\.\:]+)$')
 
         # Slot      CPLD Version        Firmware Version
         # --------- ------------------- ---------------------------------------
         # 0         00200800            16.2(1r)
-        p7 = re.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +'
-                        r'(?P<fireware_ver>[\w\.\(\)\/]+)$')
+        p7 = _patterns.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +'
+                               r'(?P<fireware_ver>[\w\.\(\)\/]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2617,14 +2621,14 @@ class ShowBoot(ShowBootSchema):
             line = line.strip()
 
             # Current Boot Variables:
-            p1 = re.compile(r'Current +Boot +Variables:$')
+            p1 = _patterns.compile(r'Current +Boot +Variables:$')
             m = p1.match(line)
             if m:
                 boot_variable = 'current'
                 continue
 
             # Boot Variables on next reload:
-            p1_2 = re.compile(r'Boot +Variables +on +next +reload:$')
+            p1_2 = _patterns.compile(r'Boot +Variables +on +next +reload:$')
             m = p1_2.match(line)
             if m:
                 boot_variable = 'next'
@@ -2635,7 +2639,7 @@ class ShowBoot(ShowBootSchema):
             #                 flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
             # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200427_012602.SSA.bin
             # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200428_021754.SSA.bin;bootflash:/cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20200429_051305.SSA_starfleet-1.bin;
-            p1_1 = re.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
+            p1_1 = _patterns.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
             m = p1_1.match(line)
             if m:
                 boot = m.groupdict()['var']
@@ -2651,7 +2655,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-            p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+            p2 = _patterns.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
             m = p2.match(line)
             if m:
                 if m.groupdict()['var']:
@@ -2662,7 +2666,7 @@ class ShowBoot(ShowBootSchema):
 
             # Configuration register is 0x2002
             # Configuration Register is 0x102
-            p3 = re.compile(r'^Configuration +[r|R]egister +is +(?P<var>\w+)$')
+            p3 = _patterns.compile(r'^Configuration +[r|R]egister +is +(?P<var>\w+)$')
             m = p3.match(line)
             if m:
                 if 'active' not in boot_dict:
@@ -2671,8 +2675,8 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Standby Configuration register is 0x2002
-            p4 = re.compile(r'^Standby +Configuration +register'
-                            ' +is +(?P<var>\w+)$')
+            p4 = _patterns.compile(r'^Standby +Configuration +register'
+                                   ' +is +(?P<var>\w+)$')
             m = p4.match(line)
             if m:
                 if 'standby' not in boot_dict:
@@ -2681,7 +2685,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Manual Boot = yes
-            p6 = re.compile(r'^Manual +Boot += +(?P<var>\w+)$')
+            p6 = _patterns.compile(r'^Manual +Boot += +(?P<var>\w+)$')
             m = p6.match(line)
             if m:
                 boot_dict['manual_boot'] = True if \
@@ -2690,7 +2694,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Enable Break = yes
-            p6 = re.compile(r'^Enable +Break += +(?P<var>\w+)$')
+            p6 = _patterns.compile(r'^Enable +Break += +(?P<var>\w+)$')
             m = p6.match(line)
             if m:
                 boot_dict['enable_break'] = True if \
@@ -2699,14 +2703,14 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Boot Mode = DEVICE
-            p6 = re.compile(r'^Boot +Mode += +(?P<var>\w+)$')
+            p6 = _patterns.compile(r'^Boot +Mode += +(?P<var>\w+)$')
             m = p6.match(line)
             if m:
                 boot_dict['boot_mode'] = m.groupdict()['var'].lower()
                 continue
 
             # iPXE Timeout = 0
-            p6 = re.compile(r'^iPXE +Timeout +=? +(?P<var>\w+)$')
+            p6 = _patterns.compile(r'^iPXE +Timeout +=? +(?P<var>\w+)$')
             m = p6.match(line)
             if m:
                 boot_dict['ipxe_timeout'] = int(m.groupdict()['var'])
@@ -2714,8 +2718,8 @@ class ShowBoot(ShowBootSchema):
 
             # BOOT path-list      : flash:/c2960x-universalk9-mz.152-4.E8.bin
             # HELPER path-list    :
-            p7 = re.compile(r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
-                            r'+(?P<value>[\w\:\/\-\.]+)?)$')
+            p7 = _patterns.compile(r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
+                                   r'+(?P<value>[\w\:\/\-\.]+)?)$')
             m7 = p7.match(line)
             if m7:
                 group = m7.groupdict()
@@ -2742,7 +2746,7 @@ class ShowBoot(ShowBootSchema):
             # Allow Dev Key         : yes
             # Auto upgrade        : no
             # Auto upgrade path   :
-            p8 = re.compile(r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$')
+            p8 = _patterns.compile(r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$')
             m8 = p8.match(line)
             if m8:
                 group = m8.groupdict()
@@ -2758,7 +2762,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # buffer size:   524288
-            p9 = re.compile(r'buffer +size\: +(?P<value>\d+)$')
+            p9 = _patterns.compile(r'buffer +size\: +(?P<value>\d+)$')
             m9 = p9.match(line)
             if m9:
                 index_dict.update({'nvram_buffer_size': int(m9.groupdict()['value'])})
@@ -2766,7 +2770,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Download:    0 seconds
-            p10 = re.compile(r'Download\: +(?P<value>\d+ +\w+)$')
+            p10 = _patterns.compile(r'Download\: +(?P<value>\d+ +\w+)$')
             m10 = p10.match(line)
             if m10:
                 index_dict.update({'timeout_config_download': m10.groupdict()['value']})
@@ -2774,8 +2778,8 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # via DHCP:       disabled (next boot: disabled)
-            p11 = re.compile(r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
-                             r'+(?P<next_boot>\w+)\)$')
+            p11 = _patterns.compile(r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
+                                    r'+(?P<next_boot>\w+)\)$')
             m11 = p11.match(line)
             if m11:
                 group = m11.groupdict()
@@ -2788,7 +2792,7 @@ class ShowBoot(ShowBootSchema):
 
             # Switch 2
             # switch 3
-            p12 = re.compile(r'^[Ss]witch +(?P<switch_number>\d+)$')
+            p12 = _patterns.compile(r'^[Ss]witch +(?P<switch_number>\d+)$')
             m12 = p12.match(line)
             if m12:
                 switch_number = int(m12.groupdict()['switch_number'])
@@ -2846,12 +2850,12 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
         # initial regexp pattern
 
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        '(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1 = _patterns.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+                               '(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +'
-                        '(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2 = _patterns.compile(r'^[Mm]ac +persistency +wait +time\: +'
+                               '(?P<mac_persistency_wait_time>[\w\.\:]+)$')
 
         #                                              H/W   Current
         # Switch#   Role    Mac Address     Priority Version  State
@@ -2859,24 +2863,24 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
         # *1       Active   689c.e2ff.b9d9     3      V04     Ready
         #  2       Standby  689c.e2ff.b9d9     14             Ready
         #  3       Member   bbcc.fcff.7b00     15     0       V-Mismatch
-        p3_0 = re.compile(r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$')
+        p3_0 = _patterns.compile(r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$')
 
-        p3_1 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                           '(?P<mac_address>[\w\.]+) +'
-                           '(?P<priority>\d+) +'
-                           '(?P<hw_ver>\w+)? +'
-                           '(?P<state>[\w\s-]+)$')
+        p3_1 = _patterns.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+                                  '(?P<mac_address>[\w\.]+) +'
+                                  '(?P<priority>\d+) +'
+                                  '(?P<hw_ver>\w+)? +'
+                                  '(?P<state>[\w\s-]+)$')
 
         #          Stack Port Status             Neighbors
         # Switch#  Port 1     Port 2           Port 1   Port 2
         #   1         OK         OK               3        2
         #   1       DOWN       DOWN             None     None
-        p4_0 = re.compile(r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$')
+        p4_0 = _patterns.compile(r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$')
 
-        p4_1 = re.compile(r'^(?P<switch>\d+) +(?P<status1>\w+) +'
-                           '(?P<status2>\w+) +'
-                           '(?P<nbr_num_1>\w+) +'
-                           '(?P<nbr_num_2>\w+)$')
+        p4_1 = _patterns.compile(r'^(?P<switch>\d+) +(?P<status1>\w+) +'
+                                  '(?P<status2>\w+) +'
+                                  '(?P<nbr_num_1>\w+) +'
+                                  '(?P<nbr_num_2>\w+)$')
 
         active_table = 0
 
@@ -3034,31 +3038,31 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>[\w\s]+)$')
+        p1 = _patterns.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>[\w\s]+)$')
 
         # Switch 1 FAN 1 direction is Front to Back
-        p1_1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s'
-                          r'+direction\s+is\s+(?P<direction>[\w\s]+)$')
+        p1_1 = _patterns.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s'
+                                 r'+direction\s+is\s+(?P<direction>[\w\s]+)$')
 
-        p1_2 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+\d+\s+(?P<state>.*)')
+        p1_2 = _patterns.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+\d+\s+(?P<state>.*)')
 
-        p2 = re.compile(r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$')
+        p2 = _patterns.compile(r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$')
 
-        p3 = re.compile(r'^Switch\s+(?P<switch>\d+):\s+SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$')
+        p3 = _patterns.compile(r'^Switch\s+(?P<switch>\d+):\s+SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$')
 
-        p4 = re.compile(r'^(?P<type>\w+)\s+Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        p4 = _patterns.compile(r'^(?P<type>\w+)\s+Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
 
-        p5 = re.compile(r'^Temperature\s+State:\s+(?P<state>\w+)$')
+        p5 = _patterns.compile(r'^Temperature\s+State:\s+(?P<state>\w+)$')
 
-        p6 = re.compile(r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        p6 = _patterns.compile(r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
 
-        p7 = re.compile(r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
-                        '((?P<pid>[\w\-]+)\s+'
-                        '(?P<serial_number>\w+)\s+)?'
-                        '(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
-                        '((?P<system_power>\w+)\s+'
-                        '(?P<poe_power>[\w\/]+)\s+'
-                        '(?P<watts>\w+))?$')
+        p7 = _patterns.compile(r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
+                               '((?P<pid>[\w\-]+)\s+'
+                               '(?P<serial_number>\w+)\s+)?'
+                               '(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
+                               '((?P<system_power>\w+)\s+'
+                               '(?P<poe_power>[\w\/]+)\s+'
+                               '(?P<watts>\w+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3185,13 +3189,13 @@ class ShowModule(ShowModuleSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<switch>\d+) *'
-                        '(?P<port>\w+) +'
-                        '(?P<model>[\w\-]+) +'
-                        '(?P<serial_number>\w+) +'
-                        '(?P<mac_address>[\w\.]+) +'
-                        '(?P<hw_ver>\w+) +'
-                        '(?P<sw_ver>[\w\.]+)$')
+        p1 = _patterns.compile(r'^(?P<switch>\d+) *'
+                               '(?P<port>\w+) +'
+                               '(?P<model>[\w\-]+) +'
+                               '(?P<serial_number>\w+) +'
+                               '(?P<mac_address>[\w\.]+) +'
+                               '(?P<hw_ver>\w+) +'
+                               '(?P<sw_ver>[\w\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3242,13 +3246,13 @@ class ShowPlatformSoftwareSlotActiveMonitorMem(ShowPlatformSoftwareSlotActiveMon
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^KiB +Mem *: +(?P<total>\d+) *total, +'
-                        '(?P<free>\d+) *free, +(?P<used>\d+) *used, +'
-                        '(?P<buff_cache>\d+) *buff\/cache$')
+        p1 = _patterns.compile(r'^KiB +Mem *: +(?P<total>\d+) *total, +'
+                               '(?P<free>\d+) *free, +(?P<used>\d+) *used, +'
+                               '(?P<buff_cache>\d+) *buff\/cache$')
 
-        p2 = re.compile(r'^KiB +Swap *: +(?P<total>\d+) *total, +'
-                        '(?P<free>\d+) *free, +(?P<used>\d+) *used. +'
-                        '(?P<available_memory>\d+) *avail +Mem$')
+        p2 = _patterns.compile(r'^KiB +Swap *: +(?P<total>\d+) *total, +'
+                               '(?P<free>\d+) *free, +(?P<used>\d+) *used. +'
+                               '(?P<available_memory>\d+) *avail +Mem$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3325,19 +3329,19 @@ class ShowPlatformSoftwareStatusControl(ShowPlatformSoftwareStatusControlSchema)
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<slot>\S+) +(?P<status>\w+) +'
-                        '(?P<min1>[\d\.]+) +(?P<min5>[\d\.]+) +(?P<min15>[\d\.]+)$')
+        p1 = _patterns.compile(r'^(?P<slot>\S+) +(?P<status>\w+) +'
+                               '(?P<min1>[\d\.]+) +(?P<min5>[\d\.]+) +(?P<min15>[\d\.]+)$')
 
-        p2 = re.compile(r'^(?P<slot>\S+) +(?P<status>\w+) +'
-                        '(?P<total>\d+) +(?P<used>\d+) +\((?P<used_percentage>[\d\s]+)\%\) +'
-                        '(?P<free>\d+) +\((?P<free_percentage>[\d\s]+)\%\) +'
-                        '(?P<committed>\d+) +\((?P<committed_percentage>[\d\s]+)\%\)$')
+        p2 = _patterns.compile(r'^(?P<slot>\S+) +(?P<status>\w+) +'
+                               '(?P<total>\d+) +(?P<used>\d+) +\((?P<used_percentage>[\d\s]+)\%\) +'
+                               '(?P<free>\d+) +\((?P<free_percentage>[\d\s]+)\%\) +'
+                               '(?P<committed>\d+) +\((?P<committed_percentage>[\d\s]+)\%\)$')
 
-        p3 = re.compile(r'^(?P<slot>\S+)? *(?P<cpu>\d+) +'
-                        '(?P<user>[\d\.]+) +(?P<system>[\d\.]+) +'
-                        '(?P<nice_process>[\d\.]+) +(?P<idle>[\d\.]+) +'
-                        '(?P<irq>[\d\.]+) +(?P<sirq>[\d\.]+) +'
-                        '(?P<waiting>[\d\.]+)$')
+        p3 = _patterns.compile(r'^(?P<slot>\S+)? *(?P<cpu>\d+) +'
+                               '(?P<user>[\d\.]+) +(?P<system>[\d\.]+) +'
+                               '(?P<nice_process>[\d\.]+) +(?P<idle>[\d\.]+) +'
+                               '(?P<irq>[\d\.]+) +(?P<sirq>[\d\.]+) +'
+                               '(?P<waiting>[\d\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3442,15 +3446,15 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
         index = 0
 
         # initial regexp pattern
-        p1 = re.compile(r'^CPU +utilization +for +five +seconds: +'
-                        '(?P<five_sec_cpu_total>\d+)\%\/(?P<five_sec_cpu_interrupts>\d+)\%;'
-                        ' +one +minute: +(?P<one_min_cpu>\d+)\%;'
-                        ' +five +minutes: +(?P<five_min_cpu>\d+)\%$')
+        p1 = _patterns.compile(r'^CPU +utilization +for +five +seconds: +'
+                               '(?P<five_sec_cpu_total>\d+)\%\/(?P<five_sec_cpu_interrupts>\d+)\%;'
+                               ' +one +minute: +(?P<one_min_cpu>\d+)\%;'
+                               ' +five +minutes: +(?P<five_min_cpu>\d+)\%$')
 
-        p2 = re.compile(r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +'
-                        '(?P<five_sec_cpu>[\d\.]+)\% +(?P<one_min_cpu>[\d\.]+)\% +'
-                        '(?P<five_min_cpu>[\d\.]+)\% +(?P<tty>\d+) +'
-                        '(?P<process>[\w\-\/\s]+)$')
+        p2 = _patterns.compile(r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +'
+                               '(?P<five_sec_cpu>[\d\.]+)\% +(?P<one_min_cpu>[\d\.]+)\% +'
+                               '(?P<five_min_cpu>[\d\.]+)\% +(?P<tty>\d+) +'
+                               '(?P<process>[\w\-\/\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3534,19 +3538,19 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
-                        ' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
-                        ' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$')
+        p1 = _patterns.compile(r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
+                               ' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
+                               ' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$')
 
-        p2 = re.compile(r'^(?P<core>[\w\s]+): +CPU +utilization +for'
-                        ' +five +seconds: +(?P<core_cpu_util_five_secs>\d\%+),'
-                        ' +one +minute: +(?P<core_cpu_util_one_min>[\d\%]+),'
-                        ' +five +minutes: +(?P<core_cpu_util_five_min>[\d\%]+)$')
+        p2 = _patterns.compile(r'^(?P<core>[\w\s]+): +CPU +utilization +for'
+                               ' +five +seconds: +(?P<core_cpu_util_five_secs>\d\%+),'
+                               ' +one +minute: +(?P<core_cpu_util_one_min>[\d\%]+),'
+                               ' +five +minutes: +(?P<core_cpu_util_five_min>[\d\%]+)$')
 
-        p3 = re.compile(r'^(?P<pid>\d+) +(?P<ppid>\d+)'
-                        ' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
-                        ' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
-                        ' +(?P<size>\d+) +(?P<name>.*)$')
+        p3 = _patterns.compile(r'^(?P<pid>\d+) +(?P<ppid>\d+)'
+                               ' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
+                               ' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
+                               ' +(?P<size>\d+) +(?P<name>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3632,15 +3636,15 @@ class ShowEnvironment(ShowEnvironmentSchema):
         # initial return dictionary
         ret_dict = {}
 
-        p1 = re.compile(r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$')
+        p1 = _patterns.compile(r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$')
 
-        p2 = re.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
+        p2 = _patterns.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
 
-        p3 = re.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
+        p3 = _patterns.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
 
-        p4 = re.compile(r'(?P<slot>\S+) +(?P<sensor_name>\S+|\w+\: +\S+(:? +\S+)?) +'
-                        r'(?P<state>Normal|Fan +Speed +\S+) +(?P<reading>\d+ +\S+'
-                        r'(:? +AC)?)(:? +\S+)?$')
+        p4 = _patterns.compile(r'(?P<slot>\S+) +(?P<sensor_name>\S+|\w+\: +\S+(:? +\S+)?) +'
+                               r'(?P<state>Normal|Fan +Speed +\S+) +(?P<reading>\d+ +\S+'
+                               r'(:? +AC)?)(:? +\S+)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3760,22 +3764,22 @@ class ShowVersionRp(ShowVersionRpSchema):
 
         # Package: rpbase, version: 03.16.04a.S.155-3.S4a-ext, status: active
         # Package: Provisioning File, version: n/a, status: active
-        p1 = re.compile(r'^Package: +(?P<package_name>[\w\d\s]+),'
-                        ' +version: +(?P<version>[\w\d\.\-\/]+),'
-                        ' +status: +(?P<status>[\w\/]+)$')
+        p1 = _patterns.compile(r'^Package: +(?P<package_name>[\w\d\s]+),'
+                               ' +version: +(?P<version>[\w\d\.\-\/]+),'
+                               ' +status: +(?P<status>[\w\/]+)$')
 
         #   File: consolidated:asr1000rp2-rpbase.03.16.04a.S.155-3.S4a-ext.pkg, on: RP0
-        p2 = re.compile(r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
-                        ' +on: +(?P<rp_slot>[\w\d\/]+)$')
+        p2 = _patterns.compile(r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
+                               ' +on: +(?P<rp_slot>[\w\d\/]+)$')
 
         # Built: 2016-10-04_12.28, by: mcpre
         # Built: n/a, by: n/a
-        p3 = re.compile(r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
-                        ' +by: +(?P<built_by>[\w\d\/]+)$')
+        p3 = _patterns.compile(r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
+                               ' +by: +(?P<built_by>[\w\d\/]+)$')
 
         #   File SHA1 checksum: 79e234871520fd480dc1128058160b4e2acee9f7
-        p4 = re.compile(r'^File +SHA1 +checksum:'
-                        ' +(?P<file_sha1_checksum>[\w\d]+)$')
+        p4 = _patterns.compile(r'^File +SHA1 +checksum:'
+                               ' +(?P<file_sha1_checksum>[\w\d]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3919,82 +3923,82 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
         # Interface: BG4048.10207e1 QFP: 0.0 if_h: 4079 Num Queues/Schedules: 0
         # Interface: VPLS-2944.10207e2 QFP: 0.0 if_h: 4080 Num Queues/Schedules:
         # Interface: internal0/0/recycle:0 QFP: 0.0 if_h: 1 Num Queues/Schedules: 0
-        p1 = re.compile(r'^Interface: +(?P<intf_name>[\w\d\/\.\-\:]+)'
-                        ' +QFP: +(?P<qfp>[\d\.]+)'
-                        ' +if_h: +(?P<if_h>\d+)'
-                        ' +Num Queues/Schedules: +(?P<num_queues>\d+)$')
+        p1 = _patterns.compile(r'^Interface: +(?P<intf_name>[\w\d\/\.\-\:]+)'
+                               ' +QFP: +(?P<qfp>[\d\.]+)'
+                               ' +if_h: +(?P<if_h>\d+)'
+                               ' +Num Queues/Schedules: +(?P<num_queues>\d+)$')
 
         #     Index 0 (Queue ID:0xa6, Name: GigabitEthernet1/0/7)
-        p2 = re.compile(r'^Index +(?P<index>\d+)'
-                        ' +\(Queue +ID:(?P<queue_id>[\w\d]+),'
-                        ' +Name: +(?P<interf_name>[\w\d\/\.\-\:]+)\)$')
+        p2 = _patterns.compile(r'^Index +(?P<index>\d+)'
+                               ' +\(Queue +ID:(?P<queue_id>[\w\d]+),'
+                               ' +Name: +(?P<interf_name>[\w\d\/\.\-\:]+)\)$')
 
         #       Software Control Info:
         #  PARQ Software Control Info:
-        p3_1 = re.compile(r'^(PARQ +)?Software Control Info:$')
+        p3_1 = _patterns.compile(r'^(PARQ +)?Software Control Info:$')
 
         #  (cache) queue id: 0x000000a6, wred: 0x88b16ac2, qlimit (bytes): 3281312
         #  (cache) queue id: 0x00000070, wred: 0xe73cfde0, qlimit (pkts ): 418
-        p3_2 = re.compile(r'^\(cache\) +queue +id: +(?P<cache_queue_id>[\w\d]+),'
-                          ' +wred: +(?P<wred>[\w\d]+),'
-                          ' +qlimit +\((?P<type>bytes|pkts +)\): +(?P<qlimit>\d+)$')
+        p3_2 = _patterns.compile(r'^\(cache\) +queue +id: +(?P<cache_queue_id>[\w\d]+),'
+                                 ' +wred: +(?P<wred>[\w\d]+),'
+                                 ' +qlimit +\((?P<type>bytes|pkts +)\): +(?P<qlimit>\d+)$')
 
         #       parent_sid: 0x284, debug_name: GigabitEthernet1/0/7
-        p4 = re.compile(r'^parent_sid: +(?P<parent_sid>[\w\d]+),'
-                        ' debug_name: +(?P<debug_name>[\w\d\/\.\-\:]+)$')
+        p4 = _patterns.compile(r'^parent_sid: +(?P<parent_sid>[\w\d]+),'
+                               ' debug_name: +(?P<debug_name>[\w\d\/\.\-\:]+)$')
 
         #       sw_flags: 0x08000011, sw_state: 0x00000c01, port_uidb: 245728
-        p5 = re.compile(r'^sw_flags: +(?P<sw_flags>[\w\d]+),'
-                        ' +sw_state: +(?P<sw_state>[\w\d]+),'
-                        ' +port_uidb: +(?P<port_uidb>\d+)$')
+        p5 = _patterns.compile(r'^sw_flags: +(?P<sw_flags>[\w\d]+),'
+                               ' +sw_state: +(?P<sw_state>[\w\d]+),'
+                               ' +port_uidb: +(?P<port_uidb>\d+)$')
 
         #       orig_min  : 0                   ,      min: 105000000
-        p6 = re.compile(r'^orig_min +: +(?P<orig_min>\d+) +,'
-                        ' +min: +(?P<min>\d+)$')
+        p6 = _patterns.compile(r'^orig_min +: +(?P<orig_min>\d+) +,'
+                               ' +min: +(?P<min>\d+)$')
 
         #       min_qos   : 0                   , min_dflt: 0
-        p7 = re.compile(r'^min_qos +: +(?P<min_qos>\d+) +,'
-                        ' +min_dflt: +(?P<min_dflt>\d+)$')
+        p7 = _patterns.compile(r'^min_qos +: +(?P<min_qos>\d+) +,'
+                               ' +min_dflt: +(?P<min_dflt>\d+)$')
 
         #       orig_max  : 0                   ,      max: 0
-        p8 = re.compile(r'^orig_max +: +(?P<orig_max>\d+) +,'
-                        ' +max: +(?P<max>\d+)$')
+        p8 = _patterns.compile(r'^orig_max +: +(?P<orig_max>\d+) +,'
+                               ' +max: +(?P<max>\d+)$')
 
         #       max_qos   : 0                   , max_dflt: 0
-        p9 = re.compile(r'^max_qos +: +(?P<max_qos>\d+) +,'
-                        ' +max_dflt: +(?P<max_dflt>\d+)$')
+        p9 = _patterns.compile(r'^max_qos +: +(?P<max_qos>\d+) +,'
+                               ' +max_dflt: +(?P<max_dflt>\d+)$')
 
         #       share     : 1
-        p10 = re.compile(r'^share +: +(?P<share>\d+)$')
+        p10 = _patterns.compile(r'^share +: +(?P<share>\d+)$')
 
         #       plevel    : 0, priority: 65535
-        p11 = re.compile(r'^plevel +: +(?P<plevel>\d+),'
-                         ' +priority: +(?P<priority>\d+)$')
+        p11 = _patterns.compile(r'^plevel +: +(?P<plevel>\d+),'
+                                ' +priority: +(?P<priority>\d+)$')
 
         #       defer_obj_refcnt: 0
         #   defer_obj_refcnt: 0, cp_ppe_addr: 0x00000000
-        p12 = re.compile(r'^defer_obj_refcnt: +(?P<defer_obj_refcnt>\d+)'
-                         r'(, +cp_ppe_addr: +(?P<cp_ppe_addr>\w+))?$')
+        p12 = _patterns.compile(r'^defer_obj_refcnt: +(?P<defer_obj_refcnt>\d+)'
+                                r'(, +cp_ppe_addr: +(?P<cp_ppe_addr>\w+))?$')
 
         #     Statistics:
-        p13_1 = re.compile(r'^Statistics:$')
+        p13_1 = _patterns.compile(r'^Statistics:$')
 
         #       tail drops  (bytes): 0                   ,          (packets): 0
-        p13_2 = re.compile(r'^tail +drops +\(bytes\): +(?P<tail_drops_bytes>\d+) +,'
-                           ' +\(packets\): +(?P<tail_drops_packets>\d+)$')
+        p13_2 = _patterns.compile(r'^tail +drops +\(bytes\): +(?P<tail_drops_bytes>\d+) +,'
+                                  ' +\(packets\): +(?P<tail_drops_packets>\d+)$')
 
         #       total enqs  (bytes): 0                   ,          (packets): 0
-        p14 = re.compile(r'^total +enqs +\(bytes\): +(?P<total_enqs_bytes>\d+) +,'
-                         ' +\(packets\): +(?P<total_enqs_packets>\d+)$')
+        p14 = _patterns.compile(r'^total +enqs +\(bytes\): +(?P<total_enqs_bytes>\d+) +,'
+                                ' +\(packets\): +(?P<total_enqs_packets>\d+)$')
 
         #       queue_depth (bytes): 0
         #       queue_depth (pkts ): 0
-        p15 = re.compile(r'^queue_depth +\((?P<type>bytes|pkts +)\): +(?P<queue_depth>\d+)$')
+        p15 = _patterns.compile(r'^queue_depth +\((?P<type>bytes|pkts +)\): +(?P<queue_depth>\d+)$')
 
         #       licensed throughput oversubscription drops:
         #                   (bytes): 0                   ,          (packets): 0
-        p16 = re.compile(r'^\(bytes\): +(?P<lic_throughput_oversub_drops_bytes>\d+) +,'
-                         ' +\(packets\): +(?P<lic_throughput_oversub_drops_packets>\d+)$')
+        p16 = _patterns.compile(r'^\(bytes\): +(?P<lic_throughput_oversub_drops_bytes>\d+) +,'
+                                ' +\(packets\): +(?P<lic_throughput_oversub_drops_packets>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4254,87 +4258,87 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
         ret_dict = {}
 
         # Interface 0/0/0
-        p1 = re.compile(r'^Interface +(?P<port>[\d\/]+)$')
+        p1 = _patterns.compile(r'^Interface +(?P<port>[\d\/]+)$')
 
         #   RX Low Priority
         #   RX High Priority
-        p2 = re.compile(r'^RX +(?P<direction>\w+) +Priority$')
+        p2 = _patterns.compile(r'^RX +(?P<direction>\w+) +Priority$')
 
         #     RX Pkts      369         Bytes 27789
-        p3 = re.compile(r'^RX +Pkts +(?P<rx_total_pkts>\d+) +Bytes +(?P<rx_total_bytes>\d+)$')
+        p3 = _patterns.compile(r'^RX +Pkts +(?P<rx_total_pkts>\d+) +Bytes +(?P<rx_total_bytes>\d+)$')
 
         #     RX Drop Pkts 0           Bytes 0
-        p4 = re.compile(r'^RX +Drop +Pkts +(?P<rx_dropped_pkts>\d+) +Bytes +(?P<rx_dropped_bytes>\d+)$')
+        p4 = _patterns.compile(r'^RX +Drop +Pkts +(?P<rx_dropped_pkts>\d+) +Bytes +(?P<rx_dropped_bytes>\d+)$')
 
         #     RX Err  Pkts 0           Bytes 0
-        p5 = re.compile(r'^RX +Err +Pkts +(?P<rx_errored_pkts>\d+) +Bytes +(?P<rx_errored_bytes>\d+)$')
+        p5 = _patterns.compile(r'^RX +Err +Pkts +(?P<rx_errored_pkts>\d+) +Bytes +(?P<rx_errored_bytes>\d+)$')
 
         #   TX Low Priority
         #   TX High Priority
-        p6 = re.compile(r'^TX +(?P<direction>\w+) +Priority$')
+        p6 = _patterns.compile(r'^TX +(?P<direction>\w+) +Priority$')
 
         #     TX Pkts      1265574622  Bytes 250735325722
-        p7 = re.compile(r'^TX +Pkts +(?P<tx_total_pkts>\d+) +Bytes +(?P<tx_total_bytes>\d+)$')
+        p7 = _patterns.compile(r'^TX +Pkts +(?P<tx_total_pkts>\d+) +Bytes +(?P<tx_total_bytes>\d+)$')
 
         #     TX Drop Pkts 0           Bytes 0
-        p8 = re.compile(r'^TX +Drop +Pkts +(?P<tx_dropped_pkts>\d+) +Bytes +(?P<tx_dropped_bytes>\d+)$')
+        p8 = _patterns.compile(r'^TX +Drop +Pkts +(?P<tx_dropped_pkts>\d+) +Bytes +(?P<tx_dropped_bytes>\d+)$')
 
         # 0/3, SPA-1XTENGE-XFP-V2, Online
-        p9 = re.compile(r'^(?P<slot>\d+)/(?P<subslot>\d+),'
-                        ' +(?P<name>[\w\d\-]+),'
-                        ' +(?P<status>\w+)$')
+        p9 = _patterns.compile(r'^(?P<slot>\d+)/(?P<subslot>\d+),'
+                               ' +(?P<name>[\w\d\-]+),'
+                               ' +(?P<status>\w+)$')
 
         #   RX IPC Pkts 0           Bytes 0
-        p10 = re.compile(r'^RX +IPC +Pkts +(?P<rx_ipc_pkts>\d+) +Bytes +(?P<rx_ipc_bytes>\d+)$')
+        p10 = _patterns.compile(r'^RX +IPC +Pkts +(?P<rx_ipc_pkts>\d+) +Bytes +(?P<rx_ipc_bytes>\d+)$')
 
         #   TX IPC Pkts 0           Bytes 0
-        p11 = re.compile(r'^TX +IPC +Pkts +(?P<tx_ipc_pkts>\d+) +Bytes +(?P<tx_ipc_bytes>\d+)$')
+        p11 = _patterns.compile(r'^TX +IPC +Pkts +(?P<tx_ipc_pkts>\d+) +Bytes +(?P<tx_ipc_bytes>\d+)$')
 
         #   RX IPC Err 0
-        p12 = re.compile(r'^RX +IPC +Err +(?P<rx_ipc_err>\d+)$')
+        p12 = _patterns.compile(r'^RX +IPC +Err +(?P<rx_ipc_err>\d+)$')
 
         #   TX IPC Err 0
-        p13 = re.compile(r'^TX +IPC +Err +(?P<tx_ipc_err>\d+)$')
+        p13 = _patterns.compile(r'^TX +IPC +Err +(?P<tx_ipc_err>\d+)$')
 
         #   RX Spi4 Interrupt Counters
         #   TX Spi4 Interrupt Counters
-        p14 = re.compile(r'^(?P<tx_rx>\w+) +Spi4 +Interrupt +Counters$')
+        p14 = _patterns.compile(r'^(?P<tx_rx>\w+) +Spi4 +Interrupt +Counters$')
 
         #     Out Of Frame 0
-        p15 = re.compile(r'^Out +Of +Frame +(?P<out_of_frame>\d+)$')
+        p15 = _patterns.compile(r'^Out +Of +Frame +(?P<out_of_frame>\d+)$')
 
         #     Dip4 Error 0
-        p16 = re.compile(r'^Dip4 +Error +(?P<rx_dip4_error>\d+)$')
+        p16 = _patterns.compile(r'^Dip4 +Error +(?P<rx_dip4_error>\d+)$')
 
         #     Disabled 0
-        p17 = re.compile(r'^Disabled +(?P<rx_disbaled>\d+)$')
+        p17 = _patterns.compile(r'^Disabled +(?P<rx_disbaled>\d+)$')
 
         #     Loss Of Sync 0
-        p18 = re.compile(r'^Loss +Of +Sync +(?P<rx_loss_of_sync>\d+)$')
+        p18 = _patterns.compile(r'^Loss +Of +Sync +(?P<rx_loss_of_sync>\d+)$')
 
         #     Sequence Error 0
-        p19 = re.compile(r'^Sequence +Error +(?P<rx_sequence_error>\d+)$')
+        p19 = _patterns.compile(r'^Sequence +Error +(?P<rx_sequence_error>\d+)$')
 
         #     Burst Error 0
-        p20 = re.compile(r'^Burst +Error +(?P<rx_burst_error>\d+)$')
+        p20 = _patterns.compile(r'^Burst +Error +(?P<rx_burst_error>\d+)$')
 
         #     EOP Abort 0
-        p21 = re.compile(r'^EOP +Abort +(?P<rx_eop_abort>\d+)$')
+        p21 = _patterns.compile(r'^EOP +Abort +(?P<rx_eop_abort>\d+)$')
 
         #     Packet Gap Error 0
-        p22 = re.compile(r'^Packet +Gap +Error +(?P<rx_packet_gap_error>\d+)$')
+        p22 = _patterns.compile(r'^Packet +Gap +Error +(?P<rx_packet_gap_error>\d+)$')
 
         #     Control Word Error 0
-        p23 = re.compile(r'^Control +Word +Error +(?P<rx_control_word_error>\d+)$')
+        p23 = _patterns.compile(r'^Control +Word +Error +(?P<rx_control_word_error>\d+)$')
 
         #     Frame Error 0
-        p24 = re.compile(r'^Frame +Error +(?P<tx_frame_error>\d+)$')
+        p24 = _patterns.compile(r'^Frame +Error +(?P<tx_frame_error>\d+)$')
 
         #     FIFO Over Flow 0
-        p25 = re.compile(r'^FIFO +Over +Flow +(?P<tx_fifo_over_flow>\d+)$')
+        p25 = _patterns.compile(r'^FIFO +Over +Flow +(?P<tx_fifo_over_flow>\d+)$')
 
         #     Dip2 Error 0
-        p26 = re.compile(r'^Dip2 +Error +(?P<tx_dip2_error>\d+)$')
+        p26 = _patterns.compile(r'^Dip2 +Error +(?P<tx_dip2_error>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4599,11 +4603,11 @@ class ShowPlatformHardwareQfpBqsOpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 38       HighNormal                    GPM             7
         # 55*      Drain Low                     GPM             0
         # * - indicates the drain mode bit is set for this channel
-        p1 = re.compile(r'^(?P<number>\d+)(?P<drained>\*)? +(?P<name>[\w\-\s]+)'
-                        ' +(?P<interface>[\w\d]+) +(?P<logical_channel>\d+)$')
+        p1 = _patterns.compile(r'^(?P<number>\d+)(?P<drained>\*)? +(?P<name>[\w\-\s]+)'
+                               ' +(?P<interface>[\w\d]+) +(?P<logical_channel>\d+)$')
 
         # 32       Unmapped
-        p2 = re.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
+        p2 = _patterns.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4662,12 +4666,12 @@ class ShowPlatformHardwareQfpBqsIpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 15     Nitrox Low          SPI0          14        1
         # 17     HT Pkt Low          HT             0        1
         # 21     CC4 Low             SPI0          16        1
-        p1 = re.compile(r'^(?P<number>\d+) +(?P<name>[\w\-\s]+)'
-                        ' +(?P<interface>[\w\d]+) +(?P<port>\d+)'
-                        ' +(?P<cfifo>\d+)$')
+        p1 = _patterns.compile(r'^(?P<number>\d+) +(?P<name>[\w\-\s]+)'
+                               ' +(?P<interface>[\w\d]+) +(?P<port>\d+)'
+                               ' +(?P<cfifo>\d+)$')
 
         # 32       Unmapped
-        p2 = re.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
+        p2 = _patterns.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4788,22 +4792,22 @@ class ShowPlatformHardwareSerdes(ShowPlatformHardwareSerdesSchema):
         ret_dict = {}
 
         # From Slot 1-Link B
-        p1 = re.compile(r'^From +Slot +(?P<link>[\w\d\-\s]+)$')
+        p1 = _patterns.compile(r'^From +Slot +(?P<link>[\w\d\-\s]+)$')
 
         #   Pkts  High: 0          Low: 0          Bad: 0          Dropped: 0
-        p2 = re.compile(r'^Pkts +High: +(?P<high>\d+) +Low: +(?P<low>\d+)( +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+))?$')
+        p2 = _patterns.compile(r'^Pkts +High: +(?P<high>\d+) +Low: +(?P<low>\d+)( +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+))?$')
 
         #   Bytes High: 0          Low: 0          Bad: 0          Dropped: 0
-        p3 = re.compile(r'^Bytes +High: +(?P<high>\d+) +Low: +(?P<low>\d+) +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+)$')
+        p3 = _patterns.compile(r'^Bytes +High: +(?P<high>\d+) +Low: +(?P<low>\d+) +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+)$')
 
         #   Pkts  Looped: 0          Error: 0
-        p4 = re.compile(r'^Pkts +Looped: +(?P<looped>\d+) +Error: +(?P<errored>\d+)$')
+        p4 = _patterns.compile(r'^Pkts +Looped: +(?P<looped>\d+) +Error: +(?P<errored>\d+)$')
 
         #   Bytes Looped 0
-        p5 = re.compile(r'^Bytes +Looped +(?P<looped>\d+)$')
+        p5 = _patterns.compile(r'^Bytes +Looped +(?P<looped>\d+)$')
 
         #   Qstat count: 0          Flow ctrl count: 3501
-        p6 = re.compile(r'^Qstat +count: +(?P<qstat_count>\d+) +Flow +ctrl +count: +(?P<flow_ctrl_count>\d+)$')
+        p6 = _patterns.compile(r'^Qstat +count: +(?P<qstat_count>\d+) +Flow +ctrl +count: +(?P<flow_ctrl_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4873,45 +4877,45 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
 
         # Network-Processor-0 Link:
         # RP/ESP Link:
-        p1 = re.compile(r'^(?P<link>[\w\d\-\s/]+) +Link:$')
+        p1 = _patterns.compile(r'^(?P<link>[\w\d\-\s/]+) +Link:$')
 
         #   Local TX in sync, Local RX in sync
-        p2 = re.compile(r'^Local +TX +in +sync, +Local +RX +in +sync$')
+        p2 = _patterns.compile(r'^Local +TX +in +sync, +Local +RX +in +sync$')
 
         #   Remote TX in sync, Remote RX in sync
-        p3 = re.compile(r'^Remote +TX +in +sync, +Remote +RX +in +sync$')
+        p3 = _patterns.compile(r'^Remote +TX +in +sync, +Remote +RX +in +sync$')
 
         #   To Network-Processor       Packets:    21763844  Bytes:  7343838083
         #   To Encryption Processor   Packets:           0  Bytes:           0
         #   To RP/ESP Packets: 1150522 Bytes: 166031138
-        p4 = re.compile(r'^To +(?P<link_name_1>[\w\-\d\s/]+) +Packets: +(?P<to_packets>\d+) +Bytes: +(?P<to_bytes>\d+)$')
+        p4 = _patterns.compile(r'^To +(?P<link_name_1>[\w\-\d\s/]+) +Packets: +(?P<to_packets>\d+) +Bytes: +(?P<to_bytes>\d+)$')
 
         #   From Network-Processor     Packets:    21259012  Bytes:  7397920802
         #   From RP/ESP Packets: 4364008 Bytes: 697982854
-        p5 = re.compile(r'^From +(?P<link_name_2>[\w\-\d\s/]+) +Packets: +(?P<from_packets>\d+) +Bytes: +(?P<from_bytes>\d+)$')
+        p5 = _patterns.compile(r'^From +(?P<link_name_2>[\w\-\d\s/]+) +Packets: +(?P<from_packets>\d+) +Bytes: +(?P<from_bytes>\d+)$')
 
         #     Drops                   Packets:           0  Bytes:           0
-        p6 = re.compile(r'^Drops +Packets: +(?P<dropped_packets>\d+) +Bytes: +(?P<dropped_bytes>\d+)$')
+        p6 = _patterns.compile(r'^Drops +Packets: +(?P<dropped_packets>\d+) +Bytes: +(?P<dropped_bytes>\d+)$')
 
         #     Errors                  Packets:           0  Bytes:           0
-        p7 = re.compile(r'^Errors +Packets: +(?P<errored_packets>\d+) +Bytes: +(?P<errored_bytes>\d+)$')
+        p7 = _patterns.compile(r'^Errors +Packets: +(?P<errored_packets>\d+) +Bytes: +(?P<errored_bytes>\d+)$')
 
         #     Errors:
-        p8 = re.compile(r'^Errors:$')
+        p8 = _patterns.compile(r'^Errors:$')
 
         #     RX/TX process: 0/0, RX/TX schedule: 0/0
-        p9 = re.compile(r'^RX/TX +process: +(?P<rx_process>\d+)/(?P<tx_process>\d+), +RX/TX +schedule: +(?P<rx_schedule>\d+)/(?P<tx_schedule>\d+)$')
+        p9 = _patterns.compile(r'^RX/TX +process: +(?P<rx_process>\d+)/(?P<tx_process>\d+), +RX/TX +schedule: +(?P<rx_schedule>\d+)/(?P<tx_schedule>\d+)$')
 
         #     RX/TX statistics: 0/0, RX parity: 0
-        p10 = re.compile(r'^RX/TX +statistics: +(?P<rx_statistics>\d+)/(?P<tx_statistics>\d+), +RX +parity: +(?P<rx_parity>\d+)$')
+        p10 = _patterns.compile(r'^RX/TX +statistics: +(?P<rx_statistics>\d+)/(?P<tx_statistics>\d+), +RX +parity: +(?P<rx_parity>\d+)$')
 
         # Serdes Exception Counts:
-        p11 = re.compile(r'^Serdes +Exception +Counts:$')
+        p11 = _patterns.compile(r'^Serdes +Exception +Counts:$')
 
         #   eqs/fc:
         #   idh-hi:
         #   spi link:
-        p12 = re.compile(r'^(?P<link>[\w\d\-\s\/]+):$')
+        p12 = _patterns.compile(r'^(?P<link>[\w\d\-\s\/]+):$')
 
         #     link 0: msgTypeError: 5
         #     link 0: msgEccError: 5
@@ -4922,7 +4926,7 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
         #     link 2: msgTypeError: 3
         #     link 2: msgEccError: 3
         #     link 2: chicoEvent: 3
-        p13 = re.compile(r'^link +(?P<link_number>\d+): +(?P<error_event>\w+): +(?P<count>\d+)$')
+        p13 = _patterns.compile(r'^link +(?P<link_number>\d+): +(?P<error_event>\w+): +(?P<count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5074,47 +5078,47 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
         ret_dict = {}
 
         # Chassis type: ASR1006-X
-        p1 = re.compile(r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)')
+        p1 = _patterns.compile(r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)')
 
         # Power Redundancy Mode: nplus1
-        p2 = re.compile(r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)')
+        p2 = _patterns.compile(r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)')
 
         # Power Allocation Status: Sufficient
-        p3 = re.compile(r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)')
+        p3 = _patterns.compile(r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)')
 
         # Slot      Type                State                 Allocation(W)
         # 0         ASR1000-SIP40       ok                    64
         #  0/0      SPA-8X1GE-V2        inserted              14
         #  0/1      SPA-1X10GE-L-V2     inserted              17.40
-        p4 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
-                        '+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$')
+        p4 = _patterns.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
+                               '+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$')
 
         # Slot      Type                State                 Capacity (W) Load (W)
         # P0        ASR1000X-AC-1100W   ok                    1100         132
-        p5 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
-                        '+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)')
+        p5 = _patterns.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
+                               '+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)')
 
         # Total load: 696 W, total capacity: 4400 W. Load / Capacity is 15%
-        p6 = re.compile(r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
-                        ' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$')
+        p6 = _patterns.compile(r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
+                               ' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$')
 
         # Power capacity:       4400 W
-        p7 = re.compile(r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$')
+        p7 = _patterns.compile(r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$')
 
         # Redundant allocation: 0 W
-        p8 = re.compile(r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$')
+        p8 = _patterns.compile(r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$')
 
         # Fan allocation:       250 W
-        p9 = re.compile(r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$')
+        p9 = _patterns.compile(r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$')
 
         # FRU allocation:       949 W
-        p10 = re.compile(r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$')
+        p10 = _patterns.compile(r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$')
 
         # Excess Power in Reserve:   3201 W
-        p11 = re.compile(r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$')
+        p11 = _patterns.compile(r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$')
 
         # Excess / (Capacity - Redundant) is 72%
-        p12 = re.compile(r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$')
+        p12 = _patterns.compile(r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5241,12 +5245,12 @@ class ShowPlatformHardwareQfpBqsStatisticsChannelAll(ShowPlatformHardwareQfpBqsS
         # Chan   GoodPkts  GoodBytes    BadPkts   BadBytes
         # 1 - 0000000000 0000000000 0000000000 0000000000
         # 2 - 0000c40f64 016a5004b0 0000000000 0000000000
-        p1 = re.compile(r'^(?P<channel>\d+) +- +(?P<goodpkts>\w+) +(?P<goodbytes>\w+) +(?P<badpkts>\w+) +(?P<badbytes>\w+)$')
+        p1 = _patterns.compile(r'^(?P<channel>\d+) +- +(?P<goodpkts>\w+) +(?P<goodbytes>\w+) +(?P<badpkts>\w+) +(?P<badbytes>\w+)$')
 
         #  0-55: OPM Channels
         # 56-59: Metapacket/Recycle Pools 0-3
         #    60: Reassembled Packets Sent to QED
-        p2 = re.compile(r'^(?P<channel>\d+)-?(?P<end_channel>\d+)?: +(?P<comment>.+)$')
+        p2 = _patterns.compile(r'^(?P<channel>\d+)-?(?P<end_channel>\d+)?: +(?P<comment>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5320,11 +5324,11 @@ class ShowPlatformHardwareQfpBqsOpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 38       HighNormal                    GPM             7
         # 55*      Drain Low                     GPM             0
         # * - indicates the drain mode bit is set for this channel
-        p1 = re.compile(r'^(?P<number>\d+)(?P<drained>\*)? +(?P<name>[\w\-\s]+)'
-                        ' +(?P<interface>[\w\d]+) +(?P<logical_channel>\d+)$')
+        p1 = _patterns.compile(r'^(?P<number>\d+)(?P<drained>\*)? +(?P<name>[\w\-\s]+)'
+                               ' +(?P<interface>[\w\d]+) +(?P<logical_channel>\d+)$')
 
         # 32       Unmapped
-        p2 = re.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
+        p2 = _patterns.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5383,12 +5387,12 @@ class ShowPlatformHardwareQfpBqsIpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 15     Nitrox Low          SPI0          14        1
         # 17     HT Pkt Low          HT             0        1
         # 21     CC4 Low             SPI0          16        1
-        p1 = re.compile(r'^(?P<number>\d+) +(?P<name>[\w\-\s]+)'
-                        ' +(?P<interface>[\w\d]+) +(?P<port>\d+)'
-                        ' +(?P<cfifo>\d+)$')
+        p1 = _patterns.compile(r'^(?P<number>\d+) +(?P<name>[\w\-\s]+)'
+                               ' +(?P<interface>[\w\d]+) +(?P<port>\d+)'
+                               ' +(?P<cfifo>\d+)$')
 
         # 32       Unmapped
-        p2 = re.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
+        p2 = _patterns.compile(r'^(?P<unmapped_number>\d+) +Unmapped$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5478,17 +5482,17 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatistics(ShowPlatformHardwareQfpIn
         final_dict = {}
 
         # Platform Handle 7
-        p1 = re.compile(r'^Platform +Handle +(?P<platform_handle>\d+)$')
+        p1 = _patterns.compile(r'^Platform +Handle +(?P<platform_handle>\d+)$')
 
         # Receive Stats                             Packets        Octets
         # Transmit Stats                            Packets        Octets
         # Input Drop Stats                          Packets        Octets
         # Output Drop Stats                         Packets        Octets
-        p2 = re.compile(r'^(?P<transmit_receive>[\w\s]+) +Stats +Packets +Octets$')
+        p2 = _patterns.compile(r'^(?P<transmit_receive>[\w\s]+) +Stats +Packets +Octets$')
 
         #   FragmentedIpv6                             0               0
         #   Other
-        p3 = re.compile(r'^(?P<stats>[\w\d]+) +(?P<packets>[\w\d]+) +(?P<octets>[\w\d]+)$')
+        p3 = _patterns.compile(r'^(?P<stats>[\w\d]+) +(?P<packets>[\w\d]+) +(?P<octets>[\w\d]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5570,7 +5574,7 @@ class ShowPlatformHardwareQfpStatisticsDrop(ShowPlatformHardwareQfpStatisticsDro
         # -------------------------------------------------------------------------
         # Ipv4NoAdj                                       7                     296
         # Ipv4NoRoute                                   181                    7964
-        p1 = re.compile(r'^(?P<global_drop_stats>\w+) +(?P<packets>\d+) +(?P<octets>\d+)$')
+        p1 = _patterns.compile(r'^(?P<global_drop_stats>\w+) +(?P<packets>\d+) +(?P<octets>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5625,17 +5629,17 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
 
         #           888886666611111                    11111
         # 7777755555996510966664444466666333335555544444666667777777777
-        p1 = re.compile(r'^ *\d+( +\d+)* *$')
+        p1 = _patterns.compile(r'^ *\d+( +\d+)* *$')
 
         #          0    5    0    5    0    5    0    5    0    5    0
-        p2 = re.compile(r'^ *0( +5 +0){5,6} *$')
+        p2 = _patterns.compile(r'^ *0( +5 +0){5,6} *$')
 
         # 80     * **#*#**   * *       *
         # 70  *  * **#*#**   * *       *           *
-        p3 = re.compile(r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)')
+        p3 = _patterns.compile(r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)')
 
         # CPU% per second (last 60 seconds)
-        p4 = re.compile(r'^ *CPU%.*$')
+        p4 = _patterns.compile(r'^ *CPU%.*$')
 
         # initialize max list & average list & return dictionary
         max_list = []
@@ -5771,22 +5775,22 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
             out = output
 
         # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p1 = _patterns.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
+                               r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p2 = _patterns.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+                               r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p3 = _patterns.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+                               r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # 0   0  678985440  347855496  304892096        428    2134314 *Init*
         # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p4 = _patterns.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+                               r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+                               r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5865,12 +5869,12 @@ class ShowPlatformSoftwareMemoryCallsite(ShowPlatformSoftwareMemoryCallsiteSchem
             callsite_dict = parsed_dict.setdefault('callsites', {})
 
         # The current tracekey is   : 1#2315ece11e07bc883d89421df58e37b6
-        p1 = re.compile(r'The +current +tracekey +is\s*: +(?P<tracekey>[#\d\w]*)')
+        p1 = _patterns.compile(r'The +current +tracekey +is\s*: +(?P<tracekey>[#\d\w]*)')
 
         # callsite      thread    diff_byte               diff_call
         # ----------------------------------------------------------
         # 1617611779    31884     57424                   2
-        p2 = re.compile(r'(?P<callsite>(\d+))\s+(?P<thread>(\d+))\s+(?P<diffbyte>(\d+))\s+(?P<diffcall>(\d+))')
+        p2 = _patterns.compile(r'(?P<callsite>(\d+))\s+(?P<thread>(\d+))\s+(?P<diffbyte>(\d+))\s+(?P<diffcall>(\d+))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5930,13 +5934,13 @@ class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSch
             backtraces_dict = parsed_dict.setdefault('backtraces', {})
 
         # backtrace: 1#2315ece11e07bc883d89421df58e37b6   maroon:7F740DEDC000+61F6 tdllib:7F7474D05000+B2B46 ui:7F74770E4000+4639A ui:7F74770E4000+4718C cdlcore:7F7466A6B000+37C95 cdlcore:7F7466A6B000+37957 uipeer:7F747A7A8000+24F2A evutil:7F747864E000+7966 evutil:7F747864E000+7745
-        p1 = re.compile(r'backtrace: (?P<backtrace>[\w#\d\s:+]+)$')
+        p1 = _patterns.compile(r'backtrace: (?P<backtrace>[\w#\d\s:+]+)$')
 
         #   callsite: 2150603778, thread_id: 31884
-        p2 = re.compile(r'callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)')
+        p2 = _patterns.compile(r'callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)')
 
         #   allocs: 1, frees: 0, call_diff: 1
-        p3 = re.compile(r'allocs: +(?P<allocs>(\d+)), +frees: +(?P<frees>(\d+)), +call_diff: +(?P<call_diff>(\d+))')
+        p3 = _patterns.compile(r'allocs: +(?P<allocs>(\d+)), +frees: +(?P<frees>(\d+)), +call_diff: +(?P<call_diff>(\d+))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6030,22 +6034,22 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
             per_process_memory_dict = ret_dict.setdefault('per_process_memory', OrderedDict())
 
         # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p1 = _patterns.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
+                               r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p2 = _patterns.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+                               r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p3 = _patterns.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+                               r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # 0   0  678985440  347855496  304892096        428    2134314 *Init*
         # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p4 = _patterns.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+                               r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+                               r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6126,29 +6130,29 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
         ret_dict = {}
 
         # Platform: C9300-24U
-        p1 = re.compile(r'^Platform: +(?P<platform>\S+)$')
+        p1 = _patterns.compile(r'^Platform: +(?P<platform>\S+)$')
         # Boot 0 Version: F01144R16.216e68ad62019-02-13
-        p2 = re.compile(r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$')
+        p2 = _patterns.compile(r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$')
         # Boot 0 Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p3 = re.compile(r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$')
+        p3 = _patterns.compile(r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$')
         # Boot Loader Version: System Bootstrap, Version 16.10.1r[FC2], DEVELOPMENT SOFTWARE
-        p4 = re.compile(r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$')
+        p4 = _patterns.compile(r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$')
         # Boot Loader Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p5 = re.compile(r'^Boot +Loader +Hash: *(?P<hash>\S+)$')
+        p5 = _patterns.compile(r'^Boot +Loader +Hash: *(?P<hash>\S+)$')
         # 51CE6FB9AE606330810EBFFE99D71D56640FD48F780EDE0C19FB5A75E31EF2192A58A196D18B244ADF67D18BF6B3AA6A16229C66DCC03D8A900753760B252C57
-        p6 = re.compile(r'^(?P<hash>\S+)$')
+        p6 = _patterns.compile(r'^(?P<hash>\S+)$')
         # OS Version: 2019-07-11_16.25_mzafar
-        p7 = re.compile(r'^OS +Version: +(?P<os_version>\S+)$')
+        p7 = _patterns.compile(r'^OS +Version: +(?P<os_version>\S+)$')
         # OS Hashes:
-        p8 = re.compile(r'^OS +Hashes:$')
+        p8 = _patterns.compile(r'^OS +Hashes:$')
         # PCR0: BB33E3FE338B82635B1BD3F1401CF442ACC9BB12A405A424FBE0A5776569884E
-        p9 = re.compile(r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$')
+        p9 = _patterns.compile(r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$')
         # cat9k_iosxe.2019-07-11_16.25_mzafar.SSA.bin:
-        p10 = re.compile(r'^(?P<os_hash>\S+):$')
+        p10 = _patterns.compile(r'^(?P<os_hash>\S+):$')
         # Signature version: 1
-        p11 = re.compile(r'^Signature version: +(?P<signature_version>\S+)$')
+        p11 = _patterns.compile(r'^Signature version: +(?P<signature_version>\S+)$')
         # Signature:
-        p12 = re.compile(r'^Signature:$')
+        p12 = _patterns.compile(r'^Signature:$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6414,48 +6418,48 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
             output = self.device.execute(self.cli_command[0])
 
         # APPQOE Feature Statistics:
-        p1 = re.compile(r'^(?P<feature>\w+) +Feature +Statistics:$')
+        p1 = _patterns.compile(r'^(?P<feature>\w+) +Feature +Statistics:$')
 
         # Global:
-        p2 = re.compile(r'^Global:$')
+        p2 = _patterns.compile(r'^Global:$')
 
         # SDVT Global stats:
-        p3 = re.compile(r'^SDVT +Global +stats:$')
+        p3 = _patterns.compile(r'^SDVT +Global +stats:$')
 
         # SN Index [0 (Green)]
         # SN Index [Default]
-        p4 = re.compile(r'^SN +Index +\[(?P<index>[\s\S]+)\]$')
+        p4 = _patterns.compile(r'^SN +Index +\[(?P<index>[\s\S]+)\]$')
 
         # SDVT Count stats:
         # SDVT Packet stats:
         # SDVT Drop Cause stats:
         # SDVT Errors stats:
-        p5 = re.compile(r'^(?P<sdvt_stats_type>SDVT +[\s\S]+ +stats):$')
+        p5 = _patterns.compile(r'^(?P<sdvt_stats_type>SDVT +[\s\S]+ +stats):$')
 
         # decaps: Processed control messages from SN: 14200
         # decaps: delete requests received total: 14200
         # decaps: delete - protocol decision: 14200
-        p6 = re.compile(r'^decaps: +(?P<decap_type>[\s\S]+): +(?P<value>\d+)$')
+        p6 = _patterns.compile(r'^decaps: +(?P<decap_type>[\s\S]+): +(?P<value>\d+)$')
 
         # Divert packets/bytes: 743013/43313261
         # Reinject packets/bytes: 679010/503129551
-        p7 = re.compile(r'^(?P<type>Divert|Reinject) +packets\/bytes: +(?P<packets>\d+)\/(?P<bytes>\d+)$')
+        p7 = _patterns.compile(r'^(?P<type>Divert|Reinject) +packets\/bytes: +(?P<packets>\d+)\/(?P<bytes>\d+)$')
 
         # ip-non-tcp-pkts: 0
         # not-enabled: 0
         # cft_handle_pkt:  0
         # sdvt_divert_req_fail:  0
         # syn_policer_rate: 800
-        p8 = re.compile(r'^(?P<key>[\s\S]+): +(?P<value>\d+)$')
+        p8 = _patterns.compile(r'^(?P<key>[\s\S]+): +(?P<value>\d+)$')
 
         # SN Index [0 (Green)], IP: 10.136.1.250, oce_id: 1243618816
-        p9 = re.compile(r'^SN +Index +\[(?P<index>[\s\S]+)\], +IP: +(?P<ip>[\s\S]+), +oce_id: +(?P<oce_id>[\s\S]+)$')
+        p9 = _patterns.compile(r'^SN +Index +\[(?P<index>[\s\S]+)\], +IP: +(?P<ip>[\s\S]+), +oce_id: +(?P<oce_id>[\s\S]+)$')
 
         # del 0, key 0x0301, id 1, ver 1, status 1, type 3, sng 0
-        p10 = re.compile(r'^del +(?P<del>[\s\S]+), key +(?P<key>[\s\S]+), id +(?P<id>[\s\S]+), ver +(?P<ver>[\s\S]+), status +(?P<status>[\s\S]+), type +(?P<type>[\s\S]+), sng +(?P<sng>[\s\S]+)$')
+        p10 = _patterns.compile(r'^del +(?P<del>[\s\S]+), key +(?P<key>[\s\S]+), id +(?P<id>[\s\S]+), ver +(?P<ver>[\s\S]+), status +(?P<status>[\s\S]+), type +(?P<type>[\s\S]+), sng +(?P<sng>[\s\S]+)$')
 
         # APPNAV STATS: toSN 2662751642/2206742552009, fromSN 2715505607/2260448392656
-        p11 = re.compile(r'^APPNAV STATS: +(?P<to_sn>[\S]+) +(?P<tosn_packets>[\d]+)\/(?P<tosn_bytes>\d+), +(?P<from_sn>[\S]+) +(?P<frmsn_packets>[\d]+)\/(?P<frmsn_bytes>\d+)$')
+        p11 = _patterns.compile(r'^APPNAV STATS: +(?P<to_sn>[\S]+) +(?P<tosn_packets>[\d]+)\/(?P<tosn_bytes>\d+), +(?P<from_sn>[\S]+) +(?P<frmsn_packets>[\d]+)\/(?P<frmsn_bytes>\d+)$')
 
         ret_dict = {}
 
@@ -6662,7 +6666,7 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
 
         # initial regexp pattern
         # CAM Utilization for ASIC  [0]
-        p1 = re.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
+        p1 = _patterns.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
 
         #CTS Cell Matrix/VPN
         #Label                  EM           O       16384        0    0.00%        0        0        0        0
@@ -6670,7 +6674,7 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
         #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
         # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
         # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-        p2 = re.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
+        p2 = _patterns.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
 
 
         for line in out.splitlines():
@@ -6754,11 +6758,11 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSum(ShowPlatformHardwareQfpActive
 
 
         #CPP 0:                     5 secs        1 min        5 min       60 min
-        p1 = re.compile(r'^CPP (?P<cpp_num>\d)\: +(\d\s\S+) +(\d\s\S+) +(\d\s\S+) +(\d+\s\S+)$')
+        p1 = _patterns.compile(r'^CPP (?P<cpp_num>\d)\: +(\d\s\S+) +(\d\s\S+) +(\d\s\S+) +(\d+\s\S+)$')
         #Input:     Total (pps)            2            2            1            0
-        p2 = re.compile(r'^(?P<dir>\w+)\: +\S+ \((?P<type>\S+)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$')
+        p2 = _patterns.compile(r'^(?P<dir>\w+)\: +\S+ \((?P<type>\S+)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$')
         #(bps)         2928         1856         1056           88
-        p3 = re.compile(r'^\((?P<type>bps)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$')
+        p3 = _patterns.compile(r'^\((?P<type>bps)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$')
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
@@ -6842,18 +6846,18 @@ class ShowPlatformHardwareQfpActiveTcamResourceManagerUsage(ShowPlatformHardware
             output = self.device.execute(self.cli_command[0])
 
         #QFP TCAM Usage Information
-        p1 = re.compile(r'^(?P<key>QFP TCAM Usage Information)$')
+        p1 = _patterns.compile(r'^(?P<key>QFP TCAM Usage Information)$')
 
         #80 Bit Region Information
         #Total TCAM Cell Usage Information
-        p2 = re.compile(r'^(?P<num>\d+|Total TCAM)(?P<region>[\s\S]+)$')
+        p2 = _patterns.compile(r'^(?P<num>\d+|Total TCAM)(?P<region>[\s\S]+)$')
 
         # Name                                : Leaf Region #1
         # Number of cells per entry           : 2
         # Current 160 bits entries used       : 19
         # Current used cell entries           : 38
         # Current free cell entries           : 4058
-        p3 = re.compile(r'^(?P<key>[\s\S]+)\:(?P<value>[\s\S]+\S)$')
+        p3 = _patterns.compile(r'^(?P<key>[\s\S]+)\:(?P<value>[\s\S]+\S)$')
 
 
         ret_dict = {}
@@ -7052,24 +7056,24 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
         #RP1 (ok, standby)                                                                               H
         #ESP0(ok, active)                                                                               H
         #ESP1(ok, standby)                                                                               H
-        p1 = re.compile(r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$')
+        p1 = _patterns.compile(r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$')
 
         #SIP0                                                                                           H
-        p2 = re.compile(r'^SIP(?P<key>[0-9]) +(?P<state>\S)$')
+        p2 = _patterns.compile(r'^SIP(?P<key>[0-9]) +(?P<state>\S)$')
 
         # Control Processor       0.51%                 100%            80%             90%             H
-        p3 = re.compile(r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p3 = _patterns.compile(r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
 
         #QFP                                                                                           H
-        p4 = re.compile(r'^QFP +(?P<state>\S)$')
+        p4 = _patterns.compile(r'^QFP +(?P<state>\S)$')
 
         #CPU Utilization        0.00%                 100%            90%             95%             H
-        p5 = re.compile(r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p5 = _patterns.compile(r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
 
         # TCAM                   16cells(0%)           1048576cells    65%             85%             H
         # DRAM                   238906KB(5%)          4194304KB       85%             95%             H
         # IRAM                   13014KB(9%)           131072KB        85%             95%             H
-        p6 = re.compile(r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p6 = _patterns.compile(r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
 
 
         ret_dict = {}
@@ -7182,7 +7186,7 @@ class ShowPlatformSoftwareYangManagementProcess(ShowPlatformSoftwareYangManageme
         # confd            : Running
         # pubd             : Running
         # gnmib            : Not Running
-        p1 = re.compile(r'^(?P<key>\S+) *: +(?P<data>(Running|Not +Running))$')
+        p1 = _patterns.compile(r'^(?P<key>\S+) *: +(?P<data>(Running|Not +Running))$')
 
         ret_dict = dict()
 
@@ -7234,8 +7238,8 @@ class ShowPlatformSoftwareYangManagementProcessMonitor(ShowPlatformSoftwareYangM
 
         # dmiauthd          551 S 376940 49600  0.0  0.6    21:44:33
         # ncsshd           1503 S 301344 17592  0.0  0.2    21:44:32
-        p1 = re.compile(r'^(?P<command>\S+) +(?P<pid>\d+) +(?P<s>\S+) +(?P<vsz>\d+) +'
-                        r'(?P<rss>\d+) +(?P<cpu>\S+) +(?P<mem>\S+) +(?P<elapsed>\S+)$')
+        p1 = _patterns.compile(r'^(?P<command>\S+) +(?P<pid>\d+) +(?P<s>\S+) +(?P<vsz>\d+) +'
+                               r'(?P<rss>\d+) +(?P<cpu>\S+) +(?P<mem>\S+) +(?P<elapsed>\S+)$')
 
         ret_dict = dict()
 
@@ -7292,12 +7296,12 @@ class ShowPlatformSoftwareYangManagementProcessState(ShowPlatformSoftwareYangMan
             out = output
 
         # Confd Status: Started
-        p1 = re.compile(r'^Confd +Status: +(?P<status>\S+)$')
+        p1 = _patterns.compile(r'^Confd +Status: +(?P<status>\S+)$')
 
         # pubd                 Running             Active
         # gnmib                Not Running         Not Applicable
-        p2 = re.compile(r'^(?P<process>\S+) +(?P<status>(Running|Not +Running)) +'
-                        r'(?P<state>(Active|Not +Active|Not +Applicable))$')
+        p2 = _patterns.compile(r'^(?P<process>\S+) +(?P<status>(Running|Not +Running)) +'
+                               r'(?P<state>(Active|Not +Active|Not +Applicable))$')
 
         ret_dict = dict()
 
@@ -7360,14 +7364,14 @@ class ShowPlatformSoftwareMemoryRpActive(ShowPlatformSoftwareMemoryRpActiveSchem
         ret_dict = {}
 
         # Module: process
-        p1 = re.compile(r'Module: +(?P<module>[\S\s]+)$')
+        p1 = _patterns.compile(r'Module: +(?P<module>[\S\s]+)$')
 
         # allocated: 16695, requested: 16647, overhead: 48
-        p2 = re.compile(r'allocated: +(?P<allocated>\d+), +requested: +'
+        p2 = _patterns.compile(r'allocated: +(?P<allocated>\d+), +requested: +'
             r'(?P<requested>\d+), +overhead: +(?P<overhead>\d+)$')
 
         # Allocations: 3, failed: 0, frees: 0
-        p3 = re.compile(r'Allocations: +(?P<allocations>\d+), +failed: +'
+        p3 = _patterns.compile(r'Allocations: +(?P<allocations>\d+), +failed: +'
             r'(?P<failed>\d+), +frees: +(?P<frees>\d+)$')
 
         for line in out.splitlines():
@@ -7466,7 +7470,7 @@ class ShowPlatformSoftwareMemoryRpActiveBrief(ShowPlatformSoftwareMemoryRpActive
         ret_dict = {}
 
         # Summary                 420136        364136        3706          206
-        p1 = re.compile(r'^(?P<module>\S+) +(?P<allocated>\d+) +'
+        p1 = _patterns.compile(r'^(?P<module>\S+) +(?P<allocated>\d+) +'
             r'(?P<requested>\d+) +(?P<allocs>\d+) +(?P<frees>\d+)$')
 
         for line in out.splitlines():
@@ -7555,10 +7559,10 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsite(ShowPlatformSoftwareMemory
         ret_dict = {}
 
         # callsite: 1355696130, thread_id: 24813
-        p1 = re.compile(r'^callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)$')
+        p1 = _patterns.compile(r'^callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)$')
 
         # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
-        p2 = re.compile(r'^allocs: +(?P<allocs>\d+), +frees: +(?P<frees>\d+), +'
+        p2 = _patterns.compile(r'^allocs: +(?P<allocs>\d+), +frees: +(?P<frees>\d+), +'
             r'alloc_bytes: +(?P<alloc_bytes>\d+), +free_bytes: +(?P<free_bytes>\d+), +'
             r'call_diff: +(?P<call_diff>\d+), +byte_diff: +(?P<byte_diff>\d+)$')
 
@@ -7635,10 +7639,10 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBrief(ShowPlatformSoftwareM
         ret_dict = {}
 
         # callsite: 1355696130, thread_id: 24813
-        p1 = re.compile(r'^The +current +tracekey +is +: +(?P<tracekey>\S+)$')
+        p1 = _patterns.compile(r'^The +current +tracekey +is +: +(?P<tracekey>\S+)$')
 
         # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
-        p2 = re.compile(r'^(?P<callsite>\d+) +(?P<thread_id>\d+) +(?P<diff_byte>\d+) +(?P<diff_call>\d+)$')
+        p2 = _patterns.compile(r'^(?P<callsite>\d+) +(?P<thread_id>\d+) +(?P<diff_byte>\d+) +(?P<diff_call>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -7710,17 +7714,17 @@ class ShowPlatformSoftwareMemoryRpActiveAllocType(ShowPlatformSoftwareMemoryRpAc
         ret_dict = {}
 
         # Module: process
-        p1 = re.compile(r'Module: +(?P<module>[\S\s]+)$')
+        p1 = _patterns.compile(r'Module: +(?P<module>[\S\s]+)$')
 
         # Type: process
-        p1_1 = re.compile(r'Type: +(?P<type>[\S\s]+)$')
+        p1_1 = _patterns.compile(r'Type: +(?P<type>[\S\s]+)$')
 
         # allocated: 16695, requested: 16647, overhead: 48
-        p2 = re.compile(r'Allocated: +(?P<allocated>\d+), +'
+        p2 = _patterns.compile(r'Allocated: +(?P<allocated>\d+), +'
             r'Requested: +(?P<requested>\d+), +Overhead: +(?P<overhead>\d+)$')
 
         # Allocations: 3, failed: 0, frees: 0
-        p3 = re.compile(r'Allocations: +(?P<allocations>\d+), +Null +Allocations: +'
+        p3 = _patterns.compile(r'Allocations: +(?P<allocations>\d+), +Null +Allocations: +'
             r'(?P<null_allocations>\d+), +Frees: +(?P<frees>\d+)$')
 
         for line in out.splitlines():
@@ -7813,7 +7817,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeBrief(ShowPlatformSoftwareMemor
         ret_dict = {}
 
         # Summary                 4989412       4501988       150851        142147
-        p1 = re.compile(r'(?P<type>\S+) +(?P<allocated>\d+) +'
+        p1 = _patterns.compile(r'(?P<type>\S+) +(?P<allocated>\d+) +'
             r'(?P<requested>\d+) +(?P<allocations>\d+) +(?P<frees>\d+)$')
 
         for line in out.splitlines():
@@ -8,6 +8,11 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+from genie.libs.parser.utils.patterns import PatternScanner
+from genie.libs.parser.utils.stream import RecordStream, StreamParser
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.interning import string_pool
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -173,10 +178,113 @@ class ShowIpRouteSchema(MetaParser):
     }
 
 
+def _show_ip_route_scanner(ip_ver):
+    '''Patterns of show ip route (ipv4) or show ipv6 route (ipv6)'''
+    lines = PatternScanner()
+
+    # Routing Table: VRF1
+    # Routing Table: VRF-infra
+    lines.add('p1', r'^Routing Table: +(?P<vrf>[\w?-]+)$')
+
+    # 10.1.0.0/32 is subnetted, 1 subnets
+    # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+    lines.add('p2', r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+                    r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
+
+    # C        10.4.1.1 is directly connected, Loopback0
+    # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+    # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+    # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+    # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
+    # D        192.168.205.1
+    # S*       0.0.0.0/0 [1/0] via 10.50.15.1
+    # L        FF00::/8 [0/0]
+    if ip_ver == 'ipv4':
+        lines.add('p3',
+            r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
+            r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+            r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
+    else:
+        lines.add('p3',
+            r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
+            r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+            r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
+
+    #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+    lines.add('p4', r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+                    r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
+
+    #       is directly connected, GigabitEthernet0/2
+    lines.add('p5', r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+                    r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+                    r'( +(?P<interface>[\S]+))?$')
+
+    #      via 2001:DB8:1:1::2
+    #      via 10.4.1.1%default, indirectly connected
+    #      via 2001:DB8:4:6::6
+    #      via 2001:DB8:20:4:6::6%VRF2
+    #      via Null0, receive
+    lines.add('p6', r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
+                    r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
+                    r'( +directly connected)?( +indirectly connected)?$')
+
+    # Routing entry for 10.151.0.0/24, 1 known subnets
+    # Routing entry for 0.0.0.0/0, supernet
+    # Routing entry for 192.168.154.0/24
+    lines.add('p100', r'^Routing +entry +for +'
+                      '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+                      '(, +(?P<net>[\w\s]+))?$')
+
+    # Known via "eigrp 1", distance 130, metric 10880, type internal
+    # Known via "rip", distance 120, metric 2
+    lines.add('p200', r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+                      'distance +(?P<distance>\d+), +'
+                      'metric +(?P<metric>\d+)'
+                      '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
+
+    # Redistributing via rip
+    # Redistributing via eigrp 1
+    lines.add('p300', r'^Redistributing +via +(?P<redist_via>\w+) *'
+                      '(?P<redist_via_tag>\d+)?$')
+
+    # Last update from 192.168.151.2 on Vlan101, 2w3d ago
+    # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
+    lines.add('p400', r'^Last +update +from +(?P<from>[\w\.]+) +'
+                      'on +(?P<interface>[\w\.\/\-]+), +'
+                      '(?P<age>[\w\.\:]+) +ago$')
+
+    # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
+    # * 10.69.1.2
+    lines.add('p500', r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+                      'from +(?P<from>[\w\.]+), +'
+                      '(?P<age>[\w\.\:]+) +ago, +'
+                      'via +(?P<interface>[\w\.\/\-]+))?$')
+
+    # Route metric is 10880, traffic share count is 1
+    lines.add('p600', r'^Route +metric +is +(?P<metric>\d+), +'
+                      'traffic +share +count +is +(?P<share_count>\d+)$')
+
+    # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
+    lines.add('p700', r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+                      '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
+
+    # Reliability 255/255, minimum MTU 1500 bytes
+    lines.add('p800', r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
+
+    # Loading 1/255, Hops 1
+    lines.add('p900', r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+
+    return lines
+
+# Lines of ShowIpRoute, scanned in a single pass
+_show_ip_route_lines = {ip_ver: _show_ip_route_scanner(ip_ver)
+                        for ip_ver in ('ipv4', 'ipv6')}
+
+
 # ====================================================
 #  parser for show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(ShowIpRouteSchema, StreamParser, CompactParser):
     """Parser for :
         show ip route
         show ip route vrf <vrf>"""
@@ -186,6 +294,18 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = ['updated']
     IP_VER='ipv4'
 
+    # A route starts on its code and network, or on the entry of a single
+    # route, under its VRF and the subnet giving the mask of the networks
+    # without one
+    record_stream = RecordStream(
+        record=r'^\s*((?!via\b|is\b)[\w\*]+( +\w+)? +[\da-fA-F\.\:]+'
+               r'(\/\d+)?( |,|$)|Routing +entry +for )',
+        context=[r'^\s*Routing +Table: ',
+                 r'^\s*[\d\/\.]+ +is +(variably +)?subnetted'])
+
+    # Routes of each VRF and address family
+    compact_tables = [('vrf', None, 'address_family', None, 'routes')]
+
     def cli(self, vrf=None, protocol=None, output=None):
 
         if output is None:
@@ -223,68 +343,32 @@ class ShowIpRoute(ShowIpRouteSchema):
 
         result_dict = {}
 
-        # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        '(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        'distance +(?P<distance>\d+), +'
-                        'metric +(?P<metric>\d+)'
-                        '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        '(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        'on +(?P<interface>[\w\.\/\-]+), +'
-                        '(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        'from +(?P<from>[\w\.]+), +'
-                        '(?P<age>[\w\.\:]+) +ago, +'
-                        'via +(?P<interface>[\w\.\/\-]+))?$')
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        'traffic +share +count +is +(?P<share_count>\d+)$')
-
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                          'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
-
         # initial variables
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
-            if line:
-                line = line.strip()
-            else:
-                continue
-
+        lines = _show_ip_route_lines['ipv4' if self.IP_VER == 'ipv4' else 'ipv6']
+        for rule, group in lines.finditer(out):
             next_hop = interface = updated = metrics = route_preference = ""
             # Routing Table: VRF1
             # Routing Table: VRF-infra
-            p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
-            m = p1.match(line)
-            if m:
-                vrf = m.groupdict()['vrf']
+            if rule == 'p1':
+                vrf = group['vrf']
                 continue
 
             # 10.1.0.0/32 is subnetted, 1 subnets
             # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                            r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-            m = p2.match(line)
-            if m:
+            if rule == 'p2':
                 # if you see the issue by "show ip route", it means that active is True.
                 # it means all routes in the output should be active=True
                 active = True
                 netmask = number_of_masks= ""
-                number_of_subnets = m.groupdict()['number_of_subnets']
-                if m.groupdict()['number_of_masks']:
-                    number_of_masks = m.groupdict()['number_of_masks']
+                number_of_subnets = group['number_of_subnets']
+                if group['number_of_masks']:
+                    number_of_masks = group['number_of_masks']
 
-                if m.groupdict()['subnetted_ip']:
-                    subnetted_ip = m.groupdict()['subnetted_ip']
+                if group['subnetted_ip']:
+                    subnetted_ip = group['subnetted_ip']
                     if '/' in subnetted_ip:
                         netmask = subnetted_ip.split('/')[1]
                 continue
@@ -297,57 +381,46 @@ class ShowIpRoute(ShowIpRouteSchema):
             # D        192.168.205.1
             # S*       0.0.0.0/0 [1/0] via 10.50.15.1
             # L        FF00::/8 [0/0]
-            if self.IP_VER == 'ipv4':
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-            else:
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
-            m = p3.match(line)
-            if m:
+            if rule == 'p3':
                 active = True
-                if m.groupdict()['code']:
-                    source_protocol_codes = m.groupdict()['code'].strip()
+                if group['code']:
+                    source_protocol_codes = string_pool(group['code'].strip())
                     for key,val in source_protocol_dict.items():
                         source_protocol_replaced = source_protocol_codes.split('*')[0]
                         if source_protocol_replaced in val:
                             source_protocol = key
 
-                if m.groupdict()['code1']:
-                    source_protocol_codes = '{} {}'.format(source_protocol_codes, m.groupdict()['code1'])
+                if group['code1']:
+                    source_protocol_codes = string_pool('{} {}'.format(
+                        source_protocol_codes, group['code1']))
 
-                if m.groupdict()['network']:
-                    network = m.groupdict()['network']
+                if group['network']:
+                    network = group['network']
                     if '/' in network:
                         route = network
                     else:
                         route = '{}/{}'.format(network,netmask)
 
-                if not m.groupdict()['network']:
+                if not group['network']:
                     route = route
 
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
+                if group['route_preference']:
+                    routepreference = group['route_preference']
                     if '/' in routepreference:
                         route_preference = routepreference.split('/')[0]
                         metrics = routepreference.split('/')[1]
 
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
+                if group['next_hop']:
+                    next_hop = string_pool(group['next_hop'])
                     index = 1
                 else:
                     index = 0
 
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                if group['interface']:
+                    interface = string_pool(group['interface'])
 
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                if group['date']:
+                    updated = string_pool(group['date'])
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
@@ -383,22 +456,19 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                            r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
-            m = p4.match(line)
-            if m:
-                routepreference = m.groupdict()['route_preference']
+            if rule == 'p4':
+                routepreference = group['route_preference']
                 if routepreference and '/' in routepreference:
                     route_preference = routepreference.split('/')[0]
                     metrics = routepreference.split('/')[1]
 
-                next_hop = m.groupdict()['next_hop']
+                next_hop = string_pool(group['next_hop'])
                 index +=1
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                if group['interface']:
+                    interface = string_pool(group['interface'])
 
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                if group['date']:
+                    updated = string_pool(group['date'])
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
@@ -434,25 +504,21 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #       is directly connected, GigabitEthernet0/2
-            p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                            r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                            r'( +(?P<interface>[\S]+))?$')
-            m = p5.match(line)
-            if m:
+            if rule == 'p5':
 
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
+                if group['route_preference']:
+                    routepreference = group['route_preference']
                     if '/' in routepreference:
                         route_preference = routepreference.split('/')[0]
                         metrics = routepreference.split('/')[1]
 
                 index += 1
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                if group['next_hop']:
+                    next_hop = string_pool(group['next_hop'])
+                if group['interface']:
+                    interface = string_pool(group['interface'])
+                if group['date']:
+                    updated = string_pool(group['date'])
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
@@ -488,22 +554,18 @@ class ShowIpRoute(ShowIpRouteSchema):
             #      via 2001:DB8:4:6::6
             #      via 2001:DB8:20:4:6::6%VRF2
             #      via Null0, receive
-            p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
-                            r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
-                            r'( +directly connected)?( +indirectly connected)?$')
-            m = p6.match(line)
-            if m:
+            if rule == 'p6':
                 vrf_val = ''
-                tmp_next_hop = m.groupdict()['next_hop']
+                tmp_next_hop = group['next_hop']
                 if tmp_next_hop:
                     if '%' in  tmp_next_hop:
-                        next_hop = tmp_next_hop.split('%')[0]
+                        next_hop = string_pool(tmp_next_hop.split('%')[0])
                         vrf_val = tmp_next_hop.split('%')[1]
                     else:
-                        next_hop = tmp_next_hop
+                        next_hop = string_pool(tmp_next_hop)
 
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                if group['interface']:
+                    interface = string_pool(group['interface'])
 
                 index += 1
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
@@ -536,9 +598,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             # Routing entry for 10.151.0.0/24, 1 known subnets
             # Routing entry for 0.0.0.0/0, supernet
             # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p100':
                 entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
                                                                                               {}).setdefault(af, {})
                 route_dict = entry_dict.setdefault('routes', {}).setdefault(route, {})
@@ -549,9 +609,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p200':
                 route_dict.update({'distance': int(group['distance'])})
                 route_dict.update({'metric': int(group['metric'])})
                 if group['type']:
@@ -560,26 +618,20 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Redistributing via rip
             # Redistributing via eigrp 1
-            m = p300.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p300':
                 route_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Last update from 192.168.151.2 on Vlan101, 2w3d ago
             # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p400':
                 update_dict = route_dict.setdefault('update', {})
                 update_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
             # * 10.69.1.2
-            m = p500.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p500':
                 index += 1
                 path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
                 path_dict.update({'index': index})
@@ -590,29 +642,21 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             # Route metric is 10880, traffic share count is 1
-            m = p600.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p600':
                 path_dict.update({k: v for k, v in group.items() if v})
 
             # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p700':
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p800':
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Loading 1/255, Hops 1
-            m = p900.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p900':
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
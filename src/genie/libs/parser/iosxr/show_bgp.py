@@ -58,6 +58,12 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.stream import RecordStream, StreamParser
+from genie.libs.parser.utils.execute import execute_commands
+
+# Patterns of the parsers in this module, compiled once
+_patterns = PatternTable()
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -110,11 +116,11 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
         ret_dict = {}
 
         #  Egress Engineering Peer Set: 192.168.1.2/32 (10b87210)
-        p1 = re.compile(r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
+        p1 = _patterns.compile(r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
         '+(?P<peer_set_id>\S+)')
 
         #   Version: 2, rn_version: 2
-        p2 = re.compile(r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
+        p2 = _patterns.compile(r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
         '+(?P<value_2>\d+)')
 
         #    Local ASN: 1
@@ -123,7 +129,7 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
         #     Remote RID: 10.4.1.4
         #     First Hop: 192.168.1.2
         #         NHID: 3
-        p3 = re.compile(r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)')
+        p3 = _patterns.compile(r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -212,14 +218,14 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
-                        r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
-                        r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$')
+        p1 = _patterns.compile(r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
+                               r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
+                               r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$')
 
-        p1_1 = re.compile(r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+')
-        p2 = re.compile(r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$')
-        p3 = re.compile(r'^Number +of +BGP +instances\: '
-                        r'+(?P<number_of_bgp_instances>\d+)$')
+        p1_1 = _patterns.compile(r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+')
+        p2 = _patterns.compile(r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$')
+        p3 = _patterns.compile(r'^Number +of +BGP +instances\: '
+                               r'+(?P<number_of_bgp_instances>\d+)$')
 
         ret_dict = {}
 
@@ -331,14 +337,14 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
             out = output
 
         ret_dict = {}
-        p1 = re.compile(r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
-                        '(?:\((?P<instance>\S+)\))?'
-                        ' +(?P<group>\S+)'
-                        ' +(?P<jid>\S+)'
-                        ' +(?P<active_rp>\S+)'
-                        ' +(?P<active_state>\S+)'
-                        ' +(?P<standby_rp>\S+)'
-                        ' +(?P<standby_state>\S+)$')
+        p1 = _patterns.compile(r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
+                               '(?:\((?P<instance>\S+)\))?'
+                               ' +(?P<group>\S+)'
+                               ' +(?P<jid>\S+)'
+                               ' +(?P<active_rp>\S+)'
+                               ' +(?P<active_state>\S+)'
+                               ' +(?P<standby_rp>\S+)'
+                               ' +(?P<standby_state>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -441,39 +447,50 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
             out = output
 
         ret_dict = {}
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         ' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)')
-        p1 = re.compile(r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
-                        'address\-family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^default\-originate *(policy)? *'
-                        '(?P<policy>[\w\-\.\:\s]+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^maximum\-prefix +'
-                        '(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^next\-hop\-self +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^policy +(?P<map>[\w]+) +in +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^policy +(?P<map>[\w]+) +out +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^route\-reflector\-client +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^send\-community\-ebgp +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^send\-extended\-community\-ebgp +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^allowas\-in +(?P<al>\d+)? *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^as\-override *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        pp1 = _patterns.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
+                                '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+                                ' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)')
+        p1 = _patterns.compile(r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
+                               'address\-family +(?P<af>[\w\s]+)$')
+        p2 = _patterns.compile(r'^default\-originate *(policy)? *'
+                               '(?P<policy>[\w\-\.\:\s]+)? +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p3 = _patterns.compile(r'^maximum\-prefix +'
+                               '(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p4 = _patterns.compile(r'^next\-hop\-self +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p5 = _patterns.compile(r'^policy +(?P<map>[\w]+) +in +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p6 = _patterns.compile(r'^policy +(?P<map>[\w]+) +out +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p7 = _patterns.compile(r'^route\-reflector\-client +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p8 = _patterns.compile(r'^send\-community\-ebgp +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p9 = _patterns.compile(r'^send\-extended\-community\-ebgp +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p10 = _patterns.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p11 = _patterns.compile(r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p12 = _patterns.compile(r'^allowas\-in +(?P<al>\d+)? *'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p13 = _patterns.compile(r'^as\-override *'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
 
         cmd = ''
+        af_group_command = 'show bgp instance {instance_name} af-group {pp_name} configuration'
+
+        # Execute the commands of all the af-groups in one batch
+        commands = []
+        for line1 in out.splitlines():
+            mm1 = pp1.match(line1.strip())
+            if mm1:
+                commands.append(af_group_command.format(
+                    instance_name=(mm1.groupdict()['instance_name'] or 'default').strip(),
+                    pp_name=mm1.groupdict()['pp_name']))
+        outputs = execute_commands(self.device, commands)
 
         for line1 in out.splitlines():
             line1 = line1.strip()
@@ -500,8 +517,8 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
                 if pp_name not in ret_dict['instance'][instance_name]['pp_name']:
                     ret_dict['instance'][instance_name]['pp_name'][pp_name] = {}
 
-                cmd = 'show bgp instance {instance_name} af-group {pp_name} configuration'.format(instance_name=instance_name, pp_name=pp_name)
-                out = self.device.execute(cmd)
+                cmd = af_group_command.format(instance_name=instance_name, pp_name=pp_name)
+                out = outputs[cmd]
 
                 # use for send_community key value tracker
                 send_community = []
@@ -761,36 +778,48 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
         ret_dict = {}
 
         cmd = ''
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         '(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
-                         ' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)')
-        p2 = re.compile(r'^remote\-as +(?P<as>\d+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^ebgp\-multihop +(?P<num>\d+)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
-                        '(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^password +encrypted +(?P<psw>\w+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^shutdown +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^timers +(?P<keep>\d+) +'
-                        '(?P<hold>\d+) +(?P<mim>\d+)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^update\-source +(?P<intf>[\w\.\/]+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^suppress\-4byteas +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^bfd fast-detect +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^ignore\-connected *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        pp1 = _patterns.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
+                                '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+                                '(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
+                                ' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)')
+        p2 = _patterns.compile(r'^remote\-as +(?P<as>\d+)? +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p3 = _patterns.compile(r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p4 = _patterns.compile(r'^ebgp\-multihop +(?P<num>\d+)? *'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p5 = _patterns.compile(r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
+                               '(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p6 = _patterns.compile(r'^password +encrypted +(?P<psw>\w+) +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p7 = _patterns.compile(r'^shutdown +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p8 = _patterns.compile(r'^timers +(?P<keep>\d+) +'
+                               '(?P<hold>\d+) +(?P<mim>\d+)? *'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p9 = _patterns.compile(r'^update\-source +(?P<intf>[\w\.\/]+) +'
+                               '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p10 = _patterns.compile(r'^suppress\-4byteas +'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p11 = _patterns.compile(r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p12 = _patterns.compile(r'^bfd fast-detect +'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p13 = _patterns.compile(r'^ignore\-connected *'
+                                '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+
+        session_group_command = 'show bgp instance {instance_name} session-group {ps_name} configuration'
+
+        # Execute the commands of all the session-groups in one batch
+        commands = []
+        for line1 in out.splitlines():
+            mm1 = pp1.match(line1.strip())
+            if mm1:
+                commands.append(session_group_command.format(
+                    instance_name=(mm1.groupdict()['instance_name'] or 'default').strip(),
+                    ps_name=str(mm1.groupdict()['ps_name'])))
+        outputs = execute_commands(self.device, commands)
 
         for line1 in out.splitlines():
             line1 = line1.strip()
@@ -823,8 +852,8 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
                     ret_dict['instance'][instance_name]['peer_session'][ps_name] = {}
 
                 # Execute command with instance and session-group name
-                cmd = 'show bgp instance {instance_name} session-group {ps_name} configuration'.format(instance_name=instance_name, ps_name=ps_name)
-                out = self.device.execute(cmd)
+                cmd = session_group_command.format(instance_name=instance_name, ps_name=ps_name)
+                out = outputs[cmd]
 
                 for line in out.splitlines():
                     line = line.strip()
@@ -1194,107 +1223,107 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                                                    vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
-        p1_1 = re.compile(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p1_1_1 = re.compile(r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$')
-        p1_2 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                          ' *(?P<route_distinguisher>\S+)$')
-        p2 = re.compile(r'BGP *is *operating *in *'
-                        '(?P<operation_mode>\w+) *mode$')
-        p3 = re.compile(r'^Autonomous *System *number *format: *'
-                        '(?P<as_format>[a-zA-Z]+)$')
-        p4 = re.compile(r'^Autonomous *System: *(?P<as_number>[0-9]+)$')
-        p5 = re.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
-                        '(\([\w\s]+\))?$')
-        p6_1 = re.compile(r'^Default *Cluster *ID: *'
-                          '(?P<default_cluster_id>[\w\.\:]+) *'
-                          '(\([\w\s\:\.\,]+\))?$')
-        p6_2 = re.compile(r'^Active *Cluster *IDs: *'
-                          '(?P<active_cluster_id>[\w\.\:]+)$')
-        p7_1 = re.compile(r'^Always compare MED is enabled$')
-        p7_2 = re.compile(r'^Comparing router ID for eBGP paths$')
-        p7_4 = re.compile(r'^Treating missing MED as worst$')
-        p8 = re.compile(r'^Fast +external +fallover +enabled$')
-        p9 = re.compile(r'^Platform *RLIMIT *max: *'
-                        '(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
-        p10 = re.compile(r'^Maximum +limit +for +BMP +buffer +size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p11 = re.compile(r'^Default *value *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p12 = re.compile(r'^Current *limit *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p13 = re.compile(r'^Current *utilization *of *BMP *buffer *'
-                         'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
-        p14 = re.compile(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
-        p15 = re.compile(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
-        p16 = re.compile(r'^Default *local *preference: *'
-                         '(?P<preference>[0-9]+)$')
-        p17 = re.compile(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
-        p18 = re.compile(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
-        p19 = re.compile(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
-        p20 = re.compile(r'^Generic *scan *interval: *'
-                         '(?P<scan_interval>[0-9]+)$')
-        p21 = re.compile(r'^BGP *Speaker *process: *'
-                         '(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
-        p22 = re.compile(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
-        p23 = re.compile(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
-                         '(?P<total>[0-9]+) +'
-                         '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
-        p24_1 = re.compile(r'^Updates:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p24_2 = re.compile(r'^Notifications:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p26 = re.compile(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
-                         '(?P<free>\d+)$')
-        p25 = re.compile(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
-                         '(?P<memory_used>[0-9]+)$')
-        p29 = re.compile(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
-        p29_1 = re.compile(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
-                           ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
-                           '(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
-        p30 = re.compile(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
-        p31 = re.compile(r'^Client +reflection +is +enabled +in +global +config$')
-        p31_1 = re.compile(r'^Client +reflection +is +not +enabled +in +global +config$')
-        p32 = re.compile(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
-        p33 = re.compile(r'^Dynamic *MED *interval *: *'
-                         '(?P<interval>[a-zA-Z0-9\s]+)$')
-        p34 = re.compile(r'^Dynamic *MED *Timer *: *'
-                         '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
-        p35 = re.compile(r'^Dynamic *MED *Periodic *Timer *: *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p36 = re.compile(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
-        p37 = re.compile(r'^Total *prefixes *scanned: *'
-                         '(?P<scan>[a-zA-Z0-9\s]+)$')
-        p38 = re.compile(r'^Prefixes *scanned *per *segment: *'
-                         '(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
-        p39 = re.compile(r'^Number *of *scan *segments: *'
-                         '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
-        p40 = re.compile(r'^Nexthop *resolution *minimum *prefix\-length: *'
-                         '(?P<length>[\w\s\(\)]+)$')
-        p41 = re.compile(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
-        p42 = re.compile(r'^Table *version *synced *to *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p43 = re.compile(r'^Table *version *acked *by *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p44 = re.compile(r'^RIB *has *not *converged: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p54 = re.compile(r'^RIB *table *prefix\-limit *reached +\? *'
-                         '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
-        p45 = re.compile(r'^Permanent +Network +(?P<status>\w+)$')
-        p46 = re.compile(r'^State: *(?P<state>[a-zA-Z\s]+).$')
-        p47 = re.compile(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
-        p48 = re.compile(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
-        p49 = re.compile(r'^Label *retention *timer *value *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p50 = re.compile(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
-        p51 = re.compile(r'^Table *bit\-field *size *: *'
-                         '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
-                         '(?P<elememt_size>\d+)$')
-        p52 = re.compile(r'^(?P<thread>\w+\s\w+) *'
-                         '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
-                         '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
-        p53 = re.compile(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
-                         '(?P<v2>[0-9]+)$')
+        p1 = _patterns.compile(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
+        p1_1 = _patterns.compile(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
+        p1_1_1 = _patterns.compile(r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$')
+        p1_2 = _patterns.compile(r'^\s*BGP *Route *Distinguisher:'
+                                 ' *(?P<route_distinguisher>\S+)$')
+        p2 = _patterns.compile(r'BGP *is *operating *in *'
+                               '(?P<operation_mode>\w+) *mode$')
+        p3 = _patterns.compile(r'^Autonomous *System *number *format: *'
+                               '(?P<as_format>[a-zA-Z]+)$')
+        p4 = _patterns.compile(r'^Autonomous *System: *(?P<as_number>[0-9]+)$')
+        p5 = _patterns.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
+                               '(\([\w\s]+\))?$')
+        p6_1 = _patterns.compile(r'^Default *Cluster *ID: *'
+                                 '(?P<default_cluster_id>[\w\.\:]+) *'
+                                 '(\([\w\s\:\.\,]+\))?$')
+        p6_2 = _patterns.compile(r'^Active *Cluster *IDs: *'
+                                 '(?P<active_cluster_id>[\w\.\:]+)$')
+        p7_1 = _patterns.compile(r'^Always compare MED is enabled$')
+        p7_2 = _patterns.compile(r'^Comparing router ID for eBGP paths$')
+        p7_4 = _patterns.compile(r'^Treating missing MED as worst$')
+        p8 = _patterns.compile(r'^Fast +external +fallover +enabled$')
+        p9 = _patterns.compile(r'^Platform *RLIMIT *max: *'
+                               '(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
+        p10 = _patterns.compile(r'^Maximum +limit +for +BMP +buffer +size: *'
+                                '(?P<size>[a-zA-Z0-9]+) *MB$')
+        p11 = _patterns.compile(r'^Default *value *for *BMP *buffer *size: *'
+                                '(?P<size>[a-zA-Z0-9]+) *MB$')
+        p12 = _patterns.compile(r'^Current *limit *for *BMP *buffer *size: *'
+                                '(?P<size>[a-zA-Z0-9]+) *MB$')
+        p13 = _patterns.compile(r'^Current *utilization *of *BMP *buffer *'
+                                'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
+        p14 = _patterns.compile(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
+        p15 = _patterns.compile(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
+        p16 = _patterns.compile(r'^Default *local *preference: *'
+                                '(?P<preference>[0-9]+)$')
+        p17 = _patterns.compile(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
+        p18 = _patterns.compile(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
+        p19 = _patterns.compile(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
+        p20 = _patterns.compile(r'^Generic *scan *interval: *'
+                                '(?P<scan_interval>[0-9]+)$')
+        p21 = _patterns.compile(r'^BGP *Speaker *process: *'
+                                '(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
+        p22 = _patterns.compile(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
+        p23 = _patterns.compile(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
+                                '(?P<total>[0-9]+) +'
+                                '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
+        p24_1 = _patterns.compile(r'^Updates:'
+                                  ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
+        p24_2 = _patterns.compile(r'^Notifications:'
+                                  ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
+        p26 = _patterns.compile(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
+                                '(?P<free>\d+)$')
+        p25 = _patterns.compile(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
+                                '(?P<memory_used>[0-9]+)$')
+        p29 = _patterns.compile(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
+        p29_1 = _patterns.compile(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
+                                  ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
+                                  '(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
+        p30 = _patterns.compile(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
+        p31 = _patterns.compile(r'^Client +reflection +is +enabled +in +global +config$')
+        p31_1 = _patterns.compile(r'^Client +reflection +is +not +enabled +in +global +config$')
+        p32 = _patterns.compile(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
+        p33 = _patterns.compile(r'^Dynamic *MED *interval *: *'
+                                '(?P<interval>[a-zA-Z0-9\s]+)$')
+        p34 = _patterns.compile(r'^Dynamic *MED *Timer *: *'
+                                '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
+        p35 = _patterns.compile(r'^Dynamic *MED *Periodic *Timer *: *'
+                                '(?P<timer>[a-zA-Z0-9\s]+)$')
+        p36 = _patterns.compile(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
+        p37 = _patterns.compile(r'^Total *prefixes *scanned: *'
+                                '(?P<scan>[a-zA-Z0-9\s]+)$')
+        p38 = _patterns.compile(r'^Prefixes *scanned *per *segment: *'
+                                '(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
+        p39 = _patterns.compile(r'^Number *of *scan *segments: *'
+                                '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
+        p40 = _patterns.compile(r'^Nexthop *resolution *minimum *prefix\-length: *'
+                                '(?P<length>[\w\s\(\)]+)$')
+        p41 = _patterns.compile(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
+        p42 = _patterns.compile(r'^Table *version *synced *to *RIB: *'
+                                '(?P<rib>[a-zA-Z0-9\s]+)$')
+        p43 = _patterns.compile(r'^Table *version *acked *by *RIB: *'
+                                '(?P<rib>[a-zA-Z0-9\s]+)$')
+        p44 = _patterns.compile(r'^RIB *has *not *converged: *'
+                                '(?P<rib>[a-zA-Z0-9\s]+)$')
+        p54 = _patterns.compile(r'^RIB *table *prefix\-limit *reached +\? *'
+                                '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
+        p45 = _patterns.compile(r'^Permanent +Network +(?P<status>\w+)$')
+        p46 = _patterns.compile(r'^State: *(?P<state>[a-zA-Z\s]+).$')
+        p47 = _patterns.compile(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
+        p48 = _patterns.compile(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
+        p49 = _patterns.compile(r'^Label *retention *timer *value *'
+                                '(?P<timer>[a-zA-Z0-9\s]+)$')
+        p50 = _patterns.compile(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
+        p51 = _patterns.compile(r'^Table *bit\-field *size *: *'
+                                '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
+                                '(?P<elememt_size>\d+)$')
+        p52 = _patterns.compile(r'^(?P<thread>\w+\s\w+) *'
+                                '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
+                                '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
+        p53 = _patterns.compile(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
+                                '(?P<v2>[0-9]+)$')
         # Init dict
         ret_dict = {}
 
@@ -1657,10 +1686,10 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # BMP pool summary:
             #                            Alloc           Free
             # Pool 100:                  0               0
-            if re.compile(r'Message +logging +pool +summary:$').match(line):
+            if _patterns.compile(r'Message +logging +pool +summary:$').match(line):
                 flag = 'message'
 
-            if re.compile(r'BMP +pool +summary:').match(line):
+            if _patterns.compile(r'BMP +pool +summary:').match(line):
                 flag = 'bmp'
 
             m = p26.match(line)
@@ -2114,9 +2143,9 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Remote Prefixes:      10              920         
             # Remote Path-elems:    10              630
 
-            if re.compile(r'^Allocated +Freed$').match(line):
+            if _patterns.compile(r'^Allocated +Freed$').match(line):
                 flag = 'allocated'
-            if re.compile(r'^Number +Mem Used$').match(line):
+            if _patterns.compile(r'^Number +Mem Used$').match(line):
                 flag = 'number'
 
 
@@ -2506,103 +2535,103 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             out = output
         # Init variables
         ret_dict = {}
-        p1 = re.compile(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
-                            '(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p2_1 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$')
-        p3 = re.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS'
-                            ' +(?P<local_as_as_no>[0-9]+)'
-                            '(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
-        p4 = re.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
-        p5 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
-                            '(?:, +up +for +(?P<up_time>[\w\:]+))?$')
-        p5_1 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
-        p6 = re.compile(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
-        p8 = re.compile(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
-                            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-        p9 = re.compile(r'^Configured +hold +time:'
-                            ' +(?P<holdtime>[0-9]+), +keepalive:'
-                            ' +(?P<keepalive_interval>[0-9]+), +min'
-                            ' +acceptable +hold +time:'
-                            ' +(?P<min_acceptable_hold_time>[0-9]+)$')
-        p10 = re.compile(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
-        p11 = re.compile(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
-        p12 = re.compile(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
-        p13 = re.compile(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
-        p14 =  re.compile(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
-        p15 = re.compile(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
-        p15_1 = re.compile(r'^Socket *(?P<socket_status>[a-z\s\,])$')
-        p16 =  re.compile(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
-        p17 = re.compile(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
-        p18 = re.compile(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
-        p19 =  re.compile(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
-        p20 =  re.compile(r'^Precedence: *(?P<precedence>[a-z]+)$')
-        p21 =  re.compile(r'^Non-stop +routing +is +enabled$')
-        p22 =  re.compile(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
-        p23 = re.compile(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
-        p24 = re.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
-        p25 = re.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
-        p26 =  re.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
-        p27 = re.compile(r'^Neighbor +capabilities: +Adv +Rcvd$')
-        p27_1= re.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+): *(?P<adv>(Y|y)es|(N|n)o) *(?P<rcvd>(Y|y)es|(N|n)o+)$')
-        p28 = re.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
-        p29 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p29_1 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>[\-]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>[\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p30 = re.compile(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
-        p31 = re.compile(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
-        p32 = re.compile(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
-        p33 = re.compile(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
-        p34 = re.compile(r'^BGP +neighbor +version'
-                            ' +(?P<neighbor_version>[0-9]+)$')
-        p35 = re.compile(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
-        p36 = re.compile(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
-        p37 = re.compile(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
-        p38 = re.compile(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
-        p39 = re.compile(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
-        p40 = re.compile(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
-        p41 = re.compile(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
-        p42 = re.compile(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
-        p43 = re.compile(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
-        p44 = re.compile(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
-        p45 = re.compile(r'^Maximum +prefixes +allowed'
+        p1 = _patterns.compile(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
+                                   '(?P<instance>[a-zA-Z0-9\-\_\']+)$')
+        p2 =  _patterns.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p2_1 =  _patterns.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$')
+        p3 = _patterns.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS'
+                                   ' +(?P<local_as_as_no>[0-9]+)'
+                                   '(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
+        p4 = _patterns.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
+        p5 = _patterns.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
+                                   '(?:, +up +for +(?P<up_time>[\w\:]+))?$')
+        p5_1 = _patterns.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
+        p6 = _patterns.compile(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
+        p7 = _patterns.compile(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
+        p8 = _patterns.compile(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
+                                   ' +interval +is +(?P<keepalive_interval>[0-9]+)'
+                                   ' +seconds$')
+        p9 = _patterns.compile(r'^Configured +hold +time:'
+                                   ' +(?P<holdtime>[0-9]+), +keepalive:'
+                                   ' +(?P<keepalive_interval>[0-9]+), +min'
+                                   ' +acceptable +hold +time:'
+                                   ' +(?P<min_acceptable_hold_time>[0-9]+)$')
+        p10 = _patterns.compile(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
+        p11 = _patterns.compile(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
+        p12 = _patterns.compile(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
+        p13 = _patterns.compile(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
+        p14 =  _patterns.compile(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
+        p15 = _patterns.compile(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
+        p15_1 = _patterns.compile(r'^Socket *(?P<socket_status>[a-z\s\,])$')
+        p16 =  _patterns.compile(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
+        p17 = _patterns.compile(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
+        p18 = _patterns.compile(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
+        p19 =  _patterns.compile(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
+        p20 =  _patterns.compile(r'^Precedence: *(?P<precedence>[a-z]+)$')
+        p21 =  _patterns.compile(r'^Non-stop +routing +is +enabled$')
+        p22 =  _patterns.compile(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
+        p23 = _patterns.compile(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
+        p24 = _patterns.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
+        p25 = _patterns.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
+        p26 =  _patterns.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
+        p27 = _patterns.compile(r'^Neighbor +capabilities: +Adv +Rcvd$')
+        p27_1= _patterns.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+): *(?P<adv>(Y|y)es|(N|n)o) *(?P<rcvd>(Y|y)es|(N|n)o+)$')
+        p28 = _patterns.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
+        p29 = _patterns.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
+                                   '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
+                                   '(?P<sent>[0-9]+) *'
+                                   '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
+                                   '(?P<received>[0-9]+)$')
+        p29_1 = _patterns.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
+                                   '(?P<last_sent>[\-]+) *'
+                                   '(?P<sent>[0-9]+) *'
+                                   '(?P<last_received>[\-]+) *'
+                                   '(?P<received>[0-9]+)$')
+        p30 = _patterns.compile(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
+        p31 = _patterns.compile(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
+        p32 = _patterns.compile(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
+        p33 = _patterns.compile(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
+        p34 = _patterns.compile(r'^BGP +neighbor +version'
+                                   ' +(?P<neighbor_version>[0-9]+)$')
+        p35 = _patterns.compile(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
+        p36 = _patterns.compile(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
+        p37 = _patterns.compile(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
+        p38 = _patterns.compile(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
+        p39 = _patterns.compile(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
+        p40 = _patterns.compile(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
+        p41 = _patterns.compile(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
+        p42 = _patterns.compile(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
+        p43 = _patterns.compile(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
+        p44 = _patterns.compile(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
+        p45 = _patterns.compile(r'^Maximum +prefixes +allowed'
                         ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$')
-        p46 = re.compile(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
-        p47 = re.compile(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
-        p48 = re.compile(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
-        p49 = re.compile(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
-        p50 = re.compile(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
-        p50_1 = re.compile(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
-        p50_2 = re.compile(r'^Send +Multicast +Attributes$')
-        p51 = re.compile(r'^Connections *(?P<bgp_state>\w+) *'
-                            '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
-        p52 = re.compile(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
-        p53 = re.compile(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
-        p54 = re.compile(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
-        p55 = re.compile(r'^Capability +4-byte-as +suppress +is +configured$')
-        p56 = re.compile(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
-        p57 = re.compile(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
-        p58 = re.compile(r'^Administratively +shut +down$')
-        p59 = re.compile(r'^External +BGP +neighbor +may +be +up +to +'
-                            '(?P<hop>\d+) +hops +away$')
-        p60 = re.compile(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
-        p61 = re.compile(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
-                            'times +in +received +updates$')
-        p62 = re.compile(r'^Route\-Reflector +Client$')
-        p63 = re.compile(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
-        p64 = re.compile(r'^Inbound +soft +reconfiguration +allowed$')
-        p65 = re.compile(r'^AS +override +is +set$')
-        p66 = re.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
-        p67 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
+        p46 = _patterns.compile(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
+        p47 = _patterns.compile(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
+        p48 = _patterns.compile(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
+        p49 = _patterns.compile(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
+        p50 = _patterns.compile(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
+        p50_1 = _patterns.compile(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
+        p50_2 = _patterns.compile(r'^Send +Multicast +Attributes$')
+        p51 = _patterns.compile(r'^Connections *(?P<bgp_state>\w+) *'
+                                   '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
+        p52 = _patterns.compile(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
+        p53 = _patterns.compile(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
+        p54 = _patterns.compile(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
+        p55 = _patterns.compile(r'^Capability +4-byte-as +suppress +is +configured$')
+        p56 = _patterns.compile(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
+        p57 = _patterns.compile(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
+        p58 = _patterns.compile(r'^Administratively +shut +down$')
+        p59 = _patterns.compile(r'^External +BGP +neighbor +may +be +up +to +'
+                                   '(?P<hop>\d+) +hops +away$')
+        p60 = _patterns.compile(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
+        p61 = _patterns.compile(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
+                                   'times +in +received +updates$')
+        p62 = _patterns.compile(r'^Route\-Reflector +Client$')
+        p63 = _patterns.compile(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
+        p64 = _patterns.compile(r'^Inbound +soft +reconfiguration +allowed$')
+        p65 = _patterns.compile(r'^AS +override +is +set$')
+        p66 = _patterns.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
+        p67 = _patterns.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -3586,38 +3615,38 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
         # handle route table name
         routes = 'received' if 'received' in route_type else 'routes'
-        p1 = re.compile(r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p15 = re.compile(r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
-                            'state: *(?P<state>[a-zA-Z]+)$')
-        p15_1 = re.compile(r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)')
-        p16 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p2 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *local *AS *number *(?P<local_as>[0-9]+)$')
-        p4 = re.compile(r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$')
-        p5 = re.compile(r'^(?P<non_stop_routing>(Non-stop routing is enabled))$')
-        p6 = re.compile(r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$')
-        p8 = re.compile(r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$')
-        p9 = re.compile(r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p10 = re.compile(r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p11 = re.compile(r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$')
-        p12 = re.compile(r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
-                            '(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$')
-        p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
-                            '(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
-                            '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
-                            '(?: *(?P<origin_codes>(i|e|\?)))?)?$')
-        p13_1 = re.compile(r'(?P<path>[\d\s]+)'
+        p1 = _patterns.compile(r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
+        p15 = _patterns.compile(r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
+                                   'state: *(?P<state>[a-zA-Z]+)$')
+        p15_1 = _patterns.compile(r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)')
+        p16 = _patterns.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
+        p2 = _patterns.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
+        p3 = _patterns.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *local *AS *number *(?P<local_as>[0-9]+)$')
+        p4 = _patterns.compile(r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$')
+        p5 = _patterns.compile(r'^(?P<non_stop_routing>(Non-stop routing is enabled))$')
+        p6 = _patterns.compile(r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
+        p7 = _patterns.compile(r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$')
+        p8 = _patterns.compile(r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$')
+        p9 = _patterns.compile(r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p10 = _patterns.compile(r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p11 = _patterns.compile(r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$')
+        p12 = _patterns.compile(r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
+                                   '(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$')
+        p13 = _patterns.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
+                                   '(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
+                                   '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
+                                   '(?: *(?P<origin_codes>(i|e|\?)))?)?$')
+        p13_1 = _patterns.compile(r'(?P<path>[\d\s]+)'
                         ' *(?P<origin_codes>(i|e|\?))?$')
 
-        p14 = re.compile(r'^Processed *(?P<processed_prefixes>[0-9]+) *'
-                            'prefixes, *(?P<processed_paths>[0-9]+) *paths$')
+        p14 = _patterns.compile(r'^Processed *(?P<processed_prefixes>[0-9]+) *'
+                                   'prefixes, *(?P<processed_paths>[0-9]+) *paths$')
 
         #    Network            Next Hop            Metric LocPrf Weight Path
         #                       10.4.1.1                    100      0    i
-        p17 = re.compile(r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
-                            '(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
-                            '*(?P<path>[\S]+)$')
+        p17 = _patterns.compile(r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
+                                   '(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
+                                   '*(?P<path>[\S]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3972,7 +4001,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                 if group_num:
                     # metric   locprf  weight path
                     # 2219      211       0 200 33299 51178 47751 {27016}
-                    m1 = re.compile(r'^(?P<metric>[0-9]+)  +'
+                    m1 = _patterns.compile(r'^(?P<metric>[0-9]+)  +'
                                  '(?P<locprf>[0-9]+)  +'
                                  '(?P<weight>[0-9]+) '
                                  '(?P<path>[0-9\{\}\s]+)$').match(group_num)
@@ -3982,14 +4011,14 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                     # locprf   weight path
                     # 211         0 200 33299 51178 47751 {27016}
     
-                    m2 = re.compile(r'^(?P<value>[0-9]+)'
+                    m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
                                  '(?P<space>\s{2,20})'
                                  '(?P<weight>[0-9]+) '
                                  '(?P<path>[0-9\{\}\s]+)$').match(group_num)
     
                     # weight path
                     # 0 200 33299 51178 47751 {27016}
-                    m3 = re.compile(r'^(?P<weight>[0-9]+) '
+                    m3 = _patterns.compile(r'^(?P<weight>[0-9]+) '
                                  '(?P<path>((\d+\s)|(\{\d+\}\s))+)$')\
                                .match(group_num)
 
@@ -4154,19 +4183,19 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
             else:
                 af = 'vpnv4 unicast'
         address_family = None
-        p1 = re.compile(
+        p1 = _patterns.compile(
             r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>['
             r'a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p7 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
-                        '(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$')
-        p4 = re.compile(
+        p2 = _patterns.compile(r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$')
+        p7 = _patterns.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
+        p3 = _patterns.compile(r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
+                               '(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$')
+        p4 = _patterns.compile(
             r'^(?P<prefix>(?P<ip>[\w\.\:]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
             r'?P<froms>[\w\.\:]+) *'
             '(?P<path>[\d\{\}\s]+)?(?P<origin_code>[e|i\?])?$')
-        p5_1 = re.compile(r'(?P<path>[\d\{\}\s]+)(?P<origin_code>e|i)?$')
-        p6 = re.compile(
+        p5_1 = _patterns.compile(r'(?P<path>[\d\{\}\s]+)(?P<origin_code>e|i)?$')
+        p6 = _patterns.compile(
             r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$')
 
         for line in out.splitlines():
@@ -4501,54 +4530,54 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
                                                                      vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
-                        ' *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^\s*VRF: *(?P<vrf>[\S]+)$')
-        p3 = re.compile(r'^\s*Address *Family:'
-                        ' *(?P<address_family>[\S\s]+)$')
-        p4 = re.compile(r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
-                        ' *(?P<vrf_state>[a-zA-Z]+)$')
-        p5 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                        ' *(?P<route_distinguisher>\S+)$')
-        p6 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p7 = re.compile(r'^\s*BGP *router *identifier'
-                        ' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
-                        ' *(?P<local_as>[0-9\.]+)$')
-        p8 = re.compile(r'^\s*BGP *generic *scan *interval'
-                        ' *(?P<generic_scan_interval>[0-9]+) *secs$')
-        p9 = re.compile(r'^\s*Non-stop *routing *is'
-                        ' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p10 = re.compile(r'^\s*BGP *table *state:'
-                         ' *(?P<table_state>[a-zA-Z]+)$')
-        p11 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         ' *RD *version: (?P<rd_version>[0-9]+)$')
-        p12 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         ' *(?P<bgp_table_version>[0-9]+)$')
-        p13 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version'
-                         ' *(?P<nsr_initial_initsync_version>[0-9]+)'
-                         ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p14 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
-                         ' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$')
-        p15 = re.compile(
+        p1 = _patterns.compile(r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
+                               ' *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
+        p2 = _patterns.compile(r'^\s*VRF: *(?P<vrf>[\S]+)$')
+        p3 = _patterns.compile(r'^\s*Address *Family:'
+                               ' *(?P<address_family>[\S\s]+)$')
+        p4 = _patterns.compile(r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
+                               ' *(?P<vrf_state>[a-zA-Z]+)$')
+        p5 = _patterns.compile(r'^\s*BGP *Route *Distinguisher:'
+                               ' *(?P<route_distinguisher>\S+)$')
+        p6 = _patterns.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
+        p7 = _patterns.compile(r'^\s*BGP *router *identifier'
+                               ' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
+                               ' *(?P<local_as>[0-9\.]+)$')
+        p8 = _patterns.compile(r'^\s*BGP *generic *scan *interval'
+                               ' *(?P<generic_scan_interval>[0-9]+) *secs$')
+        p9 = _patterns.compile(r'^\s*Non-stop *routing *is'
+                               ' *(?P<non_stop_routing>[A-Za-z]+)$')
+        p10 = _patterns.compile(r'^\s*BGP *table *state:'
+                                ' *(?P<table_state>[a-zA-Z]+)$')
+        p11 = _patterns.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+                                ' *RD *version: (?P<rd_version>[0-9]+)$')
+        p12 = _patterns.compile(r'^\s*BGP *main *routing *table *version'
+                                ' *(?P<bgp_table_version>[0-9]+)$')
+        p13 = _patterns.compile(r'^\s*BGP *NSR *Initial *initsync *version'
+                                ' *(?P<nsr_initial_initsync_version>[0-9]+)'
+                                ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p14 = _patterns.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
+                                ' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$')
+        p15 = _patterns.compile(
             r'^\s*BGP *generic *scan *interval *(?P<scan_interval>[0-9]+) *secs$')
-        p16 = re.compile(
+        p16 = _patterns.compile(
             r'^\s*BGP *is *operating *in *(?P<operation_mode>[a-zA-Z]+) *mode.$')
-        p17 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         ' *(?P<standbyver>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p17_2 = re.compile(r'^\s*(?P<spk>[0-9]+) +(?P<remote_as>[0-9]+)'
-                           ' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
-                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           ' +(?P<state_pfxrcd>.+)$')
-        p17_3 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           ' +(?P<msg_sent>[0-9]+)'
-                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           ' +(?P<state_pfxrcd>.+)$')
+        p17 = _patterns.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+                                ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+                                ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+                                ' *(?P<standbyver>[0-9]+)$')
+        p17_1 = _patterns.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p17_2 = _patterns.compile(r'^\s*(?P<spk>[0-9]+) +(?P<remote_as>[0-9]+)'
+                                  ' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
+                                  ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+                                  ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+                                  ' +(?P<state_pfxrcd>.+)$')
+        p17_3 = _patterns.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+                                  ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+                                  ' +(?P<msg_sent>[0-9]+)'
+                                  ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+                                  ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+                                  ' +(?P<state_pfxrcd>.+)$')
 
         # Init vars
         bgp_instance_summary_dict = {}
@@ -4918,7 +4947,7 @@ class ShowBgpInstanceAllAllSchema(MetaParser):
 #   * show bgp instance {instance} all all
 #   * show bgp instance {instance} vrf {vrf} {address_family}
 # ============================================================
-class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
+class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema, StreamParser):
 
     '''Parser for:
         show bgp instance all all all
@@ -4935,6 +4964,21 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
     exclude = ['bgp_table_version', 'rd_version', 'nsr_initial_init_ver_status', 'nsr_initial_initsync_version']
 
+    # A prefix starts on its status codes and network, its next paths being
+    # the lines after it, under its instance, VRF, address family, table
+    # headers and route distinguisher
+    record_stream = RecordStream(
+        record=r'^\s*[isxSdh\*\>]+ ?[\w\[][\w\.\:\-\[\]\,]*\/\d+( |$)',
+        context=[r'^\s*BGP +instance +\d+:',
+                 r'^\s*VRF: ',
+                 r'^\s*Address +Family: ',
+                 r'^\s*(BGP +VRF |BGP +Route +Distinguisher:|VRF +ID:|'
+                 r'BGP +router +identifier |BGP +generic +scan +interval|'
+                 r'Non-stop +routing |BGP +table +state:|Table +ID:|'
+                 r'BGP +main +routing +table +version|BGP +NSR|'
+                 r'BGP +scan +interval)',
+                 r'^\s*Route +Distinguisher: '])
+
     def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None):
 
         # Verify vrf_type and address_family
@@ -4977,103 +5021,103 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 af_default = 'vpnv4 unicast'
 
         # BGP instance 0: 'default'
-        p1 = re.compile(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
-                        r' +(?P<instance>(\S+))$')
+        p1 = _patterns.compile(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
+                               r' +(?P<instance>(\S+))$')
 
         # VRF: VRF1
-        p2 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
+        p2 = _patterns.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
 
         # Address Family: VPNv6 Unicast
-        p3 = re.compile(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
+        p3 = _patterns.compile(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
 
         # BGP VRF VRF1, state: Active
-        p4 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
-                        r' +(?P<vrf_state>(\S+))$')
+        p4 = _patterns.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+                               r' +(?P<vrf_state>(\S+))$')
 
         # BGP Route Distinguisher: 200:1
         # BGP Route Distinguisher: 172.16.2.90:1
 
         # VRF ID: 0x60000001
-        p5 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+        p5 = _patterns.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
 
         # BGP router identifier 10.4.1.1, local AS number 100
-        p6 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>(\d+))$')
+        p6 = _patterns.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                               r' +local +AS +number +(?P<local_as>(\d+))$')
 
         # BGP generic scan interval 60 secs
-        p7 =  re.compile(r'^\s*BGP +generic +scan +interval'
-                         r' +(?P<interval>(\d+)) +secs$')
+        p7 =  _patterns.compile(r'^\s*BGP +generic +scan +interval'
+                                r' +(?P<interval>(\d+)) +secs$')
 
         # Non-stop routing is enabled
-        p8 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p8 = _patterns.compile(r'^\s*Non-stop +routing is enabled$')
 
         # BGP table state: Active
-        p9 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p9 = _patterns.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
 
         # Table ID: 0xe0000010   RD version: 43
-        p10 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p10 = _patterns.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+                                r' +(?P<rd_version>[0-9]+)$')
 
         # BGP main routing table version 43
-        p11 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p11 = _patterns.compile(r'^\s*BGP +main +routing +table +version'
+                                r' +(?P<bgp_table_version>[0-9]+)$')
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p12 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p12 = _patterns.compile(r'^\s*BGP +NSR +Initial +initsync +version'
+                                r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+                                r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p13 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p13 = _patterns.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+                                r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
 
         # BGP scan interval 60 secs 
-        p14 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
-                         r' +secs$')
+        p14 = _patterns.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+                                r' +secs$')
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p15 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p15 = _patterns.compile(r'^\s*Route +Distinguisher:'
+                                r' +(?P<route_distinguisher>\S+)'
+                                r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
 
         # *> 2001:db8:cdc9:190::/64   2001:db8:20:1:5::5
         # *>i[2][0][48][0014.01ff.0001][32][10.249.249.10]/136
         # *> [1][10.4.1.1:1][1234.bcff.5d7f.3e11.0505][12564523]/111
-        p16_1 = re.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                           r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
-                           r'(?: +(?P<next_hop>\S+))?$')
+        p16_1 = _patterns.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                                  r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
+                                  r'(?: +(?P<next_hop>\S+))?$')
 
         # 2219             0 200 33299 51178 47751 {27016} e
-        p16_2 = re.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
-                           r' +(?P<path>[0-9\{\}\s]+) '
-                           r'+(?P<origin_codes>(i|e|\?))$')
+        p16_2 = _patterns.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
+                                  r' +(?P<path>[0-9\{\}\s]+) '
+                                  r'+(?P<origin_codes>(i|e|\?))$')
 
         # Network            Next Hop   Metric LocPrf Weight Path
         # 172.16.2.88                        0    100      0 ?
         # 172.16.2.88                             100      0 i
         # 0.0.0.0                                          0 i
-        p16_3 = re.compile(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
-                           r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
-                           r' +(?P<origin_codes>(\?|i|e))$')
+        p16_3 = _patterns.compile(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
+                                  r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
+                                  r' +(?P<origin_codes>(\?|i|e))$')
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
         # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
         # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
         # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
-        p16 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))?'
-                         r' +(?P<next_hop>\S+) +(?P<number>[\d\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p16 = _patterns.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                                r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))?'
+                                r' +(?P<next_hop>\S+) +(?P<number>[\d\s\{\}]+)'
+                                r'(?: *(?P<origin_codes>(i|e|\?)))?$')
 
-        p17 = re.compile(r'(?P<path>[\d\s]+)'
-                         r' *(?P<origin_codes>(i|e|\?))?$')
+        p17 = _patterns.compile(r'(?P<path>[\d\s]+)'
+                                r' *(?P<origin_codes>(i|e|\?))?$')
 
         # Processed 40 prefixes, 50 paths
-        p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p18 = _patterns.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+                                r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -5288,10 +5332,10 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 
                 # Parse and set the numbers
                 group_num = group['number']
-                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
-                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
-                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>((\d+\s)|(\{\d+\}\s))+)$').match(group_num)
-                m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+) (?P<path>((\d+\s)|(\{\d+\}\s))+)$').match(group_num)
+                m4 = _patterns.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
                 if m1:
                     pfx_dict['metric'] = m1.groupdict()['metric']
                     pfx_dict['locprf'] = m1.groupdict()['locprf']
@@ -5381,20 +5425,20 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
         # 10.36.3.3         default                 0 65000     0     0  Established  None
         # 2001:1:1:1::1   default                 0 65000     0     0  Established  None
         # 10.1.7.212     default                 0 10396     0     0  Established  NSR Ready
-        p1 = re.compile(r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
+        p1 = _patterns.compile(r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
             '(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
             '(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
 
         # 2001:db8:4401:4453::6f9
-        p1_1 = re.compile(r'^(?P<neighbor>[\w\d:]+)$')
+        p1_1 = _patterns.compile(r'^(?P<neighbor>[\w\d:]+)$')
 
         # default 0 65000 0 0 Established NSR Ready
-        p1_2 = re.compile(r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
-                          r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
-                          r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
+        p1_2 = _patterns.compile(r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
+                                 r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
+                                 r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
 
         # BGP instance 0: 'default'
-        p2 = re.compile(r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$')
+        p2 = _patterns.compile(r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5541,11 +5585,11 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
         # VPWS:2078                        -           172.16.2.88:2078  2   L2evpn
         # VPWS:10293                       -           172.16.2.88:10293 2   L2evpn
         # EVPN-Multicast-BTV               -           172.16.2.88:1000  2   L2evpn
-        p1 = re.compile(r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
-                         ' +(?P<ref>(\d+)) +(?P<afs>(.*))$')
+        p1 = _patterns.compile(r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
+                                ' +(?P<ref>(\d+)) +(?P<afs>(.*))$')
 
         #                                                                  Vv6u, L2evpn
-        p2 = re.compile(r'^(?P<item>([a-zA-Z0-9\,\s]+))$')
+        p2 = _patterns.compile(r'^(?P<item>([a-zA-Z0-9\,\s]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5681,79 +5725,79 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
         bgp_table_version = local_router_id = ''
         prefix = ''
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[\w\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
-                            '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_1_1 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
-                            '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
-                            '+(?P<next_hop>[\w\.\/]+) +'
-                            '(?P<metric>\d+) +(?P<localprf>\d+) '
-                            '+(?P<weight>\d+) +(?P<path>[\d ]+) +'
-                            '(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_1_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            ' (?P<path_type>(i|e|c|l|a|r|I)) '
-                            '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[\w\.\:]{8,})'
-                            '(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3_2 = re.compile(r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
-                            '(?P<origin_codes>(i|e|\?|\|))$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
-                            '|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$')
+        p = _patterns.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = _patterns.compile(r'^\s*BGP +routing +table +information +for +VRF'
+                                   ' +(?P<vrf_name>\S+), +address +family'
+                                   ' +(?P<address_family>[\w\s\-\_]+)$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                   ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+                                   ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
+        p3_1 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
+                                   '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
+        p3_1_1 = _patterns.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+                                   '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
+                                   '+(?P<next_hop>[\w\.\/]+) +'
+                                   '(?P<metric>\d+) +(?P<localprf>\d+) '
+                                   '+(?P<weight>\d+) +(?P<path>[\d ]+) +'
+                                   '(?P<origin_codes>(i|e|\?|\||&))$')
+        p3_1_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   ' (?P<path_type>(i|e|c|l|a|r|I)) '
+                                   '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))'
+                                   '(?P<prefix>[\w\.\:\/\[\]\,]+)'
+                                   ' +(?P<next_hop>[\w\.\:]+)'
+                                   ' +(?P<numbers>[\w\s\(\)\{\}]+)'
+                                   ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                   '(?P<prefix>[\w\.\:\/\[\]\,]+)'
+                                   ' +(?P<next_hop>[\w\.\:]+)'
+                                   ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
+        p3_3 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   ' *(?P<next_hop>[\w\.\:]{8,})'
+                                   '(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
+                                   ' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                   ' +(?P<next_hop>[\w\.\:]+)'
+                                   ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
+        p3_3_2 = _patterns.compile(r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
+                                   '(?P<origin_codes>(i|e|\?|\|))$')
+        p3_4 = _patterns.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
+        p4 = _patterns.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
+                                   '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                   '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
+                                   '|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$')
         
-        p5 = re.compile(r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
-                         ', *local *AS *number *(?P<local_as>[0-9]+)$')
-        p6 =  re.compile(r'^\s*BGP *generic *scan *interval *'
-                            '(?P<generic_scan_interval>[0-9]+) *secs$')
-        p7 = re.compile(r'^\s*Non-stop *routing *is'
-                        ' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p8 = re.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p9 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         ' *RD *version: (?P<rd_version>[0-9]+)$')
-        p10 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         ' *(?P<bgp_table_version>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
-                            '(?P<nsr_initial_initsync_version>[0-9]+)'
-                          ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p12 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
-                            '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p13 = re.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
-        p14 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$')
-        p15 = re.compile(r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
-                            '(?: *(?P<origin_codes>(i|e|\?)))$')
-        p16 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
-                            '(?P<processed_paths>[0-9]+) +paths$')
+        p5 = _patterns.compile(r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
+                                ', *local *AS *number *(?P<local_as>[0-9]+)$')
+        p6 =  _patterns.compile(r'^\s*BGP *generic *scan *interval *'
+                                   '(?P<generic_scan_interval>[0-9]+) *secs$')
+        p7 = _patterns.compile(r'^\s*Non-stop *routing *is'
+                               ' *(?P<non_stop_routing>[A-Za-z]+)$')
+        p8 = _patterns.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
+        p9 = _patterns.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+                                ' *RD *version: (?P<rd_version>[0-9]+)$')
+        p10 = _patterns.compile(r'^\s*BGP *main *routing *table *version'
+                                ' *(?P<bgp_table_version>[0-9]+)$')
+        p11 = _patterns.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
+                                   '(?P<nsr_initial_initsync_version>[0-9]+)'
+                                 ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p12 = _patterns.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
+                                   '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p13 = _patterns.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
+        p14 = _patterns.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$')
+        p15 = _patterns.compile(r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
+                                   '(?: *(?P<origin_codes>(i|e|\?)))$')
+        p16 = _patterns.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
+                                   '(?P<processed_paths>[0-9]+) +paths$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5947,25 +5991,25 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     index_dict.update({'metric': int(m1.groupdict()['metric'])})
@@ -5997,25 +6041,25 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     index_dict.update({'metric': int(m1.groupdict()['metric'])})
@@ -6109,25 +6153,25 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     index_dict.update({'metric': int(m1.groupdict()['metric'])})
@@ -6285,7 +6329,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                     if group_num:
                         # metric   locprf  weight path
                         # 2219      211       0 200 33299 51178 47751 {27016}
-                        m1 = re.compile(r'^(?P<metric>[0-9]+)  +'
+                        m1 = _patterns.compile(r'^(?P<metric>[0-9]+)  +'
                                     '(?P<locprf>[0-9]+)  +'
                                     '(?P<weight>[0-9]+) '
                                     '(?P<path>[0-9\{\}\s]+)$').match(group_num)
@@ -6295,14 +6339,14 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                         # locprf   weight path
                         # 211         0 200 33299 51178 47751 {27016}
         
-                        m2 = re.compile(r'^(?P<value>[0-9]+)'
+                        m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
                                     '(?P<space>\s{2,20})'
                                     '(?P<weight>[0-9]+) '
                                     '(?P<path>[0-9\{\}\s]+)$').match(group_num)
         
                         # weight path
                         # 0 200 33299 51178 47751 {27016}
-                        m3 = re.compile(r'^(?P<weight>[0-9]+) '
+                        m3 = _patterns.compile(r'^(?P<weight>[0-9]+) '
                                     '(?P<path>((\d+\s)|(\{\d+\}\s))+)$')\
                                 .match(group_num)
         
@@ -6414,52 +6458,52 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
         index = 1
 
         # Route Distinguisher: 10.196.7.7:3
-        p1 = re.compile(r'^Route +Distinguisher: +(?P<rd>(\S+))$')
+        p1 = _patterns.compile(r'^Route +Distinguisher: +(?P<rd>(\S+))$')
 
         # [2][0][48][7777.77ff.7779][0]/104 is advertised to 10.55.0.10
         # [1][0009.08ff.0d0c.0403.0201][0]/120 is advertised to 10.100.5.5
-        p2 = re.compile(r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
-                         ' +advertised +to +(?P<neighbor>(\S+))$')
+        p2 = _patterns.compile(r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
+                                ' +advertised +to +(?P<neighbor>(\S+))$')
 
         #  Path info:
-        p3 = re.compile(r'^Path info:$')
+        p3 = _patterns.compile(r'^Path info:$')
 
         #    neighbor: Local           neighbor router id: 10.1.8.8
         #    neighbor: Local           neighbor router id: 10.196.7.7
-        p4 = re.compile(r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
-                         ' +id: +(?P<neighbor_router_id>(\S+))$')
+        p4 = _patterns.compile(r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
+                                ' +id: +(?P<neighbor_router_id>(\S+))$')
 
         #    valid  redistributed  best  import-candidate
-        p5 = re.compile(r'^(?P<flags>(valid.*))$')
+        p5 = _patterns.compile(r'^(?P<flags>(valid.*))$')
 
         #    Received Path ID 0, Local Path ID 0, version 12
-        p6 = re.compile(r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
-                         ' +Path +ID +(?P<local_path_id>(\d+)), +version'
-                         ' (?P<version>(\d+))$')
+        p6 = _patterns.compile(r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
+                                ' +Path +ID +(?P<local_path_id>(\d+)), +version'
+                                ' (?P<version>(\d+))$')
 
         #  Attributes after inbound policy was applied:
         #  Attributes after outbound policy was applied:
-        p7 = re.compile(r'^Attributes +after +(?P<type>(outbound|inbound))'
-                         ' +policy +was +applied:$')
+        p7 = _patterns.compile(r'^Attributes +after +(?P<type>(outbound|inbound))'
+                                ' +policy +was +applied:$')
 
         #    next hop: 10.1.8.8
-        p8 = re.compile(r'^next +hop:(?: +(?P<nexthop>(\S+)))?$')
+        p8 = _patterns.compile(r'^next +hop:(?: +(?P<nexthop>(\S+)))?$')
 
         #    EXTCOMM
         #    ORG AS EXTCOMM
-        p9 = re.compile(r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$')
+        p9 = _patterns.compile(r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$')
 
         #    origin: IGP  
-        p10 = re.compile(r'^origin:(?: +(?P<origin>.*))?$')
+        p10 = _patterns.compile(r'^origin:(?: +(?P<origin>.*))?$')
 
         #    aspath: 
-        p11 = re.compile(r'^aspath:(?: +(?P<aspath>.*))?$')
+        p11 = _patterns.compile(r'^aspath:(?: +(?P<aspath>.*))?$')
 
         #    community: no-export
-        p12 = re.compile(r'^community:(?: +(?P<community>.*))?$')
+        p12 = _patterns.compile(r'^community:(?: +(?P<community>.*))?$')
 
         #    extended community: SoO:0.0.0.0:0 RT:100:7
-        p13 = re.compile(r'^extended +community:(?: +(?P<extended_community>.*))?$')
+        p13 = _patterns.compile(r'^extended +community:(?: +(?P<extended_community>.*))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -33,6 +33,9 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import LineDispatcher
+from genie.libs.parser.utils.counters import CounterLines, CounterParser, \
+                                             load_interval
 
 logger = logging.getLogger(__name__)
 
@@ -2369,11 +2372,282 @@ class ShowInterfacesSchema(MetaParser):
     }
 
 
-class ShowInterfaces(ShowInterfacesSchema):
+# Patterns of the lines of show interfaces, matched by ShowInterfaces.cli()
+# and parse_counters()
+_show_interfaces_lines = LineDispatcher()
+
+# GigabitEthernet1 is up, line protocol is up
+# TenGigE0/0/0/4 is administratively down, line protocol is administratively down
+_show_interfaces_lines.add(
+    r'p1', r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
+          r'+line +protocol +is +(?P<line_protocol>[\w\s]+)$',
+    contains='protocol')
+
+# Interface state transitions: 9
+_show_interfaces_lines.add(
+    r'p2', r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$',
+    anchor='Interface state transitions:')
+
+# Hardware is Loopback
+# Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
+_show_interfaces_lines.add(
+    r'p3', r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
+          r'(, *address +is +(?P<mac_address>[\w\.]+))?'
+          r'( *\(bia *(?P<phys_address>[\w\.]+)\))?$',
+    anchor='Hardware is')
+
+# Layer 2 Transport Mode
+_show_interfaces_lines.add(
+    r'p4', r'^Layer +2 +Transport +Mode$',
+    anchor='Layer 2 Transport Mode')
+
+# Description: to-ML26-BE1
+_show_interfaces_lines.add(
+    r'p5', r'^Description: *(?P<description>.*)$',
+    anchor='Description:')
+
+# Internet address is 10.4.4.4/24
+# Internet address is Unknown
+_show_interfaces_lines.add(
+    r'p6', r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
+          r'\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$',
+    anchor='Internet')
+
+# MTU 1500 bytes, BW 10000 Kbit
+# MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
+_show_interfaces_lines.add(
+    r'p7', r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
+          r'(.*Max: +(?P<bandwidth_max>[\d]+).*)?$',
+    anchor='MTU')
+
+# reliability 255/255, txload 1/255, rxload 1/255
+# reliability Unknown, txload Unknown, rxload Unknown
+_show_interfaces_lines.add(
+    r'p8', r'^reliability +(?P<reliability>[\w\/]+), '
+          r'+txload +(?P<txload>[\w\/]+), +rxload '
+          r'+(?P<rxload>[\w\/]+)$',
+    anchor='reliability')
+
+# Encapsulation ARPA,
+# Encapsulation 802.1Q Virtual LAN,
+# Encapsulation ARPA,  loopback not set,
+# Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
+# Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+_show_interfaces_lines.add(
+    r'p9', r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
+          r'( +VLAN +Id +(?P<first_dot1q>\d+),)?'
+          r'( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
+          r'( +loopback +(?P<loopback>[\w\s]+),)?$',
+    anchor='Encapsulation')
+
+# Outer Match: Dot1Q VLAN 300
+_show_interfaces_lines.add(
+    r'p10', r'^Outer +Match: +(?P<outer_match>[\w\s]+)$',
+    anchor='Outer Match:')
+
+# Ethertype Any, MAC Match src any, dest any
+_show_interfaces_lines.add(
+    r'p11', r'^Ethertype +(?P<ethertype>\w+), '
+           r'+MAC +Match +(?P<mac_match>[\w\s]+), '
+           r'+dest +(?P<dest>\w+)$',
+    anchor='Ethertype')
+
+# Full-duplex, 0Kb/s
+# Full-duplex, 1000Mb/s, link type is force-up
+# Full-duplex, Auto Speed, SR, link type is force-up
+# Duplex unknown, 0Kb/s, THD, link type is autonegotiation
+_show_interfaces_lines.add(
+    r'p12', r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
+           r'+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
+           r'(, +link +type +is +(?P<link_type>\S+))?$')
+
+# output flow control is off, input flow control is off
+# output flow control is off, input flow control is unsupported
+_show_interfaces_lines.add(
+    r'p13', r'^output +flow +control +is +(?P<send>\w+), +'
+           r'input +flow +control +is +(?P<receive>\w+)$',
+    anchor='output flow control is')
+
+# Carrier delay (up) is 10 msec
+# Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
+_show_interfaces_lines.add(
+    r'p14', r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
+           r'(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$',
+    anchor='Carrier delay (up) is')
+
+# loopback not set,
+_show_interfaces_lines.add(
+    r'p15', r'^loopback +(?P<loopback>[\w\s]+),$',
+    anchor='loopback')
+
+# Last link flapped 5w6d
+_show_interfaces_lines.add(
+    r'p16', r'^Last +link +flapped +(?P<last_link_flapped>\S+)$',
+    anchor='Last link flapped')
+
+# ARP type ARPA, ARP timeout 04:00:00
+_show_interfaces_lines.add(
+    r'p17', r'^ARP +type +(?P<arp_type>\w+), +'
+           r'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$',
+    anchor='ARP type')
+
+# Last input never, output 00:01:05
+_show_interfaces_lines.add(
+    r'p18', r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+           r'output +(?P<last_output>[\w\.\:]+)$',
+    anchor='Last input')
+
+# No. of members in this bundle: 1
+_show_interfaces_lines.add(
+    r'p19', r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$',
+    anchor='No. of members in this bundle:')
+
+# TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
+_show_interfaces_lines.add(
+    r'p20', r'^(?P<interface>[\w\/\.]+) '
+           r'+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
+           r'+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
+
+# Last clearing of "show interface" counters 1d02h
+_show_interfaces_lines.add(
+    r'p21', r'^Last +clearing +of +"show +interface" +counters +'
+           r'(?P<last_clear>[\w\:\.]+)$',
+    anchor='Last clearing of')
+
+# 5 minute input rate 0 bits/sec, 0 packets/sec
+_show_interfaces_lines.add(
+    r'p23', r'^(?P<load_interval>[\d\#]+)'
+           r' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
+           r' +(?P<in_rate>[\d]+) +bits/sec,'
+           r' +(?P<in_rate_pkts>[\d]+) +packets/sec$',
+    contains='rate')
+
+# 5 minute output rate 0 bits/sec, 0 packets/sec
+_show_interfaces_lines.add(
+    r'p24', r'^(?P<load_interval>[\d\#]+)'
+           r' *(minute|second|minutes|seconds) +output +rate'
+           r' +(?P<out_rate>[\d]+) +bits/sec,'
+           r' +(?P<out_rate_pkts>[\d]+) +packets/sec$',
+    contains='rate')
+
+# 0 packets input, 0 bytes
+# 0 packets input, 0 bytes, 0 total input drops
+_show_interfaces_lines.add(
+    r'p25', r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
+           r'(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$',
+    anchor='0 packets input')
+
+# 1258859 drops for unrecognized upper-level protocol
+_show_interfaces_lines.add(
+    r'p26', r'(?P<in_unknown_protos>[\d]+) +drops +for '
+           r'+unrecognized +upper-level +protocol$',
+    anchor='0 drops for')
+
+# 0 input drops, 0 queue drops, 0 input errors
+_show_interfaces_lines.add(
+    r'p27', r'(?P<in_drops>[\d]+) +input +drops, '
+           r'+(?P<in_queue_drops>[\d]+) +queue +drops, '
+           r'+(?P<in_errors>[\d]+) +input +errors$',
+    anchor='0 input drops')
+
+# Received 0 broadcast packets, 0 multicast packets
+_show_interfaces_lines.add(
+    r'p28', r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
+           r'+(?P<in_multicast_pkts>\d+) +multicast +packets$',
+    anchor='Received')
+
+# 0 runts, 0 giants, 0 throttles, 0 parity
+_show_interfaces_lines.add(
+    r'p29', r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
+           r'+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$',
+    anchor='0 runts')
+
+# 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+_show_interfaces_lines.add(
+    r'p30', r'^(?P<in_errors>[\d]+) +input +errors, +'
+           r'(?P<in_crc_errors>[\d]+) +CRC, +'
+           r'(?P<in_frame>[\d]+) +frame, +'
+           r'(?P<in_overrun>[\d]+) +overrun, +'
+           r'(?P<in_ignored>[\d]+) +ignored, +'
+           r'(?P<in_abort>[\d]+) +abort$',
+    anchor='0 input errors')
+
+# 0 packets output, 0 bytes
+# 0 packets output, 0 bytes, 0 total output drops
+_show_interfaces_lines.add(
+    r'p31', r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
+           r'(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$',
+    anchor='0 packets output')
+
+# Output 0 broadcast packets, 178045 multicast packets
+_show_interfaces_lines.add(
+    r'p32', r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
+           r'+(?P<out_multicast_pkts>\d+) +multicast +packets$',
+    anchor='Output')
+
+# 0 output errors, 0 underruns, 0 applique, 0 resets
+_show_interfaces_lines.add(
+    r'p33', r'^(?P<out_errors>[\d]+) +output +errors, '
+           r'+(?P<out_underruns>[\d]+) +underruns, '
+           r'+(?P<out_applique>[\d]+) +applique, '
+           r'+(?P<out_resets>[\d]+) +resets$',
+    anchor='0 output errors')
+
+# 0 output drops, 0 queue drops, 0 output errors
+_show_interfaces_lines.add(
+    r'p34', r'(?P<out_drops>[\d]+) +output +drops, '
+           r'+(?P<out_queue_drops>[\d]+) +queue +drops, '
+           r'+(?P<out_errors>[\d]+) +output +errors$',
+    anchor='0 output drops')
+
+# 0 output buffer failures, 0 output buffers swapped out
+_show_interfaces_lines.add(
+    r'p35', r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
+           r'+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$',
+    anchor='0 output buffer failures')
+
+# 0 carrier transitions
+_show_interfaces_lines.add(
+    r'p36', r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$',
+    anchor='0 carrier transitions')
+
+
+def _counters(*names):
+    '''{counter: group} of counters named as their group'''
+    return {name: name for name in names}
+
+
+# Counters of show interfaces, as stored by ShowInterfaces.cli()
+_show_interfaces_counters = CounterLines(
+    lines=_show_interfaces_lines, interface='p1',
+    counters={
+        'p23': {'load_interval': load_interval, 'in_rate': 'in_rate',
+                'in_rate_pkts': 'in_rate_pkts'},
+        'p24': _counters('out_rate', 'out_rate_pkts'),
+        'p25': _counters('in_pkts', 'in_octets', 'in_total_drops'),
+        'p26': _counters('in_unknown_protos'),
+        'p27': _counters('in_drops', 'in_queue_drops', 'in_errors'),
+        'p28': _counters('in_broadcast_pkts', 'in_multicast_pkts'),
+        'p29': _counters('in_runts', 'in_giants', 'in_throttles',
+                         'in_parity'),
+        'p30': _counters('in_errors', 'in_crc_errors', 'in_frame',
+                         'in_overrun', 'in_ignored', 'in_abort'),
+        'p31': _counters('out_pkts', 'out_octets', 'out_total_drops'),
+        'p32': _counters('out_broadcast_pkts', 'out_multicast_pkts'),
+        'p33': _counters('out_errors', 'out_underruns', 'out_applique',
+                         'out_resets'),
+        'p34': _counters('out_drops', 'out_queue_drops', 'out_errors'),
+        'p35': _counters('out_buffer_failure', 'out_buffers_swapped'),
+        'p36': _counters('carrier_transitions'),
+    })
+
+
+class ShowInterfaces(ShowInterfacesSchema, CounterParser):
     """parser for show interfaces
                   show interfaces <interface>"""
 
     cli_command = ['show interfaces','show interfaces {interface}']
+    counter_lines = _show_interfaces_counters
     exclude = []
 
 
@@ -2389,183 +2663,15 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         result_dict = {}
 
-        # GigabitEthernet1 is up, line protocol is up 
-        # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-        p1 = re.compile(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
-                         '+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
-
-        # Interface state transitions: 9 
-        p2 = re.compile(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
-
-        # Hardware is Loopback
-        # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-        p3 = re.compile(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
-                         '(, *address +is +(?P<mac_address>[\w\.]+))?'
-                         '( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
-
-        # Layer 2 Transport Mode
-        p4 = re.compile(r'^Layer +2 +Transport +Mode$')
-
-        # Description: to-ML26-BE1
-        p5 = re.compile(r'^Description: *(?P<description>.*)$')
-
-        # Internet address is 10.4.4.4/24
-        # Internet address is Unknown
-        p6 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
-                         '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
-
-        # MTU 1500 bytes, BW 10000 Kbit
-        # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-        p7 = re.compile(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
-                         '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
-
-        # reliability 255/255, txload 1/255, rxload 1/255
-        # reliability Unknown, txload Unknown, rxload Unknown
-        p8 = re.compile(r'^reliability +(?P<reliability>[\w\/]+), '
-                         '+txload +(?P<txload>[\w\/]+), +rxload '
-                         '+(?P<rxload>[\w\/]+)$')
-
-        # Encapsulation ARPA,
-        # Encapsulation 802.1Q Virtual LAN,
-        # Encapsulation ARPA,  loopback not set,
-        # Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
-        # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-        p9 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
-                         '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
-                         '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
-                         '( +loopback +(?P<loopback>[\w\s]+),)?$')
-
-        # Outer Match: Dot1Q VLAN 300
-        p10 = re.compile(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
-
-        # Ethertype Any, MAC Match src any, dest any
-        p11 = re.compile(r'^Ethertype +(?P<ethertype>\w+), '
-                           '+MAC +Match +(?P<mac_match>[\w\s]+), '
-                           '+dest +(?P<dest>\w+)$')
-
-        # Full-duplex, 0Kb/s
-        # Full-duplex, 1000Mb/s, link type is force-up
-        # Full-duplex, Auto Speed, SR, link type is force-up
-        # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-        p12 = re.compile(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
-                          '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
-                          '(, +link +type +is +(?P<link_type>\S+))?$')
-
-        # output flow control is off, input flow control is off
-        # output flow control is off, input flow control is unsupported
-        p13 = re.compile(r'^output +flow +control +is +(?P<send>\w+), +'
-                          'input +flow +control +is +(?P<receive>\w+)$')
-
-        # Carrier delay (up) is 10 msec
-        # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-        p14 = re.compile(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
-                '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
-
-        # loopback not set,
-        p15 = re.compile(r'^loopback +(?P<loopback>[\w\s]+),$')
-
-        # Last link flapped 5w6d
-        p16 = re.compile(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
-
-        # ARP type ARPA, ARP timeout 04:00:00
-        p17 = re.compile(r'^ARP +type +(?P<arp_type>\w+), +'
-                          'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
-
-        # Last input never, output 00:01:05
-        p18 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+)$')
-
-        # No. of members in this bundle: 1
-        p19 = re.compile(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
-
-        # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-        p20 = re.compile(r'^(?P<interface>[\w\/\.]+) '
-                          '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
-                          '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
-
-        # Last clearing of "show interface" counters 1d02h
-        p21 = re.compile(r'^Last +clearing +of +"show +interface" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
-
-        # Input/output data rate is disabled.
-        p22 = re.compile(r'^Input\/output +data +rate +is +disabled\.$')
-
-        # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p23 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
-                          ' +(?P<in_rate>[\d]+) +bits/sec,'
-                          ' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
-
-        # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p24 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(minute|second|minutes|seconds) +output +rate'
-                          ' +(?P<out_rate>[\d]+) +bits/sec,'
-                          ' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
-
-        # 0 packets input, 0 bytes
-        # 0 packets input, 0 bytes, 0 total input drops
-        p25 = re.compile(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
-                          '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
-
-        # 1258859 drops for unrecognized upper-level protocol
-        p26 = re.compile(r'(?P<in_unknown_protos>[\d]+) +drops +for '
-                          '+unrecognized +upper-level +protocol$')
-
-        # 0 input drops, 0 queue drops, 0 input errors
-        p27 = re.compile(r'(?P<in_drops>[\d]+) +input +drops, '
-                          '+(?P<in_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<in_errors>[\d]+) +input +errors$')
-
-        # Received 0 broadcast packets, 0 multicast packets
-        p28 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<in_multicast_pkts>\d+) +multicast +packets$')
-
-        # 0 runts, 0 giants, 0 throttles, 0 parity
-        p29 = re.compile(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
-                          '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
-
-        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p30 = re.compile(r'^(?P<in_errors>[\d]+) +input +errors, +'
-                          '(?P<in_crc_errors>[\d]+) +CRC, +'
-                          '(?P<in_frame>[\d]+) +frame, +'
-                          '(?P<in_overrun>[\d]+) +overrun, +'
-                          '(?P<in_ignored>[\d]+) +ignored, +'
-                          '(?P<in_abort>[\d]+) +abort$')
-
-        # 0 packets output, 0 bytes
-        # 0 packets output, 0 bytes, 0 total output drops
-        p31 = re.compile(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
-                          '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
-
-        # Output 0 broadcast packets, 178045 multicast packets
-        p32 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<out_multicast_pkts>\d+) +multicast +packets$')
-        
-        # 0 output errors, 0 underruns, 0 applique, 0 resets
-        p33 = re.compile(r'^(?P<out_errors>[\d]+) +output +errors, '
-                          '+(?P<out_underruns>[\d]+) +underruns, '
-                          '+(?P<out_applique>[\d]+) +applique, '
-                          '+(?P<out_resets>[\d]+) +resets$')
-
-        # 0 output drops, 0 queue drops, 0 output errors
-        p34 = re.compile(r'(?P<out_drops>[\d]+) +output +drops, '
-                          '+(?P<out_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<out_errors>[\d]+) +output +errors$')
-
-        # 0 output buffer failures, 0 output buffers swapped out
-        p35 = re.compile(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
-                          '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
-
-        # 0 carrier transitions
-        p36 = re.compile(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
-
         for line in out.splitlines():
             line = line.strip()
+            rule, m = _show_interfaces_lines.match(line)
+            if not m:
+                continue
 
             # GigabitEthernet1 is up, line protocol is up
             # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-            m = p1.match(line)
-            if m:
+            if rule == 'p1':
                 group = m.groupdict()
                 interface = group['interface']
                 enabled = group['enabled']
@@ -2583,16 +2689,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface state transitions: 9
-            m = p2.match(line)
-            if m:
+            if rule == 'p2':
                 interface_state_transitions = int(m.groupdict()['interface_state_transitions'])
                 intf_dict['interface_state_transitions'] = interface_state_transitions
                 continue
 
             # Hardware is Loopback
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-            m = p3.match(line)
-            if m:
+            if rule == 'p3':
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -2604,22 +2708,19 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Layer 2 Transport Mode
-            m = p4.match(line)
-            if m:
+            if rule == 'p4':
                 intf_dict['layer2'] = True
                 continue
 
             # Description: desc
-            m = p5.match(line)
-            if m:
+            if rule == 'p5':
                 description = m.groupdict()['description']
                 intf_dict['description'] = description
                 continue
 
             # Internet Address is 10.4.4.4/24
             # Internet address is Unknown
-            m = p6.match(line)
-            if m:
+            if rule == 'p6':
                 ipv4 = m.groupdict()['ipv4']
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2633,8 +2734,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # MTU 1500 bytes, BW 10000 Kbit
             # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-            m = p7.match(line)
-            if m:
+            if rule == 'p7':
                 mtu = m.groupdict()['mtu']
                 bandwidth = m.groupdict()['bandwidth']
                 bandwidth_max = m.groupdict()['bandwidth_max']
@@ -2646,8 +2746,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p8.match(line)
-            if m:
+            if rule == 'p8':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -2660,8 +2759,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation ARPA,
             # Encapsulation 802.1Q Virtual LAN, Vlan ID 1, loopback not set
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            m = p9.match(line)
-            if m:
+            if rule == 'p9':
                 group = m.groupdict()
                 encapsulation = group['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -2683,15 +2781,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Outer Match: Dot1Q VLAN 300
-            m = p10.match(line)
-            if m:
+            if rule == 'p10':
                 outer_match = m.groupdict()['outer_match']
                 encap_dict['outer_match'] = outer_match
                 continue
 
             # Ethertype Any, MAC Match src any, dest any
-            m = p11.match(line)
-            if m:
+            if rule == 'p11':
                 group = m.groupdict()
                 ethertype = group['ethertype']
                 mac_match = group['mac_match']
@@ -2706,8 +2802,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Full-duplex, 1000Mb/s, link type is force-up
             # Full-duplex, Auto Speed, SR, link type is force-up
             # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-            m = p12.match(line)
-            if m:
+            if rule == 'p12':
                 group = m.groupdict()
                 duplex_mode = group['duplex_mode'].lower()
                 duplex_mode = duplex_mode.replace("duplex", "").replace("-","")
@@ -2728,8 +2823,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # output flow control is off, input flow control is off
-            m = p13.match(line)
-            if m:
+            if rule == 'p13':
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
                 flow_dict = intf_dict.setdefault('flow_control', {})
@@ -2747,8 +2841,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Carrier delay (up) is 10 msec
             # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-            m = p14.match(line)
-            if m:
+            if rule == 'p14':
                 group = m.groupdict()
                 carrier_delay_up = group['carrier_delay_up']
                 carrier_delay_down = group['carrier_delay_down']
@@ -2760,23 +2853,20 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # loopback not set,
-            m = p15.match(line)
-            if m:
+            if rule == 'p15':
                 loopback = m.groupdict()['loopback']
                 intf_dict['loopback'] = loopback
                 continue
 
             # Last link flapped 5w6d
-            m = p16.match(line)
-            if m:
+            if rule == 'p16':
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 intf_dict['last_link_flapped'] = last_link_flapped
                 continue
 
 
             # ARP type ARPA, ARP timeout 04:00:00
-            m = p17.match(line)
-            if m:
+            if rule == 'p17':
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
                 intf_dict['arp_type'] = arp_type
@@ -2784,8 +2874,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05
-            m = p18.match(line)
-            if m:
+            if rule == 'p18':
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
                 intf_dict['last_input'] = last_input
@@ -2793,15 +2882,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of members in this bundle: 1
-            m = p19.match(line)
-            if m:
+            if rule == 'p19':
                 port_dict = intf_dict.setdefault('port_channel', {})
                 port_dict['member_count'] = int(m.groupdict()['member_count'])
                 continue
 
             # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-            m = p20.match(line)
-            if m:
+            if rule == 'p20':
                 group = m.groupdict()
                 interface = group['interface']
                 duplex_mode = group['duplex_mode']
@@ -2816,16 +2903,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p21.match(line)
-            if m:
+            if rule == 'p21':
                 last_clear = m.groupdict()['last_clear']
                 counter_dict = intf_dict.setdefault('counters', {})
                 counter_dict['last_clear'] = last_clear
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p23.match(line)
-            if m:
+            if rule == 'p23':
                 group = m.groupdict()
                 load_interval = int(group['load_interval'])
                 in_rate = int(group['in_rate'])
@@ -2843,8 +2928,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p24.match(line)
-            if m:
+            if rule == 'p24':
                 group = m.groupdict()
                 out_rate = int(group['out_rate'])
                 out_rate_pkts = int(group['out_rate_pkts'])
@@ -2856,8 +2940,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 packets input, 0 bytes
             # 0 packets input, 0 bytes, 0 total input drops
-            m = p25.match(line)
-            if m:
+            if rule == 'p25':
                 group = m.groupdict()
                 counter_dict = intf_dict.setdefault('counters', {})
                 for k, v in group.items():
@@ -2866,43 +2949,37 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 1258859 drops for unrecognized upper-level protocol
-            m = p26.match(line)
-            if m:
+            if rule == 'p26':
                 counter_dict['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
                 continue
 
             # 0 input drops, 0 queue drops, 0 input errors
-            m = p27.match(line)
-            if m:
+            if rule == 'p27':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # Received 0 broadcast packets, 0 multicast packets
-            m = p28.match(line)
-            if m:
+            if rule == 'p28':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 runts, 0 giants, 0 throttles, 0 parity
-            m = p29.match(line)
-            if m:
+            if rule == 'p29':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p30.match(line)
-            if m:
+            if rule == 'p30':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 packets output, 0 bytes
             # 0 packets output, 0 bytes, 0 total output drops
-            m = p31.match(line)
-            if m:
+            if rule == 'p31':
                 group = m.groupdict()
                 for k, v in group.items():
                     if v:
@@ -2910,37 +2987,32 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output 0 broadcast packets, 178045 multicast packets
-            m = p32.match(line)
-            if m:
+            if rule == 'p32':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
 
             # 0 output errors, 0 underruns, 0 applique, 0 resets
-            m = p33.match(line)
-            if m:
+            if rule == 'p33':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output drops, 0 queue drops, 0 output errors
-            m = p34.match(line)
-            if m:
+            if rule == 'p34':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p35.match(line)
-            if m:
+            if rule == 'p35':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 carrier transitions
-            m = p36.match(line)
-            if m:
+            if rule == 'p36':
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
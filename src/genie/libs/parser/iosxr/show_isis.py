@@ -26,6 +26,10 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+
+# Patterns of the parsers in this module, compiled once
+_patterns = PatternTable()
 
 #============================================
 # Schema for 'show isis fast-reroute summary'
@@ -85,10 +89,10 @@ class ShowIsisFastRerouteSummary(ShowIsisFastRerouteSummarySchema):
 
 
         # IS-IS SR IPv4 Unicast FRR summary
-        p1 = re.compile(r'IS-IS +(?P<instance>\S+) +(?P<topology>\S+\s+\S+) +FRR +summary')
+        p1 = _patterns.compile(r'IS-IS +(?P<instance>\S+) +(?P<topology>\S+\s+\S+) +FRR +summary')
 
         # Prefixes reachable in L1
-        p2 = re.compile(r'Prefixes +reachable +in +L(?P<level>\d+)')
+        p2 = _patterns.compile(r'Prefixes +reachable +in +L(?P<level>\d+)')
 
         #                       Critical   High       Medium     Low        Total
         #                       Priority   Priority   Priority   Priority
@@ -96,10 +100,10 @@ class ShowIsisFastRerouteSummary(ShowIsisFastRerouteSummarySchema):
         # All paths protected     0          0          0          0          0
         # Some paths protected    0          0          0          0          0
         # Unprotected             0          0          4          6          10
-        p3 = re.compile(r'(?P<name>[\S\s]+) +(?P<critical_priority>\d+) +(?P<high_priority>\d+) +(?P<medium_priority>\d+) +(?P<low_priority>\d+) +(?P<total>\d+)')
+        p3 = _patterns.compile(r'(?P<name>[\S\s]+) +(?P<critical_priority>\d+) +(?P<high_priority>\d+) +(?P<medium_priority>\d+) +(?P<low_priority>\d+) +(?P<total>\d+)')
 
         # Protection coverage     0.00%      0.00%      0.00%      0.00%      0.00%
-        p4 = re.compile(r'Protection +coverage +(?P<critical_priority>[\d\.\%]+) +(?P<high_priority>[\d\.\%]+) +(?P<medium_priority>[\d\.\%]+) +(?P<low_priority>[\d\.\%]+) +(?P<total>[\d\.\%]+)')
+        p4 = _patterns.compile(r'Protection +coverage +(?P<critical_priority>[\d\.\%]+) +(?P<high_priority>[\d\.\%]+) +(?P<medium_priority>[\d\.\%]+) +(?P<low_priority>[\d\.\%]+) +(?P<total>[\d\.\%]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -201,18 +205,18 @@ class ShowIsisAdjacency(ShowIsisAdjacencySchema):
         vrf = 'default'
 
         # IS-IS p Level-1 adjacencies:
-        p1 = re.compile(r'^IS-IS +(?P<isis_name>\w+) +(?P<level_name>\S+) adjacencies:$')
+        p1 = _patterns.compile(r'^IS-IS +(?P<isis_name>\w+) +(?P<level_name>\S+) adjacencies:$')
 
         # 12a4           PO0/1/0/1        *PtoP*         Up    23       00:00:06 Capable  None
-        p2 = re.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
-                         '+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<bfd>(Up|Down|None|Init))$')
+        p2 = _patterns.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
+                                '+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<bfd>(Up|Down|None|Init))$')
 
         # Total adjacency count: 1
-        p3 = re.compile(r'^Total +adjacency +count: +(?P<adjacency_count>(\d+))$')
+        p3 = _patterns.compile(r'^Total +adjacency +count: +(?P<adjacency_count>(\d+))$')
 
         # R1_xe          Gi0/0/0/0.115    fa16.3eff.4f49 Up    26   22:30:26 Yes None None
-        p4 = re.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
-                         '+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<ipv4_bfd>([\s\w]+)) +(?P<ipv6_bfd>([\w\s]+))$')
+        p4 = _patterns.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
+                                '+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<ipv4_bfd>([\s\w]+)) +(?P<ipv6_bfd>([\w\s]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -334,14 +338,14 @@ class ShowIsisNeighbors(ShowIsisNeighborsSchema):
         vrf = 'default'
 
         # IS-IS 4445 neighbors:
-        p1 = re.compile(r'^IS-IS\s+(?P<isis_name>\S+)\s*neighbors:$')
+        p1 = _patterns.compile(r'^IS-IS\s+(?P<isis_name>\S+)\s*neighbors:$')
 
         # R1_xe          Gi0/0/0/0.115    fa16.3eff.4f49 Up    24       L1L2 Capable
-        p2 = re.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None|Init)+) +(?P<holdtime>\S+) '
-                         '+(?P<type>\S+) +(?P<ietf_nsf>\S+)$')
+        p2 = _patterns.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None|Init)+) +(?P<holdtime>\S+) '
+                                '+(?P<type>\S+) +(?P<ietf_nsf>\S+)$')
 
         # Total neighbor count: 1
-        p3 = re.compile(r'^Total\sneighbor\scount:\s+(?P<neighbor_count>\S+)$')
+        p3 = _patterns.compile(r'^Total\sneighbor\scount:\s+(?P<neighbor_count>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -419,13 +423,13 @@ class ShowIsisSegmentRoutingLabelTable(ShowIsisSegmentRoutingLabelTableSchema):
         isis_dict = {}
 
         # IS-IS SR IS Label Table
-        p1 = re.compile(r'^IS-IS\s+(?P<instance>\S+)\s+IS\s+Label\s+Table$')
+        p1 = _patterns.compile(r'^IS-IS\s+(?P<instance>\S+)\s+IS\s+Label\s+Table$')
 
         # Label         Prefix/Interface
         # ----------    ----------------
         # 16001         Loopback0
         # 16002         10.2.2.2/32
-        p2 = re.compile(r'^(?P<label>\d+)\s+(?P<prefix_interface>\S+)$')
+        p2 = _patterns.compile(r'^(?P<label>\d+)\s+(?P<prefix_interface>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -528,97 +532,97 @@ class ShowIsis(ShowIsisSchema):
             output = self.device.execute(self.cli_command)
 
         # IS-IS Router: test
-        r1 = re.compile(r'IS\-IS\s+Router\s*:\s*(?P<isis_router>\S+)')
+        r1 = _patterns.compile(r'IS\-IS\s+Router\s*:\s*(?P<isis_router>\S+)')
 
         # VRF context: VRF1
-        r2 = re.compile(r'VRF\s+context\s*:\s*(?P<vrf>.+)')
+        r2 = _patterns.compile(r'VRF\s+context\s*:\s*(?P<vrf>.+)')
 
         # System Id: 3333.33ff.6666
-        r3 = re.compile(r'System\s+Id\s*:\s*(?P<system_id>\S+)')
+        r3 = _patterns.compile(r'System\s+Id\s*:\s*(?P<system_id>\S+)')
 
         # Instance Id: 0
-        r4 = re.compile(r'Instance\s+Id\s*:\s*(?P<instance_id>\S+)')
+        r4 = _patterns.compile(r'Instance\s+Id\s*:\s*(?P<instance_id>\S+)')
 
         # IS Levels: level-1-2
         # IS Levels: level-2-only
         # IS Levels: level-1-only
         # IS Levels: level-1
-        r5 = re.compile(r'IS\s+Levels\s*:\s*(?P<is_levels>\S+)')
+        r5 = _patterns.compile(r'IS\s+Levels\s*:\s*(?P<is_levels>\S+)')
 
         # Manual area address(es):
-        r6 = re.compile(r'Manual\s+area\s+address\(es\):')
+        r6 = _patterns.compile(r'Manual\s+area\s+address\(es\):')
 
         # Routing for area address(es):
-        r7 = re.compile(r'Routing\s+for\s+area\s+address\(es\):')
+        r7 = _patterns.compile(r'Routing\s+for\s+area\s+address\(es\):')
 
         # 49.0002
-        r8 = re.compile(r'(?P<area_address>\d+\.\d+)')
+        r8 = _patterns.compile(r'(?P<area_address>\d+\.\d+)')
 
         # Non-stop forwarding: Disabled
-        r9 = re.compile(r'Non\-stop\s+forwarding\s*:\s*(?P<non_stop_forwarding>\w+)')
+        r9 = _patterns.compile(r'Non\-stop\s+forwarding\s*:\s*(?P<non_stop_forwarding>\w+)')
 
         # Most recent startup mode: Cold Restart
-        r10 = re.compile(r'Most\s+recent\s+startup\s+mode\s*:\s*(?P<most_recent_startup_mode>.+)')
+        r10 = _patterns.compile(r'Most\s+recent\s+startup\s+mode\s*:\s*(?P<most_recent_startup_mode>.+)')
 
         # TE connection status: Down
-        r11 = re.compile(r'TE\s+connection\s+status\s*:\s*(?P<te_connection_status>.+)')
+        r11 = _patterns.compile(r'TE\s+connection\s+status\s*:\s*(?P<te_connection_status>.+)')
 
         # Topologies supported by IS-IS:
-        r12 = re.compile(r'Topologies\s+supported\s+by\s+IS\-IS:')
+        r12 = _patterns.compile(r'Topologies\s+supported\s+by\s+IS\-IS:')
 
         # IPv4 Unicast
         # IPv6 Unicast
         # IPv4 Unicast VRF VRF1
-        r13 = re.compile(r'(?P<topology>(IPv6|IPv4)\s+Unicast)'
-                          '(\s*VRF\s*(?P<topology_vrf>\S+))?')
+        r13 = _patterns.compile(r'(?P<topology>(IPv6|IPv4)\s+Unicast)'
+                                 '(\s*VRF\s*(?P<topology_vrf>\S+))?')
 
         # Level-1
         # Level-2
-        r14 = re.compile(r'Level\-(?P<level>\d+)')
+        r14 = _patterns.compile(r'Level\-(?P<level>\d+)')
 
         # Metric style (generate/accept): Wide/Wide
-        r15 = re.compile(r'Metric\s+style\s*\(generate\/accept\)\s*:\s*'
-                          '(?P<generate_style>\w+)\/(?P<accept_style>\w+)')
+        r15 = _patterns.compile(r'Metric\s+style\s*\(generate\/accept\)\s*:\s*'
+                                 '(?P<generate_style>\w+)\/(?P<accept_style>\w+)')
 
         # Metric: 10
-        r16 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)')
+        r16 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)')
 
         # ISPF status: Disabled
-        r17 = re.compile(r'ISPF\s+status\s*:\s*(?P<ispf_status>\w+)')
+        r17 = _patterns.compile(r'ISPF\s+status\s*:\s*(?P<ispf_status>\w+)')
 
         # No protocols redistributed
-        r18 = re.compile(r'No\s+protocols\s+redistributed')
+        r18 = _patterns.compile(r'No\s+protocols\s+redistributed')
 
         # Distance: 115
-        r19 = re.compile(r'Distance\s*:\s*(?P<distance>\d+)')
+        r19 = _patterns.compile(r'Distance\s*:\s*(?P<distance>\d+)')
 
         # Advertise Passive Interface Prefixes Only: No
-        r20 = re.compile(r'Advertise\s+Passive\s+Interface\s+Prefixes\s+Only'
-                          '\s*:\s*(?P<adv_passive_only>\S+)')
+        r20 = _patterns.compile(r'Advertise\s+Passive\s+Interface\s+Prefixes\s+Only'
+                                 '\s*:\s*(?P<adv_passive_only>\S+)')
 
         # SRLB not allocated
         # SRLB allocated: 15000 - 15999
-        r21 = re.compile(r'SRLB\s*(?P<srlb>[\w\s]+)'
-                          '(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
+        r21 = _patterns.compile(r'SRLB\s*(?P<srlb>[\w\s]+)'
+                                 '(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
 
         # SRGB allocated: 16000 - 81534
         # SRGB not allocated
-        r22 = re.compile(r'SRGB\s*(?P<srgb>[\w\s]+)'
-                          '(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
+        r22 = _patterns.compile(r'SRGB\s*(?P<srgb>[\w\s]+)'
+                                 '(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
 
         # Loopback0 is running actively (active in configuration)
         # GigabitEthernet0/0/0/0 is running actively (active in configuration)
-        r23 = re.compile(r'(?P<interface>\S+)\s+is\s+(?P<running_state>[\s\w]+)'
-                          '\s+\((?P<configuration_state>[\w\s]+)\)')
+        r23 = _patterns.compile(r'(?P<interface>\S+)\s+is\s+(?P<running_state>[\s\w]+)'
+                                 '\s+\((?P<configuration_state>[\w\s]+)\)')
 
         # OSPF process 75688
-        r24 = re.compile(r'^(?P<protocol>\S+) process +(?P<process>\d+)$')
+        r24 = _patterns.compile(r'^(?P<protocol>\S+) process +(?P<process>\d+)$')
 
         # Connected
-        r25 = re.compile(r'^Connected$')
+        r25 = _patterns.compile(r'^Connected$')
 
         # Static
-        r26 = re.compile(r'^Static$')
+        r26 = _patterns.compile(r'^Static$')
 
 
         parsed_output = {}
@@ -965,13 +969,13 @@ class ShowIsisHostname(ShowIsisHostnameSchema):
             output = self.device.execute(command)
 
         # IS-IS TEST1 hostnames
-        r1 = re.compile(r'IS\-IS\s(?P<isis>.+)\s+hostnames')
+        r1 = _patterns.compile(r'IS\-IS\s(?P<isis>.+)\s+hostnames')
 
         # 2     1720.18ff.0254 tor-28.tenlab-cloud
         # 2     1720.18ff.0213 leaf-2.qa-site1
         # 2     1720.18ff.0250 tor-23.tenlab-cloud
-        r2 = re.compile(r'(?P<level>[\d\,]+)\s+(?P<local_router>\**)\s+'
-                         '(?P<system_id>\S+)\s+(?P<dynamic_hostname>\S+)')
+        r2 = _patterns.compile(r'(?P<level>[\d\,]+)\s+(?P<local_router>\**)\s+'
+                                '(?P<system_id>\S+)\s+(?P<dynamic_hostname>\S+)')
 
         parsed_output = {}
         vrf = 'default'
@@ -1157,130 +1161,130 @@ class ShowIsisStatistics(ShowIsisStatisticsSchema):
             output = self.device.execute(self.cli_command)
 
         # IS-IS test statistics:
-        r1 = re.compile(r'IS\-IS\s+(?P<isis>.+)\s+statistics\:')
+        r1 = _patterns.compile(r'IS\-IS\s+(?P<isis>.+)\s+statistics\:')
 
         # Fast PSNP cache (hits/tries): 21/118
-        r2 = re.compile(r'Fast\s+PSNP\s+cache\s*\(hits/tries\): '
-                        r'(?P<psnp_cach_hits>\d+)/(?P<psnp_cach_tries>\d+)')
+        r2 = _patterns.compile(r'Fast\s+PSNP\s+cache\s*\(hits/tries\): '
+                               r'(?P<psnp_cach_hits>\d+)/(?P<psnp_cach_tries>\d+)')
 
         # Fast CSNP cache (hits/tries): 1398/1501
-        r3 = re.compile(r'Fast\s+CSNP\s+cache\s*\(hits/tries\): '
-                        r'(?P<csnp_cach_hits>\d+)/(?P<csnp_cach_tries>\d+)')
+        r3 = _patterns.compile(r'Fast\s+CSNP\s+cache\s*\(hits/tries\): '
+                               r'(?P<csnp_cach_hits>\d+)/(?P<csnp_cach_tries>\d+)')
 
         # Fast CSNP cache updates: 204
-        r4 = re.compile(r'Fast\s+CSNP\s+cache\s+updates\s*:\s*'
-                        r'(?P<csnp_cache_updates>\d+)')
+        r4 = _patterns.compile(r'Fast\s+CSNP\s+cache\s+updates\s*:\s*'
+                               r'(?P<csnp_cache_updates>\d+)')
 
         # LSP checksum errors received: 0
-        r5 = re.compile(r'LSP\s+checksum\s+errors\s+received\s*:\s*'
-                        r'(?P<lsp_checksum_errors_received>\d+)')
+        r5 = _patterns.compile(r'LSP\s+checksum\s+errors\s+received\s*:\s*'
+                               r'(?P<lsp_checksum_errors_received>\d+)')
 
         # LSP Dropped: 0
-        r6 = re.compile(r'LSP\s+Dropped\s*:\s*(?P<lsp_dropped>\d+)')
+        r6 = _patterns.compile(r'LSP\s+Dropped\s*:\s*(?P<lsp_dropped>\d+)')
 
         # SNP Dropped: 0
-        r7 = re.compile(r'SNP\s+Dropped\s*:\s*(?P<snp_dropped>\d+)')
+        r7 = _patterns.compile(r'SNP\s+Dropped\s*:\s*(?P<snp_dropped>\d+)')
 
         # UPD Max Queue size: 3
-        r8 = re.compile(r'UPD\s+Max\s+Queue\s+size\s*:\s*'
-                        r'(?P<upd_max_queue_size>\d+)')
+        r8 = _patterns.compile(r'UPD\s+Max\s+Queue\s+size\s*:\s*'
+                               r'(?P<upd_max_queue_size>\d+)')
 
         # UPD Queue size: 0
-        r9 = re.compile(r'UPD\s+Queue\s+size\s*:\s*(?P<upd_queue_size>\d+)')
+        r9 = _patterns.compile(r'UPD\s+Queue\s+size\s*:\s*(?P<upd_queue_size>\d+)')
 
         # Average transmit times and rate:
-        r10 = re.compile(r'Average\s+transmit\s+times\s+and\s+rate\s*:')
+        r10 = _patterns.compile(r'Average\s+transmit\s+times\s+and\s+rate\s*:')
 
         # Average process times and rate:
-        r11 = re.compile(r'Average\s+process\s+times\s+and\s+rate\s*:')
+        r11 = _patterns.compile(r'Average\s+process\s+times\s+and\s+rate\s*:')
 
         # Hello:          0 s,      66473 ns,         15/s
-        r12 = re.compile(r'Hello\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+'
-                         r'(?P<time_ns>\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
+        r12 = _patterns.compile(r'Hello\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+'
+                                r'(?P<time_ns>\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
 
         # CSNP:           0 s,      26914 ns,          1/s
-        r13 = re.compile(r'CSNP\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+'
-                         r'(?P<time_ns>\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
+        r13 = _patterns.compile(r'CSNP\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+'
+                                r'(?P<time_ns>\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
 
         # PSNP:           0 s,       4113 ns,          0/s
-        r14 = re.compile(r'PSNP\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+'
-                         r'(?P<time_ns>\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
+        r14 = _patterns.compile(r'PSNP\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+'
+                                r'(?P<time_ns>\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
 
         # LSP:            0 s,      52706 ns,          0/s
-        r15 = re.compile(r'LSP\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+(?P<time_ns>'
-                         r'\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
+        r15 = _patterns.compile(r'LSP\s*:\s+(?P<time_s>\d+)\s*\w+\,\s+(?P<time_ns>'
+                                r'\d+)\s*\w+\,\s+(?P<rate>\d+)/\w+')
 
         # Level-1:
-        r16 = re.compile(r'Level\-(?P<level>\d+):')
+        r16 = _patterns.compile(r'Level\-(?P<level>\d+):')
 
         # LSPs sourced (new/refresh): 11/15
         # LSPs sourced (new/refresh): 13/11
-        r17 = re.compile(r'LSPs\s+sourced\s*\(new/refresh\)\s*:\s*'
-                         r'(?P<lsp_source_new>\d+)\/(?P<lsp_source_refresh>\d+)')
+        r17 = _patterns.compile(r'LSPs\s+sourced\s*\(new/refresh\)\s*:\s*'
+                                r'(?P<lsp_source_new>\d+)\/(?P<lsp_source_refresh>\d+)')
 
         # IPv4 Unicast
         # IPv6 Unicast
-        r18 = re.compile(r'(?P<address_family>(IPv4|IPv6) Unicast)')
+        r18 = _patterns.compile(r'(?P<address_family>(IPv4|IPv6) Unicast)')
 
         # Total SPF calculations     : 23
-        r19 = re.compile(r'Total\s+SPF\s+calculations\s*:\s*'
-                         r'(?P<total_spf_calculation>\d+)')
+        r19 = _patterns.compile(r'Total\s+SPF\s+calculations\s*:\s*'
+                                r'(?P<total_spf_calculation>\d+)')
 
         # Full SPF calculations      : 16
-        r20 = re.compile(r'Full\s+SPF\s+calculations\s*:\s*'
-                         r'(?P<full_spf_calculation>\d+)')
+        r20 = _patterns.compile(r'Full\s+SPF\s+calculations\s*:\s*'
+                                r'(?P<full_spf_calculation>\d+)')
 
         # ISPF calculations          : 0
-        r21 = re.compile(r'ISPF\s+calculations\s*:\s*'
-                         r'(?P<ispf_calculation>\d+)')
+        r21 = _patterns.compile(r'ISPF\s+calculations\s*:\s*'
+                                r'(?P<ispf_calculation>\d+)')
 
         # Next Hop Calculations      : 0
-        r22 = re.compile(r'Next\s+Hop\s+Calculations\s*:\s*'
-                         r'(?P<next_hop_calculation>\d+)')
+        r22 = _patterns.compile(r'Next\s+Hop\s+Calculations\s*:\s*'
+                                r'(?P<next_hop_calculation>\d+)')
 
         # Partial Route Calculations : 2
-        r23 = re.compile(r'Partial\s+Route\s+Calculations\s*:\s*'
-                         r'(?P<partial_route_calculation>\d+)')
+        r23 = _patterns.compile(r'Partial\s+Route\s+Calculations\s*:\s*'
+                                r'(?P<partial_route_calculation>\d+)')
 
         # Periodic SPF calculations  : 3
-        r24 = re.compile(r'Periodic\s+SPF\s+calculations\s*:\s*'
-                         r'(?P<periodic_spf_calculation>\d+)')
+        r24 = _patterns.compile(r'Periodic\s+SPF\s+calculations\s*:\s*'
+                                r'(?P<periodic_spf_calculation>\d+)')
 
         # Interface Loopback0:
         # Interface GigabitEthernet0/0/0/1:
-        r25 = re.compile(r'Interface\s+(?P<interface>\S+):')
+        r25 = _patterns.compile(r'Interface\s+(?P<interface>\S+):')
 
         # Level-1 LSPs (sent/rcvd)  : 0/0
         # Level-2 LSPs (sent/rcvd)  : 0/0
-        r26 = re.compile(r'Level\-(?P<level>\d+)\s+LSPs\s+\(sent\/rcvd\)\s*:'
-                         r'\s*(?P<lsp_sent>\d+)/(?P<lsp_received>\d+)')
+        r26 = _patterns.compile(r'Level\-(?P<level>\d+)\s+LSPs\s+\(sent\/rcvd\)\s*:'
+                                r'\s*(?P<lsp_sent>\d+)/(?P<lsp_received>\d+)')
 
         # Level-2 CSNPs (sent/rcvd) : 0/0
         # Level-1 CSNPs (sent/rcvd) : 339/0
-        r27 = re.compile(r'Level\-(?P<level>\d+)\s+CSNPs\s+\(sent\/rcvd\)\s*:'
-                         r'\s*(?P<csnp_sent>\d+)/(?P<csnp_received>\d+)')
+        r27 = _patterns.compile(r'Level\-(?P<level>\d+)\s+CSNPs\s+\(sent\/rcvd\)\s*:'
+                                r'\s*(?P<csnp_sent>\d+)/(?P<csnp_received>\d+)')
 
         # Level-1 PSNPs (sent/rcvd) : 0/0
-        r28 = re.compile(r'Level\-(?P<level>\d+)\s+PSNPs\s+\(sent/rcvd\)\s*:'
-                         r'\s*(?P<psnp_sent>\d+)\/(?P<psnp_received>\d+)')
+        r28 = _patterns.compile(r'Level\-(?P<level>\d+)\s+PSNPs\s+\(sent/rcvd\)\s*:'
+                                r'\s*(?P<psnp_sent>\d+)\/(?P<psnp_received>\d+)')
 
         # Level-1 LSP Flooding Duplicates     : 51
-        r29 = re.compile(r'Level-(?P<level>\d+)\s+LSP\s+Flooding\s+Duplicates'
-                         r'\s*:\s*(?P<lsp_flooding_duplicates>\d+)')
+        r29 = _patterns.compile(r'Level-(?P<level>\d+)\s+LSP\s+Flooding\s+Duplicates'
+                                r'\s*:\s*(?P<lsp_flooding_duplicates>\d+)')
 
         # Level-1 LSPs Arrival Time Throttled : 0
         # Level-2 LSPs Arrival Time Throttled : 0
-        r30 = re.compile(r'Level-(?P<level>\d+)\s+LSPs\s+Arrival\s+Time\s+'
-                         r'Throttled\s*:\s*(?P<lsp_arrival_time_throttled>\d+)')
+        r30 = _patterns.compile(r'Level-(?P<level>\d+)\s+LSPs\s+Arrival\s+Time\s+'
+                                r'Throttled\s*:\s*(?P<lsp_arrival_time_throttled>\d+)')
 
         # Level-1 Hellos (sent/rcvd): 594/593
-        r31 = re.compile(r'Level-(?P<level>\d+)\s+Hellos\s+\(sent/rcvd\)\s*:'
-                         r'\s*(?P<hello_sent>\d+)/(?P<hello_received>\d+)')
+        r31 = _patterns.compile(r'Level-(?P<level>\d+)\s+Hellos\s+\(sent/rcvd\)\s*:'
+                                r'\s*(?P<hello_sent>\d+)/(?P<hello_received>\d+)')
 
         # Level-1 DR Elections      : 3
         # Level-2 DR Elections      : 3
-        r32 = re.compile(r'Level-(?P<level>\d+)\s+DR\s+Elections\s*:'
-                         r'\s*(?P<dr_elections>\d+)')
+        r32 = _patterns.compile(r'Level-(?P<level>\d+)\s+DR\s+Elections\s*:'
+                                r'\s*(?P<dr_elections>\d+)')
 
         parsed_dict = {}
         vrf = 'default'
@@ -1709,20 +1713,20 @@ class ShowIsisSpfLog(ShowIsisSpfLogSchema):
             output = self.device.execute(self.cli_command)
 
         # IS-IS TEST Level 2 IPv4 Unicast Route Calculation Log
-        r1 = re.compile(r'IS\-IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
-                         '\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
+        r1 = _patterns.compile(r'IS\-IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
+                                '\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
 
         # --- Mon Oct  7 2019 ---
-        r2 = re.compile(r'\-\-\-\s+(?P<log_date>[\s\w]+)\s+\-\-\-')
+        r2 = _patterns.compile(r'\-\-\-\s+(?P<log_date>[\s\w]+)\s+\-\-\-')
 
         #                     Time Total Trig.
         # Timestamp    Type   (ms) Nodes Count First Trigger LSP    Triggers
         # ------------ ----- ----- ----- ----- -------------------- -----------------------
         # 00:00:17.514   PRC     0    64     6      bla-host1.12-34 PREFIXBAD
         # 23:42:51.522 PPFRR     0    64     1                      PERPREFIXFRR
-        r3 = re.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<log_type>\S+)\s+(?P<time_ms>\d+)'
-                         '\s+(?P<total_nodes>\d+)\s+(?P<trigger_count>\d+)\s+'
-                         '(?P<first_trigger_lsp>\S*)\s+(?P<triggers>[\w\s]+)')
+        r3 = _patterns.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<log_type>\S+)\s+(?P<time_ms>\d+)'
+                                '\s+(?P<total_nodes>\d+)\s+(?P<trigger_count>\d+)\s+'
+                                '(?P<first_trigger_lsp>\S*)\s+(?P<triggers>[\w\s]+)')
 
         parsed_output = {}
         log_index = 1
@@ -1918,54 +1922,54 @@ class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # ISIS isp Level 1 IPv4 Unicast Route Calculation Log
-        r1 = re.compile(r'IS\-*IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
-                        r'\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
+        r1 = _patterns.compile(r'IS\-*IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
+                               r'\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
 
         #                    Time  Total Trig
         # Timestamp     Type (ms)  Nodes Count  First Trigger LSP   Triggers
         # 19:25:35.140  FSPF  1    1     1             12a5.00-00   NEWLSP0
-        r2 = re.compile(r'^(?P<timestamp>[\d\:\.]+)\s+(?P<type>\w+)\s+'
+        r2 = _patterns.compile(r'^(?P<timestamp>[\d\:\.]+)\s+(?P<type>\w+)\s+'
                 r'(?P<time_ms>\d+)\s+(?P<nodes>\d+)\s+(?P<count>\d+)'
                 r'(\s+(?P<first_trigger_lsp>[\w\-\.]+))?\s+(?P<triggers>\w+)')
 
         # Delay:              51ms (since first trigger)
-        r3 = re.compile(r'Delay\s*:\s*(?P<delay>\d+)ms\s+'
-                        r'\((?P<delay_info>[\w\s]+)\)')
+        r3 = _patterns.compile(r'Delay\s*:\s*(?P<delay>\d+)ms\s+'
+                               r'\((?P<delay_info>[\w\s]+)\)')
 
         # SPT Calculation
-        r4 = re.compile(r'SPT\s+Calculation$')
+        r4 = _patterns.compile(r'SPT\s+Calculation$')
 
         # SPT Calculation:         5     5
-        r4_1 = re.compile(r'^SPT +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
+        r4_1 = _patterns.compile(r'^SPT +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
 
         # Prefix Updates
-        r5 = re.compile(r'Prefix\s+Updates')
+        r5 = _patterns.compile(r'Prefix\s+Updates')
 
         # Route Update:            0     0
-        r5_1 = re.compile(r'^Route +Update: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
+        r5_1 = _patterns.compile(r'^Route +Update: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
 
         # Full Calculation:        0     0
-        r5_2 = re.compile(r'^Full +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
+        r5_2 = _patterns.compile(r'^Full +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
 
         # CPU Time:         1ms
         # CPU Time:         0ms
-        r6 = re.compile(r'CPU\s+Time\s*:\s*(?P<cpu_time>\d+)\w+')
+        r6 = _patterns.compile(r'CPU\s+Time\s*:\s*(?P<cpu_time>\d+)\w+')
 
         # Real Time:        0ms
-        r7 = re.compile(r'Real\s+Time\s*:\s*(?P<real_time>\d+)\w+')
+        r7 = _patterns.compile(r'Real\s+Time\s*:\s*(?P<real_time>\d+)\w+')
 
         # New LSP Arrivals:    0
-        r8 = re.compile(r'New\s+LSP\s+Arrivals\s*:\s*(?P<new_lsp_arrival>\d+)')
+        r8 = _patterns.compile(r'New\s+LSP\s+Arrivals\s*:\s*(?P<new_lsp_arrival>\d+)')
 
         # Next Wait Interval: 200ms
-        r9 = re.compile(r'Next\s+Wait\s+Interval\s*:\s*(?P<next_wait_interval>\d+)\w+')
+        r9 = _patterns.compile(r'Next\s+Wait\s+Interval\s*:\s*(?P<next_wait_interval>\d+)\w+')
 
         # Nodes:                   1       0     1
-        r10 = re.compile(r'Nodes\s*:\s*(?P<reach>\d+)\s+(?P<unreach>\d+)\s+(?P<total>\d+)')
+        r10 = _patterns.compile(r'Nodes\s*:\s*(?P<reach>\d+)\s+(?P<unreach>\d+)\s+(?P<total>\d+)')
 
         # Prefixes (Items)
         # Prefixes (Routes)
-        r11 = re.compile(r'Prefixes\s*\((?P<prefixes>\w+)\)')
+        r11 = _patterns.compile(r'Prefixes\s*\((?P<prefixes>\w+)\)')
 
         # Critical Priority:     0       0     0
         # Critical Priority:     0       -     0
@@ -1977,30 +1981,30 @@ class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
         # Low Priority:          0        -    0
         # All Priorities         0        -    0
         # All Priorities         0       0     0
-        r12 = re.compile(r'(?P<priority_level>\w+)\s+Priorit(y|ies)\s*:*\s+'
-                          '(?P<reach>\d+)\s+(?P<unreach>\d+|\-)\s+'
-                          '(?P<total>\d+)')
+        r12 = _patterns.compile(r'(?P<priority_level>\w+)\s+Priorit(y|ies)\s*:*\s+'
+                                 '(?P<reach>\d+)\s+(?P<unreach>\d+|\-)\s+'
+                                 '(?P<total>\d+)')
 
         # SR uloop:              No
-        r13 = re.compile(r'^SR +uloop: +(?P<sr_uloop>\w+)$')
+        r13 = _patterns.compile(r'^SR +uloop: +(?P<sr_uloop>\w+)$')
 
         # Interrupted:           No
-        r14 = re.compile(r'^Interrupted: +(?P<interrupted>\w+)$')
+        r14 = _patterns.compile(r'^Interrupted: +(?P<interrupted>\w+)$')
 
         # RIB Batches:           0
-        r15 = re.compile(r'^RIB +Batches: +(?P<total>\d+)( +\((?P<critical>\d+) '
+        r15 = _patterns.compile(r'^RIB +Batches: +(?P<total>\d+)( +\((?P<critical>\d+) '
                 r'critical, +(?P<high>\d+) +high, +(?P<medium>\d+) +medium, +'
                 r'(?P<low>\d+) +low\))?$')
 
         # 899545ms (since end of last calculation)
-        r16 = re.compile(r'^(?P<since_end_of_last_calculation_ms>\d+)ms +\(since '
+        r16 = _patterns.compile(r'^(?P<since_end_of_last_calculation_ms>\d+)ms +\(since '
                 r'+end +of +last +calculation\)$')
         
         # Trigger Prefix:        10.234.81.14/32 (optional field)
-        r17 = re.compile(r'^Trigger +Prefix: +(?P<trigger_prefix>\S+) +\(optional +field\)$')
+        r17 = _patterns.compile(r'^Trigger +Prefix: +(?P<trigger_prefix>\S+) +\(optional +field\)$')
 
         # Mon Aug 16 2004
-        rd = re.compile(r'(?P<timestamp_date>[\w\d\s]+)')
+        rd = _patterns.compile(r'(?P<timestamp_date>[\w\d\s]+)')
 
         parsed_dict = {}
         log_index = 1
@@ -2299,20 +2303,20 @@ class ShowIsisLspLog(ShowIsisLspLogSchema):
         # IS-IS TEST Level 2 LSP log
         # ISIS isp Level 1 LSP log
         # Level 1 LSP log
-        r1 = re.compile(r'(IS\-*IS\s+(?P<instance>.+)\s+)?Level\s+'
-                         '(?P<level>\d+)\s+LSP\s+log')
+        r1 = _patterns.compile(r'(IS\-*IS\s+(?P<instance>.+)\s+)?Level\s+'
+                                '(?P<level>\d+)\s+LSP\s+log')
 
         # --- Thu Sep 26 2019 ---
         # --- Mon Sep 30 2019 ---
-        r2 = re.compile(r'\-\-\-\s+(?P<log_date>[\w\s]+)\s+\-\-\-')
+        r2 = _patterns.compile(r'\-\-\-\s+(?P<log_date>[\w\s]+)\s+\-\-\-')
 
         # 09:39:16.648     1                   IPEXT
         # 07:05:24         2                   CONFIG NEWADJ
         # 16:15:03.822     2  BE2              DELADJ
         # 00:02:36         1
-        r3 = re.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<count>\d+)\s*'
-                         '(?P<interface>[A-Z]+[a-z]*[\/*\d\.]+)?\s*'
-                         '(?P<triggers>[\w*\s]*)')
+        r3 = _patterns.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<count>\d+)\s*'
+                                '(?P<interface>[A-Z]+[a-z]*[\/*\d\.]+)?\s*'
+                                '(?P<triggers>[\w*\s]*)')
 
         parsed_output = {}
         log_date = ''
@@ -2513,207 +2517,207 @@ class ShowIsisInterface(ShowIsisInterfaceSchema):
             output = self.device.execute(command)
 
         # IS-IS test Interfaces
-        r1 = re.compile(r'IS\-IS\s+(?P<instance>.+)\s+Interfaces')
+        r1 = _patterns.compile(r'IS\-IS\s+(?P<instance>.+)\s+Interfaces')
 
         # Loopback0                   Enabled
         # GigabitEthernet0/0/0/0      Enabled
         # TenGigE0/0/0/0/0            Disabled (No topologies cfg on the intf)
-        r2 = re.compile(r'^(?P<interface>[\w\-\d+\/\.]+)\s+(?P<interface_state>Enabled|Disabled)( +[\S ]+)?$')
+        r2 = _patterns.compile(r'^(?P<interface>[\w\-\d+\/\.]+)\s+(?P<interface_state>Enabled|Disabled)( +[\S ]+)?$')
 
         # Adjacency Formation:    Running
         # Adjacency Formation:      Enabled
-        r3 = re.compile(r'Adjacency\s+Formation\s*:\s*'
-                        r'(?P<adjacency_formation_state>\w+)')
+        r3 = _patterns.compile(r'Adjacency\s+Formation\s*:\s*'
+                               r'(?P<adjacency_formation_state>\w+)')
 
         # Prefix Advertisement:     Enabled
         # Prefix Advertisement:   Running
-        r4 = re.compile(r'Prefix\s+Advertisement\s*:\s*'
-                        r'(?P<prefix_advertisement_state>.+)')
+        r4 = _patterns.compile(r'Prefix\s+Advertisement\s*:\s*'
+                               r'(?P<prefix_advertisement_state>.+)')
 
         # IPv4 BFD:                 Disabled
         # IPv6 BFD:                 Disabled
-        r5 = re.compile(r'(?P<address_family>IPv4|IPv6)\s+BFD\s*:\s*'
-                        r'(?P<ip_bfd_state>\w+)')
+        r5 = _patterns.compile(r'(?P<address_family>IPv4|IPv6)\s+BFD\s*:\s*'
+                               r'(?P<ip_bfd_state>\w+)')
 
         # BFD Min Interval:         150
-        r6 = re.compile(r'BFD\s+Min\s+Interval\s*:\s*(?P<bfd_min_interval>\d+)')
+        r6 = _patterns.compile(r'BFD\s+Min\s+Interval\s*:\s*(?P<bfd_min_interval>\d+)')
 
         # BFD Multiplier:           3
-        r7 = re.compile(r'BFD\s+Multiplier\s*:\s*(?P<bfd_multiplier>\d+)')
+        r7 = _patterns.compile(r'BFD\s+Multiplier\s*:\s*(?P<bfd_multiplier>\d+)')
 
         # Bandwidth:                0
         # Bandwidth:                1000000
-        r8 = re.compile(r'Bandwidth\s*:\s*(?P<bandwidth>\d+)')
+        r8 = _patterns.compile(r'Bandwidth\s*:\s*(?P<bandwidth>\d+)')
 
         # Circuit Type:             level-1-2
-        r9 = re.compile(r'Circuit\s+Type\s*:\s*(?P<circuit_type>\S+)')
+        r9 = _patterns.compile(r'Circuit\s+Type\s*:\s*(?P<circuit_type>\S+)')
 
         # Media Type:               LAN
         # Media Type:               Loop
-        r10 = re.compile(r'Media\s+Type\s*:\s*(?P<media_type>\S+)')
+        r10 = _patterns.compile(r'Media\s+Type\s*:\s*(?P<media_type>\S+)')
 
         # Circuit Number:           0
-        r11 = re.compile(r'Circuit\s+Number\s*:\s*(?P<circuit_number>\d+)')
+        r11 = _patterns.compile(r'Circuit\s+Number\s*:\s*(?P<circuit_number>\d+)')
 
         # Level-1
         # Level-2
-        r12 = re.compile(r'^Level\-(?P<level>\d+)')
+        r12 = _patterns.compile(r'^Level\-(?P<level>\d+)')
 
         # Adjacency Count:        0
-        r13 = re.compile(r'Adjacency\s+Count\s*:\s*(?P<adjacency_count>\d+)')
+        r13 = _patterns.compile(r'Adjacency\s+Count\s*:\s*(?P<adjacency_count>\d+)')
 
         # LSP Pacing Interval:    33 ms
-        r14 = re.compile(r'LSP\s+Pacing\s+Interval\s*:\s*'
-                         r'(?P<lsp_pacing_interval>\d+)\s+ms')
+        r14 = _patterns.compile(r'LSP\s+Pacing\s+Interval\s*:\s*'
+                                r'(?P<lsp_pacing_interval>\d+)\s+ms')
 
         # PSNP Entry Queue Size:  0
-        r15 = re.compile(r'PSNP\s+Entry\s+Queue\s+Size\s*:\s*'
-                         r'(?P<psnp_entry_queue_size>\d+)')
+        r15 = _patterns.compile(r'PSNP\s+Entry\s+Queue\s+Size\s*:\s*'
+                                r'(?P<psnp_entry_queue_size>\d+)')
 
         # Hello Interval:         10 s
-        r16 = re.compile(r'Hello\s+Interval\s*:\s*(?P<hello_interval>\d+)\s*s')
+        r16 = _patterns.compile(r'Hello\s+Interval\s*:\s*(?P<hello_interval>\d+)\s*s')
 
         # Hello Multiplier:       3
-        r17 = re.compile(r'Hello\s+Multiplier\a*:\s*(?P<hello_multiplier>\d+)')
+        r17 = _patterns.compile(r'Hello\s+Multiplier\a*:\s*(?P<hello_multiplier>\d+)')
 
         # CLNS I/O
-        r18 = re.compile(r'CLNS\s+I\/O')
+        r18 = _patterns.compile(r'CLNS\s+I\/O')
 
         # Protocol State:         Up
         # Protocol State:         Down (Intf not up in CLNS proto stack)
-        r19 = re.compile(r'Protocol\s+State\s*:\s*(?P<protocol_state>[\S\s]+)')
+        r19 = _patterns.compile(r'Protocol\s+State\s*:\s*(?P<protocol_state>[\S\s]+)')
 
         # MTU:                    1500
-        r20 = re.compile(r'MTU\s*:\s*(?P<mtu>\d+)')
+        r20 = _patterns.compile(r'MTU\s*:\s*(?P<mtu>\d+)')
 
         # IPv4 Unicast Topology:    Enabled
         # IPv6 Unicast Topology:    Enabled
-        r21 = re.compile(r'(?P<topology>(IPv4|IPv6)[\s\w]+)\s+Topology\s*:'
-                         r'\s*(?P<topology_state>\w+)')
+        r21 = _patterns.compile(r'(?P<topology>(IPv4|IPv6)[\s\w]+)\s+Topology\s*:'
+                                r'\s*(?P<topology_state>\w+)')
 
         # Metric (L1/L2):         10/10
-        r22 = re.compile(r'Metric\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*'
-                         r':\s*(?P<metric_level_1>\d+)\/(?P<metric_level_2>\d+)')
+        r22 = _patterns.compile(r'Metric\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*'
+                                r':\s*(?P<metric_level_1>\d+)\/(?P<metric_level_2>\d+)')
 
         # Weight (L1/L2):         0/0
-        r23 = re.compile(r'Weight\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*:'
-                         r'\s*(?P<weight_level_1>\d+)\/(?P<weight_level_2>\d+)')
+        r23 = _patterns.compile(r'Weight\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*:'
+                                r'\s*(?P<weight_level_1>\d+)\/(?P<weight_level_2>\d+)')
 
         # MPLS Max Label Stack:   1/3/10 (PRI/BKP/SRTE)
         # MPLS Max Label Stack(PRI/BKP/SRTE):2/2/10
-        r24 = re.compile(r'MPLS\s+Max\s+Label\s+Stack(?P<mpls_max_label_stack>.+)')
+        r24 = _patterns.compile(r'MPLS\s+Max\s+Label\s+Stack(?P<mpls_max_label_stack>.+)')
 
         # MPLS LDP Sync (L1/L2):  Disabled/Disabled
-        r25 = re.compile(r'MPLS\s+LDP\s+Sync\s+\(L(?P<level_1>\d+)/L'
-                         r'(?P<level_2>\d+)\)\s*:\s*(?P<state_level_1>\w+)\/(?P<state_level_2>\w+)')
+        r25 = _patterns.compile(r'MPLS\s+LDP\s+Sync\s+\(L(?P<level_1>\d+)/L'
+                                r'(?P<level_2>\d+)\)\s*:\s*(?P<state_level_1>\w+)\/(?P<state_level_2>\w+)')
 
         # FRR (L1/L2):            L1 Not Enabled     L2 Not Enabled
-        r26 = re.compile(r'FRR\s+\(L\d+\/L\d+\)\s*:\s*L(?P<level_1>\d+)\s+'
-                         r'(?P<level_1_state>[\w\s]+)\s+L(?P<level_2>\d+)\s+(?P<level_2_state>[\w\s]+)')
+        r26 = _patterns.compile(r'FRR\s+\(L\d+\/L\d+\)\s*:\s*L(?P<level_1>\d+)\s+'
+                                r'(?P<level_1_state>[\w\s]+)\s+L(?P<level_2>\d+)\s+(?P<level_2_state>[\w\s]+)')
 
         # FRR Type:             None               None
-        r27 = re.compile(r'FRR\s+Type\s*:\s*(?P<frr_type_level_1>\S+)\s*'
-                         r'(?P<frr_type_level_2>\S+)')
+        r27 = _patterns.compile(r'FRR\s+Type\s*:\s*(?P<frr_type_level_1>\S+)\s*'
+                                r'(?P<frr_type_level_2>\S+)')
 
         # IPv4 Address Family:      Enabled
         # IPv6 Address Family:      Enabled
-        r28 = re.compile(r'(?P<address_family>IPv4|IPv6)\s+Address\s+Family\s*:'
-                         r'\s*(?P<address_family_state>\w+)')
+        r28 = _patterns.compile(r'(?P<address_family>IPv4|IPv6)\s+Address\s+Family\s*:'
+                                r'\s*(?P<address_family_state>\w+)')
 
         # Forwarding Address(es): 0.0.0.0
         # Forwarding Address(es): ::
-        r29 = re.compile(r'Forwarding\s+Address\(es\)\s*:\s*'
-                         r'(?P<forwarding_address>\S+)')
+        r29 = _patterns.compile(r'Forwarding\s+Address\(es\)\s*:\s*'
+                                r'(?P<forwarding_address>\S+)')
 
         # Global Prefix(es):      10.36.3.0/24
         # Global Prefix(es):      2001:db8:3:3:3::3/128
         # Global Prefix(es):      None (No global addresses are configured)
-        r30 = re.compile(r'Global\s+Prefix\(es\)\s*:\s*(?P<global_prefix>.+)')
+        r30 = _patterns.compile(r'Global\s+Prefix\(es\)\s*:\s*(?P<global_prefix>.+)')
 
         # LSP transmit timer expires in 0 ms
-        r31 = re.compile(r'LSP\s+transmit\s+timer\s+expires\s+in\s+'
-                         r'(?P<lsp_timer>\d+)\s+ms')
+        r31 = _patterns.compile(r'LSP\s+transmit\s+timer\s+expires\s+in\s+'
+                                r'(?P<lsp_timer>\d+)\s+ms')
 
         # LSP transmission is idle
-        r32 = re.compile(r'LSP\s+transmission\s+is\s+'
-                         r'(?P<lsp_transmission_state>\w+)')
+        r32 = _patterns.compile(r'LSP\s+transmission\s+is\s+'
+                                r'(?P<lsp_transmission_state>\w+)')
 
         # Can send up to 10 back-to-back LSPs in the next 0 ms
-        r33 = re.compile(r'Can\s+send\s+up\s+to\s+(?P<number_lsp_send>\d+)'
-                         r'\s+back\-to\-back\s+LSPs\s+in\s+the\s+next\s+'
-                         r'(?P<time_to_sent>\d+)\s+ms')
+        r33 = _patterns.compile(r'Can\s+send\s+up\s+to\s+(?P<number_lsp_send>\d+)'
+                                r'\s+back\-to\-back\s+LSPs\s+in\s+the\s+next\s+'
+                                r'(?P<time_to_sent>\d+)\s+ms')
 
         # LAN ID:                 R3.07
-        r34 = re.compile(r'LAN\s+ID\s*:\s*(?P<lan_id>\S+)')
+        r34 = _patterns.compile(r'LAN\s+ID\s*:\s*(?P<lan_id>\S+)')
 
         # Priority (Local/DIS):   64/none (no DIS elected)
         # Priority (Local/DIS):   64/64
-        r35 = re.compile(r'Priority\s*\(Local/DIS\)\s*:\s*'
-                         r'(?P<priority_local>\S+)/(?P<priority_dis>.+)')
+        r35 = _patterns.compile(r'Priority\s*\(Local/DIS\)\s*:\s*'
+                                r'(?P<priority_local>\S+)/(?P<priority_dis>.+)')
 
         # Next LAN IIH in:        5 s
         # Next LAN IIH in:        3 s
-        r36 = re.compile(r'Next\s+LAN\s+IIH\s+in\s*:\s*'
-                         r'(?P<next_lan_iih>\d+)\s*s')
+        r36 = _patterns.compile(r'Next\s+LAN\s+IIH\s+in\s*:\s*'
+                                r'(?P<next_lan_iih>\d+)\s*s')
 
         # SNPA:                   fa16.3eff.86bf
-        r37 = re.compile(r'SNPA\s*:\s*(?P<snpa>\S+)')
+        r37 = _patterns.compile(r'SNPA\s*:\s*(?P<snpa>\S+)')
 
         # Layer-2 MCast Groups Membership:
-        r38 = re.compile(r'Layer\-(?P<layer>\d+)\s*MCast\s+Groups\s+Membership:')
+        r38 = _patterns.compile(r'Layer\-(?P<layer>\d+)\s*MCast\s+Groups\s+Membership:')
 
         # All Level-1 ISs:      Yes
         # All Level-2 ISs:      Yes
-        r39 = re.compile(r'All\s+Level\-(?P<level>\d+)\s+ISs\s*:\s*'
-                         r'(?P<iss_state>\S+)')
+        r39 = _patterns.compile(r'All\s+Level\-(?P<level>\d+)\s+ISs\s*:\s*'
+                                r'(?P<iss_state>\S+)')
 
         # All ISs:              Yes
-        r40 = re.compile(r'All\s+ISs\s*:\s*(?P<all_iss>(Yes|No))')
+        r40 = _patterns.compile(r'All\s+ISs\s*:\s*(?P<all_iss>(Yes|No))')
 
         # Extended Circuit Number:  20
-        r41 = re.compile(r'^Extended +Circuit +Number: +(?P<extended_circuit_number>\d+)$')
+        r41 = _patterns.compile(r'^Extended +Circuit +Number: +(?P<extended_circuit_number>\d+)$')
 
         # Next P2P IIH in:          3 s
-        r42 = re.compile(r'^Next +P2P +IIH +in: +(?P<next_p2p_iih_in>\d+) +m?s$')
+        r42 = _patterns.compile(r'^Next +P2P +IIH +in: +(?P<next_p2p_iih_in>\d+) +m?s$')
 
         # LSP Rexmit Queue Size:    0
-        r43 = re.compile(r'^LSP +Rexmit +Queue +Size: +(?P<lsp_rexmit_queue_size>\d+)$')
+        r43 = _patterns.compile(r'^LSP +Rexmit +Queue +Size: +(?P<lsp_rexmit_queue_size>\d+)$')
 
         # RSI SRLG:                 Registered
-        r44 = re.compile(r'^RSI +SRLG: +(?P<rsi_srlg>\S+)$')
+        r44 = _patterns.compile(r'^RSI +SRLG: +(?P<rsi_srlg>\S+)$')
 
         # Direct LFA:           Enabled            Enabled
-        r45 = re.compile(r'^Direct +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r45 = _patterns.compile(r'^Direct +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Remote LFA:           Not Enabled        Not Enabled
-        r46 = re.compile(r'^Remote +LFA: +(?P<level_1>(Not +)?Enabled) +(?P<level_2>(Not +)?Enabled)$')
+        r46 = _patterns.compile(r'^Remote +LFA: +(?P<level_1>(Not +)?Enabled) +(?P<level_2>(Not +)?Enabled)$')
 
         # Tie Breaker          Default            Default
-        r47 = re.compile(r'^Tie +Breaker +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r47 = _patterns.compile(r'^Tie +Breaker +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Line-card disjoint   30                 30
-        r48 = re.compile(r'^Line-card +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r48 = _patterns.compile(r'^Line-card +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Lowest backup metric 20                 20
-        r49 = re.compile(r'^Lowest +backup +metric +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r49 = _patterns.compile(r'^Lowest +backup +metric +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Node protecting      40                 40
-        r50 = re.compile(r'^Node +protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r50 = _patterns.compile(r'^Node +protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Primary path         10                 10
-        r51 = re.compile(r'^Primary +path +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r51 = _patterns.compile(r'^Primary +path +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # TI LFA:               Enabled            Enabled
-        r52 = re.compile(r'^TI +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r52 = _patterns.compile(r'^TI +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Link Protecting      Enabled            Enabled
-        r53 = re.compile(r'^Link +Protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r53 = _patterns.compile(r'^Link +Protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # SRLG disjoint        0                  0
-        r54 = re.compile(r'^SRLG +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r54 = _patterns.compile(r'^SRLG +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # IfName: Hu0/0/0/1 IfIndex: 0x55
-        r55 = re.compile(r'^IfName: +(?P<if_name>\S+) +IfIndex: +(?P<if_index>\S+)$')
+        r55 = _patterns.compile(r'^IfName: +(?P<if_name>\S+) +IfIndex: +(?P<if_index>\S+)$')
 
         parsed_output = {}
         interface_flag = False
@@ -2908,7 +2912,7 @@ class ShowIsisInterface(ShowIsisInterfaceSchema):
                 continue
 
             # CLNS I/O
-            r18 = re.compile(r'CLNS\s+I\/O')
+            r18 = _patterns.compile(r'CLNS\s+I\/O')
             result = r18.match(line)
             if result:
                 clns_dict = interface_dict.setdefault('clns_io', {})
@@ -3564,8 +3568,8 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
         # IS-IS test (Level-1) Link State Database
         # IS-IS test (Level-2) Link State Database
         # IS-IS Level-1 Link State Database
-        r1 = re.compile(r'IS\-IS\s+(?P<instance>\S+)?\s*\(*Level\-'
-                        r'(?P<level>\d+)\)*\s+Link\s+State\s+Database')
+        r1 = _patterns.compile(r'IS\-IS\s+(?P<instance>\S+)?\s*\(*Level\-'
+                               r'(?P<level>\d+)\)*\s+Link\s+State\s+Database')
 
         # LSPID                 LSP Seq Num   LSP Checksum  LSP Holdtime/Rcvd  ATT/P/OL
         # R3.00-00            * 0x0000000d    0x0476        578  /*            1/0/0
@@ -3573,120 +3577,120 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
         # router-5.00-00        0x00000005 0x807997c        457                0/0/0
         # 0000.0CFF.0C35.00-00  0x0000000C    0x5696        325                0/0/0
         # 0000.0CFF.40AF.00-00* 0x00000009    0x8452        608                1/0/0
-        r2 = re.compile(r'^(?P<lspid>[\w\-\.]+)( *(?P<local_router>\*))? +'
+        r2 = _patterns.compile(r'^(?P<lspid>[\w\-\.]+)( *(?P<local_router>\*))? +'
                 r'(?P<lsp_seq_num>\w+) +(?P<lsp_checksum>\w+) +(?P<lsp_holdtime>\d+|\*)'
                 r'( *\/(?P<lsp_rcvd>\d+|\*))? +(?P<attach_bit>\d+)\/(?P<p_bit>\d+)\/'
                 r'(?P<overload_bit>\d+)$')
 
         # Area Address:   49.0002
-        r3 = re.compile(r'Area\s+Address\s*:\s*(?P<area_address>\S+)')
+        r3 = _patterns.compile(r'Area\s+Address\s*:\s*(?P<area_address>\S+)')
 
         # NLPID: 0xcc
         # NLPID: 0xCC 0x8E
-        r4 = re.compile(r'NLPID\s*:\s*(?P<nlpid>[\w\s]+)')
+        r4 = _patterns.compile(r'NLPID\s*:\s*(?P<nlpid>[\w\s]+)')
 
         # IP Address:     10.36.3.3
-        r5 = re.compile(r'IP\s*Address\s*:\s*(?P<ip_address>\S+)')
+        r5 = _patterns.compile(r'IP\s*Address\s*:\s*(?P<ip_address>\S+)')
 
         # Metric: 10         IP-Extended 10.36.3.0/24
         # Metric: 10         IP-Extended 10.2.3.0/24
-        r6 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\s+'
-                        r'(?P<ip_address>[\d\.\/]+)')
+        r6 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\s+'
+                               r'(?P<ip_address>[\d\.\/]+)')
 
         # Hostname:       R3
-        r7 = re.compile(r'Hostname\s*:\s+(?P<hostname>\S+)')
+        r7 = _patterns.compile(r'Hostname\s*:\s+(?P<hostname>\S+)')
 
         # IPv6 Address:   2001:db8:3:3:3::3
-        r8 = re.compile(r'IPv6\s+Address\s*:\s*(?P<ipv6_address>\S+)')
+        r8 = _patterns.compile(r'IPv6\s+Address\s*:\s*(?P<ipv6_address>\S+)')
 
         # Metric: 10         MT (IPv6 Unicast) IPv6 2001:db8:3:3:3::3/128
         # Metric: 10         MT (IPv6 Unicast) IPv6 2001:db8:10:2::/64
-        r9 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+MT\s*\(IPv(4|6)\s+'
-                        r'\w+\)\s*(?P<ip_version>IPv(4|6))\s+(?P<ip_address>\S+)')
+        r9 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+MT\s*\(IPv(4|6)\s+'
+                               r'\w+\)\s*(?P<ip_version>IPv(4|6))\s+(?P<ip_address>\S+)')
 
         # Metric: 10   IPv6 (MT-IPv6) 2001:0DB8::/64
         # Metric: 10         IPv6 2001:2:2:2::2/128
-        r9_2 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+(?P<ip_version>'
-                          r'IPv(4|6))\s+(\(MT-IPv6\))?\s*(?P<ip_address>'
-                          r'[\w\:\/]+)')
+        r9_2 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+(?P<ip_version>'
+                                 r'IPv(4|6))\s+(\(MT-IPv6\))?\s*(?P<ip_address>'
+                                 r'[\w\:\/]+)')
 
         # MT:             Standard (IPv4 Unicast)
         # MT:             Standard (IPv6 Unicast)
-        r10 = re.compile(r'MT\s*:\s*(?P<mt>\w+\s+\(IPv(4|6)\s*\w+\))\s*'
-                         r'(:?(?P<attach_bit>\d+)\/(?P<p_bit>\d+)\/'
-                         r'(?P<overload_bit>\d+))?')
+        r10 = _patterns.compile(r'MT\s*:\s*(?P<mt>\w+\s+\(IPv(4|6)\s*\w+\))\s*'
+                                r'(:?(?P<attach_bit>\d+)\/(?P<p_bit>\d+)\/'
+                                r'(?P<overload_bit>\d+))?')
 
         # MT:             IPv6 Unicast                                 1/0/0
         # MT:             IPv4 Unicast                                 0/0/0
-        r11 = re.compile(r'MT\s*:\s*(?P<mt>IPv(4|6)\s+\w+)\s+'
-                         r'(?P<attach_bit>\d+)/(?P<p_bit>\d+)/'
-                         r'(?P<overload_bit>\d+)')
+        r11 = _patterns.compile(r'MT\s*:\s*(?P<mt>IPv(4|6)\s+\w+)\s+'
+                                r'(?P<attach_bit>\d+)/(?P<p_bit>\d+)/'
+                                r'(?P<overload_bit>\d+)')
 
         # Metric: 10         IS-Extended R3.03
         # Metric: 10         IS-Extended R5.01
-        r12 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\-Extended\s+'
-                         r'(?P<is_extended>\S+)')
+        r12 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\-Extended\s+'
+                                r'(?P<is_extended>\S+)')
 
         # Metric: 10         MT (IPv6 Unicast) IS-Extended R3.03
         # Metric: 10         MT (IPv6 Unicast) IS-Extended R5.01
-        r13 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+'
-                         r'(?P<mt_id>[\w\(\)\s]+)\s+IS-Extended\s+'
-                         r'(?P<is_extended>\S+)')
+        r13 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+'
+                                r'(?P<mt_id>[\w\(\)\s]+)\s+IS-Extended\s+'
+                                r'(?P<is_extended>\S+)')
 
         # Router ID:      10.144.6.6
         # Router ID:      10.196.7.7
-        r14 = re.compile(r'Router\s+ID\s*:\s*(?P<router_id>\S+)')
+        r14 = _patterns.compile(r'Router\s+ID\s*:\s*(?P<router_id>\S+)')
 
         # Metric: 40         IP-Extended-Interarea 10.7.8.0/24
-        r15 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\-'
-                          'Interarea\s+(?P<ip_interarea>\S+)')
+        r15 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\-'
+                                 'Interarea\s+(?P<ip_interarea>\S+)')
 
         # Metric: 40         MT (IPv6 Unicast) IPv6-Interarea 2001:db8:10:7::/64
-        r16 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+MT\s+\('
-                         r'(?P<address_family>.+)\)\s+IPv6-Interarea\s+'
-                         r'(?P<ipv6_interarea>\S+)')
+        r16 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+MT\s+\('
+                                r'(?P<address_family>.+)\)\s+IPv6-Interarea\s+'
+                                r'(?P<ipv6_interarea>\S+)')
 
         # Total Level-1 LSP count: 11     Local Level-1 LSP count: 1
         # Total Level-2 LSP count: 11     Local Level-2 LSP count: 1
-        r17 = re.compile(r'Total\s+Level\-(?P<total_level>\d+)\s+LSP\s+count\s*:'
-                         r'\s*(?P<total_lsp_count>\d+)\s+Local\s*Level-'
-                         r'(?P<local_level>\d+)\s+LSP\s+count\s*:\s*'
-                         r'(?P<local_lsp_count>\d+)')
+        r17 = _patterns.compile(r'Total\s+Level\-(?P<total_level>\d+)\s+LSP\s+count\s*:'
+                                r'\s*(?P<total_lsp_count>\d+)\s+Local\s*Level-'
+                                r'(?P<local_level>\d+)\s+LSP\s+count\s*:\s*'
+                                r'(?P<local_lsp_count>\d+)')
 
         # Total LSP count: 3 (L1: 0, L2 3, local L1: 0, local L2 2)
-        r17_2 = re.compile(r'Total\s*LSP\s+count\s*:\s*(?P<total_lsp_count>\d+)'
-                           r'\s*\(L1\s*:\s*(?P<total_l1>\d+)\s*,\s*L2\s*'
-                           r'(?P<total_l2>\d+)\s*,\s*local\s*L1\s*:\s*'
-                           r'(?P<local_l1>\d+),\s*local\s*L2\s*'
-                           r'(?P<local_l2>\d+)\)')
+        r17_2 = _patterns.compile(r'Total\s*LSP\s+count\s*:\s*(?P<total_lsp_count>\d+)'
+                                  r'\s*\(L1\s*:\s*(?P<total_l1>\d+)\s*,\s*L2\s*'
+                                  r'(?P<total_l2>\d+)\s*,\s*local\s*L1\s*:\s*'
+                                  r'(?P<local_l1>\d+),\s*local\s*L2\s*'
+                                  r'(?P<local_l2>\d+)\)')
 
         # Metric: 10   IS 0000.0CFF.62E6.03
-        r18 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\s+'
-                         r'(?P<is_neighbor>[\w\.\-]+)')
+        r18 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\s+'
+                                r'(?P<is_neighbor>[\w\.\-]+)')
 
         # Metric: 0    ES 0000.0CFF.0C35
-        r19 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+ES\s+'
-                         r'(?P<es_neighbor>[\w\.]+)')
+        r19 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+ES\s+'
+                                r'(?P<es_neighbor>[\w\.]+)')
 
         # Topology: IPv4 (0x0) IPv6 (0x2)
         # Topology: IPv4 (0x0)
         # Topology: IPv6 (0x0)
-        r20 = re.compile(r'Topology\s*:\s*(?P<topology_1>IPv(4|6)\s+\(0x0\))'
-                         r'\s*(?P<topology_2>IPv(4|6)\s+\(0x2\))?')
+        r20 = _patterns.compile(r'Topology\s*:\s*(?P<topology_1>IPv(4|6)\s+\(0x0\))'
+                                r'\s*(?P<topology_2>IPv(4|6)\s+\(0x2\))?')
 
         # Metric: 10    IS (MT-IPv6) cisco.03
-        r21 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s*IS\s+\(MT-IPv(4|6)\)'
-                         r'\s+(?P<is_neighbor>[\w\.]+)')
+        r21 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s*IS\s+\(MT-IPv(4|6)\)'
+                                r'\s+(?P<is_neighbor>[\w\.]+)')
 
         # Metric: 0          IP 172.16.115.0/24
-        r22 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\s+'
-                         r'(?P<ip_address>[\d\.\/]+)')
+        r22 = _patterns.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\s+'
+                                r'(?P<ip_address>[\d\.\/]+)')
 
         # Router Cap:     172.19.1.2 D:0 S:0
-        r23 = re.compile(r'^Router +Cap: +(?P<router_cap>[\S ]+)$')
+        r23 = _patterns.compile(r'^Router +Cap: +(?P<router_cap>[\S ]+)$')
 
         # TLV 14:         Length: 2
-        r24 = re.compile(r'^TLV +(?P<tlv>\d+): +Length: +(?P<length>\d+)$')
+        r24 = _patterns.compile(r'^TLV +(?P<tlv>\d+): +Length: +(?P<length>\d+)$')
 
         parsed_output = {}
 
@@ -4811,73 +4815,73 @@ class ShowIsisPrivateAll(ShowIsisPrivateAllSchema):
         # +++++++++++++++++++++++ IS-IS TEST Global Private Data ++++++++++++++++++++++++
 
         # ISIS Test private data:
-        r1 = re.compile(r'^(?P<indent>\s*)ISIS +(?P<instance>\w+) +private +data:$')
+        r1 = _patterns.compile(r'^(?P<indent>\s*)ISIS +(?P<instance>\w+) +private +data:$')
 
         # Address Family Table
-        r2 = re.compile(r'^(?P<indent>\s*)Address +Family +Table$')
+        r2 = _patterns.compile(r'^(?P<indent>\s*)Address +Family +Table$')
 
         # IPv4
         # IPv6
-        r3 = re.compile(r'^(?P<indent>\s*)IPv(4|6)$')
+        r3 = _patterns.compile(r'^(?P<indent>\s*)IPv(4|6)$')
 
         # Link Topology Table
-        r4 = re.compile(r'^(?P<indent>\s*)Link +Topology +Table$')
+        r4 = _patterns.compile(r'^(?P<indent>\s*)Link +Topology +Table$')
 
         # Standard (IPv4 Unicast)
-        r5 = re.compile(r'^(?P<indent>\s*)Standard +\(IPv4 +Unicast\)$')
+        r5 = _patterns.compile(r'^(?P<indent>\s*)Standard +\(IPv4 +Unicast\)$')
 
         # Topology Table
-        r6 = re.compile(r'^(?P<indent>\s*)Topology +Table$')
+        r6 = _patterns.compile(r'^(?P<indent>\s*)Topology +Table$')
 
         # IPv4 Unicast
         # IPv4 Unicast VRF VRF1
-        r7 = re.compile(r'^(?P<indent>\s*)IPv(4|6) +Unicast( +VRF +\S+)?$')
+        r7 = _patterns.compile(r'^(?P<indent>\s*)IPv(4|6) +Unicast( +VRF +\S+)?$')
 
         # Configuration:
-        r8 = re.compile(r'^(?P<indent>\s*)Configuration:$')
+        r8 = _patterns.compile(r'^(?P<indent>\s*)Configuration:$')
 
         # Area Configuration Table
-        r9 = re.compile(r'^(?P<indent>\s*)Area +Configuration +Table$')
+        r9 = _patterns.compile(r'^(?P<indent>\s*)Area +Configuration +Table$')
 
         # Cross Levels
-        r10 = re.compile(r'^(?P<indent>\s*)Cross +Levels$')
+        r10 = _patterns.compile(r'^(?P<indent>\s*)Cross +Levels$')
 
         # Level-1
-        r11 = re.compile(r'^(?P<indent>\s*)Level\-(?P<level>\d+)$')
+        r11 = _patterns.compile(r'^(?P<indent>\s*)Level\-(?P<level>\d+)$')
 
         # Area Table
-        r12 = re.compile(r'^(?P<indent>\s*)Area +Table$')
+        r12 = _patterns.compile(r'^(?P<indent>\s*)Area +Table$')
 
         # per_af[IPv4]
         # per_topo[IPv4 Unicast]   :
         # prefix_priority_acl[ISIS_PREFIX_PRIORITY_CRITICAL]: 0x0
-        r13 = re.compile(r'^(?P<indent>\s*)(?P<key>\w+)\[(?P<type>.+)\]( *:)?'
-                         r'( +(?P<value>.*))?$')
+        r13 = _patterns.compile(r'^(?P<indent>\s*)(?P<key>\w+)\[(?P<type>.+)\]( *:)?'
+                                r'( +(?P<value>.*))?$')
 
         # [000] is_spf_prefix_priority_acl_names_set : FALSE
-        r14 = re.compile(r'^(?P<indent>\s*)\[(?P<idx>\d+)\] +(?P<key>\w+) *: +'
-                         r'(?P<value>.*)$')
+        r14 = _patterns.compile(r'^(?P<indent>\s*)\[(?P<idx>\d+)\] +(?P<key>\w+) *: +'
+                                r'(?P<value>.*)$')
 
 
         # ++++++++++++++++++++++ IS-IS Test Interface Private Data ++++++++++++++++++++++
 
         # Interface TenGigE0/0/1/2
-        r15 = re.compile(r'^(?P<indent>\s*)Interface +(?P<interface>\S+)$')
+        r15 = _patterns.compile(r'^(?P<indent>\s*)Interface +(?P<interface>\S+)$')
 
         #   media             : 0x440cc90
-        r16 = re.compile(r'^(?P<indent>\s*)media *: +(?P<media>\S+)$')
+        r16 = _patterns.compile(r'^(?P<indent>\s*)media *: +(?P<media>\S+)$')
 
         # cfg.cross_levels   :
         # cfg.per_level[Level-1]    :
         # cfg.per_level[Level-2]    :
-        r17 = re.compile(r'^(?P<indent>\s*)(?P<key>cfg\.(cross_levels|per_level\[.*\])) +:$')
+        r17 = _patterns.compile(r'^(?P<indent>\s*)(?P<key>cfg\.(cross_levels|per_level\[.*\])) +:$')
 
         # media_specific.p2p.nsf_ietf
         # media_specific.p2p.p2p_over_lan
-        r18 = re.compile(r'^(?P<indent>\s*)(?P<key>[\w]+\.[\S]+)$')
+        r18 = _patterns.compile(r'^(?P<indent>\s*)(?P<key>[\w]+\.[\S]+)$')
 
         #   lsp_arrivaltime_parameter.backoff_cfg.secondary_wait_msecs: 200
-        r99 = re.compile(r'^(?P<indent>\s*)(?P<key>[\w\.]+) *: +(?P<value>.*)$')
+        r99 = _patterns.compile(r'^(?P<indent>\s*)(?P<key>[\w\.]+) *: +(?P<value>.*)$')
 
         for line in output.splitlines():
             line = line.rstrip()
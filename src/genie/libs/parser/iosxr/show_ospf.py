@@ -21,6 +21,12 @@ from netaddr import IPAddress, IPNetwork
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.execute import memoize_commands
+from genie.libs.parser.utils.cache import parse_cached
+
+# Patterns of the parsers in this module, compiled once
+_patterns = PatternTable()
 
 
 # ==================================================
@@ -270,6 +276,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         "high_water_mark",
     ]
 
+    @memoize_commands
     def cli(self, vrf="", interface="", output=None):
         if output is None:
             if interface:
@@ -296,95 +303,95 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         # Mapping dict
         bool_dict = {"up": True, "down": False, "unknown": False}
 
-        p1 = re.compile(
+        p1 = _patterns.compile(
             r"^Interfaces +for +OSPF +(?P<instance>(\S+))"
             "(?:, +VRF +(?P<vrf>(\S+)))?$"
         )
-        p2 = re.compile(
+        p2 = _patterns.compile(
             r"^(?P<interface>(\S+)) +is( +administratively)?"
             " +(?P<enable>(unknown|up|down)), +line +protocol"
             " +is +(?P<line_protocol>(up|down))$"
         )
-        p3 = re.compile(
+        p3 = _patterns.compile(
             r"^Internet +Address +(?P<address>(\S+)),"
             " +Area +(?P<area>(\S+))"
             "(, +(?P<dummy>.+))?$"
         )
-        p4 = re.compile(
+        p4 = _patterns.compile(
             r"^Process +ID +(?P<pid>(\S+))"
             "(?:, +VRF +(?P<vrf>(\S+)))?"
             ", +Router +ID +(?P<router_id>(\S+))"
             ", +Network +Type +(?P<interface_type>(\S+))"
             "(?:, +Cost: +(?P<cost>(\d+))( \([A-Z\-]+\))?)?$"
         )
-        p5 = re.compile(
+        p5 = _patterns.compile(
             r"^Transmit +Delay is +(?P<delay>(\d+)) +sec,"
             " +State +(?P<state>(\S+)),"
             "(?: +Priority +(?P<priority>(\d+)),)?"
             " +MTU +(?P<mtu>(\d+)),"
             " +MaxPktSz +(?P<max_pkt_sz>(\d+))$"
         )
-        p6 = re.compile(
+        p6 = _patterns.compile(
             r"^Designated +(R|r)outer +\(ID\)"
             " +(?P<dr_router_id>(\S+)), +(I|i)nterface"
             " +(A|a)ddress +(?P<dr_ip_addr>(\S+))$"
         )
-        p7 = re.compile(
+        p7 = _patterns.compile(
             r"^Backup +(D|d)esignated +(R|r)outer +\(ID\)"
             " +(?P<bdr_router_id>(\S+)), +(I|i)nterface"
             " +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$"
         )
-        p8 = re.compile(
+        p8 = _patterns.compile(
             r"^Timer +intervals +configured,"
             " +Hello +(?P<hello>(\d+)),"
             " +Dead +(?P<dead>(\d+)),"
             " +Wait +(?P<wait>(\d+)),"
             " +Retransmit +(?P<retransmit>(\d+))$"
         )
-        p9_1 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
-        p9_2 = re.compile(r"^No +Hellos +\(Passive +interface\)$")
-        p10 = re.compile(
+        p9_1 = _patterns.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
+        p9_2 = _patterns.compile(r"^No +Hellos +\(Passive +interface\)$")
+        p10 = _patterns.compile(
             r"^Index +(?P<index>(\S+))," " +flood +queue +length +(?P<length>(\d+))$"
         )
-        p22 = re.compile(r"^Next +(?P<next>(\S+))$")
-        p11 = re.compile(
+        p22 = _patterns.compile(r"^Next +(?P<next>(\S+))$")
+        p11 = _patterns.compile(
             r"^Last +flood +scan +length +is +(?P<num>(\d+)),"
             " +maximum +is +(?P<max>(\d+))$"
         )
-        p12 = re.compile(
+        p12 = _patterns.compile(
             r"^Last +flood +scan +time +is +(?P<time1>(\d+))"
             " +msec, +maximum +is +(?P<time2>(\d+)) +msec$"
         )
-        p13 = re.compile(
+        p13 = _patterns.compile(
             r"^LS +Ack +List: +(?P<ls_ack_list>(\S+)) +length"
             " +(?P<num>(\d+)), +high +water +mark"
             " +(?P<num2>(\d+))$"
         )
-        p14 = re.compile(
+        p14 = _patterns.compile(
             r"^Neighbor +Count +is +(?P<nbr_count>(\d+)),"
             " +Adjacent +neighbor +count +is"
             " +(?P<adj_nbr_count>(\d+))$"
         )
-        p15_1 = re.compile(
+        p15_1 = _patterns.compile(
             r"^Adjacent +with +neighbor +(?P<nbr>(\S+))"
             " +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$"
         )
-        p15_2 = re.compile(
+        p15_2 = _patterns.compile(
             r"^Adjacent +with +neighbor +(?P<nbr>(\S+))"
             " +\((D|d)esignated +(R|r)outer\)$"
         )
-        p15_3 = re.compile(
+        p15_3 = _patterns.compile(
             r"^Adjacent +with +neighbor +(?P<nbr>(\S+))" " +\(Hello suppressed\)$"
         )
-        p16 = re.compile(r"^Suppress +hello +for +(?P<sup>(\d+))" " +neighbor\(s\)$")
-        p17 = re.compile(r"^Multi-area +interface +Count +is" " +(?P<count>(\d+))$")
-        p18 = re.compile(r"^Configured as demand circuit\.$")
-        p19 = re.compile(r"^Run as demand circuit\.$")
-        p20 = re.compile(
+        p16 = _patterns.compile(r"^Suppress +hello +for +(?P<sup>(\d+))" " +neighbor\(s\)$")
+        p17 = _patterns.compile(r"^Multi-area +interface +Count +is" " +(?P<count>(\d+))$")
+        p18 = _patterns.compile(r"^Configured as demand circuit\.$")
+        p19 = _patterns.compile(r"^Run as demand circuit\.$")
+        p20 = _patterns.compile(
             r"^DoNotAge +LSA +not +allowed +\(Number +of"
             " +DCbitless +LSA +is +(?P<num>(\d+))\)\.$"
         )
-        p21 = re.compile(
+        p21 = _patterns.compile(
             r"^BFD enabled"
             "(?:, +BFD +interval +(?P<interval>(\d+)) +msec)?"
             "(?:, +BFD +multiplier +(?P<multi>(\d+)))?"
@@ -499,8 +506,8 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     vl_transit_area_id = None
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    vl_out = parse_cached(ShowOspfVrfAllInclusiveVirtualLinks,
+                                          self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
@@ -1011,6 +1018,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
 
     exclude = ["dead_timer", "neighbor_uptime", "hello_timer", "total_dbd_retrans"]
 
+    @memoize_commands
     def cli(self, vrf="", neighbor="", interface="", output=None):
         if output is None:
             if vrf:
@@ -1048,55 +1056,55 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
         ret_dict = {}
         af = "ipv4"  # this is ospf - always ipv4
 
-        p1 = re.compile(
+        p1 = _patterns.compile(
             r"^Neighbors +for +OSPF +(?P<instance>(\S+))" "(?:, +VRF +(?P<vrf>(\S+)))?$"
         )
-        p2 = re.compile(
+        p2 = _patterns.compile(
             r"^Neighbor +(?P<neighbor>(\S+)), +interface"
             " +address +(?P<address>(\S+))$"
         )
-        p3 = re.compile(
+        p3 = _patterns.compile(
             r"^In +the +area +(?P<area>\S+) +via +interface"
             " +(?P<interface>\S+)( +, +BFD +(?P<bfd_status>\w+), +Mode: (?P<mode>\w+))?$"
         )
-        p4 = re.compile(
+        p4 = _patterns.compile(
             r"^Neighbor +priority +is +(?P<priority>(\d+)),"
             " +State +is +(?P<state>(\S+)),"
             " +(?P<num>(\d+)) +state +changes$"
         )
-        p5 = re.compile(
+        p5 = _patterns.compile(
             r"^DR +is +(?P<dr_ip_addr>(\S+))" " +BDR +is +(?P<bdr_ip_addr>(\S+))$"
         )
-        p6_1 = re.compile(r"^Options +is +(?P<options>(\S+))$")
-        p6_2 = re.compile(r"^LLS +Options +is +(?P<lls_options>(.*))$")
-        p7 = re.compile(r"^Dead +timer +due +in +(?P<dead_timer>(\S+))$")
-        p8 = re.compile(r"^Neighbor +is +up +for +(?P<uptime>(\S+))$")
-        p9 = re.compile(
+        p6_1 = _patterns.compile(r"^Options +is +(?P<options>(\S+))$")
+        p6_2 = _patterns.compile(r"^LLS +Options +is +(?P<lls_options>(.*))$")
+        p7 = _patterns.compile(r"^Dead +timer +due +in +(?P<dead_timer>(\S+))$")
+        p8 = _patterns.compile(r"^Neighbor +is +up +for +(?P<uptime>(\S+))$")
+        p9 = _patterns.compile(
             r"^Number +of +DBD +retrans +during +last"
             " +exchange +(?P<dbd_retrans>(\d+))$"
         )
-        p10 = re.compile(
+        p10 = _patterns.compile(
             r"^Index +(?P<index>(\S+)) +retransmission +queue"
             " +length +(?P<ql>(\d+)), +number +of"
             " +retransmission +(?P<num_retrans>(\d+))$"
         )
-        p11 = re.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
-        p12 = re.compile(
+        p11 = _patterns.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
+        p12 = _patterns.compile(
             r"^Last +retransmission +scan +length +is"
             " +(?P<num1>(\d+)), +maximum +is"
             " +(?P<num2>(\d+))$"
         )
-        p13 = re.compile(
+        p13 = _patterns.compile(
             r"^Last +retransmission +scan +time +is"
             " +(?P<num1>(\d+)) +msec, +maximum +is"
             " +(?P<num2>(\d+)) +msec$"
         )
-        p14 = re.compile(
+        p14 = _patterns.compile(
             r"^LS +Ack +list: +(?P<ls_ack_list>(\S+))"
             " +pending +(?P<pending>(\d+)), +high +water"
             " +mark +(?P<mark>(\d+))$"
         )
-        p15 = re.compile(r"^Total +neighbor +count: +(?P<num>(\d+))$")
+        p15 = _patterns.compile(r"^Total +neighbor +count: +(?P<num>(\d+))$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1159,8 +1167,8 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
                         name = "VL" + str(n.groupdict()["num"])
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    vl_out = parse_cached(ShowOspfVrfAllInclusiveVirtualLinks,
+                                          self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
@@ -1606,6 +1614,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
         "external_lsa_checksum",
     ]
 
+    @memoize_commands
     def cli(self, vrf="", output=None):
         if output is None:
             if vrf:
@@ -1619,206 +1628,206 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
         ret_dict = {}
         af = "ipv4"  # this is ospf - always ipv4
         condition = "always"
-        p1 = re.compile(
+        p1 = _patterns.compile(
             r"(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process"
             ' +"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))"'
             " +with +ID +(?P<router_id>(\S+))$"
         )
-        p2 = re.compile(r"^Role *: +(?P<role>([a-zA-z0-9\s]+))$")
-        p3 = re.compile(r"^NSR +\(Non-stop routing\) +is +(?P<nsr>(\S+))$")
-        p3_1 = re.compile(r"^Supports +only +single +TOS(TOS0) routes$")
-        p3_2 = re.compile(r"^Supports +opaque +LSA$")
-        p4 = re.compile(r"^Redistributing +External +Routes +from,$")
-        p4_1 = re.compile(
+        p2 = _patterns.compile(r"^Role *: +(?P<role>([a-zA-z0-9\s]+))$")
+        p3 = _patterns.compile(r"^NSR +\(Non-stop routing\) +is +(?P<nsr>(\S+))$")
+        p3_1 = _patterns.compile(r"^Supports +only +single +TOS(TOS0) routes$")
+        p3_2 = _patterns.compile(r"^Supports +opaque +LSA$")
+        p4 = _patterns.compile(r"^Redistributing +External +Routes +from,$")
+        p4_1 = _patterns.compile(
             r"^(?P<type>(connected|static))(?: +with +metric"
             " +mapped +to +(?P<metric>(\d+)))?$"
         )
-        p4_2 = re.compile(
+        p4_2 = _patterns.compile(
             r"^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))(?: +with"
             " +metric +mapped +to +(?P<metric>(\d+)))?$"
         )
-        p4_3 = re.compile(
+        p4_3 = _patterns.compile(
             r"^Maximum +number +of +redistributed +prefixes"
             " +(?P<num_prefix>(\d+))"
             "(?: +\((?P<warn>(warning-only))\))?"
         )
-        p4_4 = re.compile(r"^Threshold +for +warning +message" " +(?P<thld>(\d+))\%$")
-        p5_0 = re.compile(
+        p4_4 = _patterns.compile(r"^Threshold +for +warning +message" " +(?P<thld>(\d+))\%$")
+        p5_0 = _patterns.compile(
             r"^It +is +an"
             "(?: +(?P<abr>(area border)))?"
             "(?: +and)?"
             "(?: +(?P<asbr>(autonomous system boundary)))?"
             " +router$"
         )
-        p5_1 = re.compile(
+        p5_1 = _patterns.compile(
             r"^Router +is +not +originating +router-LSAs" " +with +maximum +metric$"
         )
-        p5_2 = re.compile(r"^Originating +router-LSAs +with +maximum" " +metric$")
-        p5_3 = re.compile(
+        p5_2 = _patterns.compile(r"^Originating +router-LSAs +with +maximum" " +metric$")
+        p5_3 = _patterns.compile(
             r"^Condition:"
             " +(?P<condition>(always|on switch-over|on start-up|on proc-restart))"
             "(?: +for +(?P<seconds>(\d+)) +seconds,)?"
             " +State: +(?P<state>(\S+))$"
         )
-        p5_4 = re.compile(
+        p5_4 = _patterns.compile(
             r"^Advertise +stub +links +with +maximum +metric" " +in +router\-LSAs$"
         )
-        p5_5 = re.compile(
+        p5_5 = _patterns.compile(
             r"^Advertise +summary\-LSAs +with +metric" " +(?P<metric>(\d+))$"
         )
-        p5_6 = re.compile(
+        p5_6 = _patterns.compile(
             r"^^Advertise +external\-LSAs +with +metric" " +(?P<metric>(\d+))$"
         )
-        p6 = re.compile(r"^Initial +SPF +schedule +delay +(?P<time>(\S+))" " +msecs$")
-        p7 = re.compile(
+        p6 = _patterns.compile(r"^Initial +SPF +schedule +delay +(?P<time>(\S+))" " +msecs$")
+        p7 = _patterns.compile(
             r"^Minimum +hold +time +between +two +consecutive"
             " +SPFs +(?P<time>(\S+)) +msecs$"
         )
-        p8 = re.compile(
+        p8 = _patterns.compile(
             r"^Maximum +wait +time +between +two +consecutive"
             " +SPFs +(?P<time>(\S+)) +msecs$"
         )
-        p9 = re.compile(r"^Initial +LSA +throttle +delay +(?P<time>(\S+))" " +msecs$")
-        p10 = re.compile(
+        p9 = _patterns.compile(r"^Initial +LSA +throttle +delay +(?P<time>(\S+))" " +msecs$")
+        p10 = _patterns.compile(
             r"^Minimum +hold +time +for +LSA +throttle" " +(?P<time>(\S+)) +msecs$"
         )
-        p11 = re.compile(
+        p11 = _patterns.compile(
             r"^Maximum +wait +time +for +LSA +throttle" " +(?P<time>(\S+)) +msecs$"
         )
-        p12 = re.compile(
+        p12 = _patterns.compile(
             r"^Minimum +LSA +interval +(?P<interval>(\S+))"
             " +msecs. +Minimum +LSA +arrival"
             " +(?P<arrival>(\S+)) +msecs$"
         )
-        p13 = re.compile(r"^LSA +refresh +interval +(?P<refresh>(\S+))" " +seconds$")
-        p14 = re.compile(
+        p13 = _patterns.compile(r"^LSA +refresh +interval +(?P<refresh>(\S+))" " +seconds$")
+        p14 = _patterns.compile(
             r"^Flood +pacing +interval +(?P<flood>(\d+))"
             " +msecs\. +Retransmission +pacing +interval"
             " +(?P<retransmission>(\d+)) +msecs$"
         )
-        p15 = re.compile(
+        p15 = _patterns.compile(
             r"^Adjacency +stagger +(?P<adj>(\S+)); +initial"
             " +\(per +area\): +(?P<init>(\d+)),"
             " +maximum: +(?P<max>(\d+))$"
         )
-        p16 = re.compile(
+        p16 = _patterns.compile(
             r"^Number +of +neighbors +forming:"
             " +(?P<form>(\d+)), +(?P<full>(\d+)) +full$"
         )
-        p17 = re.compile(
+        p17 = _patterns.compile(
             r"^Maximum +number +of +configured +interfaces" " +(?P<max>(\d+))$"
         )
-        p18 = re.compile(
+        p18 = _patterns.compile(
             r"^Number +of +external +LSA +(?P<ext>(\d+))\."
             " +Checksum +Sum +(?P<checksum>(\S+))$"
         )
-        p19 = re.compile(
+        p19 = _patterns.compile(
             r"^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\."
             " +Checksum +Sum +(?P<checksum>(\S+))$"
         )
-        p20 = re.compile(
+        p20 = _patterns.compile(
             r"^Number +of +DCbitless +external +and +opaque"
             " +AS +LSA +(?P<num>(\d+))$"
         )
-        p21 = re.compile(
+        p21 = _patterns.compile(
             r"^Number +of +DoNotAge +external +and +opaque" " +AS +LSA +(?P<num>(\d+))$"
         )
-        p22 = re.compile(
+        p22 = _patterns.compile(
             r"^Number +of +areas +in +this +router +is"
             " +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))"
             " +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))"
             " +nssa$"
         )
-        p23 = re.compile(r"^External +flood +list +length +(?P<num>(\d+))$")
-        p43 = re.compile(
+        p23 = _patterns.compile(r"^External +flood +list +length +(?P<num>(\d+))$")
+        p43 = _patterns.compile(
             r"^LDP +Sync +(?P<sync>(Enabled|Disabled)),"
             " +Sync +Status: +(?P<status>(.*))$"
         )
-        p25 = re.compile(
+        p25 = _patterns.compile(
             r"^LSD +(?P<lsd>([a-zA-Z\,\s]+)), +revision" " +(?P<revision>(\d+))$"
         )
-        p26 = re.compile(
+        p26 = _patterns.compile(
             r"^Segment +Routing +Global +Block +default"
             " +\((?P<sr_block>([0-9\-]+))\),"
             " +(?P<status>(.*))$"
         )
-        p27 = re.compile(r"^Strict-SPF +capability +is +(?P<state>(\S+))$")
-        p28_1 = re.compile(r"^Area +(?P<area>(\S+))(?: +(inactive|\(Inactive\)))?$")
-        p28_2 = re.compile(
+        p27 = _patterns.compile(r"^Strict-SPF +capability +is +(?P<state>(\S+))$")
+        p28_1 = _patterns.compile(r"^Area +(?P<area>(\S+))(?: +(inactive|\(Inactive\)))?$")
+        p28_2 = _patterns.compile(
             r"^It +is +a +(?P<area_type>(\S+)) +area"
             "(?:, +(?P<summary>(no +summary +LSA +in +this"
             " +area)))?$"
         )
-        p28_3 = re.compile(
+        p28_3 = _patterns.compile(
             r"^generates +stub +default +route +with +cost" " +(?P<default_cost>(\d+))$"
         )
-        p28_4 = re.compile(r"^Perform +(?P<trans>(\S+)) +LSA +translation$")
-        p28_5 = re.compile(r"^Area ranges are$")
-        p28_6 = re.compile(
+        p28_4 = _patterns.compile(r"^Perform +(?P<trans>(\S+)) +LSA +translation$")
+        p28_5 = _patterns.compile(r"^Area ranges are$")
+        p28_6 = _patterns.compile(
             r"^(?P<prefix>([0-9\.\/]+)) +Passive"
             " +(?P<advertise>(Advertise|DoNotAdvertise))$"
         )
-        p29 = re.compile(
+        p29 = _patterns.compile(
             r"^Number +of +interfaces +in +this +area +is" " +(?P<num_intf>(\d+))$"
         )
-        p30 = re.compile(
+        p30 = _patterns.compile(
             r"^Area +has +RRR +enabled, +topology +version" " +(?P<topo_version>(\d+))$"
         )
-        p31 = re.compile(r"^SPF +algorithm +executed +(?P<count>(\d+))" " +times$")
-        p32 = re.compile(
+        p31 = _patterns.compile(r"^SPF +algorithm +executed +(?P<count>(\d+))" " +times$")
+        p32 = _patterns.compile(
             r"^Number +of +LSA +(?P<lsa_count>(\d+))\."
             " +Checksum +Sum +(?P<checksum_sum>(\S+))$"
         )
-        p33 = re.compile(
+        p33 = _patterns.compile(
             r"^Number +of opaque +link +LSA"
             " +(?P<opaque_count>(\d+))\. +Checksum +Sum"
             " +(?P<checksum_sum>(\S+))$"
         )
-        p34 = re.compile(r"^Number +of +DCbitless +LSA +(?P<count>(\d+))$")
-        p35 = re.compile(r"^Number +of +indication +LSA +(?P<count>(\d+))$")
-        p36 = re.compile(r"^Number +of +DoNotAge +LSA +(?P<count>(\d+))$")
-        p37 = re.compile(r"^Flood +list +length +(?P<len>(\d+))$")
-        p38 = re.compile(
+        p34 = _patterns.compile(r"^Number +of +DCbitless +LSA +(?P<count>(\d+))$")
+        p35 = _patterns.compile(r"^Number +of +indication +LSA +(?P<count>(\d+))$")
+        p36 = _patterns.compile(r"^Number +of +DoNotAge +LSA +(?P<count>(\d+))$")
+        p37 = _patterns.compile(r"^Flood +list +length +(?P<len>(\d+))$")
+        p38 = _patterns.compile(
             r"^Number +of +LFA +enabled +interfaces"
             " +(?P<count>(\d+)), +LFA +revision"
             " +(?P<revision>(\d+))$"
         )
-        p39 = re.compile(
+        p39 = _patterns.compile(
             r"^Number +of +Per +Prefix +LFA +enabled" " +interfaces +(?P<count>(\d+))$"
         )
-        p40 = re.compile(
+        p40 = _patterns.compile(
             r"^Number +of +neighbors +forming +in +staggered"
             " +mode +(?P<mode>(\d+)), +(?P<full>(\d+)) +full$"
         )
-        p41 = re.compile(
+        p41 = _patterns.compile(
             r"^Maximum +number +of +non +self-generated +LSA"
             " +allowed +(?P<max_lsa>(\d+))$"
         )
-        p42 = re.compile(r"^Non-Stop +Forwarding +enabled$")
+        p42 = _patterns.compile(r"^Non-Stop +Forwarding +enabled$")
         #  IPFRR per-prefix tiebreakers:
-        p43_2 = re.compile(
+        p43_2 = _patterns.compile(
             r"^(?P<per_prefix_tiebreakers>\S+) +per-prefix +tiebreakers:$"
         )
         # Name                    Index
-        p44 = re.compile(r"^Name +(?P<name>\S+)$")
+        p44 = _patterns.compile(r"^Name +(?P<name>\S+)$")
         # No Tunnel (Implicit)    255
-        p45 = re.compile(r"^No +Tunnel +\(Implicit\) +(?P<no_tunnel>\S+)$")
+        p45 = _patterns.compile(r"^No +Tunnel +\(Implicit\) +(?P<no_tunnel>\S+)$")
         # Node Protection         40
-        p46 = re.compile(r"^Node +Protection +(?P<node_protection>\S+)$")
+        p46 = _patterns.compile(r"^Node +Protection +(?P<node_protection>\S+)$")
         # Line-card Disjoint      30
-        p47 = re.compile(r"^Line-card +Disjoint +(?P<line_card_disjoint>\S+)$")
+        p47 = _patterns.compile(r"^Line-card +Disjoint +(?P<line_card_disjoint>\S+)$")
         # Lowest Metric           20
-        p48 = re.compile(r"^Lowest +Metric +(?P<lowest_metric>\S+)$")
+        p48 = _patterns.compile(r"^Lowest +Metric +(?P<lowest_metric>\S+)$")
         # Primary Path            10
-        p49 = re.compile(r"^Primary +Path +(?P<primary_path>\S+)$")
+        p49 = _patterns.compile(r"^Primary +Path +(?P<primary_path>\S+)$")
         # Downstream              0
-        p50 = re.compile(r"^Downstream +(?P<downstream>\S+)$")
+        p50 = _patterns.compile(r"^Downstream +(?P<downstream>\S+)$")
         # Secondary Path          0
-        p51 = re.compile(r"^Secondary +Path +(?P<secondary_path>\S+)$")
+        p51 = _patterns.compile(r"^Secondary +Path +(?P<secondary_path>\S+)$")
         # SRLG Disjoint           0
-        p52 = re.compile(r"^SRLG +Disjoint +(?P<srlg_disjoint>\S+)$")
+        p52 = _patterns.compile(r"^SRLG +Disjoint +(?P<srlg_disjoint>\S+)$")
         # Post Convergence Path   0
-        p53 = re.compile(r"^Post +Convergence +Path +(?P<post_convergence_path>\S+)$")
+        p53 = _patterns.compile(r"^Post +Convergence +Path +(?P<post_convergence_path>\S+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2238,7 +2247,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # SNMP trap is enabled
-            p24 = re.compile(r"^SNMP +trap +is +(?P<snmp>(\S+))$")
+            p24 = _patterns.compile(r"^SNMP +trap +is +(?P<snmp>(\S+))$")
             m = p24.match(line)
             if m:
                 if "enabled" in m.groupdict()["snmp"]:
@@ -2670,7 +2679,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Virtual Links for OSPF 1
             # Sham Links for OSPF 1, VRF VRF1
-            p1 = re.compile(
+            p1 = _patterns.compile(
                 r"^(Virtual|Sham) +Links +for +OSPF"
                 " +(?P<instance>([a-zA-Z0-9\s]+))"
                 "(?:, +VRF +(?P<vrf>(\S+)))?$"
@@ -2705,7 +2714,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Sham Link OSPF_SL0 to address 10.151.22.22 is up
             # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-            p2 = re.compile(
+            p2 = _patterns.compile(
                 r"^(Virtual|Sham) +Link +(?P<link>(\S+)) +to"
                 " +(address|router) +(?P<address>(\S+)) +is"
                 " +(?P<link_state>(up|down))$"
@@ -2724,7 +2733,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                     continue
 
             # Area 1, source address 10.21.33.33
-            p3_1 = re.compile(
+            p3_1 = _patterns.compile(
                 r"^Area +(?P<area>(\S+)), +source +address"
                 " +(?P<source_address>(\S+))$"
             )
@@ -2796,7 +2805,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 continue
 
             # Transit area 1, via interface GigabitEthernet0/0/0/3, Cost of using 65535
-            p3_2 = re.compile(
+            p3_2 = _patterns.compile(
                 r"^Transit +area +(?P<area>(\S+)),"
                 "(?: +via +interface +(?P<intf>(\S+)),)?"
                 " +Cost +of +using +(?P<cost>(\d+))$"
@@ -2873,14 +2882,14 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 continue
 
             # IfIndex = 2
-            p4 = re.compile(r"^IfIndex += +(?P<if_index>(\d+))$")
+            p4 = _patterns.compile(r"^IfIndex += +(?P<if_index>(\d+))$")
             m = p4.match(line)
             if m:
                 sub_dict["if_index"] = int(m.groupdict()["if_index"])
                 continue
 
             # Run as demand circuit
-            p5 = re.compile(r"^Run +as +demand +circuit$")
+            p5 = _patterns.compile(r"^Run +as +demand +circuit$")
             m = p5.match(line)
             if m:
                 if link_type == "sham_links":
@@ -2891,7 +2900,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1)., Cost of using 111
             # DoNotAge LSA not allowed Run as demand circuit (Number of DCbitless LSA is 1).
-            p6 = re.compile(
+            p6 = _patterns.compile(
                 r"^DoNotAge +LSA +not +allowed"
                 "(?: +(?P<demand>(Run +as +demand +circuit)))?"
                 " +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).,?"
@@ -2913,7 +2922,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Transmit Delay is 7 sec, State POINT_TO_POINT,
             # Transmit Delay is 5 sec, State POINT_TO_POINT,
-            p7 = re.compile(
+            p7 = _patterns.compile(
                 r"^Transmit +Delay +is +(?P<transmit_delay>(\d+))"
                 " +sec, +State +(?P<state>(\S+)),?$"
             )
@@ -2927,7 +2936,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
             # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
-            p8 = re.compile(
+            p8 = _patterns.compile(
                 r"^Timer +intervals +configured,"
                 " +Hello +(?P<hello>(\d+)),"
                 " +Dead +(?P<dead>(\d+)),"
@@ -2944,14 +2953,14 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Hello due in 00:00:00:772
             # Hello due in 00:00:03:179
-            p9 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
+            p9 = _patterns.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
             m = p9.match(line)
             if m:
                 sub_dict["hello_timer"] = str(m.groupdict()["hello_timer"])
                 continue
 
             # Non-Stop Forwarding (NSF) enabled, last NSF restart 00:18:16 ago
-            p10 = re.compile(
+            p10 = _patterns.compile(
                 r"^Non-Stop +Forwarding +\(NSF\)"
                 " +(?P<state>(enabled|disabled)), +last +NSF"
                 " +restart +(?P<restart>(\S+)) +ago$"
@@ -2969,7 +2978,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Clear text authentication enabled
             # Message digest authentication enabled
-            p11 = re.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
+            p11 = _patterns.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
             m = p11.match(line)
             if m:
                 auth = str(m.groupdict()["auth"]).lower()
@@ -2983,7 +2992,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 continue
 
             # Youngest key id is 1
-            p12 = re.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
+            p12 = _patterns.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
             m = p12.match(line)
             if m:
                 if "authentication" not in sub_dict:
@@ -3236,39 +3245,39 @@ class ShowOspfMplsTrafficEngLink(ShowOspfMplsTrafficEngLinkSchema):
         ret_dict = {}
         af = "ipv4"
 
-        p1 = re.compile(
+        p1 = _patterns.compile(
             r"^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)"
             " +\(Process +ID +(?P<instance>(\S+))\)$"
         )
-        p2_1 = re.compile(
+        p2_1 = _patterns.compile(
             r"^Area +(?P<area>(\S+)) +has"
             " +(?P<total_links>(\d+)) +MPLS +TE links\."
             " +Area +instance +is +(?P<instance>(\d+))\.$"
         )
-        p2_2 = re.compile(r"^Area +(?P<area>(\S+)) +MPLS +TE +not" " +initialized$")
-        p3 = re.compile(
+        p2_2 = _patterns.compile(r"^Area +(?P<area>(\S+)) +MPLS +TE +not" " +initialized$")
+        p3 = _patterns.compile(
             r"^Link +is +associated +with +fragment"
             " +(?P<fragment>(\d+))\. +Link +instance +is"
             " +(?P<link_instance>(\d+))$"
         )
-        p4 = re.compile(r"^Link +connected +to +(?P<net>(\S+)) +network$")
-        p5 = re.compile(r"^Link +ID *: +(?P<link_id>(\S+))$")
-        p6 = re.compile(r"^Interface +Address *: +(?P<address>(\S+))$")
-        p7 = re.compile(r"^Admin +Metric *: +TE *: +(?P<metric>(\d+))$")
-        p8 = re.compile(r"^Maximum +bandwidth *: +(?P<max_band>(\d+))$")
-        p9 = re.compile(
+        p4 = _patterns.compile(r"^Link +connected +to +(?P<net>(\S+)) +network$")
+        p5 = _patterns.compile(r"^Link +ID *: +(?P<link_id>(\S+))$")
+        p6 = _patterns.compile(r"^Interface +Address *: +(?P<address>(\S+))$")
+        p7 = _patterns.compile(r"^Admin +Metric *: +TE *: +(?P<metric>(\d+))$")
+        p8 = _patterns.compile(r"^Maximum +bandwidth *: +(?P<max_band>(\d+))$")
+        p9 = _patterns.compile(
             r"^Maximum +global +pool +reservable +bandwidth *:"
             " +(?P<max_reserve_band>(\d+))$"
         )
-        p15 = re.compile(r"^Number +of +Priority *: +(?P<priority>(\d+))$")
-        p10 = re.compile(
+        p15 = _patterns.compile(r"^Number +of +Priority *: +(?P<priority>(\d+))$")
+        p10 = _patterns.compile(
             r"^Priority +(?P<priority1>(\d+)) *: +(?P<band1>(\d+))"
             " *Priority +(?P<priority2>(\d+)) *: +(?P<band2>(\d+))$"
         )
-        p11 = re.compile(r"^Out +Interface +ID *: +(?P<out_id>(\d+))$")
-        p12 = re.compile(r"^Affinity +Bit *: +(?P<affinity>(\S+))$")
-        p13 = re.compile(r"^Extended +Admin +Group *: +(?P<eag>(\d+))$")
-        p14 = re.compile(r"^EAG\[(?P<group_num>(\d+))\]:" " +(?P<value>(\d+))$")
+        p11 = _patterns.compile(r"^Out +Interface +ID *: +(?P<out_id>(\d+))$")
+        p12 = _patterns.compile(r"^Affinity +Bit *: +(?P<affinity>(\S+))$")
+        p13 = _patterns.compile(r"^Extended +Admin +Group *: +(?P<eag>(\d+))$")
+        p14 = _patterns.compile(r"^EAG\[(?P<group_num>(\d+))\]:" " +(?P<value>(\d+))$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -3589,181 +3598,181 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
             "opaque": 10,
         }
 
-        p1 = re.compile(
+        p1 = _patterns.compile(
             r"^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)"
             " +\(Process +ID +(?P<instance>(\S+))"
             "(?:, +VRF +(?P<vrf>(\S+)))?\)$"
         )
-        p2 = re.compile(
+        p2 = _patterns.compile(
             r"^(?P<lsa_type_name>(.*)) +Link +States"
             "(?: +\(Area +(?P<area>(\S+))\))?$"
         )
-        p3_1 = re.compile(r"^Routing +Bit +Set +on +this +LSA$")
-        p3_2 = re.compile(r"^LS +age: +(?P<age>(\d+))$")
-        p4 = re.compile(
+        p3_1 = _patterns.compile(r"^Routing +Bit +Set +on +this +LSA$")
+        p3_2 = _patterns.compile(r"^LS +age: +(?P<age>(\d+))$")
+        p4 = _patterns.compile(
             r"^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?"
             "(?: *\((?P<option_desc>(.*))\))?$"
         )
-        p5_1 = re.compile(r"^LS +Type: +(?P<lsa_type>(.*))$")
-        p5_2 = re.compile(r"^Link +State +ID: +(?P<lsa_id>(\S+))" "(?: +\(.*\))?$")
-        p6 = re.compile(r"^Advertising +Router: +(?P<adv_router>(\S+))$")
-        p7 = re.compile(r"^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$")
-        p8 = re.compile(r"^Checksum: +(?P<checksum>(\S+))$")
-        p9 = re.compile(r"^Length: +(?P<length>(\d+))$")
-        p10 = re.compile(r"^Network +Mask: +\/(?P<net_mask>(\S+))$")
-        p11_1 = re.compile(r"^Metric +Type: +2 +\(.*\)$")
-        p11_2 = re.compile(r"^Metric +Type: +1 +\(.*\)$")
-        p12 = re.compile(
+        p5_1 = _patterns.compile(r"^LS +Type: +(?P<lsa_type>(.*))$")
+        p5_2 = _patterns.compile(r"^Link +State +ID: +(?P<lsa_id>(\S+))" "(?: +\(.*\))?$")
+        p6 = _patterns.compile(r"^Advertising +Router: +(?P<adv_router>(\S+))$")
+        p7 = _patterns.compile(r"^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$")
+        p8 = _patterns.compile(r"^Checksum: +(?P<checksum>(\S+))$")
+        p9 = _patterns.compile(r"^Length: +(?P<length>(\d+))$")
+        p10 = _patterns.compile(r"^Network +Mask: +\/(?P<net_mask>(\S+))$")
+        p11_1 = _patterns.compile(r"^Metric +Type: +2 +\(.*\)$")
+        p11_2 = _patterns.compile(r"^Metric +Type: +1 +\(.*\)$")
+        p12 = _patterns.compile(
             r"^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:" " +(?P<metric>(\d+)))?$"
         )
-        p13 = re.compile(r"^Metric: +(?P<metric>(\d+))$")
-        p14 = re.compile(r"^Forward +Address: +(?P<addr>(\S+))$")
-        p15 = re.compile(r"^External +Route +Tag: +(?P<tag>(\d+))$")
-        p16 = re.compile(r"^Attached +Router: +(?P<att_router>(\S+))$")
+        p13 = _patterns.compile(r"^Metric: +(?P<metric>(\d+))$")
+        p14 = _patterns.compile(r"^Forward +Address: +(?P<addr>(\S+))$")
+        p15 = _patterns.compile(r"^External +Route +Tag: +(?P<tag>(\d+))$")
+        p16 = _patterns.compile(r"^Attached +Router: +(?P<att_router>(\S+))$")
 
         # Number of Links : 1
         # Number of Links: 3
-        p17 = re.compile(r"^Number +of +(l|L)inks *: +(?P<num>(\d+))$")
-        p18 = re.compile(r"^Link +connected +to: +a +(?P<type>(.*))$")
-        p18_1 = re.compile(r"^Link +connected +to: +(?P<type>(.*))$")
-        p19_1 = re.compile(
+        p17 = _patterns.compile(r"^Number +of +(l|L)inks *: +(?P<num>(\d+))$")
+        p18 = _patterns.compile(r"^Link +connected +to: +a +(?P<type>(.*))$")
+        p18_1 = _patterns.compile(r"^Link +connected +to: +(?P<type>(.*))$")
+        p19_1 = _patterns.compile(
             r"^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:" " +(?P<link_id>(\S+))$"
         )
-        p19_2 = re.compile(
+        p19_2 = _patterns.compile(
             r"^\(Link +ID\) +(D|d)esignated +(R|r)outer"
             " +(a|A)ddress: +(?P<link_id>(\S+))$"
         )
-        p19_3 = re.compile(
+        p19_3 = _patterns.compile(
             r"^\(Link +ID\) +(N|n)eighboring +(R|r)outer"
             " +(I|d)D: +(?P<link_id>(\S+))$"
         )
-        p20_1 = re.compile(r"^\(Link +Data\) +Network +Mask:" " +(?P<link_data>(\S+))$")
-        p20_2 = re.compile(
+        p20_1 = _patterns.compile(r"^\(Link +Data\) +Network +Mask:" " +(?P<link_data>(\S+))$")
+        p20_2 = _patterns.compile(
             r"^\(Link +Data\) +Router +Interface +address:" " +(?P<link_data>(\S+))$"
         )
-        p21 = re.compile(r"^Number +of +TOS +metrics: +(?P<num>(\d+))$")
-        p22 = re.compile(r"^Opaque +Type: +(?P<type>(\d+))$")
-        p23 = re.compile(r"^Opaque +ID: +(?P<id>(\d+))$")
-        p24 = re.compile(r"^Fragment +number: +(?P<num>(\d+))$")
-        p25 = re.compile(r"^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$")
-        p26_1 = re.compile(r"^AS +Boundary +Router$")
-        p26_2 = re.compile(r"^Area +Border +Router$")
-        p27 = re.compile(r"^Link +connected +to +(?P<link>(.*))$")
-        p28 = re.compile(r"^Link +ID *: +(?P<id>(\S+))$")
-        p29 = re.compile(r"^Interface +Address *: +(?P<addr>(\S+))$")
-        p30 = re.compile(r"^Admin +Metric *: +(?P<te_metric>(\d+))$")
-        p31 = re.compile(r"^Maximum +(B|b)andwidth *:" " +(?P<max_band>(\d+))$")
-        p32 = re.compile(
+        p21 = _patterns.compile(r"^Number +of +TOS +metrics: +(?P<num>(\d+))$")
+        p22 = _patterns.compile(r"^Opaque +Type: +(?P<type>(\d+))$")
+        p23 = _patterns.compile(r"^Opaque +ID: +(?P<id>(\d+))$")
+        p24 = _patterns.compile(r"^Fragment +number: +(?P<num>(\d+))$")
+        p25 = _patterns.compile(r"^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$")
+        p26_1 = _patterns.compile(r"^AS +Boundary +Router$")
+        p26_2 = _patterns.compile(r"^Area +Border +Router$")
+        p27 = _patterns.compile(r"^Link +connected +to +(?P<link>(.*))$")
+        p28 = _patterns.compile(r"^Link +ID *: +(?P<id>(\S+))$")
+        p29 = _patterns.compile(r"^Interface +Address *: +(?P<addr>(\S+))$")
+        p30 = _patterns.compile(r"^Admin +Metric *: +(?P<te_metric>(\d+))$")
+        p31 = _patterns.compile(r"^Maximum +(B|b)andwidth *:" " +(?P<max_band>(\d+))$")
+        p32 = _patterns.compile(
             r"^Maximum +(R|r)eservable +(B|b)andwidth"
             "(?: +global)? *: +(?P<max_res_band>(\d+))$"
         )
-        p33 = re.compile(r"^Affinity +Bit *: +(?P<admin_group>(\S+))$")
-        p33_1 = re.compile(r"^IGP +Metric *: +(?P<igp_metric>(\d+))$")
-        p33_2 = re.compile(r"^Number +of +Priority *: +(?P<num>(\d+))$")
-        p34 = re.compile(
+        p33 = _patterns.compile(r"^Affinity +Bit *: +(?P<admin_group>(\S+))$")
+        p33_1 = _patterns.compile(r"^IGP +Metric *: +(?P<igp_metric>(\d+))$")
+        p33_2 = _patterns.compile(r"^Number +of +Priority *: +(?P<num>(\d+))$")
+        p34 = _patterns.compile(
             r"^Priority +(?P<num1>(\d+)) *:"
             " +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))"
             " *: +(?P<band2>(\d+)))?$"
         )
-        p35 = re.compile(
+        p35 = _patterns.compile(
             r"^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),"
             " +Length += +(?P<length>(\d+))"
             " +Value += +(?P<value>(.*))$"
         )
-        p36 = re.compile(
+        p36 = _patterns.compile(
             r"^Extended +Administrative +Group *: +Length *:" " +(?P<eag_length>(\d+))$"
         )
-        p37 = re.compile(r"^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$")
+        p37 = _patterns.compile(r"^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$")
 
         # --regex for opaque-- #
         # Router Information TLV: Length: 4
-        p38 = re.compile(r"^Router +Information +TLV: +Length: +(?P<length>\d+)$")
+        p38 = _patterns.compile(r"^Router +Information +TLV: +Length: +(?P<length>\d+)$")
 
         # Capabilities:
         #   Graceful Restart Helper Capable
-        p39 = re.compile(r"^Graceful +Restart +Helper +Capable$")
+        p39 = _patterns.compile(r"^Graceful +Restart +Helper +Capable$")
 
         #   Stub Router Capable
-        p40 = re.compile(r"^Stub +Router +Capable$")
+        p40 = _patterns.compile(r"^Stub +Router +Capable$")
 
         #   All capability bits: 0x60000000
-        p41 = re.compile(r"^All +capability +bits: +(?P<bits>\w+)$")
+        p41 = _patterns.compile(r"^All +capability +bits: +(?P<bits>\w+)$")
 
         # Segment Routing Algorithm TLV: Length: 2
-        p42 = re.compile(
+        p42 = _patterns.compile(
             r"^Segment +Routing +Algorithm +TLV: +Length: +(?P<length>\d+)$"
         )
 
         #   Algorithm: 0
         #   Algorithm: 1
-        p43 = re.compile(r"^Algorithm: +(?P<algo>\d+)$")
+        p43 = _patterns.compile(r"^Algorithm: +(?P<algo>\d+)$")
 
         # Segment Routing Range TLV: Length: 12
-        p44 = re.compile(r"^Segment +Routing +Range +TLV: +Length: +(?P<length>\d+)$")
+        p44 = _patterns.compile(r"^Segment +Routing +Range +TLV: +Length: +(?P<length>\d+)$")
 
         #   Range Size: 65535
-        p45 = re.compile(r"^Range +Size: +(?P<range_size>\d+)$")
+        p45 = _patterns.compile(r"^Range +Size: +(?P<range_size>\d+)$")
 
         #     SID sub-TLV: Length 3
         #     SID sub-TLV: Length: 8
-        p46 = re.compile(r"^(?P<type>[\S\s]+) +sub-TLV: +Length:? +(?P<length>\d+)$")
+        p46 = _patterns.compile(r"^(?P<type>[\S\s]+) +sub-TLV: +Length:? +(?P<length>\d+)$")
 
         #      Label: 16000
-        p47 = re.compile(r"^Label *: +(?P<label>\d+)$")
+        p47 = _patterns.compile(r"^Label *: +(?P<label>\d+)$")
 
         # Node MSD TLV: Length: 2
-        p48 = re.compile(r"^Node MSD TLV: +Length: +(?P<length>\d+)$")
+        p48 = _patterns.compile(r"^Node MSD TLV: +Length: +(?P<length>\d+)$")
 
         #     Type: 1, Value 10
-        p49 = re.compile(r"^Type: +(?P<type>\d+), +Value +(?P<value>\d+)$")
+        p49 = _patterns.compile(r"^Type: +(?P<type>\d+), +Value +(?P<value>\d+)$")
 
         # Segment Routing Local Block TLV: Length: 12
-        p50 = re.compile(
+        p50 = _patterns.compile(
             r"^Segment +Routing +Local +Block +TLV: +Length: +(?P<length>\d+)$"
         )
 
         # Extended Prefix Range TLV: Length: 24
         # Extended Prefix TLV: Length: 24
-        p51 = re.compile(r"^Extended +Prefix +(Range +)?TLV: +Length: +(?P<length>\d+)$")
+        p51 = _patterns.compile(r"^Extended +Prefix +(Range +)?TLV: +Length: +(?P<length>\d+)$")
 
         #   AF        : 0
-        p52 = re.compile(r"^AF *: +(?P<af>\d+)$")
+        p52 = _patterns.compile(r"^AF *: +(?P<af>\d+)$")
 
         #   Prefix    : 10.246.254.0/32
-        p53 = re.compile(r"^Prefix *: +(?P<prefix>\S+)$")
+        p53 = _patterns.compile(r"^Prefix *: +(?P<prefix>\S+)$")
 
         #   Flags     : 0x0
-        p54 = re.compile(r"^Flags *: +(?P<flags>\S+)$")
+        p54 = _patterns.compile(r"^Flags *: +(?P<flags>\S+)$")
 
         #     MTID      : 0
-        p55 = re.compile(r"^MTID *: +(?P<mt_id>\d+)$")
+        p55 = _patterns.compile(r"^MTID *: +(?P<mt_id>\d+)$")
 
         #     Algo      : 0
-        p56 = re.compile(r"^Algo *: +(?P<algo>\d+)$")
+        p56 = _patterns.compile(r"^Algo *: +(?P<algo>\d+)$")
 
         #     SID Index : 1028
-        p57 = re.compile(r"^SID +Index *: +(?P<sid_index>\d+)$")
+        p57 = _patterns.compile(r"^SID +Index *: +(?P<sid_index>\d+)$")
 
         # Extended Link TLV: Length: 76
-        p58 = re.compile(r"^Extended +Link +TLV: +Length: +(?P<length>\d+)$")
+        p58 = _patterns.compile(r"^Extended +Link +TLV: +Length: +(?P<length>\d+)$")
 
         #   Link-type : 1
-        p59 = re.compile(r"^Link-type *: +(?P<link_type>\d+)$")
+        p59 = _patterns.compile(r"^Link-type *: +(?P<link_type>\d+)$")
 
         #   Link Data : 172.16.0.91
-        p60 = re.compile(r"^Link +Data *: +(?P<link_data>\S+)$")
+        p60 = _patterns.compile(r"^Link +Data *: +(?P<link_data>\S+)$")
 
         #     Weight    : 0
-        p61 = re.compile(r"^Weight *: +(?P<weight>\d+)$")
+        p61 = _patterns.compile(r"^Weight *: +(?P<weight>\d+)$")
 
         #     Local Interface ID: 78
-        p62 = re.compile(r"^Local +Interface +ID *: +(?P<local_id>\d+)$")
+        p62 = _patterns.compile(r"^Local +Interface +ID *: +(?P<local_id>\d+)$")
 
         #     Remote Interface ID: 76
-        p63 = re.compile(r"^Remote +Interface +ID *: +(?P<remote_id>\d+)$")
+        p63 = _patterns.compile(r"^Remote +Interface +ID *: +(?P<remote_id>\d+)$")
 
         #     Neighbor Address: 172.16.0.90
-        p64 = re.compile(r"^Neighbor +Address *: +(?P<nbr_addr>\S+)$")
+        p64 = _patterns.compile(r"^Neighbor +Address *: +(?P<nbr_addr>\S+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -8,6 +8,7 @@ from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
 
+from genie.libs.parser.utils.stream import RecordStream, StreamParser
 
 # ====================================================
 #  schema for show route ipv4
@@ -82,7 +83,7 @@ class ShowRouteIpv4Schema(MetaParser):
 # ====================================================
 #  parser for show route ipv4
 # ====================================================
-class ShowRouteIpv4(ShowRouteIpv4Schema):
+class ShowRouteIpv4(ShowRouteIpv4Schema, StreamParser):
     cli_command = [
         'show route ipv4',
         'show route vrf {vrf} ipv4',
@@ -127,6 +128,14 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
     protocol_set = {'ospf', 'odr', 'isis', 'eigrp', 'static', 'mobile',
                     'rip', 'lisp', 'nhrp', 'local', 'connected', 'bgp'}
 
+    # A route starts on its codes and network, or on the entry of a single
+    # route, under its VRF and gateway of last resort
+    record_stream = RecordStream(
+        record=r'^\s*([\w](\*)*( *\S+)? +[\da-fA-F\.\:]+\/\d+ '
+               r'|Routing +entry +for )',
+        context=[r'^\s*VRF: +\S+$',
+                 r'^\s*Gateway +of +last +resort +is '])
+
     def cli(self, vrf=None, route=None, protocol=None, output=None):
         
         # Check if argument from device.parse is protocol or route
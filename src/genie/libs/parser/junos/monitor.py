@@ -41,20 +41,80 @@ class MonitorInterfaceTraffic(MonitorInterfaceTrafficSchema):
     
     cli_command = ['monitor interface traffic']
 
+    # Refreshed screen of the command, drawn with ANSI escape sequences
+    ansi_escape = re.compile(r'(\x00|\x9B|\x1B\[[0-?]*[ -\/]*[@-~])')
+
+    # Prompt given back once the command is quit
+    prompt = r'[>#%]\s*$'
+
     def cli(self, output=None, timeout=10):
         if not output:
             self.device.sendline(self.cli_command[0])
             out = self.device.expect(
                 [r'{}[\S\s]+Time:\s+\S+'.format(self.device._hostname)],
                 timeout=timeout).match_output
-            ansi_escape = re.compile(r'(\x00|\x9B|\x1B\[[0-?]*[ -\/]*[@-~])')
-            out = ansi_escape.sub('\t', out)
-            self.device.sendline('q')
-            time.sleep(5)
-            self.device.expect('.*')
+            out = self.ansi_escape.sub('\t', out)
+            self._quit(timeout)
         else:
             out = output
 
+        return self._parse_screen(out)
+
+    def samples(self, count=None, duration=None, timeout=10):
+        '''Yield the parsed screen of each refresh of the command, as they
+        are received, for count refreshes or duration seconds (until the
+        generator is closed without either)
+
+        Args:
+            count (`int`): number of samples
+            duration (`float`): seconds to sample for
+            timeout (`int`): seconds to wait for each refresh
+
+        example:
+
+            >>> monitor = MonitorInterfaceTraffic(device=device)
+            >>> for sample in monitor.samples(count=5):
+            ...     (time, screen), = sample['monitor-time'].items()
+            ...     print(time, screen['interface']['ge-0/0/0']['input-pps'])
+        '''
+        deadline = None if duration is None else time.monotonic() + duration
+        screen = _Screen()
+        sampled = 0
+
+        self.device.sendline(self.cli_command[0])
+        try:
+            while count is None or sampled < count:
+                wait = timeout
+                if deadline is not None:
+                    wait = min(timeout, deadline - time.monotonic())
+                    if wait <= 0:
+                        return
+                try:
+                    chunk = self.device.expect([r'[\S\s]+'],
+                                               timeout=wait).match_output
+                except Exception:
+                    if deadline is not None and \
+                                        time.monotonic() >= deadline:
+                        return
+                    raise
+
+                for frame in screen.feed(chunk):
+                    parsed = self._parse_screen(frame)
+                    if 'monitor-time' not in parsed:
+                        continue
+                    yield parsed
+                    sampled += 1
+                    if count is not None and sampled >= count:
+                        return
+        finally:
+            self._quit(timeout)
+
+    def _quit(self, timeout):
+        '''Quit the command and wait for the prompt'''
+        self.device.sendline('q')
+        self.device.expect([self.prompt], timeout=timeout)
+
+    def _parse_screen(self, out):
         ret_dict = {}
         monitor_time_sub_dict = {}
         
@@ -106,4 +166,127 @@ class MonitorInterfaceTraffic(MonitorInterfaceTrafficSchema):
                     setdefault(monitor_time, monitor_time_sub_dict)
                 continue
 
-        return ret_dict
\ No newline at end of file
+        return ret_dict
+
+
+class _Screen(object):
+    '''Screen of a terminal, drawn by the ANSI escape sequences of the
+    commands refreshing it. feed() yields the text of the screen each time
+    its `Time:` is refreshed, which is written last.
+    '''
+
+    # Escape sequences, and the text or control characters in between
+    sequence = re.compile(
+        r'\x1b\[(?P<params>[0-?]*)[ -/]*(?P<final>[@-~])|'
+        r'\x9b(?P<c1_params>[0-?]*)[ -/]*(?P<c1_final>[@-~])|'
+        r'\x1b[()*+][\S\s]|\x1b[^\[()*+]|'
+        r'(?P<text>[^\x00-\x1f\x1b\x9b]+)|(?P<control>[\x00-\x1f])')
+
+    # Unfinished escape sequence at the end of a chunk
+    unfinished = re.compile(
+        r'(\x1b(\[[0-?]*[ -/]*|[()*+])?|\x9b[0-?]*[ -/]*)$')
+
+    # Written last, once the whole time is
+    refresh_time = re.compile(r'Time:\s+\d+:\d\d:\d\d')
+
+    def __init__(self, columns=80):
+        self.columns = columns
+        self.rows = []
+        self.row = 0
+        self.column = 0
+        self.pending = ''
+        self.refreshed = None
+
+    def _line(self, row):
+        while len(self.rows) <= row:
+            self.rows.append([])
+        return self.rows[row]
+
+    def _write(self, text):
+        line = self._line(self.row)
+        if len(line) < self.column:
+            line.extend(' ' * (self.column - len(line)))
+        line[self.column:self.column + len(text)] = text
+        self.column += len(text)
+
+    def _erase_line(self, mode):
+        line = self._line(self.row)
+        if mode == 0:
+            del line[self.column:]
+        elif mode == 1:
+            line[:self.column] = ' ' * min(self.column, len(line))
+        else:
+            del line[:]
+
+    def _erase_display(self, mode):
+        if mode == 0:
+            self._erase_line(0)
+            del self.rows[self.row + 1:]
+        elif mode == 1:
+            for line in self.rows[:self.row]:
+                del line[:]
+            self._erase_line(1)
+        else:
+            self.rows = []
+
+    def _escape(self, params, final):
+        values = [int(value) if value.isdigit() else 0
+                  for value in params.split(';')]
+        first = values[0]
+        if final in 'Hf':
+            self.row = max(first, 1) - 1
+            self.column = max(values[1] if len(values) > 1 else 0, 1) - 1
+        elif final == 'J':
+            self._erase_display(first)
+        elif final == 'K':
+            self._erase_line(first)
+        elif final == 'A':
+            self.row = max(self.row - max(first, 1), 0)
+        elif final == 'B':
+            self.row += max(first, 1)
+        elif final == 'C':
+            self.column += max(first, 1)
+        elif final == 'D':
+            self.column = max(self.column - max(first, 1), 0)
+        elif final == 'G':
+            self.column = max(first, 1) - 1
+        elif final == 'd':
+            self.row = max(first, 1) - 1
+
+    def _control(self, character):
+        if character == '\r':
+            self.column = 0
+        elif character == '\n':
+            self.row += 1
+            self.column = 0
+        elif character == '\b':
+            self.column = max(self.column - 1, 0)
+        elif character == '\t':
+            self.column = (self.column // 8 + 1) * 8
+
+    def text(self):
+        return '\n'.join(''.join(line).rstrip() for line in self.rows)
+
+    def feed(self, data):
+        '''Draw data, yield the text of the screen at each refresh'''
+        data = self.pending + data
+        self.pending = ''
+        unfinished = self.unfinished.search(data)
+        if unfinished:
+            self.pending = unfinished.group()
+            data = data[:unfinished.start()]
+
+        for m in self.sequence.finditer(data):
+            if m.group('text') is not None:
+                self._write(m.group('text'))
+                line = ''.join(self.rows[self.row])
+                match = self.refresh_time.search(line)
+                if match and match.group() != self.refreshed:
+                    self.refreshed = match.group()
+                    yield self.text()
+            elif m.group('control') is not None:
+                self._control(m.group('control'))
+            elif m.group('final') is not None:
+                self._escape(m.group('params'), m.group('final'))
+            elif m.group('c1_final') is not None:
+                self._escape(m.group('c1_params'), m.group('c1_final'))
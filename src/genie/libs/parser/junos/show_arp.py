@@ -13,6 +13,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 class ShowArpSchema(MetaParser):
     """ Schema for:
             * show arp
@@ -33,22 +36,13 @@ class ShowArpSchema(MetaParser):
         }
     }"""
 
-    def validate_arp_table_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('arp-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "arp-table-entry-flags": str,
-            "hostname": str,
-            "interface-name": str,
-            "ip-address": str,
-            "mac-address": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_arp_table_entry_list = ListOfDict({
+        "arp-table-entry-flags": str,
+        "hostname": str,
+        "interface-name": str,
+        "ip-address": str,
+        "mac-address": str
+    }, 'arp-table-entry is not a list')
     
     # Main Schema
     schema = {
@@ -140,21 +134,12 @@ class ShowArpNoResolveSchema(MetaParser):
         }
     }"""
 
-    def validate_arp_table_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('arp-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "arp-table-entry-flags": str,
-            "interface-name": str,
-            "ip-address": str,
-            "mac-address": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_arp_table_entry_list = ListOfDict({
+        "arp-table-entry-flags": str,
+        "interface-name": str,
+        "ip-address": str,
+        "mac-address": str
+    }, 'arp-table-entry is not a list')
     
     # Main Schema
     schema = {
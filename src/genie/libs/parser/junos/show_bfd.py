@@ -11,27 +11,22 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 class ShowBFDSessionSchema(MetaParser):
     """ Schema for
         * show bfd session
     """
-    def validate_bfd_session(value):
-        if not isinstance(value, list):
-            raise SchemaError('BFD Session not a list')
-
-        bfd_session = Schema({
-            "session-neighbor": str,
-            "session-state": str,
-            Optional("session-interface"): str,
-            "session-detection-time": str,
-            "session-transmission-interval": str,
-            "session-adaptive-multiplier": str,
-        })
-
-        for item in value:
-            bfd_session.validate(item)
-        return value
+    validate_bfd_session = ListOfDict({
+        "session-neighbor": str,
+        "session-state": str,
+        Optional("session-interface"): str,
+        "session-detection-time": str,
+        "session-transmission-interval": str,
+        "session-adaptive-multiplier": str,
+    }, 'BFD Session not a list')
 
     schema = {
         "bfd-session-information": {
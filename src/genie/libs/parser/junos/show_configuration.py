@@ -13,6 +13,9 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 class ShowConfigurationProtocolsMplsLabelSwitchedPathSchema(MetaParser):
     """ Schema for:
@@ -125,18 +128,10 @@ class ShowConfigurationProtocolsMplsPathSchema(MetaParser):
         show configuration protocols mpls path {path}
     """
 
-    def validate_path_list_schema(value):
-        if not isinstance(value, list):
-            raise SchemaError('path list schema is not a list')
-    
-        path_list_schema = Schema({
-            'name': str,
-            'type': str,
-        })
-    
-        for item in value:
-            path_list_schema.validate(item)
-        return value
+    validate_path_list_schema = ListOfDict({
+        'name': str,
+        'type': str,
+    }, 'path list schema is not a list')
 
     schema = {
         "configuration": {
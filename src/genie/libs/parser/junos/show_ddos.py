@@ -12,6 +12,9 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 class ShowDdosProtectionStatisticsSchema(MetaParser):
     """
     Schema for:
@@ -111,34 +114,26 @@ class ShowDDosProtectionProtocolSchema(MetaParser):
     """ Schema for:
             * show ddos-protection protocols {protocol}  
     """
-    def validate_ddos_instance_list(value):
-        # Pass ddos instance list
-        if not isinstance(value, list):
-            raise SchemaError('ddos-instance is not a list')
-        ddos_instance_schema = Schema({
+    validate_ddos_instance_list = ListOfDict({
+        Optional("@junos:style"): str,
+        "ddos-instance-parameters": {
             Optional("@junos:style"): str,
-            "ddos-instance-parameters": {
-                Optional("@junos:style"): str,
-                Optional("hostbound-queue"): str,
-                "policer-bandwidth": str,
-                Optional("policer-bandwidth-scale"): str,
-                "policer-burst": str,
-                Optional("policer-burst-scale"): str,
-                Optional("policer-enable"): str
-            },
-            "ddos-instance-statistics": {
-                Optional("@junos:style"): str,
-                "packet-arrival-rate": str,
-                "packet-arrival-rate-max": str,
-                "packet-dropped": str,
-                "packet-received": str
-            },
-            "protocol-states-locale": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ddos_instance_schema.validate(item)
-        return value
+            Optional("hostbound-queue"): str,
+            "policer-bandwidth": str,
+            Optional("policer-bandwidth-scale"): str,
+            "policer-burst": str,
+            Optional("policer-burst-scale"): str,
+            Optional("policer-enable"): str
+        },
+        "ddos-instance-statistics": {
+            Optional("@junos:style"): str,
+            "packet-arrival-rate": str,
+            "packet-arrival-rate-max": str,
+            "packet-dropped": str,
+            "packet-received": str
+        },
+        "protocol-states-locale": str
+    }, 'ddos-instance is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -14,6 +14,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, Schema, Or)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 class ShowFirewallSchema(MetaParser):
 
     """ Schema for:
@@ -42,23 +45,12 @@ class ShowFirewallSchema(MetaParser):
     }
 }"""
 
-    def validate_counter_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('counter is not a list')
-        counter_inner_schema = Schema(
-                        {
-                            "byte-count": str,
-                            "counter-name": str,
-                            "packet-count": str
-                        
-                        }
-                    
-        )
-        # Validate each dictionary in list
-        for item in value:
-            counter_inner_schema.validate(item)
-        return value
+    validate_counter_list = ListOfDict({
+        "byte-count": str,
+        "counter-name": str,
+        "packet-count": str
+
+    }, 'counter is not a list')
 
     
     def validate_filter_information_list(value):
@@ -256,21 +248,15 @@ class ShowFirewallLogSchema(MetaParser):
     }
 }"""
 
-    def validate_log_information_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('log-information is not a list')
-        log_schema = Schema({
-                "action-name": str,
-                "destination-address": str,
-                "filter-name": str,
-                "interface-name": str,
-                "protocol-name": str,
-                "source-address": str,
-                "time": str
-        })
-        for item in value:
-            log_schema.validate(item)
-        return value
+    validate_log_information_list = ListOfDict({
+        "action-name": str,
+        "destination-address": str,
+        "filter-name": str,
+        "interface-name": str,
+        "protocol-name": str,
+        "source-address": str,
+        "time": str
+    }, 'log-information is not a list')
 
     schema = {
     "firewall-log-information": {
@@ -27,6 +27,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.schema import ListOfDict
+from genie.libs.parser.utils.patterns import LineDispatcher
+from genie.libs.parser.utils.counters import CounterLines, CounterParser
 
 
 # =======================================================
@@ -207,20 +210,12 @@ class ShowInterfacesDescriptionsSchema(MetaParser):
             * show interfaces descriptions
             * show interfaces descriptions {interface}
     """
-    def validate_physical_interface_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('physical-interface is not a list')
-        entry_schema = Schema(
-            {
-                "admin-status": str,
-                "description": str,
-                "name": str,
-                "oper-status": str
-            }
-        )
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_physical_interface_list = ListOfDict({
+        "admin-status": str,
+        "description": str,
+        "name": str,
+        "oper-status": str
+    }, 'physical-interface is not a list')
 
     schema = {
         "interface-information": {
@@ -1157,8 +1152,660 @@ class ShowInterfacesSchema(MetaParser):
         }
     }
 
-class ShowInterfaces(ShowInterfacesSchema):
+# Patterns of the lines of show interfaces, matched by ShowInterfaces.cli()
+# and parse_counters()
+_show_interfaces_lines = LineDispatcher()
+
+# Physical interface: ge-0/0/0, Enabled, Physical link is Up
+_show_interfaces_lines.add(
+    'p1', r'^Physical +interface: +(?P<name>\S+), +'
+          r'(?P<admin_status>\S+), +Physical +link +is +(?P<oper_status>\S+)$',
+    anchor='Physical interface:')
+
+# Interface index: 148, SNMP ifIndex: 526
+_show_interfaces_lines.add(
+    'p2', r'^Interface +index: +(?P<local_index>\d+), +'
+          r'SNMP +ifIndex: +(?P<snmp_index>\d+)'
+          r'(, +Generation: +\S+)$',
+    anchor='Interface index:')
+
+# Description: none/100G/in/hktGCS002_ge-0/0/0
+# Description: TEST-DESC:1|TEST#1234 DEV
+_show_interfaces_lines.add(
+    'p3', r'^Description: +(?P<description>.+)$',
+    anchor='Description:')
+
+# Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None,
+# Link-level type: Ethernet, MTU: 1514, MRU: 1522, Speed: 100Gbps, BPDU Error: None, Loopback: Disabled,
+# Link-level type: Ethernet, MTU: 1514, Link-mode: Full-duplex, Speed: 1000mbps,
+# Link-level type: Ethernet, MTU: 1514, Speed: 1Gbps, BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled, Source filtering: Disabled, Flow control: Disabled
+_show_interfaces_lines.add(
+    'p4', r'^(Type: +\S+, )?Link-level +type: +(?P<link_level_type>\S+), '
+          r'+MTU: +(?P<mtu>\S+)(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
+          r'(, +Link-mode: +(?P<link_mode>\S+))?(, +Speed: +(?P<speed>\S+))?'
+          r'(, +BPDU +Error: +(?P<bpdu_error>\w+))?'
+          r'(, +MAC-REWRITE Error: +(?P<mac_rewrite_error>\S+))?'
+          r'(, +Loopback: +(?P<loopback>\S+))?'
+          r'(, Source +filtering: +(?P<source_filtering>\S+))?'
+          r'(, +Flow +control: +(?P<if_flow_control>\S+))?(,)?$',
+    anchor=('Type:', 'Link-level type:'))
+
+# Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None,
+_show_interfaces_lines.add(
+    'p4_1', r'^(Speed: +(?P<speed>[^\s,]+))(, +)?'
+            r'(BPDU +Error: +(?P<bpdu_error>[^\s,]+))?(, +)?'
+            r'(Loop +Detect +PDU +Error: +(?P<ld_pdu_error>[^\s,]+))?(, +)?',
+    anchor='Speed:')
+
+# Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None,
+_show_interfaces_lines.add(
+    'p4_2', r'^Link-level +type: +(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
+            r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
+            r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +(?P<bpdu_error>\S+),)?'
+            r'( +Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+),)?'
+            r'( +Ethernet-Switching +Error: +(?P<eth_switch_error>\S+),)?'
+            r'( +MAC-REWRITE +Error: +\S+)?$',
+    anchor='Link-level type:')
+
+# Link-level type: Ethernet, MTU: 1514, MRU: 1522, Speed: 100Gbps, BPDU Error: None, Loopback: Disabled,
+# Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
+_show_interfaces_lines.add(
+    'p5', r'^Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+), +'
+          r'Ethernet-Switching +Error: +(?P<eth_switch_error>\S+), +MAC-REWRITE +'
+          r'Error: +\S+, +Loopback: +(?P<loopback>\S+),$',
+    anchor='Loop Detect PDU Error:')
+
+# Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
+# BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled
+_show_interfaces_lines.add(
+    'p5_1', r'^((Ethernet-Switching +Error: +(?P<eth_switch_error>[^\s,]+))|(BPDU +Error: +(?P<bpdu_error>[^\s,]+)))(, +)?(MAC-REWRITE +Error: +[^\s,]+)?(, +)?(Loopback: +(?P<loopback>[^\s,]+))(, +)?',
+    anchor=('Ethernet-Switching Error:', 'BPDU Error:'))
+
+# Loopback: Disabled, Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
+_show_interfaces_lines.add(
+    'p5_2', r'^(Loopback: +(?P<loopback>\S+),)?'
+            r'( +Source +filtering: +(?P<source_filtering>\S+),)?'
+            r'( +Flow +control: +(?P<if_flow_control>\S+),)?'
+            r'( +Auto-negotiation: +(?P<if_auto_negotiation>\S+),)?'
+            r'( +Remote +fault: +(?P<if_remote_fault>\S+))$')
+
+# Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
+# Source filtering: Disabled, Flow control: Disabled
+_show_interfaces_lines.add(
+    'p6', r'^Source +filtering: +(?P<source_filtering>\S+), +Flow +control: +(?P<if_flow_control>\S+)(, +Auto-negotiation: +(?P<if_auto_negotiation>\S+), +Remote +fault: +(?P<if_remote_fault>\S+))?$',
+    anchor='Source filtering:')
+
+# Pad to minimum frame size: Disabled
+_show_interfaces_lines.add(
+    'p7', r'^Pad +to +minimum +frame +size: +'
+          r'(?P<pad_to_minimum_frame_size>\S+)$',
+    anchor='Pad to minimum frame size:')
+
+# Minimum links needed: 1, Minimum bandwidth needed: 1bps
+_show_interfaces_lines.add(
+    'p7_1', r'^Minimum +links +needed: +(?P<minimum_links_in_aggregate>\d+), +Minimum +bandwidth +needed: +(?P<minimum_bandwidth_in_aggregate>\S+)$',
+    anchor='Minimum links needed:')
+
+# Device flags   : Present Running
+_show_interfaces_lines.add(
+    'p8', r'^Device +flags +: +(?P<if_device_flags>[\S\s]+)$',
+    anchor='Device flags :')
+
+# Interface flags: SNMP-Traps Internal: 0x4000
+_show_interfaces_lines.add(
+    'p9', r'^Interface +flags:( +(?P<hardware_down>Hardware-Down))? +'
+          r'(?P<iff_snmp_traps>\S+)( +Internal: +(?P<internal_flags>\S+))?$',
+    anchor='Interface flags:')
+
+# Link flags     : None
+_show_interfaces_lines.add(
+    'p10', r'^Link +flags +: +(?P<if_media_flags>\S+)$',
+    anchor='Link flags :')
+
+# Link type      : Full-Duplex
+_show_interfaces_lines.add(
+    'p10_1', r'^Link +type +: +(?P<link_type>\S+)$',
+    anchor='Link type :')
+
+# CoS queues     : 8 supported, 8 maximum usable queues
+_show_interfaces_lines.add(
+    'p11', r'^CoS +queues +: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
+           r'supported, +(?P<physical_interface_cos_use_max_queues>\d+) maximum +'
+           r'usable +queues$',
+    anchor='CoS queues :')
+
+# Current address: 00:50:56:ff:56:b6, Hardware address: 00:50:56:ff:56:b6
+_show_interfaces_lines.add(
+    'p12', r'^Current +address: +(?P<current_physical_address>\S+), +'
+           r'Hardware +address: +(?P<hardware_physical_address>\S+)$',
+    anchor='Current address:')
+
+# Last flapped   : 2019-08-29 09:09:19 UTC (29w6d 18:56 ago)
+_show_interfaces_lines.add(
+    'p13', r'^Last +flapped +: +(?P<interface_flapped>[\S\s]+)$',
+    anchor='Last flapped :')
+
+# IPv6 transit statistics:
+_show_interfaces_lines.add(
+    'p36', r'^IPv6 +transit +statistics:$',
+    anchor='IPv6 transit statistics:')
+
+# Dropped traffic statistics due to STP State:
+_show_interfaces_lines.add(
+    'p37', r'^Dropped +traffic +statistics +due +to +'
+           r'STP +State:$',
+    anchor='Dropped traffic statistics due to')
+
+# Transit statistics:
+_show_interfaces_lines.add(
+    'p38', r'^Transit +statistics:$',
+    anchor='Transit statistics:')
+
+# Input rate     : 2952 bps (5 pps)
+_show_interfaces_lines.add(
+    'p14', r'^Input +rate +: +(?P<input_bps>\d+) +'
+           r'bps +\((?P<input_pps>\d+) +pps\)$',
+    anchor='Input rate :')
+
+# Input  bytes  :          19732539397                 3152 bps
+_show_interfaces_lines.add(
+    'p14_1', r'^Input +bytes *: +(?P<input_bytes>\S+)'
+             r'( +(?P<input_bps>\S+) +bps)?$',
+    anchor='Input bytes')
+
+# Output bytes  :          16367814635                 3160 bps
+_show_interfaces_lines.add(
+    'p14_2', r'^Output +bytes *: +(?P<output_bytes>\S+)'
+             r'( +(?P<output_bps>\S+) +bps)?$',
+    anchor='Output bytes')
+
+# Input  packets:            133726363                    5 pps
+_show_interfaces_lines.add(
+    'p14_3', r'^Input +packets *: +(?P<input_packets>\S+)'
+             r'( +(?P<input_pps>\S+) +pps)?$',
+    anchor='Input packets')
+
+# Output packets:            129306863                    4 pps
+_show_interfaces_lines.add(
+    'p14_4', r'^Output +packets *: +(?P<output_packets>\S+)'
+             r'( +(?P<output_pps>\S+) +pps)?$',
+    anchor='Output packets')
+
+# Output rate    : 3080 bps (3 pps)
+_show_interfaces_lines.add(
+    'p15', r'^Output +rate +: +(?P<output_bps>\d+) +'
+           r'bps +\((?P<output_pps>\d+) +pps\)$',
+    anchor='Output rate :')
+
+# Active alarms  : None
+_show_interfaces_lines.add(
+    'p16', r'^Active +alarms *: +(?P<active_alarms>\S+)$',
+    anchor='Active alarms')
+
+# Active defects : None
+_show_interfaces_lines.add(
+    'p17', r'^Active +defects *: +(?P<active_defects>\S+)$',
+    anchor='Active defects')
+
+# PCS statistics                      Seconds
+_show_interfaces_lines.add(
+    'p18', r'^PCS +statistics +Seconds$',
+    anchor='PCS statistics Seconds')
+
+# Bit errors                             0
+_show_interfaces_lines.add(
+    'p19', r'^Bit +errors +(?P<bit_error_seconds>\d+)$',
+    anchor='Bit errors')
+
+# Errored blocks                         0
+_show_interfaces_lines.add(
+    'p20', r'^Errored +blocks +(?P<errored_blocks_seconds>\d+)$',
+    anchor='Errored blocks')
+
+# Ethernet FEC statistics              Errors
+_show_interfaces_lines.add(
+    'p21', r'^Ethernet +FEC +statistics +Errors$',
+    anchor='Ethernet FEC statistics Errors')
+
+# FEC Corrected Errors                    0
+# FEC Uncorrected Errors                  0
+# FEC Corrected Errors Rate               0
+# FEC Uncorrected Errors Rate             0
+_show_interfaces_lines.add(
+    'p22', r'^FEC +Corrected +Errors +(?P<fec_ccw_count>\d+)$',
+    anchor='FEC Corrected Errors')
+
+_show_interfaces_lines.add(
+    'p22_1', r'^FEC +Uncorrected +Errors +(?P<fec_nccw_count>\d+)$',
+    anchor='FEC Uncorrected Errors')
+
+_show_interfaces_lines.add(
+    'p22_2', r'^FEC +Corrected +Errors +Rate +(?P<fec_ccw_error_rate>\d+)$',
+    anchor='FEC Corrected Errors Rate')
+
+_show_interfaces_lines.add(
+    'p22_3', r'^FEC +Uncorrected +Errors +Rate +(?P<fec_nccw_error_rate>\d+)$',
+    anchor='FEC Uncorrected Errors Rate')
+
+# Interface transmit statistics: Disabled
+_show_interfaces_lines.add(
+    'p23', r'^Interface +transmit +statistics: +'
+           r'(?P<interface_transmit_statistics>\S+)$',
+    anchor='Interface transmit statistics:')
+
+# Logical interface ge-0/0/0.0 (Index 333) (SNMP ifIndex 606)
+_show_interfaces_lines.add(
+    'p24', r'^Logical +interface +(?P<name>\S+) +'
+           r'\(Index +(?P<local_index>\d+)\) +\(SNMP +ifIndex +'
+           r'(?P<snmp_index>\d+)\)( +\(Generation +\S+\))?$',
+    anchor='Logical interface')
+
+# Flags: Up SNMP-Traps 0x4004000 Encapsulation: ENET2
+# Flags: Up SNMP-Traps 0x4000 VLAN-Tag [ 0x8100.1 ]  Encapsulation: ENET2
+# Flags: Hardware-Down Device-Down SNMP-Traps 0x4000 VLAN-Tag [ 0x8100.1 ]  Encapsulation: ENET2
+_show_interfaces_lines.add(
+    'p25', r'^Flags: +(?P<iff_up>(\S+|Hardware-Down Device-Down))'
+           r'( +SNMP-Traps)?( +(?P<internal_flags>\S+))?( +VLAN-Tag +\[[\S\s]+\])?'
+           r' +Encapsulation: +(?P<encapsulation>\S+)$',
+    anchor='Flags:')
+
+# Input packets : 133657033
+_show_interfaces_lines.add(
+    'p26', r'^Input +packets *: +(?P<input_packets>\S+)$',
+    anchor='Input packets')
+
+# Output packets: 129243982
+_show_interfaces_lines.add(
+    'p27', r'^Output +packets *: +(?P<output_packets>\S+)$',
+    anchor='Output packets')
+
+# Protocol inet, MTU: 1500, Maximum labels: 2
+# Protocol inet, MTU: 1500, Generation: 150, Route table: 0
+_show_interfaces_lines.add(
+    'p28', r'^Protocol +(?P<address_family_name>\S+), +'
+           r'MTU: +(?P<mtu>\S+)(, +Maximum labels: +'
+           r'(?P<maximum_labels>\S+))?(, +Generation: +'
+           r'(?P<generation>\S+))?(, +Route table: +'
+           r'(?P<route_table>\S+))?$',
+    anchor='Protocol')
+
+# Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1, Curr new hold cnt: 0, NH drop cnt: 0
+# Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1,
+_show_interfaces_lines.add(
+    'p30', r'^Max +nh +cache: +(?P<max_local_cache>\d+), +New +hold +nh +limit: +(?P<new_hold_limit>\d+), Curr +nh +cnt: +(?P<intf_curr_cnt>\d+),( +Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+))?$',
+    anchor='Max nh cache:')
+
+# Curr new hold cnt: 0, NH drop cnt: 0
+_show_interfaces_lines.add(
+    'p30_1', r'^Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+)$',
+    anchor='Curr new hold cnt:')
+
+# Flags: No-Redirects, Sendbcast-pkt-to-re
+# Flags: Is-Primary, User-MTU
+# Flags: Up SNMP-Traps 0x4000 Encapsulation: ENET2
+_show_interfaces_lines.add(
+    'p31', r'^Flags: +(?P<flags>[\S\s]+)',
+    anchor='Flags:')
+
+# Addresses, Flags: Is-Preferred Is-Primary
+_show_interfaces_lines.add(
+    'p32', r'^Addresses, +Flags: +(?P<flags>[\S\s]+)$',
+    anchor='Addresses, Flags:')
+
+# Destination: 10.189.5.92/30, Local: 10.189.5.93, Broadcast: 10.189.5.95
+_show_interfaces_lines.add(
+    'p33', r'^Destination: +(?P<ifa_destination>\S+), +Local: +(?P<ifa_local>\S+)(, +Broadcast: +(?P<ifa_broadcast>\S+))?(, +Generation: +(?P<generation>\S+))?$',
+    anchor='Destination:')
+
+# Broadcast: 10.0.0.255, Generation: 8336
+_show_interfaces_lines.add(
+    'p33_1', r'^Broadcast: +(?P<ifa_broadcast>\S+), +Generation: +(?P<generation>\S+)$',
+    anchor='Broadcast:')
+
+# Bandwidth: 0
+_show_interfaces_lines.add(
+    'p34', r'^Bandwidth: +(?P<logical_interface_bandwidth>\S+)$',
+    anchor='Bandwidth:')
+
+# Local: fe80::250:560f:fc8d:7c08
+_show_interfaces_lines.add(
+    'p35', r'^Local: +(?P<ifa_local>\S+)$',
+    anchor='Local:')
+
+# Input errors:
+_show_interfaces_lines.add('p41', r'^Input +errors:$', anchor='Input errors:')
+
+# Output errors:
+_show_interfaces_lines.add(
+    'p42', r'^Output +errors:$',
+    anchor='Output errors:')
+
+# Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0,
+# Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0, L2 mismatch timeouts: 0, FIFO errors: 0, Resource errors: 0
+# L2 mismatch timeouts: 0, FIFO errors: 0, Resource errors: 0
+# Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0,
+# L3 incompletes: 0, L2 channel errors: 0, L2 mismatch timeouts: 0,
+# FIFO errors: 0, Resource errors: 0
+# Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Giants: 0, Policed discards: 0, Resource errors: 0
+_show_interfaces_lines.add(
+    'p43', r'^(Errors: +(?P<input_errors>\d+),)?'
+           r'( *Drops: +(?P<input_drops>\d+),)?'
+           r'( *Framing +errors: +(?P<framing_errors>\d+),)?'
+           r'( *Runts: +(?P<input_runts>\d+),)?'
+           r'( *Giants: +(?P<input_giants>\d+),)?'
+           r'( *Policed +discards: +(?P<input_discards>\d+),)?'
+           r'( *L3 +incompletes: +(?P<input_l3_incompletes>\d+),)?'
+           r'( *L2 +channel +errors: +(?P<input_l2_channel_errors>\d+),)?'
+           r'( *L2 +mismatch +timeouts: +(?P<input_l2_mismatch_timeouts>\d+),?)?'
+           r'( *FIFO +errors: +(?P<input_fifo_errors>\d+),?)?'
+           r'( *Resource +errors: +(?P<input_resource_errors>\d+))?$')
+
+# Carrier transitions: 1, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0,
+# Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0,
+# Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
+_show_interfaces_lines.add(
+    'p44_1', r'^Carrier +transitions: +(?P<carrier_transitions>\d+),'
+             r' +Errors: +(?P<output_errors>\d+),'
+             r' +Drops: +(?P<output_drops>\d+),'
+             r'( +Collisions: +(?P<output_collisions>\d+),)?'
+             r'( +Aged+ packets: +(?P<aged_packets>\d+),)?'
+             r'(( +FIFO +errors: +(?P<output_fifo_errors>\d+),)?'
+             r' +HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
+             r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
+             r'( +Resource +errors: +(?P<output_resource_errors>\d+))?$',
+    anchor='Carrier transitions:')
+
+# MTU errors: 0, Resource errors: 0
+_show_interfaces_lines.add(
+    'p44_2', r'^MTU +errors: +(?P<mtu_errors>\d+), +Resource +'
+             r'errors: +(?P<output_resource_errors>\d+)$',
+    anchor='MTU errors:')
+
+# FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
+_show_interfaces_lines.add(
+    'p44_3', r'^FIFO +errors: +(?P<output_fifo_errors>\d+), +'
+             r'(HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
+             r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
+             r'( +Resource +errors: +(?P<output_resource_errors>\d+))?',
+    anchor='FIFO errors:')
+
+# Total octets                   21604601324      16828244544
+_show_interfaces_lines.add(
+    'p45', r'^Total +octets +(?P<input_bytes>\d+) +'
+           r'(?P<output_bytes>\d+)$',
+    anchor='Total octets')
+
+# MAC statistics:                      Receive         Transmit
+_show_interfaces_lines.add(
+    'p45_1', r'^MAC +statistics: +Receive +Transmit$',
+    anchor='MAC statistics: Receive Transmit')
+
+# Total packets                    133726919        129183374
+_show_interfaces_lines.add(
+    'p46', r'^Total +packets +(?P<input_packets>\d+) +'
+           r'(?P<output_packets>\d+)',
+    anchor='Total packets')
+
+# Unicast packets                  133726908        129183361
+_show_interfaces_lines.add(
+    'p47', r'^Unicast +packets +(?P<input_unicasts>\d+) +'
+           r'(?P<output_unicasts>\d+)$',
+    anchor='Unicast packets')
+
+# Broadcast packets                        0                0
+_show_interfaces_lines.add(
+    'p48', r'^Broadcast +packets +(?P<input_broadcasts>\d+) +'
+           r'(?P<output_broadcasts>\d+)$',
+    anchor='Broadcast packets')
+
+# Multicast packets                        0                0
+_show_interfaces_lines.add(
+    'p49', r'^Multicast +packets +(?P<input_multicasts>\d+) +'
+           r'(?P<output_multicasts>\d+)$',
+    anchor='Multicast packets')
+
+# CRC/Align errors                         0                0
+_show_interfaces_lines.add(
+    'p50', r'^CRC\/Align +errors +(?P<input_crc_errors>\d+) +'
+           r'(?P<output_crc_errors>\d+)$',
+    anchor='CRC/Align errors')
+
+# FIFO errors                              0                0
+_show_interfaces_lines.add(
+    'p51', r'^FIFO +errors +(?P<input_fifo_errors>\d+) +'
+           r'(?P<output_fifo_errors>\d+)$',
+    anchor='FIFO errors')
+
+# MAC control frames                       0                0
+_show_interfaces_lines.add(
+    'p52', r'^MAC +control +frames +(?P<input_mac_control_frames>\d+) +'
+           r'(?P<output_mac_control_frames>\d+)$',
+    anchor='MAC control frames')
+
+# MAC pause frames                         0                0
+_show_interfaces_lines.add(
+    'p53', r'^MAC +pause +frames +(?P<input_mac_pause_frames>\d+) +'
+           r'(?P<output_mac_pause_frames>\d+)$',
+    anchor='MAC pause frames')
+
+# Oversized frames                         0
+_show_interfaces_lines.add(
+    'p54', r'^Oversized +frames +(?P<input_oversized_frames>\d+)$',
+    anchor='Oversized frames')
+
+# Jabber frames                            0
+_show_interfaces_lines.add(
+    'p56', r'^Jabber +frames +(?P<input_jabber_frames>\d+)$',
+    anchor='Jabber frames')
+
+# Fragment frames                          0
+_show_interfaces_lines.add(
+    'p57', r'^Fragment +frames +(?P<input_fragment_frames>\d+)$',
+    anchor='Fragment frames')
+
+# VLAN tagged frames                       0
+_show_interfaces_lines.add(
+    'p58', r'^VLAN +tagged +frames +(?P<input_vlan_tagged_frames>\d+)$',
+    anchor='VLAN tagged frames')
+
+# Code violations                          0
+_show_interfaces_lines.add(
+    'p59', r'^Code +violations +(?P<input_code_violations>\d+)$',
+    anchor='Code violations')
+
+# Total errors                             0                0
+_show_interfaces_lines.add(
+    'p60', r'^Total +errors +(?P<input_total_errors>\d+) +(?P<output_total_errors>\d+)$',
+    anchor='Total errors')
+
+# Label-switched interface (LSI) traffic statistics:
+_show_interfaces_lines.add(
+    'p61', r'^Label-switched +interface +\(LSI\) +traffic +statistics:$',
+    anchor='Label-switched interface (LSI) traffic statistics:')
+
+# Ingress queues: 8 supported, 4 in use
+# Egress queues: 8 supported, 4 in use
+_show_interfaces_lines.add(
+    'p62', r'^((?P<intf_cos_queue_type>(Ingress|Egress) +queues)): +(?P<intf_cos_num_queues_supported>\d+) +supported, +(?P<intf_cos_num_queues_in_use>\d+) +in +use$',
+    anchor=('Ingress queues:', 'Egress queues:'))
+
+# 0                                0                    0                    0
+_show_interfaces_lines.add(
+    'p63', r'^(?P<queue_number>\d+) +(?P<queue_counters_queued_packets>\d+) +'
+           r'(?P<queue_counters_trans_packets>\d+) +(?P<drop_packets>\d+)$')
+
+# Hold-times     : Up 0 ms, Down 0 ms
+_show_interfaces_lines.add(
+    'p64', r'^Hold-times +: +Up +(?P<up_hold_time>\d+) +ms, +Down +(?P<down_hold_time>\d+) +ms$',
+    anchor='Hold-times : Up')
+
+# Statistics last cleared: 2020-10-14 13:18:51 EST (00:12:30 ago)
+_show_interfaces_lines.add(
+    'p65', r'^Statistics +last +cleared: +(?P<statistics_cleared>[\S\s]+)$',
+    anchor='Statistics last cleared:')
+
+# 0                   best-effort
+# 1                   expedited-forwarding
+# 2                   assured-forwarding
+# 3                   network-control
+_show_interfaces_lines.add(
+    'p66', r'^(?P<queue_number>\d+) +(?P<forwarding_class_name>best-effort|expedited-forwarding|assured-forwarding|network-control)$',
+    anchor=('0 best-effort', '0 expedited-forwarding', '0 assured-forwarding', '0 network-control'))
+
+# Filter statistics:
+_show_interfaces_lines.add(
+    'p67', r'^Filter +statistics:$',
+    anchor='Filter statistics:')
+
+# Input packet count                   38089
+_show_interfaces_lines.add(
+    'p68', r'^Input +packet +count +(?P<input_packets>\d+)$',
+    anchor='Input packet count')
+
+# Input packet rejects                    24
+_show_interfaces_lines.add(
+    'p69', r'^Input +packet +rejects +(?P<input_reject_count>\d+)$',
+    anchor='Input packet rejects')
+
+# Input DA rejects                         0
+_show_interfaces_lines.add(
+    'p70', r'^Input +DA +rejects +(?P<input_reject_da_count>\d+)$',
+    anchor='Input DA rejects')
+
+# Input SA rejects                         0
+_show_interfaces_lines.add(
+    'p71', r'^Input +SA +rejects +(?P<input_reject_sa_count>\d+)$',
+    anchor='Input SA rejects')
+
+# Output packet count                                    8798
+_show_interfaces_lines.add(
+    'p72', r'^Output +packet +count +(?P<output_packets>\d+)$',
+    anchor='Output packet count')
+
+# Output packet pad count                                   0
+_show_interfaces_lines.add(
+    'p73', r'^Output +packet +pad +count +(?P<output_packet_pad_count>\d+)$',
+    anchor='Output packet pad count')
+
+# Output packet error count                                 0
+_show_interfaces_lines.add(
+    'p74', r'^Output +packet +error +count +(?P<output_packet_error_count>\d+)$',
+    anchor='Output packet error count')
+
+# CAM destination filters: 0, CAM source filters: 0
+_show_interfaces_lines.add(
+    'p75', r'^CAM +destination +filters: (?P<cam_destination_filter_count>\d+), +CAM +source +filters: (?P<cam_source_filter_count>\d+)$',
+    anchor='CAM destination filters:')
+
+# Destination slot: 0 (0x00)
+_show_interfaces_lines.add(
+    'p76', r'^Destination +slot: +(?P<destination_slot>\d+) +(?P<destination_mask>\S+)$',
+    anchor='Destination slot:')
+
+# 0 best-effort            95     9500000000    95              0      low    none
+_show_interfaces_lines.add(
+    'p77', r'^(?P<cos_queue_number>\d+) +(?P<cos_queue_forwarding_class>\S+) +(?P<cos_queue_bandwidth>\d+) +(?P<cos_queue_bandwidth_bps>\d+) +(?P<cos_queue_buffer>\d+) +(?P<cos_queue_buffer_bytes>\d+) +(?P<cos_queue_priority>\w+) +(?P<cos_queue_limit>\w+)$')
+
+# Direction : Output
+_show_interfaces_lines.add(
+    'p78', r'^Direction : +(?P<cos_direction>\S+)$',
+    anchor='Direction :')
+
+# Generation: 9549, Route table: 0
+_show_interfaces_lines.add(
+    'p79', r'^Generation: +(?P<generation>\d+)(, +Route +table: +(?P<route_table>\d+))?$',
+    anchor='Generation:')
+
+# Policer: Input: GE_1M-xe-0/1/7.0-log_int-i, Output: GE_1M-xe-0/1/7.0-log_int-o
+_show_interfaces_lines.add(
+    'p80', r'^Policer: +Input: +(?P<policer_input>\S+)(, +Output: +(?P<policer_output>\S+))?$',
+    anchor='Policer: Input:')
+
+# Bundle:
+# Link:
+_show_interfaces_lines.add(
+    'p81', r'^(?P<lag_int_type>(Bundle)|(Link)):$',
+    anchor=('Bundle:', 'Link:'))
+
+# xe-0/1/10.0
+# xe-0/1/10
+_show_interfaces_lines.add(
+    'p81_1', r'^(?P<name>[a-z]{2}-\d+/\d+/\d+(\.\d+)?)$')
+
+# Input :           225          0         14514         1952
+# Output:            16          0          1188            0
+_show_interfaces_lines.add(
+    'p82', r'^(?P<in_out>(Input\s*)|(Output)):\s+(?P<packets>\d+)\s+(?P<pps>\d+)\s+(?P<bytes>\d+)\s+(?P<bps>\d+)$',
+    anchor=('Input', 'Output'))
+
+# Adaptive Adjusts:          0
+# Adaptive Scans  :          0
+# Adaptive Updates:          0
+_show_interfaces_lines.add(
+    'p83', r'^(?P<adaptive>Adaptive\s+(Adjusts|Scans|Updates))\s*:\s+(?P<adaptive_value>\d+)$',
+    anchor='Adaptive')
+
+# Aggregate member links: 2
+_show_interfaces_lines.add(
+    'p84', r'^Aggregate\s+member\s+links:\s+(?P<aggregate_member_count>\d+)$',
+    anchor='Aggregate member links:')
+
+# LACP info:        Role     System             System       Port     Port    Port
+# LACP Statistics:       LACP Rx     LACP Tx   Unknown Rx   Illegal Rx
+# Marker Statistics:   Marker Rx     Resp Tx   Unknown Rx   Illegal Rx
+_show_interfaces_lines.add(
+    'p85', r'^(?P<lacp_flag>(LACP info)|(LACP Statistics)|(Marker Statistics)):\s+.+$',
+    anchor=('LACP info:', 'LACP Statistics:', 'Marker Statistics:'))
+
+# ge-0/0/6.0     Actor        127  2c:6b:f5:ff:cf:97        127        2       1
+# ge-0/0/6.0   Partner        127  2c:6b:f5:ff:08:d8        127        2       1
+_show_interfaces_lines.add(
+    'p86', r'^(?P<name>\S+)\s+(?P<lacp_role>\S+)\s+(?P<lacp_sys_priority>\d+)\s+(?P<lacp_system_id>\S+)\s+(?P<lacp_port_priority>\d+)\s+(?P<lacp_port_number>\d+)\s+(?P<lacp_port_key>\d+)$')
+
+# For LACP Statistics, and Marker Statistics
+# ge-0/0/6.0                 0           0            0            0
+_show_interfaces_lines.add(
+    'p87', r'(?P<name>\S+)\s+(?P<lacp_rx_packets>\d+)\s+(?P<lacp_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)$')
+
+# Primary         Active
+# Backup          Down
+# Standby         Down
+_show_interfaces_lines.add(
+    'p89', r'^(?P<list_type>(Primary)|(Backup)|(Standby))\s+(?P<list_status>(Active)|(Down))$',
+    anchor=('Primary', 'Backup', 'Standby'))
+
+# ge-0/0/7        Up
+_show_interfaces_lines.add(
+    'p90', r'^(?P<if_child_name>\S+)\s+(?P<if_status>(Up)|(Down))$')
+
+
+def _counters(*names):
+    '''{counter: group} of the traffic-statistics of the physical interfaces,
+    named as their group'''
+    return {name.replace('_', '-'): name for name in names}
+
+
+# Traffic statistics of the physical interfaces of show interfaces, as
+# stored by ShowInterfaces.cli()
+_show_interfaces_counters = CounterLines(
+    lines=_show_interfaces_lines, interface='p1', name='name',
+    counters={
+        ('p14', 'physical'): _counters('input_bps', 'input_pps'),
+        ('p14_1', 'physical'): _counters('input_bytes', 'input_bps'),
+        ('p14_2', 'physical'): _counters('output_bytes', 'output_bps'),
+        ('p14_3', 'physical'): _counters('input_packets', 'input_pps'),
+        ('p14_4', 'physical'): _counters('output_packets', 'output_pps'),
+        ('p15', 'physical'): _counters('output_bps', 'output_pps'),
+    },
+    sections={'p24': 'logical', 'p36': 'ipv6_transit',
+              'p37': 'dropped_stp_state', 'p38': 'transit_statistics',
+              'p61': 'lsi_traffic_statistics'},
+    start='physical')
+
+
+class ShowInterfaces(ShowInterfacesSchema, CounterParser):
     cli_command = ['show interfaces', 'show interfaces {interface}']
+    counter_lines = _show_interfaces_counters
 
     def cli(self, interface=None, output=None):
 
@@ -1174,439 +1821,6 @@ class ShowInterfaces(ShowInterfacesSchema):
         
         statistics_type = None
 
-        # Physical interface: ge-0/0/0, Enabled, Physical link is Up
-        p1 = re.compile(r'^Physical +interface: +(?P<name>\S+), +'
-            r'(?P<admin_status>\S+), +Physical +link +is +(?P<oper_status>\S+)$')
-
-        # Interface index: 148, SNMP ifIndex: 526
-        p2 = re.compile(r'^Interface +index: +(?P<local_index>\d+), +'
-            r'SNMP +ifIndex: +(?P<snmp_index>\d+)'
-            r'(, +Generation: +\S+)$')
-
-        # Description: none/100G/in/hktGCS002_ge-0/0/0
-        # Description: TEST-DESC:1|TEST#1234 DEV
-        p3 = re.compile(r'^Description: +(?P<description>.+)$')
-
-        # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None,
-        # Link-level type: Ethernet, MTU: 1514, MRU: 1522, Speed: 100Gbps, BPDU Error: None, Loopback: Disabled,
-        # Link-level type: Ethernet, MTU: 1514, Link-mode: Full-duplex, Speed: 1000mbps,
-        # Link-level type: Ethernet, MTU: 1514, Speed: 1Gbps, BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled, Source filtering: Disabled, Flow control: Disabled
-        p4 = re.compile(r'^(Type: +\S+, )?Link-level +type: +(?P<link_level_type>\S+), '
-                        r'+MTU: +(?P<mtu>\S+)(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
-                        r'(, +Link-mode: +(?P<link_mode>\S+))?(, +Speed: +(?P<speed>\S+))?'
-                        r'(, +BPDU +Error: +(?P<bpdu_error>\w+))?'
-                        r'(, +MAC-REWRITE Error: +(?P<mac_rewrite_error>\S+))?'
-                        r'(, +Loopback: +(?P<loopback>\S+))?'
-                        r'(, Source +filtering: +(?P<source_filtering>\S+))?'
-                        r'(, +Flow +control: +(?P<if_flow_control>\S+))?(,)?$')
-        
-        # Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None,
-        p4_1 = re.compile(r'^(Speed: +(?P<speed>[^\s,]+))(, +)?'
-                          r'(BPDU +Error: +(?P<bpdu_error>[^\s,]+))?(, +)?'
-                          r'(Loop +Detect +PDU +Error: +(?P<ld_pdu_error>[^\s,]+))?(, +)?')
-
-        # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None,
-        p4_2 = re.compile(r'^Link-level +type: +(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
-                          r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
-                          r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +(?P<bpdu_error>\S+),)?'
-                          r'( +Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+),)?'
-                          r'( +Ethernet-Switching +Error: +(?P<eth_switch_error>\S+),)?'
-                          r'( +MAC-REWRITE +Error: +\S+)?$')
-
-        # Link-level type: Ethernet, MTU: 1514, MRU: 1522, Speed: 100Gbps, BPDU Error: None, Loopback: Disabled,
-
-        # Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-        p5 = re.compile(r'^Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+), +'
-            r'Ethernet-Switching +Error: +(?P<eth_switch_error>\S+), +MAC-REWRITE +'
-            r'Error: +\S+, +Loopback: +(?P<loopback>\S+),$')
-
-        # Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-        # BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled
-        p5_1 = re.compile(r'^((Ethernet-Switching +Error: +(?P<eth_switch_error>[^\s,]+))|(BPDU +Error: +(?P<bpdu_error>[^\s,]+)))(, +)?(MAC-REWRITE +Error: +[^\s,]+)?(, +)?(Loopback: +(?P<loopback>[^\s,]+))(, +)?')
-
-        # Loopback: Disabled, Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-        p5_2 = re.compile(r'^(Loopback: +(?P<loopback>\S+),)?'
-                          r'( +Source +filtering: +(?P<source_filtering>\S+),)?'
-                          r'( +Flow +control: +(?P<if_flow_control>\S+),)?'
-                          r'( +Auto-negotiation: +(?P<if_auto_negotiation>\S+),)?'
-                          r'( +Remote +fault: +(?P<if_remote_fault>\S+))$')
-
-        # Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-        # Source filtering: Disabled, Flow control: Disabled
-        p6 = re.compile(r'^Source +filtering: +(?P<source_filtering>\S+), +Flow +control: +(?P<if_flow_control>\S+)(, +Auto-negotiation: +(?P<if_auto_negotiation>\S+), +Remote +fault: +(?P<if_remote_fault>\S+))?$')
-
-        # Pad to minimum frame size: Disabled
-        p7 = re.compile(r'^Pad +to +minimum +frame +size: +'
-            r'(?P<pad_to_minimum_frame_size>\S+)$')
-
-        # Minimum links needed: 1, Minimum bandwidth needed: 1bps
-        p7_1 = re.compile(r'^Minimum +links +needed: +(?P<minimum_links_in_aggregate>\d+), +Minimum +bandwidth +needed: +(?P<minimum_bandwidth_in_aggregate>\S+)$')
-
-        # Device flags   : Present Running
-        p8 = re.compile(r'^Device +flags +: +(?P<if_device_flags>[\S\s]+)$')
-
-        # Interface flags: SNMP-Traps Internal: 0x4000
-        p9 = re.compile(r'^Interface +flags:( +(?P<hardware_down>Hardware-Down))? +'
-                r'(?P<iff_snmp_traps>\S+)( +Internal: +(?P<internal_flags>\S+))?$')
-
-        # Link flags     : None
-        p10 = re.compile(r'^Link +flags +: +(?P<if_media_flags>\S+)$')
-
-        # Link type      : Full-Duplex
-        p10_1 = re.compile(r'^Link +type +: +(?P<link_type>\S+)$')
-
-        # CoS queues     : 8 supported, 8 maximum usable queues
-        p11 = re.compile(r'^CoS +queues +: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
-            r'supported, +(?P<physical_interface_cos_use_max_queues>\d+) maximum +'
-            r'usable +queues$')
-
-        # Current address: 00:50:56:ff:56:b6, Hardware address: 00:50:56:ff:56:b6
-        p12 = re.compile(r'^Current +address: +(?P<current_physical_address>\S+), +'
-            r'Hardware +address: +(?P<hardware_physical_address>\S+)$')
-
-        # Last flapped   : 2019-08-29 09:09:19 UTC (29w6d 18:56 ago)
-        p13 = re.compile(r'^Last +flapped +: +(?P<interface_flapped>[\S\s]+)$')
-
-        # Input rate     : 2952 bps (5 pps)
-        p14 = re.compile(r'^Input +rate +: +(?P<input_bps>\d+) +'
-            r'bps +\((?P<input_pps>\d+) +pps\)$')
-        
-        # Input  bytes  :          19732539397                 3152 bps
-        p14_1 = re.compile(r'^Input +bytes *: +(?P<input_bytes>\S+)'
-            r'( +(?P<input_bps>\S+) +bps)?$')
-        # Output bytes  :          16367814635                 3160 bps
-        p14_2 = re.compile(r'^Output +bytes *: +(?P<output_bytes>\S+)'
-            r'( +(?P<output_bps>\S+) +bps)?$')
-        # Input  packets:            133726363                    5 pps
-        p14_3 = re.compile(r'^Input +packets *: +(?P<input_packets>\S+)'
-            r'( +(?P<input_pps>\S+) +pps)?$')
-        # Output packets:            129306863                    4 pps
-        p14_4 = re.compile(r'^Output +packets *: +(?P<output_packets>\S+)'
-            r'( +(?P<output_pps>\S+) +pps)?$')
-        
-        # Output rate    : 3080 bps (3 pps)
-        p15 = re.compile(r'^Output +rate +: +(?P<output_bps>\d+) +'
-            r'bps +\((?P<output_pps>\d+) +pps\)$')
-        
-        # Active alarms  : None
-        p16 = re.compile(r'^Active +alarms *: +(?P<active_alarms>\S+)$')
-
-        # Active defects : None
-        p17 = re.compile(r'^Active +defects *: +(?P<active_defects>\S+)$')
-        
-        # PCS statistics                      Seconds
-        p18 = re.compile(r'^PCS +statistics +Seconds$')
-
-        # Bit errors                             0
-        p19 = re.compile(r'^Bit +errors +(?P<bit_error_seconds>\d+)$')
-
-        # Errored blocks                         0
-        p20 = re.compile(r'^Errored +blocks +(?P<errored_blocks_seconds>\d+)$')
-        
-        # Ethernet FEC statistics              Errors
-        p21 = re.compile(r'^Ethernet +FEC +statistics +Errors$')
-
-        # FEC Corrected Errors                    0
-        # FEC Uncorrected Errors                  0
-        # FEC Corrected Errors Rate               0
-        # FEC Uncorrected Errors Rate             0
-        p22 = re.compile(r'^FEC +Corrected +Errors +(?P<fec_ccw_count>\d+)$')
-        p22_1 = re.compile(r'^FEC +Uncorrected +Errors +(?P<fec_nccw_count>\d+)$')
-        p22_2 = re.compile(r'^FEC +Corrected +Errors +Rate +(?P<fec_ccw_error_rate>\d+)$')
-        p22_3 = re.compile(r'^FEC +Uncorrected +Errors +Rate +(?P<fec_nccw_error_rate>\d+)$')
-
-        # Interface transmit statistics: Disabled
-        p23 = re.compile(r'^Interface +transmit +statistics: +'
-            r'(?P<interface_transmit_statistics>\S+)$')
-
-        # Logical interface ge-0/0/0.0 (Index 333) (SNMP ifIndex 606)
-        p24 = re.compile(r'^Logical +interface +(?P<name>\S+) +'
-            r'\(Index +(?P<local_index>\d+)\) +\(SNMP +ifIndex +'
-            r'(?P<snmp_index>\d+)\)( +\(Generation +\S+\))?$')
-
-        # Flags: Up SNMP-Traps 0x4004000 Encapsulation: ENET2
-        # Flags: Up SNMP-Traps 0x4000 VLAN-Tag [ 0x8100.1 ]  Encapsulation: ENET2
-        # Flags: Hardware-Down Device-Down SNMP-Traps 0x4000 VLAN-Tag [ 0x8100.1 ]  Encapsulation: ENET2
-        p25 = re.compile(r'^Flags: +(?P<iff_up>(\S+|Hardware-Down Device-Down))'
-                         r'( +SNMP-Traps)?( +(?P<internal_flags>\S+))?( +VLAN-Tag +\[[\S\s]+\])?'
-                         r' +Encapsulation: +(?P<encapsulation>\S+)$')
-
-        # Input packets : 133657033
-        p26 = re.compile(r'^Input +packets *: +(?P<input_packets>\S+)$')
-
-        # Output packets: 129243982
-        p27 = re.compile(r'^Output +packets *: +(?P<output_packets>\S+)$')
-
-        # Protocol inet, MTU: 1500, Maximum labels: 2
-        # Protocol inet, MTU: 1500, Generation: 150, Route table: 0
-        p28 = re.compile(r'^Protocol +(?P<address_family_name>\S+), +'
-            r'MTU: +(?P<mtu>\S+)(, +Maximum labels: +'
-            r'(?P<maximum_labels>\S+))?(, +Generation: +'
-            r'(?P<generation>\S+))?(, +Route table: +'
-            r'(?P<route_table>\S+))?$')
-
-        # Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1, Curr new hold cnt: 0, NH drop cnt: 0
-        # Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1,
-        p30 = re.compile(r'^Max +nh +cache: +(?P<max_local_cache>\d+), +New +hold +nh +limit: +(?P<new_hold_limit>\d+), Curr +nh +cnt: +(?P<intf_curr_cnt>\d+),( +Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+))?$')
-
-        # Curr new hold cnt: 0, NH drop cnt: 0
-        p30_1 = re.compile(r'^Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+)$')
-
-        # Flags: No-Redirects, Sendbcast-pkt-to-re
-        # Flags: Is-Primary, User-MTU
-        # Flags: Up SNMP-Traps 0x4000 Encapsulation: ENET2
-        p31 = re.compile(r'^Flags: +(?P<flags>[\S\s]+)')
-
-        # Addresses, Flags: Is-Preferred Is-Primary
-        p32 = re.compile(r'^Addresses, +Flags: +(?P<flags>[\S\s]+)$')
-
-        # Destination: 10.189.5.92/30, Local: 10.189.5.93, Broadcast: 10.189.5.95
-        p33 = re.compile(r'^Destination: +(?P<ifa_destination>\S+), +Local: +(?P<ifa_local>\S+)(, +Broadcast: +(?P<ifa_broadcast>\S+))?(, +Generation: +(?P<generation>\S+))?$')
-
-        # Broadcast: 10.0.0.255, Generation: 8336
-        p33_1 = re.compile(r'^Broadcast: +(?P<ifa_broadcast>\S+), +Generation: +(?P<generation>\S+)$')
-
-        # Bandwidth: 0
-        p34 = re.compile(r'^Bandwidth: +(?P<logical_interface_bandwidth>\S+)$')
-
-        # Local: fe80::250:560f:fc8d:7c08
-        p35 = re.compile(r'^Local: +(?P<ifa_local>\S+)$')
-
-        # IPv6 transit statistics:
-        p36 = re.compile(r'^IPv6 +transit +statistics:$')
-
-        # Dropped traffic statistics due to STP State:
-        p37 = re.compile(r'^Dropped +traffic +statistics +due +to +'
-            r'STP +State:$')
-
-        # Transit statistics:
-        p38 = re.compile(r'^Transit +statistics:$')
-
-        # Hold-times     : Up 2000 ms, Down 0 ms
-        p39 = re.compile(r'^Hold-times +: +Up +\d+ +ms, +Down +\d+ +ms$')
-
-        # Damping        : half-life: 0 sec, max-suppress: 0 sec, reuse: 0, suppress: 0, state: unsuppressed
-        p40 = re.compile(r'^Damping +: +half-life: +\d+ +sec, +max-suppress: +'
-            r'\d+ +sec, +reuse: +\d+, +suppress: +\d+, +state: +\S+$')
-
-        # Input errors:
-        p41 = re.compile(r'^Input +errors:$')
-
-        # Output errors:
-        p42 = re.compile(r'^Output +errors:$')
-
-        # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0,
-
-        # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0, L2 mismatch timeouts: 0, FIFO errors: 0, Resource errors: 0
-
-        # L2 mismatch timeouts: 0, FIFO errors: 0, Resource errors: 0
-
-        # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0,
-        # L3 incompletes: 0, L2 channel errors: 0, L2 mismatch timeouts: 0,
-        # FIFO errors: 0, Resource errors: 0
-        # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Giants: 0, Policed discards: 0, Resource errors: 0
-        p43 = re.compile(r'^(Errors: +(?P<input_errors>\d+),)?'
-                           r'( *Drops: +(?P<input_drops>\d+),)?'
-                           r'( *Framing +errors: +(?P<framing_errors>\d+),)?'
-                           r'( *Runts: +(?P<input_runts>\d+),)?'
-                           r'( *Giants: +(?P<input_giants>\d+),)?'
-                           r'( *Policed +discards: +(?P<input_discards>\d+),)?'
-                           r'( *L3 +incompletes: +(?P<input_l3_incompletes>\d+),)?'
-                           r'( *L2 +channel +errors: +(?P<input_l2_channel_errors>\d+),)?'
-                           r'( *L2 +mismatch +timeouts: +(?P<input_l2_mismatch_timeouts>\d+),?)?'
-                           r'( *FIFO +errors: +(?P<input_fifo_errors>\d+),?)?'
-                           r'( *Resource +errors: +(?P<input_resource_errors>\d+))?$')
-
-        # Carrier transitions: 1, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0,
-        # Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0,
-        # Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
-        p44_1 = re.compile(r'^Carrier +transitions: +(?P<carrier_transitions>\d+),'
-                           r' +Errors: +(?P<output_errors>\d+),'
-                           r' +Drops: +(?P<output_drops>\d+),'
-                           r'( +Collisions: +(?P<output_collisions>\d+),)?'
-                           r'( +Aged+ packets: +(?P<aged_packets>\d+),)?'
-                           r'(( +FIFO +errors: +(?P<output_fifo_errors>\d+),)?'
-                           r' +HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
-                           r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
-                           r'( +Resource +errors: +(?P<output_resource_errors>\d+))?$')
-
-        # MTU errors: 0, Resource errors: 0
-        p44_2 = re.compile(r'^MTU +errors: +(?P<mtu_errors>\d+), +Resource +'
-            r'errors: +(?P<output_resource_errors>\d+)$')
-
-        # FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
-        p44_3 = re.compile(r'^FIFO +errors: +(?P<output_fifo_errors>\d+), +'
-                           r'(HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
-                           r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
-                           r'( +Resource +errors: +(?P<output_resource_errors>\d+))?')
-
-        # Total octets                   21604601324      16828244544
-        p45 = re.compile(r'^Total +octets +(?P<input_bytes>\d+) +'
-            r'(?P<output_bytes>\d+)$')
-
-        # MAC statistics:                      Receive         Transmit
-        p45_1 = re.compile(r'^MAC +statistics: +Receive +Transmit$')
-
-        # Total packets                    133726919        129183374
-        p46 = re.compile(r'^Total +packets +(?P<input_packets>\d+) +'
-            r'(?P<output_packets>\d+)')
-
-        # Unicast packets                  133726908        129183361
-        p47 = re.compile(r'^Unicast +packets +(?P<input_unicasts>\d+) +'
-            r'(?P<output_unicasts>\d+)$')
-
-        # Broadcast packets                        0                0
-        p48 = re.compile(r'^Broadcast +packets +(?P<input_broadcasts>\d+) +'
-            r'(?P<output_broadcasts>\d+)$')
-
-        # Multicast packets                        0                0
-        p49 = re.compile(r'^Multicast +packets +(?P<input_multicasts>\d+) +'
-            r'(?P<output_multicasts>\d+)$')
-
-        # CRC/Align errors                         0                0
-        p50 = re.compile(r'^CRC\/Align +errors +(?P<input_crc_errors>\d+) +'
-            r'(?P<output_crc_errors>\d+)$')
-
-        # FIFO errors                              0                0
-        p51 = re.compile(r'^FIFO +errors +(?P<input_fifo_errors>\d+) +'
-            r'(?P<output_fifo_errors>\d+)$')
-
-        # MAC control frames                       0                0
-        p52 = re.compile(r'^MAC +control +frames +(?P<input_mac_control_frames>\d+) +'
-            r'(?P<output_mac_control_frames>\d+)$')
-
-        # MAC pause frames                         0                0
-        p53 = re.compile(r'^MAC +pause +frames +(?P<input_mac_pause_frames>\d+) +'
-            r'(?P<output_mac_pause_frames>\d+)$')
-
-        # Oversized frames                         0
-        p54 = re.compile(r'^Oversized +frames +(?P<input_oversized_frames>\d+)$')
-
-        # Jabber frames                            0
-        p56 = re.compile(r'^Jabber +frames +(?P<input_jabber_frames>\d+)$')
-
-        # Fragment frames                          0
-        p57 = re.compile(r'^Fragment +frames +(?P<input_fragment_frames>\d+)$')
-
-        # VLAN tagged frames                       0
-        p58 = re.compile(r'^VLAN +tagged +frames +(?P<input_vlan_tagged_frames>\d+)$')
-
-        # Code violations                          0
-        p59 = re.compile(r'^Code +violations +(?P<input_code_violations>\d+)$')
-
-        # Total errors                             0                0
-        p60 = re.compile(r'^Total +errors +(?P<input_total_errors>\d+) +(?P<output_total_errors>\d+)$')
-
-        # Label-switched interface (LSI) traffic statistics:
-        p61 = re.compile(r'^Label-switched +interface +\(LSI\) +traffic +statistics:$')
-
-        # Ingress queues: 8 supported, 4 in use
-        # Egress queues: 8 supported, 4 in use
-        p62 = re.compile(r'^((?P<intf_cos_queue_type>(Ingress|Egress) +queues)): +(?P<intf_cos_num_queues_supported>\d+) +supported, +(?P<intf_cos_num_queues_in_use>\d+) +in +use$')
-
-        # 0                                0                    0                    0
-        p63 = re.compile(r'^(?P<queue_number>\d+) +(?P<queue_counters_queued_packets>\d+) +'
-            r'(?P<queue_counters_trans_packets>\d+) +(?P<drop_packets>\d+)$')
-
-        # Hold-times     : Up 0 ms, Down 0 ms
-        p64 = re.compile(r'^Hold-times +: +Up +(?P<up_hold_time>\d+) +ms, +Down +(?P<down_hold_time>\d+) +ms$')
-
-        # Statistics last cleared: 2020-10-14 13:18:51 EST (00:12:30 ago)
-        p65 = re.compile(r'^Statistics +last +cleared: +(?P<statistics_cleared>[\S\s]+)$')
-
-        # 0                   best-effort
-        # 1                   expedited-forwarding
-        # 2                   assured-forwarding
-        # 3                   network-control
-        p66 = re.compile(r'^(?P<queue_number>\d+) +(?P<forwarding_class_name>best-effort|expedited-forwarding|assured-forwarding|network-control)$')
-
-        # Filter statistics:
-        p67 = re.compile(r'^Filter +statistics:$')
-
-        # Input packet count                   38089
-        p68 = re.compile(r'^Input +packet +count +(?P<input_packets>\d+)$')
-
-        # Input packet rejects                    24
-        p69 = re.compile(r'^Input +packet +rejects +(?P<input_reject_count>\d+)$')
-
-        # Input DA rejects                         0
-        p70 = re.compile(r'^Input +DA +rejects +(?P<input_reject_da_count>\d+)$')
-
-        # Input SA rejects                         0
-        p71 = re.compile(r'^Input +SA +rejects +(?P<input_reject_sa_count>\d+)$')
-
-        # Output packet count                                    8798
-        p72 = re.compile(r'^Output +packet +count +(?P<output_packets>\d+)$')
-
-        # Output packet pad count                                   0
-        p73 = re.compile(r'^Output +packet +pad +count +(?P<output_packet_pad_count>\d+)$')
-
-        # Output packet error count                                 0
-        p74 = re.compile(r'^Output +packet +error +count +(?P<output_packet_error_count>\d+)$')
-
-        # CAM destination filters: 0, CAM source filters: 0
-        p75 = re.compile(r'^CAM +destination +filters: (?P<cam_destination_filter_count>\d+), +CAM +source +filters: (?P<cam_source_filter_count>\d+)$')
-
-        # Destination slot: 0 (0x00)
-        p76 = re.compile(r'^Destination +slot: +(?P<destination_slot>\d+) +(?P<destination_mask>\S+)$')
-
-        # 0 best-effort            95     9500000000    95              0      low    none
-        p77 = re.compile(r'^(?P<cos_queue_number>\d+) +(?P<cos_queue_forwarding_class>\S+) +(?P<cos_queue_bandwidth>\d+) +(?P<cos_queue_bandwidth_bps>\d+) +(?P<cos_queue_buffer>\d+) +(?P<cos_queue_buffer_bytes>\d+) +(?P<cos_queue_priority>\w+) +(?P<cos_queue_limit>\w+)$')
-
-        # Direction : Output
-        p78 = re.compile(r'^Direction : +(?P<cos_direction>\S+)$')
-
-        # Generation: 9549, Route table: 0
-        p79 = re.compile(r'^Generation: +(?P<generation>\d+)(, +Route +table: +(?P<route_table>\d+))?$')
-
-        # Policer: Input: GE_1M-xe-0/1/7.0-log_int-i, Output: GE_1M-xe-0/1/7.0-log_int-o
-        p80 = re.compile(r'^Policer: +Input: +(?P<policer_input>\S+)(, +Output: +(?P<policer_output>\S+))?$')
-
-        # Bundle:
-        # Link:
-        p81 = re.compile(r'^(?P<lag_int_type>(Bundle)|(Link)):$')
-
-        # xe-0/1/10.0
-        # xe-0/1/10
-        p81_1 = re.compile(r'^(?P<name>[a-z]{2}-\d+/\d+/\d+(\.\d+)?)$')
-
-        # Input :           225          0         14514         1952
-        # Output:            16          0          1188            0
-        p82 = re.compile(r'^(?P<in_out>(Input\s*)|(Output)):\s+(?P<packets>\d+)\s+(?P<pps>\d+)\s+(?P<bytes>\d+)\s+(?P<bps>\d+)$')
-
-        # Adaptive Adjusts:          0
-        # Adaptive Scans  :          0
-        # Adaptive Updates:          0
-        p83 = re.compile(r'^(?P<adaptive>Adaptive\s+(Adjusts|Scans|Updates))\s*:\s+(?P<adaptive_value>\d+)$')
-
-        # Aggregate member links: 2
-        p84 = re.compile(r'^Aggregate\s+member\s+links:\s+(?P<aggregate_member_count>\d+)$')
-
-        # LACP info:        Role     System             System       Port     Port    Port
-        # LACP Statistics:       LACP Rx     LACP Tx   Unknown Rx   Illegal Rx
-        # Marker Statistics:   Marker Rx     Resp Tx   Unknown Rx   Illegal Rx
-        p85 = re.compile(r'^(?P<lacp_flag>(LACP info)|(LACP Statistics)|(Marker Statistics)):\s+.+$')
-
-        # ge-0/0/6.0     Actor        127  2c:6b:f5:ff:cf:97        127        2       1
-        # ge-0/0/6.0   Partner        127  2c:6b:f5:ff:08:d8        127        2       1
-        p86 = re.compile(r'^(?P<name>\S+)\s+(?P<lacp_role>\S+)\s+(?P<lacp_sys_priority>\d+)\s+(?P<lacp_system_id>\S+)\s+(?P<lacp_port_priority>\d+)\s+(?P<lacp_port_number>\d+)\s+(?P<lacp_port_key>\d+)$')
-
-        # For LACP Statistics
-        # ge-0/0/6.0                 0           0            0            0
-        p87 = re.compile(r'(?P<name>\S+)\s+(?P<lacp_rx_packets>\d+)\s+(?P<lacp_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)$')
-
-        # For Marker Statistics
-        # ge-0/0/6.0                 0           0            0            0
-        p88 = re.compile(r'(?P<name>\S+)\s+(?P<marker_rx_packets>\d+)\s+(?P<marker_response_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)$')
-
-        # Primary         Active
-        # Backup          Down
-        # Standby         Down
-        p89 = re.compile(r'^(?P<list_type>(Primary)|(Backup)|(Standby))\s+(?P<list_status>(Active)|(Down))$')
-
-        # ge-0/0/7        Up
-        p90 = re.compile(r'^(?P<if_child_name>\S+)\s+(?P<if_status>(Up)|(Down))$')
-
         cnt = 0
         queue_name = ''
         lag_int_type = ''
@@ -1617,10 +1831,12 @@ class ShowInterfaces(ShowInterfacesSchema):
             if not line:
                continue
             cnt += 1
+            rule, m = _show_interfaces_lines.match(line)
+            if not m:
+                continue
 
             # Physical interface: ge-0/0/0, Enabled, Physical link is Up
-            m = p1.match(line)
-            if m:
+            if rule == 'p1':
                 group = m.groupdict()
                 statistics_type = 'physical'
                 interface_info_dict = ret_dict.setdefault('interface-information', {})
@@ -1635,16 +1851,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface index: 148, SNMP ifIndex: 526
-            m = p2.match(line)
-            if m:
+            if rule == 'p2':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Description: none/100G/in/hktGCS002_ge-0/0/0
-            m = p3.match(line)
-            if m:
+            if rule == 'p3':
                 group = m.groupdict()
                 if statistics_type == 'physical':
                     physical_interface_dict.update({k.replace('_','-'):
@@ -1655,32 +1869,28 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None,
-            m = p4.match(line)
-            if m:
+            if rule == 'p4':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None,
-            m = p4_1.match(line)
-            if m:
+            if rule == 'p4_1':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None,
-            m = p4_2.match(line)
-            if m:
+            if rule == 'p4_2':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-            m = p5.match(line)
-            if m:
+            if rule == 'p5':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
@@ -1688,48 +1898,42 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
             # BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled
-            m = p5_1.match(line)
-            if m:
+            if rule == 'p5_1':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Loopback: Disabled, Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-            m = p5_2.match(line)
-            if m:
+            if rule == 'p5_2':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-            m = p6.match(line)
-            if m:
+            if rule == 'p6':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Pad to minimum frame size: Disabled
-            m = p7.match(line)
-            if m:
+            if rule == 'p7':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Minimum links needed: 1, Minimum bandwidth needed: 1bps
-            m = p7_1.match(line)
-            if m:
+            if rule == 'p7_1':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Device flags   : Present Running
-            m = p8.match(line)
-            if m:
+            if rule == 'p8':
                 group = m.groupdict()
                 if_device_flags = group['if_device_flags']
                 if_device_flags_dict = physical_interface_dict.setdefault('if-device-flags', {})
@@ -1739,8 +1943,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface flags: SNMP-Traps Internal: 0x4000
-            m = p9.match(line)
-            if m:
+            if rule == 'p9':
                 group = m.groupdict()
                 if_config_flags_dict = physical_interface_dict.setdefault('if-config-flags', {})
                 if_config_flags_dict.update({'iff-snmp-traps': True})
@@ -1751,8 +1954,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Link flags     : None
-            m = p10.match(line)
-            if m:
+            if rule == 'p10':
                 group = m.groupdict()
                 if_media_flags = group['if_media_flags']
                 if_media_flags_dict = physical_interface_dict.setdefault('if-media-flags', {})
@@ -1762,16 +1964,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Link type      : Full-Duplex
-            m = p10_1.match(line)
-            if m:
+            if rule == 'p10_1':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # CoS queues     : 8 supported, 8 maximum usable queues
-            m = p11.match(line)
-            if m:
+            if rule == 'p11':
                 group = m.groupdict()
                 cos_dict = physical_interface_dict.setdefault('physical-interface-cos-information', {})
                 cos_dict.update({k.replace('_','-'):
@@ -1779,40 +1979,35 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Current address: 00:50:56:ff:56:b6, Hardware address: 00:50:56:ff:56:b6
-            m = p12.match(line)
-            if m:
+            if rule == 'p12':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Last flapped   : 2019-08-29 09:09:19 UTC (29w6d 18:56 ago)
-            m = p13.match(line)
-            if m:
+            if rule == 'p13':
                 group = m.groupdict()
                 intf_flapped_dict = physical_interface_dict.setdefault('interface-flapped', {})
                 intf_flapped_dict.update({'#text': group['interface_flapped']})
                 continue
             
             # IPv6 transit statistics:
-            m = p36.match(line)
-            if m:
+            if rule == 'p36':
                 group = m.groupdict()
                 traffic_statistics_dict = traffic_statistics_dict.setdefault('ipv6-transit-statistics', {})
                 statistics_type = 'ipv6_transit'
                 continue
             
             # Dropped traffic statistics due to STP State:
-            m = p37.match(line)
-            if m:
+            if rule == 'p37':
                 statistics_type = 'dropped_stp_state'
                 group = m.groupdict()
                 traffic_statistics_dict = physical_interface_dict.setdefault('stp-traffic-statistics', {})
                 continue
 
             # Transit statistics:
-            m = p38.match(line)
-            if m:
+            if rule == 'p38':
                 group = m.groupdict()
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('transit-traffic-statistics', {})
@@ -1822,8 +2017,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Input rate     : 2952 bps (5 pps)
-            m = p14.match(line)
-            if m:
+            if rule == 'p14':
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('traffic-statistics', {})
                 elif statistics_type == 'logical':
@@ -1834,8 +2028,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Input  bytes  :          19732539397                 3152 bps
-            m = p14_1.match(line)
-            if m:
+            if rule == 'p14_1':
                 group = m.groupdict()
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('traffic-statistics', {})
@@ -1849,8 +2042,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         v for k, v in group.items() if v is not None})
                 continue
             # Output bytes  :          16367814635                 3160 bps
-            m = p14_2.match(line)
-            if m:
+            if rule == 'p14_2':
                 group = m.groupdict()
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('traffic-statistics', {})
@@ -1864,8 +2056,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         v for k, v in group.items() if v is not None})
                 continue
             # Input  packets:            133726363                    5 pps
-            m = p14_3.match(line)
-            if m:
+            if rule == 'p14_3':
                 group = m.groupdict()
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('traffic-statistics', {})
@@ -1879,8 +2070,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         v for k, v in group.items() if v is not None})
                 continue
             # Output packets:            129306863                    4 pps
-            m = p14_4.match(line)
-            if m:
+            if rule == 'p14_4':
                 group = m.groupdict()
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('traffic-statistics', {})
@@ -1895,8 +2085,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Output rate    : 3080 bps (3 pps)
-            m = p15.match(line)
-            if m:
+            if rule == 'p15':
                 group = m.groupdict()
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('traffic-statistics', {})
@@ -1907,8 +2096,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Active alarms  : None
-            m = p16.match(line)
-            if m:
+            if rule == 'p16':
                 group = m.groupdict()
                 active_alarms = group['active_alarms']
                 active_alarms_dict = physical_interface_dict.setdefault('active-alarms', {})
@@ -1921,8 +2109,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Active defects : None
-            m = p17.match(line)
-            if m:
+            if rule == 'p17':
                 group = m.groupdict()
                 active_defects = group['active_defects']
                 active_defects_dict = physical_interface_dict.setdefault('active-defects', {})
@@ -1935,77 +2122,67 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # PCS statistics                      Seconds
-            m = p18.match(line)
-            if m:
+            if rule == 'p18':
                 group = m.groupdict()
                 statistics_dict = physical_interface_dict.setdefault('ethernet-pcs-statistics', {})
                 continue
 
             # Bit errors                             0
-            m = p19.match(line)
-            if m:
+            if rule == 'p19':
                 group = m.groupdict()
                 statistics_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Errored blocks                         0
-            m = p20.match(line)
-            if m:
+            if rule == 'p20':
                 group = m.groupdict()
                 statistics_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
             
             # Ethernet FEC statistics              Errors
-            m = p21.match(line)
-            if m:
+            if rule == 'p21':
                 statistics_dict = physical_interface_dict.setdefault('ethernet-fec-statistics', {})
                 continue
 
             # FEC Corrected Errors                    0
-            m = p22.match(line)
-            if m:
+            if rule == 'p22':
                 group = m.groupdict()
                 statistics_dict.update({k:
                     v for k, v in group.items() if v is not None})
                 continue
 
             # FEC Uncorrected Errors                  0
-            m = p22_1.match(line)
-            if m:
+            if rule == 'p22_1':
                 group = m.groupdict()
                 statistics_dict.update({k:
                     v for k, v in group.items() if v is not None})
                 continue
 
             # FEC Corrected Errors Rate               0
-            m = p22_2.match(line)
-            if m:
+            if rule == 'p22_2':
                 group = m.groupdict()
                 statistics_dict.update({k:
                     v for k, v in group.items() if v is not None})
                 continue
 
             # FEC Uncorrected Errors Rate             0
-            m = p22_3.match(line)
-            if m:
+            if rule == 'p22_3':
                 group = m.groupdict()
                 statistics_dict.update({k:
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Interface transmit statistics: Disabled
-            m = p23.match(line)
-            if m:
+            if rule == 'p23':
                 group = m.groupdict()
                 inft_transmit = group['interface_transmit_statistics']
                 physical_interface_dict.update({'interface-transmit-statistics': inft_transmit})
                 continue
 
             # Logical interface ge-0/0/0.0 (Index 333) (SNMP ifIndex 606)
-            m = p24.match(line)
-            if m:
+            if rule == 'p24':
                 # found_flag : To check if `physical-interface` list created
                 #              for logical-interface
                 #              This prevents to create redundant list for same physical interface
@@ -2033,8 +2210,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Flags: Up SNMP-Traps 0x4004000 Encapsulation: ENET2
-            m = p25.match(line)
-            if m:
+            if rule == 'p25':
                 group = m.groupdict()
                 if_config_flags_dict = logical_interface_dict.setdefault('if-config-flags', {})
                 if_config_flags_dict.update({'iff-up': True})
@@ -2045,16 +2221,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Input packets : 133657033
-            m = p26.match(line)
-            if m:
+            if rule == 'p26':
                 group = m.groupdict()
                 traffic_statistics_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Output packets: 129243982
-            m = p27.match(line)
-            if m:
+            if rule == 'p27':
                 group = m.groupdict()
                 traffic_statistics_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
@@ -2062,8 +2236,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Protocol inet, MTU: 1500
             # Protocol mpls, MTU: 1488, Maximum labels: 3
-            m = p28.match(line)
-            if m:
+            if rule == 'p28':
                 group = m.groupdict()
                 address_family_list = logical_interface_dict.setdefault('address-family', [])
                 address_family_dict = {k.replace('_','-'):
@@ -2071,16 +2244,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1, Curr new hold cnt: 0, NH drop cnt: 0
-            m = p30.match(line)
-            if m:
+            if rule == 'p30':
                 group = m.groupdict()
                 address_family_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Curr new hold cnt: 0, NH drop cnt: 0
-            m = p30_1.match(line)
-            if m:
+            if rule == 'p30_1':
                 group = m.groupdict()
                 address_family_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
@@ -2088,8 +2259,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Flags: No-Redirects, Sendbcast-pkt-to-re
             # Flags: Is-Primary, User-MTU
-            m = p31.match(line)
-            if m:
+            if rule == 'p31':
                 group = m.groupdict()
                 address_family_flags_dict = address_family_dict.setdefault('address-family-flags', {})
                 for flag in group['flags'].split(','):
@@ -2102,8 +2272,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Addresses, Flags: Is-Preferred Is-Primary
-            m = p32.match(line)
-            if m:
+            if rule == 'p32':
                 group = m.groupdict()
                 af_check = address_family_dict.get('interface-address', None)
                 interface_address_dict = {}
@@ -2126,46 +2295,40 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Destination: 10.189.5.92/30, Local: 10.189.5.93, Broadcast: 10.189.5.95
-            m = p33.match(line)
-            if m:
+            if rule == 'p33':
                 group = m.groupdict()
                 interface_address_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Broadcast: 10.0.0.255, Generation: 8336
-            m = p33_1.match(line)
-            if m:
+            if rule == 'p33_1':
                 group = m.groupdict()
                 interface_address_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Bandwidth: 0
-            m = p34.match(line)
-            if m:
+            if rule == 'p34':
                 group = m.groupdict()
                 logical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
             
             # Local: fe80::250:560f:fc8d:7c08
-            m = p35.match(line)
-            if m:
+            if rule == 'p35':
                 group = m.groupdict()
                 interface_address_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
             
             # Input errors:
-            m = p41.match(line)
-            if m:
+            if rule == 'p41':
                 input_error_list_dict = physical_interface_dict.setdefault('input-error-list', {})
                 continue
 
             # Output errors:
-            m = p42.match(line)
-            if m:
+            if rule == 'p42':
                 output_error_list_dict = physical_interface_dict.setdefault('output-error-list', {})
                 continue
 
@@ -2178,173 +2341,151 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0,
             # L3 incompletes: 0, L2 channel errors: 0, L2 mismatch timeouts: 0,
             # FIFO errors: 0, Resource errors: 0
-            m = p43.match(line)
-            if m:
+            if rule == 'p43':
                 group = m.groupdict()
                 input_error_list_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Carrier transitions: 1, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0,
-            m = p44_1.match(line)
-            if m:
+            if rule == 'p44_1':
                 group = m.groupdict()
                 output_error_list_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # MTU errors: 0, Resource errors: 0
-            m = p44_2.match(line)
-            if m:
+            if rule == 'p44_2':
                 group = m.groupdict()
                 output_error_list_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
-            m = p44_3.match(line)
-            if m:
+            if rule == 'p44_3':
                 group = m.groupdict()
                 output_error_list_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Total octets                   21604601324      16828244544
-            m = p45.match(line)
-            if m:
+            if rule == 'p45':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
-            m = p45_1.match(line)
-            if m:
+            if rule == 'p45_1':
                 ethernet_mac_statistics = physical_interface_dict.setdefault('ethernet-mac-statistics', {})
                 continue
 
             # Total packets                    133726919        129183374
-            m = p46.match(line)
-            if m:
+            if rule == 'p46':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Unicast packets                  133726908        129183361
-            m = p47.match(line)
-            if m:
+            if rule == 'p47':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Broadcast packets                        0                0
-            m = p48.match(line)
-            if m:
+            if rule == 'p48':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Multicast packets                        0                0
-            m = p49.match(line)
-            if m:
+            if rule == 'p49':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # CRC/Align errors                         0                0
-            m = p50.match(line)
-            if m:
+            if rule == 'p50':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # FIFO errors                              0                0
-            m = p51.match(line)
-            if m:
+            if rule == 'p51':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # MAC control frames                       0                0
-            m = p52.match(line)
-            if m:
+            if rule == 'p52':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # MAC pause frames                         0                0
-            m = p53.match(line)
-            if m:
+            if rule == 'p53':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Oversized frames                         0
-            m = p54.match(line)
-            if m:
+            if rule == 'p54':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Jabber frames                            0
-            m = p56.match(line)
-            if m:
+            if rule == 'p56':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Fragment frames                          0
-            m = p57.match(line)
-            if m:
+            if rule == 'p57':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # VLAN tagged frames                       0
-            m = p58.match(line)
-            if m:
+            if rule == 'p58':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Code violations                          0
-            m = p59.match(line)
-            if m:
+            if rule == 'p59':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Total errors                             0                0
-            m = p60.match(line)
-            if m:
+            if rule == 'p60':
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Label-switched interface (LSI) traffic statistics:
-            m = p61.match(line)
-            if m:
+            if rule == 'p61':
                 statistics_type = 'lsi_traffic_statistics'
                 traffic_statistics_dict = physical_interface_dict.setdefault('lsi-traffic-statistics', {})
                 continue
 
             # Ingress queues: 8 supported, 4 in use
             # Egress queues: 8 supported, 4 in use
-            m = p62.match(line)
-            if m:
+            if rule == 'p62':
                 group = m.groupdict()
                 queue_name = group['intf_cos_queue_type']
                 if queue_name == 'Egress queues':
@@ -2357,8 +2498,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0                                0                    0                    0
-            m = p63.match(line)
-            if m and queue_name:
+            if rule == 'p63' and queue_name:
                 group = m.groupdict()
                 if queue_name == 'Egress queues':
                     queue_list = physical_interface_dict.setdefault('queue-counters', {}).setdefault('queue', [])
@@ -2373,16 +2513,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Hold-times     : Up 0 ms, Down 0 ms
-            m = p64.match(line)
-            if m:
+            if rule == 'p64':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
             
             # Statistics last cleared: 2020-10-14 13:18:51 EST (00:12:30 ago)
-            m = p65.match(line)
-            if m:
+            if rule == 'p65':
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
@@ -2392,8 +2530,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # 1                   expedited-forwarding
             # 2                   assured-forwarding
             # 3                   network-control
-            m = p66.match(line)
-            if m:
+            if rule == 'p66':
                 group = m.groupdict()
                 queue_number = int(group.pop('queue_number', 0))
                 if 'queue-counters' in physical_interface_dict:
@@ -2407,30 +2544,26 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Filter statistics:
-            m = p67.match(line)
-            if m:
+            if rule == 'p67':
                 ethernet_filter_statistics = physical_interface_dict.setdefault('ethernet-filter-statistics', {})
                 continue
 
             # Input packet count                   38089
-            m = p68.match(line)
-            if m:
+            if rule == 'p68':
                 group = m.groupdict()
                 ethernet_filter_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Input packet rejects                    24
-            m = p69.match(line)
-            if m:
+            if rule == 'p69':
                 group = m.groupdict()
                 ethernet_filter_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Input DA rejects                         0
-            m = p70.match(line)
-            if m:
+            if rule == 'p70':
                 group = m.groupdict()
                 ethernet_filter_statistics.update(
                     {'input-reject-destination-address-count': group['input_reject_da_count']})
@@ -2438,46 +2571,40 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Input SA rejects                         0
-            m = p71.match(line)
-            if m:
+            if rule == 'p71':
                 group = m.groupdict()
                 ethernet_filter_statistics.update(
                     {'input-reject-source-address-count': group['input_reject_sa_count']})
                 continue
 
             # Output packet count                                    8798
-            m = p72.match(line)
-            if m:
+            if rule == 'p72':
                 group = m.groupdict()
                 ethernet_filter_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Output packet pad count                                   0
-            m = p73.match(line)
-            if m:
+            if rule == 'p73':
                 group = m.groupdict()
                 ethernet_filter_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Output packet error count                                 0
-            m = p74.match(line)
-            if m:
+            if rule == 'p74':
                 group = m.groupdict()
                 ethernet_filter_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
             
-            m = p75.match(line)
-            if m:
+            if rule == 'p75':
                 group = m.groupdict()
                 ethernet_filter_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
-            m = p76.match(line)
-            if m:
+            if rule == 'p76':
                 group = m.groupdict()
                 pfe_information = physical_interface_dict.setdefault('pfe-information', {})
                 pfe_information.update({k.replace('_','-'):
@@ -2485,8 +2612,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 best-effort            95     9500000000    95              0      low    none
-            m = p77.match(line)
-            if m:
+            if rule == 'p77':
                 group = m.groupdict()
                 pfe_information = physical_interface_dict.setdefault('pfe-information', {})
                 cos_stream_information_dict = physical_interface_dict.setdefault("cos-information", {}). \
@@ -2499,8 +2625,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Direction : Output
-            m = p78.match(line)
-            if m:
+            if rule == 'p78':
                 group = m.groupdict()
                 pfe_information = physical_interface_dict.setdefault('pfe-information', {})
                 cos_stream_information_dict = physical_interface_dict.setdefault("cos-information", {}). \
@@ -2510,8 +2635,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Generation: 9549, Route table: 0
-            m = p79.match(line)
-            if m:
+            if rule == 'p79':
                 group = m.groupdict()
                 address_family_list = logical_interface_dict.setdefault('address-family', [])
                 address_family_dict.update({k.replace('_','-'):
@@ -2520,8 +2644,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Direction : Output
-            m = p80.match(line)
-            if m:
+            if rule == 'p80':
                 group = m.groupdict()
                 policer_information_dict = address_family_dict.setdefault('policer-information', {})
                 policer_information_dict = {k.replace('_','-'):
@@ -2530,8 +2653,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             
             # Bundle:
             # Link:
-            m = p81.match(line)
-            if m:
+            if rule == 'p81':
                 in_out_dict = {}
                 group = m.groupdict()
                 lag_traffic_dict = logical_interface_dict.setdefault('lag-traffic-statistics', {})
@@ -2540,17 +2662,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # xe-0/1/10.0
             # xe-0/1/10
-            p81_1 = re.compile(r'^(?P<name>[a-z]{2}-\d+/\d+/\d+(\.\d+)?)$')
-            m = p81_1.match(line)
-            if m and lag_int_type == 'Link':
+            if rule == 'p81_1' and lag_int_type == 'Link':
                 in_out_dict = {}
                 group = m.groupdict()
                 lag_link_name = group['name']
 
             # Input :           225          0         14514         1952
             # Output:            16          0          1188            0
-            m = p82.match(line)
-            if m:
+            if rule == 'p82':
                 group = m.groupdict()
                 in_out_direction = group.pop('in_out').rstrip().lower()
                 in_out_dict.update({"{iod}-{k}".format(iod=in_out_direction, k=k):
@@ -2568,15 +2687,13 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Adaptive Adjusts:          0
             # Adaptive Scans  :          0
             # Adaptive Updates:          0
-            m = p83.match(line)
-            if m:
+            if rule == 'p83':
                 group = m.groupdict()
                 lag_traffic_dict.setdefault('lag-adaptive-statistics', {}).setdefault(group['adaptive'].lower().replace(' ', '-'), group['adaptive_value'])
                 continue
 
             # Aggregate member links: 2
-            m = p84.match(line)
-            if m:
+            if rule == 'p84':
                 group = m.groupdict()
                 lag_traffic_dict.setdefault('aggregate-member-info', {})
                 lag_traffic_dict['aggregate-member-info'] = {k.replace('_','-'):
@@ -2586,15 +2703,13 @@ class ShowInterfaces(ShowInterfacesSchema):
             # LACP info:        Role     System             System       Port     Port    Port
             # LACP Statistics:       LACP Rx     LACP Tx   Unknown Rx   Illegal Rx
             # Marker Statistics:   Marker Rx     Resp Tx   Unknown Rx   Illegal Rx
-            m = p85.match(line)
-            if m:
+            if rule == 'p85':
                 lacp_flag = m.groupdict()['lacp_flag']
                 continue
 
             # ge-0/0/6.0     Actor        127  2c:6b:f5:ff:cf:97        127        2       1
             # ge-0/0/6.0   Partner        127  2c:6b:f5:ff:08:d8        127        2       1
-            m = p86.match(line)
-            if m and lacp_flag == 'LACP info':
+            if rule == 'p86' and lacp_flag == 'LACP info':
                 group = m.groupdict()
                 lag_link_name = group.pop('name')
                 lag_traffic_dict.setdefault('lag-lacp-info', [])
@@ -2606,8 +2721,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # For LACP Statistics
             # ge-0/0/6.0                 0           0            0            0
-            m = p87.match(line)
-            if m and lacp_flag == 'LACP Statistics':
+            if rule == 'p87' and lacp_flag == 'LACP Statistics':
                 group = m.groupdict()
                 lag_link_name = group.pop('name')
                 lag_traffic_dict.setdefault('lag-lacp-statistics', [])
@@ -2617,9 +2731,11 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # For Maker Statistics
             # ge-0/0/6.0                 0           0            0            0
-            m = p88.match(line)
-            if m and lacp_flag == 'Marker Statistics':
-                group = m.groupdict()
+            if rule == 'p87' and lacp_flag == 'Marker Statistics':
+                group = dict(zip(('name', 'marker_rx_packets',
+                                  'marker_response_tx_packets',
+                                  'unknown_rx_packets', 'illegal_rx_packets'),
+                                 m.groups()))
                 lag_link_name = group.pop('name')
                 lag_traffic_dict.setdefault('lag-marker', [])
                 lag_traffic_dict['lag-marker'].append({k.replace('_','-'):
@@ -2630,8 +2746,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Backup          Down
             # Standby         Down
             # p89 = re.compile(r'^(?P<list_type>(Primary)|(Backup)|(Standby))\s+(?P<list_status>(Active)|(Down))$')
-            m = p89.match(line)
-            if m:
+            if rule == 'p89':
                 group = m.groupdict()
                 lag_traffic_dict.setdefault('if-distribution-list-information', [])
                 if_dist_dict = {k.replace('_','-'):
@@ -2641,8 +2756,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # ge-0/0/7        Up
             # p90 = re.compile(r'^(?P<if_child_name>\S+)\s+(?P<if_status>(Up)|(Down))$')
-            m = p90.match(line)
-            if m and if_dist_dict:
+            if rule == 'p90' and if_dist_dict:
                 group = m.groupdict()
                 lag_traffic_dict['if-distribution-list-information'][-1].setdefault('if-list', [])
                 if_list_dict = {k.replace('_','-'):
@@ -2689,153 +2803,116 @@ class ShowInterfacesStatisticsSchema(MetaParser):
 
     
 
-    def validate_physical_interface_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('physical-interface is not a list')
-
-        def validate_logical_interface_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('logical-interface is not a list')
-
-            def validate_address_family_list(value):
-                if not isinstance(value, list):
-                    raise SchemaError('address-family is not a list')
-
-                def validate_interface_address_list(value):
-                    if not isinstance(value, list):
-                        raise SchemaError('interface-address is not a list')
-
-                    interface_address_schema = Schema ({
-                            "ifa-flags": {
-                                Optional("ifaf-current-preferred"): bool,
-                                Optional("ifaf-current-primary"): bool,
-                                Optional("ifaf-current-default"): bool,
-                            },
-                            Optional("ifa-destination"): str,
-                            Optional("ifa-local"): str,
-                            Optional("ifa-broadcast"): str,
-                        })
-
-                    for item in value:
-                        interface_address_schema.validate(item)
-                    return value
-
-                address_family_schema = Schema({
-                        "address-family-name": str,
-                        "mtu": str,
-                        Optional("address-family-flags"): {
-                            Optional("ifff-is-primary"): bool,
-                            Optional("ifff-sendbcast-pkt-to-re"): bool,
-                        },
-                        Optional("interface-address"): Use(validate_interface_address_list),
-                    })
-
-                for item in value:
-                    address_family_schema.validate(item)
-                return value
-                    
-
-            logical_interface_schema = Schema (
-                {
-                        "name": str,
-                        Optional("local-index"): str,
-                        Optional("snmp-index"): str,
-                        Optional("if-config-flags"): {
-                            "iff-snmp-traps": bool,
-                            "internal-flags": str,
-                        },
-                        Optional("encapsulation"): str,
-                        "traffic-statistics": {
-                            "input-packets": str,
-                            "output-packets": str,
-                        },
-                        Optional("filter-information"): str,
-                        Optional("logical-interface-zone-name"): str,
-                        Optional("allowed-host-inbound-traffic"): {
-                            Optional("inbound-dhcp"): bool,
-                            Optional("inbound-http"): bool,
-                            Optional("inbound-https"): bool,
-                            Optional("inbound-ssh"): bool,
-                            Optional("inbound-telnet"): bool,
-                        },
-                        Optional("address-family"): Use(validate_address_family_list),
-                    }
-            )
-
-            for item in value:
-                logical_interface_schema.validate(item)
-            return value
-
-        physical_interface_schema = Schema(
-            {
-                "name": str,
-                "admin-status": str,
-                "oper-status": str,
-                "local-index": str,
-                "snmp-index": str,
-                Optional("link-level-type"): str,
-                Optional("mtu"): str,
-                Optional("source-filtering"): str,
-                Optional("link-mode"): str,
-                Optional("speed"): str,
-                Optional("bpdu-error"): str,
-                Optional("l2pt-error"): str,
-                Optional("loopback"): str,
-                Optional("if-flow-control"): str,
-                Optional("if-auto-negotiation"): str,
-                Optional("if-remote-fault"): str,
-                Optional("if-device-flags"): {
-                    Optional("ifdf-present"): bool,
-                    Optional("ifdf-running"): bool,
-                    Optional("ifdf-none"): bool,
-                },
-                Optional("if-config-flags"): {
-                    Optional("iff-snmp-traps"): bool,
-                    Optional("internal-flags"): str,
-                },
-                Optional("if-media-flags"): {
-                    Optional("ifmf-none"): bool,
-                },
-                Optional("physical-interface-cos-information"): {
-                    "physical-interface-cos-hw-max-queues": str,
-                    "physical-interface-cos-use-max-queues": str,
-                },
-                Optional("current-physical-address"): str,
-                Optional("hardware-physical-address"): str,
-                Optional("interface-flapped"): str,
-                Optional("statistics-cleared"): str,
-                Optional("stp-traffic-statistics"): {
-                    "stp-input-bytes-dropped": str,
-                    "stp-input-packets-dropped": str,
-                    "stp-output-bytes-dropped": str,
-                    "stp-output-packets-dropped": str
-                },
-                Optional("traffic-statistics"): {
-                    "input-bps": str,
-                    "input-pps": str,
-                    "output-bps": str,
-                    "output-pps": str
-                },
-                Optional("input-error-count"): str,
-                Optional("output-error-count"): str,
-                Optional("active-alarms"): {
-                    "interface-alarms": {
-                        Optional("alarm-not-present"): bool,
-                    },
-                },
-                Optional("active-defects"): {
-                    "interface-alarms": {
-                        Optional("alarm-not-present"): bool,
-                    },
-                },
-                Optional("interface-transmit-statistics"): str,
-                Optional("logical-interface"): Use(validate_logical_interface_list)
-            }
-        )
-
-        for item in value:
-            physical_interface_schema.validate(item)
-        return value
+    validate_interface_address_list = ListOfDict({
+        "ifa-flags": {
+            Optional("ifaf-current-preferred"): bool,
+            Optional("ifaf-current-primary"): bool,
+            Optional("ifaf-current-default"): bool,
+        },
+        Optional("ifa-destination"): str,
+        Optional("ifa-local"): str,
+        Optional("ifa-broadcast"): str,
+    }, 'interface-address is not a list')
+
+    validate_address_family_list = ListOfDict({
+        "address-family-name": str,
+        "mtu": str,
+        Optional("address-family-flags"): {
+            Optional("ifff-is-primary"): bool,
+            Optional("ifff-sendbcast-pkt-to-re"): bool,
+        },
+        Optional("interface-address"): Use(validate_interface_address_list),
+    }, 'address-family is not a list')
+
+    validate_logical_interface_list = ListOfDict({
+        "name": str,
+        Optional("local-index"): str,
+        Optional("snmp-index"): str,
+        Optional("if-config-flags"): {
+            "iff-snmp-traps": bool,
+            "internal-flags": str,
+        },
+        Optional("encapsulation"): str,
+        "traffic-statistics": {
+            "input-packets": str,
+            "output-packets": str,
+        },
+        Optional("filter-information"): str,
+        Optional("logical-interface-zone-name"): str,
+        Optional("allowed-host-inbound-traffic"): {
+            Optional("inbound-dhcp"): bool,
+            Optional("inbound-http"): bool,
+            Optional("inbound-https"): bool,
+            Optional("inbound-ssh"): bool,
+            Optional("inbound-telnet"): bool,
+        },
+        Optional("address-family"): Use(validate_address_family_list),
+    }, 'logical-interface is not a list')
+
+    validate_physical_interface_list = ListOfDict({
+        "name": str,
+        "admin-status": str,
+        "oper-status": str,
+        "local-index": str,
+        "snmp-index": str,
+        Optional("link-level-type"): str,
+        Optional("mtu"): str,
+        Optional("source-filtering"): str,
+        Optional("link-mode"): str,
+        Optional("speed"): str,
+        Optional("bpdu-error"): str,
+        Optional("l2pt-error"): str,
+        Optional("loopback"): str,
+        Optional("if-flow-control"): str,
+        Optional("if-auto-negotiation"): str,
+        Optional("if-remote-fault"): str,
+        Optional("if-device-flags"): {
+            Optional("ifdf-present"): bool,
+            Optional("ifdf-running"): bool,
+            Optional("ifdf-none"): bool,
+        },
+        Optional("if-config-flags"): {
+            Optional("iff-snmp-traps"): bool,
+            Optional("internal-flags"): str,
+        },
+        Optional("if-media-flags"): {
+            Optional("ifmf-none"): bool,
+        },
+        Optional("physical-interface-cos-information"): {
+            "physical-interface-cos-hw-max-queues": str,
+            "physical-interface-cos-use-max-queues": str,
+        },
+        Optional("current-physical-address"): str,
+        Optional("hardware-physical-address"): str,
+        Optional("interface-flapped"): str,
+        Optional("statistics-cleared"): str,
+        Optional("stp-traffic-statistics"): {
+            "stp-input-bytes-dropped": str,
+            "stp-input-packets-dropped": str,
+            "stp-output-bytes-dropped": str,
+            "stp-output-packets-dropped": str
+        },
+        Optional("traffic-statistics"): {
+            "input-bps": str,
+            "input-pps": str,
+            "output-bps": str,
+            "output-pps": str
+        },
+        Optional("input-error-count"): str,
+        Optional("output-error-count"): str,
+        Optional("active-alarms"): {
+            "interface-alarms": {
+                Optional("alarm-not-present"): bool,
+            },
+        },
+        Optional("active-defects"): {
+            "interface-alarms": {
+                Optional("alarm-not-present"): bool,
+            },
+        },
+        Optional("interface-transmit-statistics"): str,
+        Optional("logical-interface"): Use(validate_logical_interface_list)
+    }, 'physical-interface is not a list')
 
     schema = {
         "interface-information": {
@@ -3266,19 +3343,11 @@ class ShowInterfacesPolicersInterfaceSchema(MetaParser):
     }
 }'''
 
-    def validate_policer_information_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('policer-information is not a list')
-        policer_information_schema = Schema({
-            "policer-family": str,
-            "policer-input": str,
-            Optional("policer-output"): Or(str,None)
-        })
-        # Validate each dictionary in list
-        for item in value:
-            policer_information_schema.validate(item)
-        return value
+    validate_policer_information_list = ListOfDict({
+        "policer-family": str,
+        "policer-input": str,
+        Optional("policer-output"): Or(str,None)
+    }, 'policer-information is not a list')
 
 
     def validate_logical_interface_list(value):
@@ -3420,52 +3489,44 @@ class ShowInterfacesQueueSchema(MetaParser):
     Schema for:
         * show interfaces queue {interface}
     """
-    def validate_queue(value):
-        if not isinstance(value, list):
-            raise SchemaError('queue is not a list')
-        queue_schema = Schema(
-            {
-                "forwarding-class-name": str,
-                "queue-counters-queued-bytes": str,
-                "queue-counters-queued-bytes-rate": str,
-                "queue-counters-queued-packets": str,
-                "queue-counters-queued-packets-rate": str,
-                "queue-counters-red-bytes": str,
-                "queue-counters-red-bytes-high": str,
-                "queue-counters-red-bytes-low": str,
-                "queue-counters-red-bytes-medium-high": str,
-                "queue-counters-red-bytes-medium-low": str,
-                "queue-counters-red-bytes-rate": str,
-                "queue-counters-red-bytes-rate-high": str,
-                "queue-counters-red-bytes-rate-low": str,
-                "queue-counters-red-bytes-rate-medium-high": str,
-                "queue-counters-red-bytes-rate-medium-low": str,
-                "queue-counters-red-packets": str,
-                "queue-counters-red-packets-high": str,
-                "queue-counters-red-packets-low": str,
-                "queue-counters-red-packets-medium-high": str,
-                "queue-counters-red-packets-medium-low": str,
-                "queue-counters-red-packets-rate": str,
-                "queue-counters-red-packets-rate-high": str,
-                "queue-counters-red-packets-rate-low": str,
-                "queue-counters-red-packets-rate-medium-high": str,
-                "queue-counters-red-packets-rate-medium-low": str,
-                "queue-counters-tail-drop-packets": str,
-                "queue-counters-tail-drop-packets-rate": str,
-                Optional("queue-counters-rl-drop-packets"): str,
-                Optional("queue-counters-rl-drop-packets-rate"): str,
-                Optional("queue-counters-rl-drop-bytes"): str,
-                Optional("queue-counters-rl-drop-bytes-rate"): str,
-                "queue-counters-trans-bytes": str,
-                "queue-counters-trans-bytes-rate": str,
-                "queue-counters-trans-packets": str,
-                "queue-counters-trans-packets-rate": str,
-                "queue-number": str
-            }
-        )
-        for item in value:
-            queue_schema.validate(item)
-        return value
+    validate_queue = ListOfDict({
+        "forwarding-class-name": str,
+        "queue-counters-queued-bytes": str,
+        "queue-counters-queued-bytes-rate": str,
+        "queue-counters-queued-packets": str,
+        "queue-counters-queued-packets-rate": str,
+        "queue-counters-red-bytes": str,
+        "queue-counters-red-bytes-high": str,
+        "queue-counters-red-bytes-low": str,
+        "queue-counters-red-bytes-medium-high": str,
+        "queue-counters-red-bytes-medium-low": str,
+        "queue-counters-red-bytes-rate": str,
+        "queue-counters-red-bytes-rate-high": str,
+        "queue-counters-red-bytes-rate-low": str,
+        "queue-counters-red-bytes-rate-medium-high": str,
+        "queue-counters-red-bytes-rate-medium-low": str,
+        "queue-counters-red-packets": str,
+        "queue-counters-red-packets-high": str,
+        "queue-counters-red-packets-low": str,
+        "queue-counters-red-packets-medium-high": str,
+        "queue-counters-red-packets-medium-low": str,
+        "queue-counters-red-packets-rate": str,
+        "queue-counters-red-packets-rate-high": str,
+        "queue-counters-red-packets-rate-low": str,
+        "queue-counters-red-packets-rate-medium-high": str,
+        "queue-counters-red-packets-rate-medium-low": str,
+        "queue-counters-tail-drop-packets": str,
+        "queue-counters-tail-drop-packets-rate": str,
+        Optional("queue-counters-rl-drop-packets"): str,
+        Optional("queue-counters-rl-drop-packets-rate"): str,
+        Optional("queue-counters-rl-drop-bytes"): str,
+        Optional("queue-counters-rl-drop-bytes-rate"): str,
+        "queue-counters-trans-bytes": str,
+        "queue-counters-trans-bytes-rate": str,
+        "queue-counters-trans-packets": str,
+        "queue-counters-trans-packets-rate": str,
+        "queue-number": str
+    }, 'queue is not a list')
 
     schema = {
         "interface-information": {
@@ -3743,120 +3804,104 @@ class ShowInterfacesDiagnosticsOpticsSchema(MetaParser):
         * show interfaces diagnostics optics
     """
 
-    def validate_interface(value):
-        if not isinstance(value, list):
-            raise SchemaError('Interface not a list')
-
-        def validate_lanes(value):
-            if not isinstance(value, list):
-                raise SchemaError('Lanes are not a list')
-        
-            lanes = Schema({
-                "lane-number": str,
-                "laser-bias-current": str,
-                "laser-output-power": str,
-                "laser-temperature": str,
-                "laser-receiver-power": str,
-                "laser-bias-current-high-alarm": str,
-                "laser-bias-current-low-alarm": str,
-                "laser-bias-current-high-warning": str,
-                "laser-bias-current-low-warning": str,
-                "laser-output-power-high-alarm": str,
-                "laser-output-power-low-alarm": str,
-                "laser-output-power-high-warning": str,
-                "laser-output-power-low-warning": str,
-                "laser-temperature-high-alarm": str,
-                "laser-temperature-low-alarm": str,
-                "laser-temperature-high-warning": str,
-                "laser-temperature-low-warning": str,
-                "laser-receiver-power-high-alarm": str,
-                "laser-receiver-power-low-alarm": str,
-                "laser-receiver-power-high-warning": str,
-                "laser-receiver-power-low-warning": str,
-                "tx-loss-of-signal-functionality-alarm": str,
-                "tx-cdr-loss-of-lock-alarm": str,
-                "rx-loss-of-signal-alarm": str,
-                "rx-cdr-loss-of-lock-alarm": str,
-                "apd-supply-fault-alarm": str,
-                "tec-fault-alarm": str,
-                "wavelength-unlocked-alarm": str,
-            })
-        
-            for item in value:
-                lanes.validate(item)
-            return value
-    
-        interface = Schema({
-            'name': str,
-            'optics-diagnostics': {
-                Optional("laser-bias-current"): str,
-                Optional("laser-output-power"): str,
-                "module-temperature": str,
-                "module-voltage": str,
-                Optional("receiver-signal-average-optical-power"): str,
-                Optional("laser-bias-current-high-alarm"): str,
-                Optional("laser-bias-current-low-alarm"): str,
-                Optional("laser-bias-current-high-warning"): str,
-                Optional("laser-bias-current-low-warning"): str,
-                Optional("laser-output-power-high-alarm"): str,
-                Optional("laser-output-power-low-alarm"): str,
-                Optional("laser-output-power-high-warning"): str,
-                Optional("laser-output-power-low-warning"): str,
-                "module-temperature-high-alarm": str,
-                "module-temperature-low-alarm": str,
-                "module-temperature-high-warning": str,
-                "module-temperature-low-warning": str,
-                "module-voltage-high-alarm": str,
-                "module-voltage-low-alarm": str,
-                "module-voltage-high-warning": str,
-                "module-voltage-low-warning": str,
-                Optional("laser-rx-power-high-alarm"): str,
-                Optional("laser-rx-power-low-alarm"): str,
-                Optional("laser-rx-power-high-warning"): str,
-                Optional("laser-rx-power-low-warning"): str,
-                "laser-bias-current-high-alarm-threshold": str,
-                "laser-bias-current-low-alarm-threshold": str,
-                "laser-bias-current-high-warning-threshold": str,
-                "laser-bias-current-low-warning-threshold": str,
-                "laser-output-power-high-alarm-threshold": str,
-                "laser-output-power-low-alarm-threshold": str,
-                "laser-output-power-high-warning-threshold": str,
-                "laser-output-power-low-warning-threshold": str,
-                "module-temperature-high-alarm-threshold": str,
-                "module-temperature-low-alarm-threshold": str,
-                "module-temperature-high-warning-threshold": str,
-                "module-temperature-low-warning-threshold": str,
-                "module-voltage-high-alarm-threshold": str,
-                "module-voltage-low-alarm-threshold": str,
-                "module-voltage-high-warning-threshold": str,
-                "module-voltage-low-warning-threshold": str,
-                "laser-rx-power-high-alarm-threshold": str,
-                "laser-rx-power-low-alarm-threshold": str,
-                Optional("laser-rx-power-high-warning-threshold"): str,
-                Optional("laser-rx-power-low-warning-threshold"): str,
-                Optional("module-not-ready-alarm"): str,
-                Optional("module-low-power-alarm"): str,
-                Optional("module-initialization-incomplete-alarm"): str,
-                Optional("module-fault-alarm"): str,
-                Optional("pld-flash-initialization-fault-alarm"): str,
-                Optional("power-supply-fault-alarm"): str,
-                Optional("checksum-fault-alarm"): str,
-                Optional("tx-laser-disabled-alarm"): str,
-                Optional("tx-loss-of-signal-functionality-alarm"): str,
-                Optional("tx-cdr-loss-of-lock-alarm"): str,
-                Optional("rx-loss-of-signal-alarm"): str,
-                Optional("rx-cdr-loss-of-lock-alarm"): str,
-                Optional("laser-temperature-high-alarm-threshold"): str,
-                Optional("laser-temperature-low-alarm-threshold"): str,
-                Optional("laser-temperature-high-warning-threshold"): str,
-                Optional("laser-temperature-low-warning-threshold"): str,
-                Optional("lanes"): Use(validate_lanes)
-            }
-        })
-    
-        for item in value:
-            interface.validate(item)
-        return value
+    validate_lanes = ListOfDict({
+        "lane-number": str,
+        "laser-bias-current": str,
+        "laser-output-power": str,
+        "laser-temperature": str,
+        "laser-receiver-power": str,
+        "laser-bias-current-high-alarm": str,
+        "laser-bias-current-low-alarm": str,
+        "laser-bias-current-high-warning": str,
+        "laser-bias-current-low-warning": str,
+        "laser-output-power-high-alarm": str,
+        "laser-output-power-low-alarm": str,
+        "laser-output-power-high-warning": str,
+        "laser-output-power-low-warning": str,
+        "laser-temperature-high-alarm": str,
+        "laser-temperature-low-alarm": str,
+        "laser-temperature-high-warning": str,
+        "laser-temperature-low-warning": str,
+        "laser-receiver-power-high-alarm": str,
+        "laser-receiver-power-low-alarm": str,
+        "laser-receiver-power-high-warning": str,
+        "laser-receiver-power-low-warning": str,
+        "tx-loss-of-signal-functionality-alarm": str,
+        "tx-cdr-loss-of-lock-alarm": str,
+        "rx-loss-of-signal-alarm": str,
+        "rx-cdr-loss-of-lock-alarm": str,
+        "apd-supply-fault-alarm": str,
+        "tec-fault-alarm": str,
+        "wavelength-unlocked-alarm": str,
+    }, 'Lanes are not a list')
+
+    validate_interface = ListOfDict({
+        'name': str,
+        'optics-diagnostics': {
+            Optional("laser-bias-current"): str,
+            Optional("laser-output-power"): str,
+            "module-temperature": str,
+            "module-voltage": str,
+            Optional("receiver-signal-average-optical-power"): str,
+            Optional("laser-bias-current-high-alarm"): str,
+            Optional("laser-bias-current-low-alarm"): str,
+            Optional("laser-bias-current-high-warning"): str,
+            Optional("laser-bias-current-low-warning"): str,
+            Optional("laser-output-power-high-alarm"): str,
+            Optional("laser-output-power-low-alarm"): str,
+            Optional("laser-output-power-high-warning"): str,
+            Optional("laser-output-power-low-warning"): str,
+            "module-temperature-high-alarm": str,
+            "module-temperature-low-alarm": str,
+            "module-temperature-high-warning": str,
+            "module-temperature-low-warning": str,
+            "module-voltage-high-alarm": str,
+            "module-voltage-low-alarm": str,
+            "module-voltage-high-warning": str,
+            "module-voltage-low-warning": str,
+            Optional("laser-rx-power-high-alarm"): str,
+            Optional("laser-rx-power-low-alarm"): str,
+            Optional("laser-rx-power-high-warning"): str,
+            Optional("laser-rx-power-low-warning"): str,
+            "laser-bias-current-high-alarm-threshold": str,
+            "laser-bias-current-low-alarm-threshold": str,
+            "laser-bias-current-high-warning-threshold": str,
+            "laser-bias-current-low-warning-threshold": str,
+            "laser-output-power-high-alarm-threshold": str,
+            "laser-output-power-low-alarm-threshold": str,
+            "laser-output-power-high-warning-threshold": str,
+            "laser-output-power-low-warning-threshold": str,
+            "module-temperature-high-alarm-threshold": str,
+            "module-temperature-low-alarm-threshold": str,
+            "module-temperature-high-warning-threshold": str,
+            "module-temperature-low-warning-threshold": str,
+            "module-voltage-high-alarm-threshold": str,
+            "module-voltage-low-alarm-threshold": str,
+            "module-voltage-high-warning-threshold": str,
+            "module-voltage-low-warning-threshold": str,
+            "laser-rx-power-high-alarm-threshold": str,
+            "laser-rx-power-low-alarm-threshold": str,
+            Optional("laser-rx-power-high-warning-threshold"): str,
+            Optional("laser-rx-power-low-warning-threshold"): str,
+            Optional("module-not-ready-alarm"): str,
+            Optional("module-low-power-alarm"): str,
+            Optional("module-initialization-incomplete-alarm"): str,
+            Optional("module-fault-alarm"): str,
+            Optional("pld-flash-initialization-fault-alarm"): str,
+            Optional("power-supply-fault-alarm"): str,
+            Optional("checksum-fault-alarm"): str,
+            Optional("tx-laser-disabled-alarm"): str,
+            Optional("tx-loss-of-signal-functionality-alarm"): str,
+            Optional("tx-cdr-loss-of-lock-alarm"): str,
+            Optional("rx-loss-of-signal-alarm"): str,
+            Optional("rx-cdr-loss-of-lock-alarm"): str,
+            Optional("laser-temperature-high-alarm-threshold"): str,
+            Optional("laser-temperature-low-alarm-threshold"): str,
+            Optional("laser-temperature-high-warning-threshold"): str,
+            Optional("laser-temperature-low-warning-threshold"): str,
+            Optional("lanes"): Use(validate_lanes)
+        }
+    }, 'Interface not a list')
 
     schema = {
         'interface-information': {
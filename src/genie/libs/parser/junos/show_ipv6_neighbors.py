@@ -12,6 +12,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 class ShowIpv6NeighborsSchema(MetaParser):
     """ Schema for:
             * show ipv6 neighbors
@@ -36,24 +39,15 @@ class ShowIpv6NeighborsSchema(MetaParser):
     }
 }"""
 
-    def validate_ipv6_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ipv6-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "ipv6-nd-expire": str,
-            "ipv6-nd-interface-name": str,
-            "ipv6-nd-isrouter": str,
-            "ipv6-nd-issecure": str,
-            "ipv6-nd-neighbor-address": str,
-            "ipv6-nd-neighbor-l2-address": str,
-            "ipv6-nd-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ipv6_entry_list = ListOfDict({
+        "ipv6-nd-expire": str,
+        "ipv6-nd-interface-name": str,
+        "ipv6-nd-isrouter": str,
+        "ipv6-nd-issecure": str,
+        "ipv6-nd-neighbor-address": str,
+        "ipv6-nd-neighbor-l2-address": str,
+        "ipv6-nd-state": str
+    }, 'ipv6-entry is not a list')
     
     # Main Schema
     schema = {
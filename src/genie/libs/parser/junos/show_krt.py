@@ -12,6 +12,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 class ShowKrtStateSchema(MetaParser):
 
     schema = {
@@ -276,18 +279,10 @@ class ShowKrtQueueSchema(MetaParser):
     }'''
 
     # Sub Schema
-    def validate_krt_queue_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        krt_queue_schema = Schema({
-                "krtq-queue-length": str,
-                "krtq-type": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            krt_queue_schema.validate(item)
-        return value
+    validate_krt_queue_list = ListOfDict({
+        "krtq-queue-length": str,
+        "krtq-type": str
+    }, 'ospf-interface is not a list')
 
     # Main Schema
     schema = {
@@ -16,26 +16,21 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 class ShowLDPSessionSchema(MetaParser):
     """ Schema for
         * show ldp session
     """
-    def validate_ldp_session(value):
-        if not isinstance(value, list):
-            raise SchemaError('LDP Session not a list')
-
-        ldp_session = Schema({
-            "ldp-neighbor-address": str,
-            "ldp-session-state": str,
-            "ldp-connection-state": str,
-            "ldp-remaining-time": str,
-            Optional("ldp-session-adv-mode"): str,
-        })
-
-        for item in value:
-            ldp_session.validate(item)
-        return value
+    validate_ldp_session = ListOfDict({
+        "ldp-neighbor-address": str,
+        "ldp-session-state": str,
+        "ldp-connection-state": str,
+        "ldp-remaining-time": str,
+        Optional("ldp-session-adv-mode"): str,
+    }, 'LDP Session not a list')
 
     schema = {
         "ldp-session-information": {
@@ -103,20 +98,12 @@ class ShowLdpNeighborSchema(MetaParser):
         }
     }'''
 
-    def validate_ldp_neighbor(value):
-        if not isinstance(value, list):
-            raise SchemaError('LDP neighbor is not a list')
-
-        ldp_neighbor = Schema({
-            "interface-name": str,
-            "ldp-label-space-id": str,
-            "ldp-neighbor-address": str,
-            "ldp-remaining-time": str
-        })
-
-        for item in value:
-            ldp_neighbor.validate(item)
-        return value
+    validate_ldp_neighbor = ListOfDict({
+        "interface-name": str,
+        "ldp-label-space-id": str,
+        "ldp-neighbor-address": str,
+        "ldp-remaining-time": str
+    }, 'LDP neighbor is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -193,18 +180,10 @@ class ShowLdpDatabaseSessionIpaddressSchema(MetaParser):
     }
 }'''
 
-    def validate_ldp_binding(value):
-        if not isinstance(value, list):
-            raise SchemaError('LDP binding is not a list')
-
-        ldp_binding = Schema({
-            "ldp-label": str,
-            "ldp-prefix": str
-        })
-
-        for item in value:
-            ldp_binding.validate(item)
-        return value
+    validate_ldp_binding = ListOfDict({
+        "ldp-label": str,
+        "ldp-prefix": str
+    }, 'LDP binding is not a list')
 
     def validate_ldp_database(value):
         if not isinstance(value, list):
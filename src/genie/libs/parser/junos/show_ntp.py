@@ -18,6 +18,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use
 # pyats
 from pyats.utils.exceptions import SchemaError
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 # ==============================================
 #  Schema for show ntp associations
@@ -385,18 +388,9 @@ class ShowConfigurationSystemNtpSet(ShowConfigurationSystemNtpSetSchema):
 class ShowConfigurationSystemNtpSchema(MetaParser):
     """Schema for: show configuration system ntp """
 
-    def validate_server_list(value):
-        # Pass server list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('server list is not a list')
-        # Create server list Schema
-        servers = Schema({
-            'name': str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            servers.validate(item)
-        return value
+    validate_server_list = ListOfDict({
+        'name': str,
+    }, 'server list is not a list')
 
     schema = {
         "configuration": {
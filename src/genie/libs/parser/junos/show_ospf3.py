@@ -23,6 +23,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 class ShowOspf3InterfaceSchema(MetaParser):
     '''schema = {
@@ -40,22 +43,14 @@ class ShowOspf3InterfaceSchema(MetaParser):
     }'''
 
     # Sub Schema
-    def validate_ospf3_interface_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_interface_schema = Schema({
-            "bdr-id": str,
-            "dr-id": str,
-            "interface-name": str,
-            "neighbor-count": str,
-            "ospf-area": str,
-            "ospf-interface-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_interface_schema.validate(item)
-        return value
+    validate_ospf3_interface_list = ListOfDict({
+        "bdr-id": str,
+        "dr-id": str,
+        "interface-name": str,
+        "neighbor-count": str,
+        "ospf-area": str,
+        "ospf-interface-state": str
+    }, 'ospf-interface is not a list')
 
     # Main Schema
     schema = {
@@ -137,34 +132,25 @@ class ShowOspf3NeighborExtensiveSchema(MetaParser):
         ]
     }
 }"""
-    def validate_ospf3_neighbor_extensive_list(value):
-        # Pass osp3_neighbor_extensive-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "activity-timer": str,
-            "bdr-id": str,
-            "dr-id": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            Optional("neighbor-adjacency-time"): {
-                "#text": str
-            },
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            Optional("neighbor-up-time"): {
-                "#text": str
-            },
-            "options": str,
-            "ospf-area": str,
-            "ospf-neighbor-state": str,
-            "ospf3-interface-index": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ospf3_neighbor_extensive_list = ListOfDict({
+        "activity-timer": str,
+        "bdr-id": str,
+        "dr-id": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        Optional("neighbor-adjacency-time"): {
+            "#text": str
+        },
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        Optional("neighbor-up-time"): {
+            "#text": str
+        },
+        "options": str,
+        "ospf-area": str,
+        "ospf-neighbor-state": str,
+        "ospf3-interface-index": str
+    }, 'ospf3-table-entry is not a list')
 
     # Main Schema
     schema = {
@@ -292,23 +278,14 @@ class ShowOspf3NeighborSchema(MetaParser):
         ]
    }
 }"""
-    def validate_ospf3_neighbor_list(value):
-        # Pass osp3_neighbor_detail-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "activity-timer": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            "ospf-neighbor-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ospf3_neighbor_list = ListOfDict({
+        "activity-timer": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        "ospf-neighbor-state": str
+    }, 'ospf3-table-entry is not a list')
 
     # Main Schema
     schema = {
@@ -455,35 +432,20 @@ class ShowOspf3DatabaseSchema(MetaParser):
         return value
 
     # Sub Schema ospf3-database
-    def validate_ospf3_database_list(value):
-        # Pass ospf3-database list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "sequence-number": str,
-            Optional('our-entry'): bool
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_database_schema.validate(item)
-        return value
+    validate_ospf3_database_list = ListOfDict({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "sequence-number": str,
+        Optional('our-entry'): bool
+    }, 'ospf-interface is not a list')
 
     # Sub Schema ospf3-intf-header
-    def validate_ospf3_intf_header_list(value):
-        # Pass ospf3-intf-header list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_intf_header_schema = Schema({"ospf-area": str, "ospf-intf": str})
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_intf_header_schema.validate(item)
-        return value
+    validate_ospf3_intf_header_list = ListOfDict(
+        {"ospf-area": str, "ospf-intf": str}, 'ospf-interface is not a list')
 
     # Main Schema
     schema = {
@@ -591,38 +553,30 @@ class ShowOspf3InterfaceExtensiveSchema(MetaParser):
     """
 
     # Sub Schema ospf3-interface
-    def validate_ospf3_interface_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-interface is not a list')
-        ospf3_interface_schema = Schema({
-            "adj-count": str,
-            "bdr-id": str,
-            "dead-interval": str,
-            "dr-id": str,
-            "hello-interval": str,
-            "interface-address": str,
-            "interface-cost": str,
-            "interface-name": str,
-            "interface-type": str,
-            "mtu": str,
-            "neighbor-count": str,
-            "ospf-area": str,
-            "ospf-interface-protection-type": str,
-            "ospf-interface-state": str,
-            "ospf-stub-type": str,
-            "ospf3-interface-index": str,
-            Optional("ospf3-router-lsa-id"): str,
-            "prefix-length": str,
-            "retransmit-interval": str,
-            Optional("router-priority"): str,
-            Optional("dr-address"): str,
-            Optional("br-address"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_interface_schema.validate(item)
-        return value
+    validate_ospf3_interface_list = ListOfDict({
+        "adj-count": str,
+        "bdr-id": str,
+        "dead-interval": str,
+        "dr-id": str,
+        "hello-interval": str,
+        "interface-address": str,
+        "interface-cost": str,
+        "interface-name": str,
+        "interface-type": str,
+        "mtu": str,
+        "neighbor-count": str,
+        "ospf-area": str,
+        "ospf-interface-protection-type": str,
+        "ospf-interface-state": str,
+        "ospf-stub-type": str,
+        "ospf3-interface-index": str,
+        Optional("ospf3-router-lsa-id"): str,
+        "prefix-length": str,
+        "retransmit-interval": str,
+        Optional("router-priority"): str,
+        Optional("dr-address"): str,
+        Optional("br-address"): str
+    }, 'ospf3-interface is not a list')
 
     schema = {
         "ospf3-interface-information": {
@@ -834,52 +788,44 @@ class ShowOspf3DatabaseExternalExtensiveSchema(MetaParser):
     """
 
     # Sub Schema
-    def validate_ospf3_database_list(value):
-        # Pass ospf3-database list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        ospf3_interface_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            Optional('our-entry'): bool,
-            "ospf-database-extensive": {
-                "aging-timer": {
-                    "#text": str
-                },
-                "expiration-time": {
-                    "#text": str
-                },
-                "installation-time": {
-                    "#text": str
-                },
-                Optional("generation-timer"): {
-                    "#text": str
-                },
-                "lsa-change-count": str,
-                "lsa-changed-time": {
-                    "#text": str
-                },
-                Optional("send-time"): {
-                    "#text": str
-                },
-                Optional("database-entry-state"): str
+    validate_ospf3_database_list = ListOfDict({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        Optional('our-entry'): bool,
+        "ospf-database-extensive": {
+            "aging-timer": {
+                "#text": str
             },
-            "ospf3-external-lsa": {
-                "metric": str,
-                "ospf3-prefix": str,
-                "ospf3-prefix-options": str,
-                "type-value": str
+            "expiration-time": {
+                "#text": str
             },
-            "sequence-number": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_interface_schema.validate(item)
-        return value
+            "installation-time": {
+                "#text": str
+            },
+            Optional("generation-timer"): {
+                "#text": str
+            },
+            "lsa-change-count": str,
+            "lsa-changed-time": {
+                "#text": str
+            },
+            Optional("send-time"): {
+                "#text": str
+            },
+            Optional("database-entry-state"): str
+        },
+        "ospf3-external-lsa": {
+            "metric": str,
+            "ospf3-prefix": str,
+            "ospf3-prefix-options": str,
+            "type-value": str
+        },
+        "sequence-number": str
+    }, 'ospf-interface is not a list')
 
     schema = {
         "ospf3-database-information": {
@@ -1453,40 +1399,26 @@ class ShowOspf3DatabaseExtensiveSchema(MetaParser):
     """
 
     # Sub Schema ospf3-link
-    def validate_ospf3_link_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("ospf3-link is not a list")
-        ospf3_link_schema = Schema({
-            "link-intf-id": str,
-            "link-metric": str,
-            "link-type-name": str,
-            "link-type-value": str,
-            "nbr-intf-id": str,
-            "nbr-rtr-id": str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_link_schema.validate(item)
-        return value
+    validate_ospf3_link_list = ListOfDict({
+        "link-intf-id": str,
+        "link-metric": str,
+        "link-type-name": str,
+        "link-type-value": str,
+        "nbr-intf-id": str,
+        "nbr-rtr-id": str,
+    }, 'ospf3-link is not a list')
 
     # Sub Schema ospf3-lsa-topology-link
-    def validate_ospf3_lsa_topology_link_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("ospf3-lsa-topology-link is not a list")
-        ospf3_lsa_topology_link_schema = Schema({
-            "link-type-name":
-            str,
-            "ospf-lsa-topology-link-metric":
-            str,
-            "ospf-lsa-topology-link-node-id":
-            str,
-            "ospf-lsa-topology-link-state":
-            str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_lsa_topology_link_schema.validate(item)
-        return value
+    validate_ospf3_lsa_topology_link_list = ListOfDict({
+        "link-type-name":
+        str,
+        "ospf-lsa-topology-link-metric":
+        str,
+        "ospf-lsa-topology-link-node-id":
+        str,
+        "ospf-lsa-topology-link-state":
+        str,
+    }, 'ospf3-lsa-topology-link is not a list')
 
     # Sub Schema ospf3-database
     def validate_ospf3_database_list(value):
@@ -1597,14 +1529,8 @@ class ShowOspf3DatabaseExtensiveSchema(MetaParser):
         return value
 
     # Sub Schema ospf3-intf-header
-    def validate_ospf3_intf_header_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("ospf3-intf-header is not a list")
-        ospf3_link_schema = Schema({"ospf-area": str, "ospf-intf": str})
-        # Validate each dictionary in list
-        for item in value:
-            ospf3_link_schema.validate(item)
-        return value
+    validate_ospf3_intf_header_list = ListOfDict(
+        {"ospf-area": str, "ospf-intf": str}, 'ospf3-intf-header is not a list')
 
     schema = {
         "ospf3-database-information": {
@@ -2171,18 +2097,12 @@ class ShowOspf3DatabaseNetworkDetailSchema(MetaParser):
             ]
         }
     } """
-    def validate_ospf_lsa_topology_innerlist(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf3 lsa is not a list')
-        ospf3_lsa_schema = Schema({
-            "link-type-name": str,
-            "ospf-lsa-topology-link-metric": str,
-            "ospf-lsa-topology-link-node-id": str,
-            "ospf-lsa-topology-link-state": str
-        })
-        for item in value:
-            ospf3_lsa_schema.validate(item)
-        return value
+    validate_ospf_lsa_topology_innerlist = ListOfDict({
+        "link-type-name": str,
+        "ospf-lsa-topology-link-metric": str,
+        "ospf-lsa-topology-link-node-id": str,
+        "ospf-lsa-topology-link-state": str
+    }, 'ospf3 lsa is not a list')
 
     def validate_ospf3_database_topology_list(value):
         if not isinstance(value, list):
@@ -2371,39 +2291,28 @@ class ShowOspf3DatabaseLinkAdvertisingRouterSchema(MetaParser):
             ]
         }
     } """
-    def validate_ospf3_intf_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf3 intf is not a list')
-        ospf3_intf_schema = Schema({"ospf-area": str, "ospf-intf": str})
-        for item in value:
-            ospf3_intf_schema.validate(item)
-        return value
-
-    def validate_ospf3_database_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-        ospf3_database_schema = Schema({
-            Optional("@heading"): str,
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "ospf3-link-lsa": {
-                "linklocal-address": str,
-                "ospf3-options": str,
-                Optional("ospf3-prefix"): str,
-                Optional("ospf3-prefix-options"): str,
-                "prefix-count": str,
-                "router-priority": str
-            },
-            Optional("our-entry"): bool,
-            "sequence-number": str
-        })
-        for item in value:
-            ospf3_database_schema.validate(item)
-        return value
+    validate_ospf3_intf_list = ListOfDict(
+        {"ospf-area": str, "ospf-intf": str}, 'ospf3 intf is not a list')
+
+    validate_ospf3_database_list = ListOfDict({
+        Optional("@heading"): str,
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "ospf3-link-lsa": {
+            "linklocal-address": str,
+            "ospf3-options": str,
+            Optional("ospf3-prefix"): str,
+            Optional("ospf3-prefix-options"): str,
+            "prefix-count": str,
+            "router-priority": str
+        },
+        Optional("our-entry"): bool,
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -2572,33 +2481,27 @@ class ShowOspf3RouteNetworkExtensiveSchema(MetaParser):
     }'''
 
 
-    def validate_ospf3_route_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route is not a list')
-        ospf3_route_schema = Schema({
-            "ospf3-route-entry": {
-                "address-prefix": str,
-                Optional("forward"): str,
-                "interface-cost": str,
-                "next-hop-type": str,
-                "ospf-area": str,
-                Optional("ospf-next-hop"): {
-                    Optional("next-hop-address"): {
-                                "interface-address": str
-                    },
-                    "next-hop-name": {
-                        "interface-name": str
-                    }
+    validate_ospf3_route_list = ListOfDict({
+        "ospf3-route-entry": {
+            "address-prefix": str,
+            Optional("forward"): str,
+            "interface-cost": str,
+            "next-hop-type": str,
+            "ospf-area": str,
+            Optional("ospf-next-hop"): {
+                Optional("next-hop-address"): {
+                            "interface-address": str
                 },
-                "route-origin": str,
-                "route-path-type": str,
-                "route-priority": str,
-                "route-type": str
+                "next-hop-name": {
+                    "interface-name": str
                 }
-        })
-        for item in value:
-            ospf3_route_schema.validate(item)
-        return value
+            },
+            "route-origin": str,
+            "route-path-type": str,
+            "route-priority": str,
+            "route-type": str
+            }
+    }, 'ospf-route is not a list')
 
 
     
@@ -2708,23 +2611,14 @@ class ShowOspf3NeighborInstanceAllSchema(MetaParser):
         }
     }"""
 
-    def validate_ospf3_neighbor_list(value):
-        # Pass osp3_neighbor_detail-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ospf3-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "activity-timer": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            "ospf-neighbor-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ospf3_neighbor_list = ListOfDict({
+        "activity-timer": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        "ospf-neighbor-state": str
+    }, 'ospf3-table-entry is not a list')
 
     # Main Schema
     schema = {
@@ -15,6 +15,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 class ShowPfeStatisticsTrafficSchema(MetaParser):
     """ Schema for:
@@ -841,14 +844,8 @@ class ShowPfeRouteSummarySchema(MetaParser):
     """ Schema for:
             * show pfe route summary
     """
-    def validate_route_table_data(value):
-        if not isinstance(value, list):
-            raise SchemaError('validate_route_table_data is not a list')
-        entry_schema = Schema({'index': str, 'routes': str, 'size': str})
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_route_table_data = ListOfDict(
+        {'index': str, 'routes': str, 'size': str}, 'validate_route_table_data is not a list')
 
     schema = {
         'slot': {
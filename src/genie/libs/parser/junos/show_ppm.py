@@ -13,6 +13,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, \
                     Optional, Use
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 # ===========================
 # Schema for:
@@ -39,32 +42,24 @@ class ShowPPMTransmissionsProtocolBfdDetailSchema(MetaParser):
     }
     '''
 
-    def validate_transmission_data(value):
-        if not isinstance(value, list):
-            raise SchemaError('transmission data is not a list')
-
-        transmission_data = Schema({
-            "protocol": str,
-            Optional("transmission-count"): str,
-            Optional("transmission-delay-difference"): str,
-            Optional("transmission-delayed"): str,
-            Optional("transmission-delayed-count"): str,
-            "transmission-destination": str,
-            "transmission-distributed": str,
-            Optional("transmission-host"): str,
-            "transmission-interface-index": str,
-            "transmission-interval": str,
-            Optional("transmission-interval-threshold"): str,
-            Optional("transmission-jitter"): str,
-            Optional("transmission-largest-difference"): str,
-            Optional("transmission-last-interval"): str,
-            Optional("transmission-pfe-addr"): str,
-            Optional("transmission-pfe-handle"): str
-        })
-
-        for item in value:
-            transmission_data.validate(item)
-        return value
+    validate_transmission_data = ListOfDict({
+        "protocol": str,
+        Optional("transmission-count"): str,
+        Optional("transmission-delay-difference"): str,
+        Optional("transmission-delayed"): str,
+        Optional("transmission-delayed-count"): str,
+        "transmission-destination": str,
+        "transmission-distributed": str,
+        Optional("transmission-host"): str,
+        "transmission-interface-index": str,
+        "transmission-interval": str,
+        Optional("transmission-interval-threshold"): str,
+        Optional("transmission-jitter"): str,
+        Optional("transmission-largest-difference"): str,
+        Optional("transmission-last-interval"): str,
+        Optional("transmission-pfe-addr"): str,
+        Optional("transmission-pfe-handle"): str
+    }, 'transmission data is not a list')
 
     schema = {
         "ppm-transmissions": {
@@ -29,6 +29,11 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+
+# import parser utils
+from genie.libs.parser.utils.patterns import PatternScanner
+from genie.libs.parser.utils.schema import ListOfDict
+from genie.libs.parser.utils.stream import RecordStream, StreamParser
 '''
 Schema for:
     * show route table {table}
@@ -294,82 +299,52 @@ class ShowRouteSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt list is not a list')
-            
-            def validate_nh_list(value):
-                # Pass nh list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('nh list is not a list')
-                # Create nh-list Entry Schema
-                nh_schema = Schema({
-                            Optional("mpls-label"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("nh-local-interface"): str,
-                            Optional("nh-table"): str,
-                            Optional("to"): str,
-                            Optional("via"): str
-                        })
-                # Validate each dictionary in list
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-
-            # Create rt-list Entry Schema
-            rt_schema = Schema({
-                    Optional("@junos:style"): str,
-                    Optional("rt-destination"): str,
-                    "rt-entry": {
-                        Optional("active-tag"): str,
-                        "age": {
-                            "#text": str,
-                            Optional("@junos:seconds"): str
-                        },
-                        Optional('as-path'): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        Optional("learned-from"): str,
-                        Optional("local-preference"): str,
-                        Optional("peer-id"): str,
-                        Optional("med"): str,
-                        Optional("metric"): str,
-                        Optional("metric2"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional('nh-type'): str,
-                        "preference": str,
-                        Optional("preference2"): str,
-                        "protocol-name": str,
-                        Optional('rt-tag'): str,
-                        Optional("validation-state"): str
-                    }
-                })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-
-        # Create RouteEntry Schema
-        route_entry_schema = Schema({
-                "active-route-count": str,
-                "destination-count": str,
-                "hidden-route-count": str,
-                "holddown-route-count": str,
-                Optional("rt"): Use(validate_rt_list),
-                "table-name": str,
-                "total-route-count": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            route_entry_schema.validate(item)
-        return value
+    validate_nh_list = ListOfDict({
+        Optional("mpls-label"): str,
+        Optional("selected-next-hop"): str,
+        Optional("nh-local-interface"): str,
+        Optional("nh-table"): str,
+        Optional("to"): str,
+        Optional("via"): str
+    }, 'nh list is not a list')
+
+    validate_rt_list = ListOfDict({
+        Optional("@junos:style"): str,
+        Optional("rt-destination"): str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "age": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            Optional('as-path'): str,
+            Optional("current-active"): str,
+            Optional("last-active"): str,
+            Optional("learned-from"): str,
+            Optional("local-preference"): str,
+            Optional("peer-id"): str,
+            Optional("med"): str,
+            Optional("metric"): str,
+            Optional("metric2"): str,
+            Optional("nh"): Use(validate_nh_list),
+            Optional('nh-type'): str,
+            "preference": str,
+            Optional("preference2"): str,
+            "protocol-name": str,
+            Optional('rt-tag'): str,
+            Optional("validation-state"): str
+        }
+    }, 'rt list is not a list')
+
+    validate_route_table_list = ListOfDict({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -380,7 +355,47 @@ class ShowRouteSchema(MetaParser):
         }
     }
 
-class ShowRoute(ShowRouteSchema):
+# Lines of ShowRoute, scanned in a single pass
+_show_route_lines = PatternScanner()
+
+# inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
+_show_route_lines.add('p1', r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                            r'destinations, +(?P<total_route_count>\d+) +routes +'
+                            r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
+                            r'holddown, +(?P<hidden>\d+) +hidden\)$')
+
+# 10.220.0.0/16      *[BGP/170] 3w3d 03:12:24, MED 12003, localpref 120, from 10.169.14.240
+# 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
+# *[OSPF3/10] 3w1d 17:03:23, metric 5
+# 0.0.0.0/0          *[OSPF/150/10] 3w3d 03:24:58, metric 101, tag 0
+# 167963             *[LDP/9] 1w6d 20:41:01, metric 1, metric2 100, tag 65000500
+# 10.16.2.2/32         *[Static/5] 00:00:02
+_show_route_lines.add('p2', r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?(, +localpref +(?P<local_preference>\d+))?(, +from +(?P<learned_from>\S+))?$')
+
+# MultiRecv
+_show_route_lines.add('p2_1', r'^(?P<nh_type>MultiRecv)$')
+
+# >  to 10.169.14.121 via ge-0/0/1.0
+_show_route_lines.add('p3', r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
+                            r'(, +(?P<mpls_label>[\S\s]+))?$')
+
+# Local via fxp0.0
+_show_route_lines.add('p3_1', r'^Local +via +(?P<nh_local_interface>\S+)$')
+
+# AS path: (65151 65000) I, validation-state: unverified
+# AS path: I
+# AS path: 3 4 I, validation-state: unverified
+_show_route_lines.add('p4', r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
+                            r'(, validation-state: +(?P<validation_state>\S+))?$')
+
+# to table inet.0
+_show_route_lines.add('p5', r'^to +table +(?P<nh_table>\S+)$')
+
+# 2001:db8:eb18:ca45::1/128
+_show_route_lines.add('pIP', r'^(?P<rt_destination>[\w:\/]+)$')
+
+
+class ShowRoute(ShowRouteSchema, StreamParser):
     """ Parser for:
             * show route
             * show route {ip_address}
@@ -395,6 +410,12 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
+    # A destination starts on its prefix, alone or followed by its first
+    # route, under its routing table
+    record_stream = RecordStream(
+        record=r'^\s*(\S+ +[\*\+\-]?\[[\w\-]+\/\d+|(?!MultiRecv$)[\w:\/]+$)',
+        context=[r'^\s*\S+: +\d+ +destinations, '])
+
     def cli(self, protocol=None, ip_address=None, table=None, output=None):
         if not output:
             if protocol and table:
@@ -426,49 +447,10 @@ class ShowRoute(ShowRouteSchema):
         rt_destination = None
 
 
-        # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                r'destinations, +(?P<total_route_count>\d+) +routes +'
-                r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
-                r'holddown, +(?P<hidden>\d+) +hidden\)$')
-        
-        # 10.220.0.0/16      *[BGP/170] 3w3d 03:12:24, MED 12003, localpref 120, from 10.169.14.240
-        # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
-        # *[OSPF3/10] 3w1d 17:03:23, metric 5
-        # 0.0.0.0/0          *[OSPF/150/10] 3w3d 03:24:58, metric 101, tag 0
-        # 167963             *[LDP/9] 1w6d 20:41:01, metric 1, metric2 100, tag 65000500
-        # 10.16.2.2/32         *[Static/5] 00:00:02
-        p2 = re.compile(r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?(, +localpref +(?P<local_preference>\d+))?(, +from +(?P<learned_from>\S+))?$')
-
-        # MultiRecv
-        p2_1 = re.compile(r'^(?P<nh_type>MultiRecv)$')
-        
-        # >  to 10.169.14.121 via ge-0/0/1.0
-        p3 = re.compile(r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
-                        r'(, +(?P<mpls_label>[\S\s]+))?$')
-        
-        # Local via fxp0.0
-        p3_1 = re.compile(r'^Local +via +(?P<nh_local_interface>\S+)$')
-
-        # AS path: (65151 65000) I, validation-state: unverified
-        # AS path: I
-        # AS path: 3 4 I, validation-state: unverified
-        p4 = re.compile(r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
-                        r'(, validation-state: +(?P<validation_state>\S+))?$')
-        
-        # to table inet.0
-        p5 = re.compile(r'^to +table +(?P<nh_table>\S+)$')
-
-        # 2001:db8:eb18:ca45::1/128
-        pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
-
-        for line in out.splitlines():
-            line = line.strip()
+        for rule, group in _show_route_lines.finditer(out):
 
             # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p1':
                 table_name = group['table_name']
                 destination_count = group['destination_count']
                 total_route_count = group['total_route_count']
@@ -489,9 +471,7 @@ class ShowRoute(ShowRouteSchema):
             
             # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
             # *[OSPF3/10] 3w1d 17:03:23, metric 5
-            m = p2.match(line) 
-            if m:
-                group = m.groupdict()
+            if rule == 'p2':
                 if not rt_destination:
                     rt_destination = group['rt_destination']
                 active_tag = group['active_tag']
@@ -535,16 +515,12 @@ class ShowRoute(ShowRouteSchema):
                 rt_destination = None
                 continue
             
-            m = p2_1.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p2_1':
                 rt_entry_dict.update({'nh-type': group['nh_type']})
                 continue
 
             # >  to 10.169.14.121 via ge-0/0/1.0
-            m = p3.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p3':
                 nh_list = rt_entry_dict.setdefault('nh', [])
                 nh_dict = {}
                 nh_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
@@ -552,9 +528,7 @@ class ShowRoute(ShowRouteSchema):
                 continue
 
             # Local via fxp0.0
-            m = p3_1.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p3_1':
                 nh_list = rt_entry_dict.setdefault('nh', [])
                 nh_dict = {}
                 nh_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
@@ -563,16 +537,12 @@ class ShowRoute(ShowRouteSchema):
             
             # AS path: (65151 65000) I, validation-state: unverified
             # AS path: I
-            m = p4.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p4':
                 rt_entry_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
                 continue
             
             # to table inet.0
-            m = p5.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'p5':
                 nh_list = rt_entry_dict.setdefault('nh', [])
                 nh_dict = {}
                 nh_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
@@ -580,9 +550,7 @@ class ShowRoute(ShowRouteSchema):
                 continue
 
             # 2001:db8:eb18:ca45::1/128
-            m = pIP.match(line)
-            if m:
-                group = m.groupdict()
+            if rule == 'pIP':
                 rt_destination = group['rt_destination']
                 continue
         return ret_dict
@@ -714,181 +682,128 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            def validate_rt_entry_list(value):
-                if isinstance(value, dict):
-                    value = [value]
-                if not isinstance(value, list):
-                    raise SchemaError('rt-entry is not a list')
-                def validate_nh_list(value):
-                    # Pass nh list of dict in value
-                    if not isinstance(value, list):
-                        raise SchemaError('nh is not a list')
-                    nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("label-element"): str,
-                        Optional("label-element-childcount"): str,
-                        Optional("label-element-lspid"): str,
-                        Optional("label-element-parent"): str,
-                        Optional("label-element-refcount"): str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh-string"): str,
-                        Optional("selected-next-hop"): str,
-                        Optional("session"): str,
-                        Optional("to"): str,
-                        Optional("via"): str,
-                        Optional("weight"): str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        nh_schema.validate(item)
-                    return value
-                def validate_protocol_nh_list(value):
-                    # Pass nh list of dict in value
-                    if isinstance(value, dict):
-                        value = [value]
-                    if not isinstance(value, list):
-                        raise SchemaError('protocol-nh is not a list')
-                    def validate_nh_list(value):
-                        # Pass nh list of dict in value
-                        if isinstance(value, dict):
-                            value = [value]
-                        if not isinstance(value, list):
-                            raise SchemaError('nh is not a list')
-                        nh_schema = Schema({
-                            Optional("@junos:indent"): str,
-                            Optional("label-element"): str,
-                            Optional("label-element-childcount"): str,
-                            Optional("label-element-lspid"): str,
-                            Optional("label-element-parent"): str,
-                            Optional("label-element-refcount"): str,
-                            Optional("label-ttl-action"): str,
-                            Optional("load-balance-label"): str,
-                            Optional("mpls-label"): str,
-                            Optional("nh-string"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("session"): str,
-                            Optional("to"): str,
-                            Optional("via"): str,
-                            Optional("weight"): str
-                        })
-                        # Validate each dictionary in list
-                        for item in value:
-                            nh_schema.validate(item)
-                        return value
-                    protocol_nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("forwarding-nh-count"): str,
-                        "indirect-nh": str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("metric"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional("nh-index"): str,
-                        Optional("nh-type"): str,
-                        Optional("output"): str,
-                        "to": str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        protocol_nh_schema.validate(item)
-                    return value
-                rt_entry_schema = Schema({
-                    Optional("accepted"): str,
-                    Optional("active-tag"): str,
-                    Optional("age"): {
-                        "#text": str,
-                        Optional("@junos:seconds"): str
-                    },
-                    Optional("announce-bits"): str,
-                    Optional("announce-tasks"): str,
-                    Optional("as-path"): str,
-                    Optional("cluster-list"): str,
-                    Optional("bgp-rt-flag"): str,
-                    Optional("bgp-path-attributes"): {
-                        "attr-as-path-effective": {
-                            "aspath-effective-string": str,
-                            "attr-value": str
-                        }
-                    },
-                    Optional("current-active"): str,
-                    Optional("inactive-reason"): str,
-                    Optional("last-active"): str,
-                    Optional("local-as"): str,
-                    Optional("local-preference"): str,
-                    Optional("peer-as"): str,
-                    Optional("metric"): str,
-                    Optional("metric2"): str,
-                    Optional("nh"): Use(validate_nh_list),
-                    Optional("nh-address"): str,
-                    Optional("nh-index"): str,
-                    Optional("nh-kernel-id"): str,
-                    Optional("nh-reference-count"): str,
-                    Optional("gateway"): str,
-                    Optional("nh-type"): str,
-                    Optional("preference"): str,
-                    Optional("preference2"): str,
-                    Optional("protocol-name"): str,
-                    Optional("protocol-nh"): Use(validate_protocol_nh_list),
-                    Optional("rt-entry-state"): str,
-                    Optional("rt-ospf-area"): str,
-                    Optional("rt-tag"): str,
-                    Optional("peer-id"): str,
-                    Optional("task-name"): str,
-                    Optional("validation-state"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    rt_entry_schema.validate(item)
-                return value
-
-            # Create rt Schema
-            rt_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-announced-count": str,
-                "rt-destination": str,
-                Optional("rt-entry"): Use(validate_rt_entry_list),
-                "rt-entry-count": {
-                    "#text": str,
-                    Optional("@junos:format"): str
-                },
-                Optional("rt-prefix-length"): str,
-                Optional("rt-state"): str,
-                Optional("tsi"): {
-                    "#text": str,
-                    Optional("@junos:indent"): str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_nh_list = ListOfDict({
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        Optional("nh-string"): str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        Optional("via"): str,
+        Optional("weight"): str
+    }, 'nh is not a list')
+
+    validate_protocol_nh_nh_list = ListOfDict({
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        Optional("nh-string"): str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        Optional("via"): str,
+        Optional("weight"): str
+    }, 'nh is not a list', dict_as_list=True)
+
+    validate_protocol_nh_list = ListOfDict({
+        Optional("@junos:indent"): str,
+        Optional("forwarding-nh-count"): str,
+        "indirect-nh": str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("metric"): str,
+        Optional("mpls-label"): str,
+        Optional("nh"): Use(validate_protocol_nh_nh_list),
+        Optional("nh-index"): str,
+        Optional("nh-type"): str,
+        Optional("output"): str,
+        "to": str
+    }, 'protocol-nh is not a list', dict_as_list=True)
+
+    validate_rt_entry_list = ListOfDict({
+        Optional("accepted"): str,
+        Optional("active-tag"): str,
+        Optional("age"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("announce-bits"): str,
+        Optional("announce-tasks"): str,
+        Optional("as-path"): str,
+        Optional("cluster-list"): str,
+        Optional("bgp-rt-flag"): str,
+        Optional("bgp-path-attributes"): {
+            "attr-as-path-effective": {
+                "aspath-effective-string": str,
+                "attr-value": str
+            }
+        },
+        Optional("current-active"): str,
+        Optional("inactive-reason"): str,
+        Optional("last-active"): str,
+        Optional("local-as"): str,
+        Optional("local-preference"): str,
+        Optional("peer-as"): str,
+        Optional("metric"): str,
+        Optional("metric2"): str,
+        Optional("nh"): Use(validate_nh_list),
+        Optional("nh-address"): str,
+        Optional("nh-index"): str,
+        Optional("nh-kernel-id"): str,
+        Optional("nh-reference-count"): str,
+        Optional("gateway"): str,
+        Optional("nh-type"): str,
+        Optional("preference"): str,
+        Optional("preference2"): str,
+        Optional("protocol-name"): str,
+        Optional("protocol-nh"): Use(validate_protocol_nh_list),
+        Optional("rt-entry-state"): str,
+        Optional("rt-ospf-area"): str,
+        Optional("rt-tag"): str,
+        Optional("peer-id"): str,
+        Optional("task-name"): str,
+        Optional("validation-state"): str
+    }, 'rt-entry is not a list', dict_as_list=True)
+
+    validate_rt_list = ListOfDict({
+        Optional("@junos:style"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): Use(validate_rt_entry_list),
+        "rt-entry-count": {
+            "#text": str,
+            Optional("@junos:format"): str
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,
+        Optional("tsi"): {
+            "#text": str,
+            Optional("@junos:indent"): str
+        }
+    }, 'rt is not a list')
+
+    validate_route_table_list = ListOfDict({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -1598,34 +1513,17 @@ class ShowRouteForwardingTableSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_route_table_summary_list(value):
-            # Pass route-table-summary list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('route-table-summary is not a list')
-            # Create route-table-summary Schema
-            route_table_summary_schema = Schema({
-                "route-count": str,
-                "route-table-type": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                route_table_summary_schema.validate(item)
-            return value
-        # Create route-table-summary Schema
-        route_table_schema = Schema({
-            "address-family": str,
-            Optional("enabled-protocols"): str,
-            "route-table-summary": Use(validate_route_table_summary_list),
-            "table-name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_route_table_summary_list = ListOfDict({
+        "route-count": str,
+        "route-table-type": str
+    }, 'route-table-summary is not a list')
+
+    validate_route_table_list = ListOfDict({
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "route-table-summary": Use(validate_route_table_summary_list),
+        "table-name": str
+    }, 'route-table is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -1739,49 +1637,30 @@ class ShowRouteReceiveProtocolSchema(MetaParser):
         }
     """
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-destination": str,
-                "rt-entry": {
-                    Optional("active-tag"): str,
-                    "as-path": str,
-                    Optional("local-preference"): str,
-                    Optional("med"): str,
-                    "nh": {
-                        "to": str
-                    },
-                    "protocol-name": str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-
-        # Create route-table entry Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_rt_list = ListOfDict({
+        Optional("@junos:style"): str,
+        "rt-destination": str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "as-path": str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            "nh": {
+                "to": str
+            },
+            "protocol-name": str
+        }
+    }, 'rt is not a list')
+
+    validate_route_table_list = ListOfDict({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
     
     # Main Schema
     schema = {
@@ -1937,30 +1816,21 @@ class ShowRouteAdvertisingProtocolSchema(MetaParser):
         }
     """
 
-    def validate_rt_list(value):
-        # Pass rt list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('rt is not a list')
-        # Create rt entry Schema
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "rt-destination": str,
-            "rt-entry": {
-                Optional("active-tag"): str,
-                "as-path": str,
-                "bgp-metric-flags": str,
-                Optional("local-preference"): str,
-                Optional("med"): str,
-                "nh": {
-                    "to": str
-                },
-                "protocol-name": str
-            }
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = ListOfDict({
+        Optional("@junos:style"): str,
+        "rt-destination": str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "as-path": str,
+            "bgp-metric-flags": str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            "nh": {
+                "to": str
+            },
+            "protocol-name": str
+        }
+    }, 'rt is not a list')
     
     # Main schema
     schema = {
@@ -2122,38 +1992,21 @@ class ShowRouteSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_protocols_list(value):
-            # Pass protocols list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('protocols is not a list')
-            # Create protocols Schema
-            protocols_schema = Schema({
-                "active-route-count": str,
-                "protocol-name": str,
-                "protocol-route-count": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                protocols_schema.validate(item)
-            return value
-        # Create route-table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            "protocols": Use(validate_protocols_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_protocols_list = ListOfDict({
+        "active-route-count": str,
+        "protocol-name": str,
+        "protocol-route-count": str
+    }, 'protocols is not a list')
+
+    validate_route_table_list = ListOfDict({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        "protocols": Use(validate_protocols_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -2272,45 +2125,26 @@ class ShowRouteInstanceDetailSchema(MetaParser):
     #     }
     # }
 
-    def validate_instance_core_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('instance-core is not a list')
-        def validate_instance_rib_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('instance-rib is not a list')
-            instance_rib_schema = Schema({
-                        "irib-active-count": str,
-                        "irib-hidden-count": str,
-                        "irib-holddown-count": str,
-                        "irib-name": str,
-                        "irib-route-count": str
-                    })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        def validate_interface_name_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('interface-name is not a list')
-            instance_rib_schema = Schema({
-                    "interface-name": str
-                })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        instance_core_schema = Schema({
-            Optional("instance-interface"): Use(validate_interface_name_list),
-            "instance-name": str,
-            Optional("instance-rib"): Use(validate_instance_rib_list),
-            Optional("instance-state"): str,
-            Optional("instance-type"): str,
-            Optional("router-id"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            instance_core_schema.validate(item)
-        return value
+    validate_instance_rib_list = ListOfDict({
+        "irib-active-count": str,
+        "irib-hidden-count": str,
+        "irib-holddown-count": str,
+        "irib-name": str,
+        "irib-route-count": str
+    }, 'instance-rib is not a list')
+
+    validate_interface_name_list = ListOfDict({
+        "interface-name": str
+    }, 'interface-name is not a list')
+
+    validate_instance_core_list = ListOfDict({
+        Optional("instance-interface"): Use(validate_interface_name_list),
+        "instance-name": str,
+        Optional("instance-rib"): Use(validate_instance_rib_list),
+        Optional("instance-state"): str,
+        Optional("instance-type"): str,
+        Optional("router-id"): str
+    }, 'instance-core is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -2456,43 +2290,35 @@ class ShowRouteAdvertisingProtocolDetailSchema(MetaParser):
     #     },
     # }
 
-    def validate_rt_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('protocol information is not a list')
-
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "table-name": str,
-            "destination-count": str,
-            "total-route-count": str,
-            "active-route-count": str,
-            "holddown-route-count": str,
-            "hidden-route-count": str,
-            "rt-entry": {
-                Optional('active-tag'): str,
-                "rt-destination": str,
-                "rt-prefix-length": str,
-                "rt-entry-count": str,
-                "rt-announced-count": str,
-                Optional('route-label'): str,
-                Optional("bgp-group"): {
-                    "bgp-group-name": str,
-                    "bgp-group-type": str,
-                },
-                "nh": {
-                    "to": str,
-                },
-                Optional("med"): str,
-                Optional("local-preference"): str,
-                'as-path': str,
-                Optional("communities"): str,
-                Optional("flags"): str,
-            }
-        })
-
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = ListOfDict({
+        Optional("@junos:style"): str,
+        "table-name": str,
+        "destination-count": str,
+        "total-route-count": str,
+        "active-route-count": str,
+        "holddown-route-count": str,
+        "hidden-route-count": str,
+        "rt-entry": {
+            Optional('active-tag'): str,
+            "rt-destination": str,
+            "rt-prefix-length": str,
+            "rt-entry-count": str,
+            "rt-announced-count": str,
+            Optional('route-label'): str,
+            Optional("bgp-group"): {
+                "bgp-group-name": str,
+                "bgp-group-type": str,
+            },
+            "nh": {
+                "to": str,
+            },
+            Optional("med"): str,
+            Optional("local-preference"): str,
+            'as-path': str,
+            Optional("communities"): str,
+            Optional("flags"): str,
+        }
+    }, 'protocol information is not a list')
 
     # Main schema
     schema = {
@@ -2649,43 +2475,26 @@ class ShowRouteForwardingTableLabelSchema(MetaParser):
     """
 
 
-    def validate_rt_table_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('Route table is not a list')
-
-        def validate_rt_entry_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('Route entry is not a list')
-
-            rt_entry = Schema({
-                                "rt-destination": str,
-                                "destination-type": str,
-                                "route-reference-count": str,
-                                "nh":{
-                                    Optional("to"): str,
-                                    "nh-type": str,
-                                    "nh-index": str,
-                                    "nh-reference-count": str,
-                                    Optional("nh-lb-label"): str,
-                                    Optional("via"): str,
-                                }
-                            })
-            
-            for item in value:
-                rt_entry.validate(item)
-            return value
-
-
-        rt_table = Schema({
-                        "table-name": str,
-                        "address-family": str,
-                        Optional("enabled-protocols"): str,
-                        "rt-entry": Use(validate_rt_entry_list)
-                    })
+    validate_rt_entry_list = ListOfDict({
+        "rt-destination": str,
+        "destination-type": str,
+        "route-reference-count": str,
+        "nh":{
+            Optional("to"): str,
+            "nh-type": str,
+            "nh-index": str,
+            "nh-reference-count": str,
+            Optional("nh-lb-label"): str,
+            Optional("via"): str,
+        }
+    }, 'Route entry is not a list')
 
-        for item in value:
-            rt_table.validate(item)
-        return value
+    validate_rt_table_list = ListOfDict({
+        "table-name": str,
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "rt-entry": Use(validate_rt_entry_list)
+    }, 'Route table is not a list')
 
     # Main schema
     schema = {
@@ -2784,56 +2593,32 @@ class ShowRouteTableLabelSwitchedNameSchema(MetaParser):
         * show route table {table} label-switched-path {name}
     """
 
-    def validate_rt_schema(value):
-        if not isinstance(value, list):
-            raise SchemaError('rt schema is not a list')
-
-        def validate_rt_entry_schema(value):
-            if not isinstance(value, list):
-                raise SchemaError('rt entry schema is not a list')
+    validate_nh_schema = ListOfDict({
+        Optional("selected-next-hop"): bool,
+        "to": str,
+        "via": str,
+        "lsp-name": str,
+    }, 'nh schema is not a list')
+
+    validate_rt_entry_schema = ListOfDict({
+        Optional("active-tag"): str,
+        Optional("current-active"): str,
+        Optional("last-active"): str,
+        "protocol-name": str,
+        "preference": str,
+        "preference2": str,
+        "age": {
+            '#text': str,
+            Optional('@junos:seconds'): str,
+        },
+        "metric": str,
+        "nh": Use(validate_nh_schema)
+    }, 'rt entry schema is not a list')
 
-            def validate_nh_schema(value):
-                if not isinstance(value, list):
-                    raise SchemaError('nh schema is not a list')
-            
-                nh_schema = Schema({
-                            Optional("selected-next-hop"): bool,
-                            "to": str,
-                            "via": str,
-                            "lsp-name": str,
-                        })
-            
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-        
-            rt_entry_schema = Schema({
-                        Optional("active-tag"): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        "protocol-name": str,
-                        "preference": str,
-                        "preference2": str,
-                        "age": {
-                            '#text': str,
-                            Optional('@junos:seconds'): str,
-                        },
-                        "metric": str,
-                        "nh": Use(validate_nh_schema)
-                    })
-        
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-    
-        rt_schema = Schema({
-                    "rt-destination": str,
-                    "rt-entry": Use(validate_rt_entry_schema)
-                })
-    
-        for item in value:
-            rt_schema.validate(item)
-        return value
+    validate_rt_schema = ListOfDict({
+        "rt-destination": str,
+        "rt-entry": Use(validate_rt_entry_schema)
+    }, 'rt schema is not a list')
 
     schema = {
             "route-information": {
@@ -3325,49 +3110,39 @@ class ShowRouteReceiveProtocolExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} {target_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): {
-                    Optional("@junos:style"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("active-tag"): str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
+    validate_route_table_list = ListOfDict({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): {
+                Optional("@junos:style"): str,
+                "rt-announced-count": str,
+                "rt-destination": str,
+                Optional("active-tag"): str,
+                Optional("rt-entry"): {
+                    Optional("as-path"): str,
+                    Optional("bgp-rt-flag"): str,
+                    Optional("bgp-path-attributes"): {
+                        "attr-as-path-effective": {
+                            "aspath-effective-string": str,
+                            "attr-value": str
                         }
                     },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,
+                    Optional("local-preference"): str,
+                    Optional("nh"): {
+                        'to': str,
+                    }
                 },
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+                "rt-entry-count": {
+                    "#text": str,
+                },
+                Optional("rt-prefix-length"): str,
+                Optional("rt-state"): str,
+            },
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -3501,59 +3276,41 @@ class ShowRouteReceiveProtocolPeerAddressExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value): 
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema(
-                    {Optional("@junos:style"): str,
-                    Optional("active-tag"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
-                        }
-                    },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,}
-            )
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_rt_list = ListOfDict({
+        Optional("@junos:style"): str,
+        Optional("active-tag"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): {
+            Optional("as-path"): str,
+            Optional("bgp-rt-flag"): str,
+            Optional("bgp-path-attributes"): {
+                "attr-as-path-effective": {
+                    "aspath-effective-string": str,
+                    "attr-value": str
+                }
+            },
+            Optional("local-preference"): str,
+            Optional("nh"): {
+                'to': str,
+            }
+        },
+        "rt-entry-count": {
+            "#text": str,
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,
+    }, 'rt is not a list')
+
+    validate_route_table_list = ListOfDict({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -3690,20 +3447,12 @@ class ShowRouteInstanceNameSchema(MetaParser):
             * show route instance {name}
     """
     
-    def validate_instance_rib(value):
-        if not isinstance(value, list):
-            raise SchemaError('Instance rib is not a list')
-    
-        instance_rib = Schema({
-            "irib-name": str,
-            "irib-active-count": str,
-            "irib-holddown-count": str,
-            "irib-hidden-count": str,
-        })
-    
-        for item in value:
-            instance_rib.validate(item)
-        return value
+    validate_instance_rib = ListOfDict({
+        "irib-name": str,
+        "irib-active-count": str,
+        "irib-holddown-count": str,
+        "irib-hidden-count": str,
+    }, 'Instance rib is not a list')
 
     # Main Schema
     schema = {
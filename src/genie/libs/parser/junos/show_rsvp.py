@@ -13,30 +13,25 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 class ShowRSVPNeighborSchema(MetaParser):
     """ Schema for:
         * show rsvp neighbor
     """
 
-    def validate_neighbor_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('RSVP Neighbor not a list')
-
-        rsvp_neighbor_list = Schema({
-                "rsvp-neighbor-address": str,
-                "neighbor-idle": str,
-                "neighbor-up-count": str,
-                "neighbor-down-count": str,
-                "last-changed-time": str,
-                "hello-interval": str,
-                "hellos-sent": str,
-                "hellos-received": str,
-                "messages-received": str,
-            })
-
-        for item in value:
-            rsvp_neighbor_list.validate(item)
-        return value
+    validate_neighbor_list = ListOfDict({
+        "rsvp-neighbor-address": str,
+        "neighbor-idle": str,
+        "neighbor-up-count": str,
+        "neighbor-down-count": str,
+        "last-changed-time": str,
+        "hello-interval": str,
+        "hellos-sent": str,
+        "hellos-received": str,
+        "messages-received": str,
+    }, 'RSVP Neighbor not a list')
 
     schema = {
             "rsvp-neighbor-information": {
@@ -105,41 +100,33 @@ class ShowRSVPNeighborDetailSchema(MetaParser):
         * show rsvp neighbor detail
     """
 
-    def validate_neighbor_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('RSVP Neighbor not a list')
-
-        rsvp_neighbor_list = Schema({
-                    "rsvp-neighbor-address": str,
-                    Optional("rsvp-neighbor-interface"): str,
-                    "rsvp-neighbor-status": str,
-                    Optional("rsvp-neighbor-node"): bool,
-                    "last-changed-time": str,
-                    "neighbor-idle": str,
-                    "neighbor-up-count": str,
-                    "neighbor-down-count": str,
-                    "messages-received": str,
-                    "hello-interval": str,
-                    "hellos-sent": str,
-                    "hellos-received": str,
-                    "rsvp-neighbor-remote-instance": str,
-                    "rsvp-neighbor-local-instance": str,
-                    Optional("rsvp-refresh-reduct-status"): str,
-                    Optional("rsvp-refresh-reduct-remote-status"): str,
-                    Optional("rsvp-refresh-reduct-ack-status"): str,
-                    Optional("rsvp-nbr-enh-local-protection"): {
-                        Optional("rsvp-nbr-enh-lp-status"): str,
-                        Optional("rsvp-nbr-enh-lp-total-lsp-count"): str,
-                        Optional("rsvp-nbr-enh-lp-phop-lsp-count"): str,
-                        Optional("rsvp-nbr-enh-lp-pphop-lsp-count"): str,
-                        Optional("rsvp-nbr-enh-lp-nhop-lsp-count"): str,
-                        Optional("rsvp-nbr-enh-lp-nnhop-lsp-count"): str,
-                    }
-                })
-
-        for item in value:
-            rsvp_neighbor_list.validate(item)
-        return value
+    validate_neighbor_list = ListOfDict({
+        "rsvp-neighbor-address": str,
+        Optional("rsvp-neighbor-interface"): str,
+        "rsvp-neighbor-status": str,
+        Optional("rsvp-neighbor-node"): bool,
+        "last-changed-time": str,
+        "neighbor-idle": str,
+        "neighbor-up-count": str,
+        "neighbor-down-count": str,
+        "messages-received": str,
+        "hello-interval": str,
+        "hellos-sent": str,
+        "hellos-received": str,
+        "rsvp-neighbor-remote-instance": str,
+        "rsvp-neighbor-local-instance": str,
+        Optional("rsvp-refresh-reduct-status"): str,
+        Optional("rsvp-refresh-reduct-remote-status"): str,
+        Optional("rsvp-refresh-reduct-ack-status"): str,
+        Optional("rsvp-nbr-enh-local-protection"): {
+            Optional("rsvp-nbr-enh-lp-status"): str,
+            Optional("rsvp-nbr-enh-lp-total-lsp-count"): str,
+            Optional("rsvp-nbr-enh-lp-phop-lsp-count"): str,
+            Optional("rsvp-nbr-enh-lp-pphop-lsp-count"): str,
+            Optional("rsvp-nbr-enh-lp-nhop-lsp-count"): str,
+            Optional("rsvp-nbr-enh-lp-nnhop-lsp-count"): str,
+        }
+    }, 'RSVP Neighbor not a list')
 
 
     schema = {
@@ -311,42 +298,26 @@ class ShowRSVPSessionSchema(MetaParser):
         * show rsvp session transit
     """
 
-    def validate_session_data_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('RSVP session data not a list')
-
-        def validate_session_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('RSVP session not a list')
-
-            rsvp_session_list = Schema({
-                    "destination-address": str,
-                    "source-address": str,
-                    "lsp-state": str,
-                    "route-count": str,
-                    "rsb-count": str,
-                    "resv-style": str,
-                    "label-in": str,
-                    "label-out": str,
-                    "name": str,
-                })
-
-            for item in value:
-                rsvp_session_list.validate(item)
-            return value
-
-        rsvp_session_data_list = Schema({
-                "session-type": str,
-                "count": str,
-                Optional("rsvp-session"): Use(validate_session_list),
-                "display-count": str,
-                "up-count": str,
-                "down-count": str,
-            })
-
-        for item in value:
-            rsvp_session_data_list.validate(item)
-        return value
+    validate_session_list = ListOfDict({
+        "destination-address": str,
+        "source-address": str,
+        "lsp-state": str,
+        "route-count": str,
+        "rsb-count": str,
+        "resv-style": str,
+        "label-in": str,
+        "label-out": str,
+        "name": str,
+    }, 'RSVP session not a list')
+
+    validate_session_data_list = ListOfDict({
+        "session-type": str,
+        "count": str,
+        Optional("rsvp-session"): Use(validate_session_list),
+        "display-count": str,
+        "up-count": str,
+        "down-count": str,
+    }, 'RSVP session data not a list')
 
     schema = {
             "rsvp-session-information": {
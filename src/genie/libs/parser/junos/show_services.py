@@ -21,6 +21,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 class ShowServicesAccountingAggregationTemplateSchema(MetaParser):
     """ Schema for:
@@ -202,21 +205,13 @@ class ShowServicesAccountingUsageSchema(MetaParser):
             * show services accounting usage
     """
 
-    def validate_usage_information(value):
-        if not isinstance(value, list):
-            raise SchemaError('Usage information is not a list')
-    
-        usage_information = Schema({
-                        "interface-name": str,
-                        "uptime": str,
-                        "inttime": str,
-                        "five-second-load": str,
-                        "one-minute-load": str,
-                    })
-    
-        for item in value:
-            usage_information.validate(item)
-        return value
+    validate_usage_information = ListOfDict({
+        "interface-name": str,
+        "uptime": str,
+        "inttime": str,
+        "five-second-load": str,
+        "one-minute-load": str,
+    }, 'Usage information is not a list')
 
     schema = {
                 "services-accounting-information": {
@@ -307,22 +302,14 @@ class ShowServicesAccountingErrorsSchema(MetaParser):
             * show services accounting errors
     """
 
-    def validate_error_information(value):
-        if not isinstance(value, list):
-            raise SchemaError('Error information is not a list')
-    
-        error_information = Schema({
-                        "interface-name": str,
-                        "service-set-dropped": str,
-                        "active-timeout-failures": str,
-                        "export-packet-failures": str,
-                        "flow-creation-failures": str,
-                        "memory-overload": str,
-                    })
-    
-        for item in value:
-            error_information.validate(item)
-        return value
+    validate_error_information = ListOfDict({
+        "interface-name": str,
+        "service-set-dropped": str,
+        "active-timeout-failures": str,
+        "export-packet-failures": str,
+        "flow-creation-failures": str,
+        "memory-overload": str,
+    }, 'Error information is not a list')
 
     schema = {
                 "services-accounting-information": {
@@ -605,24 +592,16 @@ class ShowServicesAccountingMemorySchema(MetaParser):
             * show services accounting memory
     """
 
-    def validate_memory_information(value):
-        if not isinstance(value, list):
-            raise SchemaError('Memory information is not a list')
-    
-        memory_information = Schema({
-                    "interface-name": str,
-                    "allocation-count": str,
-                    "free-count": str,
-                    "allocations-per-second": str,
-                    "frees-per-second": str,
-                    "memory-used": str,
-                    "memory-free": str,
-                    "v9-memory-used": str,
-                })
-    
-        for item in value:
-            memory_information.validate(item)
-        return value
+    validate_memory_information = ListOfDict({
+        "interface-name": str,
+        "allocation-count": str,
+        "free-count": str,
+        "allocations-per-second": str,
+        "frees-per-second": str,
+        "memory-used": str,
+        "memory-free": str,
+        "v9-memory-used": str,
+    }, 'Memory information is not a list')
 
     schema = {
                 "services-accounting-information": {
@@ -742,24 +721,16 @@ class ShowServicesAccountingStatusSchema(MetaParser):
             * show services accounting status
     """
 
-    def validate_status_information(value):
-        if not isinstance(value, list):
-            raise SchemaError('Status information is not a list')
-    
-        status_information = Schema({
-                    "interface-name": str,
-                    "status-export-format": str,
-                    "status-route-record-count": str,
-                    "status-ifl-snmp-map-count": str,
-                    "status-as-count": str,
-                    "status-monitor-config-set": str,
-                    "status-monitor-route-record-set": str,
-                    "status-monitor-ifl-snmp-set": str,
-                })
-    
-        for item in value:
-            status_information.validate(item)
-        return value
+    validate_status_information = ListOfDict({
+        "interface-name": str,
+        "status-export-format": str,
+        "status-route-record-count": str,
+        "status-ifl-snmp-map-count": str,
+        "status-as-count": str,
+        "status-monitor-config-set": str,
+        "status-monitor-route-record-set": str,
+        "status-monitor-ifl-snmp-set": str,
+    }, 'Status information is not a list')
 
     schema = {
                 "services-accounting-information": {
@@ -14,6 +14,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 
 class ShowSnmpMibWalkSystemSchema(MetaParser):
     """ Schema for:
@@ -21,19 +24,12 @@ class ShowSnmpMibWalkSystemSchema(MetaParser):
     """
 
     # Sub Schema snmp-object
-    def validate_snmp_object_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('snmp-object is not a list')
-        snmp_object_schema = Schema({
-                    "name": str,
-                    "object-value": str,
-                    Optional("object-value-type"): str,
-                    Optional("oid"): str
-                })
-        # Validate each dictionary in list
-        for item in value:
-            snmp_object_schema.validate(item)
-        return value
+    validate_snmp_object_list = ListOfDict({
+        "name": str,
+        "object-value": str,
+        Optional("object-value-type"): str,
+        Optional("oid"): str
+    }, 'snmp-object is not a list')
 
     schema = {
         "snmp-object-information": {
@@ -120,45 +116,22 @@ class ShowSnmpConfigurationSchema(MetaParser):
         },
     }
     '''
+    validate_clients_list = ListOfDict({
+        "name": str,
+        Optional("restrict"): bool
+    }, 'snmp clients is not a list')
+
     # Sub Schema snmp community
-    def validate_community_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('snmp community is not a list')
-
-        def validate_clients_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('snmp clients is not a list')
-            snmp_clients_schema = Schema({
-                "name": str,
-                Optional("restrict"): bool
-            })
-            # Validate each dictionary in list
-            for item in value:
-                snmp_clients_schema.validate(item)
-            return value
-
-        snmp_community_schema = Schema({
-                    "name": str,
-                    Optional("authorization"): str,
-                    Optional("clients"): Use(validate_clients_list),
-                })
-        # Validate each dictionary in list
-        for item in value:
-            snmp_community_schema.validate(item)
-        return value
+    validate_community_list = ListOfDict({
+        "name": str,
+        Optional("authorization"): str,
+        Optional("clients"): Use(validate_clients_list),
+    }, 'snmp community is not a list')
 
     # Sub Schema snmp categories and targets
-    def validate_categories_or_targets_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('snmp categories/targets is not a list')
-
-        snmp_categories_or_targets_schema = Schema({
-            "name": str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            snmp_categories_or_targets_schema.validate(item)
-        return value
+    validate_categories_or_targets_list = ListOfDict({
+        "name": str,
+    }, 'snmp categories/targets is not a list')
 
     schema = {
         "configuration": {
@@ -443,45 +416,22 @@ class ShowSnmpStatisticsSchema(MetaParser):
         }
     }
     '''
+    validate_clients_list = ListOfDict({
+        "name": str,
+        Optional("restrict"): bool
+    }, 'snmp clients is not a list')
+
     # Sub Schema snmp community
-    def validate_community_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('snmp community is not a list')
-
-        def validate_clients_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('snmp clients is not a list')
-            snmp_clients_schema = Schema({
-                "name": str,
-                Optional("restrict"): bool
-            })
-            # Validate each dictionary in list
-            for item in value:
-                snmp_clients_schema.validate(item)
-            return value
-
-        snmp_community_schema = Schema({
-                    "name": str,
-                    "authorization": str,
-                    "clients": Use(validate_clients_list),
-                })
-        # Validate each dictionary in list
-        for item in value:
-            snmp_community_schema.validate(item)
-        return value
+    validate_community_list = ListOfDict({
+        "name": str,
+        "authorization": str,
+        "clients": Use(validate_clients_list),
+    }, 'snmp community is not a list')
 
     # Sub Schema snmp categories or targets
-    def validate_categories_or_targets_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('snmp categories is not a list')
-
-        snmp_categories_or_targets_schema = Schema({
-            "name": str,
-        })
-        # Validate each dictionary in list
-        for item in value:
-            snmp_categories_or_targets_schema.validate(item)
-        return value
+    validate_categories_or_targets_list = ListOfDict({
+        "name": str,
+    }, 'snmp categories is not a list')
 
     schema = {
         "snmp-statistics": {
@@ -0,0 +1,130 @@
+# Python
+import time
+import unittest
+from unittest.mock import Mock
+
+# Parser
+from genie.libs.parser.junos.monitor import MonitorInterfaceTraffic, _Screen
+
+
+SCREEN = [
+    'genieDevice                      Seconds: 44',
+    'Interface    Link  Input packets        (pps)     Output packets'
+    '        (pps)',
+    'ge-0/0/0      Up        5641273          (0)          3945678'
+    '          (0)',
+    'ge-0/0/5    Down              0          (0)                0'
+    '          (0)',
+    'dsc           Up              0                             0',
+    'Bytes=b, Clear=c, Delta=d, Packets=p, Quit=q or ESC, Rate=r, Up=^U, '
+    'Down=^D Time: 03:13:30',
+]
+
+
+def draw(screen):
+    '''Escape sequences drawing the whole screen'''
+    return '\x1b[H\x1b[2J' + ''.join('\x1b[{};1H{}'.format(row + 1, line)
+                                     for row, line in enumerate(screen))
+
+
+def refresh(seconds):
+    '''Escape sequences updating the cells changed after seconds more'''
+    return ('\x1b[1;43H{:<3}'.format(44 + seconds) +
+            '\x1b[3;25H{}\x1b[3;42H({})'.format(5641273 + seconds * 7, 7) +
+            '\x1b[6;83H03:13:{}'.format(30 + seconds))
+
+
+class ScriptedDevice(object):
+    '''Device giving the command output in chunks of `size` characters, one
+    per expect() call, then the prompt once q is sent'''
+
+    _hostname = 'genieDevice'
+
+    def __init__(self, stream, size=5, delay=0):
+        self.chunks = [stream[index:index + size]
+                       for index in range(0, len(stream), size)]
+        self.delay = delay
+        self.sent = []
+
+    def sendline(self, line):
+        self.sent.append(line)
+
+    def expect(self, patterns, timeout=None):
+        if self.sent[-1] == 'q':
+            return Mock(match_output='\x1b[?1049l\r\ngenie@genieDevice> ')
+        if not self.chunks:
+            time.sleep(timeout)
+            raise TimeoutError('no output in {} seconds'.format(timeout))
+        time.sleep(self.delay)
+        return Mock(match_output=self.chunks.pop(0))
+
+
+class TestMonitorInterfaceTrafficSamples(unittest.TestCase):
+
+    stream = draw(SCREEN) + refresh(1) + refresh(2) + '\x1b[6;1H'
+
+    def test_samples(self):
+        device = ScriptedDevice(self.stream)
+        samples = list(MonitorInterfaceTraffic(device=device).samples(
+            count=3))
+
+        self.assertEqual([list(sample['monitor-time']) for sample in samples],
+                         [['03:13:30'], ['03:13:31'], ['03:13:32']])
+        first = samples[0]['monitor-time']['03:13:30']
+        self.assertEqual(first['seconds'], '44')
+        self.assertEqual(first['interface']['ge-0/0/0'], {
+            'link': 'Up', 'input-packets': 5641273, 'input-pps': 0,
+            'output-packets': 3945678, 'output-pps': 0})
+        self.assertEqual(first['interface']['dsc'], {
+            'link': 'Up', 'input-packets': 0, 'output-packets': 0})
+        last = samples[2]['monitor-time']['03:13:32']
+        self.assertEqual(last['seconds'], '46')
+        self.assertEqual(last['interface']['ge-0/0/0']['input-packets'],
+                         5641287)
+        self.assertEqual(last['interface']['ge-0/0/0']['input-pps'], 7)
+        self.assertEqual(len(last['interface']), 3)
+
+        # Quit once sampled, without reading the rest
+        self.assertEqual(device.sent, ['monitor interface traffic', 'q'])
+
+    def test_duration(self):
+        device = ScriptedDevice(self.stream, size=40, delay=0.01)
+        start = time.monotonic()
+        samples = list(MonitorInterfaceTraffic(device=device).samples(
+            duration=0.5))
+
+        # Waited for more refreshes until the end of the duration only
+        self.assertEqual(len(samples), 3)
+        self.assertGreaterEqual(time.monotonic() - start, 0.5)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(device.sent[-1], 'q')
+
+    def test_timeout(self):
+        device = ScriptedDevice('')
+        with self.assertRaises(TimeoutError):
+            next(MonitorInterfaceTraffic(device=device).samples(
+                timeout=0.01))
+        self.assertEqual(device.sent[-1], 'q')
+
+    def test_screen(self):
+        screen = _Screen()
+        frames = []
+        for chunk in (draw(SCREEN)[:-3], draw(SCREEN)[-3:] + '\x1b',
+                      '[1;43H45'):
+            frames.extend(screen.feed(chunk))
+        self.assertEqual(frames, ['\n'.join(SCREEN)])
+        self.assertEqual(screen.text().splitlines()[0],
+                         'genieDevice                      Seconds: 45')
+
+    def test_cli(self):
+        device = ScriptedDevice('')
+        device.expect = Mock(side_effect=[
+            Mock(match_output='\n'.join(SCREEN)),
+            Mock(match_output='genie@genieDevice> ')])
+        parsed = MonitorInterfaceTraffic(device=device).cli()
+        self.assertEqual(list(parsed['monitor-time']), ['03:13:30'])
+        self.assertEqual(device.sent, ['monitor interface traffic', 'q'])
+
+
+if __name__ == '__main__':
+    unittest.main()
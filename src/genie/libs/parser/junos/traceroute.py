@@ -13,6 +13,9 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListOfDict
+
 class TracerouteNoResolveSchema(MetaParser):
     """ Schema for:
                 * traceroute {ipaddress} no-resolve
@@ -38,21 +41,12 @@ class TracerouteNoResolveSchema(MetaParser):
     }
     """
 
-    def validate_hops_list(value):
-        # Pass hops list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('hops is not a list')
-        # Create hop Schema
-        hop_schema = Schema({
-                       "hop-number": str,
-                       Optional("router-name"): str,
-                       "address": str,
-                       "round-trip-time": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            hop_schema.validate(item)
-        return value
+    validate_hops_list = ListOfDict({
+        "hop-number": str,
+        Optional("router-name"): str,
+        "address": str,
+        "round-trip-time": str
+    }, 'hops is not a list')
 
     # Main Schema
     schema = {
@@ -63,6 +63,12 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.stream import RecordStream, StreamParser
+from genie.libs.parser.utils.execute import execute_commands
+
+# Patterns of the parsers in this module, compiled once
+_patterns = PatternTable()
 
 
 # =====================================
@@ -203,109 +209,109 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
         # Init vars
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
-        p2 = re.compile(r'^\s*BGP Protocol Started, +reason: *:'
-                            ' +(?P<reason>[a-zA-Z\s]+)$')
-        p2_1 = re.compile(r'^\s*BGP +Performance +Mode: *:'
-                            ' +(?P<performance_mode>[a-zA-Z\s]+)$')
-        p3 = re.compile(r'^\s*BGP +Protocol +Tag *:'
-                            ' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
-        p4 = re.compile(r'^\s*BGP +Protocol +State *:'
-                            ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
-        p4_1 = re.compile(r'^\s*BGP +Isolate +Mode *:'
-                            ' +(?P<isolate_mode>[a-zA-Z\s]+)$')
-        p4_3 = re.compile(r'^\s*BGP +MMODE *:'
-                            ' +(?P<mmode>[a-zA-Z\s]+)$')
-        p5 = re.compile(r'^\s*BGP +Memory +State *:'
-                            ' +(?P<memory_state>[\w\s]+)$')
-        p5_1 = re.compile(r'^\s*BGP +asformat *:'
-                            ' +(?P<asformat>[a-zA-Z\s]+)$')
-        p5_2 = re.compile(r'^\s*Segment +Routing +Global +Block *:'
-                            ' +(?P<segment>[0-9\-]+)$')
-        p6 = re.compile(r'^\s*Number +of +attribute +entries *:'
-                            ' +(?P<num_attr_entries>[0-9]+)$')
-        p7 = re.compile(r'^\s*HWM +of +attribute +entries *:'
-                            ' +(?P<hwm_attr_entries>[0-9]+)$')
-        p8 = re.compile(r'^\s*Bytes +used +by +entries *:'
-                            ' +(?P<bytes_used>[0-9]+)$')
-        p9 = re.compile(r'^\s*Entries +pending +delete *:'
-                            ' +(?P<entries_pending_delete>[0-9]+)$')
-        p10 = re.compile(r'^\s*HWM +of +entries +pending +delete *:'
-                            ' +(?P<hwm_entries_pending_delete>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP +paths +per +attribute +HWM *:'
-                            ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
-        p12 = re.compile(r'^\s*BGP +AS +path +entries *:'
-                            ' +(?P<bgp_as_path_entries>[0-9]+)$')
-        p13 = re.compile(r'^\s*Bytes +used +by +AS +path +entries *:'
-                            ' +(?P<bytes_used_as_path_entries>[0-9]+)$')
-        p14 = re.compile(r'^\s*BGP +Information +for +VRF'
-                            ' +(?P<vrf_name>(\S+))$')
-        p15 = re.compile(r'^\s*VRF +Id *:'
-                            ' +(?P<vrf_id>[a-zA-Z0-9]+)$')
-        p16 = re.compile(r'^\s*VRF +state *:'
-                            ' +(?P<vrf_state>[a-zA-Z]+)$')
-        p16_1 = re.compile(r'^\s*VNID *:'
-                            ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
-        p16_2 = re.compile(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
-        p16_3 = re.compile(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
-        p16_4 = re.compile(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
-        p16_5 = re.compile(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
-        p16_6 = re.compile(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
-        p16_7 = re.compile(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
-        p16_8 = re.compile(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
-        p17 = re.compile(r'^\s*Router-ID *:'
-                            ' +(?P<router_id>[0-9\.]+)$')
-        p18 = re.compile(r'^\s*Configured +Router-ID *:'
-                            ' +(?P<conf_router_id>[0-9\.]+)$')
-        p19 = re.compile(r'^\s*Confed-ID *:'
-                            ' +(?P<confed_id>[0-9]+)$')
-        p20 = re.compile(r'^\s*Cluster-ID *:'
-                            ' +(?P<cluster_id>[0-9\.]+)$')
-        p21 = re.compile(r'^\s*No. +of +configured +peers *:'
-                            ' +(?P<num_conf_peers>[0-9]+)$')
-        p22 = re.compile(r'^\s*No. +of +pending +config +peers *:'
-                            ' +(?P<num_pending_conf_peers>[0-9]+)$')
-        p23 = re.compile(r'^\s*No. +of +established +peers *:'
-                            ' +(?P<num_established_peers>[0-9]+)$')
-        p24 = re.compile(r'^\s*VRF +RD *:'
-                            ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p24_1 = re.compile(r'^\s*VRF +EVPN +RD *:'
-                            ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p25 = re.compile(r'^\s*Information +for +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
-                            ' +in +VRF +(?P<vrf>(\S+))$')
-        p26 = re.compile(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
-        p27 = re.compile(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
-        p28 = re.compile(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
-                            ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
-                            ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
-        p29 = re.compile(r'^\s*(?P<name>[a-zA-Z]+),'
-                            ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
-        p30 = re.compile(r'^\s*(?P<type>(Export|Import|EVPN Export|'
-                            'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
-                            ' *:(?: +(?P<rt_list>[0-9\:]+))?$')
-        p31 = re.compile(r'^\s*(?P<rt_list>(\d+)\:(\d+))$')
-        p32 = re.compile(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
-        p32_1 = re.compile(r'^\s*Is +a +Route\-reflector$')
-        p33 = re.compile(r'^\s*Aggregate +label *:'
-                            ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
-        p33_1 = re.compile(r'^\s*Allocate-index *:'
-                           ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
-        p34 = re.compile(r'^\s*Import +default +limit *:'
-                            ' +(?P<import_default_prefix_limit>[0-9]+)$')
-        p35 = re.compile(r'^\s*Import +default +prefix +count *:'
-                            ' +(?P<import_default_prefix_count>[0-9]+)$')
-        p36 = re.compile(r'^\s*Import +default +map *:'
-                            ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
-        p37 = re.compile(r'^\s*Export +default +limit *:'
-                            ' +(?P<export_default_prefix_limit>[0-9]+)$')
-        p38 = re.compile(r'^\s*Export +default +prefix +count *:'
-                            ' +(?P<export_default_prefix_count>[0-9]+)$')
-        p39 = re.compile(r'^\s*Export +default +map *:'
-                            ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
-        p40 = re.compile(r'^\s*Nexthop +trigger-delay$')
-        p41 = re.compile(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
-        p42 = re.compile(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
+        p1 = _patterns.compile(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
+        p2 = _patterns.compile(r'^\s*BGP Protocol Started, +reason: *:'
+                                   ' +(?P<reason>[a-zA-Z\s]+)$')
+        p2_1 = _patterns.compile(r'^\s*BGP +Performance +Mode: *:'
+                                   ' +(?P<performance_mode>[a-zA-Z\s]+)$')
+        p3 = _patterns.compile(r'^\s*BGP +Protocol +Tag *:'
+                                   ' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
+        p4 = _patterns.compile(r'^\s*BGP +Protocol +State *:'
+                                   ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
+        p4_1 = _patterns.compile(r'^\s*BGP +Isolate +Mode *:'
+                                   ' +(?P<isolate_mode>[a-zA-Z\s]+)$')
+        p4_3 = _patterns.compile(r'^\s*BGP +MMODE *:'
+                                   ' +(?P<mmode>[a-zA-Z\s]+)$')
+        p5 = _patterns.compile(r'^\s*BGP +Memory +State *:'
+                                   ' +(?P<memory_state>[\w\s]+)$')
+        p5_1 = _patterns.compile(r'^\s*BGP +asformat *:'
+                                   ' +(?P<asformat>[a-zA-Z\s]+)$')
+        p5_2 = _patterns.compile(r'^\s*Segment +Routing +Global +Block *:'
+                                   ' +(?P<segment>[0-9\-]+)$')
+        p6 = _patterns.compile(r'^\s*Number +of +attribute +entries *:'
+                                   ' +(?P<num_attr_entries>[0-9]+)$')
+        p7 = _patterns.compile(r'^\s*HWM +of +attribute +entries *:'
+                                   ' +(?P<hwm_attr_entries>[0-9]+)$')
+        p8 = _patterns.compile(r'^\s*Bytes +used +by +entries *:'
+                                   ' +(?P<bytes_used>[0-9]+)$')
+        p9 = _patterns.compile(r'^\s*Entries +pending +delete *:'
+                                   ' +(?P<entries_pending_delete>[0-9]+)$')
+        p10 = _patterns.compile(r'^\s*HWM +of +entries +pending +delete *:'
+                                   ' +(?P<hwm_entries_pending_delete>[0-9]+)$')
+        p11 = _patterns.compile(r'^\s*BGP +paths +per +attribute +HWM *:'
+                                   ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
+        p12 = _patterns.compile(r'^\s*BGP +AS +path +entries *:'
+                                   ' +(?P<bgp_as_path_entries>[0-9]+)$')
+        p13 = _patterns.compile(r'^\s*Bytes +used +by +AS +path +entries *:'
+                                   ' +(?P<bytes_used_as_path_entries>[0-9]+)$')
+        p14 = _patterns.compile(r'^\s*BGP +Information +for +VRF'
+                                   ' +(?P<vrf_name>(\S+))$')
+        p15 = _patterns.compile(r'^\s*VRF +Id *:'
+                                   ' +(?P<vrf_id>[a-zA-Z0-9]+)$')
+        p16 = _patterns.compile(r'^\s*VRF +state *:'
+                                   ' +(?P<vrf_state>[a-zA-Z]+)$')
+        p16_1 = _patterns.compile(r'^\s*VNID *:'
+                                   ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
+        p16_2 = _patterns.compile(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
+        p16_3 = _patterns.compile(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
+        p16_4 = _patterns.compile(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
+        p16_5 = _patterns.compile(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
+        p16_6 = _patterns.compile(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
+        p16_7 = _patterns.compile(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
+        p16_8 = _patterns.compile(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
+        p17 = _patterns.compile(r'^\s*Router-ID *:'
+                                   ' +(?P<router_id>[0-9\.]+)$')
+        p18 = _patterns.compile(r'^\s*Configured +Router-ID *:'
+                                   ' +(?P<conf_router_id>[0-9\.]+)$')
+        p19 = _patterns.compile(r'^\s*Confed-ID *:'
+                                   ' +(?P<confed_id>[0-9]+)$')
+        p20 = _patterns.compile(r'^\s*Cluster-ID *:'
+                                   ' +(?P<cluster_id>[0-9\.]+)$')
+        p21 = _patterns.compile(r'^\s*No. +of +configured +peers *:'
+                                   ' +(?P<num_conf_peers>[0-9]+)$')
+        p22 = _patterns.compile(r'^\s*No. +of +pending +config +peers *:'
+                                   ' +(?P<num_pending_conf_peers>[0-9]+)$')
+        p23 = _patterns.compile(r'^\s*No. +of +established +peers *:'
+                                   ' +(?P<num_established_peers>[0-9]+)$')
+        p24 = _patterns.compile(r'^\s*VRF +RD *:'
+                                   ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
+        p24_1 = _patterns.compile(r'^\s*VRF +EVPN +RD *:'
+                                   ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
+        p25 = _patterns.compile(r'^\s*Information +for +address +family'
+                                   ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
+                                   ' +in +VRF +(?P<vrf>(\S+))$')
+        p26 = _patterns.compile(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
+        p27 = _patterns.compile(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
+        p28 = _patterns.compile(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
+                                   ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
+                                   ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
+        p29 = _patterns.compile(r'^\s*(?P<name>[a-zA-Z]+),'
+                                   ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
+        p30 = _patterns.compile(r'^\s*(?P<type>(Export|Import|EVPN Export|'
+                                   'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
+                                   ' *:(?: +(?P<rt_list>[0-9\:]+))?$')
+        p31 = _patterns.compile(r'^\s*(?P<rt_list>(\d+)\:(\d+))$')
+        p32 = _patterns.compile(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
+        p32_1 = _patterns.compile(r'^\s*Is +a +Route\-reflector$')
+        p33 = _patterns.compile(r'^\s*Aggregate +label *:'
+                                   ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
+        p33_1 = _patterns.compile(r'^\s*Allocate-index *:'
+                                  ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
+        p34 = _patterns.compile(r'^\s*Import +default +limit *:'
+                                   ' +(?P<import_default_prefix_limit>[0-9]+)$')
+        p35 = _patterns.compile(r'^\s*Import +default +prefix +count *:'
+                                   ' +(?P<import_default_prefix_count>[0-9]+)$')
+        p36 = _patterns.compile(r'^\s*Import +default +map *:'
+                                   ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
+        p37 = _patterns.compile(r'^\s*Export +default +limit *:'
+                                   ' +(?P<export_default_prefix_limit>[0-9]+)$')
+        p38 = _patterns.compile(r'^\s*Export +default +prefix +count *:'
+                                   ' +(?P<export_default_prefix_count>[0-9]+)$')
+        p39 = _patterns.compile(r'^\s*Export +default +map *:'
+                                   ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
+        p40 = _patterns.compile(r'^\s*Nexthop +trigger-delay$')
+        p41 = _patterns.compile(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
+        p42 = _patterns.compile(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
 
 
         for line in out.splitlines():
@@ -1150,26 +1156,26 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
         peer_sessions = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-session '
+        p1 = _patterns.compile(r'^\s*template +peer-session '
                     '+(?P<session_name>[a-zA-Z\-\_0-9]+)$')
-        r1 = re.compile(r'^\s*Shutdown$')
-        r2 = re.compile(r'^\s*Update +Source +-'
+        r1 = _patterns.compile(r'^\s*Shutdown$')
+        r2 = _patterns.compile(r'^\s*Update +Source +-'
                     ' +(?P<update_source>[a-zA-Z0-9\:\s]+)$')
-        r3 = re.compile(r'^\s*Description +- +description *:'
+        r3 = _patterns.compile(r'^\s*Description +- +description *:'
                     ' +(?P<desc>[a-zA-Z\-]+)$')
-        r4 = re.compile(r'^\s*Password$')
-        r5 = re.compile(r'^\s*EBGP +Multihop +- +hop +limit *:'
+        r4 = _patterns.compile(r'^\s*Password$')
+        r5 = _patterns.compile(r'^\s*EBGP +Multihop +- +hop +limit *:'
                     ' +(?P<ebgp_multihop_limit>[0-9]+)$')
-        r6 = re.compile(r'^\s*Disable +Connectivity +Check$')
-        r7 = re.compile(r'^\s*Suppress +Capabilities$')
-        r8 = re.compile(r'^\s*Passive Only$')
-        r9 = re.compile(r'^\s*Timers +- +hold +time *:'
+        r6 = _patterns.compile(r'^\s*Disable +Connectivity +Check$')
+        r7 = _patterns.compile(r'^\s*Suppress +Capabilities$')
+        r8 = _patterns.compile(r'^\s*Passive Only$')
+        r9 = _patterns.compile(r'^\s*Timers +- +hold +time *:'
                     ' +(?P<holdtime>[0-9]+), keepalive *:'
                     ' +(?P<keepalive>[0-9]+)$')
-        r10 = re.compile(r'^\s*Remote AS$')
-        r11 = re.compile(r'^\s*Local AS$')
-        r12 = re.compile(r'^\s*Enable Bfd$')
-        r13 = re.compile(r'^\s*VRF +default *:'
+        r10 = _patterns.compile(r'^\s*Remote AS$')
+        r11 = _patterns.compile(r'^\s*Local AS$')
+        r12 = _patterns.compile(r'^\s*Enable Bfd$')
+        r13 = _patterns.compile(r'^\s*VRF +default *:'
                     ' +(?P<vrf_default>[0-9\.]+)$')
 
         for line in out.splitlines():
@@ -1188,7 +1194,9 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
 
         if peer_sessions:
             
-            # Execute bgp show command now
+            # Execute bgp show commands now, in one batch
+            outputs = execute_commands(
+                self.device, ['show bgp peer-session ' + session for session in peer_sessions])
             for session in peer_sessions:
                 # Create session key
                 if session not in parsed_dict['peer_session']:
@@ -1197,7 +1205,7 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
                 
                 base_cmd = 'show bgp peer-session ' + session
                 cmd = base_cmd
-                out = self.device.execute(cmd)
+                out = outputs[cmd]
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -1341,26 +1349,26 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
         policy_names = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-policy'
+        p1 = _patterns.compile(r'^\s*template +peer-policy'
                     ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        r1 = re.compile(r'^\s*Send +Community$')
-        r2 = re.compile(r'^\s*Send +Ext-community$')
-        r3 = re.compile(r'^\s*Route +Reflector +Client$')
-        r4 = re.compile(r'^\s*Route-map +Inbound +- +policy-name *:'
-                            ' +(?P<inbound_name>[a-zA-Z\-]+)$')
-        r5 = re.compile(r'^\s*Route-map +Outbound +- +policy-name *:'
-                            ' +(?P<outbound_name>[a-zA-Z\-]+)$')
-        r6 = re.compile(r'^\s*Maximum +Prefixes +- +prefix +limit *:'
-                            ' +(?P<max_prefix_no>[0-9]+)$')
-        r7 = re.compile(r'^\s*Default +Originate(?: +- +route-map *:'
-                            ' +(?P<route_map>[a-zA-Z]+))?$')
-        r8 = re.compile(r'^\s*Soft-Reconfig$')
-        r9 = re.compile(r'^\s*Site-of-origin$')
-        r10 = re.compile(r'^\s*Allowas-in$')
-        r11 = re.compile(r'^\s*AS-override$')
-        r12 = re.compile(r'^\s*VRF +default *:'
-                            ' +(?P<vrf_default>[0-9\.]+)$')
-        r13 = re.compile(r'^\s*Nexthop +Self$')
+        r1 = _patterns.compile(r'^\s*Send +Community$')
+        r2 = _patterns.compile(r'^\s*Send +Ext-community$')
+        r3 = _patterns.compile(r'^\s*Route +Reflector +Client$')
+        r4 = _patterns.compile(r'^\s*Route-map +Inbound +- +policy-name *:'
+                                   ' +(?P<inbound_name>[a-zA-Z\-]+)$')
+        r5 = _patterns.compile(r'^\s*Route-map +Outbound +- +policy-name *:'
+                                   ' +(?P<outbound_name>[a-zA-Z\-]+)$')
+        r6 = _patterns.compile(r'^\s*Maximum +Prefixes +- +prefix +limit *:'
+                                   ' +(?P<max_prefix_no>[0-9]+)$')
+        r7 = _patterns.compile(r'^\s*Default +Originate(?: +- +route-map *:'
+                                   ' +(?P<route_map>[a-zA-Z]+))?$')
+        r8 = _patterns.compile(r'^\s*Soft-Reconfig$')
+        r9 = _patterns.compile(r'^\s*Site-of-origin$')
+        r10 = _patterns.compile(r'^\s*Allowas-in$')
+        r11 = _patterns.compile(r'^\s*AS-override$')
+        r12 = _patterns.compile(r'^\s*VRF +default *:'
+                                   ' +(?P<vrf_default>[0-9\.]+)$')
+        r13 = _patterns.compile(r'^\s*Nexthop +Self$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -1379,7 +1387,9 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
 
         if policy_names:
             
-            # Execute bgp show command now
+            # Execute bgp show commands now, in one batch
+            outputs = execute_commands(
+                self.device, ['show bgp peer-policy ' + policy_name for policy_name in policy_names])
             for policy_name in policy_names:
                 
                 # Create policy_name key
@@ -1389,7 +1399,7 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
                 
                 base_cmd = 'show bgp peer-policy ' + policy_name
                 cmd = base_cmd
-                out = self.device.execute(cmd)
+                out = outputs[cmd]
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -1527,32 +1537,32 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
         else:
             out = output
 
-        p0 = re.compile(r'^\s*template +peer'
-                        ' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$')
-        p1 = re.compile(r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$')
-        p2 = re.compile(r'^\s*Inherits +session +configuration'
-                            ' +from session-template'
-                            ' +(?P<inherit_template>(\S+))$')
-        p3 = re.compile(r'^\s*Description *: +(?P<desc>(\S+))$')
-        p4 = re.compile(r'^\s*Using +(?P<update_source>(\S+)) +as'
-                            ' +update +source +for +this +peer$')
-        p5 = re.compile(r'^\s*Connected check is disabled$')
-        p6 = re.compile(r'^\s*BFD live-detection +is +configured$')
-        p7 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            ' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
-                            ' +away$')
-        p8 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            ' +(?P<tcp_md5_auth>(\S+))$')
-        p9 = re.compile(r'^\s*Only +passive +connection +setup'
-                            ' +allowed$')
-        p10 = re.compile(r'^\s*Neighbor +local-as +command'
-                            ' +(?P<nbr_local_as_cmd>(\S+))$')
-        p11 = re.compile(r'^\s*Private +AS +numbers +removed +from'
-                            ' +updates +sent +to +this +neighbor$')
-        p12 = re.compile(r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
-                            ' +keepalive +interval +is'
-                            ' +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
+        p0 = _patterns.compile(r'^\s*template +peer'
+                               ' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$')
+        p1 = _patterns.compile(r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$')
+        p2 = _patterns.compile(r'^\s*Inherits +session +configuration'
+                                   ' +from session-template'
+                                   ' +(?P<inherit_template>(\S+))$')
+        p3 = _patterns.compile(r'^\s*Description *: +(?P<desc>(\S+))$')
+        p4 = _patterns.compile(r'^\s*Using +(?P<update_source>(\S+)) +as'
+                                   ' +update +source +for +this +peer$')
+        p5 = _patterns.compile(r'^\s*Connected check is disabled$')
+        p6 = _patterns.compile(r'^\s*BFD live-detection +is +configured$')
+        p7 = _patterns.compile(r'^\s*External +BGP +peer +might +be +upto'
+                                   ' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
+                                   ' +away$')
+        p8 = _patterns.compile(r'^\s*TCP +MD5 +authentication +is'
+                                   ' +(?P<tcp_md5_auth>(\S+))$')
+        p9 = _patterns.compile(r'^\s*Only +passive +connection +setup'
+                                   ' +allowed$')
+        p10 = _patterns.compile(r'^\s*Neighbor +local-as +command'
+                                   ' +(?P<nbr_local_as_cmd>(\S+))$')
+        p11 = _patterns.compile(r'^\s*Private +AS +numbers +removed +from'
+                                   ' +updates +sent +to +this +neighbor$')
+        p12 = _patterns.compile(r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
+                                   ' +keepalive +interval +is'
+                                   ' +(?P<keepalive_interval>[0-9]+)'
+                                   ' +seconds$')
                                     
         # Init vars
         peer_templates = []
@@ -1574,7 +1584,9 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
 
         if peer_templates:
             
-            # Execute bgp show command now
+            # Execute bgp show commands now, in one batch
+            outputs = execute_commands(
+                self.device, ['show bgp peer-template ' + peer_template for peer_template in peer_templates])
             for peer_template in peer_templates:
                 
                 # Create template_names key
@@ -1584,7 +1596,7 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
                 
                 base_cmd = 'show bgp peer-template ' + peer_template
                 cmd = base_cmd
-                out = self.device.execute(cmd)
+                out = outputs[cmd]
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -1722,7 +1734,7 @@ class ShowBgpVrfAllAllSchema(MetaParser):
 # =================================
 # Parser for 'show bgp vrf all all'
 # =================================
-class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
+class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema, StreamParser):
     """Parser for show bgp vrf <vrf>> <address_family>"""
 
     cli_command = 'show bgp vrf {vrf} {address_family}'
@@ -1733,6 +1745,16 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
       'path_type',
       'weight']
 
+    # A prefix starts on its status codes, path type and network, its next
+    # paths being the lines after it, under its VRF and address family,
+    # table version and route distinguisher
+    record_stream = RecordStream(
+        record=r'^\s*([sxSdh\*\>\&]+ ?[iecarlI]?|[iecarlI])[\w\[]'
+               r'[\w\.\:\-\[\]\,]*\/\d+( |$)',
+        context=[r'^\s*BGP +routing +table +information +for +VRF ',
+                 r'^\s*BGP +table +version +is',
+                 r'^\s*Route +Distinguisher *:'])
+
     def cli(self, vrf='all', address_family='all', output=None):
         if output is None:
             out = self.device.execute(self.cli_command.format(vrf=vrf,
@@ -1750,48 +1772,48 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
         data_on_nextline = False
         bgp_table_version = local_router_id = ''
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_1_2 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+        p = _patterns.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = _patterns.compile(r'^\s*BGP +routing +table +information +for +VRF'
+                                   ' +(?P<vrf_name>\S+), +address +family'
+                                   ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                   ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+                                   ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
+        p3_4 = _patterns.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
+        p3_1 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_1_2 = _patterns.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
             '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) +(?P<next_hop>[\w\.\/]+) +'
             '(?P<metric>\d+) +(?P<localprf>\d+) +(?P<weight>\d+) +(?P<path>[\d ]+) +'
             '(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            ' +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p3_3 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                   ' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                       '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                       '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                       ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                       ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p4 = _patterns.compile(r'^\s*Route +Distinguisher *:'
+                                   ' +(?P<route_distinguisher>(\S+))'
+                                   '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                   '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                   ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                       '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                       '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                       '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                       ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                       ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -1967,25 +1989,25 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -2098,25 +2120,25 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -2384,130 +2406,130 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
         parsed_dict = {}
         standard_send_community = False
 
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
-                            ' +remote +AS +(?P<remote_as>[0-9]+),'
-                            '(?: +local +AS +(?P<local_as>[0-9]+),)?'
-                            ' +(?P<link>[a-zA-Z]+) +link,'
-                            '( +(?P<peer_fab_type>[fabric\-\S]+),)?'
-                            ' +Peer +index +(?P<peer_index>[0-9]+)$')
-        p2 = re.compile(r'^\s*Description *: +(?P<description>(\S+))$')
-        p3 = re.compile(r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
-                            ' +remote +router +ID +(?P<router_id>[0-9\.]+)$')
-        p4 = re.compile(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
-                            '(?: +\((?P<reason>([a-zA-Z\s]+))\))?,'
-                            ' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
-                            '(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$')
-        p5 = re.compile(r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
-                            ' +as +update +source +for +this +peer$')
-        p6 = re.compile(r'^\s*BFD live-detection is configured'
-                            '(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
-                            ' +(?P<bfd_state>(\S+)))?$')
-        p7 = re.compile(r'^\s*Neighbor +local-as +command'
-                            ' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$')
-        p8 = re.compile(r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
-                            ' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
-                            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-        p9 = re.compile(r'^\s*Last +written'
-                            ' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
-                            ' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$')
-        p10 = re.compile(r'^\s*Inherits +session +configuration +from'
+        p1 = _patterns.compile(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
+                                   ' +remote +AS +(?P<remote_as>[0-9]+),'
+                                   '(?: +local +AS +(?P<local_as>[0-9]+),)?'
+                                   ' +(?P<link>[a-zA-Z]+) +link,'
+                                   '( +(?P<peer_fab_type>[fabric\-\S]+),)?'
+                                   ' +Peer +index +(?P<peer_index>[0-9]+)$')
+        p2 = _patterns.compile(r'^\s*Description *: +(?P<description>(\S+))$')
+        p3 = _patterns.compile(r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
+                                   ' +remote +router +ID +(?P<router_id>[0-9\.]+)$')
+        p4 = _patterns.compile(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
+                                   '(?: +\((?P<reason>([a-zA-Z\s]+))\))?,'
+                                   ' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
+                                   '(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$')
+        p5 = _patterns.compile(r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
+                                   ' +as +update +source +for +this +peer$')
+        p6 = _patterns.compile(r'^\s*BFD live-detection is configured'
+                                   '(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
+                                   ' +(?P<bfd_state>(\S+)))?$')
+        p7 = _patterns.compile(r'^\s*Neighbor +local-as +command'
+                                   ' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$')
+        p8 = _patterns.compile(r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
+                                   ' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
+                                   ' +interval +is +(?P<keepalive_interval>[0-9]+)'
+                                   ' +seconds$')
+        p9 = _patterns.compile(r'^\s*Last +written'
+                                   ' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
+                                   ' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$')
+        p10 = _patterns.compile(r'^\s*Inherits +session +configuration +from'
                         ' +session-template +(?P<template>[a-zA-Z\-\_]+)$')
-        p11 = re.compile(r'^\s*Connected check is disabled$')
-        p11_2 = re.compile(r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$')
-        p12_1 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p12_2 = re.compile(r'^\s*External +BGP +peer +might +be +up to'
-                            ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p13 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            ' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$')
-        p14 = re.compile(r'^\s*Only +passive +connection +setup +allowed$')
-        p15 = re.compile(r'^\s*Received +(?P<received_messages>[0-9]+)'
-                            ' +messages, +(?P<received_notifications>[0-9]+)'
-                            ' +notifications, +(?P<received_bytes>[0-9]+)'
-                            ' +bytes +in +queue$')
-        p16 = re.compile(r'^\s*Sent +(?P<sent_messages>[0-9]+)'
-                            ' +messages, +(?P<sent_notifications>[0-9]+)'
-                            ' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
-                            ' +bytes +in +queue$')
-        p17 = re.compile(r'^\s*Connections +established'
-                            ' +(?P<esablished>[0-9]+), +dropped'
-                            ' +(?P<dropped>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*Connections +attempts'
-                            ' +(?P<attemps>[0-9]+)$')
-        p18 = re.compile(r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
-                            ' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
-                            ' +(?P<reset_reason>[a-zA-Z\-\s]+)$')
-        p19 = re.compile(r'^\s*Neighbor +capabilities *:$')
-        p20_1 = re.compile(r'^\s*Dynamic +capability *:'
-                            ' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$')
-        p20_2 = re.compile(r'^\s*Dynamic +capability +\(old\) *:'
-                            ' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$')
-        p21 = re.compile(r'^\s*Route +refresh +capability +\(new\) *:'
-                            ' +(?P<route_refresh>[a-zA-Z\s]+)$')
-        p21_1 = re.compile(r'^\s*Route +refresh +capability +\(old\) *:'
-                            ' +(?P<route_refresh_old>[a-zA-Z\s]+)$')
-        p22 = re.compile(r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$')
-        p23 = re.compile(r'^\s*Address +family +VPNv4 +Unicast *:'
-                            ' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$')
-        p24 = re.compile(r'^\s*Address +family +VPNv6 +Unicast *:'
-                            ' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$')
-        p24_1 = re.compile(r'^\s*Address +family +IPv4 +MVPN:'
-                            ' +(?P<ipv4_mvpn>[\w\s]+)$')
-        p25 = re.compile(r'^\s*Graceful +Restart +capability *:'
-                            ' +(?P<graceful_restart>[a-zA-Z\s]+)$')
-        p26 = re.compile(r'^\s*Graceful +Restart +Parameters *:$')
-        p27_1 = re.compile(r'^\s*$')
-        p27_2 = re.compile(r'^\s*$')
-        p28_1 = re.compile(r'^\s*Restart +time +advertised +to +peer *:'
-                            ' +(?P<time>[0-9]+) +seconds$')
-        p28_2 = re.compile(r'^\s*Restart +time +advertised +by +peer *:'
-                            ' +(?P<time>[0-9]+) +seconds$')
-        p28 = re.compile(r'^\s*Stale +time +for +routes +advertised +by'
-                            ' +peer *: +(?P<time>[0-9]+) +seconds$')
-        p30 = re.compile(r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
-                            ' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$')
-        p31 = re.compile(r'^\s*For +address +family *:'
-                            ' +(?P<af>[a-zA-Z0-9\s]+)$')
-        p32 = re.compile(r'^\s*BGP +table +version'
-                            ' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
-                            ' +version +(?P<nbr_version>[0-9]+)$')
-        p33 = re.compile(r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
-                            ' +paths +consume +(?P<bytes_consumed>[0-9]+)'
-                            ' +bytes +of +memory$')
-        p34 = re.compile(r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$')
-        p35 = re.compile(r'^\s*Community +attribute +sent +to +this'
-                            ' +neighbor$')
-        p36 = re.compile(r'^\s*Extended +community +attribute +sent +to'
-                            ' +this +neighbor$')
-        p37 = re.compile(r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$')
-        p38 = re.compile(r'^\s*Inbound +route-map +configured +is'
-                            ' +(?P<route_map_name_in>(\S+)), +handle'
-                            ' +obtained$')
-        p39 = re.compile(r'^\s*Outbound +route-map +configured +is'
-                            ' +(?P<route_map_name_out>(\S+)), +handle'
-                            ' +obtained$')
-        p40 = re.compile(r'^\s*Third-party +Nexthop +will +not +be'
-                            ' +computed.$')
-        p41 = re.compile(r'^\s*SOO +Extcommunity *:'
-                            ' +(?P<soo>[a-zA-Z0-9\:]+)$')
-        p42 = re.compile(r'^\s*Inbound +soft +reconfiguration +allowed$')
-        p43 = re.compile(r'\s*Nexthop(?: +always)? +set +to +local +peering'
-                            ' +address, +(?P<ip>[\w\.\:]+)$')
-        p44 = re.compile(r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$')
-        p45 = re.compile(r'^\s*ASN override is enabled$')
-        p46 = re.compile(r'^\s*Default +information +originate,'
-                            '(?: +route-map +(?P<route_map>(\S+)),)?'
-                            ' +default(?: +not)? +sent$')
-        p48 = re.compile(r'^\s*(?P<inherit_peer_seq>[0-9]+)'
-                            ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        p49 = re.compile(r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
-                            ' +Local +port *: +(?P<local_port>[0-9]+)$')
-        p50 = re.compile(r'^\s*Foreign +host *:'
-                            ' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
-                            ' +port *: +(?P<foreign_port>[0-9]+)$')
-        p51 = re.compile(r'^\s*fd += +(?P<fd>[0-9]+)$')
-        p52 = re.compile(r'^\s*Route reflector client$')
+        p11 = _patterns.compile(r'^\s*Connected check is disabled$')
+        p11_2 = _patterns.compile(r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$')
+        p12_1 = _patterns.compile(r'^\s*External +BGP +peer +might +be +upto'
+                                   ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
+        p12_2 = _patterns.compile(r'^\s*External +BGP +peer +might +be +up to'
+                                   ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
+        p13 = _patterns.compile(r'^\s*TCP +MD5 +authentication +is'
+                                   ' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$')
+        p14 = _patterns.compile(r'^\s*Only +passive +connection +setup +allowed$')
+        p15 = _patterns.compile(r'^\s*Received +(?P<received_messages>[0-9]+)'
+                                   ' +messages, +(?P<received_notifications>[0-9]+)'
+                                   ' +notifications, +(?P<received_bytes>[0-9]+)'
+                                   ' +bytes +in +queue$')
+        p16 = _patterns.compile(r'^\s*Sent +(?P<sent_messages>[0-9]+)'
+                                   ' +messages, +(?P<sent_notifications>[0-9]+)'
+                                   ' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
+                                   ' +bytes +in +queue$')
+        p17 = _patterns.compile(r'^\s*Connections +established'
+                                   ' +(?P<esablished>[0-9]+), +dropped'
+                                   ' +(?P<dropped>[0-9]+)$')
+        p17_1 = _patterns.compile(r'^\s*Connections +attempts'
+                                   ' +(?P<attemps>[0-9]+)$')
+        p18 = _patterns.compile(r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
+                                   ' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
+                                   ' +(?P<reset_reason>[a-zA-Z\-\s]+)$')
+        p19 = _patterns.compile(r'^\s*Neighbor +capabilities *:$')
+        p20_1 = _patterns.compile(r'^\s*Dynamic +capability *:'
+                                   ' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$')
+        p20_2 = _patterns.compile(r'^\s*Dynamic +capability +\(old\) *:'
+                                   ' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$')
+        p21 = _patterns.compile(r'^\s*Route +refresh +capability +\(new\) *:'
+                                   ' +(?P<route_refresh>[a-zA-Z\s]+)$')
+        p21_1 = _patterns.compile(r'^\s*Route +refresh +capability +\(old\) *:'
+                                   ' +(?P<route_refresh_old>[a-zA-Z\s]+)$')
+        p22 = _patterns.compile(r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$')
+        p23 = _patterns.compile(r'^\s*Address +family +VPNv4 +Unicast *:'
+                                   ' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$')
+        p24 = _patterns.compile(r'^\s*Address +family +VPNv6 +Unicast *:'
+                                   ' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$')
+        p24_1 = _patterns.compile(r'^\s*Address +family +IPv4 +MVPN:'
+                                   ' +(?P<ipv4_mvpn>[\w\s]+)$')
+        p25 = _patterns.compile(r'^\s*Graceful +Restart +capability *:'
+                                   ' +(?P<graceful_restart>[a-zA-Z\s]+)$')
+        p26 = _patterns.compile(r'^\s*Graceful +Restart +Parameters *:$')
+        p27_1 = _patterns.compile(r'^\s*$')
+        p27_2 = _patterns.compile(r'^\s*$')
+        p28_1 = _patterns.compile(r'^\s*Restart +time +advertised +to +peer *:'
+                                   ' +(?P<time>[0-9]+) +seconds$')
+        p28_2 = _patterns.compile(r'^\s*Restart +time +advertised +by +peer *:'
+                                   ' +(?P<time>[0-9]+) +seconds$')
+        p28 = _patterns.compile(r'^\s*Stale +time +for +routes +advertised +by'
+                                   ' +peer *: +(?P<time>[0-9]+) +seconds$')
+        p30 = _patterns.compile(r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
+                                   ' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$')
+        p31 = _patterns.compile(r'^\s*For +address +family *:'
+                                   ' +(?P<af>[a-zA-Z0-9\s]+)$')
+        p32 = _patterns.compile(r'^\s*BGP +table +version'
+                                   ' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
+                                   ' +version +(?P<nbr_version>[0-9]+)$')
+        p33 = _patterns.compile(r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
+                                   ' +paths +consume +(?P<bytes_consumed>[0-9]+)'
+                                   ' +bytes +of +memory$')
+        p34 = _patterns.compile(r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$')
+        p35 = _patterns.compile(r'^\s*Community +attribute +sent +to +this'
+                                   ' +neighbor$')
+        p36 = _patterns.compile(r'^\s*Extended +community +attribute +sent +to'
+                                   ' +this +neighbor$')
+        p37 = _patterns.compile(r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$')
+        p38 = _patterns.compile(r'^\s*Inbound +route-map +configured +is'
+                                   ' +(?P<route_map_name_in>(\S+)), +handle'
+                                   ' +obtained$')
+        p39 = _patterns.compile(r'^\s*Outbound +route-map +configured +is'
+                                   ' +(?P<route_map_name_out>(\S+)), +handle'
+                                   ' +obtained$')
+        p40 = _patterns.compile(r'^\s*Third-party +Nexthop +will +not +be'
+                                   ' +computed.$')
+        p41 = _patterns.compile(r'^\s*SOO +Extcommunity *:'
+                                   ' +(?P<soo>[a-zA-Z0-9\:]+)$')
+        p42 = _patterns.compile(r'^\s*Inbound +soft +reconfiguration +allowed$')
+        p43 = _patterns.compile(r'\s*Nexthop(?: +always)? +set +to +local +peering'
+                                   ' +address, +(?P<ip>[\w\.\:]+)$')
+        p44 = _patterns.compile(r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$')
+        p45 = _patterns.compile(r'^\s*ASN override is enabled$')
+        p46 = _patterns.compile(r'^\s*Default +information +originate,'
+                                   '(?: +route-map +(?P<route_map>(\S+)),)?'
+                                   ' +default(?: +not)? +sent$')
+        p48 = _patterns.compile(r'^\s*(?P<inherit_peer_seq>[0-9]+)'
+                                   ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
+        p49 = _patterns.compile(r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
+                                   ' +Local +port *: +(?P<local_port>[0-9]+)$')
+        p50 = _patterns.compile(r'^\s*Foreign +host *:'
+                                   ' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
+                                   ' +port *: +(?P<foreign_port>[0-9]+)$')
+        p51 = _patterns.compile(r'^\s*fd += +(?P<fd>[0-9]+)$')
+        p52 = _patterns.compile(r'^\s*Route reflector client$')
             
         for line in out.splitlines():
             line = line.rstrip()
@@ -3301,33 +3323,33 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
         # Init vars
         nh_dict = {}
 
-        p1 = re.compile(r'^\s*Next +Hop +table +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<af>[a-zA-Z0-9\s\-]+) *:$')
-        p2 = re.compile(r'^\s*Critical *:'
-                            ' +(?P<nexthop_trigger_delay_critical>[0-9]+)'
-                            ' +Non-critical *:'
-                            ' +(?P<nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p3 = re.compile(r'^\s*Nexthop *: +(?P<nh>[a-zA-Z0-9\.\:]+),'
-                            '( +Flags *: +(?P<flags>\w+),)?'
-                            ' +Refcount *: +(?P<refcount>[0-9]+), +IGP'
-                            ' +cost *: +(?P<igp_cost>[0-9\-]+)'
-                            '(?:, +Multipath: +(?P<multipath>(\S+)))?$')
-        p4 = re.compile(r'^\s*IGP +Route +type *:'
-                            ' +(?P<igp_route_type>[0-9]+), +IGP +preference *:'
-                            ' +(?P<igp_preference>[0-9]+)$')
-        p5 = re.compile(r'^\s*Nexthop +is +(?P<attached>[\w\-]+) +'
-                            '(?P<local>[\w\-]+) +(?P<reachable>[\w\-]+) +'
-                            '(?P<labeled>[\w\-]+)$')
-        p6 = re.compile(r'^\s*Nexthop +last +resolved *:'
-                            ' +(?P<nexthop_last_resolved>[a-zA-Z0-9\:\.\s]+),'
-                            ' +using +(?P<nexthop_resolved_using>[\w\:\-\.\/]+)$')
-        p7 = re.compile(r'^\s*Metric +next +advertise *:'
-                            ' +(?P<metric_next_advertise>[a-zA-Z0-9\:]+)$')
-        p8 = re.compile(r'^\s*RNH +epoch *: +(?P<rnh_epoch>[0-9]+)$')
-        p9 = re.compile(r'^\s*Attached +nexthop *:'
-                            ' +(?P<attached_nexthop>[\w\.\:]+), +Interface *:'
-                            ' +(?P<attached_nexthop_interface>[\w\-\.\/]+)$')
+        p1 = _patterns.compile(r'^\s*Next +Hop +table +for +VRF'
+                                   ' +(?P<vrf_name>\S+), +address +family'
+                                   ' +(?P<af>[a-zA-Z0-9\s\-]+) *:$')
+        p2 = _patterns.compile(r'^\s*Critical *:'
+                                   ' +(?P<nexthop_trigger_delay_critical>[0-9]+)'
+                                   ' +Non-critical *:'
+                                   ' +(?P<nexthop_trigger_delay_non_critical>[0-9]+)$')
+        p3 = _patterns.compile(r'^\s*Nexthop *: +(?P<nh>[a-zA-Z0-9\.\:]+),'
+                                   '( +Flags *: +(?P<flags>\w+),)?'
+                                   ' +Refcount *: +(?P<refcount>[0-9]+), +IGP'
+                                   ' +cost *: +(?P<igp_cost>[0-9\-]+)'
+                                   '(?:, +Multipath: +(?P<multipath>(\S+)))?$')
+        p4 = _patterns.compile(r'^\s*IGP +Route +type *:'
+                                   ' +(?P<igp_route_type>[0-9]+), +IGP +preference *:'
+                                   ' +(?P<igp_preference>[0-9]+)$')
+        p5 = _patterns.compile(r'^\s*Nexthop +is +(?P<attached>[\w\-]+) +'
+                                   '(?P<local>[\w\-]+) +(?P<reachable>[\w\-]+) +'
+                                   '(?P<labeled>[\w\-]+)$')
+        p6 = _patterns.compile(r'^\s*Nexthop +last +resolved *:'
+                                   ' +(?P<nexthop_last_resolved>[a-zA-Z0-9\:\.\s]+),'
+                                   ' +using +(?P<nexthop_resolved_using>[\w\:\-\.\/]+)$')
+        p7 = _patterns.compile(r'^\s*Metric +next +advertise *:'
+                                   ' +(?P<metric_next_advertise>[a-zA-Z0-9\:]+)$')
+        p8 = _patterns.compile(r'^\s*RNH +epoch *: +(?P<rnh_epoch>[0-9]+)$')
+        p9 = _patterns.compile(r'^\s*Attached +nexthop *:'
+                                   ' +(?P<attached_nexthop>[\w\.\:]+), +Interface *:'
+                                   ' +(?P<attached_nexthop_interface>[\w\-\.\/]+)$')
         for line in out.splitlines():
             line = line.rstrip()
 
@@ -3558,47 +3580,47 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
         # Init vars
         sum_dict = {}
         data_on_nextline = False
-        p1 = re.compile(r'^\s*BGP +summary +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +router +identifier'
-                            ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                            ' +number +(?P<local_as>[0-9]+)$')
-        p3 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+),'
-                            ' +(?P<address_family>[a-zA-Z0-9\-\s]+) +config'
-                            ' +peers +(?P<config_peers>[0-9]+), +capable'
-                            ' +peers +(?P<capable_peers>[0-9]+)$')
-        p4 = re.compile(r'^\s*(?P<networks>[0-9]+) +network +entries +and'
-                            ' +(?P<paths>[0-9]+) +paths +using'
-                            ' +(?P<bytes>[0-9]+) +bytes +of +memory$')
-        p5 = re.compile(r'^\s*BGP +attribute +entries'
-                            ' +(?P<attribute_entries>(\S+)), +BGP +AS +path'
-                            ' +entries +(?P<as_path_entries>(\S+))$')
-        p6 = re.compile(r'^\s*BGP +community +entries'
-                            ' +(?P<community_entries>(\S+)), +BGP +clusterlist'
-                            ' +entries +(?P<clusterlist_entries>(\S+))$')
-        p7 = re.compile(r'^\s*Dampening +configured,'
-                            ' +(?P<history_paths>[0-9]+) +history +paths,'
-                            ' +(?P<dampened_paths>[0-9]+) +dampened +paths$')
-        p9 = re.compile(r'^\s*(?P<val>[0-9]+) +received +paths +for +inbound +soft +reconfiguration$')
-        p10 = re.compile(r'^\s*(?P<val1>[0-9]+) +identical, +'
-                            '(?P<val2>[0-9]+) +modified, +'
-                            '(?P<val3>[0-9]+) +filtered +received +paths +'
-                            'using +(?P<val4>[0-9]+) +bytes$')
-        p8 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<v>[0-9]+)'
-                            ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
-                            ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                            ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                            ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                            ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?'
-                            '(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
-        p8_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p8_2 = re.compile(r'^\s*(?P<v>[0-9]+) +(?P<as>[0-9]+)'
-                            ' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
-                            ' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
-                            ' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
-                            ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
+        p1 = _patterns.compile(r'^\s*BGP +summary +information +for +VRF'
+                                   ' +(?P<vrf_name>\S+), +address +family'
+                                   ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p2 = _patterns.compile(r'^\s*BGP +router +identifier'
+                                   ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
+                                   ' +number +(?P<local_as>[0-9]+)$')
+        p3 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                   ' +(?P<bgp_table_version>[0-9]+),'
+                                   ' +(?P<address_family>[a-zA-Z0-9\-\s]+) +config'
+                                   ' +peers +(?P<config_peers>[0-9]+), +capable'
+                                   ' +peers +(?P<capable_peers>[0-9]+)$')
+        p4 = _patterns.compile(r'^\s*(?P<networks>[0-9]+) +network +entries +and'
+                                   ' +(?P<paths>[0-9]+) +paths +using'
+                                   ' +(?P<bytes>[0-9]+) +bytes +of +memory$')
+        p5 = _patterns.compile(r'^\s*BGP +attribute +entries'
+                                   ' +(?P<attribute_entries>(\S+)), +BGP +AS +path'
+                                   ' +entries +(?P<as_path_entries>(\S+))$')
+        p6 = _patterns.compile(r'^\s*BGP +community +entries'
+                                   ' +(?P<community_entries>(\S+)), +BGP +clusterlist'
+                                   ' +entries +(?P<clusterlist_entries>(\S+))$')
+        p7 = _patterns.compile(r'^\s*Dampening +configured,'
+                                   ' +(?P<history_paths>[0-9]+) +history +paths,'
+                                   ' +(?P<dampened_paths>[0-9]+) +dampened +paths$')
+        p9 = _patterns.compile(r'^\s*(?P<val>[0-9]+) +received +paths +for +inbound +soft +reconfiguration$')
+        p10 = _patterns.compile(r'^\s*(?P<val1>[0-9]+) +identical, +'
+                                   '(?P<val2>[0-9]+) +modified, +'
+                                   '(?P<val3>[0-9]+) +filtered +received +paths +'
+                                   'using +(?P<val4>[0-9]+) +bytes$')
+        p8 = _patterns.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<v>[0-9]+)'
+                                   ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+                                   ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+                                   ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+                                   ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                   ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?'
+                                   '(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
+        p8_1 = _patterns.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p8_2 = _patterns.compile(r'^\s*(?P<v>[0-9]+) +(?P<as>[0-9]+)'
+                                   ' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
+                                   ' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
+                                   ' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                   ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -3852,7 +3874,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -4204,25 +4226,25 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
 
         bgp_dict = {}
         sub_dict = {}
-        p1 = re.compile(r'^Route +(?P<route>\w+) +Dampening +Parameters '
-                            '+for +VRF +(?P<vrf>\w+) +Address +family '
-                            '+(?P<af_name>[a-zA-Z0-9 ]+):$')
-        p9 = re.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
-                        '\(VRF +(?P<rd_vrf>\w+)\)$')
-        p10 = re.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
-                            '\((?P<rd_vrf>\w+)( *VNI +(?P<vni>\w+))\)')
-        p2 = re.compile(r'^Dampening +policy +configured: '
-                            '+(?P<route_map>\w+)$')
-        p3 = re.compile(r'^Half-life +time +: +'
-                            '(?P<half_time>\d+)( *(?P<unit>\w+))?$')
-        p4 = re.compile(r'^Suppress +penalty +: +'
-                            '(?P<suppress_pen>\d+)( *(?P<unit>\w+))?$')
-        p5 = re.compile(r'^Reuse +penalty +: +'
-                            '(?P<reuse_pen>\d+)( *(?P<unit>\w+))?$')
-        p6 = re.compile(r'^Max +suppress +time +: +'
-                            '(?P<max_sup_time>\d+)( *(?P<unit>\w+))?$')
-        p7 = re.compile(r'^Max +suppress +penalty +: '
-                            '+(?P<max_sup_pen>\d+)( *(?P<unit>\w+))?$')
+        p1 = _patterns.compile(r'^Route +(?P<route>\w+) +Dampening +Parameters '
+                                   '+for +VRF +(?P<vrf>\w+) +Address +family '
+                                   '+(?P<af_name>[a-zA-Z0-9 ]+):$')
+        p9 = _patterns.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
+                               '\(VRF +(?P<rd_vrf>\w+)\)$')
+        p10 = _patterns.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
+                                   '\((?P<rd_vrf>\w+)( *VNI +(?P<vni>\w+))\)')
+        p2 = _patterns.compile(r'^Dampening +policy +configured: '
+                                   '+(?P<route_map>\w+)$')
+        p3 = _patterns.compile(r'^Half-life +time +: +'
+                                   '(?P<half_time>\d+)( *(?P<unit>\w+))?$')
+        p4 = _patterns.compile(r'^Suppress +penalty +: +'
+                                   '(?P<suppress_pen>\d+)( *(?P<unit>\w+))?$')
+        p5 = _patterns.compile(r'^Reuse +penalty +: +'
+                                   '(?P<reuse_pen>\d+)( *(?P<unit>\w+))?$')
+        p6 = _patterns.compile(r'^Max +suppress +time +: +'
+                                   '(?P<max_sup_time>\d+)( *(?P<unit>\w+))?$')
+        p7 = _patterns.compile(r'^Max +suppress +penalty +: '
+                                   '+(?P<max_sup_pen>\d+)( *(?P<unit>\w+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4333,7 +4355,7 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -4594,63 +4616,63 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
         # Init dictionary
         route_dict = {}
 
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                        r' +address +family'
-                        r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
-        p3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p4 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p5 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p6 = re.compile(r'^(?P<metric>[0-9]+)'
-                        r'(?P<space1>\s{5,10})'
-                        r'(?P<localprf>[0-9]+)'
-                        r'(?P<space2>\s{5,10})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p7 = re.compile(r'^(?P<value>[0-9]+)'
-                        r'(?P<space>\s{2,21})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p8 = re.compile(r'^(?P<weight>[0-9]+)'
-                            r' +(?P<path>[0-9\{\}\s]+)$')
-        p9 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p10 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p11 = re.compile(r'^(?P<metric>[0-9]+)'
+        p1 = _patterns.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+                               r' +address +family'
+                               r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                               r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                               r' +ID +is +(?P<local_router_id>(\S+))$')
+        p3 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p4 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                   r' +(?P<origin_codes>(i|e|\?|\|))$')
+        p5 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                   r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p6 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                               r'(?P<space1>\s{5,10})'
+                               r'(?P<localprf>[0-9]+)'
+                               r'(?P<space2>\s{5,10})'
+                               r'(?P<weight>[0-9]+)'
+                               r'(?: *(?P<path>[0-9\{\}\s]+))?$')
+        p7 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                               r'(?P<space>\s{2,21})'
+                               r'(?P<weight>[0-9]+)'
+                               r'(?: *(?P<path>[0-9\{\}\s]+))?$')
+        p8 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                   r' +(?P<path>[0-9\{\}\s]+)$')
+        p9 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))'
+                                   r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                   r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p10 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                   r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p11 = _patterns.compile(r'^(?P<metric>[0-9]+)'
                         r'(?P<space1>\s{5,10})'
                         r'(?P<localprf>[0-9]+)'
                         r'(?P<space2>\s{5,10})'
                         r'(?P<weight>[0-9]+)'
                         r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p12 = re.compile(r'^(?P<value>[0-9]+)'
+        p12 = _patterns.compile(r'^(?P<value>[0-9]+)'
                         r'(?P<space>\s{2,21})'
                         r'(?P<weight>[0-9]+)'
                         r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p13 = re.compile(r'^(?P<weight>[0-9]+)'
+        p13 = _patterns.compile(r'^(?P<weight>[0-9]+)'
                         r' +(?P<path>[0-9\{\}\s]+)$')
-        p14 = re.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>'
+        p14 = _patterns.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>'
                         r'(\S+))(?: +\((?:VRF +(?P<default_vrf>\w+)|L2VNI +'
                         r'(?P<rd_l2vni>\d+)|L3VNI +(?P<rd_l3vni>\d+))\))?$')
         # Init vars
@@ -5068,43 +5090,43 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
         route_dict = {}
         af_dict = {}
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                            ' +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            ' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            ' +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        p = _patterns.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = _patterns.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+                                   ' +address +family'
+                                   ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                   ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                   ' +ID +is +(?P<local_router_id>(\S+))$')
+        p3_1 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_3 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                   ' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                       '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                       '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                       ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                       ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                   ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                       '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                       '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                       '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                       ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                       ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p4 = _patterns.compile(r'^\s*Route +Distinguisher *:'
+                                   ' +(?P<route_distinguisher>(\S+))'
+                                   '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                   '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
         # Init vars
         data_on_nextline = False
         index = 1
@@ -5245,25 +5267,25 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5334,25 +5356,25 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5515,43 +5537,43 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
         route_dict = {}
         af_dict = {}
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                            ' +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            ' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            ' +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        p = _patterns.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = _patterns.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+                                   ' +address +family'
+                                   ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is'
+                                   ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                   ' +ID +is +(?P<local_router_id>(\S+))$')
+        p3_1 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_3 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                   ' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                       '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                       '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                       ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                       ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p3_2 = _patterns.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                   '(?P<path_type>(i|e|c|l|a|r|I))'
+                                   '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                   ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = _patterns.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                       '(?P<path_type>(i|e|c|l|a|r|I))?'
+                                       '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                       '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                       ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                       ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p4 = _patterns.compile(r'^\s*Route +Distinguisher *:'
+                                   ' +(?P<route_distinguisher>(\S+))'
+                                   '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                   '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
         # Init vars
         data_on_nextline =  False
         index = 1
@@ -5691,25 +5713,25 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5780,25 +5802,25 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = _patterns.compile(r'^(?P<metric>[0-9]+)'
+                                        '(?P<space1>\s{5,10})'
+                                        '(?P<localprf>[0-9]+)'
+                                        '(?P<space2>\s{5,10})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = _patterns.compile(r'^(?P<value>[0-9]+)'
+                                        '(?P<space>\s{2,21})'
+                                        '(?P<weight>[0-9]+)'
+                                        '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = _patterns.compile(r'^(?P<weight>[0-9]+)'
+                                        ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -6129,125 +6151,125 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
-        p2 = re.compile(r'^\s*shutdown$')
-        p2_1 = re.compile(r'^\s*evpn$')
-        p2_2 = re.compile(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
-        p2_3 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p2_4 = re.compile(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
-        p3 = re.compile(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
-        p3_1 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p4 = re.compile(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
-        p5 = re.compile(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
-        p6 = re.compile(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
-        p7 = re.compile(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
-        p8 = re.compile(r'^\s*no graceful-restart$')
-        p9 = re.compile(r'^\s*graceful-restart'
+        p1 = _patterns.compile(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
+        p2 = _patterns.compile(r'^\s*shutdown$')
+        p2_1 = _patterns.compile(r'^\s*evpn$')
+        p2_2 = _patterns.compile(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
+        p2_3 = _patterns.compile(r'^\s*rd +(?P<rd>[\w]+)$')
+        p2_4 = _patterns.compile(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
+        p3 = _patterns.compile(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
+        p3_1 = _patterns.compile(r'^\s*rd +(?P<rd>[\w]+)$')
+        p4 = _patterns.compile(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
+        p5 = _patterns.compile(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
+        p6 = _patterns.compile(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
+        p7 = _patterns.compile(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
+        p8 = _patterns.compile(r'^\s*no graceful-restart$')
+        p9 = _patterns.compile(r'^\s*graceful-restart'
                     ' +(?P<graceful_restart_type>[a-z\-]+)'
                     ' +(?P<time>[0-9]+)$')
-        p10 = re.compile(r'^\s*log-neighbor-changes$')
-        p11 = re.compile(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
-        p12 = re.compile(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
+        p10 = _patterns.compile(r'^\s*log-neighbor-changes$')
+        p11 = _patterns.compile(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
+        p12 = _patterns.compile(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
                     ' +(?P<holdtime>[0-9]+)$')
-        p13 = re.compile(r'^\s*no enforce-first-as$')
-        p14 = re.compile(r'^\s*no fast-external-fallover$')
-        p15 = re.compile(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
-        p16 = re.compile(r'^\s*flush-routes$')
-        p17 = re.compile(r'^\s*isolate$')
-        p18 = re.compile(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
-        p19 = re.compile(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
-        p20 = re.compile(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
-        p21_1 = re.compile(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
-        p21 = re.compile(r'^\s*dampening '
+        p13 = _patterns.compile(r'^\s*no enforce-first-as$')
+        p14 = _patterns.compile(r'^\s*no fast-external-fallover$')
+        p15 = _patterns.compile(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
+        p16 = _patterns.compile(r'^\s*flush-routes$')
+        p17 = _patterns.compile(r'^\s*isolate$')
+        p18 = _patterns.compile(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
+        p19 = _patterns.compile(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
+        p20 = _patterns.compile(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
+        p21_1 = _patterns.compile(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
+        p21 = _patterns.compile(r'^\s*dampening '
                         '+(?P<af_dampening_half_life_time>[0-9]+) '
                         '+(?P<af_dampening_reuse_time>[0-9]+) '
                         '+(?P<af_dampening_suppress_time>[0-9]+) '
                         '+(?P<af_dampening_max_suppress_time>[0-9]+)$')
-        p22 = re.compile(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
-        p23 = re.compile(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
-        p24 = re.compile(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p25 = re.compile(r'^\s*no nexthop trigger-delay$')
-        p26 = re.compile(r'^\s*no client-to-client reflection$')
-        p27 = re.compile(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
-        p28 = re.compile(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
-        p28_1 = re.compile(r'additional-paths send')
-        p28_2 = re.compile(r'additional-paths receive')
-        p28_3 = re.compile(r'default-information originate')
-        p29 = re.compile(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
-        p30 = re.compile(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
-        p31 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p32 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p33 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p34 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p35 = re.compile(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
-        p36 = re.compile(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
-        p37 = re.compile(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
-        p38 = re.compile(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
-        p39 = re.compile(r'^\s*allocate-label all$')
-        p40 = re.compile(r'^\s*retain route-target all$')
-        p41 = re.compile(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
-        p103 = re.compile(r'^\s*advertise-pip$')
-        p42 = re.compile(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
-        p43 = re.compile(r'^\s*bfd$')
-        p44 = re.compile(r'^\s*capability suppress 4-byte-as$')
-        p45 = re.compile(r'^\s*description +(?P<nbr_description>[A-Za-z0-9]+)$')
-        p46 = re.compile(r'^\s*disable-connected-check$')
-        p47 = re.compile(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
-        p48 = re.compile(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
-        p49 = re.compile(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
-        p50 = re.compile(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
-        p51 = re.compile(r'^\s*remove-private-as$')
-        p52 = re.compile(r'^\s*shutdown$')
-        p53 = re.compile(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
-        p54 = re.compile(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
-        p55 = re.compile(r'^\s*password +(?P<nbr_password_text>.*)$')
-        p56 = re.compile(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
-        p101 = re.compile(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
-        p104 = re.compile(r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$')
-        p57 = re.compile(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
-        p58 = re.compile(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
-        p59 = re.compile(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
-        p60 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p61 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
-        p62 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$')
-        p63 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$')
-        p64 = re.compile(r'^\s*route-reflector-client$')
-        p65 = re.compile(r'^\s*send-community$')
-        p66 = re.compile(r'^\s*send-community +extended$')
-        p100 = re.compile(r'^\s*rewrite-evpn-rt-asn$')
-        p67 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p68 = re.compile(r'^\s*next-hop-self$')
-        p69 = re.compile(r'^\s*as-override$')
-        p70 = re.compile(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
-        p71 = re.compile(r'^\s*soo +(?P<nbr_af_soo>.*)$')
-        p72 = re.compile(r'^\s*template peer-session +(?P<ps_name>.*)$')
-        p73 = re.compile(r'^\s*bfd$')
-        p74 = re.compile(r'^\s*bfd$')
-        p75 = re.compile(r'^\s*description +(?P<ps_description>.*)$')
-        p76 = re.compile(r'^\s*disable-connected-check$')
-        p77 = re.compile(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
-        p78 = re.compile(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
-        p79 = re.compile(r'^\s*password +(?P<ps_password_text>.*)$')
-        p80 = re.compile(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
-        p81 = re.compile(r'^\s*shutdown$')
-        p82 = re.compile(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
-        p83 = re.compile(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
-        p84 = re.compile(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
-        p85 = re.compile(r'^\s*template peer-policy +(?P<pp_name>.*)$')
-        p86 = re.compile(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
-        p87 = re.compile(r'^\s*as-override$')
-        p88 = re.compile(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
-        p89 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
-        p90 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
-        p91 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p92 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
-        p93 = re.compile(r'^\s*next-hop-self$')
-        p94 = re.compile(r'^\s*route-reflector-client$')
-        p95 = re.compile(r'^\s*send-community$')
-        p96 = re.compile(r'^\s*send-community +extended$')
-        p97 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p98 = re.compile(r'^\s*soo +(?P<pp_soo>.*)$')
-        peer_1 = re.compile(r'template peer +(?P<peer_name>\S+)')
+        p22 = _patterns.compile(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
+        p23 = _patterns.compile(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
+        p24 = _patterns.compile(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
+        p25 = _patterns.compile(r'^\s*no nexthop trigger-delay$')
+        p26 = _patterns.compile(r'^\s*no client-to-client reflection$')
+        p27 = _patterns.compile(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
+        p28 = _patterns.compile(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
+        p28_1 = _patterns.compile(r'additional-paths send')
+        p28_2 = _patterns.compile(r'additional-paths receive')
+        p28_3 = _patterns.compile(r'default-information originate')
+        p29 = _patterns.compile(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
+        p30 = _patterns.compile(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
+        p31 = _patterns.compile(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
+        p32 = _patterns.compile(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
+        p33 = _patterns.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
+        p34 = _patterns.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
+        p35 = _patterns.compile(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
+        p36 = _patterns.compile(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
+        p37 = _patterns.compile(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
+        p38 = _patterns.compile(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
+        p39 = _patterns.compile(r'^\s*allocate-label all$')
+        p40 = _patterns.compile(r'^\s*retain route-target all$')
+        p41 = _patterns.compile(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
+        p103 = _patterns.compile(r'^\s*advertise-pip$')
+        p42 = _patterns.compile(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
+        p43 = _patterns.compile(r'^\s*bfd$')
+        p44 = _patterns.compile(r'^\s*capability suppress 4-byte-as$')
+        p45 = _patterns.compile(r'^\s*description +(?P<nbr_description>[A-Za-z0-9]+)$')
+        p46 = _patterns.compile(r'^\s*disable-connected-check$')
+        p47 = _patterns.compile(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
+        p48 = _patterns.compile(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
+        p49 = _patterns.compile(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
+        p50 = _patterns.compile(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
+        p51 = _patterns.compile(r'^\s*remove-private-as$')
+        p52 = _patterns.compile(r'^\s*shutdown$')
+        p53 = _patterns.compile(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
+        p54 = _patterns.compile(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
+        p55 = _patterns.compile(r'^\s*password +(?P<nbr_password_text>.*)$')
+        p56 = _patterns.compile(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
+        p101 = _patterns.compile(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
+        p104 = _patterns.compile(r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$')
+        p57 = _patterns.compile(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
+        p58 = _patterns.compile(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
+        p59 = _patterns.compile(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
+        p60 = _patterns.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
+        p61 = _patterns.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
+        p62 = _patterns.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$')
+        p63 = _patterns.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$')
+        p64 = _patterns.compile(r'^\s*route-reflector-client$')
+        p65 = _patterns.compile(r'^\s*send-community$')
+        p66 = _patterns.compile(r'^\s*send-community +extended$')
+        p100 = _patterns.compile(r'^\s*rewrite-evpn-rt-asn$')
+        p67 = _patterns.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
+        p68 = _patterns.compile(r'^\s*next-hop-self$')
+        p69 = _patterns.compile(r'^\s*as-override$')
+        p70 = _patterns.compile(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
+        p71 = _patterns.compile(r'^\s*soo +(?P<nbr_af_soo>.*)$')
+        p72 = _patterns.compile(r'^\s*template peer-session +(?P<ps_name>.*)$')
+        p73 = _patterns.compile(r'^\s*bfd$')
+        p74 = _patterns.compile(r'^\s*bfd$')
+        p75 = _patterns.compile(r'^\s*description +(?P<ps_description>.*)$')
+        p76 = _patterns.compile(r'^\s*disable-connected-check$')
+        p77 = _patterns.compile(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
+        p78 = _patterns.compile(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
+        p79 = _patterns.compile(r'^\s*password +(?P<ps_password_text>.*)$')
+        p80 = _patterns.compile(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
+        p81 = _patterns.compile(r'^\s*shutdown$')
+        p82 = _patterns.compile(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
+        p83 = _patterns.compile(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
+        p84 = _patterns.compile(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
+        p85 = _patterns.compile(r'^\s*template peer-policy +(?P<pp_name>.*)$')
+        p86 = _patterns.compile(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
+        p87 = _patterns.compile(r'^\s*as-override$')
+        p88 = _patterns.compile(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
+        p89 = _patterns.compile(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
+        p90 = _patterns.compile(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
+        p91 = _patterns.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
+        p92 = _patterns.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
+        p93 = _patterns.compile(r'^\s*next-hop-self$')
+        p94 = _patterns.compile(r'^\s*route-reflector-client$')
+        p95 = _patterns.compile(r'^\s*send-community$')
+        p96 = _patterns.compile(r'^\s*send-community +extended$')
+        p97 = _patterns.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
+        p98 = _patterns.compile(r'^\s*soo +(?P<pp_soo>.*)$')
+        peer_1 = _patterns.compile(r'template peer +(?P<peer_name>\S+)')
         # Init vars
         bgp_dict = {}
         bgp_id = ''
@@ -7447,37 +7469,37 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         sub_dict = {}
         history_paths = None
         dampened_paths = None
-        p1 = re.compile(r'^Flap +Statistics +for +VRF +'
-                            '(?P<vrf_name>[\w\-]+), +address +family +'
-                            '(?P<address_family>[\w\s\-]+):$')
-        p2 = re.compile(r'^Dampening +configured, +'
-                            '(?P<history_paths>\d+) +history +paths, +'
-                            '(?P<dampened_paths>\d+) +dampened +paths$')
-        p2_1 = re.compile(r'^Dampening +not +configured, +'
-                            '(?P<history_paths>\d+) +history +paths, +'
-                            '(?P<dampened_paths>\d+) +dampened +paths$')
-        p3 = re.compile(r'^Route +Distinguisher: +'
-                            '(?P<route_identifier>[\w\.\:]+)$')
-        p4 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            '(?P<best>[\>|\s])?'
-                            '(?P<pathtype>[e|i])?'
-                            ' +(?P<network>\S+)'
-                            ' +(?P<peer>[\w\/\.\:]+)'
-                            ' +(?P<flaps>\d+)'
-                            ' +(?P<duration>[\w\:\.]+)'
-                            '(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            ' +(?P<current_penalty>\d+)\/'
-                            '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
-        p4_1 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            '(?P<best>[\>|\s])?'
-                            '(?P<pathtype>[e|i|\s])?'
-                            ' +(?P<network>\S+\/\d{1,3})'
-                            '(?P<peer>[1|2][\d\.\:]+)'
-                            ' +(?P<flaps>\d+)'
-                            ' +(?P<duration>[\w\:\.]+)'
-                            '(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            ' +(?P<current_penalty>\d+)\/'
-                            '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
+        p1 = _patterns.compile(r'^Flap +Statistics +for +VRF +'
+                                   '(?P<vrf_name>[\w\-]+), +address +family +'
+                                   '(?P<address_family>[\w\s\-]+):$')
+        p2 = _patterns.compile(r'^Dampening +configured, +'
+                                   '(?P<history_paths>\d+) +history +paths, +'
+                                   '(?P<dampened_paths>\d+) +dampened +paths$')
+        p2_1 = _patterns.compile(r'^Dampening +not +configured, +'
+                                   '(?P<history_paths>\d+) +history +paths, +'
+                                   '(?P<dampened_paths>\d+) +dampened +paths$')
+        p3 = _patterns.compile(r'^Route +Distinguisher: +'
+                                   '(?P<route_identifier>[\w\.\:]+)$')
+        p4 = _patterns.compile(r'^(?P<status>[\*|d|s|h|\s])?'
+                                   '(?P<best>[\>|\s])?'
+                                   '(?P<pathtype>[e|i])?'
+                                   ' +(?P<network>\S+)'
+                                   ' +(?P<peer>[\w\/\.\:]+)'
+                                   ' +(?P<flaps>\d+)'
+                                   ' +(?P<duration>[\w\:\.]+)'
+                                   '(?: +(?P<reuse_time>[\w\:\.]+))?'
+                                   ' +(?P<current_penalty>\d+)\/'
+                                   '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
+        p4_1 = _patterns.compile(r'^(?P<status>[\*|d|s|h|\s])?'
+                                   '(?P<best>[\>|\s])?'
+                                   '(?P<pathtype>[e|i|\s])?'
+                                   ' +(?P<network>\S+\/\d{1,3})'
+                                   '(?P<peer>[1|2][\d\.\:]+)'
+                                   ' +(?P<flaps>\d+)'
+                                   ' +(?P<duration>[\w\:\.]+)'
+                                   '(?: +(?P<reuse_time>[\w\:\.]+))?'
+                                   ' +(?P<current_penalty>\d+)\/'
+                                   '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -7598,7 +7620,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -7840,7 +7862,7 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -8138,42 +8160,42 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         sub_dict = {}
         tem_peer = None
 
-        p1 = re.compile(r'^BGP +peer\-template +is +'
-                            '(?P<template>[\w\-]+)$')
-        p2 = re.compile(r'^Using +(?P<intf>[\w\-\/\.]+) +as'
-                            ' +update +source +for +this +peer$')
-        p3 = re.compile(r'^Peer +is +low\-memory +exempt$')
-        p4 = re.compile(r'^Disable +logging +neighbor +events$')
-        p5 = re.compile(r'^External +BGP +peer +might +be +up +to'
-                            ' +(?P<hops>\d+) +hops +away$')
-        p6 = re.compile(r'^Only +passive +connection +setup +allowed$')
-        p23 = re.compile(r'^Neighbor +local\-as +command +not +active$')
-        p7 = re.compile(r'^For +address +family: +(?P<af>[\w\s\-]+)$')
-        p8 = re.compile(r'^Condition\-map +(?P<con_map>[\w\-]+), +'
-                            'Advertise\-map +(?P<adv_map>[\w\-]+), +'
-                            'Status +(?P<status>[\w\-]+)$')
-        p25 = re.compile(r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$')
-        p9 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
-        p10 = re.compile(r'^Extended +community +attribute +sent +'
-                            'to +this +neighbor$')
-        p11 = re.compile(r'^Nexthop(?: +always)? +set +to +local +'
-                            'peering +address, +(?P<local_nexthop>[\w\.\:]+)$')
-        p12 = re.compile(r'^Third\-party +Nexthop +will +not +be +computed.$')
-        p13 = re.compile(r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$')
-        p14 = re.compile(r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$')
-        p15 = re.compile(r'^Weight: +(?P<weight>\d+)$')
-        p16 = re.compile(r'^Allow +my +ASN +(?P<asn>\d+) +times$')
-        p17 = re.compile(r'^ASN +override +is +(?P<status>\w+)$')
-        p24 = re.compile(r'^Peer +ASN +check +is +disabled$')
-        p18 = re.compile(r'^Inbound +(?P<type>[\w\-\s]+) +configured'
-                            ' +is +(?P<name>[\w\-]+)$')
-        p19 = re.compile(r'^Outbound +(?P<type>[\w\-\s]+) +configured'
-                            ' +is +(?P<name>[\w\-]+)$')
-        p20 = re.compile(r'^Default +information +originate(, +'
-                            'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$')
-        p21 = re.compile(r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$')
-        p22 = re.compile(r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$')
-        p22_1 = re.compile(r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$')
+        p1 = _patterns.compile(r'^BGP +peer\-template +is +'
+                                   '(?P<template>[\w\-]+)$')
+        p2 = _patterns.compile(r'^Using +(?P<intf>[\w\-\/\.]+) +as'
+                                   ' +update +source +for +this +peer$')
+        p3 = _patterns.compile(r'^Peer +is +low\-memory +exempt$')
+        p4 = _patterns.compile(r'^Disable +logging +neighbor +events$')
+        p5 = _patterns.compile(r'^External +BGP +peer +might +be +up +to'
+                                   ' +(?P<hops>\d+) +hops +away$')
+        p6 = _patterns.compile(r'^Only +passive +connection +setup +allowed$')
+        p23 = _patterns.compile(r'^Neighbor +local\-as +command +not +active$')
+        p7 = _patterns.compile(r'^For +address +family: +(?P<af>[\w\s\-]+)$')
+        p8 = _patterns.compile(r'^Condition\-map +(?P<con_map>[\w\-]+), +'
+                                   'Advertise\-map +(?P<adv_map>[\w\-]+), +'
+                                   'Status +(?P<status>[\w\-]+)$')
+        p25 = _patterns.compile(r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$')
+        p9 = _patterns.compile(r'^Community +attribute +sent +to +this +neighbor$')
+        p10 = _patterns.compile(r'^Extended +community +attribute +sent +'
+                                   'to +this +neighbor$')
+        p11 = _patterns.compile(r'^Nexthop(?: +always)? +set +to +local +'
+                                   'peering +address, +(?P<local_nexthop>[\w\.\:]+)$')
+        p12 = _patterns.compile(r'^Third\-party +Nexthop +will +not +be +computed.$')
+        p13 = _patterns.compile(r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$')
+        p14 = _patterns.compile(r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$')
+        p15 = _patterns.compile(r'^Weight: +(?P<weight>\d+)$')
+        p16 = _patterns.compile(r'^Allow +my +ASN +(?P<asn>\d+) +times$')
+        p17 = _patterns.compile(r'^ASN +override +is +(?P<status>\w+)$')
+        p24 = _patterns.compile(r'^Peer +ASN +check +is +disabled$')
+        p18 = _patterns.compile(r'^Inbound +(?P<type>[\w\-\s]+) +configured'
+                                   ' +is +(?P<name>[\w\-]+)$')
+        p19 = _patterns.compile(r'^Outbound +(?P<type>[\w\-\s]+) +configured'
+                                   ' +is +(?P<name>[\w\-]+)$')
+        p20 = _patterns.compile(r'^Default +information +originate(, +'
+                                   'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$')
+        p21 = _patterns.compile(r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$')
+        p22 = _patterns.compile(r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$')
+        p22_1 = _patterns.compile(r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8437,7 +8459,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -8828,27 +8850,27 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
 
         # extract vrf info if specified,
         # if not, vrf is default
-        m = re.compile(r'^show +bgp +vrf +(?P<vrf>\S+)').match(cmd)
+        m = _patterns.compile(r'^show +bgp +vrf +(?P<vrf>\S+)').match(cmd)
         if m:
             vrf = m.groupdict()['vrf']
             if vrf == 'all':
                 vrf = ''
         else:
             vrf = 'default'
-        p1 = re.compile(r'^Details +for +VRF +'
-                            '(?P<vrf>[\w\-]+)$')
-        p2 = re.compile(r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
-                            '(?P<handles>\d+)$')
-        p3 = re.compile(r'^BGP +policy +statistics +not +available$')
-        p4 = re.compile(r'^route\-map +(?P<name>\S+) +'
-                            '(?P<action>\w+) +(?P<seqnum>\d+)$')
-        p5 = re.compile(r'^(?P<command>[\w\s\-\>]+) +'
-                            'C: +(?P<compare_count>\d+) +'
-                            'M: +(?P<match_count>\d+)$')
-        p6 = re.compile(r'^Total +accept +count +for +policy: +'
-                            '(?P<total_accept_count>\d+)$')
-        p7 = re.compile(r'^Total +reject +count +for +policy: +'
-                            '(?P<total_reject_count>\d+)$')
+        p1 = _patterns.compile(r'^Details +for +VRF +'
+                                   '(?P<vrf>[\w\-]+)$')
+        p2 = _patterns.compile(r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
+                                   '(?P<handles>\d+)$')
+        p3 = _patterns.compile(r'^BGP +policy +statistics +not +available$')
+        p4 = _patterns.compile(r'^route\-map +(?P<name>\S+) +'
+                                   '(?P<action>\w+) +(?P<seqnum>\d+)$')
+        p5 = _patterns.compile(r'^(?P<command>[\w\s\-\>]+) +'
+                                   'C: +(?P<compare_count>\d+) +'
+                                   'M: +(?P<match_count>\d+)$')
+        p6 = _patterns.compile(r'^Total +accept +count +for +policy: +'
+                                   '(?P<total_accept_count>\d+)$')
+        p7 = _patterns.compile(r'^Total +reject +count +for +policy: +'
+                                   '(?P<total_reject_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8861,7 +8883,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
                 continue
 
             # No such neighbor
-            if re.compile(r'No +such +neighbor$').match(line):
+            if _patterns.compile(r'No +such +neighbor$').match(line):
                 nei_flag = False
 
             # Total count for redistribute rpm handles: 1
@@ -8967,7 +8989,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -9276,25 +9298,25 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                       'E': 'established',
                       'C': 'closing',
                       'S': 'shutdown'}
-        p1 = re.compile(r'^Total +peers +(?P<total>\d+), +'
-                            'established +peers +(?P<established>\d+)$')
-        p2 = re.compile(r'^ASN +(?P<asn>\d+)$')
-        p3 = re.compile(r'^VRF +(?P<vrf>\S+), +'
-                            'local +ASN +(?P<asn>\d+)$')
-        p4 = re.compile(r'^peers +(?P<peer>\d+), +'
-                            'established +peers +(?P<established>\d+), +'
-                            'local +router\-id +(?P<id>[\w\.\:]+)$')
-        p5 = re.compile(r'^(?P<nei>[\w\.\:]+) +'
-                            '(?P<asn>\d+) +'
-                            '(?P<dropped>\d+) +'
-                            '(?P<last_flap>[\w\.\:]+) *\|'
-                            '(?P<last_read>[\w\.\:]+) *\|'
-                            '(?P<last_write>[\w\.\:]+) +'
-                            '(?P<state>[a-zA-Z]) +'
-                            '(?P<local_port>\d+)\/'
-                            '(?P<remote_port>\d+) +'
-                            '(?P<notifications_sent>\d+)\/'
-                            '(?P<notifications_received>\d+)$')
+        p1 = _patterns.compile(r'^Total +peers +(?P<total>\d+), +'
+                                   'established +peers +(?P<established>\d+)$')
+        p2 = _patterns.compile(r'^ASN +(?P<asn>\d+)$')
+        p3 = _patterns.compile(r'^VRF +(?P<vrf>\S+), +'
+                                   'local +ASN +(?P<asn>\d+)$')
+        p4 = _patterns.compile(r'^peers +(?P<peer>\d+), +'
+                                   'established +peers +(?P<established>\d+), +'
+                                   'local +router\-id +(?P<id>[\w\.\:]+)$')
+        p5 = _patterns.compile(r'^(?P<nei>[\w\.\:]+) +'
+                                   '(?P<asn>\d+) +'
+                                   '(?P<dropped>\d+) +'
+                                   '(?P<last_flap>[\w\.\:]+) *\|'
+                                   '(?P<last_read>[\w\.\:]+) *\|'
+                                   '(?P<last_write>[\w\.\:]+) +'
+                                   '(?P<state>[a-zA-Z]) +'
+                                   '(?P<local_port>\d+)\/'
+                                   '(?P<remote_port>\d+) +'
+                                   '(?P<notifications_sent>\d+)\/'
+                                   '(?P<notifications_received>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -9402,7 +9424,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -9683,21 +9705,21 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
                          'r': 'redist',
                          'a': 'aggregate',
                          'I': 'injected'}
-        p1 = re.compile(r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
-                            'address +family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^BGP +table +version +is +(?P<ver>\d+), +'
-                            '(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$')
-        p4 = re.compile(r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
-                            '\(VRF +(?P<vrf>\S+)\)$')
-        p3 = re.compile(r'^(?P<status>s|S|x|d|h|\*)?'
-                            '(?P<best>\>)?'
-                            ' *(?P<type_code>i|e|c|l|a|r|I)'
-                            '(?P<prefix>[\w\/\.\:]+)?'
-                            ' +(?P<next_hop>[\w\/\.\:]+)'
-                            '(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
-                            '(?: +\((?P<vpn>(\S+))\))?$')
-        p3_1 = re.compile(r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
-                            '(?: +\((?P<vpn>(\S+))\))?$')
+        p1 = _patterns.compile(r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
+                                   'address +family +(?P<af>[\w\s]+)$')
+        p2 = _patterns.compile(r'^BGP +table +version +is +(?P<ver>\d+), +'
+                                   '(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$')
+        p4 = _patterns.compile(r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
+                                   '\(VRF +(?P<vrf>\S+)\)$')
+        p3 = _patterns.compile(r'^(?P<status>s|S|x|d|h|\*)?'
+                                   '(?P<best>\>)?'
+                                   ' *(?P<type_code>i|e|c|l|a|r|I)'
+                                   '(?P<prefix>[\w\/\.\:]+)?'
+                                   ' +(?P<next_hop>[\w\/\.\:]+)'
+                                   '(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
+                                   '(?: +\((?P<vpn>(\S+))\))?$')
+        p3_1 = _patterns.compile(r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
+                                   '(?: +\((?P<vpn>(\S+))\))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -9858,7 +9880,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
         # get xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
+            m = _patterns.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
             namespace = m.groupdict()['name']
         except Exception:
             return etree_dict
@@ -10163,23 +10185,23 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
         # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         # 172.16.205.8      4   200     130     139      155    0    0 02:05:01 0L2ROUTE Summary
 
-        p1 = re.compile(r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(
+        p1 = _patterns.compile(r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+                               ' +address +family +(?P<af_name>[\w\s]+)$')
+        p2 = _patterns.compile(
             r'^\s*BGP +router +identifier +(?P<vrf_router_id>[\d\.]+), +local +AS +number +(?P<vrf_local_as>[\d]+)$')
-        p3 = re.compile(r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
-                        ' +config +peers +(?P<configuredpeers>[\d]+),'
-                        ' +capable +peers +(?P<capablepeers>[\d]+)$')
-        p4 = re.compile(
+        p3 = _patterns.compile(r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
+                               ' +config +peers +(?P<configuredpeers>[\d]+),'
+                               ' +capable +peers +(?P<capablepeers>[\d]+)$')
+        p4 = _patterns.compile(
             r'^\s*(?P<totalnetworks>[\d]+) +network +entries +and +(?P<totalpaths>[\d]+) +paths +using'
             ' +(?P<memoryused>[\d]+) +bytes +of +memory$')
-        p5 = re.compile(r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
-                        ' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$')
+        p5 = _patterns.compile(r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
+                               ' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$')
 
-        p6 = re.compile(r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
-                        ' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$')
+        p6 = _patterns.compile(r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
+                               ' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$')
 
-        p7 = re.compile(
+        p7 = _patterns.compile(
             r'^\s*(?P<neighborid>[\d\.]+) +(?P<neighborversion>[\d]+) +(?P<neighboras>[\d]+) +(?P<msgrecvd>[\d]+)'
             ' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
             ' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+)$')
@@ -10380,32 +10402,32 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
         #     10.121.0.11          10.121.0.22          10.121.0.33          10.121.0.44
         #     10.196.0.11
 
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$')
-        p3 = re.compile(r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$')
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$')
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$')
-        p6 = re.compile(r'^\s*Multipath: +(?P<multipath>[\w]+)$')
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$')
-        p9 = re.compile(r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
-        p10 = re.compile(r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
-                         ' +\((?P<neighborid>[\d\.]+)\)$')
-        p11 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
-                         ' +weight +(?P<weight>[\d]+)$')
-        p12 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
-        p13 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
-        p14 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p15 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
-        p16 = re.compile(r'^\s*Received +label +(?P<inlabel>[\d]+)$')
+        p1 = _patterns.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+                               ' +address +family +(?P<af_name>[\w\s]+)$')
+        p2 = _patterns.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$')
+        p3 = _patterns.compile(r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$')
+        p4 = _patterns.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$')
+        p5 = _patterns.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$')
+        p6 = _patterns.compile(r'^\s*Multipath: +(?P<multipath>[\w]+)$')
+        p7 = _patterns.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
+        p8 = _patterns.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$')
+        p9 = _patterns.compile(r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
+        p10 = _patterns.compile(r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
+                                ' +\((?P<neighborid>[\d\.]+)\)$')
+        p11 = _patterns.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
+                                ' +weight +(?P<weight>[\d]+)$')
+        p12 = _patterns.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
+        p13 = _patterns.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
+        p14 = _patterns.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
+        p15 = _patterns.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
+        p16 = _patterns.compile(r'^\s*Received +label +(?P<inlabel>[\d]+)$')
 
         # PMSI Tunnel Attribute:
-        p17 = re.compile(r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$')
+        p17 = _patterns.compile(r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$')
         #         flags: 0x00, Tunnel type: Ingress Replication
-        p18 = re.compile(r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$')
+        p18 = _patterns.compile(r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$')
         #         Label: 10101, Tunnel Id: 10.196.7.7
-        p19 = re.compile(r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$')
+        p19 = _patterns.compile(r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$')
 
         for line in out.splitlines():
             if line:
@@ -10868,119 +10890,119 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
         # Foreign host: 172.16.205.8, Foreign port: 52715
         # fd = 84
 
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
-                        ' +Peer index +(?P<index>[\d]+)$')
-        p2 = re.compile(r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$')
-        p3 = re.compile(r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
-                        ' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$')
-        p4 = re.compile(r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$')
-        p5 = re.compile(r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$')
-        p6 = re.compile(r'^\s*TCP MD5 authentication is set \(enabled\)$')
-        p7 = re.compile(r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
-                            ' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$')
-        p8 = re.compile(r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$')
-        p9 = re.compile(r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
-                        ' +(?P<recvbufbytes>[\d]+)+ bytes in queue$')
-        p10 = re.compile(r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
-                          ' +(?P<notificationssent>[\d]+)'
-                          ' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
-                          '(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$')
-        p11 = re.compile(r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$')
-        p12 = re.compile(r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$')
-        p13 = re.compile(r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$')
-        p14 = re.compile(r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$')
-        p15 = re.compile(r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$')
-        p16 = re.compile(r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$')
-        p17 = re.compile(r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$')
-        p18 = re.compile(r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$')
-        p19 = re.compile(r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$')
-        p20 = re.compile(r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$')
-        p20_1 = re.compile(r'^\s*Graceful Restart Parameters:$')
-        p21 = re.compile(r'^\s*Address families advertised to peer:$')
-        p22 = re.compile(r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$')
-        p23 = re.compile(r'^\s*Address families received from peer:$')
-        p24_1 = re.compile(r'^\s*Forwarding state preserved by peer for:$')
-        p25 = re.compile(r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$')
-        p26 = re.compile(r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$')
-        p27 = re.compile(r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$')
-        p28 = re.compile(r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$')
-        p29 = re.compile(r'^\s*Receive IPv6 next hop encoding Capability for AF:$')
-        p30 = re.compile(r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$')
-        p31 = re.compile(r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$')
-        p32 = re.compile(r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$')
-        p33 = re.compile(r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$')
-        p34 = re.compile(r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$')
-        p35 = re.compile(r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$')
-        p36 = re.compile(r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$')
-        p38 = re.compile(r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$')
-        p39 = re.compile(r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$')
-        p40 = re.compile(r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$')
-        p41 = re.compile(r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$')
-        p42 = re.compile(r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$')
-        p43 = re.compile(r'^\s*Community attribute sent to this neighbor$')
-        p44 = re.compile(r'^\s*Extended community attribute sent to this neighbor$')
-        p46 = re.compile(r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$')
-        p47 = re.compile(r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$')
-        p48 = re.compile(r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
-                         ' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$')
-        p49 = re.compile(r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$')
-        p50 = re.compile(r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$')
-        p51 = re.compile(r'^\s*fd = +(?P<fd>[\d]+)$')
+        p1 = _patterns.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
+                               ' +Peer index +(?P<index>[\d]+)$')
+        p2 = _patterns.compile(r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$')
+        p3 = _patterns.compile(r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
+                               ' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$')
+        p4 = _patterns.compile(r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$')
+        p5 = _patterns.compile(r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$')
+        p6 = _patterns.compile(r'^\s*TCP MD5 authentication is set \(enabled\)$')
+        p7 = _patterns.compile(r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
+                                   ' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$')
+        p8 = _patterns.compile(r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$')
+        p9 = _patterns.compile(r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
+                               ' +(?P<recvbufbytes>[\d]+)+ bytes in queue$')
+        p10 = _patterns.compile(r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
+                                 ' +(?P<notificationssent>[\d]+)'
+                                 ' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
+                                 '(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$')
+        p11 = _patterns.compile(r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$')
+        p12 = _patterns.compile(r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$')
+        p13 = _patterns.compile(r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$')
+        p14 = _patterns.compile(r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$')
+        p15 = _patterns.compile(r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$')
+        p16 = _patterns.compile(r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$')
+        p17 = _patterns.compile(r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$')
+        p18 = _patterns.compile(r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$')
+        p19 = _patterns.compile(r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$')
+        p20 = _patterns.compile(r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$')
+        p20_1 = _patterns.compile(r'^\s*Graceful Restart Parameters:$')
+        p21 = _patterns.compile(r'^\s*Address families advertised to peer:$')
+        p22 = _patterns.compile(r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$')
+        p23 = _patterns.compile(r'^\s*Address families received from peer:$')
+        p24_1 = _patterns.compile(r'^\s*Forwarding state preserved by peer for:$')
+        p25 = _patterns.compile(r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$')
+        p26 = _patterns.compile(r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$')
+        p27 = _patterns.compile(r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$')
+        p28 = _patterns.compile(r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$')
+        p29 = _patterns.compile(r'^\s*Receive IPv6 next hop encoding Capability for AF:$')
+        p30 = _patterns.compile(r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$')
+        p31 = _patterns.compile(r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$')
+        p32 = _patterns.compile(r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$')
+        p33 = _patterns.compile(r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$')
+        p34 = _patterns.compile(r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$')
+        p35 = _patterns.compile(r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$')
+        p36 = _patterns.compile(r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$')
+        p38 = _patterns.compile(r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$')
+        p39 = _patterns.compile(r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$')
+        p40 = _patterns.compile(r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$')
+        p41 = _patterns.compile(r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$')
+        p42 = _patterns.compile(r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$')
+        p43 = _patterns.compile(r'^\s*Community attribute sent to this neighbor$')
+        p44 = _patterns.compile(r'^\s*Extended community attribute sent to this neighbor$')
+        p46 = _patterns.compile(r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$')
+        p47 = _patterns.compile(r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$')
+        p48 = _patterns.compile(r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
+                                ' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$')
+        p49 = _patterns.compile(r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$')
+        p50 = _patterns.compile(r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$')
+        p51 = _patterns.compile(r'^\s*fd = +(?P<fd>[\d]+)$')
 
         # Enhanced error processing: On
-        p52 = re.compile(r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$')
+        p52 = _patterns.compile(r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$')
 
         # 0 discarded attributes
-        p53 = re.compile(r'\s*(?P<discarded_attr>\d) +discarded +attributes$')
+        p53 = _patterns.compile(r'\s*(?P<discarded_attr>\d) +discarded +attributes$')
         
         # Last error length received: 0 
-        p54 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$')
+        p54 = _patterns.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$')
         
         # Reset error value sent: 0
-        p55 = re.compile(r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$')
+        p55 = _patterns.compile(r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$')
 
         # Reset error sent major: 0 minor: 0
-        p56 = re.compile(r'\s*Reset +error +sent +major\: '
+        p56 = _patterns.compile(r'\s*Reset +error +sent +major\: '
                         r'+(?P<reset_error_sent_major>\d+) +minor\: '
                         r'+(?P<reset_error_sent_minor>\d+)$')
         
         # Last error length received: 0
-        p57 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$')
+        p57 = _patterns.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$')
 
         # Reset error value received 0
-        p58 = re.compile(r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$')
+        p58 = _patterns.compile(r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$')
 
         # Reset error received major: 0 minor: 0
-        p59 = re.compile(r'\s*Reset error received major\: '
+        p59 = _patterns.compile(r'\s*Reset error received major\: '
                         r'+(?P<reset_error_received_major>\d+) +minor\:'
                         r' +(?P<reset_error_received_minor>\d+)$')
 
         # 10 accepted prefixes (10 paths), consuming 2360 bytes of memory
-        p60 = re.compile(r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
+        p60 = _patterns.compile(r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
                         r' +\(\d+ +paths\)\, +consuming '
                         r'+(?P<memory_consumed_in_bytes>\d+) +bytes +of +memory$')
 
         # 0 received prefixes treated as withdrawn
-        p61 = re.compile(r'\s*(?P<received_prefixes>\d+) +received '
+        p61 = _patterns.compile(r'\s*(?P<received_prefixes>\d+) +received '
                         r'+prefixes +treated +as +withdrawn$')
         
         # 40541 sent prefixes (40541 paths)
-        p62 = re.compile(r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$')
+        p62 = _patterns.compile(r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$')
 
         # Advertise GW IP is enabled
-        p63 = re.compile(r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$')
+        p63 = _patterns.compile(r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$')
 
         # Outbound route-map configured is GENIE_TEST, handle obtained
-        p64 = re.compile(r'\s*Outbound +route\-map +configured +is '
+        p64 = _patterns.compile(r'\s*Outbound +route\-map +configured +is '
                         r'+(?P<outbound_route_map>\w+)\, +handle +obtained$')
 
         # Last End-of-RIB received 00:00:11 after session start
         # Last End-of-RIB sent 00:00:06 after session start
-        p65 = re.compile(r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
+        p65 = _patterns.compile(r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
                         r'+(?P<time>[\w:]+) +after +session +start$')
 
         # First convergence 00:00:06 after session start with 18810 routes sent
-        p66 = re.compile(r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
+        p66 = _patterns.compile(r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
                         r'+after +session +start +with '
                         r'+(?P<convergence_routes_sent>\d+) +routes +sent$')
 
@@ -11466,8 +11488,8 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$')
-        p2 = re.compile(r'^Received label +(?P<received_label>[0-9]+).*$')
+        p1 = _patterns.compile(r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$')
+        p2 = _patterns.compile(r'^Received label +(?P<received_label>[0-9]+).*$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -11584,22 +11606,22 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
             out = output
         result_dict = {}
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
+        p1 = _patterns.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
                 ' +address +family +(?P<af>[\w\s]+)$')
 
         # BGP table version is 390, Local Router ID is 10.16.2.2
-        p2 = re.compile(r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
-                        ' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$')
+        p2 = _patterns.compile(r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
+                               ' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$')
 
         #    Network            Next Hop            Metric     LocPrf     Weight Path
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p3 = re.compile(r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
-                        '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p3 = _patterns.compile(r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
+                               '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
 
         # *>l[5][10.111.1.3][238.8.4.101]/64
-        p4 = re.compile(r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
-                            '(?P<typecode>(i|e|c|l|a|r|I)+)?'
-                            '(?P<prefix>[\w\]\/\:\.\]\[]+)$')
+        p4 = _patterns.compile(r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
+                                   '(?P<typecode>(i|e|c|l|a|r|I)+)?'
+                                   '(?P<prefix>[\w\]\/\:\.\]\[]+)$')
 
         #                       Next Hop            Metric     LocPrf     Weight Path
         #                       10.196.7.7                           100          0 i
@@ -11607,7 +11629,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
         #                       10.64.4.4                                        0 200 100 i
         #                       0.0.0.0                  0        100      32768 ?
         #                       10.64.4.4              219        0 10 3277 32768 36640 {27016} e
-        p6 = re.compile(
+        p6 = _patterns.compile(
             r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?(?P<typecode>('
             r'i|e|c|l|a|r|I)+)?\s+(?P<ipnexthop>[\d\.]+)?(?P<space1>\s+)?(?P<metric>['
             r'\d]+)?\s+(?P<localpref>[\d]+)\s+?(?P<weight>[\d]+)( +(?P<path>[0-9\{\}\s]+))? +(?P<origin>[i|e|c|l|a|I|?]+)$')
@@ -11821,64 +11843,64 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
         result_dict = {}
 
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
+        p1 = _patterns.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
+                               ' +address +family +(?P<af_name>[\w\s]+)$')
 
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
-                        '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p2 = _patterns.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
+                               '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
 
         # BGP routing table entry for [5][10.111.1.3][238.8.4.s101]/64, version 388
-        p3 = re.compile(
+        p3 = _patterns.compile(
             r'^\s*BGP +routing +table +entry +for +(?P<nonipprefix>[\d\[\]\:\.\/]+),'
             ' +version +(?P<prefixversion>[\d]+)$')
 
         # Paths: (1 available, best #1)
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
-                        ' +best +#(?P<bestpathnr>[\d]+)\)$')
+        p4 = _patterns.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
+                               ' +best +#(?P<bestpathnr>[\d]+)\)$')
 
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn, is not in HW
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
+        p5 = _patterns.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
             '(, +(?P<flags_attr>[\w\s\/\,]+))?$')
 
         #   Advertised path-id 1
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
+        p7 = _patterns.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
 
         # Path type: local, path is valid, is best path, no labeled nexthop
         # Path type: internal, path is invalid(rnh not resolved),
         #        not best reason: Neighbor Address, no labeled nexthop
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
-                        ' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$')
+        p8 = _patterns.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
+                               ' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$')
 
         #   AS-Path: NONE, path locally originated
-        p9 = re.compile(
+        p9 = _patterns.compile(
             r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?'
                 '(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
 
         #     0.0.0.0 (metric 0) from 0.0.0.0 (10.16.2.2)
         #     10.144.6.6 (inaccessible, metric 4294967295) from 10.64.4.4 (10.64.4.4)
-        p10 = re.compile(
+        p10 = _patterns.compile(
             r'^\s*(?P<ipnexthop>[\d\.]+) +\(((?P<nexthop_status>[\w]+), )?metric +(?P<nexthopmetric>[\d]+)\)'
             ' +from +(?P<neighbor>[\d\.]+)'
             ' +\((?P<neighborid>[\d\.]+)\)$')
 
         #       Origin IGP, MED not set, localpref 100, weight 32768
-        p11 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
-                         ' +localpref +(?P<localpref>[\d]+),'
-                         ' +weight +(?P<weight>[\d]+)$')
+        p11 = _patterns.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
+                                ' +localpref +(?P<localpref>[\d]+),'
+                                ' +weight +(?P<weight>[\d]+)$')
 
         #       Extcommunity: RT:100:10100
-        p12 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
+        p12 = _patterns.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
 
         # Originator: 10.144.6.6 Cluster list: 10.100.5.5 
-        p13 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
-                         ' +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
+        p13 = _patterns.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
+                                ' +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
 
         #   Path-id 1 advertised to peers:
         #     10.64.4.4            10.100.5.5        
-        p14 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p15 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
+        p14 = _patterns.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
+        p15 = _patterns.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
 
 
         for line in out.splitlines():
@@ -24,6 +24,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import LineDispatcher
+from genie.libs.parser.utils.counters import CounterLines, CounterParser
 
 
 # ===========================
@@ -146,15 +148,426 @@ class ShowInterfaceSchema(MetaParser):
             },
         }
 
+# Patterns of the lines of show interface, matched by ShowInterface.cli()
+# and parse_counters()
+_show_interface_lines = LineDispatcher()
+
+# Ethernet2/1.10 is down (Administratively down)
+# Vlan1 is down (Administratively down), line protocol is down, autostate enabled
+# Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
+# Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
+# Ethernet2/2 is up
+# Ethernet1/10 is down (Link not connected)
+# Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
+# Ethernet1/3 is down (XCVR not inserted)
+# Ethernet1/2 is down (SFP validation failed)
+# Ethernet1/4 is down (SFP not inserted)
+# Ethernet1/11 is down (inactive)
+# Ethernet1/12 is down (Transceiver validation failed)
+# Ethernet1/13 is down (SFP validation failed)
+# Ethernet1/13 is down (Channel admin down)
+_show_interface_lines.add(
+    'p1', r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up|'
+          r'inactive|Transceiver +validation +failed|'
+          r'SFP +validation +failed|Channel +admin +down))?'
+          r'(administratively\s+(?P<admin_1>(down)))?\s*'
+          r'(\(Administratively\s*(?P<admin_2>(down))\))?'
+          r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
+          r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
+          r'(,\s+autostate\s+(?P<autostate>\S+))?'
+          r'(\(No\s+operational\s+members\))?'
+          r'(\(Link\s+not\s+connected\))?'
+          r'(\(SFP\s+validation\s+failed\))?'
+          r'(\(SFP\s+not\s+inserted\))?'
+          r'(\(SFP\s+checksum\s+error\))?'
+          r'(\(suspended\(.*\)\))?'
+          r'(\(\S+ErrDisabled\))?'
+          r'(\(XCVR\s+not\s+inserted\))?'
+          r'(\(No\s+operational\s+members\))?'
+          r'(\(.*ACK.*\))?$',
+    contains='is')
+
+# admin state is up
+# admin state is up,
+# admin state is up, Dedicated Interface
+# admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
+_show_interface_lines.add(
+    'p2', r'^admin +state +is'
+          r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
+          r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
+          r'(?:, +\[parent +interface +is'
+          r' +(?P<parent_intf>(\S+))\])?$',
+    anchor='admin state is')
+
+# Dedicated Interface
+_show_interface_lines.add(
+    'p2_1', r'^Dedicated Interface$',
+    anchor='Dedicated Interface')
+
+# Belongs to Po1
+_show_interface_lines.add(
+    'p2_2', r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$',
+    anchor='Belongs to')
+
+# Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
+_show_interface_lines.add(
+    'p3', r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
+          r' *address: *(?P<mac_address>[a-z0-9\.]+)'
+          r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$',
+    anchor='Hardware:')
+
+# Description: desc
+_show_interface_lines.add(
+    'p4', r'^Description: *(?P<description>.*)$',
+    anchor='Description:')
+
+# Internet Address is 10.4.4.4/24 secondary tag 10
+_show_interface_lines.add(
+    'p5', r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
+          r'\/(?P<prefix_length>[0-9]+)'
+          r'(?: *(?P<secondary>(secondary)))?(?: *tag'
+          r' *(?P<route_tag>[0-9]+))?$',
+    anchor='Internet Address is')
+
+# MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
+# MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
+# MTU 1500 bytes, BW 1000000 Kbit
+# MTU 600 bytes, BW 10000000 Kbit , DLY 10 usec
+_show_interface_lines.add(
+    'p6', r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+          r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
+          r' *(?P<delay>[0-9]+) *usec)?,?$',
+    anchor='MTU')
+
+# MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
+_show_interface_lines.add(
+    'p6_1', r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+            r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
+            r' *([0-9]+) *Kbit, *DLY'
+            r' *(?P<delay>[0-9]+) *usec$',
+    anchor='MTU')
+
+# reliability 255/255, txload 1/255, rxload 1/255
+_show_interface_lines.add(
+    'p7', r'^reliability *(?P<reliability>[0-9\/]+),'
+          r' *txload *(?P<txload>[0-9\/]+),'
+          r' *rxload *(?P<rxload>[0-9\/]+)$',
+    anchor='reliability')
+
+# Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
+# Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+# Encapsulation ARPA, medium is broadcast
+_show_interface_lines.add(
+    'p8', r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+          r' *medium *is *(?P<medium>[a-zA-Z]+)$',
+    anchor='Encapsulation')
+
+_show_interface_lines.add(
+    'p8_1', r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+            r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
+            r' *medium *is *(?P<medium>[a-z0-9]+)$',
+    anchor='Encapsulation')
+
+# Encapsulation ARPA, loopback not set
+_show_interface_lines.add(
+    'p8_2', r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+            r' *([\w\s]+)$',
+    anchor='Encapsulation')
+
+# Port mode is routed
+_show_interface_lines.add(
+    'p9', r'^Port *mode *is *(?P<port_mode>[a-z]+)$',
+    anchor='Port mode is')
+
+# auto-duplex, auto-speed
+_show_interface_lines.add(
+    'p10_1', r'^auto-duplex, +auto-speed$',
+    anchor='auto-duplex, auto-speed')
+
+# full-duplex, 1000 Mb/s
+# auto-duplex, auto-speed
+# full-duplex, 1000 Mb/s, media type is 1G
+# auto-duplex, auto-speed, media type is 10G
+_show_interface_lines.add(
+    'p10', r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
+           r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$',
+    contains='-duplex')
+
+# Beacon is turned off
+_show_interface_lines.add(
+    'p11', r'^Beacon *is *turned *(?P<beacon>[a-z]+)$',
+    anchor='Beacon is turned')
+
+# Auto-Negotiation is turned off
+_show_interface_lines.add(
+    'p12', r'^Auto-Negotiation *is *turned'
+           r' *(?P<auto_negotiate>(off))$',
+    anchor='Auto-Negotiation is turned')
+
+# Auto-Negotiation is turned on
+_show_interface_lines.add(
+    'p12_1', r'^Auto-Negotiation *is *turned'
+             r' *(?P<auto_negotiate>(on))$',
+    anchor='Auto-Negotiation is turned')
+
+# Input flow-control is off, output flow-control is off
+_show_interface_lines.add(
+    'p13', r'^Input *flow-control *is *(?P<receive>(off)+),'
+           r' *output *flow-control *is *(?P<send>(off)+)$',
+    anchor='Input flow-control is')
+
+# Input flow-control is off, output flow-control is on
+_show_interface_lines.add(
+    'p13_1', r'^Input *flow-control *is *(?P<receive>(on)+),'
+             r' *output *flow-control *is *(?P<send>(on)+)$',
+    anchor='Input flow-control is')
+
+# Auto-mdix is turned off
+_show_interface_lines.add(
+    'p14', r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$',
+    anchor='Auto-mdix is turned')
+
+# Switchport monitor is off
+_show_interface_lines.add(
+    'p15', r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$',
+    anchor='Switchport monitor is')
+
+# EtherType is 0x8100
+_show_interface_lines.add(
+    'p16', r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$',
+    anchor='EtherType is')
+
+# Members in this channel: Eth1/15, Eth1/16
+# Members in this channel: Eth1/28
+_show_interface_lines.add(
+    'p38', r'^Members +in +this +channel *: *'
+           r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$',
+    anchor='Members in this channel')
+
+# EEE (efficient-ethernet) : n/a
+_show_interface_lines.add(
+    'p17', r'^EEE *\(efficient-ethernet\) *:'
+           r' *(?P<efficient_ethernet>[A-Za-z\/]+)$',
+    anchor='EEE (efficient-ethernet)')
+
+# Last link flapped 00:07:28
+# Last link flapped 15week(s) 5day(s)
+_show_interface_lines.add(
+    'p18', r'^Last *link *flapped'
+           r' *(?P<last_link_flapped>[\S ]+)$',
+    anchor='Last link flapped')
+
+# Last clearing of "show interface" counters never
+_show_interface_lines.add(
+    'p19', r'^Last *clearing *of *\"show *interface\"'
+           r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
+    anchor='Last clearing of')
+
+# Last clearing of "" counters 00:15:42
+_show_interface_lines.add(
+    'p19_1', r'^Last *clearing *of *\" *\"'
+             r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
+    anchor='Last clearing of')
+
+# 1 interface resets
+_show_interface_lines.add(
+    'p20', r'^(?P<interface_reset>[0-9]+) *interface'
+           r' *resets$',
+    anchor='0 interface resets')
+
+# 1 minute input rate 0 bits/sec, 0 packets/sec
+_show_interface_lines.add(
+    'p21', r'^(?P<load_interval>[0-9\#]+)'
+           r' *(minute|second|minutes|seconds) *input *rate'
+           r' *(?P<in_rate>[0-9]+) *bits/sec,'
+           r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
+    contains='rate')
+
+# 1 minute output rate 24 bits/sec, 0 packets/sec
+_show_interface_lines.add(
+    'p22', r'^(?P<load_interval>[0-9\#]+)'
+           r' *(minute|second|minutes|seconds) *output'
+           r' *rate *(?P<out_rate>[0-9]+)'
+           r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
+           r' *packets/sec$',
+    contains='rate')
+
+# input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
+_show_interface_lines.add(
+    'p23', r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
+           r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
+           r' *(?P<out_rate_bps>[0-9]+) *bps,'
+           r' *(?P<out_rate_pps>[0-9]+) *pps$',
+    anchor='input rate')
+
+# RX
+# Rx
+_show_interface_lines.add('p23_1', r'^(?P<rx>(RX|Rx))$', anchor=('RX', 'Rx'))
+
+# 0 unicast packets  0 multicast packets  0 broadcast packets
+# (received under RX, sent under TX, by p32 otherwise)
+_show_interface_lines.add(
+    'p24', r'^(?P<unicast_pkts>[0-9]+) +unicast +packets'
+           r' +(?P<multicast_pkts>[0-9]+) +multicast +packets'
+           r' +(?P<broadcast_pkts>[0-9]+) +broadcast +packets$',
+    anchor='0 unicast packets')
+
+# 0 input packets  0 bytes
+# 607382344 input packets 445986207 unicast packets 132485585 multicast packets
+_show_interface_lines.add(
+    'p25', r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
+           r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
+           r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$',
+    anchor='0 input packets')
+
+# 28910552 broadcast packets 63295517997 bytes
+_show_interface_lines.add(
+    'p39', r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$',
+    anchor='0 broadcast packets')
+
+# 0 jumbo packets  0 storm suppression packets
+_show_interface_lines.add(
+    'p26', r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
+           r' *(?P<in_storm_suppression_packets>[0-9]+)'
+           r' *storm *suppression *packets$',
+    anchor='0 jumbo packets')
+
+# 0 runts  0 giants  0 CRC/FCS  0 no buffer
+# 0 runts  0 giants  0 CRC  0 no buffer
+_show_interface_lines.add(
+    'p27', r'^(?P<in_runts>[0-9]+) *runts'
+           r' *(?P<in_oversize_frame>[0-9]+) *giants'
+           r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
+           r' *(?P<in_no_buffer>[0-9]+) *no *buffer$',
+    anchor='0 runts')
+
+# 0 input error  0 short frame  0 overrun   0 underrun  0 ignored
+_show_interface_lines.add(
+    'p28', r'^(?P<in_errors>[0-9]+) *input *error'
+           r' *(?P<in_short_frame>[0-9]+) *short *frame'
+           r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
+           r' *underrun *(?P<in_ignored>[0-9]+) *ignored$',
+    anchor='0 input error')
+
+# 0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
+_show_interface_lines.add(
+    'p29', r'^(?P<in_watchdog>[0-9]+) *watchdog'
+           r' *(?P<in_bad_etype_drop>[0-9]+)'
+           r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
+           r' *bad *proto'
+           r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$',
+    anchor='0 watchdog')
+
+# 0 input with dribble  0 input discard
+_show_interface_lines.add(
+    'p30', r'^(?P<in_with_dribble>[0-9]+) *input *with'
+           r' *dribble *(?P<in_discard>[0-9]+) *input *discard$',
+    anchor='0 input with dribble')
+
+# 0 Rx pause
+_show_interface_lines.add(
+    'p31', r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$',
+    anchor='0 Rx pause')
+
+# TX
+_show_interface_lines.add('p31_1', r'^(?P<tx>(TX|Tx))$', anchor=('TX', 'Tx'))
+
+# 0 unicast packets  0 multicast packets  0 broadcast packets
+_show_interface_lines.add(
+    'p32', r'^(?P<unicast_pkts>[0-9]+) *unicast *packets'
+           r' *(?P<multicast_pkts>[0-9]+) *multicast *packets'
+           r' *(?P<broadcast_pkts>[0-9]+) *broadcast *packets$',
+    anchor='0 unicast packets')
+
+# 0 output packets  0 bytes
+_show_interface_lines.add(
+    'p33', r'^(?P<out_pkts>[0-9]+) *output *packets'
+           r' *(?P<out_octets>[0-9]+) *bytes$',
+    anchor='0 output packets')
+
+# 0 jumbo packets
+_show_interface_lines.add(
+    'p34', r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$',
+    anchor='0 jumbo packets')
+
+# 0 output error  0 collision  0 deferred  0 late collision
+_show_interface_lines.add(
+    'p35', r'^(?P<out_errors>[0-9]+) *output *error'
+           r' *(?P<out_collision>[0-9]+) *collision'
+           r' *(?P<out_deferred>[0-9]+) *deferred'
+           r' *(?P<out_late_collision>[0-9]+)'
+           r' *late *collision$',
+    anchor='0 output error')
+
+# 0 lost carrier  0 no carrier  0 babble  0 output discard
+_show_interface_lines.add(
+    'p36', r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
+           r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
+           r' *(?P<out_babble>[0-9]+) *babble'
+           r' *(?P<out_discard>[0-9]+) *output *discard$',
+    anchor='0 lost carrier')
+
+# 0 Tx pause
+_show_interface_lines.add(
+    'p37', r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$',
+    anchor='0 Tx pause')
+
+
+def _counters(*names):
+    '''{counter: group} of counters named as their group'''
+    return {name: name for name in names}
+
+
+# Counters of show interface, as stored by ShowInterface.cli()
+_show_interface_counters = CounterLines(
+    lines=_show_interface_lines, interface='p1',
+    counters={
+        'p21': _counters('load_interval', 'in_rate', 'in_rate_pkts'),
+        'p22': _counters('load_interval', 'out_rate', 'out_rate_pkts'),
+        'p23': _counters('in_rate_bps', 'in_rate_pps', 'out_rate_bps',
+                         'out_rate_pps'),
+        ('p24', 'rx'): {'in_unicast_pkts': 'unicast_pkts',
+                        'in_multicast_pkts': 'multicast_pkts',
+                        'in_broadcast_pkts': 'broadcast_pkts'},
+        ('p24', 'tx'): {'out_unicast_pkts': 'unicast_pkts',
+                        'out_multicast_pkts': 'multicast_pkts',
+                        'out_broadcast_pkts': 'broadcast_pkts'},
+        ('p32', 'tx'): {'out_unicast_pkts': 'unicast_pkts',
+                        'out_multicast_pkts': 'multicast_pkts',
+                        'out_broadcast_pkts': 'broadcast_pkts'},
+        'p25': _counters('in_pkts', 'in_octets', 'in_unicast_pkts',
+                         'in_multicast_pkts'),
+        'p39': _counters('in_broadcast_pkts', 'in_octets'),
+        'p26': _counters('in_jumbo_packets', 'in_storm_suppression_packets'),
+        'p27': _counters('in_runts', 'in_oversize_frame', 'in_crc_errors',
+                         'in_no_buffer'),
+        'p28': _counters('in_errors', 'in_short_frame', 'in_overrun',
+                         'in_underrun', 'in_ignored'),
+        'p29': _counters('in_watchdog', 'in_bad_etype_drop',
+                         'in_unknown_protos', 'in_if_down_drop'),
+        'p30': _counters('in_with_dribble', 'in_discard'),
+        'p31': _counters('in_mac_pause_frames'),
+        'p33': _counters('out_pkts', 'out_octets'),
+        'p34': _counters('out_jumbo_packets'),
+        'p35': _counters('out_errors', 'out_collision', 'out_deferred',
+                         'out_late_collision'),
+        'p36': _counters('out_lost_carrier', 'out_no_carrier', 'out_babble',
+                         'out_discard'),
+        'p37': _counters('out_mac_pause_frames'),
+    },
+    sections={'p23_1': 'rx', 'p31_1': 'tx'})
+
+
 # ===========================
 # Parser for 'show interface'
 # ===========================
 
 
-class ShowInterface(ShowInterfaceSchema):
+class ShowInterface(ShowInterfaceSchema, CounterParser):
     """Parser for show interface, show interface <interface>"""
 
     cli_command = ['show interface', 'show interface {interface}']
+    counter_lines = _show_interface_counters
     exclude = [
       'in_unicast_pkts',
       'out_unicast_pkts',
@@ -197,274 +610,6 @@ class ShowInterface(ShowInterfaceSchema):
         else:
             out = output
 
-        # Ethernet2/1.10 is down (Administratively down)
-        # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
-        # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
-        # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
-        # Ethernet2/2 is up
-        # Ethernet1/10 is down (Link not connected)
-        # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
-        # Ethernet1/3 is down (XCVR not inserted)
-        # Ethernet1/2 is down (SFP validation failed)
-        # Ethernet1/4 is down (SFP not inserted)
-        # Ethernet1/11 is down (inactive)
-        # Ethernet1/12 is down (Transceiver validation failed)
-        # Ethernet1/13 is down (SFP validation failed)
-        # Ethernet1/13 is down (Channel admin down)
-        p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up|'
-                        r'inactive|Transceiver +validation +failed|'
-                        r'SFP +validation +failed|Channel +admin +down))?'
-                        r'(administratively\s+(?P<admin_1>(down)))?\s*'
-                        r'(\(Administratively\s*(?P<admin_2>(down))\))?'
-                        r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
-                        r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
-                        r'(,\s+autostate\s+(?P<autostate>\S+))?'
-                        r'(\(No\s+operational\s+members\))?'
-                        r'(\(Link\s+not\s+connected\))?'
-                        r'(\(SFP\s+validation\s+failed\))?'
-                        r'(\(SFP\s+not\s+inserted\))?'
-                        r'(\(SFP\s+checksum\s+error\))?'
-                        r'(\(suspended\(.*\)\))?'
-                        r'(\(\S+ErrDisabled\))?'
-                        r'(\(XCVR\s+not\s+inserted\))?'
-                        r'(\(No\s+operational\s+members\))?'
-                        r'(\(.*ACK.*\))?$')
-
-        # admin state is up
-        # admin state is up,
-        # admin state is up, Dedicated Interface
-        # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-        p2 = re.compile(r'^admin +state +is'
-                        r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
-                        r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
-                        r'(?:, +\[parent +interface +is'
-                        r' +(?P<parent_intf>(\S+))\])?$')
-
-        # Dedicated Interface
-        p2_1 = re.compile(r'^Dedicated Interface$')
-
-        # Belongs to Po1
-        p2_2 = re.compile(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
-
-        # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-        p3 = re.compile(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
-                        r' *address: *(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
-
-        #Description: desc
-        p4 = re.compile(r'^Description: *(?P<description>.*)$')
-
-        #Internet Address is 10.4.4.4/24 secondary tag 10
-        p5 = re.compile(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+)'
-                        r'(?: *(?P<secondary>(secondary)))?(?: *tag'
-                        r' *(?P<route_tag>[0-9]+))?$')
-
-        # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
-        # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
-        # MTU 1500 bytes, BW 1000000 Kbit
-        # MTU 600 bytes, BW 10000000 Kbit , DLY 10 usec
-        p6 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                        r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
-                        r' *(?P<delay>[0-9]+) *usec)?,?$')
-
-        # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-        p6_1 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                          r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
-                          r' *([0-9]+) *Kbit, *DLY'
-                          r' *(?P<delay>[0-9]+) *usec$')
-
-        # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability *(?P<reliability>[0-9\/]+),'
-                        r' *txload *(?P<txload>[0-9\/]+),'
-                        r' *rxload *(?P<rxload>[0-9\/]+)$')
-
-        #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
-        #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
-        #Encapsulation ARPA, medium is broadcast
-        p8 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                        r' *medium *is *(?P<medium>[a-zA-Z]+)$')
-
-        p8_1 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
-                          r' *medium *is *(?P<medium>[a-z0-9]+)$')
-
-        # Encapsulation ARPA, loopback not set
-        p8_2 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *([\w\s]+)$')
-
-        #Port mode is routed
-        p9 = re.compile(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
-
-        # auto-duplex, auto-speed
-        p10_1 = re.compile(r'^auto-duplex, +auto-speed$')
-
-        #full-duplex, 1000 Mb/s
-        # auto-duplex, auto-speed
-        # full-duplex, 1000 Mb/s, media type is 1G
-        # auto-duplex, auto-speed, media type is 10G
-        p10 = re.compile(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
-                         r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
-
-        #Beacon is turned off
-        p11 = re.compile(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
-
-        #Auto-Negotiation is turned off
-        p12 = re.compile(r'^Auto-Negotiation *is *turned'
-                         r' *(?P<auto_negotiate>(off))$')
-
-        #Auto-Negotiation is turned on
-        p12_1 = re.compile(r'^Auto-Negotiation *is *turned'
-                           r' *(?P<auto_negotiate>(on))$')
-
-        #Input flow-control is off, output flow-control is off
-        p13 = re.compile(r'^Input *flow-control *is *(?P<receive>(off)+),'
-                         r' *output *flow-control *is *(?P<send>(off)+)$')
-
-        #Input flow-control is off, output flow-control is on
-        p13_1 = re.compile(r'^Input *flow-control *is *(?P<receive>(on)+),'
-                           r' *output *flow-control *is *(?P<send>(on)+)$')
-
-        #Auto-mdix is turned off
-        p14 = re.compile(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
-
-        #Switchport monitor is off
-        p15 = re.compile(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
-
-        #EtherType is 0x8100
-        p16 = re.compile(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
-
-        # Members in this channel: Eth1/15, Eth1/16
-        # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
-
-        #EEE (efficient-ethernet) : n/a
-        p17 = re.compile(r'^EEE *\(efficient-ethernet\) *:'
-                         r' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
-
-        #Last link flapped 00:07:28
-        #Last link flapped 15week(s) 5day(s)
-        p18 = re.compile(r'^Last *link *flapped'
-                         r' *(?P<last_link_flapped>[\S ]+)$')
-
-        # Last clearing of "show interface" counters never
-        p19 = re.compile(r'^Last *clearing *of *\"show *interface\"'
-                         r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-
-        # Last clearing of "" counters 00:15:42
-        p19_1 = re.compile(r'^Last *clearing *of *\" *\"'
-                           r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-
-        #1 interface resets
-        p20 = re.compile(r'^(?P<interface_reset>[0-9]+) *interface'
-                         r' *resets$')
-
-        # 1 minute input rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *input *rate'
-                         r' *(?P<in_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-
-        #1 minute output rate 24 bits/sec, 0 packets/sec
-        p22 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *output'
-                         r' *rate *(?P<out_rate>[0-9]+)'
-                         r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
-                         r' *packets/sec$')
-
-        #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-        p23 = re.compile(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
-                         r' *(?P<out_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<out_rate_pps>[0-9]+) *pps$')
-
-        # RX
-        # Rx
-        p23_1 = re.compile(r'^(?P<rx>(RX|Rx))$')
-
-        #0 unicast packets  0 multicast packets  0 broadcast packets
-        p24 = re.compile(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
-                         r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
-                         r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
-
-        # 0 input packets  0 bytes
-        # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-        p25 = re.compile(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
-                         r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
-                         r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
-
-        #0 jumbo packets  0 storm suppression packets
-        p26 = re.compile(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
-                         r' *(?P<in_storm_suppression_packets>[0-9]+)'
-                         r' *storm *suppression *packets$')
-
-        #0 runts  0 giants  0 CRC/FCS  0 no buffer
-        #0 runts  0 giants  0 CRC  0 no buffer
-        p27 = re.compile(r'^(?P<in_runts>[0-9]+) *runts'
-                         r' *(?P<in_oversize_frame>[0-9]+) *giants'
-                         r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
-                         r' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
-
-        #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-        p28 = re.compile(r'^(?P<in_errors>[0-9]+) *input *error'
-                         r' *(?P<in_short_frame>[0-9]+) *short *frame'
-                         r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
-                         r' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
-
-        #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-        p29 = re.compile(r'^(?P<in_watchdog>[0-9]+) *watchdog'
-                         r' *(?P<in_bad_etype_drop>[0-9]+)'
-                         r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
-                         r' *bad *proto'
-                         r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
-
-        # 0 input with dribble  0 input discard
-        p30 = re.compile(r'^(?P<in_with_dribble>[0-9]+) *input *with'
-                         r' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
-
-        # 0 Rx pause
-        p31 = re.compile(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
-
-        # TX
-        p31_1 = re.compile(r'^(?P<tx>(TX|Tx))$')
-
-        #0 unicast packets  0 multicast packets  0 broadcast packets
-        p32 = re.compile(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
-                         r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
-                         r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
-
-        #0 output packets  0 bytes
-        p33 = re.compile(r'^(?P<out_pkts>[0-9]+) *output *packets'
-                         r' *(?P<out_octets>[0-9]+) *bytes$')
-
-        #0 jumbo packets
-        p34 = re.compile(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
-
-        #0 output error  0 collision  0 deferred  0 late collision
-        p35 = re.compile(r'^(?P<out_errors>[0-9]+) *output *error'
-                         r' *(?P<out_collision>[0-9]+) *collision'
-                         r' *(?P<out_deferred>[0-9]+) *deferred'
-                         r' *(?P<out_late_collision>[0-9]+)'
-                         r' *late *collision$')
-
-        #0 lost carrier  0 no carrier  0 babble  0 output discard
-        p36 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
-                         r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
-                         r' *(?P<out_babble>[0-9]+) *babble'
-                         r' *(?P<out_discard>[0-9]+) *output *discard$')
-
-        #0 Tx pause
-        p37 = re.compile(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
-
-        # Members in this channel: Eth1/15, Eth1/16
-        # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
-
-        # 28910552 broadcast packets 63295517997 bytes
-        p39 = re.compile(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
-
         interface_dict = {}
 
         rx = False
@@ -472,6 +617,9 @@ class ShowInterface(ShowInterfaceSchema):
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.strip()
+            rule, m = _show_interface_lines.match(line)
+            if not m:
+                continue
 
             # Ethernet2/1.10 is down (Administratively down)
             # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
@@ -481,8 +629,7 @@ class ShowInterface(ShowInterfaceSchema):
             # Ethernet1/10 is down (Link not connected)
             # Ethernet1/3 is down (XCVR not inserted)
             # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
-            m = p1.match(line)
-            if m:
+            if rule == 'p1':
                 group = m.groupdict()
                 interface = group['interface']
 
@@ -518,8 +665,7 @@ class ShowInterface(ShowInterfaceSchema):
             # admin state is up,
             # admin state is up, Dedicated Interface
             # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-            m = p2.match(line)
-            if m:
+            if rule == 'p2':
                 # admin_state
                 admin_state = m.groupdict()['admin_state']
                 interface_dict[interface]['admin_state'] = admin_state
@@ -535,14 +681,12 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Dedicated Interface
-            m = p2_1.match(line)
-            if m:
+            if rule == 'p2_1':
                 interface_dict[interface]['dedicated_interface'] = True
                 continue
 
             # Belongs to Po1
-            m = p2_2.match(line)
-            if m:
+            if rule == 'p2_2':
                 port_channel_int = str(m.groupdict()['port_channel_int'])
                 if 'port_channel' not in interface_dict[interface]:
                     interface_dict[interface]['port_channel'] = {}
@@ -553,8 +697,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-            m = p3.match(line)
-            if m:
+            if rule == 'p3':
                 types = m.groupdict()['types']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -567,16 +710,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Description: desc
-            m = p4.match(line)
-            if m:
+            if rule == 'p4':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             #Internet Address is 10.4.4.4/24 secondary tag 10
-            m = p5.match(line)
-            if m:
+            if rule == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = str(m.groupdict()['prefix_length'])
                 secondary = m.groupdict()['secondary']
@@ -604,8 +745,7 @@ class ShowInterface(ShowInterfaceSchema):
             # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
             # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
             # MTU 1500 bytes, BW 1000000 Kbit
-            m = p6.match(line)
-            if m:
+            if rule == 'p6':
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
                 if m.groupdict()['delay']:
@@ -616,8 +756,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-            m = p6_1.match(line)
-            if m:
+            if rule == 'p6_1':
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
 
@@ -627,8 +766,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
+            if rule == 'p7':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -641,8 +779,7 @@ class ShowInterface(ShowInterfaceSchema):
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
             #Encapsulation ARPA, medium is broadcast
-            m = p8.match(line)
-            if m:
+            if rule == 'p8':
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
                 medium = m.groupdict()['medium']
@@ -655,8 +792,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['medium'] = medium
                 continue
 
-            m = p8_1.match(line)
-            if m:
+            if rule == 'p8_1':
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
                 first_dot1q = str(m.groupdict()['first_dot1q'])
@@ -673,8 +809,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Encapsulation ARPA, loopback not set
-            m = p8_2.match(line)
-            if m:
+            if rule == 'p8_2':
                 encapsulation = m.groupdict()['encapsulation'].lower()
 
                 if 'encapsulations' not in interface_dict[interface]:
@@ -685,15 +820,13 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Port mode is routed
-            m = p9.match(line)
-            if m:
+            if rule == 'p9':
                 port_mode = m.groupdict()['port_mode']
                 interface_dict[interface]['port_mode'] = port_mode
                 continue
 
             # auto-duplex, auto-speed
-            m = p10_1.match(line)
-            if m:
+            if rule == 'p10_1':
                 # not caring for this line
                 continue
 
@@ -701,8 +834,7 @@ class ShowInterface(ShowInterfaceSchema):
             # auto-duplex, auto-speed
             # full-duplex, 1000 Mb/s, media type is 1G
             # auto-duplex, auto-speed, media type is 10G
-            m = p10.match(line)
-            if m:
+            if rule == 'p10':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed']
                 if m.groupdict()['media_type']:
@@ -715,29 +847,25 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Beacon is turned off
-            m = p11.match(line)
-            if m:
+            if rule == 'p11':
                 beacon = m.groupdict()['beacon']
                 interface_dict[interface]['beacon'] = beacon
                 continue
 
             #Auto-Negotiation is turned off
-            m = p12.match(line)
-            if m:
+            if rule == 'p12':
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = False
                 continue
 
             #Auto-Negotiation is turned on
-            m = p12_1.match(line)
-            if m:
+            if rule == 'p12_1':
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = True
                 continue
 
             #Input flow-control is off, output flow-control is off
-            m = p13.match(line)
-            if m:
+            if rule == 'p13':
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
 
@@ -748,8 +876,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['flow_control']['send'] = False
                 continue
             #Input flow-control is off, output flow-control is on
-            m = p13_1.match(line)
-            if m:
+            if rule == 'p13_1':
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
 
@@ -761,30 +888,26 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Auto-mdix is turned off
-            m = p14.match(line)
-            if m:
+            if rule == 'p14':
                 auto_mdix = m.groupdict()['auto_mdix']
                 interface_dict[interface]['auto_mdix'] = auto_mdix
                 continue
 
             #Switchport monitor is off
-            m = p15.match(line)
-            if m:
+            if rule == 'p15':
                 switchport_monitor = m.groupdict()['switchport_monitor']
                 interface_dict[interface]['switchport_monitor'] = switchport_monitor
                 continue
 
             #EtherType is 0x8100
-            m = p16.match(line)
-            if m:
+            if rule == 'p16':
                 ethertype = m.groupdict()['ethertype']
                 interface_dict[interface]['ethertype'] = ethertype
                 continue
 
             # Members in this channel: Eth1/15, Eth1/16
             # Members in this channel: Eth1/28
-            m = p38.match(line)
-            if m:
+            if rule == 'p38':
                 port_channel_member_intfs = m.groupdict()['port_channel_member_intfs']
                 if port_channel_member_intfs:
                     if 'port_channel' not in interface_dict[interface]:
@@ -797,42 +920,36 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #EEE (efficient-ethernet) : n/a
-            m = p17.match(line)
-            if m:
+            if rule == 'p17':
                 efficient_ethernet = m.groupdict()['efficient_ethernet']
                 interface_dict[interface]['efficient_ethernet'] = efficient_ethernet
                 continue
 
             #Last link flapped 00:07:28
-            m = p18.match(line)
-            if m:
+            if rule == 'p18':
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 interface_dict[interface]['last_link_flapped']\
                  = last_link_flapped
                 continue
 
             # Last clearing of "show interface" counters never
-            m = p19.match(line)
-            if m:
+            if rule == 'p19':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Last clearing of "" counters 00:15:42
-            m = p19_1.match(line)
-            if m:
+            if rule == 'p19_1':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             #1 interface resets
-            m = p20.match(line)
-            if m:
+            if rule == 'p20':
                 interface_reset = int(m.groupdict()['interface_reset'])
                 interface_dict[interface]['interface_reset'] = interface_reset
                 continue
 
             # 1 minute input rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
-            if m:
+            if rule == 'p21':
 
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -852,8 +969,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #1 minute output rate 24 bits/sec, 0 packets/sec
-            m = p22.match(line)
-            if m:
+            if rule == 'p22':
                 load_interval = int(m.groupdict()['load_interval'])
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
@@ -867,8 +983,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-            m = p23.match(line)
-            if m:
+            if rule == 'p23':
                 in_rate_bps = int(m.groupdict()['in_rate_bps'])
                 in_rate_pps = int(m.groupdict()['in_rate_pps'])
                 out_rate_bps = int(m.groupdict()['out_rate_bps'])
@@ -890,8 +1005,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             # RX
             # Rx
-            m = p23_1.match(line)
-            if m:
+            if rule == 'p23_1':
                 rx = m.groupdict()['rx']
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
@@ -901,11 +1015,10 @@ class ShowInterface(ShowInterfaceSchema):
 
             if rx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p24.match(line)
-                if m:
-                    in_unicast_pkts = int(m.groupdict()['in_unicast_pkts'])
-                    in_multicast_pkts = int(m.groupdict()['in_multicast_pkts'])
-                    in_broadcast_pkts = int(m.groupdict()['in_broadcast_pkts'])
+                if rule == 'p24':
+                    in_unicast_pkts = int(m.groupdict()['unicast_pkts'])
+                    in_multicast_pkts = int(m.groupdict()['multicast_pkts'])
+                    in_broadcast_pkts = int(m.groupdict()['broadcast_pkts'])
 
                     interface_dict[interface]['counters']['in_unicast_pkts'] = in_unicast_pkts
                     interface_dict[interface]['counters']['in_multicast_pkts'] = in_multicast_pkts
@@ -919,8 +1032,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             # 0 input packets  0 bytes
             # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-            m = p25.match(line)
-            if m:
+            if rule == 'p25':
                 group = m.groupdict()
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
@@ -934,8 +1046,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 28910552 broadcast packets 63295517997 bytes
-            m = p39.match(line)
-            if m:
+            if rule == 'p39':
                 in_octets = int(m.groupdict()['in_octets'])
                 interface_dict[interface]['counters']['in_octets'] = in_octets
 
@@ -943,8 +1054,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
 
             #0 jumbo packets  0 storm suppression packets
-            m = p26.match(line)
-            if m:
+            if rule == 'p26':
                 in_jumbo_packets = int(m.groupdict()['in_jumbo_packets'])
                 in_storm_suppression_packets = int(m.groupdict()['in_storm_suppression_packets'])
 
@@ -955,8 +1065,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             #0 runts  0 giants  0 CRC/FCS  0 no buffer
             #0 runts  0 giants  0 CRC  0 no buffer
-            m = p27.match(line)
-            if m:
+            if rule == 'p27':
 
                 interface_dict[interface]['counters']['in_runts'] = int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_oversize_frame'] = int(m.groupdict()['in_oversize_frame'])
@@ -965,8 +1074,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-            m = p28.match(line)
-            if m:
+            if rule == 'p28':
 
                 interface_dict[interface]['counters']['in_errors'] = int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_short_frame'] = int(m.groupdict()['in_short_frame'])
@@ -976,8 +1084,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-            m = p29.match(line)
-            if m:
+            if rule == 'p29':
 
                 interface_dict[interface]['counters']['in_watchdog'] = int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_bad_etype_drop'] = int(m.groupdict()['in_bad_etype_drop'])
@@ -986,8 +1093,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 input with dribble  0 input discard
-            m = p30.match(line)
-            if m:
+            if rule == 'p30':
                 in_with_dribble = int(m.groupdict()['in_with_dribble'])
                 in_discard = int(m.groupdict()['in_discard'])
 
@@ -996,16 +1102,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 Rx pause
-            m = p31.match(line)
-            if m:
+            if rule == 'p31':
                 in_mac_pause_frames = int(m.groupdict()['in_mac_pause_frames'])
 
                 interface_dict[interface]['counters']['in_mac_pause_frames'] = in_mac_pause_frames
                 continue
             # TX
             # Tx
-            m = p31_1.match(line)
-            if m:
+            if rule == 'p31_1':
                 rx = False
                 tx = m.groupdict()['tx']
                 if 'counters' not in interface_dict[interface]:
@@ -1015,16 +1119,15 @@ class ShowInterface(ShowInterfaceSchema):
 
             if tx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p32.match(line)
-                if m :
-                    interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['out_unicast_pkts'])
-                    interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
-                    interface_dict[interface]['counters']['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
+                # (also matched by p24)
+                if rule in ('p24', 'p32'):
+                    interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['unicast_pkts'])
+                    interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['multicast_pkts'])
+                    interface_dict[interface]['counters']['out_broadcast_pkts'] = int(m.groupdict()['broadcast_pkts'])
                     continue
 
             #0 output packets  0 bytes
-            m = p33.match(line)
-            if m:
+            if rule == 'p33':
                 out_pkts = int(m.groupdict()['out_pkts'])
                 out_octets = int(m.groupdict()['out_octets'])
 
@@ -1033,16 +1136,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 jumbo packets
-            m = p34.match(line)
-            if m:
+            if rule == 'p34':
                 out_jumbo_packets = int(m.groupdict()['out_jumbo_packets'])
 
                 interface_dict[interface]['counters']['out_jumbo_packets'] = out_jumbo_packets
                 continue
 
             #0 output error  0 collision  0 deferred  0 late collision
-            m = p35.match(line)
-            if m:
+            if rule == 'p35':
                 interface_dict[interface]['counters']['out_errors'] = int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_collision'] = int(m.groupdict()['out_collision'])
                 interface_dict[interface]['counters']['out_deferred'] = int(m.groupdict()['out_deferred'])
@@ -1050,8 +1151,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 lost carrier  0 no carrier  0 babble  0 output discard
-            m = p36.match(line)
-            if m:
+            if rule == 'p36':
 
                 interface_dict[interface]['counters']['out_lost_carrier'] = int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = int(m.groupdict()['out_no_carrier'])
@@ -1060,8 +1160,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 Tx pause
-            m = p37.match(line)
-            if m:
+            if rule == 'p37':
                 out_mac_pause_frames = int(m.groupdict()['out_mac_pause_frames'])
 
                 interface_dict[interface]['counters']['out_mac_pause_frames'] = out_mac_pause_frames
@@ -16,6 +16,7 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.nxos.show_vrf import  ShowVrf
+from genie.libs.parser.utils.cache import parse_cached
 
 # ===================================
 # Parser for 'show ip mroute vrf all'
@@ -844,8 +845,7 @@ class ShowForwardingDistributionMulticastRoute(ShowForwardingDistributionMultica
 
         if vrf:
             if vrf == 'all':
-                showparser = ShowVrf(device=self.device)
-                vrfs_list = showparser.parse()
+                vrfs_list = parse_cached(ShowVrf, self.device)
                 for vrf_name in vrfs_list['vrfs'].keys():
                     vrf_id = vrfs_list['vrfs'][vrf_name]['vrf_id']
                     vrf_dict.update({vrf_id: vrf_name})
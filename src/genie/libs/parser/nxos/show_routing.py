@@ -51,6 +51,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternScanner
+from genie.libs.parser.utils.stream import RecordStream, StreamParser
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -527,6 +529,52 @@ class ShowIpRouteSchema(MetaParser):
     }
 
 
+# Lines of ShowIpRoute, scanned in a single pass
+_show_ip_route_lines = PatternScanner()
+
+# IP Route Table for VRF "default"
+# IP Route Table for Context "default"
+# IPv6 Routing Table for VRF "default"
+# IP Route Table for VRF "default"
+_show_ip_route_lines.add('p1', r'^\s*(?P<af>IPv6|IP) +Rout(?:e|ing) +Table +for (VRF|Context) +\"(?P<vrf>\S+)\"$')
+
+# 10.4.1.1/32, ubest/mbest: 2/0
+# 10.36.3.3/32, ubest/mbest: 2/0, attached
+# 10.121.0.0/24, ubest/mbest: 1/0 time, attached
+# 10.94.77.1/32, ubest/mbest: 1/0 time
+# 0.0.0.0/0, 1 ucast next-hops, 0 mcast next-hops
+# 0.1.3.255/32, 1 ucast next-hops, 0 mcast next-hops, attached
+# 2001:db8:5f1:1::1/128, ubest/mbest: 1/0, attached
+# 192.168.1.1/32, ubest/mbest: 1/0, pending ufdm
+_show_ip_route_lines.add('p2', r'^(?P<route>[\w\/\.\:]+), +(ubest/mbest: +'
+                                r'(?P<ubest_mbest>[\d\/]+)( +time)?)?((?P<ubest>\d+) '
+                                r'+ucast +next-hops, +(?P<mbest>\d+) +mcast +next-hops)?'
+                                r'(, +(?P<attached>[\w]+))?( +(?P<attached2>[\w]+))?$')
+
+# *via 10.2.3.2, Eth1/4, [1/0], 01:01:30, static
+# *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra
+# *via 10.229.11.11, [200/0], 01:01:12, bgp-100, internal, tag 100
+# *via 2001:db8:5f1:1::1, Eth1/27, [0/0], 05:56:03, local
+# *via ::ffff:10.229.11.11%default:IPv4, [200/0], 01:01:43, bgp-100, internal,
+# *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra, tag 100,
+# via 10.4.1.1, [200/0], 1w4d, bgp-65000, internal, tag 65000 (hidden)
+# via 10.23.120.2, Eth1/1.120, [120/2], 1w4d, rip-1, rip
+# **via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
+# *via vrf default, Null0, [20/0], 18:11:28, bgp-333, external, tag 333
+# *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
+# *via 2001:db8:626b:2101::3/128, [200/7], 01:51:32, bgp-10001, internal, tag 20001
+_show_ip_route_lines.add('p3', r'^\s*(?P<star>[*]+)?via +(?P<next_hop>[\s\w\:\.\/\%]+),'
+                                r'( +(?P<interface>[\w\/\.]+))?,? +\[(?P<route_preference>[\d\/]+)\],'
+                                r' +(?P<date>[0-9][\w\:]+)?,?( +(?P<source_protocol>[\w\-]+))?,?'
+                                r'( +(?P<source_protocol_status>[\w-]+))?,?( +tag +(?P<tag>[\d]+))?,?'
+                                r'( +\((?P<hidden>hidden)\))?'
+                                r'\s*(?P<vpn>[a-zA-Z\(\)\-]+)?,?( +segid: +(?P<segid>\d+))?,?'
+                                r'( +tunnelid: +(?P<tunnelid>[0-9x]+))?,?( +encap: +(?P<encap>[a-zA-Z0-9]+))?$')
+
+#    tag 100
+_show_ip_route_lines.add('p4', r'^tag +(?P<tag>\d+)$')
+
+
 # ====================================================
 # Parser for:
 # show ip route {route} {protocol} interface {interface} vrf {vrf}
@@ -547,7 +595,7 @@ class ShowIpRouteSchema(MetaParser):
 # show ip route vrf all
 # show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(ShowIpRouteSchema, StreamParser):
     """Parser for :
         'show ip route {route} {protocol} interface {interface} vrf {vrf}',
         'show ip route {route} {protocol} interface {interface}',
@@ -588,6 +636,12 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = [
         'updated']
 
+    # A route starts on its prefix and best paths, under its VRF
+    record_stream = RecordStream(
+        record=r'^\s*[\w\/\.\:]+, +(ubest/mbest: |\d+ +ucast +next-hops)',
+        context=[r'^\s*(IPv6|IP) +Rout(e|ing) +Table +for (VRF|Context) ']
+    )
+
     def cli(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
 
         # execute command to get output
@@ -681,60 +735,15 @@ class ShowIpRoute(ShowIpRouteSchema):
         af = 'ipv6' if 'v6' in cmd else 'ipv4'
         result_dict = {}
 
-        # IP Route Table for VRF "default"
-        # IP Route Table for Context "default"
-        # IPv6 Routing Table for VRF "default"
-        # IP Route Table for VRF "default"
-        p1 = re.compile(r'^\s*(?P<af>IPv6|IP) +Rout(?:e|ing) +Table +for (VRF|Context) +\"(?P<vrf>\S+)\"$')
-
-        # 10.4.1.1/32, ubest/mbest: 2/0
-        # 10.36.3.3/32, ubest/mbest: 2/0, attached
-        # 10.121.0.0/24, ubest/mbest: 1/0 time, attached
-        # 10.94.77.1/32, ubest/mbest: 1/0 time
-        # 0.0.0.0/0, 1 ucast next-hops, 0 mcast next-hops
-        # 0.1.3.255/32, 1 ucast next-hops, 0 mcast next-hops, attached
-        # 2001:db8:5f1:1::1/128, ubest/mbest: 1/0, attached
-        # 192.168.1.1/32, ubest/mbest: 1/0, pending ufdm
-        p2 = re.compile(r'^(?P<route>[\w\/\.\:]+), +(ubest/mbest: +'
-                        r'(?P<ubest_mbest>[\d\/]+)( +time)?)?((?P<ubest>\d+) '
-                        r'+ucast +next-hops, +(?P<mbest>\d+) +mcast +next-hops)?'
-                        r'(, +(?P<attached>[\w]+))?( +(?P<attached2>[\w]+))?$')
-
-        # *via 10.2.3.2, Eth1/4, [1/0], 01:01:30, static
-        # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra
-        # *via 10.229.11.11, [200/0], 01:01:12, bgp-100, internal, tag 100
-        # *via 2001:db8:5f1:1::1, Eth1/27, [0/0], 05:56:03, local
-        # *via ::ffff:10.229.11.11%default:IPv4, [200/0], 01:01:43, bgp-100, internal,
-        # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra, tag 100,
-        # via 10.4.1.1, [200/0], 1w4d, bgp-65000, internal, tag 65000 (hidden)
-        # via 10.23.120.2, Eth1/1.120, [120/2], 1w4d, rip-1, rip
-        # **via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
-        # *via vrf default, Null0, [20/0], 18:11:28, bgp-333, external, tag 333
-        # *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
-        # *via 2001:db8:626b:2101::3/128, [200/7], 01:51:32, bgp-10001, internal, tag 20001
-        p3 = re.compile(r'^\s*(?P<star>[*]+)?via +(?P<next_hop>[\s\w\:\.\/\%]+),'
-                        r'( +(?P<interface>[\w\/\.]+))?,? +\[(?P<route_preference>[\d\/]+)\],'
-                        r' +(?P<date>[0-9][\w\:]+)?,?( +(?P<source_protocol>[\w\-]+))?,?'
-                        r'( +(?P<source_protocol_status>[\w-]+))?,?( +tag +(?P<tag>[\d]+))?,?'
-                        r'( +\((?P<hidden>hidden)\))?'
-                        r'\s*(?P<vpn>[a-zA-Z\(\)\-]+)?,?( +segid: +(?P<segid>\d+))?,?'
-                        r'( +tunnelid: +(?P<tunnelid>[0-9x]+))?,?( +encap: +(?P<encap>[a-zA-Z0-9]+))?$')
-
-        #    tag 100
-        p4 = re.compile(r'^tag +(?P<tag>\d+)$')
-
-        for line in out.splitlines():
-            line = line.strip()
+        for rule, group in _show_ip_route_lines.finditer(out):
 
             # IP Route Table for VRF "default"
             # IP Route Table for Context "default"
             # IPv6 Routing Table for VRF "default"
-            m = p1.match(line)
-            if m:
+            if rule == 'p1':
                 if 'vrf' not in result_dict:
                     vrfs_dict = result_dict.setdefault('vrf', {})
 
-                group = m.groupdict()
                 vrf = group['vrf']
                 af = 'ipv6' if 'v6' in group['af'] else 'ipv4'
 
@@ -750,26 +759,24 @@ class ShowIpRoute(ShowIpRouteSchema):
             # 0.1.3.255/32, 1 ucast next-hops, 0 mcast next-hops, attached
             # 2001:db8:5f1:1::1/128, ubest/mbest: 1/0, attached
             # 192.168.1.1/32, ubest/mbest: 1/0, pending ufdm
-            m = p2.match(line)
-            if m:
-                groups = m.groupdict()
-                route = groups['route']
+            if rule == 'p2':
+                route = group['route']
                 active = True
                 index = 1
 
-                if groups['ubest_mbest']:
-                    ubest_mbest = groups['ubest_mbest']
+                if group['ubest_mbest']:
+                    ubest_mbest = group['ubest_mbest']
 
                     if '/' in ubest_mbest:
                         ubest_mbest = ubest_mbest.split('/')
                         ubest = ubest_mbest[0]
                         mbest = ubest_mbest[1]
-                elif groups['ubest'] and groups['mbest']:
-                    ubest = groups['ubest']
-                    mbest = groups['mbest']
+                elif group['ubest'] and group['mbest']:
+                    ubest = group['ubest']
+                    mbest = group['mbest']
 
-                if groups['attached']:
-                    attached = True if 'attached' in groups['attached'] else False
+                if group['attached']:
+                    attached = True if 'attached' in group['attached'] else False
 
                 # if vrf:
                 if 'vrf' not in result_dict:
@@ -786,7 +793,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if mbest:
                     route_dict.update({'mbest': int(mbest)})
 
-                if groups['attached']:
+                if group['attached']:
                     route_dict.update({'attached': attached})
 
                 continue
@@ -801,17 +808,15 @@ class ShowIpRoute(ShowIpRouteSchema):
             # via 10.23.120.2, Eth1/1.120, [120/2], 1w4d, rip-1, rip
             # **via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
             # *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
-            m = p3.match(line)
-            if m:
-                groups = m.groupdict()
+            if rule == 'p3':
 
                 tag = process_id = source_protocol_status = interface = next_hop_vrf = next_hop_af = ""
-                star = m.groupdict()['star']
+                star = group['star']
                 cast = None
 
                 star_rp, non_star_rp, star_metrics, non_star_metrics = None, None, None, None
-                if groups['route_preference']:
-                    rp_val = groups['route_preference'].split('/')
+                if group['route_preference']:
+                    rp_val = group['route_preference'].split('/')
                     rp = int(rp_val[0])
                     metrics = int(rp_val[1])
                     if star:
@@ -825,8 +830,8 @@ class ShowIpRoute(ShowIpRouteSchema):
                         non_star_rp = rp
                         non_star_metrics = metrics
 
-                if groups['next_hop']:
-                    next_hop = groups['next_hop']
+                if group['next_hop']:
+                    next_hop = group['next_hop']
                     if '%' in next_hop:
                         next_hop_vrf = next_hop.split('%')[1]
                         next_hop = next_hop.split('%')[0]
@@ -834,26 +839,26 @@ class ShowIpRoute(ShowIpRouteSchema):
                             next_hop_af = next_hop_vrf.split(':')[1].lower()
                             next_hop_vrf = next_hop_vrf.split(':')[0]
 
-                if groups['interface']:
-                    interface = Common.convert_intf_name(groups['interface'])
+                if group['interface']:
+                    interface = Common.convert_intf_name(group['interface'])
 
-                if groups['date']:
-                    updated = groups['date']
+                if group['date']:
+                    updated = group['date']
 
-                if groups['source_protocol_status']:
-                    source_protocol_status = groups['source_protocol_status']
+                if group['source_protocol_status']:
+                    source_protocol_status = group['source_protocol_status']
 
-                if groups['source_protocol']:
-                    if '-' in groups['source_protocol']:
-                        source_protocol = groups['source_protocol'].split('-')[0]
-                        process_id = groups['source_protocol'].split('-')[1]
+                if group['source_protocol']:
+                    if '-' in group['source_protocol']:
+                        source_protocol = group['source_protocol'].split('-')[0]
+                        process_id = group['source_protocol'].split('-')[1]
                     else:
-                        source_protocol = groups['source_protocol']
+                        source_protocol = group['source_protocol']
 
-                if groups['tag']:
-                    tag = groups['tag']
+                if group['tag']:
+                    tag = group['tag']
 
-                hidden = True if groups.get('hidden') else False
+                hidden = True if group.get('hidden') else False
 
                 if hidden:
                     route_dict.update({'hidden': hidden})
@@ -920,19 +925,19 @@ class ShowIpRoute(ShowIpRouteSchema):
                     if non_star_rp is not None:
                         index_dict['route_preference'] = non_star_rp
 
-                    segid = groups['segid']
+                    segid = group['segid']
                     if segid:
                         index_dict['segid'] = int(segid)
 
-                    tunnelid = groups['tunnelid']
+                    tunnelid = group['tunnelid']
                     if tunnelid:
                         index_dict['tunnelid'] = tunnelid
 
-                    encap = groups['encap']
+                    encap = group['encap']
                     if encap:
                         index_dict['encap'] = encap.lower()
 
-                    vpn = groups['vpn']
+                    vpn = group['vpn']
                     if vpn and 'mpls-vpn' in vpn:
                         index_dict['mpls_vpn'] = True
                     elif vpn and 'mpls' in vpn:
@@ -946,11 +951,9 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #    tag 100
-            m = p4.match(line)
-            if m:
-                groups = m.groupdict()
-                if groups['tag']:
-                    route_dict.update({'tag': int(groups['tag'])})
+            if rule == 'p4':
+                if group['tag']:
+                    route_dict.update({'tag': int(group['tag'])})
 
         return result_dict
 
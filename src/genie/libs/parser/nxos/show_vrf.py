@@ -15,6 +15,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.cache import parse_cached
+from genie.libs.parser.utils.execute import execute_commands
 
 # =====================
 # Parser for 'show vrf'
@@ -298,14 +300,17 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
             vrf_list.append(vrf)
 
         else:
-            showVrf = ShowVrf(device=self.device)
-            vrfs = showVrf.parse()
+            vrfs = parse_cached(ShowVrf, self.device)
             for vrf in vrfs['vrfs'].keys():
                 vrf_list.append(vrf)
 
 
+        # Execute the command of every vrf in one batch
+        outputs = execute_commands(
+            self.device, [self.cli_command.format(vrf=vrf) for vrf in vrf_list])
+
         for vrf in vrf_list:
-            out = self.device.execute(self.cli_command.format(vrf=vrf))
+            out = outputs[self.cli_command.format(vrf=vrf)]
 
             for line in out.splitlines():
                 line = line.strip()
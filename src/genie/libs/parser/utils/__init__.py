@@ -1,3 +1,9 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parser_exclude, get_parser_commands, \
+                    get_parser_index, clear_parser_cache
 from . import entry_points
 
+from . import validation
+from . import async_parse
+
+validation.configure()
+async_parse.install()
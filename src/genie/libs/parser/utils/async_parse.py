@@ -0,0 +1,156 @@
+'''Asyncio entry point of the parsers
+
+    >>> parsed = await ShowVersion(device=device).aparse()
+
+aparse() returns what parse() returns, without blocking the event loop:
+
+    * The text parsing runs in an executor, the default one of the event
+      loop unless set with set_parse_executor().
+    * When the device has async execute() or get() methods, they are awaited
+      in the event loop. The cli() of the parser runs against a device
+      answering with the awaited results.
+
+The first call of the device stops the parse, before any output was read,
+and is awaited without holding an executor thread, so most parsers, which
+execute one command, wait on their device without a thread. The parse is
+then run again, once: the first call is answered with its awaited result,
+and every later call waits in the executor thread for its result, awaited
+in the event loop.
+
+Every parser therefore gains async support through its cli(output=...)
+code path, and is run at most twice whatever the number of commands it
+executes.
+'''
+
+# python
+import asyncio
+import functools
+
+from genie.metaparser import MetaParser
+
+from .execute import DeviceWrapper
+
+# Device methods awaited when they are coroutine functions
+ASYNC_METHODS = ('execute', 'get')
+
+# Executor parsing the outputs, None for the default one of the loop
+_executor = None
+
+
+def set_parse_executor(executor):
+    '''Set the executor in which aparse() parses the outputs
+
+    Args:
+        executor (`concurrent.futures.Executor`): executor, None for the
+                                                 default one of the loop
+    '''
+    global _executor
+    _executor = executor
+
+
+def get_parse_executor():
+    '''Return the executor in which aparse() parses the outputs'''
+    return _executor
+
+
+class _Unanswered(BaseException):
+    '''Stops the parse at the first call of the device. Not an Exception,
+    for the parsers not to catch it.'''
+
+    def __init__(self, key, method, args, kwargs):
+        super().__init__(key)
+        self.key = key
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+
+
+class _Raised(object):
+    '''Exception raised by the device, raised again in the parse'''
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+class _AnsweringDevice(DeviceWrapper):
+    '''Device answering the calls of the parser with the results awaited from
+    the async methods of device. Every other attribute is the one of the
+    device.
+
+    Until `loop` is set, a call not answered yet stops the parse. Once set,
+    it waits for the result of the call, awaited in loop.
+
+    Args:
+        device (`Device`): device with async methods
+        methods (`list`): names of the async methods
+    '''
+
+    def __init__(self, device, methods):
+        super().__init__(device)
+        # {(method, args, kwargs): result}
+        self.results = {}
+        # Event loop awaiting the calls not answered
+        self.loop = None
+        for method in methods:
+            setattr(self, method, functools.partial(self._call, method))
+
+    def _call(self, method, *args, **kwargs):
+        key = (method, args, tuple(sorted(kwargs.items())))
+        try:
+            result = self.results[key]
+        except TypeError:
+            key = repr(key)
+            result = self.results.get(key, self)
+        except KeyError:
+            result = self
+        if result is self:
+            if self.loop is None:
+                raise _Unanswered(key, method, args, kwargs)
+            return asyncio.run_coroutine_threadsafe(
+                getattr(self.device, method)(*args, **kwargs),
+                self.loop).result()
+        if isinstance(result, _Raised):
+            raise result.exception
+        return result
+
+
+async def aparse(self, **kwargs):
+    '''Coroutine returning parse(**kwargs) of the parser, awaiting the async
+    execute() or get() of its device
+
+    example:
+
+        >>> parsed = await asyncio.gather(*[
+        ...     ShowVersion(device=device).aparse() for device in devices])
+    '''
+    loop = asyncio.get_event_loop()
+    parse = functools.partial(self.parse, **kwargs)
+    device = self.device
+    methods = [method for method in ASYNC_METHODS
+                if asyncio.iscoroutinefunction(getattr(device, method, None))]
+    if kwargs.get('output') is not None or not methods:
+        return await loop.run_in_executor(_executor, parse)
+
+    answering = _AnsweringDevice(device, methods)
+    self.device = answering
+    try:
+        try:
+            return await loop.run_in_executor(_executor, parse)
+        except _Unanswered as unanswered:
+            call = getattr(device, unanswered.method)
+            try:
+                result = await call(*unanswered.args, **unanswered.kwargs)
+            except Exception as e:
+                result = _Raised(e)
+            answering.results[unanswered.key] = result
+
+        # The later calls wait for their result in the executor thread
+        answering.loop = loop
+        return await loop.run_in_executor(_executor, parse)
+    finally:
+        self.device = device
+
+
+def install():
+    '''Add aparse() to every parser'''
+    MetaParser.aparse = aparse
@@ -0,0 +1,247 @@
+'''Caches used to avoid repeating work across parser calls'''
+
+# python
+import copy
+import time
+import threading
+from collections import OrderedDict
+
+from .execute import unwrap_device
+
+PARSER_RESULT_TTL = 'pyats.libs.parser.result_ttl'
+
+# Seconds the results of parsers called by other parsers are kept, none
+# unless pyats.libs.parser.result_ttl is set: the device cannot tell when
+# its configuration changes
+DEFAULT_RESULT_TTL = 0
+
+# Attribute of the device holding its ParsedResultCache
+RESULT_CACHE_ATTR = 'parsed_results'
+
+
+def _result_ttl():
+    from .common import _get_config
+    ttl = _get_config(PARSER_RESULT_TTL)
+    return DEFAULT_RESULT_TTL if ttl is None else float(ttl)
+
+
+class LRUCache(object):
+    '''Bounded, thread-safe least recently used cache with hit/miss
+    statistics.
+
+    Args:
+        maxsize (`int`): maximum number of entries kept, the least recently
+                         used entry is dropped when full
+
+    example:
+
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.put('show version', 'ShowVersion')
+        >>> cache.get('show version')
+        'ShowVersion'
+        >>> cache.stats
+        {'hits': 1, 'misses': 0, 'size': 1, 'maxsize': 2}
+    '''
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        '''Return the cached value of key, or default when not cached'''
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        '''Cache value under key, evicting the least recently used entry if
+        the cache is full'''
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        '''Drop every entry, statistics are kept'''
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def stats(self):
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize}
+
+
+class ParsedResultCache(object):
+    '''Results of the parsers called on one device, kept for ttl seconds.
+
+    Parsers calling other parsers, such as ShowVrf for the list of VRFs, get
+    the same result for each call instead of executing and parsing the
+    command again. Each caller gets its own copy of the result.
+
+    Results are only kept when a ttl is set, through the
+    pyats.libs.parser.result_ttl setting. They are then not parsed again
+    after configuring the device within ttl seconds, unless dropped with
+    invalidate_parsed_results().
+
+    Args:
+        ttl (`float`): seconds a result is kept, 0 (default) keeps none
+
+    example:
+
+        >>> cache = ParsedResultCache(ttl=30)
+        >>> cache.parse(ShowVrf, device)
+        >>> cache.parse(ShowVrf, device)    # not executed again
+        >>> cache.invalidate(ShowVrf)
+    '''
+
+    def __init__(self, ttl=DEFAULT_RESULT_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # device.execute the results were obtained with
+        self.executor = None
+        # {key: (expiry, result)}
+        self._data = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(parser_cls, kwargs):
+        return (parser_cls, frozenset(kwargs.items()))
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self._data.pop(key, None)
+            self.misses += 1
+            return None
+
+    def _put(self, key, result):
+        if self.ttl > 0:
+            with self._lock:
+                self._data[key] = (time.monotonic() + self.ttl, result)
+
+    def parse(self, parser_cls, device, **kwargs):
+        '''Return parser_cls(device=device).parse(**kwargs), parsed again
+        only once the previous result expired'''
+        if self.ttl <= 0:
+            return parser_cls(device=device).parse(**kwargs)
+        try:
+            key = self._key(parser_cls, kwargs)
+        except TypeError:
+            return parser_cls(device=device).parse(**kwargs)
+        result = self._get(key)
+        if result is None:
+            result = parser_cls(device=device).parse(**kwargs)
+            self._put(key, result)
+        # Callers modifying their result must not modify the cached one
+        return copy.deepcopy(result)
+
+    def execute(self, device, command):
+        '''Return the output of command, executed again only once the
+        previous output expired'''
+        if self.ttl <= 0:
+            return device.execute(command)
+        key = self._key(None, {'command': command})
+        output = self._get(key)
+        if output is None:
+            output = device.execute(command)
+            self._put(key, output)
+        return output
+
+    def invalidate(self, parser_cls=None):
+        '''Drop the results of parser_cls, or every result and output'''
+        with self._lock:
+            if parser_cls is None:
+                self._data.clear()
+            else:
+                for key in [key for key in self._data
+                                                if key[0] is parser_cls]:
+                    del self._data[key]
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def stats(self):
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'ttl': self.ttl}
+
+
+def device_result_cache(device):
+    '''Return the ParsedResultCache of device, created on first use, or
+    None when results cannot be attached to the device'''
+    # Commands memoized or recorded for one parse are executed by the
+    # device itself
+    device = unwrap_device(device)
+    if device is None:
+        return None
+    cache = getattr(device, RESULT_CACHE_ATTR, None)
+    if not isinstance(cache, ParsedResultCache):
+        cache = ParsedResultCache(ttl=_result_ttl())
+        try:
+            setattr(device, RESULT_CACHE_ATTR, cache)
+        except AttributeError:
+            return None
+
+    # Results of another connection, or another execute, are outdated
+    execute = getattr(device, 'execute', None)
+    if cache.executor != execute:
+        cache.invalidate()
+        cache.executor = execute
+    return cache
+
+
+def parse_cached(parser_cls, device, **kwargs):
+    '''Return parser_cls(device=device).parse(**kwargs) through the result
+    cache of device
+
+    example:
+
+        >>> vrfs = parse_cached(ShowVrf, self.device)
+    '''
+    cache = device_result_cache(device)
+    if cache is None:
+        return parser_cls(device=device).parse(**kwargs)
+    return cache.parse(parser_cls, device, **kwargs)
+
+
+def execute_cached(device, command):
+    '''Return device.execute(command) through the result cache of device'''
+    cache = device_result_cache(device)
+    if cache is None:
+        return device.execute(command)
+    return cache.execute(device, command)
+
+
+def invalidate_parsed_results(device, parser_cls=None):
+    '''Drop the cached results of parser_cls on device, or all of them, for
+    instance after configuring the device'''
+    cache = device_result_cache(device)
+    if cache is not None:
+        cache.invalidate(parser_cls)
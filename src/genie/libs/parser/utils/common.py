@@ -9,6 +9,7 @@ import math
 import logging
 import warnings
 import importlib
+from types import MappingProxyType
 
 from genie.libs import parser
 from genie.abstract import Lookup
@@ -16,52 +17,86 @@ from genie.metaparser.util import merge_dict
 
 from pyats import configuration as cfg
 from .extension import ExtendParsers
+from .trie import CommandTrie
+from .cache import LRUCache
+from .interface_names import intf_names
+from .registry import ParserRegistry, LoadedParsers, load_index
 
 PYATS_EXT_PARSER = 'pyats.libs.external.parser'
+PYATS_EXT_PARSER_MANIFEST = 'pyats.libs.external.parser_manifest'
+PYATS_EXT_PARSER_STATIC = 'pyats.libs.external.parser_static'
 
 log = logging.getLogger(__name__)
 
+def _get_config(key):
+    '''get a setting from pyats configuration or its environment variable'''
+    return cfg.get(key, None) or \
+        os.environ.get(key.upper().replace('.', '_'))
+
 def _load_parser_json():
-    '''get all parser data in json file'''
+    '''get all parser data in json file, or in its precompiled index'''
     try:
         mod = importlib.import_module('genie.libs.parser')
         parsers = os.path.join(mod.__path__[0], 'parsers.json')
     except Exception:
         parsers = ''
-    if not os.path.isfile(parsers):
+
+    # Precompiled index is much faster to load than the full json
+    parser_data = load_index(os.path.splitext(parsers)[0] + '.marshal',
+                             json_path=parsers) if parsers else None
+
+    if parser_data is None and not os.path.isfile(parsers):
         log.warning('parsers.json does not exist, make sure you '
                     'are running with latest version of '
                     'genie.libs.parsers')
-        parser_data = {}
-    else:
+        return {}
+
+    if parser_data is None:
         # Open all the parsers in json file
         with open(parsers) as f:
             parser_data = json.load(f)
 
-        # check if provided external parser packages
-        ext_parser_package = cfg.get(PYATS_EXT_PARSER, None) or \
-            os.environ.get(PYATS_EXT_PARSER.upper().replace('.', '_'))
-        if ext_parser_package:
-            ext = ExtendParsers(ext_parser_package)
-            ext.extend()
+    # check if provided external parser packages
+    ext_parser_package = _get_config(PYATS_EXT_PARSER)
+    if ext_parser_package:
+        # Parsers found are kept in a manifest, and possibly found without
+        # importing the modules
+        static = str(_get_config(PYATS_EXT_PARSER_STATIC)).lower() in \
+                                                        ('1', 'true', 'yes')
+        ext = ExtendParsers(ext_parser_package, static=static,
+                            manifest=_get_config(PYATS_EXT_PARSER_MANIFEST))
+        ext.extend()
+
+        ext.output.pop('tokens', None)
+        summary = ext.output.pop('extend_info', None)
 
-            ext.output.pop('tokens', None)
-            summary = ext.output.pop('extend_info', None)
+        merge_dict(parser_data, ext.output, update=True)
+        log.warning("External parser counts: {}\nSummary:\n{}"
+            .format(len(summary), json.dumps(summary, indent=2)))
 
-            merge_dict(parser_data, ext.output, update=True)
-            log.warning("External parser counts: {}\nSummary:\n{}"
-                .format(len(summary), json.dumps(summary, indent=2)))
+        # Precompiled os commands do not know about the external parsers
+        parser_data = LoadedParsers(parser_data,
+                        source=getattr(parser_data, 'source', 'json'))
 
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
+# Parser within Genie, loaded on first use
+parser_data = ParserRegistry(_load_parser_json)
+
+# Resolved parsers, keyed on command, os and abstraction tokens
+parser_cache = LRUCache(maxsize=1024)
+
+# Runnable commands of each kind of device, keyed on os and abstraction tokens
+parser_index_cache = LRUCache(maxsize=64)
 
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
 
+    if data is parser_data:
+        return list(parser_data.os_commands(device.os))
+
     commands = []
     for command, values in data.items():
         if '{' in command or command == 'tokens' or device.os not in values:
@@ -69,6 +104,46 @@ def get_parser_commands(device, data=parser_data):
         commands.append(command)
     return commands
 
+def get_parser_index(device):
+    '''Return {command: (parser class, exclude)} of every command without
+       argument which has a parser for this device.
+
+       The index is built once per os and abstraction tokens and shared by
+       every device of the same kind, it must not be modified.'''
+
+    lookup = Lookup.from_device(device, packages={'parser': parser})
+    key = (device.os, tuple(lookup._tokens))
+
+    index = parser_index_cache.get(key)
+    if index is None:
+        commands = {}
+        for command in parser_data.os_commands(device.os):
+            data = parser_data[command]
+
+            # Check if all the tokens exists and take the farthest one
+            for token in lookup._tokens:
+                if token in data:
+                    data = data[token]
+
+            try:
+                parser_cls = _find_parser_cls(device, data)
+            except KeyError:
+                # Command only has parsers under other child level tokens
+                continue
+            except Exception as e:
+                # A broken parser module only loses its own commands
+                log.warning("Could not import the parser of '{}' for {}, "
+                            "skipping it: {}".format(command, device.os, e))
+                continue
+
+            commands[command] = (parser_cls,
+                                 getattr(parser_cls, 'exclude', []))
+
+        index = MappingProxyType(commands)
+        parser_index_cache.put(key, index)
+
+    return index
+
 def format_output(parser_data, tab=2):
     '''Format the parsed output in an aligned intended structure'''
 
@@ -99,6 +174,35 @@ def get_parser(command, device, fuzzy=False):
         order_list = None
 
     lookup = Lookup.from_device(device, packages={'parser': parser})
+
+    # Same command on the same kind of device resolves to the same parser
+    key = (command, fuzzy, device.os, tuple(lookup._tokens),
+           tuple(order_list or ()))
+    results = parser_cache.get(key)
+    if results is None:
+        results = _resolve_parser(command, device, fuzzy, lookup, order_list)
+        parser_cache.put(key, results)
+
+    # Hand out copies of kwargs so the cached ones cannot be altered
+    if not fuzzy:
+        return results[0][1], dict(results[0][2])
+
+    return [(found_command, parser_cls, dict(kwargs))
+                                for found_command, parser_cls, kwargs in results]
+
+def clear_parser_cache():
+    '''Forget every resolved parser, to be called whenever parser_data is
+       modified'''
+    global _command_trie
+
+    parser_cache.clear()
+    parser_index_cache.clear()
+    parser_data.invalidate()
+    _command_trie = None
+
+def _resolve_parser(command, device, fuzzy, lookup, order_list):
+    '''Find the (command, parser class, kwargs) of every parser matching
+       the command'''
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
     
@@ -125,9 +229,6 @@ def get_parser(command, device, fuzzy=False):
         raise Exception("Could not find parser for "
                         "'{c}' under {l}".format(c=command, l=lookup._tokens))
 
-    if not fuzzy:
-        return valid_results[0][1], valid_results[0][2]
-
     return valid_results
 
 def _fuzzy_search_command(search, fuzzy, os=None, order_list=None, 
@@ -161,7 +262,7 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    for command, source in _search_space(tokens, fuzzy):
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(),
                                                         command, {}, fuzzy)
@@ -211,6 +312,44 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
 
     return result
 
+def _get_command_trie():
+    '''Return the command trie of parser_data, built again once
+       clear_parser_cache() was called'''
+    global _command_trie
+
+    trie = _command_trie
+    if trie is None:
+        trie = _command_trie = CommandTrie(parser_data)
+    return trie
+
+_command_trie = None
+
+def _search_space(tokens, fuzzy):
+    """ Find the (command, source) pairs worth comparing with the search.
+
+        When every search token is a regular token, the command trie returns
+        the few commands the tokens can match, otherwise (regex expression in
+        fuzzy mode) every command of parser_data has to be compared.
+
+        Args:
+            tokens (`list`): the search tokens
+            fuzzy (`bool`): whether or not fuzzy mode should be used
+
+        Returns:
+            iterable: the (command, source) pairs
+    """
+    if fuzzy:
+        if not all(token == '*' or _is_regular_token(token) 
+                                                        for token in tokens):
+            return parser_data.items()
+
+        # Same conversion _matches_fuzzy does on regular tokens
+        tokens = [token.replace(r'\|', '|').replace(r'\.', '.')
+                                                        for token in tokens]
+
+    return [(command, parser_data[command]) 
+                    for command in _get_command_trie().candidates(tokens)]
+
 def _is_regular_token(token):
     """ Checks if a token is regular (does not contain regex symbols).
 
@@ -524,60 +663,26 @@ class Common():
                 >>> convert_intf_name(intf='Eth2/1')
         '''
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'Ten': 'TenGigabitEthernet',
-                   'Tw': 'TwoGigabitEthernet',
-                   'Two': 'TwoGigabitEthernet',
-                   'Twe': 'TwentyFiveGigE',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'For': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'Hun': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether',
-                   'M-E': 'M-Ethernet',             # comware
-                   'BAGG' : 'Bridge-Aggregation'    # comware
-                   }
-        m = re.search(r'([a-zA-Z]+)', intf) 
-        m1 = re.search(r'([\d\/\.]+)', intf)
-        m2 = re.search(r'(M-E)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            if hasattr(m2, 'group'):
-                int_type = m2.group(0)
-            else:
-                int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+        return intf_names(intf)
+
+    @classmethod
+    def convert_intf_names(self, intfs):
+        '''return the full interface names of a column of names
+
+            Args:
+                intfs (`list`): Short versions of the interface names
+
+            Returns:
+                Full interface names, in order
+
+            Raises:
+                None
+
+            example:
+
+                >>> convert_intf_names(intfs=['Gi1/0/1', 'Gi1/0/2'])
+        '''
+        return intf_names.convert_all(intfs)
 
 
     @classmethod
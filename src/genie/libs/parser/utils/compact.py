@@ -0,0 +1,349 @@
+'''Compact, read-only results for parsers of big tables
+
+The result of a parser is made of dictionaries, one for each row of its
+tables (MAC addresses, ARP entries, NAT translations, routes), each holding
+its own hash table of the same keys. For tables of hundreds of thousands of
+rows, these dictionaries take most of the memory of the result.
+
+Parsers inheriting CompactParser declare where their tables are, and gain
+parse_compact(), returning their validated result with:
+
+    * every row of the tables, and the dictionaries it holds, as a Record: a
+      read-only mapping storing its values in __slots__, its keys being held
+      once by its class, shared by every record of the same keys
+    * every table as a Table: a read-only mapping of the keys of its rows to
+      their records or, with columns=True, storing each field of the rows in
+      a column (an array of integers for the integer fields), rows being
+      read through views of their position in the columns
+    * every other dictionary, whose keys often come from the output (vrfs,
+      interfaces), as a Branch: a read-only mapping of its values
+
+Records, tables and branches are Mapping, equal to the dictionaries they
+hold the values of, and are read the same way (`[]`, get(), items(), `in`).
+They cannot be changed, to_dict() returns the result as dictionaries again.
+
+    >>> parsed = ShowIpRoute(device=device).parse_compact(vrf='VRF1')
+    >>> parsed['vrf']['VRF1']['address_family']['ipv4']['routes']['10.1.0.0/24']
+    Record({'route': '10.1.0.0/24', 'active': True, ...})
+'''
+
+# python
+from array import array
+from itertools import compress
+from collections.abc import Mapping
+
+from .cache import LRUCache
+
+# Row not having a field of its table
+_MISSING = object()
+
+# {keys: Record subclass of these keys}, bounded as the keys of the
+# dictionaries held by rows can still come from the output
+_record_classes = LRUCache(maxsize=1024)
+
+
+class Record(Mapping):
+    '''Read-only mapping of a fixed set of keys, its values in __slots__.
+    Subclasses of each set of keys are made by record_class().'''
+
+    __slots__ = ()
+
+    # Keys of the records, in order
+    _keys = ()
+
+    # {key: name of its slot}
+    _slots = {}
+
+    def __init__(self, values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._slots[key])
+        except (KeyError, TypeError):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        try:
+            return key in self._slots
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'{}' is read-only".format(
+            self.__class__.__name__))
+
+    def __reduce__(self):
+        return _record, (self._keys, tuple(self.values()))
+
+    def __repr__(self):
+        return 'Record({!r})'.format(dict(self.items()))
+
+    def to_dict(self):
+        '''Return the record as a dictionary, and what it holds as
+        dictionaries'''
+        return {key: _to_dict(value) for key, value in self.items()}
+
+
+def record_class(keys):
+    '''Return the Record subclass of keys, made once for each set of keys
+    while it is among the most recently used ones
+
+    Args:
+        keys (`tuple`): keys of the records, in order
+
+    example:
+
+        >>> Arp = record_class(('ip', 'link_layer_address'))
+        >>> Arp(('10.1.1.1', 'fa16.3eff.9c9e'))['ip']
+        '10.1.1.1'
+    '''
+    cls = _record_classes.get(keys)
+    if cls is None:
+        slots = tuple('_{}'.format(index) for index in range(len(keys)))
+        cls = type('Record', (Record,), {
+            '__slots__': slots,
+            '_keys': keys,
+            '_slots': dict(zip(keys, slots)),
+        })
+        _record_classes.put(keys, cls)
+    return cls
+
+
+def _record(keys, values):
+    '''Record of keys and values, as unpickled'''
+    return record_class(keys)(values)
+
+
+class Branch(Mapping):
+    '''Read-only mapping of a dictionary of the result outside of its tables
+
+    Args:
+        items (`dict`): {key: value} of compacted values
+    '''
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items):
+        self._items = items
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __reduce__(self):
+        return self.__class__, (self._items,)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._items)
+
+    def to_dict(self):
+        '''Return the branch as a dictionary, and what it holds as
+        dictionaries'''
+        return {key: _to_dict(value) for key, value in self.items()}
+
+
+class Table(Branch):
+    '''Read-only mapping of the keys of the rows of a table to their records
+
+    Args:
+        rows (`dict`): {key: row} of compacted rows
+    '''
+
+    __slots__ = ()
+
+    def to_dict(self):
+        '''Return the table as a dictionary, and its rows as dictionaries'''
+        return {key: _to_dict(row) for key, row in self.items()}
+
+
+class ColumnTable(Table):
+    '''Read-only mapping of the keys of the rows of a table to views of their
+    fields, each field of the rows stored in a column
+
+    Args:
+        rows (`dict`): {key: row} of compacted rows
+    '''
+
+    __slots__ = ('_fields', '_columns')
+
+    def __init__(self, rows):
+        # {key: position of the row in the columns}
+        self._items = {key: index for index, key in enumerate(rows)}
+        fields = {}
+        for row in rows.values():
+            for field in row:
+                fields.setdefault(field, None)
+        self._fields = tuple(fields)
+        self._columns = tuple(
+            _column([row.get(field, _MISSING) for row in rows.values()])
+            for field in self._fields)
+
+    def __getitem__(self, key):
+        return ColumnRow(self, self._items[key])
+
+    def __reduce__(self):
+        return ColumnTable, (dict(self.items()),)
+
+    def __repr__(self):
+        return 'ColumnTable({} rows, {!r})'.format(len(self), self._fields)
+
+    def to_dict(self):
+        '''Return the table as a dictionary, and its rows as dictionaries'''
+        return {key: ColumnRow(self, index).to_dict()
+                for key, index in self._items.items()}
+
+
+class ColumnRow(Mapping):
+    '''Read-only view of a row of a ColumnTable
+
+    Args:
+        table (`ColumnTable`): table of the row
+        index (`int`): position of the row in the columns of table
+    '''
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def _values(self):
+        return [column[self._index] for column in self._table._columns]
+
+    def __getitem__(self, key):
+        table = self._table
+        try:
+            value = table._columns[table._fields.index(key)][self._index]
+        except ValueError:
+            raise KeyError(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return compress(self._table._fields,
+                        [value is not _MISSING for value in self._values()])
+
+    def __len__(self):
+        return sum(value is not _MISSING for value in self._values())
+
+    def __reduce__(self):
+        return _record, (tuple(self), tuple(self.values()))
+
+    def __repr__(self):
+        return 'ColumnRow({!r})'.format(dict(self.items()))
+
+    def to_dict(self):
+        '''Return the row as a dictionary, and what it holds as
+        dictionaries'''
+        return {key: _to_dict(value) for key, value in self.items()}
+
+
+def _column(values):
+    '''Column of values: an array when they are all integers, a list
+    otherwise'''
+    if all(type(value) is int for value in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            pass
+    return values
+
+
+def _to_dict(value):
+    if isinstance(value, (Record, Branch, ColumnRow)):
+        return value.to_dict()
+    return value
+
+
+def compact(parsed, tables=(), columns=False):
+    '''Return parsed as branches, and its tables as Table of records
+
+    Args:
+        parsed (`dict`): result of a parser
+        tables (`list`): paths of the tables, each a tuple of the keys leading
+                         to the table, None standing for any key
+        columns (`bool`): store the fields of the rows of the tables in
+                          columns, as ColumnTable
+
+    example:
+
+        >>> parsed = compact(ShowIpArp(device=device).parse(),
+        ...                  tables=[('interfaces', None, 'ipv4', 'neighbors')])
+    '''
+    return _compact(parsed, [tuple(path) for path in tables], columns, {})
+
+
+def _compact(value, paths, columns, classes):
+    if not isinstance(value, dict):
+        return value
+    if () in paths:
+        rows = {key: _compact_row(row, classes) for key, row in value.items()}
+        return ColumnTable(rows) if columns else Table(rows)
+    return Branch({key: _compact(item, [path[1:] for path in paths
+                                        if path[0] is None or path[0] == key],
+                                 columns, classes)
+                   for key, item in value.items()})
+
+
+def _compact_row(value, classes):
+    '''Record of a row of a table, and of the dictionaries it holds
+
+    Args:
+        value: row, or value held by a row
+        classes (`dict`): {keys: Record subclass} of the rows compacted
+                          so far, not to look the classes up for each row
+    '''
+    if not isinstance(value, dict):
+        return value
+    keys = tuple(value)
+    cls = classes.get(keys)
+    if cls is None:
+        cls = classes[keys] = record_class(keys)
+    return cls([_compact_row(item, classes) for item in value.values()])
+
+
+class CompactParser(object):
+    '''Gives the parsers declaring their tables a parse_compact()
+
+    example:
+
+        >>> class ShowIpArp(ShowArp, CompactParser):
+        ...     compact_tables = [('interfaces', None, 'ipv4', 'neighbors')]
+    '''
+
+    # Paths of the tables of the result, None standing for any key
+    compact_tables = ()
+
+    def parse_compact(self, columns=False, **kwargs):
+        '''Return the result of parse() as branches, and its tables as
+        Table of records
+
+        Args:
+            columns (`bool`): store the fields of the rows of the tables in
+                              columns, as ColumnTable
+            kwargs: arguments of parse()
+
+        example:
+
+            >>> parsed = ShowMacAddressTable(device=device).parse_compact(
+            ...     columns=True)
+        '''
+        return compact(self.parse(**kwargs), self.compact_tables,
+                       columns=columns)
@@ -0,0 +1,234 @@
+'''Interface counters of show interfaces, as columns
+
+Telemetry computing rates and deltas across thousands of ports reads the
+counters of every interface out of the nested result of ShowInterfaces, one
+dictionary at a time. Interface parsers inheriting CounterParser also have
+parse_counters(), filling the counters straight from the output into
+InterfaceCounters:
+
+    * interfaces: the interface names, in the order of the output, a row
+      each
+    * columns: {counter: array of signed 64-bit integers}, an item per row,
+      MISSING where the output of the interface does not have the counter
+
+No dictionary is made for the interfaces. Their counters are appended to the
+arrays as the lines are read, so each column is a contiguous buffer, which
+to_numpy() hands to numpy without copying:
+
+    >>> before = ShowInterfaces(device=device).parse_counters()
+    >>> after = ShowInterfaces(device=device).parse_counters()
+    >>> octets = after.to_numpy()['in_octets'] - before.to_numpy()['in_octets']
+
+The counters are named as in the result of the parser, rates included, and
+hold the same values. numpy is only needed for to_numpy().
+'''
+
+# python
+import string
+from array import array
+from collections import OrderedDict
+
+# Item of the interfaces without the counter
+MISSING = -1
+
+
+class InterfaceCounters(object):
+    '''Counters of interfaces, a column each
+
+    Args:
+        counters (`list`): names of the counters, in order
+
+    example:
+
+        >>> counters = InterfaceCounters(['in_octets', 'out_octets'])
+        >>> row = counters.add('GigabitEthernet1')
+        >>> counters.set(row, 'in_octets', 2513375)
+        >>> counters.get('GigabitEthernet1')
+        {'in_octets': 2513375}
+    '''
+
+    def __init__(self, counters):
+        # Interface names, by row
+        self.interfaces = []
+        # {interface name: row}
+        self.index = {}
+        self.columns = OrderedDict((counter, array('q'))
+                                   for counter in counters)
+
+    def __len__(self):
+        return len(self.interfaces)
+
+    def add(self, interface):
+        '''Return the row of interface, appended to the columns as MISSING
+        the first time'''
+        row = self.index.get(interface)
+        if row is None:
+            row = self.index[interface] = len(self.interfaces)
+            self.interfaces.append(interface)
+            for column in self.columns.values():
+                column.append(MISSING)
+        return row
+
+    def set(self, row, counter, value):
+        '''Set counter of row to value'''
+        self.columns[counter][row] = value
+
+    def get(self, interface):
+        '''Return {counter: value} of the counters interface has'''
+        row = self.index[interface]
+        return {counter: column[row]
+                for counter, column in self.columns.items()
+                if column[row] != MISSING}
+
+    def to_numpy(self):
+        '''Return {counter: numpy int64 array}, sharing the memory of the
+        columns
+
+        example:
+
+            >>> columns = counters.to_numpy()
+            >>> columns['in_crc_errors'][columns['in_crc_errors'] > 0]
+        '''
+        # Imported on use, parsers loading this module do not need numpy
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('numpy is needed for the counters as numpy '
+                              'arrays, the columns are arrays of the '
+                              'array module otherwise')
+        return OrderedDict((counter, numpy.frombuffer(column,
+                                                      dtype=numpy.int64))
+                           for counter, column in self.columns.items())
+
+
+def load_interval(group):
+    '''Load interval of a '5 minute input rate' line in seconds, its number
+    in group 'load_interval' and its unit in group 'unit'
+
+    example:
+
+        >>> load_interval({'load_interval': '5', 'unit': 'minute'})
+        300
+    '''
+    interval = int(group['load_interval'])
+    if 'minute' in group['unit']:
+        return interval * 60
+    return interval
+
+
+class CounterLines(object):
+    '''Where the interfaces and their counters are in the output of a parser
+
+    Args:
+        lines (`LineDispatcher`): patterns of the lines of the output
+        interface (`str`): rule of the first line of an interface
+        counters (`dict`): {rule: {counter: group}} of the counters on the
+                           lines of rule. The value of a counter is the one
+                           of its group, or what a function of the groupdict
+                           returns. A (rule, section) key only applies in the
+                           section, before the one of rule
+        sections (`dict`): {rule: section} of the lines starting sections of
+                           an interface
+        name (`str`): group of the interface name
+        start (`str`): section the interfaces start in
+
+    example:
+
+        >>> counter_lines = CounterLines(
+        ...     lines=_show_interface_lines, interface='p1',
+        ...     counters={'p25': {'in_pkts': 'in_pkts'},
+        ...               ('p24', 'rx'): {'in_unicast_pkts': 'unicast'},
+        ...               ('p24', 'tx'): {'out_unicast_pkts': 'unicast'}},
+        ...     sections={'p23_1': 'rx', 'p31_1': 'tx'})
+    '''
+
+    def __init__(self, lines, interface, counters, sections=None,
+                 name='interface', start=None):
+        self.lines = lines
+        self.interface = interface
+        self.counters = counters
+        self.sections = sections or {}
+        self.name = name
+        self.start = start
+
+        names = OrderedDict()
+        for fields in counters.values():
+            for counter in fields:
+                names.setdefault(counter, None)
+        self.names = list(names)
+
+    def parse(self, output):
+        '''Return the InterfaceCounters of output'''
+        counters = InterfaceCounters(self.names)
+        columns = counters.columns
+        row = None
+        section = self.start
+        for line in output.splitlines():
+            rule, m = self.lines.match(line.strip())
+            if rule is None:
+                continue
+            if rule == self.interface:
+                row = counters.add(m.group(self.name))
+                section = self.start
+                continue
+            if rule in self.sections:
+                section = self.sections[rule]
+                continue
+            fields = self.counters.get((rule, section)) or \
+                     self.counters.get(rule)
+            if not fields or row is None:
+                continue
+            group = m.groupdict()
+            for counter, field in fields.items():
+                if callable(field):
+                    value = field(group)
+                else:
+                    value = group[field]
+                if value is not None:
+                    columns[counter][row] = int(value)
+        return counters
+
+
+class CounterParser(object):
+    '''Gives the interface parsers declaring CounterLines a parse_counters()
+
+    example:
+
+        >>> class ShowInterfaces(ShowInterfacesSchema, CounterParser):
+        ...     counter_lines = CounterLines(...)
+    '''
+
+    # CounterLines of the parser
+    counter_lines = None
+
+    def parse_counters(self, output=None, **kwargs):
+        '''Return the InterfaceCounters of the output of the command
+
+        Args:
+            output (`str`): output of the command, executed on the device
+                            when not given
+            kwargs: arguments of the command, such as interface
+
+        example:
+
+            >>> counters = ShowInterfaces(device=device).parse_counters()
+            >>> counters.columns['in_octets']
+            array('q', [2513375, 0, 1386])
+        '''
+        if output is None:
+            output = self.device.execute(self._counters_command(**kwargs))
+        return self.counter_lines.parse(output)
+
+    def _counters_command(self, **kwargs):
+        '''Command of cli_command taking the arguments given'''
+        arguments = {key for key, value in kwargs.items() if value}
+        commands = self.cli_command
+        if isinstance(commands, str):
+            commands = [commands]
+        for command in commands:
+            fields = {field for _, field, _, _ in
+                      string.Formatter().parse(command) if field}
+            if fields == arguments:
+                return command.format(**kwargs)
+        raise TypeError("No command of {} takes the arguments {}".format(
+            self.__class__.__name__, sorted(arguments)))
@@ -31,18 +31,46 @@ example 'nxos', and the value is a list of MetaParser class definitions.
             ]
         }
 
+The value can also map each command to the dotted path of its parser class.
+The class is then only imported once the command is resolved by get_parser.
+The entry point can point to such a dictionary directly, which avoids importing
+any parser module at startup:
+
+    MY_PARSERS = {
+        'iosxe': {
+            'show interfaces transceiver':
+                'my_parsers.iosxe.show_interface_transceiver.'
+                'ShowInterfaceTransceiver',
+        },
+    }
+
+    with "packagename = my_parsers.entry:MY_PARSERS" as entry point.
+
+The time spent loading each entry point is kept, see entry_points_report().
 """
 
 import sys
-import pkg_resources
+import time
 import logging
 
-from .common import parser_data
+try:
+    from importlib import metadata
+except ImportError:
+    # Python < 3.8
+    try:
+        import importlib_metadata as metadata
+    except ImportError:
+        metadata = None
+
+from .common import parser_data, clear_parser_cache
 
 log = logging.getLogger(__name__)
 
 ENTRY_POINT_NAME = 'genie.libs.parser'
 
+# Time spent and parsers added by each entry point
+_report = []
+
 
 def add_parser(parser, os_name):
     """
@@ -79,19 +107,134 @@ def add_parser(parser, os_name):
             'class': parser.__name__
         }
 
+    # Previously resolved commands may now resolve to this parser
+    clear_parser_cache()
+
+
+def add_parser_path(path, commands, os_name):
+    """
+    Add the parser class at the dotted path `path` for the given commands
+    and network OS name `os_name`, without importing it
+
+    Parameters
+    ----------
+    path : str
+        Dotted path of the parser class, for example
+        "my_parsers.iosxe.show_version.ShowVersion"
+
+    commands : str or list
+        Commands parsed by the parser class
+
+    os_name : str
+        The NOS name for which the parser is supported, for example "nxos"
+    """
+    module, _, class_name = path.rpartition('.')
+    package, _, module_name = module.rpartition('.')
+
+    if isinstance(commands, str):
+        commands = [commands]
+
+    for cmd in commands:
+        if cmd not in parser_data:
+            parser_data[cmd] = {}
+
+        parser_data[cmd][os_name] = {
+            'module_name': module_name,
+            'package': package,
+            'class': class_name
+        }
+
+    clear_parser_cache()
+
+
+def add_parsers(parser_dict):
+    """
+    Add the parsers of an entry point, either a list of parser classes or a
+    {command: dotted class path} dictionary per os.
+
+    Returns
+    -------
+    int
+        Number of parsers added
+    """
+    count = 0
+    for os_name, parsers in parser_dict.items():
+        if isinstance(parsers, dict):
+            for cmd, path in parsers.items():
+                add_parser_path(path=path, commands=cmd, os_name=os_name)
+                count += 1
+        else:
+            for parser in parsers:
+                add_parser(parser=parser, os_name=os_name)
+                count += 1
+    return count
+
+
+def _iter_entry_points():
+    if metadata is None:
+        # Slow to import, only needed without importlib metadata
+        import pkg_resources
+        return pkg_resources.iter_entry_points(ENTRY_POINT_NAME)
+
+    eps = metadata.entry_points()
+    if hasattr(eps, 'select'):
+        return eps.select(group=ENTRY_POINT_NAME)
+    # Python < 3.10
+    return eps.get(ENTRY_POINT_NAME, [])
+
 
 def load_entry_points():
-    for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
-        loader_function = ep.load()
-        if not callable(loader_function):
-            log.warning('unable to load parsers from entry point '
-                        '{name} as it is not callable.'.format(name=ep.name))
+    '''Add the parsers of every entry point. An entry point failing to load
+    is logged and kept in entry_points_report(), the others still load.'''
+    del _report[:]
+    for ep in _iter_entry_points():
+        start = time.perf_counter()
+        entry = {'name': ep.name, 'value': getattr(ep, 'value', str(ep)),
+                 'parsers': 0, 'time': None, 'error': None}
+        _report.append(entry)
+
+        try:
+            loaded = ep.load()
+
+            if isinstance(loaded, dict):
+                # Declarative form, nothing to call
+                parser_dict = loaded
+            elif callable(loaded):
+                parser_dict = loaded()
+            else:
+                log.warning('unable to load parsers from entry point '
+                            '{name} as it is not callable.'
+                            .format(name=ep.name))
+                entry['error'] = 'not callable'
+                continue
+
+            entry['parsers'] = add_parsers(parser_dict)
+        except Exception as e:
+            log.error('unable to load parsers from entry point {name}: '
+                      '{error}'.format(name=ep.name, error=e), exc_info=True)
+            entry['error'] = str(e)
             continue
+        finally:
+            entry['time'] = time.perf_counter() - start
 
-        parser_dict = loader_function()
-        for os_name, parser_list in parser_dict.items():
-            for parser in parser_list:
-                add_parser(parser=parser, os_name=os_name)
+        log.debug('Loaded {parsers} parsers from entry point {name} in '
+                  '{time:.3f}s'.format(**entry))
+
+
+def entry_points_report():
+    """
+    Return the time spent and number of parsers added by each entry point,
+    slowest first
+
+    Returns
+    -------
+    list
+        one dict per entry point, with keys name, value, parsers, time, error
+    """
+    parser_data.load()
+    return sorted(_report, key=lambda entry: entry['time'] or 0,
+                  reverse=True)
 
 
-load_entry_points()
+# Entry points are loaded along with parser_data, on its first use
+parser_data.on_load(load_entry_points)
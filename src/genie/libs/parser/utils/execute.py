@@ -0,0 +1,243 @@
+'''Helpers around the commands parsers execute on the device'''
+
+# python
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Attribute of the device holding its BatchExecutor
+BATCH_EXECUTOR_ATTR = 'batch_executor'
+
+
+class DeviceWrapper(object):
+    '''Device given to a parser in place of its device for the time of a
+    call. Every attribute not set by the wrapper is the one of the device.
+
+    Args:
+        device (`Device`): device wrapped
+    '''
+
+    def __init__(self, device):
+        self.device = device
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+    def __repr__(self):
+        return '<{} of {!r}>'.format(self.__class__.__name__, self.device)
+
+
+def unwrap_device(device):
+    '''Return the device wrapped by DeviceWrapper, or device itself'''
+    while isinstance(device, DeviceWrapper):
+        device = device.device
+    return device
+
+
+class CommandMemo(DeviceWrapper):
+    '''Device wrapper executing each command once, returning the output of
+    the first execution to the next ones. Every other attribute is the one of
+    the device.
+
+    Args:
+        device (`Device`): device executing the commands
+
+    example:
+
+        >>> device = CommandMemo(device)
+        >>> device.execute('show running-config | section router ospf 1')
+        >>> device.execute('show running-config | section router ospf 1')
+        >>> device.executed
+        {'show running-config | section router ospf 1': 2}
+    '''
+
+    def __init__(self, device):
+        super().__init__(device)
+        # {(command, kwargs): output}
+        self.outputs = {}
+        # {command: times the parser asked for it}
+        self.executed = {}
+
+    def execute(self, command, **kwargs):
+        self.executed[command] = self.executed.get(command, 0) + 1
+        try:
+            key = (command, frozenset(kwargs.items()))
+        except TypeError:
+            return self.device.execute(command, **kwargs)
+
+        try:
+            return self.outputs[key]
+        except KeyError:
+            output = self.outputs[key] = self.device.execute(command,
+                                                             **kwargs)
+            return output
+
+
+class CommandRecorder(DeviceWrapper):
+    '''Device wrapper keeping the output of every command executed through
+    it. Every other attribute is the one of the device.
+
+    Args:
+        device (`Device`): device executing the commands
+
+    example:
+
+        >>> device = CommandRecorder(device)
+        >>> device.execute('show vrf')
+        >>> device.text()
+        'show vrf\n  Name    Default RD ...'
+    '''
+
+    def __init__(self, device):
+        super().__init__(device)
+        # [(command, output)] in execution order
+        self.outputs = []
+
+    def execute(self, command, **kwargs):
+        output = self.device.execute(command, **kwargs)
+        self.outputs.append((command, output))
+        return output
+
+    def text(self):
+        '''Return every command executed followed by its output'''
+        return '\n'.join('{}\n{}'.format(command, output)
+                         for command, output in self.outputs)
+
+
+def memoize_commands(cli):
+    '''Decorator of a parser cli() method, executing each command once
+    during the call. Parsers it calls with device=self.device share the
+    outputs of the same commands.
+
+    example:
+
+        >>> class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
+        ...     @memoize_commands
+        ...     def cli(self, interface=None, output=None):
+        ...         for line in out.splitlines():
+        ...             # executed once for all the interfaces
+        ...             self.device.execute(
+        ...                 'show running-config | section router ospf 1')
+    '''
+    @functools.wraps(cli)
+    def wrapper(self, *args, **kwargs):
+        device = self.device
+        if device is None or isinstance(device, CommandMemo):
+            return cli(self, *args, **kwargs)
+
+        self.device = CommandMemo(device)
+        try:
+            return cli(self, *args, **kwargs)
+        finally:
+            self.device = device
+    return wrapper
+
+
+class BatchExecutor(object):
+    '''Executes a list of commands in as few round-trips as possible, for
+    the parsers executing one command per VRF, neighbor or template.
+
+    Without sessions, the commands are given all at once to device.execute,
+    which sends them in one write of its session and returns the output of
+    each of them (as unicon does for a list of commands). With sessions,
+    the commands are spread over them and executed concurrently.
+
+    Args:
+        device (`Device`): device executing the commands
+        sessions (`list`): connections of the device to spread the commands
+                           over, each with an execute() method
+        pipeline (`bool`): give a list of commands to each execute() call,
+                           False executes them one at a time
+
+    example:
+
+        >>> device.batch_executor = BatchExecutor(device)
+        >>> execute_commands(device, ['show bgp peer-session PS-1',
+        ...                           'show bgp peer-session PS-2'])
+        {'show bgp peer-session PS-1': '...',
+         'show bgp peer-session PS-2': '...'}
+    '''
+
+    def __init__(self, device, sessions=None, pipeline=True):
+        self.device = device
+        self.sessions = list(sessions or [])
+        self.pipeline = pipeline
+
+    def _execute(self, session, commands):
+        if not self.pipeline or len(commands) == 1:
+            return {command: session.execute(command)
+                                                    for command in commands}
+        outputs = session.execute(list(commands))
+        if not isinstance(outputs, dict):
+            raise TypeError('{!r} returned {} for a list of commands'
+                            .format(session, type(outputs).__name__))
+        return outputs
+
+    def execute(self, commands):
+        '''Return {command: output} of commands'''
+        if len(self.sessions) < 2 or len(commands) < 2:
+            session = self.sessions[0] if self.sessions else self.device
+            return self._execute(session, commands)
+
+        # Round robin, each session executing its share in one batch
+        shares = [commands[index::len(self.sessions)]
+                                    for index in range(len(self.sessions))]
+        outputs = {}
+        with ThreadPoolExecutor(max_workers=len(self.sessions)) as pool:
+            for share_outputs in pool.map(self._execute, self.sessions,
+                                          shares):
+                outputs.update(share_outputs)
+        return outputs
+
+
+def execute_commands(device, commands):
+    '''Return {command: output} of commands, executed through the
+    BatchExecutor of device if it has one, one at a time otherwise. Each
+    command is executed once, and once per parse with memoize_commands.
+
+    example:
+
+        >>> outputs = execute_commands(self.device,
+        ...     [self.cli_command.format(vrf=vrf) for vrf in vrfs])
+        >>> for vrf in vrfs:
+        ...     out = outputs[self.cli_command.format(vrf=vrf)]
+    '''
+    # Recorders over the memo get every output, the ones under it only the
+    # outputs executed
+    memo = None
+    recorders, executed_recorders = [], []
+    while isinstance(device, (CommandMemo, CommandRecorder)):
+        if isinstance(device, CommandRecorder):
+            (recorders if memo is None else executed_recorders).append(device)
+        elif memo is None:
+            memo = device
+        device = device.device
+
+    outputs = {}
+    pending = []
+    for command in OrderedDict.fromkeys(commands):
+        if memo is not None:
+            memo.executed[command] = memo.executed.get(command, 0) + 1
+            key = (command, frozenset())
+            if key in memo.outputs:
+                outputs[command] = memo.outputs[key]
+                continue
+        pending.append(command)
+
+    if pending:
+        executor = getattr(device, BATCH_EXECUTOR_ATTR, None)
+        if isinstance(executor, BatchExecutor):
+            executed = executor.execute(pending)
+        else:
+            executed = {command: device.execute(command)
+                                                    for command in pending}
+        for command in pending:
+            outputs[command] = executed[command]
+            if memo is not None:
+                memo.outputs[(command, frozenset())] = executed[command]
+            for recorder in executed_recorders:
+                recorder.outputs.append((command, executed[command]))
+
+    for recorder in recorders:
+        recorder.outputs.extend(outputs.items())
+    return outputs
@@ -1,5 +1,9 @@
+import os
+import ast
+import json
 import logging
 import pathlib
+import warnings
 import inspect
 import itertools
 import importlib
@@ -7,16 +11,38 @@ from genie.metaparser import MetaParser
 
 log = logging.getLogger(__name__)
 
+# Version of the manifest layout
+MANIFEST_VERSION = 1
+
 class ExtendParsers(object):
+    '''Find the parsers of an external package.
+
+    Args:
+        package (`str`): the external parser package
+        manifest (`str`): optional file where the parsers found in each module
+                          are kept, keyed by module path, mtime and size. A
+                          module which did not change since is not imported
+                          again
+        static (`bool`): find the parsers by reading the source of the modules
+                         instead of importing them. Only classes directly
+                         assigning a literal cli_command are found this way
+    '''
     # Files and directories to ignore while walking package
     IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
     IGNORE_FILE = ['__init__.py', 'base.py', 'utils.py']
 
-    def __init__(self, package):
+    def __init__(self, package, manifest=None, static=False):
         self.output = {'tokens': [], 'extend_info': []}
         self.package = package
+        self.manifest = manifest
+        self.static = static
         # Figure out location of package so you can walk it
         self.module_loc = importlib.import_module(package).__path__[0]
+        self._modules = {}
+        self._visited = set()
+        self._manifest_changed = False
+        # How many modules were read from the manifest, imported or parsed
+        self.stats = {'cached': 0, 'imported': 0, 'static': 0}
 
     @staticmethod
     def _find_parsers(mod):
@@ -41,13 +67,41 @@ class ExtendParsers(object):
 
         return parsers
 
-    def _add_parser(self, parser, cli, tokens, mod):
+    @staticmethod
+    def _find_parsers_static(path):
+        '''Find the parsers defined in the source file at path without
+           importing it'''
+        with open(path) as f, warnings.catch_warnings():
+            # Same warnings as importing, such as invalid escape sequences
+            warnings.simplefilter('ignore')
+            tree = ast.parse(f.read(), filename=str(path))
+
+        parsers = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef) or node.name.startswith('_'):
+                continue
+
+            for item in node.body:
+                if isinstance(item, ast.Assign) and any(
+                        isinstance(target, ast.Name) and \
+                        target.id == 'cli_command' for target in item.targets):
+                    try:
+                        cli_command = ast.literal_eval(item.value)
+                    except ValueError:
+                        # Not a literal, needs the module to be imported
+                        continue
+                    parsers.append({'class': node.name,
+                                    'doc': ast.get_docstring(node, clean=False),
+                                    'cli_command': cli_command})
+        return parsers
+
+    def _add_parser(self, parser, cli, tokens, module_name):
         if cli not in self.output:
             self.output[cli] = {}
 
         extend_info = self.output['extend_info']
         extend_info.append("cli: '{}', tokens {}, class: {}"
-                    .format(cli, tokens, parser.__name__))
+                    .format(cli, tokens, parser['class']))
 
         output = self.output[cli]
         for token in tokens:
@@ -57,26 +111,87 @@ class ExtendParsers(object):
             if token not in self.output['tokens']:
                 self.output['tokens'].append(token)
 
-        output['module_name'] = mod.__name__.rsplit('.', 1)[-1]
+        output['module_name'] = module_name
         output['package'] = self.package
-        output['class'] = parser.__name__
-        output['doc'] = parser.__doc__
+        output['class'] = parser['class']
+        output['doc'] = parser['doc']
         output['uid'] = cli.replace(' ', '_').replace('{', '').replace('}', '').replace('|', '_')
 
+    def _module_parsers(self, item, tokens):
+        '''Return the parsers of the module at item, from the manifest
+           when the module did not change'''
+        stat = item.stat()
+        key = str(item)
+        self._visited.add(key)
+        cached = self._modules.get(key)
+        if cached and cached['mtime'] == stat.st_mtime_ns and \
+                cached['size'] == stat.st_size:
+            self.stats['cached'] += 1
+            return cached['parsers']
+
+        if self.static:
+            parsers = self._find_parsers_static(item)
+            self.stats['static'] += 1
+        else:
+            # Find all classes which has a function named parse
+            # Will give module path
+            path_list = [self.package] + tokens + \
+                                        [item.name.replace(item.suffix, '')]
+            mod = importlib.import_module('.'.join(path_list))
+            parsers = [{'class': parser.__name__,
+                        'doc': parser.__doc__,
+                        'cli_command': parser.cli_command}
+                       for parser in self._find_parsers(mod)]
+            self.stats['imported'] += 1
+
+        self._modules[key] = {'mtime': stat.st_mtime_ns,
+                              'size': stat.st_size,
+                              'parsers': parsers}
+        self._manifest_changed = True
+        return parsers
+
     def _add_parsers(self, item, tokens):
-        # Find all classes which has a function named parse
-        # Will give module path
-        path_list = [self.package] + tokens + [item.name.replace(item.suffix, '')]
-        module_path = '.'.join(path_list)
-        mod = importlib.import_module(module_path)
-        parsers = self._find_parsers(mod)
-
-        for parser in parsers:
-            if isinstance(parser.cli_command, list):
-                for cli in parser.cli_command:
-                    self._add_parser(parser, cli, tokens, mod)
+        module_name = item.name.replace(item.suffix, '')
+
+        for parser in self._module_parsers(item, tokens):
+            if isinstance(parser['cli_command'], (list, tuple)):
+                for cli in parser['cli_command']:
+                    self._add_parser(parser, cli, tokens, module_name)
             else:
-                self._add_parser(parser, parser.cli_command, tokens, mod)
+                self._add_parser(parser, parser['cli_command'], tokens,
+                                                                module_name)
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if manifest.get('version') != MANIFEST_VERSION or \
+                manifest.get('package') != self.package or \
+                manifest.get('static') != self.static:
+            log.debug('Ignoring manifest {} made for another package or '
+                      'mode'.format(self.manifest))
+            return
+
+        self._modules = manifest.get('modules', {})
+
+    def _save_manifest(self):
+        manifest = {'version': MANIFEST_VERSION,
+                    'package': self.package,
+                    'static': self.static,
+                    'modules': self._modules}
+
+        # Write then rename so a concurrent reader never sees half a file
+        tmp = '{}.{}.tmp'.format(self.manifest, os.getpid())
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(manifest, f)
+            os.replace(tmp, self.manifest)
+        except OSError as e:
+            log.warning('Could not write parser manifest {}: {}'
+                        .format(self.manifest, e))
 
     def _recursive_find(self, item, token):
         for item in item.iterdir():
@@ -95,5 +210,17 @@ class ExtendParsers(object):
                 self._add_parsers(item, token)
 
     def extend(self):
+        if self.manifest:
+            self._load_manifest()
+
         # Walk all file in there and go through the parsers
+        seen = set(self._modules)
         self._recursive_find(pathlib.Path(self.module_loc), [])
+
+        # Forget modules which were removed from the package
+        for key in seen - self._visited:
+            del self._modules[key]
+            self._manifest_changed = True
+
+        if self.manifest and self._manifest_changed:
+            self._save_manifest()
@@ -0,0 +1,188 @@
+'''Full interface names of the short ones found in show outputs
+
+MAC, ARP, CDP/LLDP and routing tables name the interface of every row,
+mostly in their short form (Gi1/0/1, Po10, BAGG1). Their parsers convert
+each one through Common.convert_intf_name, backed by an IntfNameConverter:
+
+    * the interface types of the short names are looked up in a table of
+      prefixes, built once, with its patterns compiled once
+    * the names already converted are kept in a bounded LRU cache, tables
+      of thousands of rows naming the same few dozen interfaces
+    * convert_all() converts a whole column of names, each distinct name
+      once
+
+Interface types of a single vendor are kept in VENDOR_INTF_PREFIXES, and
+more can be registered:
+
+    >>> intf_names.register({'Hg': 'HundredGigE'})
+    >>> intf_names('Hg1/0/1')
+    'HundredGigE1/0/1'
+'''
+
+# python
+import re
+from collections import OrderedDict
+
+from .cache import LRUCache
+
+# {short interface type: full interface type}
+# Please add more when face other type of interface
+INTF_PREFIXES = OrderedDict([
+    ('Eth', 'Ethernet'),
+    ('Lo', 'Loopback'),
+    ('lo', 'Loopback'),
+    ('Fa', 'FastEthernet'),
+    ('Fas', 'FastEthernet'),
+    ('Po', 'Port-channel'),
+    ('PO', 'Port-channel'),
+    ('Null', 'Null'),
+    ('Gi', 'GigabitEthernet'),
+    ('Gig', 'GigabitEthernet'),
+    ('GE', 'GigabitEthernet'),
+    ('Te', 'TenGigabitEthernet'),
+    ('Ten', 'TenGigabitEthernet'),
+    ('Tw', 'TwoGigabitEthernet'),
+    ('Two', 'TwoGigabitEthernet'),
+    ('Twe', 'TwentyFiveGigE'),
+    ('mgmt', 'mgmt'),
+    ('Vl', 'Vlan'),
+    ('Tu', 'Tunnel'),
+    ('Fe', ''),
+    ('Hs', 'HSSI'),
+    ('AT', 'ATM'),
+    ('Et', 'Ethernet'),
+    ('BD', 'BDI'),
+    ('Se', 'Serial'),
+    ('Fo', 'FortyGigabitEthernet'),
+    ('For', 'FortyGigabitEthernet'),
+    ('Hu', 'HundredGigE'),
+    ('Hun', 'HundredGigE'),
+    ('vl', 'vasileft'),
+    ('vr', 'vasiright'),
+    ('BE', 'Bundle-Ether'),
+])
+
+# {os: {short interface type: full interface type}} of the types of a
+# single vendor
+VENDOR_INTF_PREFIXES = {
+    'comware': OrderedDict([
+        ('M-E', 'M-Ethernet'),
+        ('BAGG', 'Bridge-Aggregation'),
+    ]),
+}
+
+# Names converted and kept by default
+DEFAULT_CACHE_SIZE = 4096
+
+# Letters of the interface type, and numbers of the interface
+_intf_type = re.compile(r'[a-zA-Z]+')
+_intf_port = re.compile(r'[\d\/\.]+')
+
+
+class IntfNameConverter(object):
+    '''Converts short interface names to full ones, through a table of
+    prefixes and a cache of the names already converted
+
+    Types made of letters are the first letters of the name. Types of other
+    characters, such as M-E, are found anywhere in the name, before the
+    letters are looked at. Names of a type not in the table are returned
+    capitalized, without spaces.
+
+    Args:
+        prefixes (`dict`): {short interface type: full interface type}
+        maxsize (`int`): number of converted names kept
+
+    example:
+
+        >>> convert = IntfNameConverter(INTF_PREFIXES)
+        >>> convert('Gi1/0/1')
+        'GigabitEthernet1/0/1'
+        >>> convert.convert_all(['Gi1/0/1', 'Gi1/0/1', 'Po10'])
+        ['GigabitEthernet1/0/1', 'GigabitEthernet1/0/1', 'Port-channel10']
+    '''
+
+    def __init__(self, prefixes=INTF_PREFIXES, maxsize=DEFAULT_CACHE_SIZE):
+        self.prefixes = OrderedDict()
+        self.cache = LRUCache(maxsize=maxsize)
+        self._special = None
+        self.register(prefixes)
+
+    def register(self, prefixes):
+        '''Add the interface types of prefixes to the table
+
+        Args:
+            prefixes (`dict`): {short interface type: full interface type}
+
+        example:
+
+            >>> intf_names.register(VENDOR_INTF_PREFIXES['comware'])
+        '''
+        self.prefixes.update(prefixes)
+        special = [re.escape(prefix) for prefix in self.prefixes
+                   if not prefix.isalpha()]
+        self._special = re.compile('|'.join(special)) if special else None
+        # Names converted with the previous table
+        self.cache.clear()
+
+    def extend(self, prefixes, maxsize=None):
+        '''Return a new converter of the table with prefixes added, this
+        one unchanged
+
+        Args:
+            prefixes (`dict`): {short interface type: full interface type}
+            maxsize (`int`): number of converted names kept, the one of
+                             this converter by default
+        '''
+        converter = self.__class__(
+            self.prefixes,
+            maxsize=self.cache.maxsize if maxsize is None else maxsize)
+        converter.register(prefixes)
+        return converter
+
+    def __call__(self, intf):
+        '''Return the full name of intf'''
+        name = self.cache.get(intf)
+        if name is None:
+            name = self._convert(intf)
+            self.cache.put(intf, name)
+        return name
+
+    def convert_all(self, intfs):
+        '''Return the full names of intfs, in order, each distinct name
+        converted once
+
+        Args:
+            intfs (`list`): short interface names, such as a column of a
+                            table
+
+        example:
+
+            >>> intf_names.convert_all(['Gi1/0/1', 'Gi1/0/2', 'Gi1/0/1'])
+            ['GigabitEthernet1/0/1', 'GigabitEthernet1/0/2',
+             'GigabitEthernet1/0/1']
+        '''
+        names = {}
+        for intf in intfs:
+            if intf not in names:
+                names[intf] = self(intf)
+        return [names[intf] for intf in intfs]
+
+    def _convert(self, intf):
+        m = _intf_type.search(intf)
+        m1 = _intf_port.search(intf)
+        if not m or not m1:
+            return intf
+        m2 = self._special.search(intf) if self._special else None
+        int_type = m2.group(0) if m2 else m.group(0)
+        try:
+            return self.prefixes[int_type] + m1.group(0)
+        except KeyError:
+            # Unifying interface names
+            return intf[0].capitalize() + \
+                   intf[1:].replace(' ', '').replace('ethernet', 'Ethernet')
+
+
+# Converter of Common.convert_intf_name, every vendor type included
+intf_names = IntfNameConverter(INTF_PREFIXES)
+for _prefixes in VENDOR_INTF_PREFIXES.values():
+    intf_names.register(_prefixes)
@@ -0,0 +1,77 @@
+'''Shared strings for the values repeated across parse results
+
+Route, BGP, MAC and ARP tables repeat the same few values on most of their
+rows: interface names, next hops, protocol codes, entry types, BGP path
+attributes. Each match of a line makes new copies of them, so a result of
+hundreds of thousands of rows holds as many copies of 'dynamic' or
+'GigabitEthernet0/1' as it has rows.
+
+Their parsers pass these values through string_pool before storing them in
+their result. Each value is then stored once, shared by the rows of the
+result, and by the other results of the process still holding it, such as
+the ones kept by ParsedResultCache:
+
+    >>> string_pool('dynamic') is string_pool(''.join(['dyn', 'amic']))
+    True
+
+Only the values repeated across rows go through the pool, not the ones
+unique to a row (prefixes, MAC or IP addresses of the entries), which would
+only fill it.
+'''
+
+# Strings kept by default, the pool starts over once full
+DEFAULT_POOL_SIZE = 65536
+
+
+class StringPool(object):
+    '''Bounded pool of shared strings
+
+    The pool keeps the first copy of each string it is given, and returns
+    it for every equal string after it. Once maxsize strings are kept, the
+    pool is emptied and starts over, strings already shared staying shared.
+
+    Args:
+        maxsize (`int`): maximum number of strings kept, 0 keeps none
+
+    example:
+
+        >>> pool = StringPool(maxsize=1024)
+        >>> first = pool('GigabitEthernet0/1')
+        >>> pool('GigabitEthernet' + '0/1') is first
+        True
+    '''
+
+    def __init__(self, maxsize=DEFAULT_POOL_SIZE):
+        self.maxsize = maxsize
+        self._strings = {}
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __call__(self, value):
+        '''Return the string of the pool equal to value, value itself the
+        first time. Values other than strings, such as None, are returned
+        as they are.'''
+        strings = self._strings
+        try:
+            return strings[value]
+        except KeyError:
+            pass
+        except TypeError:
+            return value
+        if type(value) is not str:
+            return value
+        if len(strings) >= self.maxsize:
+            if self.maxsize <= 0:
+                return value
+            strings.clear()
+        strings[value] = value
+        return value
+
+    def clear(self):
+        '''Drop every string of the pool'''
+        self._strings.clear()
+
+
+# Pool of the parsers, shared by every parse of the process
+string_pool = StringPool()
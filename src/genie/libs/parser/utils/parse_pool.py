@@ -0,0 +1,159 @@
+'''Parse outputs in worker processes
+
+Parsing a full BGP or routing table is pure Python work holding the GIL, so
+threads collecting from many devices wait on each other to parse. ParsePool
+ships the raw outputs to worker processes instead:
+
+    * The parser of each command is resolved in the worker with get_parser,
+      for the os, platform and abstraction of the device.
+    * The workers import the parser packages they are given once, when they
+      start, and keep them (and every parser they resolved) for the next
+      outputs.
+    * Results come back pickled, the keys repeated in every entry of a table
+      being sent once per result.
+
+    >>> from genie.libs.parser.utils.parse_pool import ParsePool
+    >>> with ParsePool(packages=['iosxe']) as pool:
+    ...     futures = [pool.submit('show ip route', output, device=device)
+    ...                for device, output in outputs.items()]
+    ...     parsed = [future.result() for future in futures]
+
+Only the given output is parsed: parsers executing other commands on the
+device cannot run in a worker.
+'''
+
+# python
+import logging
+import pkgutil
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+
+from .common import get_parser, parser_data
+
+log = logging.getLogger(__name__)
+
+# Parser packages imported in this process, when it is a worker
+_imported = set()
+
+# Device attributes giving the parser of a command
+DEVICE_ATTRIBUTES = ('name', 'os', 'platform', 'model', 'type', 'series')
+
+
+class _WorkerDevice(object):
+    '''Device of the workers, only carrying what finds its parsers'''
+
+    def __init__(self, custom=None, **attributes):
+        self.custom = custom or {}
+        self.__dict__.update(attributes)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__,
+                                getattr(self, 'name', None))
+
+
+def _device_info(device=None, os=None):
+    '''What the workers need of device to find its parsers, as a dict'''
+    info = {}
+    if device is not None:
+        for attribute in DEVICE_ATTRIBUTES:
+            value = getattr(device, attribute, None)
+            if isinstance(value, str):
+                info[attribute] = value
+        custom = getattr(device, 'custom', None)
+        if isinstance(custom, dict) and 'abstraction' in custom:
+            info['custom'] = {'abstraction': custom['abstraction']}
+    if os is not None:
+        info['os'] = os
+    return info
+
+
+def _import_package(name):
+    '''Import every parser module of the package name, but its tests'''
+    module = importlib.import_module(name)
+    for info in pkgutil.iter_modules(module.__path__, name + '.'):
+        if info.name.rsplit('.', 1)[1] == 'tests':
+            continue
+        try:
+            importlib.import_module(info.name)
+        except Exception as e:
+            log.debug('Could not import {}: {}'.format(info.name, e))
+            continue
+        if info.ispkg:
+            _import_package(info.name)
+
+
+def _warm(packages):
+    '''Import the parsers index and the parser packages not imported yet'''
+    parser_data.load()
+    for package in packages:
+        if package not in _imported:
+            _imported.add(package)
+            _import_package('genie.libs.parser.{}'.format(package))
+
+
+def _parse(packages, command, output, info, kwargs):
+    '''Worker side of ParsePool.submit()'''
+    _warm(packages)
+    device = _WorkerDevice(**info)
+    if isinstance(command, str):
+        parser_cls, parser_kwargs = get_parser(command, device)
+    else:
+        parser_cls, parser_kwargs = command, {}
+    parser_kwargs.update(kwargs)
+    parser_kwargs['output'] = output
+    return parser_cls(device=device).parse(**parser_kwargs)
+
+
+class ParsePool(object):
+    '''Process pool parsing outputs with the parsers of genie.libs.parser
+
+    Args:
+        max_workers (`int`): worker processes, the number of CPUs by default
+        packages (`list`): parser packages each worker imports when it
+                           starts, such as ['iosxe', 'nxos']
+
+    example:
+
+        >>> pool = ParsePool(max_workers=4, packages=['iosxr'])
+        >>> pool.parse('show bgp instance all all', output, os='iosxr')
+        {'instance': {'default': ...}}
+        >>> pool.shutdown()
+    '''
+
+    def __init__(self, max_workers=None, packages=()):
+        self.packages = tuple(packages)
+        try:
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_warm,
+                initargs=(self.packages,))
+        except TypeError:
+            # Python < 3.7, imported by the first output of each worker
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    def submit(self, command, output, device=None, os=None, **kwargs):
+        '''Parse output in a worker, return the Future of the result
+
+        Args:
+            command (`str`): command of the output, or the parser class
+            output (`str`): output of the command
+            device (`Device`): device the output comes from, giving the os,
+                               platform and abstraction of its parser
+            os (`str`): os of the parser, without device
+            kwargs: arguments of the parser not in the command
+        '''
+        return self._executor.submit(_parse, self.packages, command, output,
+                                     _device_info(device, os), kwargs)
+
+    def parse(self, command, output, device=None, os=None, **kwargs):
+        '''Return output parsed in a worker'''
+        return self.submit(command, output, device=device, os=os,
+                           **kwargs).result()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -0,0 +1,384 @@
+'''Helpers to match device output against regular expressions'''
+
+# python
+import re
+
+
+class PatternTable(dict):
+    '''Compiled regular expressions of a parser module.
+
+    Parsers compile their patterns on every call of cli(). Python only keeps
+    the last 512 compiled expressions, so going through many parsers keeps
+    compiling the same patterns again. A PatternTable is declared once per
+    module and compiles each pattern the first time it is used only.
+
+    example:
+
+        >>> _patterns = PatternTable()
+        >>> class ShowClock(ShowClockSchema):
+        ...     def cli(self, output=None):
+        ...         p1 = _patterns.compile(r'^(?P<time>[\\d\\:\\.]+)')
+        ...         p2 = _patterns.compile(r'^Time source is (?P<source>\\w+)',
+        ...                                re.IGNORECASE)
+    '''
+
+    def compile(self, pattern, flags=0):
+        '''Return pattern compiled with flags, compiling it on first use'''
+        key = (pattern, flags) if flags else pattern
+        try:
+            return self[key]
+        except KeyError:
+            compiled = self[key] = re.compile(pattern, flags)
+            return compiled
+
+
+class LineDispatcher(object):
+    '''Match lines against the patterns of a parser, only trying the patterns
+    which can match each line.
+
+    Parsers try each of their patterns in turn on every line, so most lines go
+    through tens of failing match() before reaching theirs. Each pattern added
+    to a LineDispatcher can declare the literal text every line it matches
+    starts with (its anchor). Lines are routed on their first word to the
+    patterns anchored on that word, along with the patterns without anchor,
+    still tried in the order they were added.
+
+    The first word of an anchor must be complete ('Hardware is', not 'Hard').
+    A leading number stands for any number and is routed along with the word
+    following it ('0 packets input' for '1386 packets input, 149370 bytes').
+
+    Patterns are compiled on the first match.
+
+    example:
+
+        >>> lines = LineDispatcher()
+        >>> lines.add('p1', r'^(?P<interface>\\S+) +is +(?P<enabled>\\w+), '
+        ...                 r'+line +protocol', contains='line protocol')
+        >>> lines.add('p2', r'^Hardware +is +(?P<type>.+)$',
+        ...           anchor='Hardware is')
+        >>> lines.add('p3', r'^(?P<in_pkts>\\d+) +packets +input',
+        ...           anchor='0 packets input')
+        >>> lines.match('Hardware is CSR vNIC')
+        ('p2', <re.Match object; span=(0, 20), match='Hardware is CSR vNIC'>)
+        >>> lines.match('nothing to see')
+        (None, None)
+    '''
+
+    _first_word = re.compile(r'([^\W\d_]+)|\d+\s*([^\W\d_]*)')
+
+    def __init__(self):
+        self._rules = []
+        self._index = None
+
+    def __len__(self):
+        return len(self._rules)
+
+    @classmethod
+    def _key(cls, text):
+        '''Word a line starting with text is routed on, None if text does not
+        start with a word or a number'''
+        m = cls._first_word.match(text)
+        if not m:
+            return None
+        word, after_number = m.groups()
+        return word if word is not None else '0 ' + after_number
+
+    def add(self, rule, pattern, anchor=None, contains=None, flags=0):
+        '''Add a pattern, tried after the ones already added
+
+        Args:
+            rule (`str`): returned by match() when the pattern matches, can be
+                          shared by several patterns
+            pattern (`str`): regular expression matched from the start of the
+                             line
+            anchor (`str` or `tuple`): literal text the lines matched by the
+                                       pattern start with, or several of them.
+                                       None to try the pattern on every line
+            contains (`str`): literal text the lines matched by the pattern
+                              contain, the pattern is not tried on the other
+                              lines. Mostly useful without anchor
+            flags (`int`): re flags
+        '''
+        if anchor is None:
+            keys = None
+        else:
+            anchors = (anchor,) if isinstance(anchor, str) else anchor
+            keys = []
+            for text in anchors:
+                key = self._key(text)
+                if key is None:
+                    raise ValueError("Anchor '{}' of pattern '{}' does not "
+                                     "start with a word".format(text, rule))
+                if key not in keys:
+                    keys.append(key)
+
+        self._rules.append((rule, pattern, flags, keys, contains))
+        self._index = None
+
+    def _compile(self):
+        # Each word gets its anchored patterns and the patterns without
+        # anchor, in the order they were added
+        compiled = []
+        fallback = []
+        index = {}
+        for rule, pattern, flags, keys, contains in self._rules:
+            entry = (rule, re.compile(pattern, flags), contains)
+            compiled.append(entry)
+            if keys is None:
+                fallback.append(entry)
+                for candidates in index.values():
+                    candidates.append(entry)
+                continue
+            for key in keys:
+                index.setdefault(key, list(fallback)).append(entry)
+
+        self._index = (index, fallback, compiled)
+        return self._index
+
+    @property
+    def rules(self):
+        '''[(rule, compiled pattern)] in the order they were added'''
+        compiled = (self._index or self._compile())[2]
+        return [(rule, pattern) for rule, pattern, _ in compiled]
+
+    def candidates(self, line):
+        '''Return the [(rule, compiled pattern)] which can match line'''
+        index, fallback, _ = self._index or self._compile()
+        return [(rule, pattern)
+                for rule, pattern, contains in index.get(self._key(line),
+                                                         fallback)
+                if contains is None or contains in line]
+
+    def match(self, line):
+        '''Return (rule, match object) of the first pattern matching line, or
+        (None, None)'''
+        index, fallback, _ = self._index or self._compile()
+        for rule, pattern, contains in index.get(self._key(line), fallback):
+            if contains is not None and contains not in line:
+                continue
+            m = pattern.match(line)
+            if m:
+                return rule, m
+        return None, None
+
+
+class PatternScanner(object):
+    '''Match lines against all the patterns of a parser at once.
+
+    The patterns are merged into a single alternation, each of them in its own
+    named group, so a line goes through one match() instead of one per
+    pattern. As the alternatives are tried in the order the patterns were
+    added, the pattern reported is the first one matching, like trying them in
+    turn. The groups of each pattern are handed back as its own groupdict.
+
+    Patterns cannot use numbered back references, conditional groups or inline
+    global flags, flags are given to the scanner instead.
+
+    example:
+
+        >>> lines = PatternScanner()
+        >>> lines.add('p1', r'^Routing Table: +(?P<vrf>\\S+)$')
+        >>> lines.add('p2', r'^(?P<code>[\\w\\*]+) +(?P<network>[\\d\\.\\/]+)')
+        >>> lines.match('Routing Table: VRF1')
+        ('p1', {'vrf': 'VRF1'})
+        >>> for rule, group in lines.finditer(output):
+        ...     if rule == 'p1':
+        ...         vrf = group['vrf']
+    '''
+
+    def __init__(self, flags=0):
+        self.flags = flags
+        self._rules = []
+        self._compiled = []
+        self._line = None
+        self._buffer = None
+
+    def __len__(self):
+        return len(self._rules)
+
+    def add(self, rule, pattern):
+        '''Add a pattern, tried after the ones already added
+
+        Args:
+            rule (`str`): returned along with the groupdict when the pattern
+                          matches, can be shared by several patterns
+            pattern (`str`): regular expression matched from the start of the
+                             line
+        '''
+        # Rejected now rather than on the first match
+        _rewrite(pattern, '_0_', line_end=False)
+        compiled = re.compile(pattern, self.flags)
+        names = sorted(compiled.groupindex, key=compiled.groupindex.get)
+        self._rules.append((rule, pattern, compiled.groups, names,
+                            [compiled.groupindex[name] for name in names]))
+        self._compiled.append((rule, compiled))
+        self._line = self._buffer = None
+
+    @property
+    def rules(self):
+        '''[(rule, compiled pattern)] in the order they were added'''
+        return list(self._compiled)
+
+    def _compile(self, buffer):
+        # Each pattern is followed by an empty group, the last one closed
+        # when it matches. Group 1 of the buffer pattern is the indentation
+        # of the line
+        offset = 1 if buffer else 0
+        alternatives = []
+        rules = {}
+        for number, (rule, pattern, groups, names, indexes) in \
+                                                    enumerate(self._rules):
+            rewritten = _rewrite(pattern, '_{}_'.format(number),
+                                 line_end=buffer)
+            # An alternative starting with a literal is skipped on the first
+            # character, only grouped when it has alternatives of its own
+            if '|' in rewritten:
+                rewritten = '(?:{})'.format(rewritten)
+            alternatives.append('{}(?P<_{}>)'.format(rewritten, number))
+            marker = offset + groups + 1
+            rules[marker] = (rule, names,
+                             tuple(offset + index for index in indexes))
+            offset = marker
+
+        alternation = '|'.join(alternatives)
+        if buffer:
+            # Each line is matched once: leading blanks are left out of the
+            # patterns as by strip(), the rest of the line is consumed
+            compiled = re.compile(r'^(?=(?P<_indent>[ \t\r\f\v]*))(?P=_indent)'
+                                  r'(?:{})[^\n]*'.format(alternation),
+                                  self.flags | re.MULTILINE)
+            self._buffer = (compiled, rules)
+        else:
+            compiled = re.compile(alternation, self.flags)
+            self._line = (compiled, rules)
+        return compiled, rules
+
+    @staticmethod
+    def _result(m, rules):
+        rule, names, indexes = rules[m.lastindex]
+        if not names:
+            return rule, {}
+        values = m.group(*indexes) if len(indexes) > 1 else \
+                                                        (m.group(indexes[0]),)
+        return rule, dict(zip(names, values))
+
+    def match(self, line):
+        '''Return (rule, groupdict) of the first pattern matching line, or
+        (None, None)'''
+        compiled, rules = self._line or self._compile(buffer=False)
+        m = compiled.match(line)
+        if not m:
+            return None, None
+        return self._result(m, rules)
+
+    def scan(self, output):
+        '''Yield (rule, groupdict) for each line of output matching a pattern,
+        lines being stripped first'''
+        compiled, rules = self._line or self._compile(buffer=False)
+        result = self._result
+        for line in output.splitlines():
+            m = compiled.match(line.strip())
+            if m:
+                yield result(m, rules)
+
+    def finditer(self, output):
+        '''Yield the same as scan(), going through output with a single
+        finditer() instead of matching each line'''
+        compiled, rules = self._buffer or self._compile(buffer=True)
+        # Faster than a substitution going through each run of blanks
+        output = '\n'.join(line.rstrip() for line in output.split('\n'))
+        # splitlines() has no empty line after the last line break
+        if output.endswith('\n'):
+            output = output[:-1]
+        if not output:
+            return
+        result = self._result
+        for m in compiled.finditer(output):
+            yield result(m, rules)
+
+
+_group = re.compile(r'\?P([<=])(\w+)')
+
+# Escapes matching a line break, and the same without it
+_line_escapes = {'\\s': '[^\\S\\n]', '\\W': '[^\\w\\n]', '\\D': '[^\\d\\n]'}
+
+
+def _line_class(char_class):
+    '''Return char_class, kept from matching a line break'''
+    if not re.match(char_class, '\n'):
+        return char_class
+    if char_class.startswith('[^'):
+        return char_class[:-1] + '\\n]'
+    return '(?:(?!\\n){})'.format(char_class)
+
+
+def _rewrite(pattern, prefix, line_end):
+    '''Return pattern with its group names prefixed. With line_end, the
+    pattern is also kept from matching across the end of a line, for a
+    buffer scanned with MULTILINE.
+
+    Raises ValueError if the pattern cannot be merged with others.
+    '''
+    out = []
+    i = 0
+    length = len(pattern)
+    class_start = None
+
+    # The start of the line is matched by the buffer pattern itself
+    if line_end and pattern.startswith('^'):
+        i = 1
+
+    while i < length:
+        char = pattern[i]
+
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if class_start is None:
+                if escape[1:2].isdigit() and escape[1] != '0':
+                    raise ValueError("Numbered back reference in '{}'"
+                                     .format(pattern))
+                if line_end and escape in _line_escapes:
+                    escape = _line_escapes[escape]
+            out.append(escape)
+            i += 2
+            continue
+
+        if class_start is not None:
+            out.append(char)
+            i += 1
+            if char == ']':
+                if line_end:
+                    out[class_start:] = [_line_class(''.join(
+                                                        out[class_start:]))]
+                class_start = None
+            continue
+
+        if char == '[':
+            out.append(char)
+            i += 1
+            if pattern[i:i + 1] == '^':
+                out.append('^')
+                i += 1
+            class_start = len(out) - 1 if out[-1] == '[' else len(out) - 2
+            # A ']' right after '[' or '[^' is a literal
+            if pattern[i:i + 1] == ']':
+                out.append(']')
+                i += 1
+            continue
+
+        if char == '(' and pattern[i + 1:i + 2] == '?':
+            m = _group.match(pattern, i + 1)
+            if m:
+                out.append('(?P{}{}{}'.format(m.group(1), prefix, m.group(2)))
+                i = m.end()
+                continue
+            if pattern[i + 2:i + 3] == '(':
+                raise ValueError("Conditional group in '{}'".format(pattern))
+            if re.match(r'\?[aiLmsux]+\)', pattern[i + 1:]):
+                raise ValueError("Inline global flags in '{}', give them to "
+                                 "the PatternScanner".format(pattern))
+
+        out.append(char)
+        i += 1
+
+    return ''.join(out)
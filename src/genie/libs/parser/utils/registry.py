@@ -0,0 +1,283 @@
+'''Lazily loaded registry of the parsers (parser_data) and its precompiled
+index.
+
+The full parsers.json carries the doc, schema and url of every parser which
+are not needed to find a parser. At build time it is compiled into
+parsers.marshal, which only keeps what get_parser needs plus the argument
+free commands of each os, by compile_package_index() (see `make json`).
+'''
+
+# python
+import os
+import json
+import time
+import hashlib
+import marshal
+import logging
+import threading
+import functools
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+# Keys of a parser entry which are needed to import the parser class
+INDEX_KEYS = ('module_name', 'package', 'class')
+
+# Version of the parsers.marshal layout
+INDEX_VERSION = 2
+
+
+class ParserRegistry(dict):
+    '''dict of the parsers, only populated on its first use.
+
+    Args:
+        loader (`callable`): returns the parsers as a dict
+
+    example:
+
+        >>> parser_data = ParserRegistry(_load_parser_json)
+        >>> parser_data.loaded
+        False
+        >>> 'show version' in parser_data
+        True
+        >>> parser_data.stats
+        {'loaded': True, 'load_time': 0.0021, 'source': 'marshal', ...}
+    '''
+
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+        self._hooks = []
+        self._lock = threading.RLock()
+        self._os_commands = None
+        self._loading = False
+        self.loaded = False
+        self.load_time = None
+        self.source = None
+
+    def load(self):
+        '''Populate the registry if not done yet, then run the on_load hooks
+
+        The registry is only published as loaded once every hook ran. If one
+        of them fails, the registry is emptied again, so every lookup loads
+        it again and reports the error instead of missing its parsers.
+        '''
+        if self.loaded:
+            return
+
+        with self._lock:
+            # Hooks read and add parsers while loading
+            if self.loaded or self._loading:
+                return
+
+            start = time.perf_counter()
+            self._loading = True
+            try:
+                data = self._loader()
+
+                # Loader can say where the data came from
+                self.source = getattr(data, 'source', 'json')
+                self._os_commands = getattr(data, 'os_commands', None)
+
+                dict.update(self, data)
+
+                for hook in self._hooks:
+                    hook()
+            except Exception:
+                dict.clear(self)
+                self._os_commands = None
+                self.source = None
+                raise
+            finally:
+                self._loading = False
+
+            self.load_time = time.perf_counter() - start
+            self.loaded = True
+
+    def on_load(self, hook):
+        '''Call hook once the registry is loaded, right away if it already
+        is'''
+        with self._lock:
+            if self.loaded:
+                hook()
+            else:
+                self._hooks.append(hook)
+
+    def invalidate(self):
+        '''Drop what was derived from the parsers, to be called after
+        modifying them'''
+        self._os_commands = None
+
+    def os_commands(self, os_name):
+        '''Return the commands without argument which have a parser for
+        os_name'''
+        self.load()
+        if self._os_commands is None:
+            self._os_commands = build_os_commands(self)
+        return self._os_commands.get(os_name, [])
+
+    @property
+    def stats(self):
+        return {'loaded': self.loaded,
+                'load_time': self.load_time,
+                'source': self.source,
+                'commands': dict.__len__(self)}
+
+    def __repr__(self):
+        if not self.loaded:
+            return '<{} (not loaded)>'.format(self.__class__.__name__)
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+
+def _loading(name):
+    method = getattr(dict, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.loaded:
+            self.load()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+# Every way of reading or writing the dict loads it first
+for _name in ('__getitem__', '__setitem__', '__delitem__', '__contains__',
+              '__iter__', '__len__', '__eq__', '__ne__', '__reversed__',
+              'get', 'items', 'keys', 'values', 'pop', 'popitem',
+              'setdefault', 'update', 'copy', 'clear'):
+    setattr(ParserRegistry, _name, _loading(_name))
+
+
+class LoadedParsers(dict):
+    '''Parsers returned by a loader, with where they were loaded from'''
+
+    def __init__(self, data, source, os_commands=None):
+        super().__init__(data)
+        self.source = source
+        self.os_commands = os_commands
+
+
+def build_os_commands(data):
+    '''Return {os: [commands]} of the commands without argument'''
+    commands = OrderedDict()
+    for command, values in data.items():
+        if '{' in command or command == 'tokens':
+            continue
+        for os_name in values:
+            commands.setdefault(os_name, []).append(command)
+    return dict(commands)
+
+
+def _compact(entry):
+    '''Only keep the keys needed to import the parser, at every token level'''
+    return {key: _compact(value) if isinstance(value, dict) else value
+            for key, value in entry.items()
+            if isinstance(value, dict) or key in INDEX_KEYS}
+
+
+def _source_stamp(json_path):
+    '''Size and modification time of parsers.json'''
+    stat = os.stat(json_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _source_hash(json_path):
+    '''Digest of the content of parsers.json'''
+    digest = hashlib.sha1()
+    with open(json_path, 'rb') as f:
+        for chunk in iter(functools.partial(f.read, 1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_outdated(index, json_path):
+    '''Return whether parsers.json changed since the index was compiled
+
+    The size and modification time are checked first. When only the
+    modification time differs, as once installed from a package, the
+    content decides.
+    '''
+    size, mtime_ns = _source_stamp(json_path)
+    if size != index['source_size']:
+        return True
+    if mtime_ns == index['source_mtime_ns']:
+        return False
+    return _source_hash(json_path) != index['source_hash']
+
+
+def compile_index(json_path, index_path):
+    '''Compile parsers.json into the parsers.marshal index
+
+    Args:
+        json_path (`str`): path of parsers.json
+        index_path (`str`): path of the index to write
+
+    Returns:
+        dict: the index written
+    '''
+    with open(json_path) as f:
+        data = json.load(f)
+
+    parsers = {command: _compact(values) if isinstance(values, dict)
+                                                                else values
+               for command, values in data.items()}
+
+    size, mtime_ns = _source_stamp(json_path)
+    index = {'version': INDEX_VERSION,
+             'source_size': size,
+             'source_mtime_ns': mtime_ns,
+             'source_hash': _source_hash(json_path),
+             'parsers': parsers,
+             'os_commands': build_os_commands(parsers)}
+
+    with open(index_path, 'wb') as f:
+        marshal.dump(index, f)
+
+    return index
+
+
+def load_index(index_path, json_path=None):
+    '''Load the parsers.marshal index
+
+    Args:
+        index_path (`str`): path of the index
+        json_path (`str`): path of parsers.json the index was compiled from,
+                           if it exists and does not match the index, the
+                           index is considered outdated
+
+    Returns:
+        LoadedParsers, or None if the index cannot be used
+    '''
+    try:
+        with open(index_path, 'rb') as f:
+            index = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+        log.debug('{} has an unknown layout, ignoring it'.format(index_path))
+        return None
+
+    if json_path and os.path.isfile(json_path) and \
+            _is_outdated(index, json_path):
+        log.debug('{} is outdated compared to {}, ignoring it'
+                  .format(index_path, json_path))
+        return None
+
+    return LoadedParsers(index['parsers'], source='marshal',
+                         os_commands=index['os_commands'])
+
+
+def compile_package_index():
+    '''Compile parsers.json of genie.libs.parser into parsers.marshal next
+    to it'''
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    json_path = os.path.join(here, 'parsers.json')
+    index_path = os.path.join(here, 'parsers.marshal')
+
+    index = compile_index(json_path, index_path)
+    log.info('Compiled {} commands into {}'.format(len(index['parsers']),
+                                                  index_path))
+    return index
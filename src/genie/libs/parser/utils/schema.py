@@ -0,0 +1,63 @@
+'''Helpers to declare parser schemas'''
+
+from pyats.utils.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema
+
+
+class ListOfDict(object):
+    '''Validator of a list of dict, each of them validated against the same
+    schema, to be given to Use() in a schema.
+
+    Validators defined as functions build a new Schema each time they are
+    called, which happens for every list of the output when nested in another
+    list. A ListOfDict is declared once in the schema class and builds its
+    Schema on its first use only.
+
+    Args:
+        schema (`dict`): schema of each dict of the list
+        error (`str`): message of the SchemaError raised when the value is not
+                       a list
+        dict_as_list (`bool`): a single dict is validated as a list of one
+                               dict, and returned as such
+
+    example:
+
+        >>> class ShowRouteSchema(MetaParser):
+        ...     validate_nh_list = ListOfDict({
+        ...         Optional("to"): str,
+        ...         Optional("via"): str
+        ...     }, 'nh is not a list')
+        ...     validate_rt_list = ListOfDict({
+        ...         "rt-destination": str,
+        ...         Optional("nh"): Use(validate_nh_list)
+        ...     }, 'rt is not a list')
+        ...     schema = {
+        ...         "route-table": {
+        ...             Optional("rt"): Use(validate_rt_list)
+        ...         }
+        ...     }
+    '''
+
+    def __init__(self, schema, error='value is not a list',
+                 dict_as_list=False):
+        self.schema = schema
+        self.error = error
+        self.dict_as_list = dict_as_list
+        self._compiled = None
+
+    def __call__(self, value):
+        if self.dict_as_list and isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError(self.error)
+
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = Schema(self.schema)
+
+        for item in value:
+            compiled.validate(item)
+        return value
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.schema)
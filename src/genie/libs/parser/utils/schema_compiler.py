@@ -0,0 +1,290 @@
+'''Compile parser schemas into generated Python validators
+
+Schema.validate() interprets the schema recursively for every value of the
+output, which dominates the validation of big results such as a full BGP
+table. compiled_schema() generates straight-line functions checking the same
+schema once, and keeps them for the next validations of that schema.
+
+The generated check is only trusted to accept: it is stricter than Schema
+(exact types, no coercion), and whatever it rejects or does not know how to
+check is validated by Schema itself. Accepted and rejected outputs, and the
+exceptions raised for the rejected ones, are therefore the ones of Schema.
+
+    >>> from genie.libs.parser.utils.schema_compiler import compiled_schema
+    >>> compiled_schema(ShowBgpInstanceAllAll.schema).validate(output)
+'''
+
+# python
+import threading
+
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, Use
+
+from .cache import LRUCache
+from .schema import ListOfDict
+
+# Compiled schemas of the parsers used, by id of their schema
+_compiled_schemas = LRUCache(maxsize=4096)
+_compiled_lock = threading.Lock()
+
+# Types checked inline with type(value) is <type>
+_BUILTIN_TYPES = {str: 'str', int: 'int', float: 'float', bool: 'bool',
+                  dict: 'dict', list: 'list', tuple: 'tuple'}
+
+# Literal values compared with type(value) is <type> and value == literal
+_LITERAL_TYPES = (str, int, float, bool, type(None))
+
+
+def _alternatives(schema):
+    '''Schemas of an Or, as named by the versions of genie'''
+    return getattr(schema, 'schemas', None) or getattr(schema, '_args', None)
+
+
+def _converter(schema):
+    '''Callable of a Use, as named by the versions of genie'''
+    func = getattr(schema, 'schema', None)
+    if func is None:
+        func = getattr(schema, '_callable', None)
+    return func
+
+
+def _subtree(schema, value):
+    '''Check value with Schema, for the parts of a schema not compiled'''
+    try:
+        schema.validate(value)
+    except Exception:
+        return False
+    return True
+
+
+class _Generator(object):
+    '''Source of the functions checking a schema, and the objects they use'''
+
+    def __init__(self):
+        self.namespace = {'_subtree': _subtree}
+        self.functions = []
+        self.tables = []
+        self._count = 0
+        # Function generated for each dict, list or callable of the schema
+        self._generated = {}
+
+    def _name(self, prefix):
+        self._count += 1
+        return '{}{}'.format(prefix, self._count)
+
+    def constant(self, value):
+        name = self._name('_c')
+        self.namespace[name] = value
+        return name
+
+    def function(self, prefix, body):
+        '''Add a function of one argument `v`, return its name'''
+        name = self._name(prefix)
+        self.functions.append('def {}(v):\n{}'.format(
+            name, ''.join('    {}\n'.format(line) for line in body)))
+        return name
+
+    def table(self, functions):
+        '''Add a dict of literal key to function, return its name'''
+        name = self._name('_keys')
+        self.tables.append('{} = {{{}}}'.format(name, ', '.join(
+            '{!r}: {}'.format(key, function)
+                                    for key, function in functions.items())))
+        return name
+
+    def source(self):
+        return '\n\n'.join(self.functions + ['\n'.join(self.tables)]) + '\n'
+
+    def call(self, schema, var, generate):
+        '''Call of the function checking schema, generated once'''
+        name = self._generated.get(id(schema))
+        if name is None:
+            name = self._generated[id(schema)] = generate(schema)
+        return '{}({})'.format(name, var)
+
+    def subtree(self, schema, var):
+        return '_subtree({}, {})'.format(self.constant(Schema(schema)), var)
+
+    def expr(self, schema, var):
+        '''Python expression true when var is accepted by schema'''
+        if type(schema) is Schema:
+            return self.expr(schema.schema, var)
+        if isinstance(schema, type):
+            name = _BUILTIN_TYPES.get(schema) or self.constant(schema)
+            return 'type({}) is {}'.format(var, name)
+        if type(schema) is Any:
+            return 'True'
+        if type(schema) is Or and _alternatives(schema):
+            return '({})'.format(' or '.join(
+                self.expr(alternative, var)
+                                for alternative in _alternatives(schema)))
+        if type(schema) is Use and _converter(schema) is not None:
+            func = _converter(schema)
+            if isinstance(func, ListOfDict):
+                return self.call(func, var, self.list_of_dict)
+            return self.call(func, var, self.use)
+        if type(schema) is dict:
+            return self.call(schema, var, self.dict)
+        if type(schema) in _LITERAL_TYPES:
+            return '(type({0}) is {1} and {0} == {2})'.format(
+                var, _BUILTIN_TYPES.get(type(schema), 'type(None)'),
+                self.constant(schema))
+        return self.subtree(schema, var)
+
+    def use(self, func):
+        # Schema returns what func returns, accepted when it is the value
+        return self.function('_use', [
+            'try:',
+            '    return {}(v) is v'.format(self.constant(func)),
+            'except Exception:',
+            '    return False'])
+
+    def _items(self, alternatives):
+        return [
+            'if type(v) is not list:',
+            '    return False',
+            'for i in v:',
+            '    if not ({}):'.format(' or '.join(self.expr(item, 'i')
+                                                  for item in alternatives)),
+            '        return False',
+            'return True']
+
+    def list_of_dict(self, validator):
+        # A single dict of dict_as_list is returned as a list by Schema
+        return self.function('_list', self._items([validator.schema]))
+
+    def dict(self, schema):
+        literals = []
+        wildcards = []
+        for key, value in schema.items():
+            optional = type(key) is Optional
+            name = getattr(key, 'schema', None) if optional else key
+            if type(name) is str:
+                literals.append((name, value, optional, bool(wildcards)))
+            elif type(name) is Any or name is str:
+                wildcards.append((name, value, optional))
+            else:
+                break
+        else:
+            if len(wildcards) <= 1:
+                return self._dict(literals,
+                                  wildcards[0] if wildcards else None)
+        # Keys which Schema may match differently than the generated lookups
+        return self.function('_dict', ['return ' + self.subtree(schema, 'v')])
+
+    def _dict(self, literals, wildcard):
+        body = ['if type(v) is not dict:',
+                '    return False']
+
+        required = frozenset(name for name, _, optional, _ in literals
+                                                            if not optional)
+        if required:
+            body += ['if not v.keys() >= {}:'.format(self.constant(required)),
+                     '    return False']
+
+        # Values of literal keys checked by their type only, or by a function
+        types = {}
+        functions = {}
+        for name, value, optional, after_wildcard in literals:
+            if after_wildcard:
+                # Schema may try the wildcard before this key
+                functions[name] = self.function('_key', [
+                    'return {} and {}'.format(self.expr(value, 'v'),
+                                              self.expr(wildcard[1], 'v'))])
+            elif isinstance(value, type) and value in _BUILTIN_TYPES:
+                types[name] = value
+            else:
+                functions[name] = self.function('_key', [
+                    'return ' + self.expr(value, 'v')])
+
+        seen = wildcard is not None and not wildcard[2]
+        if seen:
+            body.append('seen = False')
+        body.append('for k, i in v.items():')
+        if types:
+            body += ['    t = {}.get(k)'.format(self.constant(types)),
+                     '    if t is not None:',
+                     '        if type(i) is not t:',
+                     '            return False',
+                     '        continue']
+        if functions:
+            body += ['    f = {}.get(k)'.format(self.table(functions)),
+                     '    if f is not None:',
+                     '        if not f(i):',
+                     '            return False',
+                     '        continue']
+        if wildcard is None:
+            body.append('    return False')
+        else:
+            if wildcard[0] is str:
+                body += ['    if type(k) is not str:',
+                         '        return False']
+            body += ['    if not {}:'.format(self.expr(wildcard[1], 'i')),
+                     '        return False']
+            if seen:
+                body.append('    seen = True')
+        body.append('return seen' if seen else 'return True')
+        return self.function('_dict', body)
+
+
+class CompiledSchema(object):
+    '''Schema validating through generated functions
+
+    Args:
+        schema (`dict`): schema of a parser
+
+    example:
+
+        >>> compiled = CompiledSchema({'vrf': {Any(): {'index': int}}})
+        >>> compiled.check({'vrf': {'default': {'index': 1}}})
+        True
+        >>> compiled.validate({'vrf': {'default': {'index': '1'}}})
+        Traceback (most recent call last):
+        ...
+        SchemaTypeError: ...
+    '''
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._schema = None
+
+        generator = _Generator()
+        check = generator.function('_check',
+                                   ['return ' + generator.expr(schema, 'v')])
+        self.source = generator.source()
+
+        namespace = generator.namespace
+        exec(compile(self.source, '<schema {:#x}>'.format(id(schema)),
+                     'exec'), namespace)
+        self.check = namespace[check]
+
+    def validate(self, data, **kwargs):
+        '''Return data when accepted by the schema, raise the error of Schema
+        otherwise
+
+        Args:
+            data (`dict`): output of the parser
+            kwargs: arguments of Schema.validate, such as
+                    warn_unsupported_keys
+        '''
+        if self.check(data):
+            return data
+        if self._schema is None:
+            self._schema = Schema(self.schema)
+        return self._schema.validate(data, **kwargs)
+
+    def __repr__(self):
+        return '<{} {:#x}>'.format(self.__class__.__name__, id(self.schema))
+
+
+def compiled_schema(schema):
+    '''Return the CompiledSchema of schema, compiled on its first use'''
+    key = id(schema)
+    cached = _compiled_schemas.get(key)
+    if cached is not None and cached.schema is schema:
+        return cached
+    with _compiled_lock:
+        cached = _compiled_schemas.get(key)
+        if cached is None or cached.schema is not schema:
+            cached = CompiledSchema(schema)
+            _compiled_schemas.put(key, cached)
+    return cached
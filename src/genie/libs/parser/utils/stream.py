@@ -0,0 +1,165 @@
+'''Parse route and BGP tables record by record, while they are read
+
+A full routing or BGP table is read whole, parsed whole, and only then handed
+back as one dictionary, holding every prefix at once. Table parsers inheriting
+StreamParser also have iter_parse(), going through the output as it comes in
+and yielding each prefix on its own once its last line is read.
+
+The records are cut out of the output by the RecordStream of the parser:
+
+    * A record starts on a line matching its record pattern, and goes on
+      until the next record or context line.
+    * Context lines (VRF, address family, table headers) are kept, level by
+      level, as long as they apply: a new VRF drops the address family and
+      headers kept under the previous one.
+
+Each record is parsed by cli() along with the context lines it is under, so
+it is a complete result of the parser for that prefix only, with its VRF and
+address family keys. Only the context lines and the lines of the current
+record are kept, whatever the size of the table. Records are not validated
+against the schema, and a context without any record (a VRF without routes)
+yields nothing.
+
+    >>> parser = ShowIpRoute(device=device)
+    >>> with open('show_ip_route.txt') as f:
+    ...     for record in parser.iter_parse(f):
+    ...         process(record)
+'''
+
+# python
+import re
+import codecs
+
+
+def iter_lines(output):
+    '''Yield the lines of output, given whole or as an iterable of chunks
+
+    Args:
+        output (`str` or `iterable`): output, lines with their line break as
+                                      read from a file, or chunks as read
+                                      from a connection, str or utf-8 bytes
+
+    example:
+
+        >>> list(iter_lines(['Routing Table: VR', 'F1\\nC  10.4.1.1']))
+        ['Routing Table: VRF1', 'C  10.4.1.1']
+    '''
+    if isinstance(output, (str, bytes)):
+        output = (output,)
+    decoder = None
+    pending = ''
+    for chunk in output:
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder('utf-8')('replace')
+            chunk = decoder.decode(chunk)
+        if '\n' not in chunk:
+            pending += chunk
+            continue
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip('\r')
+    if decoder is not None:
+        pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.rstrip('\r')
+
+
+class RecordStream(object):
+    '''Where the records and their context are in the output of a parser
+
+    Patterns are matched against each line, leading blanks included.
+
+    Args:
+        record (`str`): pattern of the first line of a record
+        context (`list`): patterns of the context lines, by level. Context
+                          lines of a level following each other are kept
+                          together, and replace the ones kept for their level
+                          and the levels after it otherwise
+
+    example:
+
+        >>> stream = RecordStream(
+        ...     record=r'^\\s*[\\w\\*]+ +[\\d\\.]+\\/\\d+ ',
+        ...     context=[r'^Routing Table: ', r'^\\s*[\\d\\.\\/]+ +is +subnetted'])
+        >>> for lines in stream.split(iter_lines(output)):
+        ...     print('\\n'.join(lines))
+    '''
+
+    def __init__(self, record, context=()):
+        self.record = re.compile(record)
+        self.context = [re.compile(pattern) for pattern in context]
+
+    def split(self, lines):
+        '''Yield the lines of each record, after the context lines it is
+        under'''
+        # [(level, line)] in the order they were read
+        context = []
+        # Levels extended since the last record
+        fresh = set()
+        record = []
+        for line in lines:
+            for level, pattern in enumerate(self.context):
+                if pattern.match(line):
+                    break
+            else:
+                level = None
+
+            if level is not None:
+                if record:
+                    yield [kept for _, kept in context] + record
+                    record = []
+                if level in fresh:
+                    context = [(l, kept) for l, kept in context if l <= level]
+                else:
+                    context = [(l, kept) for l, kept in context if l < level]
+                fresh = {l for l in fresh if l < level}
+                fresh.add(level)
+                context.append((level, line))
+            elif self.record.match(line):
+                if record:
+                    yield [kept for _, kept in context] + record
+                record = [line]
+                fresh = set()
+            elif record:
+                record.append(line)
+            # Anything else before the first record of a context (legends,
+            # column titles) is not part of any record
+
+        if record:
+            yield [kept for _, kept in context] + record
+
+
+class StreamParser(object):
+    '''Gives the table parsers declaring a RecordStream an iter_parse()
+
+    example:
+
+        >>> class ShowIpRoute(ShowIpRouteSchema, StreamParser):
+        ...     record_stream = RecordStream(record=..., context=[...])
+    '''
+
+    # RecordStream of the parser
+    record_stream = None
+
+    def iter_parse(self, output, **kwargs):
+        '''Yield the parsed records of output as they are read, each a
+        result of cli() for one prefix
+
+        Args:
+            output (`str` or `iterable`): output of the command, whole or as
+                                          lines or chunks read one after the
+                                          other
+            kwargs: arguments of cli(), such as the vrf of the output
+
+        example:
+
+            >>> for record in ShowBgpAll(device=device).iter_parse(
+            ...         channel_chunks, address_family='ipv4 unicast'):
+            ...     store(record)
+        '''
+        for lines in self.record_stream.split(iter_lines(output)):
+            parsed = self.cli(output='\n'.join(lines), **kwargs)
+            if parsed:
+                yield parsed
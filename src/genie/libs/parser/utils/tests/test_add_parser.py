@@ -1,10 +1,16 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from genie.libs.parser.utils import entry_points
 from genie.libs.parser.utils.common import (
     parser_data
 )
-from genie.libs.parser.utils.entry_points import add_parser
+from genie.libs.parser.utils.entry_points import (
+    add_parser,
+    add_parser_path,
+    load_entry_points,
+    entry_points_report
+)
 
 
 class TestAddParser(unittest.TestCase):
@@ -39,6 +45,71 @@ class TestAddParser(unittest.TestCase):
         for cmd in cli_command:
             self.assertIn(cmd, parser_data)
 
+    def test_add_parser_path(self):
+        cli_command = 'show test_add_parser_path'
+        self.assertNotIn(cli_command, parser_data)
+
+        add_parser_path(path='my_parsers.iosxe.show_test.ShowTest',
+                        commands=cli_command, os_name='iosxe')
+
+        self.assertEqual(parser_data[cli_command]['iosxe'],
+                         {'module_name': 'show_test',
+                          'package': 'my_parsers.iosxe',
+                          'class': 'ShowTest'})
+
+    def test_load_entry_points(self):
+        declarative = Mock(value='my_parsers.entry:PARSERS')
+        declarative.name = 'declarative'
+        declarative.load.return_value = {
+            'nxos': {'show test_entry_point_declarative':
+                                    'my_parsers.nxos.show_test.ShowTest'}}
+
+        mock_parser = Mock(cli_command='show test_entry_point_function',
+                           __module__='asa.MockParser')
+        mock_parser.__name__ = 'MockParser'
+        function = Mock(value='my_parsers.entry:add_parsers')
+        function.name = 'function'
+        function.load.return_value = Mock(
+                                    return_value={'asa': [mock_parser]})
+
+        with patch.object(entry_points, '_iter_entry_points',
+                          return_value=[declarative, function]), \
+             patch.dict('sys.modules', {'asa.MockParser': Mock(
+                        __name__='asa.MockParser', __package__='asa')}), \
+             patch.object(entry_points, '_report', []):
+            load_entry_points()
+            report = {entry['name']: entry for entry in entry_points_report()}
+
+        self.assertIn('show test_entry_point_declarative', parser_data)
+        self.assertIn('show test_entry_point_function', parser_data)
+        self.assertEqual(report['declarative']['parsers'], 1)
+        self.assertEqual(report['function']['parsers'], 1)
+        self.assertIsNotNone(report['function']['time'])
+
+    def test_broken_entry_point(self):
+        broken = Mock(value='broken_parsers.entry:PARSERS')
+        broken.name = 'broken'
+        broken.load.side_effect = ImportError("No module named 'broken'")
+        declarative = Mock(value='my_parsers.entry:PARSERS')
+        declarative.name = 'declarative'
+        declarative.load.return_value = {
+            'nxos': {'show test_entry_point_after_broken':
+                                    'my_parsers.nxos.show_test.ShowTest'}}
+
+        with patch.object(entry_points, '_iter_entry_points',
+                          return_value=[broken, declarative]), \
+             patch.object(entry_points, '_report', []), \
+             self.assertLogs(entry_points.log, 'ERROR') as logs:
+            load_entry_points()
+            report = {entry['name']: entry for entry in entry_points_report()}
+
+        # Logged and reported, the other entry points still load
+        self.assertIn('broken', logs.output[0])
+        self.assertEqual(report['broken']['error'],
+                         "No module named 'broken'")
+        self.assertEqual(report['broken']['parsers'], 0)
+        self.assertIn('show test_entry_point_after_broken', parser_data)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,206 @@
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils import async_parse
+from genie.libs.parser.utils.async_parse import set_parse_executor
+from genie.libs.parser.utils.cache import ParsedResultCache, execute_cached
+from genie.libs.parser.utils.execute import memoize_commands
+
+
+class AsyncDevice(object):
+    '''Device answering each command with its output from `outputs`, once
+    `concurrent` commands are awaited at the same time'''
+
+    def __init__(self, outputs, concurrent=1):
+        self.outputs = outputs
+        self.concurrent = concurrent
+        self.commands = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._all_in_flight = asyncio.Event()
+
+    async def execute(self, command):
+        self.commands.append(command)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.in_flight >= self.concurrent:
+            self._all_in_flight.set()
+        try:
+            await asyncio.wait_for(self._all_in_flight.wait(), 10)
+        finally:
+            self.in_flight -= 1
+        output = self.outputs[command]
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+
+class ShowDummyInterface(MetaParser):
+
+    def cli(self, output=None):
+        return {'config': self.device.execute('show running-config')}
+
+
+class ShowDummy(MetaParser):
+
+    @memoize_commands
+    def cli(self, output=None):
+        parsed = {}
+        for interface in ('Gi1', 'Gi2', 'Gi1'):
+            try:
+                parsed[interface] = self.device.execute(
+                    'show interface {}'.format(interface))
+            except ValueError as e:
+                parsed[interface] = str(e)
+        parsed.update(ShowDummyInterface(device=self.device).cli())
+        return parsed
+
+
+class ShowDummyInterfaces(MetaParser):
+
+    runs = 0
+
+    def cli(self, output=None):
+        ShowDummyInterfaces.runs += 1
+        return {interface: self.device.execute(
+                                    'show interface {}'.format(interface))
+                for interface in ('Gi1', 'Gi2', 'Gi3', 'Gi4')}
+
+
+class ShowDummyCached(MetaParser):
+
+    def cli(self, output=None):
+        return {'vrf': execute_cached(self.device, 'show vrf')}
+
+
+class TestAsyncParse(unittest.TestCase):
+
+    show_vrf = '''\
+Name                             Default RD            Protocols   Interfaces
+BT-RBG-LAB                       10.116.83.34:99       ipv4        Gi0/0/0
+Mgmt-intf                        <not set>             ipv4,ipv6   Gi0
+rb-bcn-lab                       10.116.83.34:1        ipv4,ipv6   Lo9
+                                                                   Te0/0/1
+'''
+
+    parsed_show_vrf = {
+        'vrf': {
+            'BT-RBG-LAB': {
+                'interfaces': ['GigabitEthernet0/0/0'],
+                'protocols': ['ipv4'],
+                'route_distinguisher': '10.116.83.34:99'},
+            'Mgmt-intf': {
+                'interfaces': ['GigabitEthernet0'],
+                'protocols': ['ipv4', 'ipv6']},
+            'rb-bcn-lab': {
+                'interfaces': ['Loopback9', 'TenGigabitEthernet0/0/1'],
+                'protocols': ['ipv4', 'ipv6'],
+                'route_distinguisher': '10.116.83.34:1'},
+        },
+    }
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(set_parse_executor, None)
+
+    def run_coroutine(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_concurrent_parses(self):
+        device = AsyncDevice({'show vrf': self.show_vrf}, concurrent=1000)
+        parsers = [ShowVrf(device=device) for _ in range(1000)]
+
+        async def parse_all():
+            return await asyncio.gather(*[parser.aparse()
+                                          for parser in parsers])
+
+        for parsed in self.run_coroutine(parse_all()):
+            self.assertEqual(parsed, self.parsed_show_vrf)
+        # All the commands awaited at once, whatever the executor threads
+        self.assertEqual(device.max_in_flight, 1000)
+        self.assertEqual(len(device.commands), 1000)
+        self.assertIs(parsers[0].device, device)
+
+    def test_commands(self):
+        device = AsyncDevice({
+            'show interface Gi1': 'Gi1 is up',
+            'show interface Gi2': ValueError('Gi2 does not exist'),
+            'show running-config': 'hostname R1'})
+
+        parsed = self.run_coroutine(ShowDummy(device=device).aparse())
+
+        self.assertEqual(parsed, {'Gi1': 'Gi1 is up',
+                                  'Gi2': 'Gi2 does not exist',
+                                  'config': 'hostname R1'})
+        self.assertEqual(device.commands, ['show interface Gi1',
+                                           'show interface Gi2',
+                                           'show running-config'])
+
+    def test_parsed_twice(self):
+        outputs = {'show interface Gi{}'.format(index): 'Gi{} is up'.format(
+                                        index) for index in range(1, 5)}
+        device = AsyncDevice(outputs)
+        ShowDummyInterfaces.runs = 0
+
+        parsed = self.run_coroutine(ShowDummyInterfaces(device=device)
+                                                                .aparse())
+
+        self.assertEqual(parsed['Gi4'], 'Gi4 is up')
+        self.assertEqual(device.commands, list(outputs))
+        # Stopped at the first command, then parsed once
+        self.assertEqual(ShowDummyInterfaces.runs, 2)
+
+    def test_result_cache_kept(self):
+        device = AsyncDevice({'show vrf': self.show_vrf})
+        device.parsed_results = ParsedResultCache(ttl=30)
+
+        for _ in range(2):
+            parsed = self.run_coroutine(ShowDummyCached(device=device)
+                                                                .aparse())
+            self.assertEqual(parsed, {'vrf': self.show_vrf})
+        # Not dropped by the device answering each aparse
+        self.assertEqual(device.commands, ['show vrf'])
+        self.assertEqual(device.parsed_results.hits, 1)
+
+    def test_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        set_parse_executor(executor)
+        device = AsyncDevice({'show vrf': self.show_vrf})
+
+        with patch.object(executor, 'submit',
+                          wraps=executor.submit) as submit:
+            parsed = self.run_coroutine(ShowVrf(device=device).aparse())
+
+        self.assertEqual(parsed, self.parsed_show_vrf)
+        # Stopped at the command, then parsed its output
+        self.assertEqual(submit.call_count, 2)
+
+    def test_output(self):
+        device = Mock()
+        parsed = self.run_coroutine(ShowVrf(device=device).aparse(
+            output=self.show_vrf))
+        self.assertEqual(parsed, self.parsed_show_vrf)
+        device.execute.assert_not_called()
+
+    def test_blocking_device(self):
+        device = Mock()
+        device.execute.return_value = self.show_vrf
+        parsed = self.run_coroutine(ShowVrf(device=device).aparse())
+        self.assertEqual(parsed, self.parsed_show_vrf)
+        device.execute.assert_called_once_with('show vrf')
+
+    def test_installed(self):
+        self.assertIs(MetaParser.aparse, async_parse.aparse)
+
+
+if __name__ == '__main__':
+    unittest.main()
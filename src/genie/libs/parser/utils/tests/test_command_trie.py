@@ -0,0 +1,91 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.trie import CommandTrie
+from genie.libs.parser.utils.common import (
+    _matches_fuzzy,
+    _search_space,
+    clear_parser_cache,
+    parser_data
+)
+
+class TestCommandTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = CommandTrie([
+            'show version',
+            'show vrf',
+            'show vrf {vrf}',
+            'show vrf {vrf} interface {interface}',
+            'show ip route vrf {vrf}',
+            '/dna/intent/api/v1/interface/{interface}',
+        ])
+
+    def test_exact_and_abbreviated(self):
+        self.assertEqual(self.trie.candidates(['show', 'version']),
+                         ['show version'])
+        self.assertEqual(self.trie.candidates(['sh', 'v']),
+                         ['show version', 'show vrf'])
+        self.assertEqual(self.trie.candidates(['s', 'ver']),
+                         ['show version'])
+
+    def test_arguments(self):
+        self.assertEqual(self.trie.candidates(['sh', 'vrf', 'VRF1']),
+                         ['show vrf {vrf}'])
+        self.assertEqual(
+            self.trie.candidates('sh vrf VRF1 int Gi1/0/1'.split()),
+            ['show vrf {vrf} interface {interface}'])
+
+        # Argument can span two tokens
+        self.assertEqual(
+            self.trie.candidates('sh vrf VRF1 int Gi 1/0/1'.split()),
+            ['show vrf {vrf} interface {interface}'])
+
+    def test_partial_argument(self):
+        self.assertEqual(
+            self.trie.candidates(['/dna/intent/api/v1/interface/argument']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+        self.assertEqual(self.trie.candidates(['/dna/intent/api/v2/x']), [])
+
+    def test_no_match(self):
+        self.assertEqual(self.trie.candidates(['show', 'bgp']), [])
+        self.assertEqual(self.trie.candidates(['show', 'version', 'x']), [])
+
+    def test_insertion_order(self):
+        trie = CommandTrie(['show vrf detail', 'show version', 'show vrf'])
+        self.assertEqual(trie.candidates(['sh', 'v']),
+                         ['show version', 'show vrf'])
+        self.assertEqual(len(trie), 3)
+        self.assertIn('show vrf detail', trie)
+
+    def test_candidates_superset_of_matches(self):
+        for command in parser_data.keys():
+            search = re.sub('{.*?}', 'argument', command)
+            tokens = [token[:3] for token in search.split()]
+            candidates = [c for c, _ in _search_space(tokens, False)]
+
+            for other in parser_data.keys():
+                if _matches_fuzzy(0, 0, tokens.copy(), other, {}, False):
+                    self.assertIn(other, candidates, search)
+
+    def test_replaced_command(self):
+        removed, added = 'show test_trie_removed', 'show test_trie_added'
+        parser_data[removed] = {'iosxe': {}}
+        clear_parser_cache()
+        self.assertEqual([c for c, _ in _search_space(removed.split(), False)],
+                         [removed])
+
+        # Same number of commands
+        del parser_data[removed]
+        parser_data[added] = {'iosxe': {}}
+        clear_parser_cache()
+        try:
+            self.assertEqual(
+                [c for c, _ in _search_space(added.split(), False)], [added])
+        finally:
+            del parser_data[added]
+            clear_parser_cache()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import glob
+import json
+import pickle
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils import compact as compact_module
+from genie.libs.parser.utils.compact import compact, record_class, Record, \
+                                            Branch, Table, ColumnTable
+
+PARSERS = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+
+ARP = {
+    'interfaces': {
+        'GigabitEthernet2.390': {
+            'ipv4': {
+                'neighbors': {
+                    '10.12.90.1': {'ip': '10.12.90.1',
+                                   'link_layer_address': 'fa16.3eff.9c9e',
+                                   'type': 'ARPA', 'origin': 'static',
+                                   'age': '-', 'protocol': 'Internet'},
+                    '10.12.90.2': {'ip': '10.12.90.2',
+                                   'link_layer_address': 'fa16.3eff.5a76',
+                                   'type': 'ARPA', 'origin': 'dynamic',
+                                   'age': '139', 'protocol': 'Internet'},
+                },
+            },
+        },
+    },
+}
+
+NEIGHBORS = ('interfaces', None, 'ipv4', 'neighbors')
+
+
+def goldens(parser):
+    '''(output, arguments) of the goldens of the folder tests of parser'''
+    for name in sorted(glob.glob(os.path.join(
+            PARSERS, 'iosxe', 'tests', parser.__name__, 'cli', 'equal',
+            '*_output.txt'))):
+        with open(name) as f:
+            output = f.read()
+        arguments = name.replace('_output.txt', '_arguments.json')
+        if os.path.exists(arguments):
+            with open(arguments) as f:
+                yield output, json.load(f)
+        else:
+            yield output, {}
+
+
+class TestCompact(unittest.TestCase):
+
+    def test_records(self):
+        parsed = compact(ARP, tables=[NEIGHBORS])
+        self.assertEqual(parsed, ARP)
+        self.assertEqual(parsed.to_dict(), ARP)
+        self.assertIsInstance(parsed, Branch)
+        self.assertIsInstance(parsed['interfaces'], Branch)
+
+        neighbors = parsed['interfaces']['GigabitEthernet2.390']['ipv4']\
+                                                                ['neighbors']
+        self.assertIsInstance(neighbors, Table)
+        first, second = neighbors.values()
+        # One class, the keys of every row held once
+        self.assertIs(type(first), type(second))
+        self.assertEqual(first['age'], '-')
+        self.assertEqual(second.get('origin'), 'dynamic')
+        self.assertNotIn('vrf', first)
+        with self.assertRaises(KeyError):
+            first['vrf']
+        self.assertFalse(hasattr(first, '__dict__'))
+
+    def test_columns(self):
+        parsed = compact(ARP, tables=[NEIGHBORS], columns=True)
+        self.assertEqual(parsed, ARP)
+        self.assertEqual(parsed.to_dict(), ARP)
+        neighbors = parsed['interfaces']['GigabitEthernet2.390']['ipv4']\
+                                                                ['neighbors']
+        self.assertIsInstance(neighbors, ColumnTable)
+        self.assertEqual(dict(neighbors['10.12.90.2']),
+                         ARP['interfaces']['GigabitEthernet2.390']['ipv4']
+                            ['neighbors']['10.12.90.2'])
+
+    def test_columns_missing_and_integers(self):
+        rows = {'10.1.0.0/24': {'route': '10.1.0.0/24', 'metric': 2},
+                '10.2.0.0/24': {'route': '10.2.0.0/24', 'metric': 3,
+                                'tag': 'red'}}
+        table = compact({'routes': rows}, tables=[('routes',)],
+                        columns=True)['routes']
+        self.assertEqual(table, rows)
+        self.assertEqual(list(table['10.1.0.0/24']), ['route', 'metric'])
+        self.assertEqual(len(table['10.2.0.0/24']), 3)
+        self.assertNotIn('tag', table['10.1.0.0/24'])
+        self.assertEqual(table._columns[1].typecode, 'q')
+
+    def test_read_only(self):
+        parsed = compact(ARP, tables=[NEIGHBORS])
+        with self.assertRaises(TypeError):
+            parsed['interfaces'] = {}
+        first = parsed['interfaces']['GigabitEthernet2.390']['ipv4']\
+                      ['neighbors']['10.12.90.1']
+        with self.assertRaises(AttributeError):
+            first._0 = '10.12.90.3'
+
+    def test_pickle(self):
+        for columns in (False, True):
+            parsed = compact(ARP, tables=[NEIGHBORS], columns=columns)
+            self.assertEqual(pickle.loads(pickle.dumps(parsed)), ARP)
+
+    def test_record_class(self):
+        Neighbor = record_class(('ip', 'age'))
+        self.assertIs(record_class(('ip', 'age')), Neighbor)
+        self.assertEqual(Neighbor(('10.1.1.1', '-')), {'ip': '10.1.1.1',
+                                                       'age': '-'})
+
+    def test_classes_bounded(self):
+        classes = compact_module._record_classes
+        # Keys of the levels above the tables come from the output
+        for index in range(classes.maxsize + 10):
+            interface = 'GigabitEthernet2.{}'.format(index)
+            compact({'interfaces': {interface: ARP['interfaces']
+                                                ['GigabitEthernet2.390']}},
+                    tables=[NEIGHBORS])
+        self.assertNotIn(('GigabitEthernet2.1',), classes)
+
+        # So can the ones of the dictionaries held by the rows
+        for index in range(classes.maxsize + 10):
+            compact({'routes': {'10.1.0.0/24': {'next_hop': {
+                'Gi{}'.format(index): {'index': index}}}}},
+                    tables=[('routes',)])
+        self.assertEqual(len(classes), classes.maxsize)
+
+
+class TestParseCompact(unittest.TestCase):
+
+    def test_goldens(self):
+        for parser in (ShowIpArp, ShowMacAddressTable, ShowIpNatTranslations,
+                       ShowIpRoute):
+            for output, arguments in goldens(parser):
+                expected = parser(device=Mock()).parse(output=output,
+                                                       **arguments)
+                for columns in (False, True):
+                    with self.subTest(parser=parser.__name__,
+                                      columns=columns):
+                        parsed = parser(device=Mock()).parse_compact(
+                            columns=columns, output=output, **arguments)
+                        self.assertEqual(parsed, expected)
+                        self.assertEqual(parsed.to_dict(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
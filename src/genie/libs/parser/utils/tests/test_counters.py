@@ -0,0 +1,213 @@
+import os
+import glob
+import json
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces \
+                                                   as IosxeShowInterfaces
+from genie.libs.parser.iosxr.show_interface import ShowInterfaces \
+                                                   as IosxrShowInterfaces
+from genie.libs.parser.junos.show_interface import ShowInterfaces \
+                                                   as JunosShowInterfaces
+from genie.libs.parser.nxos.show_interface import ShowInterface \
+                                                  as NxosShowInterface
+from genie.libs.parser.utils.counters import InterfaceCounters, MISSING
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+PARSERS = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+
+NXOS_OUTPUT = '''
+    Ethernet2/1 is up
+    admin state is up, Dedicated Interface
+      Hardware: 10/100/1000 Ethernet, address: aaaa.bbff.8888 (bia 5254.00ff.8506)
+      MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
+      Last clearing of "show interface" counters never
+      1 interface resets
+      Load-Interval #1: 30 seconds
+        30 seconds input rate 3280 bits/sec, 4 packets/sec
+        30 seconds output rate 1296 bits/sec, 1 packets/sec
+        input rate 3.28 Kbps, 4 pps; output rate 1.30 Kbps, 1 pps
+      RX
+        1250 unicast packets  301 multicast packets  12 broadcast packets
+        1563 input packets  183740 bytes
+        0 jumbo packets  0 storm suppression packets
+        0 runts  0 giants  3 CRC/FCS  0 no buffer
+        3 input error  0 short frame  0 overrun   0 underrun  0 ignored
+        0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
+        0 input with dribble  0 input discard
+        0 Rx pause
+      TX
+        980 unicast packets  45 multicast packets  2 broadcast packets
+        1027 output packets  99120 bytes
+        0 jumbo packets
+        0 output error  0 collision  0 deferred  0 late collision
+        0 lost carrier  0 no carrier  0 babble  0 output discard
+        0 Tx pause
+    Ethernet2/1.10 is down (Administratively down)
+    admin state is down, Dedicated Interface, [parent interface is Ethernet2/1]
+      Hardware: 10/100/1000 Ethernet, address: 5254.00ff.8534 (bia 5254.00ff.8506)
+      MTU 1600 bytes, BW 768 Kbit, DLY 10 usec
+'''
+
+IOSXR_OUTPUT = '''
+    GigabitEthernet0/0/0/1 is up, line protocol is up
+      Interface state transitions: 1
+      Hardware is GigabitEthernet, address is 5254.00ff.6459 (bia 5254.00ff.6459)
+      Internet address is 10.1.5.1/24
+      MTU 1514 bytes, BW 1000000 Kbit (Max: 1000000 Kbit)
+      Last clearing of "show interface" counters never
+      5 minute input rate 0 bits/sec, 0 packets/sec
+      5 minute output rate 0 bits/sec, 0 packets/sec
+         146164 packets input, 18221418 bytes, 0 total input drops
+         0 drops for unrecognized upper-level protocol
+         Received 0 broadcast packets, 29056 multicast packets
+                  0 runts, 0 giants, 0 throttles, 0 parity
+         0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+         123696 packets output, 10777610 bytes, 0 total output drops
+         Output 2 broadcast packets, 6246 multicast packets
+         0 output errors, 0 underruns, 0 applique, 0 resets
+         0 output buffer failures, 0 output buffers swapped out
+         1 carrier transitions
+'''
+
+
+def goldens(os_name, parser):
+    '''(output, arguments) of the goldens of the folder tests of parser'''
+    for name in sorted(glob.glob(os.path.join(
+            PARSERS, os_name, 'tests', parser.__name__, 'cli', 'equal',
+            '*_output.txt'))):
+        with open(name) as f:
+            output = f.read()
+        arguments = name.replace('_output.txt', '_arguments.json')
+        if os.path.exists(arguments):
+            with open(arguments) as f:
+                yield output, json.load(f)
+        else:
+            yield output, {}
+
+
+def integer_counters(parsed):
+    '''{interface: {counter: value}} of the integer counters and rates of
+    the result of iosxe, iosxr and nxos parsers'''
+    interfaces = {}
+    for interface, attributes in parsed.items():
+        counters = dict(attributes.get('counters', {}))
+        counters.update(counters.pop('rate', {}))
+        interfaces[interface] = {counter: value
+                                 for counter, value in counters.items()
+                                 if type(value) is int}
+    return interfaces
+
+
+def counters_of(counters):
+    return {interface: counters.get(interface)
+            for interface in counters.interfaces}
+
+
+class TestInterfaceCounters(unittest.TestCase):
+
+    def test_columns(self):
+        counters = InterfaceCounters(['in_octets', 'out_octets'])
+        row = counters.add('GigabitEthernet1')
+        self.assertEqual(counters.add('GigabitEthernet1'), row)
+        counters.set(row, 'in_octets', 2513375)
+        counters.set(counters.add('GigabitEthernet2'), 'out_octets', 1386)
+
+        self.assertEqual(len(counters), 2)
+        self.assertEqual(counters.interfaces,
+                         ['GigabitEthernet1', 'GigabitEthernet2'])
+        self.assertEqual(list(counters.columns['in_octets']),
+                         [2513375, MISSING])
+        self.assertEqual(counters.columns['out_octets'].typecode, 'q')
+        self.assertEqual(counters.get('GigabitEthernet1'),
+                         {'in_octets': 2513375})
+        self.assertEqual(counters.get('GigabitEthernet2'),
+                         {'out_octets': 1386})
+
+    @unittest.skipUnless(numpy, 'numpy is not installed')
+    def test_to_numpy(self):
+        counters = InterfaceCounters(['in_octets'])
+        counters.set(counters.add('GigabitEthernet1'), 'in_octets', 2 ** 40)
+        columns = counters.to_numpy()
+        self.assertEqual(columns['in_octets'].dtype, numpy.int64)
+        self.assertEqual(columns['in_octets'].tolist(), [2 ** 40])
+
+    @unittest.skipIf(numpy, 'numpy is installed')
+    def test_to_numpy_missing(self):
+        with self.assertRaises(ImportError):
+            InterfaceCounters(['in_octets']).to_numpy()
+
+
+class TestParseCounters(unittest.TestCase):
+
+    def test_iosxe_goldens(self):
+        for output, arguments in goldens('iosxe', IosxeShowInterfaces):
+            with self.subTest(output=output[:60]):
+                parsed = IosxeShowInterfaces(device=Mock()).cli(
+                    output=output, **arguments)
+                counters = IosxeShowInterfaces(device=Mock()).parse_counters(
+                    output=output)
+                self.assertEqual(counters_of(counters),
+                                 integer_counters(parsed))
+
+    def test_junos_goldens(self):
+        for output, arguments in goldens('junos', JunosShowInterfaces):
+            with self.subTest(output=output[:60]):
+                parsed = JunosShowInterfaces(device=Mock()).cli(
+                    output=output, **arguments)
+                counters = JunosShowInterfaces(device=Mock()).parse_counters(
+                    output=output)
+                # Counters of the traffic statistics of physical interfaces
+                for interface in parsed['interface-information']\
+                                       ['physical-interface']:
+                    statistics = interface.get('traffic-statistics', {})
+                    expected = {counter: int(value)
+                                for counter, value in statistics.items()
+                                if isinstance(value, str) and value.isdigit()}
+                    if expected:
+                        self.assertEqual(counters.get(interface['name']),
+                                         expected)
+
+    def test_nxos(self):
+        counters = NxosShowInterface(device=Mock()).parse_counters(
+            output=NXOS_OUTPUT)
+        parsed = NxosShowInterface(device=Mock()).cli(output=NXOS_OUTPUT)
+        self.assertEqual(counters_of(counters), integer_counters(parsed))
+
+        # Same lines in the RX and TX sections
+        ethernet = counters.get('Ethernet2/1')
+        self.assertEqual(ethernet['in_unicast_pkts'], 1250)
+        self.assertEqual(ethernet['out_unicast_pkts'], 980)
+        self.assertEqual(ethernet['in_crc_errors'], 3)
+        # Interface without counters
+        self.assertEqual(counters.get('Ethernet2/1.10'), {})
+        row = counters.index['Ethernet2/1.10']
+        self.assertEqual(counters.columns['in_octets'][row], MISSING)
+
+    def test_iosxr(self):
+        counters = IosxrShowInterfaces(device=Mock()).parse_counters(
+            output=IOSXR_OUTPUT)
+        parsed = IosxrShowInterfaces(device=Mock()).cli(output=IOSXR_OUTPUT)
+        self.assertEqual(counters_of(counters), integer_counters(parsed))
+        self.assertEqual(counters.get('GigabitEthernet0/0/0/1')
+                         ['load_interval'], 300)
+
+    def test_command(self):
+        device = Mock(**{'execute.return_value': IOSXR_OUTPUT})
+        parser = IosxrShowInterfaces(device=device)
+        parser.parse_counters()
+        device.execute.assert_called_with('show interfaces')
+        parser.parse_counters(interface='GigabitEthernet0/0/0/1')
+        device.execute.assert_called_with(
+            'show interfaces GigabitEthernet0/0/0/1')
+        with self.assertRaises(TypeError):
+            parser.parse_counters(vrf='VRF1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils.execute import (CommandMemo, memoize_commands,
+                                             CommandRecorder, BatchExecutor,
+                                             execute_commands)
+
+
+class RecordingDevice(object):
+    '''Device answering every command with its own output, recording each
+    round-trip: a command, or the list of commands sent in one write'''
+
+    def __init__(self):
+        self.round_trips = []
+
+    def execute(self, command):
+        self.round_trips.append(command)
+        if isinstance(command, list):
+            return {each: 'output of ' + each for each in command}
+        return 'output of ' + command
+
+
+class ShowDummyInterface(MetaParser):
+
+    def cli(self, output=None):
+        return {'config': self.device.execute('show running-config')}
+
+
+class ShowDummy(MetaParser):
+
+    @memoize_commands
+    def cli(self, output=None):
+        parsed = {}
+        for interface in ('Gi1', 'Gi2', 'Gi2'):
+            parsed[interface] = self.device.execute(
+                'show interface {}'.format(interface))
+            parsed['config'] = self.device.execute('show running-config')
+        parsed['nested'] = ShowDummyInterface(device=self.device).cli()
+        return parsed
+
+
+class TestCommandMemo(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock(os='iosxe')
+        self.device.execute.side_effect = lambda command, **kwargs: \
+                                                    'output of ' + command
+
+    def test_executed_once(self):
+        memo = CommandMemo(self.device)
+        for _ in range(3):
+            self.assertEqual(memo.execute('show vrf'), 'output of show vrf')
+        memo.execute('show vrf', timeout=10)
+        self.assertEqual(self.device.execute.call_count, 2)
+        self.assertEqual(memo.executed, {'show vrf': 4})
+
+    def test_device_attributes(self):
+        self.assertEqual(CommandMemo(self.device).os, 'iosxe')
+
+    def test_memoize_commands(self):
+        parser = ShowDummy(device=self.device)
+        parsed = parser.cli()
+        self.assertEqual(parsed['Gi2'], 'output of show interface Gi2')
+        self.assertEqual(parsed['nested'],
+                         {'config': 'output of show running-config'})
+        self.assertEqual([call[0][0] for call in
+                          self.device.execute.call_args_list],
+                         ['show interface Gi1', 'show running-config',
+                          'show interface Gi2'])
+        # Scoped to the call
+        self.assertIs(parser.device, self.device)
+        parser.cli()
+        self.assertEqual(self.device.execute.call_count, 6)
+
+    def test_without_device(self):
+        cli = memoize_commands(lambda parser, output=None: parser.device)
+        self.assertIsNone(cli(ShowDummy(device=None), output='Gi1'))
+
+
+class TestExecuteCommands(unittest.TestCase):
+
+    commands = ['show bgp peer-session PS-{}'.format(index)
+                                                    for index in range(4)]
+
+    def setUp(self):
+        self.device = RecordingDevice()
+
+    def test_one_at_a_time(self):
+        outputs = execute_commands(self.device, self.commands)
+        self.assertEqual(outputs, {command: 'output of ' + command
+                                   for command in self.commands})
+        self.assertEqual(self.device.round_trips, self.commands)
+
+    def test_pipelined(self):
+        self.device.batch_executor = BatchExecutor(self.device)
+        outputs = execute_commands(self.device,
+                                   self.commands + self.commands[:1])
+        self.assertEqual(outputs['show bgp peer-session PS-3'],
+                         'output of show bgp peer-session PS-3')
+        self.assertEqual(self.device.round_trips, [self.commands])
+
+    def test_sessions(self):
+        sessions = [RecordingDevice(), RecordingDevice()]
+        self.device.batch_executor = BatchExecutor(self.device,
+                                                   sessions=sessions)
+        outputs = execute_commands(self.device, self.commands)
+        self.assertEqual(list(outputs), self.commands)
+        self.assertEqual(self.device.round_trips, [])
+        self.assertEqual(sessions[0].round_trips,
+                         [self.commands[0::2]])
+        self.assertEqual(sessions[1].round_trips,
+                         [self.commands[1::2]])
+
+    def test_not_pipelined(self):
+        self.device.batch_executor = BatchExecutor(self.device,
+                                                   pipeline=False)
+        execute_commands(self.device, self.commands)
+        self.assertEqual(self.device.round_trips, self.commands)
+
+    def test_memo(self):
+        memo = CommandMemo(self.device)
+        self.device.batch_executor = BatchExecutor(self.device)
+        memo.execute(self.commands[0])
+        outputs = execute_commands(memo, self.commands)
+        self.assertEqual(len(outputs), 4)
+        self.assertEqual(self.device.round_trips,
+                         [self.commands[0], self.commands[1:]])
+        memo.execute(self.commands[3])
+        self.assertEqual(len(self.device.round_trips), 2)
+
+    def test_recorder(self):
+        recorder = CommandRecorder(self.device)
+        self.device.batch_executor = BatchExecutor(self.device)
+        memo = CommandMemo(recorder)
+        memo.execute(self.commands[0])
+        execute_commands(memo, self.commands)
+        # Each command recorded once, as executed by the device
+        self.assertEqual([command for command, _ in recorder.outputs],
+                         self.commands)
+        self.assertEqual(recorder.outputs[1],
+                         (self.commands[1], 'output of ' + self.commands[1]))
+
+        # Over the memo, every output given to the parser
+        outer = CommandRecorder(memo)
+        execute_commands(outer, self.commands[:2])
+        self.assertEqual(len(outer.outputs), 2)
+        self.assertEqual(len(recorder.outputs), 4)
+        self.assertTrue(outer.text().startswith(
+            'show bgp peer-session PS-0\noutput of show bgp peer-session '
+            'PS-0\nshow bgp peer-session PS-1'))
+
+    def test_mock_device(self):
+        device = Mock()
+        device.execute.side_effect = lambda command: command
+        self.assertEqual(execute_commands(device, ['show vrf']),
+                         {'show vrf': 'show vrf'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 import unittest
 from genie.libs.parser.utils.extension import ExtendParsers
 from genie.libs.parser.utils.tests.dummy_parser import package_path
@@ -49,6 +51,47 @@ class TestExtendParser(unittest.TestCase):
                 }
             })
 
+    def _extend(self, **kwargs):
+        ext = ExtendParsers('genie.libs.parser.utils.tests.dummy_parser',
+                            **kwargs)
+        ext.extend()
+        ext.output.pop('extend_info')
+        return ext
+
+    def test_extend_manifest(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        manifest = os.path.join(tmp, 'manifest.json')
+
+        expected = self._extend().output
+
+        first = self._extend(manifest=manifest)
+        self.assertEqual(first.output, expected)
+        self.assertEqual(first.stats, {'cached': 0, 'imported': 3,
+                                                            'static': 0})
+        self.assertTrue(os.path.isfile(manifest))
+
+        # Nothing changed, nothing is imported
+        second = self._extend(manifest=manifest)
+        self.assertEqual(second.output, expected)
+        self.assertEqual(second.stats, {'cached': 3, 'imported': 0,
+                                                            'static': 0})
+
+    def test_extend_static(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        manifest = os.path.join(tmp, 'manifest.json')
+
+        expected = self._extend().output
+
+        ext = self._extend(static=True, manifest=manifest)
+        self.assertEqual(ext.output, expected)
+        self.assertEqual(ext.stats, {'cached': 0, 'imported': 0, 'static': 3})
+
+        # Manifest made in import mode is not used in static mode
+        ext = self._extend(manifest=manifest)
+        self.assertEqual(ext.stats['cached'], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.interface_names import IntfNameConverter, \
+                                                    INTF_PREFIXES, \
+                                                    VENDOR_INTF_PREFIXES, \
+                                                    intf_names
+
+
+class TestConvertIntfName(unittest.TestCase):
+
+    def test_convert_intf_name(self):
+        for intf, name in [('Eth2/1', 'Ethernet2/1'),
+                           ('Gi1/0/1', 'GigabitEthernet1/0/1'),
+                           ('Te1/1/1.100', 'TenGigabitEthernet1/1/1.100'),
+                           ('Po10', 'Port-channel10'),
+                           ('BE1', 'Bundle-Ether1'),
+                           ('BAGG1', 'Bridge-Aggregation1'),
+                           ('M-E0/0/0', 'M-Ethernet0/0/0'),
+                           ('port-channel 1', 'Port-channel1'),
+                           ('mgmt0', 'mgmt0'),
+                           ('Router', 'Router'),
+                           ('1/1', '1/1'),
+                           ('', '')]:
+            with self.subTest(intf=intf):
+                self.assertEqual(Common.convert_intf_name(intf), name)
+
+    def test_convert_intf_names(self):
+        self.assertEqual(
+            Common.convert_intf_names(['Gi1/0/1', 'Po10', 'Gi1/0/1']),
+            ['GigabitEthernet1/0/1', 'Port-channel10',
+             'GigabitEthernet1/0/1'])
+        self.assertEqual(Common.convert_intf_names([]), [])
+
+
+class TestIntfNameConverter(unittest.TestCase):
+
+    def test_cache(self):
+        convert = IntfNameConverter(INTF_PREFIXES, maxsize=2)
+        self.assertEqual(convert('Gi1'), 'GigabitEthernet1')
+        self.assertEqual(convert('Gi1'), 'GigabitEthernet1')
+        self.assertEqual(convert.cache.stats['hits'], 1)
+        convert('Gi2')
+        convert('Gi3')
+        self.assertEqual(len(convert.cache), 2)
+        self.assertNotIn('Gi1', convert.cache)
+
+    def test_convert_all(self):
+        convert = IntfNameConverter(INTF_PREFIXES)
+        names = convert.convert_all(['Gi1', 'Gi1', 'Gi1', 'Lo0'])
+        self.assertEqual(names, ['GigabitEthernet1'] * 3 + ['Loopback0'])
+        # Each distinct name converted once
+        self.assertEqual(convert.cache.stats['misses'], 2)
+
+    def test_vendor_prefixes(self):
+        convert = IntfNameConverter(INTF_PREFIXES)
+        self.assertEqual(convert('BAGG1'), 'BAGG1')
+        comware = convert.extend(VENDOR_INTF_PREFIXES['comware'])
+        self.assertEqual(comware('BAGG1'), 'Bridge-Aggregation1')
+        self.assertEqual(comware('M-E0/0/0'), 'M-Ethernet0/0/0')
+        # Extended converter only
+        self.assertEqual(convert('BAGG1'), 'BAGG1')
+        self.assertNotIn('BAGG', convert.prefixes)
+
+    def test_register(self):
+        convert = IntfNameConverter(INTF_PREFIXES)
+        self.assertEqual(convert('Hg1/0/1'), 'Hg1/0/1')
+        convert.register({'Hg': 'HundredGigE'})
+        # Names converted with the previous table are dropped
+        self.assertEqual(convert('Hg1/0/1'), 'HundredGigE1/0/1')
+        self.assertIn('M-E', intf_names.prefixes)
+
+
+if __name__ == '__main__':
+    unittest.main()
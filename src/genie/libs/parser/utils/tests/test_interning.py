@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.utils.interning import StringPool, string_pool
+
+ARP_OUTPUT = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.12.90.1              -   fa16.3eff.9c9e  ARPA   GigabitEthernet2.390
+Internet  10.12.90.2            139   fa16.3eff.5a76  ARPA   GigabitEthernet2.390
+'''
+
+MAC_OUTPUT = '''\
+          Mac Address Table
+-------------------------------------------
+
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+  10    aaaa.bbff.8888    DYNAMIC     Gi1/0/8
+  20    aaaa.bbff.9999    DYNAMIC     Gi1/0/9
+Total Mac Addresses for this criterion: 2
+'''
+
+
+def copy(value):
+    '''Equal string, not the same object'''
+    return ''.join(list(value))
+
+
+class TestStringPool(unittest.TestCase):
+
+    def test_shared(self):
+        pool = StringPool()
+        first = pool(copy('dynamic'))
+        second = copy('dynamic')
+        self.assertIsNot(first, second)
+        self.assertIs(pool(second), first)
+        self.assertEqual(len(pool), 1)
+
+    def test_other_values(self):
+        pool = StringPool()
+        self.assertIsNone(pool(None))
+        self.assertEqual(pool(100), 100)
+        self.assertEqual(len(pool), 0)
+
+    def test_bounded(self):
+        pool = StringPool(maxsize=2)
+        first = pool(copy('Gi1'))
+        pool(copy('Gi2'))
+        # Full, started over
+        pool(copy('Gi3'))
+        self.assertEqual(len(pool), 1)
+        self.assertIsNot(pool(copy('Gi1')), first)
+
+    def test_disabled(self):
+        pool = StringPool(maxsize=0)
+        value = copy('ARPA')
+        self.assertIs(pool(value), value)
+        self.assertEqual(len(pool), 0)
+
+
+class TestParsers(unittest.TestCase):
+
+    def test_arp(self):
+        first = ShowIpArp(device=Mock()).parse(output=ARP_OUTPUT)
+        second = ShowIpArp(device=Mock()).parse(output=ARP_OUTPUT)
+        neighbors = first['interfaces']['GigabitEthernet2.390']['ipv4']\
+                         ['neighbors']
+        self.assertIs(neighbors['10.12.90.1']['type'],
+                      neighbors['10.12.90.2']['type'])
+        # Shared by the results of the process
+        self.assertIs(second['interfaces']['GigabitEthernet2.390']['ipv4']
+                            ['neighbors']['10.12.90.1']['protocol'],
+                      neighbors['10.12.90.1']['protocol'])
+        self.assertIs(neighbors['10.12.90.1']['type'], string_pool('ARPA'))
+
+    def test_mac_address_table(self):
+        parsed = ShowMacAddressTable(device=Mock()).parse(output=MAC_OUTPUT)
+        vlans = parsed['mac_table']['vlans']
+        self.assertIs(vlans['10']['mac_addresses']['aaaa.bbff.8888']
+                           ['interfaces']['GigabitEthernet1/0/8']
+                           ['entry_type'],
+                      vlans['20']['mac_addresses']['aaaa.bbff.9999']
+                           ['interfaces']['GigabitEthernet1/0/9']
+                           ['entry_type'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils import parse_pool
+from genie.libs.parser.utils.parse_pool import ParsePool
+
+
+class ShowFailing(MetaParser):
+
+    def cli(self, output=None):
+        raise ValueError('cannot parse {}'.format(output))
+
+
+def imported(module):
+    '''Modules imported in the worker'''
+    return sorted(parse_pool._imported), module in sys.modules
+
+
+class TestParsePool(unittest.TestCase):
+
+    show_vrf = '''\
+Name                             Default RD            Protocols   Interfaces
+Mgmt-intf                        <not set>             ipv4,ipv6   Gi0
+rb-bcn-lab                       10.116.83.34:1        ipv4,ipv6   Lo9
+'''
+
+    parsed_show_vrf = {
+        'vrf': {
+            'Mgmt-intf': {
+                'interfaces': ['GigabitEthernet0'],
+                'protocols': ['ipv4', 'ipv6']},
+            'rb-bcn-lab': {
+                'interfaces': ['Loopback9'],
+                'protocols': ['ipv4', 'ipv6'],
+                'route_distinguisher': '10.116.83.34:1'},
+        },
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool(max_workers=2, packages=['dnac'])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_parse(self):
+        self.assertEqual(self.pool.parse(ShowVrf, self.show_vrf),
+                         self.parsed_show_vrf)
+
+    def test_submit(self):
+        futures = [self.pool.submit(ShowVrf, self.show_vrf)
+                                                    for _ in range(20)]
+        for future in futures:
+            self.assertEqual(future.result(), self.parsed_show_vrf)
+
+    def test_error(self):
+        with self.assertRaisesRegex(ValueError, 'cannot parse x'):
+            self.pool.parse(ShowFailing, 'x')
+
+    def test_warm_imports(self):
+        future = self.pool._executor.submit(
+            imported, 'genie.libs.parser.dnac.interface')
+        self.assertEqual(future.result(), (['dnac'], True))
+
+    def test_get_parser(self):
+        device = Mock(os='iosxe', platform='cat9k', custom={
+            'abstraction': {'order': ['os', 'platform']}})
+        with patch.object(parse_pool, 'get_parser',
+                          return_value=(ShowVrf, {'vrf': 'rb-bcn-lab'})) \
+                                                            as get_parser, \
+             patch.object(ShowVrf, 'cli',
+                          return_value={'vrf': {}}) as cli:
+            parsed = parse_pool._parse((), 'show vrf rb-bcn-lab',
+                                       self.show_vrf,
+                                       parse_pool._device_info(device), {})
+
+        self.assertEqual(parsed, {'vrf': {}})
+        command, worker_device = get_parser.call_args[0]
+        self.assertEqual(command, 'show vrf rb-bcn-lab')
+        self.assertEqual((worker_device.os, worker_device.platform),
+                         ('iosxe', 'cat9k'))
+        self.assertEqual(worker_device.custom['abstraction']['order'],
+                         ['os', 'platform'])
+        cli.assert_called_once_with(vrf='rb-bcn-lab', output=self.show_vrf)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,292 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils import cache
+from genie.libs.parser.utils.cache import (LRUCache, ParsedResultCache,
+                                           parse_cached, execute_cached,
+                                           invalidate_parsed_results)
+from genie.libs.parser.utils.execute import CommandMemo
+from genie.libs.parser.utils.registry import ParserRegistry
+from genie.libs.parser.utils.common import (
+    get_parser,
+    get_parser_index,
+    clear_parser_cache
+)
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_put(self):
+        cache = LRUCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats,
+                         {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 2})
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        # 'a' becomes the most recently used one
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.put('a', 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled(self):
+        cache = LRUCache(maxsize=0)
+        cache.put('a', 1)
+        self.assertNotIn('a', cache)
+
+    def test_threads(self):
+        cache = LRUCache(maxsize=50)
+
+        def worker(offset):
+            for i in range(1000):
+                cache.put((offset, i), i)
+                cache.get((offset, i - 1))
+
+        threads = [threading.Thread(target=worker, args=(i,))
+                                                        for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.hits + cache.misses, 8000)
+
+
+class ShowDummyVrf(object):
+
+    def __init__(self, device):
+        self.device = device
+
+    def parse(self, vrf=''):
+        return {'vrf': self.device.execute('show vrf {}'.format(vrf))}
+
+
+class TestParsedResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock()
+        self.device.execute.side_effect = lambda command: command.strip()
+        self.device.parsed_results = ParsedResultCache(ttl=30)
+
+    def test_parsed_once(self):
+        for _ in range(3):
+            self.assertEqual(parse_cached(ShowDummyVrf, self.device),
+                             {'vrf': 'show vrf'})
+        parse_cached(ShowDummyVrf, self.device, vrf='red')
+        # Through the memo of a parse too
+        parse_cached(ShowDummyVrf, CommandMemo(self.device), vrf='red')
+        self.assertEqual(self.device.execute.call_count, 2)
+        self.assertEqual(self.device.parsed_results.stats,
+                         {'hits': 3, 'misses': 2, 'size': 2, 'ttl': 30})
+
+    def test_copies(self):
+        first = parse_cached(ShowDummyVrf, self.device)
+        first['vrf'] = 'modified'
+        self.assertEqual(parse_cached(ShowDummyVrf, self.device),
+                         {'vrf': 'show vrf'})
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_disabled_by_default(self):
+        device = Mock()
+        device.execute.side_effect = lambda command: command.strip()
+        parse_cached(ShowDummyVrf, device)
+        parse_cached(ShowDummyVrf, device)
+        execute_cached(device, 'show run')
+        execute_cached(device, 'show run')
+        self.assertEqual(device.execute.call_count, 4)
+        self.assertEqual(device.parsed_results.ttl, 0)
+        self.assertEqual(len(device.parsed_results), 0)
+
+    def test_execute_cached(self):
+        execute_cached(self.device, 'show run | sec address-family')
+        execute_cached(self.device, 'show run | sec address-family')
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_expired(self):
+        with patch.object(cache.time, 'monotonic', return_value=100):
+            parse_cached(ShowDummyVrf, self.device)
+        with patch.object(cache.time, 'monotonic', return_value=129):
+            parse_cached(ShowDummyVrf, self.device)
+        self.assertEqual(self.device.execute.call_count, 1)
+        with patch.object(cache.time, 'monotonic', return_value=131):
+            parse_cached(ShowDummyVrf, self.device)
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_disabled(self):
+        self.device.parsed_results = ParsedResultCache(ttl=0)
+        parse_cached(ShowDummyVrf, self.device)
+        parse_cached(ShowDummyVrf, self.device)
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_ttl_config(self):
+        device = Mock()
+        device.execute.return_value = 'VRF1'
+        with patch.dict('os.environ', {'PYATS_LIBS_PARSER_RESULT_TTL': '5'}):
+            parse_cached(ShowDummyVrf, device)
+        self.assertEqual(device.parsed_results.ttl, 5)
+
+    def test_invalidate(self):
+        parse_cached(ShowDummyVrf, self.device)
+        execute_cached(self.device, 'show run')
+        invalidate_parsed_results(self.device, ShowDummyVrf)
+        parse_cached(ShowDummyVrf, self.device)
+        execute_cached(self.device, 'show run')
+        self.assertEqual(self.device.execute.call_count, 3)
+
+        invalidate_parsed_results(self.device)
+        self.assertEqual(len(self.device.parsed_results), 0)
+
+    def test_other_execute(self):
+        parse_cached(ShowDummyVrf, self.device)
+        self.device.execute = Mock(return_value='reconnected')
+        self.assertEqual(parse_cached(ShowDummyVrf, self.device),
+                         {'vrf': 'reconnected'})
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        self.device = Mock(os='iosxe', custom={})
+        self.lookup = Mock(_tokens=['iosxe'])
+        self.parser_cls = Mock()
+
+    def tearDown(self):
+        clear_parser_cache()
+
+    def test_resolved_once(self):
+        resolved = [('show vrf {vrf}', self.parser_cls, {'vrf': 'VRF1'})]
+
+        with patch.object(common.Lookup, 'from_device',
+                          return_value=self.lookup), \
+             patch.object(common, '_resolve_parser',
+                          return_value=resolved) as resolve:
+            for _ in range(3):
+                parser_cls, kwargs = get_parser('sh vrf VRF1', self.device)
+                self.assertIs(parser_cls, self.parser_cls)
+                self.assertEqual(kwargs, {'vrf': 'VRF1'})
+
+                # Altering the returned kwargs must not alter the cache
+                kwargs['vrf'] = 'other'
+
+            self.assertEqual(resolve.call_count, 1)
+
+            # Other os is another entry
+            get_parser('sh vrf VRF1', Mock(os='nxos', custom={}))
+            self.assertEqual(resolve.call_count, 2)
+
+            clear_parser_cache()
+            get_parser('sh vrf VRF1', self.device)
+            self.assertEqual(resolve.call_count, 3)
+
+    def test_not_found_not_cached(self):
+        with patch.object(common.Lookup, 'from_device',
+                          return_value=self.lookup), \
+             patch.object(common, '_resolve_parser',
+                          side_effect=Exception('not found')) as resolve:
+            for _ in range(2):
+                with self.assertRaises(Exception):
+                    get_parser('show nothing', self.device)
+            self.assertEqual(resolve.call_count, 2)
+
+
+class TestGetParserIndex(unittest.TestCase):
+
+    PARSERS = {
+        'show version': {'iosxe': {'class': 'ShowVersion'},
+                         'nxos': {'class': 'ShowVersion'}},
+        'show vrf': {'iosxe': {'class': 'ShowVrf'}},
+        'show vrf {vrf}': {'iosxe': {'class': 'ShowVrf'}},
+        'show inventory': {'iosxe': {'c9300': {'class': 'ShowInventory'}}},
+    }
+
+    def setUp(self):
+        clear_parser_cache()
+        self.registry = ParserRegistry(lambda: dict(self.PARSERS))
+        self.classes = {'ShowVersion': Mock(exclude=['uptime']),
+                        'ShowVrf': Mock(spec=[]),
+                        'ShowInventory': Mock(exclude=[])}
+
+    def tearDown(self):
+        clear_parser_cache()
+
+    def _find_parser_cls(self, device, data):
+        return self.classes[data['class']]
+
+    def test_index(self):
+        device = Mock(os='iosxe', custom={})
+
+        with patch.object(common, 'parser_data', self.registry), \
+             patch.object(common, '_find_parser_cls',
+                          side_effect=self._find_parser_cls) as find, \
+             patch.object(common.Lookup, 'from_device',
+                          return_value=Mock(_tokens=['iosxe'])):
+            index = get_parser_index(device)
+
+            # Inventory only exists under c9300
+            self.assertEqual(dict(index), {
+                'show version': (self.classes['ShowVersion'], ['uptime']),
+                'show vrf': (self.classes['ShowVrf'], [])})
+            self.assertEqual(find.call_count, 3)
+
+            # Shared by devices of the same kind
+            self.assertIs(get_parser_index(Mock(os='iosxe', custom={})),
+                          index)
+            self.assertEqual(find.call_count, 3)
+
+            with self.assertRaises(TypeError):
+                index['show clock'] = None
+
+    def test_index_import_error(self):
+        device = Mock(os='iosxe', custom={})
+        self.classes['ShowVrf'] = None
+
+        def find_parser_cls(device, data):
+            parser_cls = self._find_parser_cls(device, data)
+            if parser_cls is None:
+                raise ImportError("No module named 'show_vrf'")
+            return parser_cls
+
+        with patch.object(common, 'parser_data', self.registry), \
+             patch.object(common, '_find_parser_cls',
+                          side_effect=find_parser_cls), \
+             patch.object(common.Lookup, 'from_device',
+                          return_value=Mock(_tokens=['iosxe'])), \
+             self.assertLogs(common.log, 'WARNING') as logs:
+            index = get_parser_index(device)
+
+        # Only the command of the broken module is missing
+        self.assertEqual(list(index), ['show version'])
+        self.assertIn('show vrf', logs.output[0])
+
+    def test_index_platform_token(self):
+        device = Mock(os='iosxe', custom={})
+
+        with patch.object(common, 'parser_data', self.registry), \
+             patch.object(common, '_find_parser_cls',
+                          side_effect=self._find_parser_cls), \
+             patch.object(common.Lookup, 'from_device',
+                          return_value=Mock(_tokens=['iosxe', 'c9300'])):
+            index = get_parser_index(device)
+
+        self.assertEqual(list(index),
+                         ['show version', 'show vrf', 'show inventory'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import subprocess
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.registry import (
+    ParserRegistry,
+    compile_index,
+    load_index
+)
+
+PARSERS = {
+    'tokens': ['iosxe', 'nxos'],
+    'show version': {
+        'iosxe': {'module_name': 'show_platform',
+                  'package': 'genie.libs.parser',
+                  'class': 'ShowVersion',
+                  'doc': 'Parser for show version',
+                  'uid': 'show_version'},
+        'nxos': {'module_name': 'show_platform',
+                 'package': 'genie.libs.parser',
+                 'class': 'ShowVersion',
+                 'doc': 'Parser for show version',
+                 'uid': 'show_version'},
+    },
+    'show vrf {vrf}': {
+        'iosxe': {'module_name': 'show_vrf',
+                  'package': 'genie.libs.parser',
+                  'class': 'ShowVrf',
+                  'doc': 'Parser for show vrf'},
+    },
+    'show inventory': {
+        'iosxe': {
+            'c9300': {'module_name': 'show_platform',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowInventory',
+                      'doc': 'Parser for show inventory'},
+        },
+    },
+}
+
+
+class TestParserRegistry(unittest.TestCase):
+
+    def test_lazy_load(self):
+        loader = Mock(return_value=PARSERS)
+        registry = ParserRegistry(loader)
+        self.assertFalse(registry.loaded)
+        self.assertEqual(registry.stats['commands'], 0)
+        loader.assert_not_called()
+
+        self.assertIn('show version', registry)
+        self.assertTrue(registry.loaded)
+        self.assertEqual(len(registry), 4)
+        self.assertEqual(registry.stats['source'], 'json')
+        self.assertIsNotNone(registry.stats['load_time'])
+
+        registry.get('show vrf {vrf}')
+        list(registry.items())
+        loader.assert_called_once_with()
+
+    def test_write_loads_first(self):
+        registry = ParserRegistry(lambda: dict(PARSERS))
+        registry['show clock'] = {}
+        self.assertIn('show version', registry)
+        self.assertIn('show clock', registry)
+
+    def test_on_load(self):
+        registry = ParserRegistry(lambda: dict(PARSERS))
+        hook = Mock()
+        registry.on_load(hook)
+        hook.assert_not_called()
+
+        registry.load()
+        hook.assert_called_once_with()
+
+        # Already loaded, called right away
+        other = Mock()
+        registry.on_load(other)
+        other.assert_called_once_with()
+
+    def test_hooks_before_loaded(self):
+        registry = ParserRegistry(lambda: dict(PARSERS))
+        seen = []
+
+        def hook():
+            # Parsers can be read and added, not yet published as loaded
+            seen.append((registry.loaded, 'show version' in registry))
+            registry['show clock'] = {'nxos': {}}
+        registry.on_load(hook)
+
+        self.assertIn('show clock', registry)
+        self.assertEqual(seen, [(False, True)])
+        self.assertTrue(registry.loaded)
+
+    def test_failing_hook(self):
+        registry = ParserRegistry(lambda: dict(PARSERS))
+        registry.on_load(Mock(side_effect=ValueError('broken hook')))
+        added = Mock()
+        registry.on_load(added)
+
+        # Every lookup reports the error, none misses the parsers of the
+        # hooks
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, 'broken hook'):
+                registry.get('show version')
+            self.assertFalse(registry.loaded)
+            self.assertEqual(registry.stats['commands'], 0)
+        added.assert_not_called()
+
+    def test_os_commands(self):
+        registry = ParserRegistry(lambda: dict(PARSERS))
+        self.assertEqual(registry.os_commands('iosxe'),
+                         ['show version', 'show inventory'])
+        self.assertEqual(registry.os_commands('nxos'), ['show version'])
+        self.assertEqual(registry.os_commands('junos'), [])
+
+        registry['show clock'] = {'nxos': {}}
+        registry.invalidate()
+        self.assertEqual(registry.os_commands('nxos'),
+                         ['show version', 'show clock'])
+
+
+class TestParserIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.tmp, 'parsers.json')
+        self.index_path = os.path.join(self.tmp, 'parsers.marshal')
+        with open(self.json_path, 'w') as f:
+            json.dump(PARSERS, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_compile_and_load(self):
+        compile_index(self.json_path, self.index_path)
+        data = load_index(self.index_path, json_path=self.json_path)
+
+        self.assertEqual(data.source, 'marshal')
+        self.assertEqual(data['tokens'], ['iosxe', 'nxos'])
+        self.assertEqual(data['show version']['iosxe'],
+                         {'module_name': 'show_platform',
+                          'package': 'genie.libs.parser',
+                          'class': 'ShowVersion'})
+        self.assertEqual(data['show inventory']['iosxe']['c9300']['class'],
+                         'ShowInventory')
+        self.assertEqual(data.os_commands,
+                         {'iosxe': ['show version', 'show inventory'],
+                          'nxos': ['show version']})
+
+        registry = ParserRegistry(lambda: data)
+        self.assertEqual(registry.os_commands('iosxe'),
+                         ['show version', 'show inventory'])
+        self.assertEqual(registry.stats['source'], 'marshal')
+
+    def test_outdated_index(self):
+        compile_index(self.json_path, self.index_path)
+        with open(self.json_path, 'a') as f:
+            f.write(' ')
+        self.assertIsNone(load_index(self.index_path,
+                                     json_path=self.json_path))
+
+    def test_outdated_index_same_size(self):
+        compile_index(self.json_path, self.index_path)
+        with open(self.json_path) as f:
+            text = f.read()
+        with open(self.json_path, 'w') as f:
+            f.write(text.replace('ShowVersion', 'ShowVersioN'))
+        self.assertIsNone(load_index(self.index_path,
+                                     json_path=self.json_path))
+
+    def test_touched_source(self):
+        # Same content with another modification time, as once installed
+        compile_index(self.json_path, self.index_path)
+        stat = os.stat(self.json_path)
+        os.utime(self.json_path, ns=(stat.st_atime_ns,
+                                     stat.st_mtime_ns + 10 ** 9))
+        data = load_index(self.index_path, json_path=self.json_path)
+        self.assertEqual(data.source, 'marshal')
+
+    def test_missing_index(self):
+        self.assertIsNone(load_index(self.index_path))
+
+
+class TestImportBudget(unittest.TestCase):
+
+    def test_import_does_not_load_parsers(self):
+        # Fresh interpreter, importing the utils must not read any parser
+        code = ('import genie.libs.parser.utils as utils; '
+                'print(utils.common.parser_data.loaded)')
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         env=env)
+        self.assertEqual(output.decode().strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.patterns import (PatternTable, LineDispatcher,
+                                              PatternScanner)
+
+
+class TestPatternTable(unittest.TestCase):
+
+    def test_compile_once(self):
+        table = PatternTable()
+        p1 = table.compile(r'^Hardware +is +(?P<type>\S+)$')
+        self.assertIs(table.compile(r'^Hardware +is +(?P<type>\S+)$'), p1)
+        self.assertEqual(p1.match('Hardware is CSR').groupdict(),
+                         {'type': 'CSR'})
+        self.assertEqual(len(table), 1)
+
+    def test_flags(self):
+        table = PatternTable()
+        p1 = table.compile(r'^mtu (?P<mtu>\d+)$')
+        p2 = table.compile(r'^mtu (?P<mtu>\d+)$', re.IGNORECASE)
+        self.assertIsNot(p1, p2)
+        self.assertIsNone(p1.match('MTU 1500'))
+        self.assertEqual(p2.match('MTU 1500').group('mtu'), '1500')
+        self.assertIs(table.compile(r'^mtu (?P<mtu>\d+)$', re.IGNORECASE), p2)
+
+    def test_survives_re_purge(self):
+        table = PatternTable()
+        p1 = table.compile(r'^Internet address is (?P<ip>\S+)$')
+        re.purge()
+        self.assertIs(table.compile(r'^Internet address is (?P<ip>\S+)$'), p1)
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.lines = LineDispatcher()
+        self.lines.add('intf', r'^(?P<intf>\S+) +is +(?P<enabled>\w+), +line '
+                               r'+protocol +is +(?P<protocol>\w+)$',
+                       contains='protocol')
+        self.lines.add('hardware', r'^Hardware +is +(?P<type>[\w ]+)$',
+                       anchor='Hardware is')
+        self.lines.add('mtu', r'^MTU +(?P<mtu>\d+) +bytes', anchor='MTU')
+        self.lines.add('any', r'^(?P<key>\S+) +: +(?P<value>\d+)$')
+        self.lines.add('in_pkts', r'^(?P<in_pkts>\d+) +packets +input',
+                       anchor='0 packets input')
+        self.lines.add('flow', r'^(input|output) +flow-control',
+                       anchor=('input', 'output'))
+
+    def test_match(self):
+        rule, m = self.lines.match('Hardware is CSR vNIC')
+        self.assertEqual(rule, 'hardware')
+        self.assertEqual(m.groupdict(), {'type': 'CSR vNIC'})
+
+        rule, m = self.lines.match('GigabitEthernet1 is up, line protocol is up')
+        self.assertEqual(rule, 'intf')
+        self.assertEqual(m.group('intf'), 'GigabitEthernet1')
+
+        self.assertEqual(self.lines.match('1386 packets input, 149370 bytes')
+                         [1].group('in_pkts'), '1386')
+        self.assertEqual(self.lines.match('output flow-control is off')[0],
+                         'flow')
+        self.assertEqual(self.lines.match('MTU 1500 bytes')[0], 'mtu')
+        self.assertEqual(self.lines.match('AAL5 : 0')[0], 'any')
+        self.assertEqual(self.lines.match('Description: uplink'),
+                         (None, None))
+        self.assertEqual(self.lines.match(''), (None, None))
+
+    def test_candidates(self):
+        # Patterns anchored on the word and the ones without anchor, in the
+        # order they were added
+        self.assertEqual(
+            [rule for rule, _ in self.lines.candidates('MTU 1500 bytes')],
+            ['mtu', 'any'])
+        self.assertEqual(
+            [rule for rule, _ in self.lines.candidates('0 packets input')],
+            ['any', 'in_pkts'])
+        self.assertEqual(
+            [rule for rule, _ in self.lines.candidates('Vlan1 is up, '
+                                                       'line protocol is up')],
+            ['intf', 'any'])
+        self.assertEqual(
+            [rule for rule, _ in self.lines.candidates('0 runts, 0 giants')],
+            ['any'])
+
+    def test_same_result_as_linear(self):
+        lines = ['GigabitEthernet1 is up, line protocol is up',
+                 'Hardware is CSR vNIC', 'MTU 1500 bytes, BW 1000000 Kbit',
+                 '10 packets input, 1024 bytes', 'CRC : 0',
+                 'input flow-control is off', 'Hardware : 1', 'MTU : 2',
+                 '12 : 3', 'nothing']
+        for line in lines:
+            expected = (None, None)
+            for rule, pattern in self.lines.rules:
+                m = pattern.match(line)
+                if m:
+                    expected = (rule, m.groupdict())
+                    break
+            rule, m = self.lines.match(line)
+            self.assertEqual((rule, m.groupdict() if m else None), expected,
+                             line)
+
+    def test_bad_anchor(self):
+        with self.assertRaises(ValueError):
+            self.lines.add('bad', r'^\(size\)', anchor='(size)')
+
+
+class TestPatternScanner(unittest.TestCase):
+
+    OUTPUT = (
+        'Routing Table: VRF1\n'
+        'Gateway of last resort is not set\n'
+        '\n'
+        '      10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks\n'
+        'C        10.1.1.0/24 is directly connected, GigabitEthernet2  \n'
+        'O        10.2.2.0/24 [110/2] via 10.1.1.2, 00:01:02, '
+        'GigabitEthernet2\n'
+        '                     [110/2] via 10.1.1.3, 00:01:02, '
+        'GigabitEthernet3\n'
+        '   \n'
+        'AS path: 65151 65000 I\n'
+        'nothing to see\n')
+
+    def setUp(self):
+        self.patterns = [
+            ('vrf', r'^Routing Table: +(?P<vrf>\S+)$'),
+            ('route', r'^(?P<code>[\w\*]+) +(?P<network>[\d\.\/]+)'
+                      r'( +is +directly +connected, +(?P<intf>\S+))?'),
+            ('route', r'^(?P<network>[\d\.\/]+) +is +variably'),
+            ('nexthop', r'^\[(?P<pref>\d+)\/(?P<metric>\d+)\] +via '
+                        r'+(?P<nexthop>[\d\.]+)'),
+            ('path', r'AS +path: +(?P<path>[\d\s]+ )?(?P<origin>\w)$'),
+            ('gateway', r'^Gateway +of +last +resort'),
+        ]
+        self.lines = PatternScanner()
+        for rule, pattern in self.patterns:
+            self.lines.add(rule, pattern)
+
+    def sequential(self, output):
+        compiled = [(rule, re.compile(pattern))
+                    for rule, pattern in self.patterns]
+        for line in output.splitlines():
+            line = line.strip()
+            for rule, pattern in compiled:
+                m = pattern.match(line)
+                if m:
+                    yield rule, m.groupdict()
+                    break
+
+    def test_match(self):
+        self.assertEqual(self.lines.match('Routing Table: VRF1'),
+                         ('vrf', {'vrf': 'VRF1'}))
+        self.assertEqual(self.lines.match('10.0.0.0/8 is variably subnetted'),
+                         ('route', {'network': '10.0.0.0/8'}))
+        self.assertEqual(self.lines.match('Gateway of last resort is not set'),
+                         ('gateway', {}))
+        self.assertEqual(self.lines.match('nothing'), (None, None))
+        self.assertEqual(self.lines.match(''), (None, None))
+
+    def test_scan(self):
+        self.assertEqual(list(self.lines.scan(self.OUTPUT)),
+                         list(self.sequential(self.OUTPUT)))
+
+    def test_finditer(self):
+        expected = list(self.sequential(self.OUTPUT))
+        self.assertEqual(len(expected), 7)
+        self.assertEqual(list(self.lines.finditer(self.OUTPUT)), expected)
+
+        # \s of a pattern does not go past the end of its line
+        output = 'AS path: 1 2\n3 I\n'
+        self.assertEqual(list(self.lines.finditer(output)),
+                         list(self.sequential(output)))
+
+        for output in ('', '\n', '   \n\n', self.OUTPUT.rstrip(),
+                       self.OUTPUT.replace('\n', '\r\n')):
+            self.assertEqual(list(self.lines.finditer(output)),
+                             list(self.sequential(output)), repr(output))
+
+    def test_flags(self):
+        lines = PatternScanner(flags=re.IGNORECASE)
+        lines.add('mtu', r'^mtu +(?P<mtu>\d+)$')
+        self.assertEqual(lines.match('MTU 1500'), ('mtu', {'mtu': '1500'}))
+        self.assertEqual(list(lines.finditer(' MTU 1500\n')),
+                         [('mtu', {'mtu': '1500'})])
+
+    def test_unsupported(self):
+        for pattern in (r'^(\w+) +\1$', r'^(?P<a>\w)?(?(a)b|c)$',
+                        r'(?i)^mtu$'):
+            with self.assertRaises(ValueError):
+                self.lines.add('bad', pattern)
+        # Named back references are kept
+        self.lines.add('twice', r'^(?P<word>\w+) (?P=word)$')
+        self.assertEqual(self.lines.match('up up'),
+                         ('twice', {'word': 'up'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
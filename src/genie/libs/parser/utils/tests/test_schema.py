@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch
+
+from pyats.utils.exceptions import SchemaError
+
+from genie.libs.parser.utils import schema
+from genie.libs.parser.utils.schema import ListOfDict
+
+
+class TestListOfDict(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = ListOfDict({'to': str}, 'nh is not a list')
+
+    def test_validate_each_item(self):
+        value = [{'to': '10.0.0.1'}, {'to': '10.0.0.2'}]
+        with patch.object(schema, 'Schema') as Schema:
+            self.assertIs(self.validator(value), value)
+        Schema.assert_called_once_with({'to': str})
+        self.assertEqual([call[0] for call in
+                          Schema.return_value.validate.call_args_list],
+                         [({'to': '10.0.0.1'},), ({'to': '10.0.0.2'},)])
+
+    def test_schema_built_once(self):
+        with patch.object(schema, 'Schema') as Schema:
+            for _ in range(3):
+                self.validator([{'to': '10.0.0.1'}])
+            self.validator([])
+        self.assertEqual(Schema.call_count, 1)
+
+    def test_not_a_list(self):
+        with patch.object(schema, 'Schema') as Schema:
+            with self.assertRaises(SchemaError) as cm:
+                self.validator({'to': '10.0.0.1'})
+        self.assertEqual(str(cm.exception), 'nh is not a list')
+        Schema.assert_not_called()
+
+    def test_dict_as_list(self):
+        validator = ListOfDict({'to': str}, 'nh is not a list',
+                               dict_as_list=True)
+        with patch.object(schema, 'Schema') as Schema:
+            self.assertEqual(validator({'to': '10.0.0.1'}),
+                             [{'to': '10.0.0.1'}])
+            with self.assertRaises(SchemaError):
+                validator('10.0.0.1')
+        Schema.return_value.validate.assert_called_once_with(
+            {'to': '10.0.0.1'})
+
+
+if __name__ == '__main__':
+    unittest.main()
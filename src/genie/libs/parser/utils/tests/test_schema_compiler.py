@@ -0,0 +1,143 @@
+import unittest
+from unittest.mock import patch
+
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, Use
+
+from genie.libs.parser.utils import schema_compiler
+from genie.libs.parser.utils.schema import ListOfDict
+from genie.libs.parser.utils.schema_compiler import (CompiledSchema,
+                                                    compiled_schema)
+
+
+def validate_state(value):
+    if value not in ('up', 'down'):
+        raise ValueError('{} is not a state'.format(value))
+    return value
+
+
+class TestCompiledSchema(unittest.TestCase):
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'index': int,
+                Optional('state'): Use(validate_state),
+                Optional('mtu'): Or(int, str),
+                Optional('flags'): list,
+                Optional('enabled'): bool,
+                Optional('neighbors'): {
+                    str: {
+                        Optional('address'): str,
+                    },
+                },
+            },
+        },
+    }
+
+    accepted = [
+        {'vrf': {'default': {'index': 1}}},
+        {'vrf': {'default': {'index': 1, 'state': 'up', 'mtu': 1500,
+                             'flags': ['a', 'b'], 'enabled': True},
+                 'red': {'index': 2, 'mtu': 'auto',
+                         'neighbors': {'10.0.0.1': {'address': 'x'},
+                                       '10.0.0.2': {}}}}},
+    ]
+
+    rejected = [
+        {},
+        [],
+        {'vrf': {}},
+        {'vrf': {'default': {}}},
+        {'vrf': {'default': {'index': '1'}}},
+        {'vrf': {'default': {'index': 1, 'state': 'unknown'}}},
+        {'vrf': {'default': {'index': 1, 'mtu': 1.5}}},
+        {'vrf': {'default': {'index': 1, 'flags': 'a'}}},
+        {'vrf': {'default': {'index': 1, 'neighbors': {}}}},
+        {'vrf': {'default': {'index': 1, 'extra': 1}}},
+        {'vrf': {'default': {'index': 1}}, 'extra': 1},
+    ]
+
+    def accepts(self, schema, data):
+        try:
+            schema.validate(data)
+        except Exception:
+            return False
+        return True
+
+    def test_same_as_schema(self):
+        compiled = CompiledSchema(self.schema)
+        schema = Schema(self.schema)
+        for data in self.accepted + self.rejected:
+            with self.subTest(data=data):
+                self.assertEqual(self.accepts(compiled, data),
+                                 self.accepts(schema, data))
+                # The generated check never accepts more than Schema
+                if compiled.check(data):
+                    self.assertTrue(self.accepts(schema, data))
+
+    def test_accepted_without_schema(self):
+        compiled = CompiledSchema(self.schema)
+        with patch.object(schema_compiler, 'Schema') as Schema:
+            for data in self.accepted:
+                self.assertIs(compiled.validate(data), data)
+        Schema.assert_not_called()
+
+    def test_rejected_by_schema(self):
+        compiled = CompiledSchema(self.schema)
+        data = {'vrf': {'default': {'index': '1'}}}
+        with self.assertRaises(Exception) as expected:
+            Schema(self.schema).validate(data)
+        with self.assertRaises(type(expected.exception)):
+            compiled.validate(data)
+
+    def test_literal_key_after_wildcard(self):
+        # Also accepted by the wildcard, whichever Schema tries first
+        schema = {Any(): int, Optional('name'): Or(int, str)}
+        compiled = CompiledSchema(schema)
+        self.assertTrue(compiled.check({'a': 1, 'name': 2}))
+        self.assertFalse(compiled.check({'a': 1, 'name': 'x'}))
+
+    def test_list_of_dict(self):
+        compiled = CompiledSchema({
+            'rt': Use(ListOfDict({'to': str}, dict_as_list=True))})
+        self.assertTrue(compiled.check({'rt': [{'to': 'a'}, {'to': 'b'}]}))
+        self.assertFalse(compiled.check({'rt': [{'to': 1}]}))
+        self.assertFalse(compiled.check({'rt': 'a'}))
+        # Made a list by Schema
+        self.assertFalse(compiled.check({'rt': {'to': 'a'}}))
+        self.assertEqual(compiled.validate({'rt': {'to': 'a'}}),
+                         {'rt': [{'to': 'a'}]})
+
+    def test_list_literal(self):
+        # Exact value for Schema, not a list of str
+        compiled = CompiledSchema({'flags': [str]})
+        for data in ({'flags': [str]}, {'flags': ['a', 'b']}):
+            with self.subTest(data=data):
+                self.assertEqual(self.accepts(compiled, data),
+                                 self.accepts(Schema({'flags': [str]}), data))
+        self.assertFalse(compiled.check({'flags': ['a', 'b']}))
+
+    def test_converted(self):
+        compiled = CompiledSchema({'index': Use(int)})
+        self.assertTrue(compiled.check({'index': 1}))
+        # Converted by Schema
+        self.assertFalse(compiled.check({'index': '1'}))
+        self.assertEqual(compiled.validate({'index': '1'}), {'index': 1})
+
+    def test_source(self):
+        compiled = CompiledSchema(self.schema)
+        self.assertIn('def _check', compiled.source)
+        self.assertNotIn('_subtree(', compiled.source)
+
+    def test_compiled_once(self):
+        schema = {'version': str}
+        with patch.object(schema_compiler, 'CompiledSchema',
+                          wraps=CompiledSchema) as compile:
+            first = compiled_schema(schema)
+            self.assertIs(compiled_schema(schema), first)
+            compiled_schema({'version': str})
+        self.assertEqual(compile.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
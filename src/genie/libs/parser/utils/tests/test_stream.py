@@ -0,0 +1,271 @@
+import os
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAll
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxr.show_bgp import ShowBgpInstanceAllAll
+from genie.libs.parser.iosxr.show_routing import ShowRouteIpv4
+from genie.libs.parser.junos.show_route import ShowRoute
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.nxos.show_routing import ShowIpRoute as NxosShowIpRoute
+from genie.libs.parser.utils.stream import iter_lines, RecordStream
+
+PARSERS = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+
+
+def golden(os_name, parser, name):
+    '''Output of a golden of the folder tests'''
+    with open(os.path.join(PARSERS, os_name, 'tests', parser, 'cli', 'equal',
+                           name + '_output.txt')) as f:
+        return f.read()
+
+
+def chunks(output, size=7):
+    return [output[index:index + size]
+            for index in range(0, len(output), size)]
+
+
+def merge(parsed, record):
+    '''Merge record into parsed, as found in the output parsed whole'''
+    for key, value in record.items():
+        if isinstance(value, dict) and isinstance(parsed.get(key), dict):
+            merge(parsed[key], value)
+        else:
+            parsed[key] = value
+    return parsed
+
+
+def prefixes(parsed, path):
+    '''Prefixes found under path, a key or None for each key, the last one
+    for the prefixes themselves'''
+    if len(path) == 1:
+        return list(parsed)
+    if path[0] is None:
+        return [prefix for value in parsed.values()
+                for prefix in prefixes(value, path[1:])]
+    return prefixes(parsed.get(path[0], {}), path[1:])
+
+
+class TestIterLines(unittest.TestCase):
+
+    def test_chunks(self):
+        self.assertEqual(list(iter_lines(['Routing Table: VR', 'F1\nC  10.4',
+                                          '.1.1\n\nO', '  10.2.3.0/24'])),
+                         ['Routing Table: VRF1', 'C  10.4.1.1', '',
+                          'O  10.2.3.0/24'])
+
+    def test_file_lines(self):
+        self.assertEqual(list(iter_lines(['Routing Table: VRF1\r\n',
+                                          'C  10.4.1.1\r\n'])),
+                         ['Routing Table: VRF1', 'C  10.4.1.1'])
+
+    def test_output(self):
+        self.assertEqual(list(iter_lines('C  10.4.1.1\nL  10.4.1.2\n')),
+                         ['C  10.4.1.1', 'L  10.4.1.2'])
+        self.assertEqual(list(iter_lines('')), [])
+
+    def test_bytes(self):
+        encoded = 'via Etherneté1\nC  10.4.1.1'.encode('utf-8')
+        split = encoded.index(b'\xa9')
+        self.assertEqual(list(iter_lines([encoded[:split],
+                                          encoded[split:]])),
+                         ['via Etherneté1', 'C  10.4.1.1'])
+
+
+class TestRecordStream(unittest.TestCase):
+
+    stream = RecordStream(record=r'^\* ', context=[r'^VRF ', r'^AF ',
+                                                   r'^Table '])
+
+    def test_split(self):
+        lines = ['Status codes', 'VRF red', 'AF ipv4', 'Legend',
+                 'Table version 2', 'Table id 0x1', '* 10.1.0.0/24', ' path 2',
+                 '* 10.2.0.0/24', 'Table version 3', '* 10.3.0.0/24',
+                 'AF ipv6', '* 2001::/64', 'VRF blue', 'Table version 4',
+                 '* 10.4.0.0/24']
+        self.assertEqual(list(self.stream.split(lines)), [
+            ['VRF red', 'AF ipv4', 'Table version 2', 'Table id 0x1',
+             '* 10.1.0.0/24', ' path 2'],
+            ['VRF red', 'AF ipv4', 'Table version 2', 'Table id 0x1',
+             '* 10.2.0.0/24'],
+            ['VRF red', 'AF ipv4', 'Table version 3', '* 10.3.0.0/24'],
+            ['VRF red', 'AF ipv6', '* 2001::/64'],
+            ['VRF blue', 'Table version 4', '* 10.4.0.0/24'],
+        ])
+
+    def test_record_on_read(self):
+        read = []
+
+        def lines():
+            for line in ['VRF red', '* 10.1.0.0/24', ' path 2',
+                         '* 10.2.0.0/24', ' path 2']:
+                read.append(line)
+                yield line
+
+        records = self.stream.split(lines())
+        self.assertEqual(next(records), ['VRF red', '* 10.1.0.0/24',
+                                         ' path 2'])
+        # Complete once the next record starts, nothing else read
+        self.assertEqual(len(read), 4)
+
+
+class TestIterParse(unittest.TestCase):
+
+    def assertStreamed(self, parser_cls, output, path, **kwargs):
+        '''Check the records of output make up its parsed output, one prefix
+        each'''
+        parser = parser_cls(device=Mock())
+        records = list(parser.iter_parse(chunks(output), **kwargs))
+        parsed = parser.cli(output=output, **kwargs)
+
+        self.assertEqual([len(prefixes(record, path)) for record in records],
+                         [1] * len(records))
+        self.assertEqual(sorted(prefix for record in records
+                                for prefix in prefixes(record, path)),
+                         sorted(prefixes(parsed, path)))
+        merged = {}
+        for record in records:
+            merge(merged, record)
+        self.assertEqual(merged, parsed)
+        return records
+
+    def test_iosxe_show_ip_route(self):
+        records = self.assertStreamed(
+            ShowIpRoute, golden('iosxe', 'ShowIpRoute',
+                                'golden_output_2_with_vrf'),
+            ('vrf', None, 'address_family', None, 'routes', None), vrf='VRF1')
+        # Mask of the subnet the route is under
+        self.assertEqual(prefixes(records[3], ('vrf', 'VRF1', 'address_family',
+                                               'ipv4', 'routes', None)),
+                         ['10.145.0.0/24'])
+
+    def test_iosxe_show_bgp_all(self):
+        records = self.assertStreamed(
+            ShowBgpAll, golden('iosxe', 'ShowBgpAll', 'golden_output2'),
+            ('vrf', None, 'address_family', None, 'routes', None))
+        af = records[0]['vrf']['default']['address_family']
+        self.assertEqual(af['vpnv4 unicast RD 200:1']['bgp_table_version'],
+                         56)
+        self.assertEqual(len(af['vpnv4 unicast RD 200:1']['routes']
+                             ['10.1.1.0/24']['index']), 2)
+
+    def test_junos_show_route(self):
+        output = golden('junos', 'ShowRoute', 'golden_output_5')
+        parser = ShowRoute(device=Mock())
+        records = list(parser.iter_parse(chunks(output)))
+        parsed = parser.cli(output=output)
+
+        destinations = []
+        for record in records:
+            tables = record['route-information']['route-table']
+            self.assertEqual(len(tables), 1)
+            self.assertEqual(tables[0]['table-name'], 'inet.0')
+            routes = tables[0]['rt']
+            self.assertIn('rt-destination', routes[0])
+            destinations.append(routes)
+        self.assertEqual(
+            [route for routes in destinations for route in routes],
+            [route for table in parsed['route-information']['route-table']
+             for route in table.get('rt', [])])
+
+    def test_nxos_show_ip_route(self):
+        output = '''\
+IP Route Table for VRF "default"
+'*' denotes best ucast next-hop
+'**' denotes best mcast next-hop
+
+10.4.1.1/32, ubest/mbest: 2/0
+    *via 10.2.4.2, Eth1/1, [110/41], 01:01:18, ospf-1, intra
+    *via 10.4.2.4, Eth1/2, [110/41], 01:01:18, ospf-1, intra
+10.229.11.11/32, ubest/mbest: 1/0, attached
+    *via 10.229.11.11, Lo0, [0/0], 01:01:38, local
+
+IP Route Table for VRF "VRF1"
+10.36.3.3/32, ubest/mbest: 1/0
+    *via 10.229.11.11%default, [200/0], 01:01:12, bgp-100, internal, tag 100
+'''
+        records = self.assertStreamed(
+            NxosShowIpRoute, output,
+            ('vrf', None, 'address_family', None, 'routes', None))
+        self.assertEqual(list(records[2]['vrf']), ['VRF1'])
+
+    def test_nxos_show_bgp_vrf_all_all(self):
+        output = '''\
+BGP routing table information for VRF default, address family IPv4 Unicast
+BGP table version is 174, Local Router ID is 10.145.0.6
+Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
+Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist, I-injected
+Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath, & - backup
+
+   Network            Next Hop            Metric     LocPrf     Weight Path
+* i10.4.1.0/24        10.106.101.1            2222        100          0 1 2 3 65000 23 i
+*>i                   10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
+*>i10.49.0.0/16       10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
+d e10.4.0.0/24        10.106.102.3                                     0 888 10 20 30 40 50 60 70 80 90 i
+'''
+        records = self.assertStreamed(
+            ShowBgpVrfAllAll, output,
+            ('vrf', None, 'address_family', None, 'prefixes', None))
+        af = records[0]['vrf']['default']['address_family']['ipv4 unicast']
+        self.assertEqual(af['bgp_table_version'], 174)
+        self.assertEqual(len(af['prefixes']['10.4.1.0/24']['index']), 2)
+
+    def test_iosxr_show_route_ipv4(self):
+        output = '''\
+VRF: VRF501
+
+Codes: C - connected, S - static, R - RIP, B - BGP, (>) - Diversion path
+       O - OSPF, IA - OSPF inter area, L - local
+
+Gateway of last resort is 172.16.0.88 to network 0.0.0.0
+
+O    10.23.90.0/24 [110/2] via 10.12.90.1, 01:50:49, GigabitEthernet0/0/0/0.90
+                   [110/2] via 10.13.90.3, 01:50:49, GigabitEthernet0/0/0/1.90
+C    10.12.90.0/24 is directly connected, 01:51:13, GigabitEthernet0/0/0/0.90
+L    10.12.90.2/32 is directly connected, 01:51:13, GigabitEthernet0/0/0/0.90
+'''
+        records = self.assertStreamed(
+            ShowRouteIpv4, output,
+            ('vrf', None, 'address_family', None, 'routes', None))
+        self.assertEqual(records[2]['vrf']['VRF501']['last_resort'],
+                         {'gateway': '172.16.0.88', 'to_network': '0.0.0.0'})
+
+    def test_iosxr_show_bgp_instance_all_all(self):
+        output = '''\
+BGP instance 0: 'default'
+=========================
+
+Address Family: VPNv4 Unicast
+-----------------------------
+
+BGP router identifier 10.4.1.1, local AS number 100
+BGP generic scan interval 60 secs
+BGP table state: Active
+BGP main routing table version 43
+
+Status codes: s suppressed, d damped, h history, * valid, > best
+              i - internal, r RIB-failure, S stale, N Nexthop-discard
+Origin codes: i - IGP, e - EGP, ? - incomplete
+   Network            Next Hop            Metric LocPrf Weight Path
+Route Distinguisher: 200:1 (default for vrf VRF1)
+*> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
+Route Distinguisher: 300:1
+*>i10.169.1.0/24        10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
+* i                   10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
+
+Processed 2 prefixes, 3 paths
+'''
+        records = self.assertStreamed(
+            ShowBgpInstanceAllAll, output,
+            ('instance', None, 'vrf', None, 'address_family', None, 'prefix',
+             None))
+        af = records[1]['instance']['default']['vrf']['default']\
+                                                            ['address_family']
+        self.assertEqual(af['vpnv4 unicast']['router_identifier'], '10.4.1.1')
+        self.assertEqual(len(af['vpnv4 unicast RD 300:1']['prefix']
+                             ['10.169.1.0/24']['index']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import validation
+from genie.libs.parser.utils.validation import (ValidationPolicy,
+                                                set_validation_policy,
+                                                get_validation_policy,
+                                                reset_validation_policy,
+                                                set_compiled_schemas)
+
+
+class ShowDummySchema(MetaParser):
+    schema = {'version': str}
+
+
+class ShowDummy(ShowDummySchema):
+
+    def cli(self, output=None):
+        return {'version': output} if output else {}
+
+
+class ShowOtherDummy(ShowDummy):
+    pass
+
+
+class ShowExecutedDummy(ShowDummySchema):
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute('show version')
+        # Not a str, fails the schema
+        return {'version': len(output)}
+
+
+class TestValidationPolicy(unittest.TestCase):
+
+    def test_sample(self):
+        policy = ValidationPolicy('sampled', rate=3)
+        self.assertEqual([policy.sample(ShowDummy) for _ in range(7)],
+                         [True, False, False, True, False, False, True])
+        # Counted per key
+        self.assertTrue(policy.sample(ShowOtherDummy))
+        self.assertTrue(ValidationPolicy('always').sample(ShowDummy))
+        self.assertFalse(ValidationPolicy('never').sample(ShowDummy))
+
+    def test_from_string(self):
+        policy = ValidationPolicy.from_string('Sampled:1000')
+        self.assertEqual((policy.mode, policy.rate), ('sampled', 1000))
+        self.assertEqual(ValidationPolicy.from_string('never').mode, 'never')
+        with self.assertRaises(ValueError):
+            ValidationPolicy.from_string('sometimes')
+        with self.assertRaises(ValueError):
+            ValidationPolicy('sampled', rate=0)
+
+
+class TestValidatedParse(unittest.TestCase):
+
+    def setUp(self):
+        self.metaparser_parse = MetaParser.parse
+        self.addCleanup(reset_validation_policy)
+
+        self.device = Mock(version='17.3')
+
+    def parse(self, parser_cls=ShowDummy, output='17.3', device=None,
+              **kwargs):
+        return parser_cls(device=device or self.device).parse(output=output,
+                                                              **kwargs)
+
+    def test_always_unchanged(self):
+        set_validation_policy('always', ShowOtherDummy)
+        self.assertIsNot(MetaParser.parse, self.metaparser_parse)
+
+        with patch.object(validation.PolicySchema, 'validate') as validate:
+            self.assertEqual(self.parse(ShowOtherDummy), {'version': '17.3'})
+        validate.assert_not_called()
+
+        reset_validation_policy()
+        self.assertIs(MetaParser.parse, self.metaparser_parse)
+
+    def test_never_validates_first_use(self):
+        set_validation_policy('never')
+        with patch.object(validation, 'Schema') as Schema:
+            for _ in range(3):
+                self.assertEqual(self.parse(), {'version': '17.3'})
+            self.assertEqual(Schema.call_count, 1)
+
+            # Once per version
+            self.parse(device=Mock(version='17.4'))
+            self.assertEqual(Schema.call_count, 2)
+
+        # Not validated
+        self.assertEqual(self.parse(output=17.3), {'version': 17.3})
+
+    def test_sampled(self):
+        set_validation_policy('sampled:2')
+        with patch.object(validation, 'Schema') as Schema:
+            for _ in range(5):
+                self.parse()
+        # First use, then one call out of 2
+        self.assertEqual(Schema.call_count, 3)
+
+    def test_parser_policy(self):
+        set_validation_policy('never', ShowDummy)
+        self.assertEqual(get_validation_policy(ShowOtherDummy).mode, 'never')
+        set_validation_policy('always', ShowOtherDummy)
+        self.assertEqual(get_validation_policy(ShowOtherDummy).mode,
+                         'always')
+        set_validation_policy(None, ShowOtherDummy)
+        self.assertEqual(get_validation_policy(ShowOtherDummy).mode, 'never')
+
+    def test_failure_logged(self):
+        set_validation_policy('never')
+        with self.assertLogs(validation.log, 'WARNING') as logs:
+            self.assertEqual(self.parse(output=17.3), {'version': 17.3})
+        self.assertIn('ShowDummy output does not match its schema',
+                      logs.output[0])
+        self.assertIn("{'version': 17.3}", logs.output[0])
+
+    def test_failure_logged_with_device_output(self):
+        set_validation_policy('never')
+        self.device.execute.return_value = 'Cisco IOS XE Software, 17.3'
+        parser = ShowExecutedDummy(device=self.device)
+        with self.assertLogs(validation.log, 'WARNING') as logs:
+            self.assertEqual(parser.parse(), {'version': 27})
+        self.assertIn('Device output:\nshow version\n'
+                      'Cisco IOS XE Software, 17.3', logs.output[0])
+        self.assertIs(parser.device, self.device)
+
+    def test_compiled_schemas(self):
+        set_compiled_schemas(True)
+        self.assertIsNot(MetaParser.parse, self.metaparser_parse)
+        with patch.object(validation, 'compiled_schema',
+                          wraps=validation.compiled_schema) as compiled:
+            self.assertEqual(self.parse(), {'version': '17.3'})
+            # Raised with the always policy
+            with self.assertRaises(Exception):
+                self.parse(ShowDummy, output=17.3)
+        self.assertEqual(compiled.call_count, 2)
+
+        set_compiled_schemas(False)
+        set_validation_policy('never')
+        with patch.object(validation, 'Schema') as Schema:
+            self.parse(device=Mock(version='17.5'))
+        self.assertEqual(Schema.call_count, 1)
+
+    def test_empty(self):
+        set_validation_policy('never')
+        with self.assertRaises(SchemaEmptyParserError):
+            self.parse(output='')
+
+    def test_metaparser_arguments(self):
+        set_validation_policy('never')
+        parser = ShowDummy(device=self.device)
+        # Handled by MetaParser, not given to cli()
+        self.assertEqual(parser.parse(output='17.3', context='cli',
+                                      warn_unsupported_keys=True),
+                         {'version': '17.3'})
+        # Schema of the class again
+        self.assertNotIn('schema', vars(parser))
+        self.assertIs(parser.schema, ShowDummySchema.schema)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+'''Token trie used to narrow down the commands a search can match'''
+
+# python
+import re
+from bisect import bisect_left
+
+
+class _Node(object):
+    '''A single level of the command trie'''
+
+    __slots__ = ('children', 'arguments', 'partials', 'commands', '_keys')
+
+    def __init__(self):
+        # literal command token -> child node
+        self.children = {}
+        # child nodes reached through a '{argument}' token
+        self.arguments = []
+        # (start, end, child) for tokens such as 'interface/{interface}'
+        self.partials = []
+        # commands ending at this node
+        self.commands = []
+        self._keys = None
+
+    def child(self, token):
+        node = self.children.get(token)
+        if node is None:
+            node = self.children[token] = _Node()
+            self._keys = None
+        return node
+
+    def prefixed(self, token):
+        '''Yield every literal child whose token starts with `token`'''
+        if self._keys is None:
+            self._keys = sorted(self.children)
+        keys = self._keys
+        index = bisect_left(keys, token)
+        while index < len(keys) and keys[index].startswith(token):
+            yield self.children[keys[index]]
+            index += 1
+
+
+class CommandTrie(object):
+    '''Index the registered commands token by token.
+
+    Literal tokens are stored as sorted edges so an abbreviated token
+    ('sh' for 'show') is resolved with a bisect, and '{argument}' tokens are
+    stored as wildcard edges able to consume one or two search tokens, the
+    same way `_matches_fuzzy` does. Walking the trie only returns
+    *candidates*; the caller still confirms each of them with
+    `_matches_fuzzy` so kwargs and scores are unchanged.
+
+    Args:
+        commands (`iterable`): the commands to index
+
+    example:
+
+        >>> trie = CommandTrie(['show version', 'show vrf {vrf}'])
+        >>> trie.candidates(['sh', 'vrf', 'VRF1'])
+        ['show vrf {vrf}']
+    '''
+
+    def __init__(self, commands=()):
+        self.root = _Node()
+        self._order = {}
+        for command in commands:
+            self.insert(command)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, command):
+        return command in self._order
+
+    def insert(self, command):
+        '''Add a command to the trie, keeping the insertion order'''
+        if command in self._order:
+            return
+        self._order[command] = len(self._order)
+
+        node = self.root
+        for token in command.split():
+            if '{' not in token:
+                node = node.child(token)
+            elif token.startswith('{'):
+                child = _Node()
+                node.arguments.append(child)
+                node = child
+            else:
+                start, end = re.match('(.*){.*?}(.*)', token).groups()
+                child = _Node()
+                node.partials.append((start, end, child))
+                node = child
+        node.commands.append(command)
+
+    def candidates(self, tokens):
+        '''Return the commands which could match the search tokens, in
+        insertion order.
+
+        Args:
+            tokens (`list`): the search tokens, all of them regular
+                             (no regex expression)
+
+        Returns:
+            list: the candidate commands
+        '''
+        found = set()
+        stack = [(self.root, 0)]
+        seen = set()
+        total = len(tokens)
+
+        while stack:
+            node, index = stack.pop()
+            key = (id(node), index)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if index == total:
+                found.update(node.commands)
+                continue
+
+            token = tokens[index]
+
+            for child in node.prefixed(token):
+                stack.append((child, index + 1))
+
+            for start, end, child in node.partials:
+                if token.startswith(start) and token.endswith(end):
+                    stack.append((child, index + 1))
+
+            # An argument spans one or two search tokens
+            for child in node.arguments:
+                stack.append((child, index + 1))
+                if index + 2 <= total:
+                    stack.append((child, index + 2))
+
+        return sorted(found, key=self._order.__getitem__)
@@ -0,0 +1,325 @@
+'''Policy deciding which parse() calls validate their result against the
+schema of the parser.
+
+Validating a big nested result can cost as much as parsing it. Parsers which
+are known to be good can be validated on a sample of their calls only, or
+not at all:
+
+    * always: every call is validated, failures raise (default)
+    * never: no call is validated
+    * sampled: one call out of `rate` is validated
+
+Whatever the policy, the first call of a parser class for each software
+version is validated. Outside of the always policy, validation failures are
+logged along with the parsed output instead of raised.
+
+The policy can be given for all parsers, through the
+`pyats.libs.parser.validation` setting (or its
+PYATS_LIBS_PARSER_VALIDATION environment variable) such as 'sampled:1000',
+or set for all parsers or a parser class:
+
+    >>> from genie.libs.parser.utils import validation
+    >>> validation.set_validation_policy('sampled:1000')
+    >>> validation.set_validation_policy('never', ShowBgpVrfAllAll)
+
+Validation can also go through schemas compiled into Python functions (see
+schema_compiler), which accept and reject the same outputs as Schema but
+validate big outputs much faster. It is enabled by
+`pyats.libs.parser.compiled_schemas` or:
+
+    >>> validation.set_compiled_schemas(True)
+'''
+
+# python
+import logging
+import threading
+from pprint import pformat
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Schema
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from .common import _get_config
+from .execute import CommandRecorder
+from .schema_compiler import compiled_schema
+
+PARSER_VALIDATION = 'pyats.libs.parser.validation'
+PARSER_COMPILED_SCHEMAS = 'pyats.libs.parser.compiled_schemas'
+
+log = logging.getLogger(__name__)
+
+
+class ValidationPolicy(object):
+    '''When to validate the result of a parser
+
+    Args:
+        mode (`str`): 'always', 'never' or 'sampled'
+        rate (`int`): with sampled, validate one call out of rate
+
+    example:
+
+        >>> policy = ValidationPolicy('sampled', rate=3)
+        >>> [policy.sample(ShowVersion) for _ in range(4)]
+        [True, False, False, True]
+    '''
+
+    ALWAYS = 'always'
+    NEVER = 'never'
+    SAMPLED = 'sampled'
+
+    def __init__(self, mode=ALWAYS, rate=100):
+        if mode not in (self.ALWAYS, self.NEVER, self.SAMPLED):
+            raise ValueError("Unknown validation mode '{}'".format(mode))
+        if mode == self.SAMPLED and rate < 1:
+            raise ValueError('Sampling rate must be at least 1')
+        self.mode = mode
+        self.rate = rate
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_string(cls, text):
+        '''Return the policy of 'always', 'never' or 'sampled:<rate>' '''
+        mode, _, rate = text.strip().lower().partition(':')
+        if rate:
+            return cls(mode, rate=int(rate))
+        return cls(mode)
+
+    def sample(self, key):
+        '''Return whether this call of key is validated, counting the calls
+        of each key'''
+        if self.mode == self.ALWAYS:
+            return True
+        if self.mode == self.NEVER:
+            return False
+        with self._lock:
+            calls = self._calls.get(key, 0)
+            self._calls[key] = calls + 1
+        return calls % self.rate == 0
+
+    def __repr__(self):
+        if self.mode == self.SAMPLED:
+            return '<{} sampled 1/{}>'.format(self.__class__.__name__,
+                                              self.rate)
+        return '<{} {}>'.format(self.__class__.__name__, self.mode)
+
+
+# Policy of every parser class without one of its own
+_default_policy = ValidationPolicy()
+
+# {parser class: ValidationPolicy}
+_policies = {}
+
+# (parser class, software version) validated at least once
+_validated = set()
+_validated_lock = threading.Lock()
+
+# Validate through compiled schemas instead of Schema
+_compiled_schemas = False
+
+# MetaParser.parse, wrapped by _parse while a policy is set
+_metaparser_parse = None
+
+
+def _policy(policy):
+    if isinstance(policy, ValidationPolicy):
+        return policy
+    return ValidationPolicy.from_string(policy)
+
+
+def set_validation_policy(policy, parser_cls=None):
+    '''Set the policy of parser_cls and its subclasses, or the default one
+
+    Args:
+        policy (`ValidationPolicy` or `str`): 'always', 'never',
+                                              'sampled:<rate>'. None removes
+                                              the policy of parser_cls
+        parser_cls (`class`): parser class, None for every parser
+    '''
+    global _default_policy
+
+    if parser_cls is None:
+        _default_policy = _policy(policy or ValidationPolicy.ALWAYS)
+    elif policy is None:
+        _policies.pop(parser_cls, None)
+    else:
+        _policies[parser_cls] = _policy(policy)
+
+    _install_if_needed()
+
+
+def set_compiled_schemas(enabled=True):
+    '''Validate through schemas compiled into Python functions, including
+    with the always policy
+
+    Args:
+        enabled (`bool`): False validates through Schema again
+    '''
+    global _compiled_schemas
+    _compiled_schemas = bool(enabled)
+    _install_if_needed()
+
+
+def _install_if_needed():
+    if _compiled_schemas or _policies or \
+            _default_policy.mode != ValidationPolicy.ALWAYS:
+        install()
+
+
+def get_validation_policy(parser_cls):
+    '''Return the policy of parser_cls, inherited from its base classes'''
+    if _policies:
+        for cls in parser_cls.__mro__:
+            policy = _policies.get(cls)
+            if policy is not None:
+                return policy
+    return _default_policy
+
+
+def reset_validation_policy():
+    '''Validate every call again, as without policy'''
+    global _default_policy, _compiled_schemas
+    _default_policy = ValidationPolicy()
+    _compiled_schemas = False
+    _policies.clear()
+    with _validated_lock:
+        _validated.clear()
+    uninstall()
+
+
+def _device_version(device):
+    '''Software version of the device as given in the testbed, or None'''
+    version = getattr(device, 'version', None)
+    if version is None:
+        custom = getattr(device, 'custom', None) or {}
+        version = custom.get('version')
+    return version
+
+
+def _first_use(parser_cls, version):
+    key = (parser_cls, version)
+    if key in _validated:
+        return False
+    with _validated_lock:
+        if key in _validated:
+            return False
+        _validated.add(key)
+        return True
+
+
+class PolicySchema(Schema):
+    '''Schema handed to MetaParser.parse in place of the one of the parser,
+    validating the output as decided by the policy of the parser class
+
+    MetaParser.parse still runs the parser, checks the output is not empty
+    and filters the selected keys, only its validation goes through the
+    policy. Distributors replacing their schema while parsing are validated
+    by MetaParser as usual.
+
+    Args:
+        schema (`dict`): schema of the parser
+        parser (`MetaParser`): parser being parsed
+        raw (`str` or `CommandRecorder`): output of the device, or the device
+                                          recording the commands executed by
+                                          the parser, logged along with
+                                          failures
+    '''
+
+    def __init__(self, schema, parser, raw=None):
+        super().__init__(schema)
+        self.parser = parser
+        self.raw = raw
+
+    def _raw_text(self):
+        if isinstance(self.raw, CommandRecorder):
+            return self.raw.text()
+        return self.raw
+
+    def validate(self, data, top=True, command='',
+                 warn_unsupported_keys=False):
+        if not data:
+            raise SchemaEmptyParserError(data=data)
+
+        parser_cls = type(self.parser)
+        policy = get_validation_policy(parser_cls)
+        if policy.mode == ValidationPolicy.ALWAYS:
+            return _schema(self.schema).validate(
+                data, command=command,
+                warn_unsupported_keys=warn_unsupported_keys)
+
+        if _first_use(parser_cls, _device_version(self.parser.device)) or \
+                policy.sample(parser_cls):
+            try:
+                _schema(self.schema).validate(
+                    data, command=command,
+                    warn_unsupported_keys=warn_unsupported_keys)
+            except Exception as e:
+                raw = self._raw_text()
+                log.warning('{} output does not match its schema: {}\n{}{}'
+                            .format(parser_cls.__name__, e, pformat(data),
+                                    '\nDevice output:\n{}'.format(raw)
+                                                        if raw else ''))
+        return data
+
+
+def _schema(schema):
+    if _compiled_schemas:
+        return compiled_schema(schema)
+    return Schema(schema)
+
+
+def _parse(self, **kwargs):
+    '''MetaParser.parse, its schema validation going through the policy of
+    the parser class'''
+    policy = get_validation_policy(type(self))
+    schema = self.schema
+    if not schema or isinstance(schema, PolicySchema) or \
+            (policy.mode == ValidationPolicy.ALWAYS and not _compiled_schemas):
+        return _metaparser_parse(self, **kwargs)
+
+    # Without output given, the commands executed by the parser are kept
+    # to be logged along with failures
+    device = self.device
+    raw = kwargs.get('output')
+    if raw is None and device is not None:
+        raw = self.device = CommandRecorder(device)
+
+    policy_schema = PolicySchema(schema, self, raw=raw)
+    own_schema = 'schema' in vars(self)
+    self.schema = policy_schema
+    try:
+        return _metaparser_parse(self, **kwargs)
+    finally:
+        self.device = device
+        # Unless replaced while parsing, by distributors
+        if vars(self).get('schema') is policy_schema:
+            if own_schema:
+                self.schema = schema
+            else:
+                del self.schema
+
+
+def install():
+    '''Decide through the validation policies whether parse() validates'''
+    global _metaparser_parse
+    if _metaparser_parse is None:
+        _metaparser_parse = MetaParser.parse
+        MetaParser.parse = _parse
+
+
+def uninstall():
+    '''Validate every parse() call, as MetaParser does'''
+    global _metaparser_parse
+    if _metaparser_parse is not None:
+        MetaParser.parse = _metaparser_parse
+        _metaparser_parse = None
+
+
+def configure():
+    '''Set the default policy from the pyats configuration, if given'''
+    value = _get_config(PARSER_VALIDATION)
+    if value:
+        set_validation_policy(value)
+    if str(_get_config(PARSER_COMPILED_SCHEMAS)).lower() in \
+                                                    ('1', 'true', 'yes'):
+        set_compiled_schemas(True)
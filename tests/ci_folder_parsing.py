@@ -4,6 +4,7 @@
 import os
 import re
 import sys
+import copy
 import glob
 import json
 import logging
@@ -23,7 +24,9 @@ from pyats.aetest.steps import Steps
 # Genie
 from genie.utils.diff import Diff
 from genie.libs import parser as _parser
+from genie.metaparser.util.schemaengine import Schema
 from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.libs.parser.utils.schema_compiler import compiled_schema
 
 
 log = logging.getLogger(__name__)
@@ -47,6 +50,54 @@ def read_python_file(file_path):
     return getattr(_module, "expected_output")
 
 
+def mutate_output(parsed_output, paths=20):
+    """Helper function yielding copies of a parsed output with a leaf of the
+    wrong type, an unknown key or a missing key."""
+    keys = []
+
+    def walk(data, path):
+        if isinstance(data, dict):
+            for key, value in data.items():
+                keys.append(path + [key])
+                walk(value, path + [key])
+
+    walk(parsed_output, [])
+    for path in keys[::max(1, len(keys) // paths)]:
+        for mutation in ("type", "unknown", "missing"):
+            mutated = copy.deepcopy(parsed_output)
+            parent = mutated
+            for key in path[:-1]:
+                parent = parent[key]
+            value = parent[path[-1]]
+            if mutation == "type":
+                parent[path[-1]] = 1.5 if isinstance(value, str) else "1.5"
+            elif mutation == "unknown":
+                if not isinstance(value, dict):
+                    continue
+                value["unknown_key"] = 1
+            else:
+                del parent[path[-1]]
+            yield mutated
+
+
+def compiled_schema_mismatches(schema, parsed_output):
+    """Helper function yielding the outputs, among the parsed output and its
+    mutations, the compiled schema does not accept or reject like Schema."""
+    compiled = compiled_schema(schema)
+    interpreted = Schema(schema)
+
+    def accepts(validator, data):
+        try:
+            validator.validate(data)
+        except Exception:
+            return False
+        return True
+
+    for data in [parsed_output] + list(mutate_output(parsed_output)):
+        if accepts(compiled, data) != accepts(interpreted, data):
+            yield data
+
+
 def get_operating_systems(_os):
     """Helper Script to get operating systems."""
     # Update and fix as more OS's converted to folder based tests
@@ -290,6 +341,13 @@ class FileBasedTest(aetest.Testcase):
                         logging.debug(banner(msg))
                         logging.debug("\nThe following is the device output for the passed parser:\n{}\n".format(golden_output['execute.return_value']), extra = {'colour': 'yellow'})
 
+                # The compiled schema accepts and rejects like Schema
+                schema = getattr(obj, "schema", None)
+                if schema:
+                    for mismatch in compiled_schema_mismatches(schema, golden_parsed_output):
+                        log.info("Validated differently by the compiled schema:\n{}\n".format(json.dumps(mismatch, indent=4, sort_keys=True, default=str)), extra = {'colour': 'yellow'})
+                        raise AssertionError("Compiled schema and schema do not validate the same")
+
 
     @screen_log_handling
     def test_empty(self, steps, local_class, operating_system, token=None):
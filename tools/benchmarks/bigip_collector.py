@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+'''Time to fetch bigip resources, one at a time and with the collector
+
+Serves the given number of resources from a local HTTP server answering
+each request after the given latency, and fetches all of them:
+
+    * serial: device.get(path).json() of each path, as the bigip parsers did
+    * collector: BigipCollector(device).collect(paths)
+
+usage:
+
+    python tools/benchmarks/bigip_collector.py --resources 300 --latency 20
+'''
+
+import json
+import time
+import timeit
+import argparse
+import threading
+from socketserver import ThreadingMixIn
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from genie.libs.parser.bigip.collector import BigipCollector
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        body = json.dumps({'kind': 'tm:collectionstate', 'items': [
+            {'name': 'item{}'.format(index), 'fullPath': self.path}
+                                                for index in range(20)]})
+        body = body.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class IcrSession(object):
+    '''iControl REST session of the bigip REST connector'''
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def get(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
+
+
+class Device(object):
+    '''Device connected with the bigip REST connector'''
+
+    def __init__(self, host, port):
+        self.base_url = 'http://{}:{}'.format(host, port)
+        self.icr_session = IcrSession()
+
+    def get(self, api_url, timeout=30):
+        return self.icr_session.get(self.base_url + api_url, timeout=timeout)
+
+
+def bench(resources, latency, max_workers):
+    server = Server(('127.0.0.1', 0), Handler)
+    server.latency = latency
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    device = Device(*server.server_address)
+    paths = ['/mgmt/tm/sys/resource{}'.format(index)
+                                                for index in range(resources)]
+
+    def serial():
+        for path in paths:
+            device.get(path).json()
+
+    def collector():
+        BigipCollector(device, max_workers=max_workers).collect(paths)
+
+    try:
+        return {name: min(timeit.repeat(func, number=1, repeat=3))
+                    for name, func in (('serial', serial),
+                                       ('collector', collector))}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resources', type=int, default=300)
+    parser.add_argument('--latency', type=float, default=20,
+                        help='milliseconds')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    results = bench(args.resources, args.latency / 1e3, args.workers)
+    print('{} resources, {} ms latency'.format(args.resources, args.latency))
+    for name, seconds in results.items():
+        print('{:<12} {:>10.1f} ms'.format(name, seconds * 1e3))
+    print('{:<12} {:>10.1f}x'.format(
+        'speedup', results['serial'] / results['collector']))
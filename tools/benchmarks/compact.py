@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+'''Time and memory of iosxe table results, as dictionaries and compacted
+
+Builds outputs of the given number of rows for show mac address-table,
+show ip arp, show ip nat translations and show ip route, and parses each:
+
+    * dict: parse(output=...)
+    * records: parse_compact(output=...), rows as slotted records
+    * columns: parse_compact(columns=True, output=...), rows stored in
+      columns
+
+Times are the ones of the whole call, parse and compaction. Memory is what
+the result holds once returned, and the peak during the call, traced in a
+second run not to slow the timed one.
+
+usage:
+
+    python tools/benchmarks/compact.py --rows 500000
+'''
+
+import gc
+import time
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+
+def address(index):
+    return '{}.{}.{}'.format(index >> 16 & 255, index >> 8 & 255,
+                             index & 255)
+
+
+def mac(index):
+    return 'fa16.3e{:02x}.{:04x}'.format(index >> 16 & 255, index & 0xffff)
+
+
+def mac_table(rows):
+    lines = ['          Mac Address Table',
+             '-------------------------------------------', '',
+             'Vlan    Mac Address       Type        Ports',
+             '----    -----------       --------    -----']
+    for index in range(rows):
+        lines.append('{:<4}    {}    DYNAMIC     Gi1/0/{}'.format(
+            index % 100 + 1, mac(index), index % 48 + 1))
+    lines.append('Total Mac Addresses for this criterion: {}'.format(rows))
+    return '\n'.join(lines) + '\n'
+
+
+def arp_table(rows):
+    lines = ['Protocol  Address          Age (min)  Hardware Addr   Type   '
+             'Interface']
+    for index in range(rows):
+        lines.append('Internet  10.{}  {:>12}   {}  ARPA   '
+                     'GigabitEthernet2.{}'.format(address(index), index % 240,
+                                                  mac(index), index % 400))
+    return '\n'.join(lines) + '\n'
+
+
+def nat_table(rows):
+    lines = ['Pro  Inside global         Inside local          '
+             'Outside local         Outside global']
+    for index in range(rows):
+        lines.append('tcp  172.16.0.1:{0}  10.{1}:{0}  192.168.0.{2}:443  '
+                     '192.168.0.{2}:443'.format(index % 64511 + 1024,
+                                                address(index),
+                                                index % 250 + 1))
+    lines.append('Total number of translations: {}'.format(rows))
+    return '\n'.join(lines) + '\n'
+
+
+def route_table(rows):
+    lines = ['Codes: L - local, C - connected, S - static, R - RIP, '
+             'M - mobile, B - BGP', '', 'Gateway of last resort is not set',
+             '', '      10.0.0.0/8 is variably subnetted, {} subnets, '
+             '1 masks'.format(rows)]
+    for index in range(rows):
+        lines.append('O        10.{}/32 [110/2] via 192.168.0.{}, 06:46:59, '
+                     'GigabitEthernet0/{}'.format(address(index),
+                                                  index % 250 + 1, index % 4))
+    return '\n'.join(lines) + '\n'
+
+
+TABLES = [(ShowMacAddressTable, mac_table), (ShowIpArp, arp_table),
+          (ShowIpNatTranslations, nat_table), (ShowIpRoute, route_table)]
+
+
+def measure(function):
+    '''Return the time of function, then the memory its result holds and
+    its peak memory, traced in a second run not to slow the timed one'''
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return seconds, held, peak
+
+
+def bench(parser_cls, output):
+    parser = parser_cls(device=Mock())
+    return {
+        'dict': measure(lambda: parser.parse(output=output)),
+        'records': measure(lambda: parser.parse_compact(output=output)),
+        'columns': measure(lambda: parser.parse_compact(columns=True,
+                                                        output=output)),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500000)
+    args = parser.parse_args()
+
+    print('{} rows'.format(args.rows))
+    for parser_cls, table in TABLES:
+        results = bench(parser_cls, table(args.rows))
+        print(parser_cls.__name__)
+        for name, (seconds, held, peak) in results.items():
+            print('{:<12} {:>10.1f} ms {:>10.1f} MiB held {:>10.1f} MiB '
+                  'peak'.format(name, seconds * 1e3, held / 2 ** 20,
+                                peak / 2 ** 20))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+'''Time and memory of the counters of iosxe show interfaces
+
+Builds an output of the given number of ports for show interfaces, and reads
+the counters of every port:
+
+    * parse: parse(output=...), the counters read from the result
+    * counters: parse_counters(output=...), the counters as columns
+
+Memory is what the result holds once returned, traced in a second run not to
+slow the timed one.
+
+usage:
+
+    python tools/benchmarks/interface_counters.py --ports 10000
+'''
+
+import gc
+import time
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+PORT = '''\
+GigabitEthernet{slot}/0/{port} is up, line protocol is up (connected)
+  Hardware is Gigabit Ethernet, address is 0057.d2ff.{index:04x} (bia 0057.d2ff.{index:04x})
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  Keepalive set (10 sec)
+  Full-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
+  input flow-control is off, output flow-control is unsupported
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Last input never, output 00:00:02, output hang never
+  Last clearing of "show interface" counters 1d02h
+  Input queue: 0/2000/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate {index}000 bits/sec, 5 packets/sec
+  5 minute output rate 0 bits/sec, 0 packets/sec
+     {index}526 packets input, {index}10298 bytes, 0 no buffer
+     Received 535996 broadcasts (535961 multicasts)
+     0 runts, 0 giants, 0 throttles
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     0 watchdog, 535961 multicast, 0 pause input
+     0 input packets with dribble condition detected
+     23376 packets output, {index}2296 bytes, 0 underruns
+     0 output errors, 0 collisions, 5 interface resets
+     0 unknown protocol drops
+     0 babbles, 0 late collision, 0 deferred
+     0 lost carrier, 0 no carrier, 0 pause output
+     0 output buffer failures, 0 output buffers swapped out
+'''
+
+
+def show_interfaces(ports):
+    return ''.join(PORT.format(slot=index // 48 + 1, port=index % 48 + 1,
+                               index=index)
+                   for index in range(ports))
+
+
+def in_octets(parsed):
+    '''in_octets of every interface of the result of parse()'''
+    return [attributes['counters']['in_octets']
+            for attributes in parsed.values()]
+
+
+def measure(function):
+    '''Return the time of function, then the memory its result holds, traced
+    in a second run not to slow the timed one'''
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return seconds, held
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ports', type=int, default=10000)
+    args = parser.parse_args()
+
+    output = show_interfaces(args.ports)
+    interfaces = ShowInterfaces(device=Mock())
+    results = [
+        ('parse', measure(lambda: interfaces.parse(output=output))),
+        ('counters', measure(lambda: interfaces.parse_counters(
+            output=output))),
+    ]
+    parsed = interfaces.parse(output=output)
+    counters = interfaces.parse_counters(output=output)
+    assert in_octets(parsed) == list(counters.columns['in_octets'])
+
+    print('{} ports'.format(args.ports))
+    for name, (seconds, held) in results:
+        print('{:<12} {:>10.1f} ms {:>10.1f} MiB held'.format(
+            name, seconds * 1e3, held / 2 ** 20))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+'''Time of the conversion of the interface names of a MAC address table
+
+Builds a show mac address-table output of the given number of rows, the
+interfaces of its rows in their short form, and converts them:
+
+    * uncached: every name converted through the prefix table, no cache
+    * cached: Common.convert_intf_name, one call per row
+    * column: Common.convert_intf_names, the whole column at once
+    * parse: ShowMacAddressTable().parse(output=...), converting the name of
+      every row
+
+usage:
+
+    python tools/benchmarks/interface_names.py --rows 200000
+'''
+
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.interface_names import IntfNameConverter, \
+                                                    intf_names
+
+
+def short_name(index):
+    return ('Gi1/0/{}', 'Te1/1/{}', 'Po{}')[index % 3].format(index % 48 + 1)
+
+
+def mac_table(rows):
+    lines = ['          Mac Address Table',
+             '-------------------------------------------', '',
+             'Vlan    Mac Address       Type        Ports',
+             '----    -----------       --------    -----']
+    for index in range(rows):
+        lines.append('{:<4}    fa16.3e{:02x}.{:04x}    DYNAMIC     {}'.format(
+            index % 100 + 1, index >> 16 & 255, index & 0xffff,
+            short_name(index)))
+    lines.append('Total Mac Addresses for this criterion: {}'.format(rows))
+    return '\n'.join(lines) + '\n'
+
+
+def measure(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    names = [short_name(index) for index in range(args.rows)]
+    output = mac_table(args.rows)
+    uncached = IntfNameConverter(intf_names.prefixes, maxsize=0)
+    results = [
+        ('uncached', measure(lambda: [uncached(name) for name in names])),
+        ('cached', measure(lambda: [Common.convert_intf_name(name)
+                                    for name in names])),
+        ('column', measure(lambda: Common.convert_intf_names(names))),
+        ('parse', measure(lambda: ShowMacAddressTable(device=Mock()).parse(
+            output=output))),
+    ]
+
+    print('{} rows'.format(args.rows))
+    for name, seconds in results:
+        print('{:<12} {:>10.1f} ms'.format(name, seconds * 1e3))
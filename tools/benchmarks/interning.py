@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+'''Memory of iosxe table results, with and without the shared string pool
+
+Builds outputs of the given number of rows for show mac address-table,
+show ip arp, show ip route and show ip bgp all, and parses each twice, the
+two results held together as a cache of results would:
+
+    * copies: string_pool keeping no string, each value its own copy
+    * pooled: string_pool as the parsers use it, repeated values shared by
+      the rows and by the two results
+
+Times are the ones of the first parse. Memory is what the two results hold
+once returned, traced in a second run not to slow the timed one.
+
+usage:
+
+    python tools/benchmarks/interning.py --rows 200000
+'''
+
+import gc
+import time
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgpAll
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils.interning import string_pool
+
+
+def address(index):
+    return '{}.{}.{}'.format(index >> 16 & 255, index >> 8 & 255,
+                             index & 255)
+
+
+def mac(index):
+    return 'fa16.3e{:02x}.{:04x}'.format(index >> 16 & 255, index & 0xffff)
+
+
+def mac_table(rows):
+    lines = ['          Mac Address Table',
+             '-------------------------------------------', '',
+             'Vlan    Mac Address       Type        Ports',
+             '----    -----------       --------    -----']
+    for index in range(rows):
+        lines.append('{:<4}    {}    DYNAMIC     Gi1/0/{}'.format(
+            index % 100 + 1, mac(index), index % 48 + 1))
+    lines.append('Total Mac Addresses for this criterion: {}'.format(rows))
+    return '\n'.join(lines) + '\n'
+
+
+def arp_table(rows):
+    lines = ['Protocol  Address          Age (min)  Hardware Addr   Type   '
+             'Interface']
+    for index in range(rows):
+        lines.append('Internet  10.{}  {:>12}   {}  ARPA   '
+                     'GigabitEthernet2.{}'.format(address(index), index % 240,
+                                                  mac(index), index % 400))
+    return '\n'.join(lines) + '\n'
+
+
+def route_table(rows):
+    lines = ['Codes: L - local, C - connected, S - static, R - RIP, '
+             'M - mobile, B - BGP', '', 'Gateway of last resort is not set',
+             '', '      10.0.0.0/8 is variably subnetted, {} subnets, '
+             '1 masks'.format(rows)]
+    for index in range(rows):
+        lines.append('O        10.{}/32 [110/2] via 192.168.0.{}, 06:46:59, '
+                     'GigabitEthernet0/{}'.format(address(index),
+                                                  index % 250 + 1, index % 4))
+    return '\n'.join(lines) + '\n'
+
+
+def bgp_table(rows):
+    lines = ['For address family: IPv4 Unicast', '',
+             'BGP table version is 25, local router ID is 10.186.101.1',
+             '     Network          Next Hop            Metric LocPrf Weight '
+             'Path']
+    for index in range(rows):
+        lines.append('*>i 10.{}/32   192.168.0.{:<3}            0    100      '
+                     '0 65000 {} i'.format(address(index), index % 8 + 1,
+                                           64512 + index % 16))
+    return '\n'.join(lines) + '\n'
+
+
+TABLES = [(ShowMacAddressTable, mac_table), (ShowIpArp, arp_table),
+          (ShowIpRoute, route_table), (ShowIpBgpAll, bgp_table)]
+
+
+def measure(function):
+    '''Return the time of function, then the memory its results hold,
+    traced in a second run not to slow the timed one'''
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function(), function()
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return seconds, held
+
+
+def bench(parser_cls, output):
+    parser = parser_cls(device=Mock())
+    results = {}
+    for name, maxsize in (('copies', 0), ('pooled', string_pool.maxsize)):
+        pool_size = string_pool.maxsize
+        string_pool.maxsize = maxsize
+        string_pool.clear()
+        try:
+            results[name] = measure(lambda: parser.parse(output=output))
+        finally:
+            string_pool.maxsize = pool_size
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    print('{} rows, two results held'.format(args.rows))
+    for parser_cls, table in TABLES:
+        results = bench(parser_cls, table(args.rows))
+        print(parser_cls.__name__)
+        for name, (seconds, held) in results.items():
+            print('{:<12} {:>10.1f} ms {:>10.1f} MiB held'.format(
+                name, seconds * 1e3, held / 2 ** 20))
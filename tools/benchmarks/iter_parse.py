@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+'''Time and peak memory to parse an iosxe show ip route, whole and streamed
+
+Builds the output of the given number of OSPF routes, written to a file, and
+reads it back:
+
+    * parse: the file read whole, then ShowIpRoute.parse(output=...)
+    * iter_parse: the lines of the file given to ShowIpRoute.iter_parse(),
+      each record dropped once counted
+
+usage:
+
+    python tools/benchmarks/iter_parse.py --routes 100000
+'''
+
+import os
+import time
+import argparse
+import tempfile
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+
+def route_table(routes):
+    yield 'Codes: L - local, C - connected, S - static, R - RIP, M - mobile\n'
+    yield '\nGateway of last resort is not set\n\n'
+    yield '      10.0.0.0/8 is variably subnetted, {} subnets, 1 masks\n'\
+          .format(routes)
+    for index in range(routes):
+        yield 'O        10.{}.{}.{}/32 [110/2] via 192.168.0.{}, 06:46:59, ' \
+              'GigabitEthernet0/{}\n'.format(index >> 16 & 255,
+                                             index >> 8 & 255, index & 255,
+                                             index % 250 + 1, index % 4)
+
+
+def measure(function):
+    '''Return what function counted, its time, then its peak memory, traced
+    in a second run not to slow the timed one'''
+    start = time.perf_counter()
+    count = function()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, seconds, peak
+
+
+def bench(routes):
+    parser = ShowIpRoute(device=Mock())
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.writelines(route_table(routes))
+    try:
+        def whole():
+            with open(f.name) as lines:
+                parsed = parser.parse(output=lines.read())
+            return len(parsed['vrf']['default']['address_family']['ipv4']
+                       ['routes'])
+
+        def streamed():
+            with open(f.name) as lines:
+                return sum(1 for _ in parser.iter_parse(lines))
+
+        return {'parse': measure(whole), 'iter_parse': measure(streamed)}
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--routes', type=int, default=100000)
+    args = parser.parse_args()
+
+    results = bench(args.routes)
+    print('{} routes'.format(args.routes))
+    for name, (count, seconds, peak) in results.items():
+        print('{:<12} {:>10.1f} ms {:>10.1f} KiB peak, {} routes'.format(
+            name, seconds * 1e3, peak / 2 ** 10, count))
+    print('{:<12} {:>10.1f}x'.format(
+        'memory', results['parse'][2] / results['iter_parse'][2]))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+'''Throughput of iosxe ShowInterfaces with its LineDispatcher
+
+Parses the output of a chassis with the given number of interfaces, and
+compares matching each of its lines through the dispatcher against trying
+every pattern in turn, the way the parser did before:
+
+    * parser: ShowInterfaces.cli(output=...)
+    * linear: first matching pattern, all of them tried in order
+    * dispatched: LineDispatcher.match()
+
+usage:
+
+    python tools/benchmarks/line_dispatcher.py --interfaces 500
+'''
+
+import timeit
+import argparse
+
+from genie.libs.parser.iosxe.show_interface import (ShowInterfaces,
+                                                   _show_interfaces_lines)
+
+INTERFACE = '''\
+GigabitEthernet1/0/{index} is up, line protocol is up (connected)
+  Hardware is Gigabit Ethernet, address is 0057.d2ff.{index:04x} (bia 0057.d2ff.{index:04x})
+  Description: access port {index}
+  Internet address is 10.{high}.{low}.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  Keepalive set (10 sec)
+  Full-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
+  input flow-control is off, output flow-control is unsupported
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Last input 00:00:02, output 00:00:01, output hang never
+  Last clearing of "show interface" counters 1d02h
+  Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate 3000 bits/sec, 4 packets/sec
+  5 minute output rate 2000 bits/sec, 2 packets/sec
+     1386 packets input, 149370 bytes, 0 no buffer
+     Received 1226 broadcasts (1220 multicasts)
+     0 runts, 0 giants, 0 throttles
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     0 watchdog, 1220 multicast, 0 pause input
+     0 input packets with dribble condition detected
+     1490 packets output, 166138 bytes, 0 underruns
+     0 output errors, 0 collisions, 1 interface resets
+     0 unknown protocol drops
+     0 babbles, 0 late collision, 0 deferred
+     0 lost carrier, 0 no carrier, 0 pause output
+     0 output buffer failures, 0 output buffers swapped out
+'''
+
+
+def chassis_output(interfaces):
+    return ''.join(INTERFACE.format(index=index, high=index // 256,
+                                    low=index % 256)
+                   for index in range(interfaces))
+
+
+def linear_match(rules, line):
+    for rule, pattern in rules:
+        m = pattern.match(line)
+        if m:
+            return rule, m
+    return None, None
+
+
+def bench(output, number):
+    lines = [line.strip() for line in output.splitlines()]
+
+    rules = _show_interfaces_lines.rules
+
+    def parser():
+        ShowInterfaces(device=None).cli(output=output)
+
+    def linear():
+        for line in lines:
+            linear_match(rules, line)
+
+    def dispatched():
+        for line in lines:
+            _show_interfaces_lines.match(line)
+
+    results = {}
+    for name, func in (('parser', parser), ('linear', linear),
+                       ('dispatched', dispatched)):
+        func()
+        results[name] = min(timeit.repeat(func, number=number, repeat=3)) \
+                                                                    / number
+    return len(lines), results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--interfaces', type=int, default=500)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    count, results = bench(chassis_output(args.interfaces), args.number)
+    print('{} interfaces, {} lines'.format(args.interfaces, count))
+    for name, seconds in results.items():
+        print('{:<12} {:>10.1f} ms {:>12.0f} lines/s'.format(
+            name, seconds * 1e3, count / seconds))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+'''Validation cost of junos ShowRoute with its ListOfDict validators
+
+Validates the parsed output of a routing table with the given number of
+routes against ShowRouteSchema, with the list validators building their
+Schema once (ListOfDict) and, as they did before, on every call.
+
+usage:
+
+    python tools/benchmarks/list_validators.py --routes 100000
+'''
+
+import timeit
+import argparse
+
+from genie.metaparser.util.schemaengine import Schema
+
+from genie.libs.parser.utils import schema
+from genie.libs.parser.utils.schema import ListOfDict
+from genie.libs.parser.junos.show_route import ShowRouteSchema
+
+
+def route_output(routes):
+    rt = []
+    for index in range(routes):
+        rt.append({
+            'rt-destination': '10.{}.{}.0/24'.format(index // 256 % 256,
+                                                     index % 256),
+            'rt-entry': {
+                'active-tag': '*',
+                'age': {'#text': '3w3d 03:12:24'},
+                'metric': '101',
+                'nh': [{'to': '10.169.14.121', 'via': 'ge-0/0/1.0'},
+                       {'to': '10.169.14.122', 'via': 'ge-0/0/2.0'}],
+                'preference': '150',
+                'protocol-name': 'OSPF'}})
+    return {'route-information': {'route-table': [{
+        'active-route-count': str(routes),
+        'destination-count': str(routes),
+        'hidden-route-count': '0',
+        'holddown-route-count': '0',
+        'rt': rt,
+        'table-name': 'inet.0',
+        'total-route-count': str(routes)}]}}
+
+
+def uncached(self, value):
+    '''ListOfDict.__call__ building its Schema on every call'''
+    if not isinstance(value, list):
+        raise schema.SchemaError(self.error)
+    compiled = schema.Schema(self.schema)
+    for item in value:
+        compiled.validate(item)
+    return value
+
+
+class Counted(Schema):
+    '''Schema counting how many times it is built'''
+    count = 0
+
+    def __init__(self, *args, **kwargs):
+        Counted.count += 1
+        super().__init__(*args, **kwargs)
+
+
+def bench(output, number):
+    validators = [value for value in vars(ShowRouteSchema).values()
+                                            if isinstance(value, ListOfDict)]
+    results = {}
+    cached = ListOfDict.__call__
+    for name, call in (('before', uncached), ('after', cached)):
+        ListOfDict.__call__ = call
+        schema.Schema = Counted
+        try:
+            def validate():
+                Schema(ShowRouteSchema.schema).validate(output)
+            for validator in validators:
+                validator._compiled = None
+            Counted.count = 0
+            validate()
+            built = Counted.count
+            seconds = min(timeit.repeat(validate, number=number,
+                                        repeat=3)) / number
+        finally:
+            ListOfDict.__call__ = cached
+            schema.Schema = Schema
+        results[name] = (seconds, built)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--routes', type=int, default=100000)
+    parser.add_argument('--number', type=int, default=1)
+    args = parser.parse_args()
+
+    results = bench(route_output(args.routes), args.number)
+    print('{} routes'.format(args.routes))
+    for name, (seconds, built) in results.items():
+        print('{:<8} {:>10.1f} ms {:>10} schemas built on first '
+              'validation'.format(name, seconds * 1e3, built))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+'''Time to parse many iosxe show ip route outputs, in threads and in ParsePool
+
+Builds outputs of the given number of OSPF routes and parses the given
+number of them:
+
+    * threads: ShowIpRoute(device).parse(output=...) in a thread pool, as
+      collectors parsing the outputs of their devices do
+    * processes: ParsePool(packages=['iosxe']).submit(...), once its workers
+      are started and warm
+
+usage:
+
+    python tools/benchmarks/parse_pool.py --outputs 16 --routes 20000
+'''
+
+import time
+import argparse
+from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils.parse_pool import ParsePool
+
+
+def route_table(routes):
+    lines = ['Codes: L - local, C - connected, S - static, R - RIP, '
+             'M - mobile, B - BGP', '',
+             'Gateway of last resort is not set', '',
+             '      10.0.0.0/8 is variably subnetted, {} subnets, 1 masks'
+             .format(routes)]
+    for index in range(routes):
+        lines.append('O        10.{}.{}.0/24 [110/2] via 192.168.0.{}, '
+                     '06:46:59, GigabitEthernet0/{}'.format(
+                         index // 256 % 256, index % 256, index % 250 + 1,
+                         index % 4))
+    return '\n'.join(lines) + '\n'
+
+
+def bench(outputs, routes, workers):
+    output = route_table(routes)
+    device = Mock(os='iosxe', custom={})
+
+    def parse(output):
+        return ShowIpRoute(device=device).parse(output=output)
+
+    results = {}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parsed = list(pool.map(parse, [output] * outputs))
+    results['threads'] = time.perf_counter() - start
+
+    with ParsePool(max_workers=workers, packages=['iosxe']) as pool:
+        # Started and warm
+        for future in [pool.submit(ShowIpRoute, 'Gateway of last resort '
+                                   'is not set') for _ in range(workers)]:
+            future.exception()
+        start = time.perf_counter()
+        futures = [pool.submit(ShowIpRoute, output) for _ in range(outputs)]
+        assert [future.result() for future in futures] == parsed
+        results['processes'] = time.perf_counter() - start
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--outputs', type=int, default=16)
+    parser.add_argument('--routes', type=int, default=20000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    results = bench(args.outputs, args.routes, args.workers)
+    print('{} outputs of {} routes, {} workers'.format(
+        args.outputs, args.routes, args.workers))
+    for name, seconds in results.items():
+        print('{:<12} {:>10.1f} ms'.format(name, seconds * 1e3))
+    print('{:<12} {:>10.1f}x'.format(
+        'speedup', results['threads'] / results['processes']))
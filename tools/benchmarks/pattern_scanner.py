@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+'''Throughput of iosxe ShowIpRoute with its PatternScanner
+
+Parses the output of a routing table with the given number of routes, and
+compares matching its lines against the patterns of the parser:
+
+    * parser: ShowIpRoute.cli(output=...)
+    * sequential: every pattern tried in turn on each stripped line, the way
+                  the parser did before
+    * scan: PatternScanner.scan(), one match() per line
+    * finditer: PatternScanner.finditer(), one finditer() over the output
+
+usage:
+
+    python tools/benchmarks/pattern_scanner.py --routes 100000
+'''
+
+import timeit
+import argparse
+
+from genie.libs.parser.iosxe.show_routing import (ShowIpRoute,
+                                                  _show_ip_route_lines)
+
+HEADER = '''\
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+       D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area
+
+Gateway of last resort is not set
+
+'''
+
+ROUTES = (
+    '      10.{high}.0.0/16 is variably subnetted, 2 subnets, 2 masks\n'
+    'O        10.{high}.{low}.0/24 [110/2] via 192.168.1.{low}, 1d02h, '
+    'GigabitEthernet2\n'
+    '                      [110/2] via 192.168.2.{low}, 1d02h, '
+    'GigabitEthernet3\n'
+    'B        172.{high}.{low}.0/24 [200/0] via 192.168.3.{low}, 2w0d\n'
+)
+
+
+def table_output(routes):
+    return HEADER + ''.join(ROUTES.format(high=index // 256 % 256,
+                                          low=index % 256)
+                            for index in range(routes // 3))
+
+
+def sequential(rules, output):
+    for line in output.splitlines():
+        line = line.strip()
+        for rule, pattern in rules:
+            m = pattern.match(line)
+            if m:
+                yield rule, m.groupdict()
+                break
+
+
+def bench(output, number):
+    lines = _show_ip_route_lines['ipv4']
+    rules = lines.rules
+
+    def parser():
+        ShowIpRoute(device=None).cli(output=output)
+
+    results = {}
+    for name, func in (('parser', parser),
+                       ('sequential', lambda: list(sequential(rules, output))),
+                       ('scan', lambda: list(lines.scan(output))),
+                       ('finditer', lambda: list(lines.finditer(output)))):
+        func()
+        results[name] = min(timeit.repeat(func, number=number, repeat=3)) \
+                                                                    / number
+    return output.count('\n'), results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--routes', type=int, default=100000)
+    parser.add_argument('--number', type=int, default=1)
+    args = parser.parse_args()
+
+    count, results = bench(table_output(args.routes), args.number)
+    print('{} routes, {} lines'.format(args.routes, count))
+    for name, seconds in results.items():
+        print('{:<12} {:>10.1f} ms {:>12.0f} lines/s'.format(
+            name, seconds * 1e3, count / seconds))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+'''Per call cost of compiling the patterns of a parser cli()
+
+For each function of the given modules, one "call" compiles the patterns that
+function uses, the way cli() does on every parse:
+
+    * re.compile, cache hit: the patterns are still in re's own cache
+    * re.compile, cache miss: other parsers evicted them (re keeps 512)
+    * PatternTable: what migrated modules do
+
+usage:
+
+    python tools/benchmarks/pattern_table.py src/genie/libs/parser/iosxe/show_ospf.py
+'''
+
+import re
+import ast
+import sys
+import timeit
+import argparse
+
+from genie.libs.parser.utils.patterns import PatternTable
+
+
+def function_patterns(path):
+    '''Return {function name: [(pattern, flags)]} of a module, whether it
+    uses re.compile or _patterns.compile'''
+    with open(path) as f:
+        tree = ast.parse(f.read())
+
+    functions = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for func in node.body:
+            if not isinstance(func, ast.FunctionDef):
+                continue
+            patterns = []
+            for call in ast.walk(func):
+                if isinstance(call, ast.Call) and \
+                        isinstance(call.func, ast.Attribute) and \
+                        call.func.attr == 'compile' and call.args and \
+                        isinstance(call.args[0], ast.Constant) and \
+                        isinstance(call.args[0].value, str):
+                    flags = eval(compile(ast.Expression(call.args[1]), path,
+                                         'eval')) if len(call.args) > 1 else 0
+                    patterns.append((call.args[0].value, flags))
+            if patterns:
+                functions['{}.{}'.format(node.name, func.name)] = patterns
+    return functions
+
+
+def bench(patterns, number):
+    table = PatternTable()
+
+    def compile_hit():
+        for pattern, flags in patterns:
+            re.compile(pattern, flags)
+
+    def compile_miss():
+        re.purge()
+        for pattern, flags in patterns:
+            re.compile(pattern, flags)
+
+    def pattern_table():
+        for pattern, flags in patterns:
+            table.compile(pattern, flags)
+
+    results = {}
+    for name, func in (('re.compile hit', compile_hit),
+                       ('re.compile miss', compile_miss),
+                       ('PatternTable', pattern_table)):
+        func()
+        results[name] = min(timeit.repeat(func, number=number, repeat=3)) \
+                                                            / number * 1e6
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--top', type=int, default=5,
+                        help='functions with the most patterns to show')
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    print('{:<60} {:>4} {:>16} {:>16} {:>14}'.format(
+        'function', 'pat', 're hit (us)', 're miss (us)', 'table (us)'))
+    for path in args.paths:
+        functions = function_patterns(path)
+        largest = sorted(functions.items(), key=lambda item: len(item[1]),
+                         reverse=True)[:args.top]
+        for name, patterns in largest:
+            results = bench(patterns, args.number)
+            print('{:<60} {:>4} {:>16.1f} {:>16.1f} {:>14.1f}'.format(
+                name[:60], len(patterns), results['re.compile hit'],
+                results['re.compile miss'], results['PatternTable']))
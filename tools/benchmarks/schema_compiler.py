@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+'''Validation time of iosxr ShowBgpInstanceAllAll with its compiled schema
+
+Builds the result of a BGP table with the given number of prefixes, and
+validates it against the schema of the parser:
+
+    * schema: Schema(schema).validate(), as done by MetaParser
+    * compiled: compiled_schema(schema).validate()
+
+usage:
+
+    python tools/benchmarks/schema_compiler.py --prefixes 100000
+'''
+
+import timeit
+import argparse
+
+from genie.metaparser.util.schemaengine import Schema
+
+from genie.libs.parser.iosxr.show_bgp import ShowBgpInstanceAllAll
+from genie.libs.parser.utils.schema_compiler import (CompiledSchema,
+                                                    compiled_schema)
+
+
+def bgp_table(prefixes):
+    prefix = {}
+    for index in range(prefixes):
+        network = '{}.{}.{}.0/24'.format(index // 65536 % 224 + 1,
+                                         index // 256 % 256, index % 256)
+        prefix[network] = {'index': {
+            1: {'next_hop': '10.4.1.1', 'status_codes': '*>',
+                'metric': '2219', 'locprf': '100', 'weight': '0',
+                'path': '200 33299 51178 47751 {27016}',
+                'origin_codes': 'e'},
+            2: {'next_hop': '10.4.1.2', 'status_codes': '*',
+                'metric': '2219', 'weight': '0',
+                'path': '300 33299 51178 47751 {27016}',
+                'origin_codes': 'e'}}}
+    return {'instance': {'default': {'vrf': {'default': {
+        'address_family': {'ipv4 unicast': {
+            'router_identifier': '10.4.1.1', 'local_as': 100,
+            'vrf_state': 'active', 'table_state': 'active',
+            'table_id': '0xe0000000', 'rd_version': 0,
+            'bgp_table_version': prefixes, 'processed_prefix': prefixes,
+            'processed_paths': 2 * prefixes, 'non_stop_routing': True,
+            'prefix': prefix}}}}}}}
+
+
+def bench(output, number):
+    schema = ShowBgpInstanceAllAll.schema
+
+    def interpreted():
+        Schema(schema).validate(output)
+
+    def compiled():
+        compiled_schema(schema).validate(output)
+
+    results = {}
+    for name, func in (('schema', interpreted), ('compiled', compiled)):
+        func()
+        results[name] = min(timeit.repeat(func, number=number, repeat=3)) \
+                                                                    / number
+    results['compile'] = min(timeit.repeat(lambda: CompiledSchema(schema),
+                                           number=10, repeat=3)) / 10
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--prefixes', type=int, default=100000)
+    parser.add_argument('--number', type=int, default=3)
+    args = parser.parse_args()
+
+    results = bench(bgp_table(args.prefixes), args.number)
+    print('{} prefixes, {} paths'.format(args.prefixes, 2 * args.prefixes))
+    for name, seconds in results.items():
+        print('{:<12} {:>10.1f} ms'.format(name, seconds * 1e3))
+    print('{:<12} {:>10.1f}x'.format(
+        'speedup', results['schema'] / results['compiled']))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+'''Move the re.compile() calls of parser modules into a module PatternTable
+
+Every `re.compile(<string literal>[, <re flags>])` made inside a function of
+the given modules becomes `_patterns.compile(...)`, and the module gets a
+`_patterns = PatternTable()` declared after its imports. Patterns built at
+runtime (format, concatenation with variables) are left untouched.
+
+usage:
+
+    python tools/pattern_table.py src/genie/libs/parser/iosxe/show_ospf.py ...
+'''
+
+import ast
+import argparse
+
+TABLE = '_patterns'
+HEADER = ('from genie.libs.parser.utils.patterns import PatternTable\n'
+          '\n'
+          '# Patterns of the parsers in this module, compiled once\n'
+          '{} = PatternTable()\n'.format(TABLE))
+
+
+def _is_flags(node):
+    '''re.X, re.X | re.Y or an int'''
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, int)
+    if isinstance(node, ast.Attribute):
+        return isinstance(node.value, ast.Name) and node.value.id == 're'
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _is_flags(node.left) and _is_flags(node.right)
+    return False
+
+
+def _is_static_compile(node):
+    if not (isinstance(node, ast.Call) and
+            isinstance(node.func, ast.Attribute) and
+            node.func.attr == 'compile' and
+            isinstance(node.func.value, ast.Name) and
+            node.func.value.id == 're'):
+        return False
+    if not node.args or len(node.args) > 2:
+        return False
+    if not (isinstance(node.args[0], ast.Constant) and
+            isinstance(node.args[0].value, str)):
+        return False
+    flags = node.args[1:] + [kw.value for kw in node.keywords
+                                              if kw.arg == 'flags']
+    if len(node.keywords) != len(flags) - len(node.args[1:]):
+        return False
+    return all(_is_flags(flag) for flag in flags)
+
+
+def _compile_calls(tree):
+    '''Yield the static re.compile calls made inside functions'''
+    for func in ast.walk(tree):
+        if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for stmt in func.body:
+            for node in ast.walk(stmt):
+                if _is_static_compile(node):
+                    yield node
+
+
+def migrate(source):
+    '''Return source using a PatternTable, and how many calls were moved'''
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+
+    calls = {(node.lineno, node.col_offset): node
+                                        for node in _compile_calls(tree)}
+    imports = [stmt for stmt in tree.body
+                            if isinstance(stmt, (ast.Import, ast.ImportFrom))]
+    if not calls or not imports:
+        return source, 0
+
+    shift = len(TABLE + '.compile') - len('re.compile')
+
+    # Bottom up so positions of the remaining calls stay valid
+    for lineno, col in sorted(calls, reverse=True):
+        node = calls[lineno, col]
+        func = node.func
+        line = lines[func.lineno - 1]
+        paren = func.end_col_offset
+
+        # Realign arguments continued on the next lines, unless within a
+        # triple quoted string
+        segment = ast.get_source_segment(source, node)
+        multiline_string = "'''" in segment or '"""' in segment
+        for index in range(node.lineno, node.end_lineno):
+            if multiline_string:
+                break
+            continued = lines[index]
+            indent = len(continued) - len(continued.lstrip(' '))
+            if continued.strip() and indent >= paren + 1:
+                lines[index] = ' ' * shift + continued
+
+        # ast offsets count utf-8 bytes
+        encoded = line.encode()
+        lines[func.lineno - 1] = encoded[:func.col_offset].decode() + \
+            TABLE + '.compile' + encoded[func.end_col_offset:].decode()
+
+    # Declare the table after the imports at the top of the module
+    last_import = imports[0]
+    for stmt in tree.body[tree.body.index(last_import):]:
+        if not isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            break
+        last_import = stmt
+    lines.insert(last_import.end_lineno, HEADER)
+
+    return ''.join(lines), len(calls)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='modules to migrate')
+    args = parser.parse_args()
+
+    for path in args.paths:
+        with open(path) as f:
+            source = f.read()
+
+        if 'PatternTable()' in source:
+            print('{}: already migrated'.format(path))
+            continue
+
+        migrated, count = migrate(source)
+        with open(path, 'w') as f:
+            f.write(migrated)
+        print('{}: {} patterns moved to {}'.format(path, count, TABLE))